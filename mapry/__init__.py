@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Serialize and deserialize object graphs from/to JSONables."""
 import collections
+import copy
 import typing
 # yapf: disable
 from typing import (
@@ -302,6 +303,7 @@ class Cpp:
         self.optional_as = ''
         self.datetime_library = ''
         self.indention = ''
+        self.trusted_input = False
 
 
 class Go:
@@ -310,17 +312,32 @@ class Go:
     def __init__(self) -> None:
         """Initialize the Go settings with default attribute values."""
         self.package = ''
+        self.trusted_input = False
 
 
 class Py:
     """List settings for the generation of the Python code."""
 
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(self) -> None:
         """Initialize the Python settings with default attribute values."""
         self.module_name = ''
         self.path_as = ''
         self.timezone_as = ''
         self.indention = ''
+        self.slots = False
+        self.trusted_input = False
+        self.numeric_array_as = ''
+        self.lazy_decoding = False
+        self.compact_pickling = False
+        self.track_changes = False
+        self.split_modules = False
+        self.compile_ready = False
+        self.lazy_registries = False
+        self.coroutines = False
+        self.parallel_parsing = False
+        self.iter_registries = False
 
 
 class Schema:
@@ -523,3 +540,36 @@ def iterate_over_types(graph: Graph) -> Iterable[Tuple[Type, str]]:
         yield from _iterate_over_composite_types(composite=embed)
 
     yield from _iterate_over_composite_types(composite=graph)
+
+
+def without_constraints(graph: Graph) -> Graph:
+    """
+    Copy the graph and remove the constraints on the values from the copy.
+
+    The removed constraints are the ranges of numbers, the sizes of arrays,
+    the patterns of strings and paths as well as the patterns of class
+    identifiers. The types themselves are left untouched.
+
+    :param graph: mapry definition of the object graph
+    :return: copy of the graph without the value constraints
+    """
+    result = copy.deepcopy(graph)
+
+    for a_type, _ in iterate_over_types(graph=result):
+        if isinstance(a_type, (Integer, Float)):
+            a_type.minimum = None
+            a_type.exclusive_minimum = False
+            a_type.maximum = None
+            a_type.exclusive_maximum = False
+
+        elif isinstance(a_type, (String, Path)):
+            a_type.pattern = None
+
+        elif isinstance(a_type, Array):
+            a_type.minimum_size = None
+            a_type.maximum_size = None
+
+    for cls in result.classes.values():
+        cls.id_pattern = None
+
+    return result
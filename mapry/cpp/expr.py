@@ -24,29 +24,30 @@ def is_variable(expr: str) -> bool:
 
 @require(lambda exprs: len(exprs) > 0)
 @ensure(lambda result: not result.endswith('\n'))
-def append_strings(exprs: List[str]) -> str:
+def lazy_ref(exprs: List[str]) -> str:
     """
-    Generate the concatenation of the given C++ expressions.
+    Generate the lazy reference to a nested value.
 
-    The expressions are concatenated *via* ``std::string::append``.
+    The first expression gives the reference to the outermost value, while
+    the remaining expressions give the keys or indices of the nested values.
+    The reference is represented by nested ``parse::Ref``'s so that
+    the reference path is rendered only if needed.
 
-    :param exprs: C++ expressensions representing the individual parts
+    :param exprs: C++ expressions representing the individual parts
     :return: generated C++ expression
 
-    >>> print(append_strings(['ref']))
+    >>> print(lazy_ref(['ref']))
     ref
 
-    >>> print(append_strings(['ref', '"/some_property"']))
-    std::string(ref)
-        .append("/some_property")
+    >>> print(lazy_ref(['ref', '"some_property"']))
+    parse::Ref(ref, "some_property")
 
-    """
-    if len(exprs) == 1:
-        return exprs[0]
+    >>> print(lazy_ref(['ref', '"some_array"', 'i_1']))
+    parse::Ref(parse::Ref(ref, "some_array"), i_1)
 
-    parts = ['std::string({})'.format(exprs[0])]
+    """
+    result = exprs[0]
     for ref_part in exprs[1:]:
-        # yapf: disable
-        parts.append('\n    .append({})'.format(ref_part))
+        result = 'parse::Ref({}, {})'.format(result, ref_part)
 
-    return ''.join(parts)
+    return result
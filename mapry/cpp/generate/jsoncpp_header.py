@@ -124,7 +124,7 @@ void {{graph.name|as_variable}}_from(
     ref_cls.plural|as_variable }}_registry registry of the {{
         ref_cls.name|as_composite }} instances
 {% endfor %}
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
@@ -135,7 +135,7 @@ void {{ composite.name|as_variable }}_from(
         ref_cls.name|as_composite }}>>& {{
             ref_cls.plural|as_variable }}_registry,
 {% endfor %}
-    std::string ref,
+    const parse::Ref& ref,
     {{ composite.name|as_composite }}* target,
     parse::Errors* errors);
 {% endfor %}
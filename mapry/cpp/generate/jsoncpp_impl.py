@@ -3,10 +3,11 @@
 # pylint: disable=too-many-lines
 # pylint: disable=too-many-arguments
 
+import collections
 import re
 import textwrap
 from typing import (  # pylint: disable=unused-import
-    Dict, List, Mapping, MutableMapping, Set, Union)
+    Dict, List, Mapping, MutableMapping, Optional, Set, Union)
 
 import icontract
 from icontract import ensure
@@ -16,6 +17,7 @@ import mapry.cpp.generate
 import mapry.cpp.jinja2_env
 import mapry.cpp.naming
 import mapry.indention
+import mapry.strftime
 
 
 def _needs_regex(a_type: mapry.Type) -> bool:
@@ -34,9 +36,6 @@ def _needs_regex(a_type: mapry.Type) -> bool:
     if isinstance(a_type, mapry.Path) and a_type.pattern:
         return True
 
-    if isinstance(a_type, mapry.Duration):
-        return True
-
     return False
 
 
@@ -174,25 +173,6 @@ def _regex_constants(graph: mapry.Graph) -> str:
     """
     blocks = []  # type: List[str]
 
-    # define regular expressions for duration
-    if mapry.needs_type(a_type=graph, query=mapry.Duration):
-        re_block = mapry.indention.reindent(
-            '''\
-            namespace re {
-            const std::regex kDuration(
-                "^(\\\\+|-)?P(((0|[1-9][0-9]*)(\\\\.[0-9]+)?)Y)?"
-                "(((0|[1-9][0-9]*)(\\\\.[0-9]+)?)M)?"
-                "(((0|[1-9][0-9]*)(\\\\.[0-9]+)?)W)?"
-                "(((0|[1-9][0-9]*)(\\\\.[0-9]+)?)D)?"
-                "(T"
-                "(((0|[1-9][0-9]*)(\\\\.[0-9]+)?)H)?"
-                "(((0|[1-9][0-9]*)(\\\\.[0-9]+)?)M)?"
-                "(((0|[1-9][0-9]*)(\\\\.([0-9]+))?)S)?"
-                ")?$");
-            }  // namespace re''')
-
-        blocks.append(re_block)
-
     for cls in graph.classes.values():
         if cls.id_pattern is None:
             continue
@@ -257,6 +237,133 @@ def _duration_from_string() -> str:
             return rightRep + left;
         }
 
+        /**
+         * represents the components of a duration in ISO 8601 format
+         * as they are written in the text.
+         *
+         * The components which are not specified are empty.
+         */
+        struct DurationParts {
+            std::string sign;
+            std::string years;
+            std::string months;
+            std::string weeks;
+            std::string days;
+            std::string hours;
+            std::string minutes;
+            std::string seconds;
+            std::string fraction;
+        };
+
+        /**
+         * scans the duration in ISO 8601 format in a single pass.
+         *
+         * @param[in] s string to scan
+         * @param[out] parts components of the duration
+         * @return true if s conforms to the format
+         */
+        bool scan_duration(const std::string& s, DurationParts* parts) {
+            size_t i = 0;
+            if (i < s.size() and (s[i] == '+' or s[i] == '-')) {
+                parts->sign = s.substr(i, 1);
+                ++i;
+            }
+
+            if (i == s.size() or s[i] != 'P') {
+                return false;
+            }
+            ++i;
+
+            // Designators of the date part are followed by
+            // the designators of the time part.
+            const char* designators = "YMWD";
+            size_t offset = 0;
+            size_t next = 0;
+
+            while (i < s.size()) {
+                if (s[i] == 'T' and offset == 0) {
+                    designators = "HMS";
+                    offset = 4;
+                    next = 0;
+                    ++i;
+                    continue;
+                }
+
+                const size_t start = i;
+
+                if (s[i] == '0') {
+                    ++i;
+                } else if (s[i] >= '1' and s[i] <= '9') {
+                    ++i;
+                    while (i < s.size() and s[i] >= '0' and s[i] <= '9') {
+                        ++i;
+                    }
+                } else {
+                    return false;
+                }
+
+                const size_t integer_end = i;
+
+                if (i < s.size() and s[i] == '.') {
+                    ++i;
+                    while (i < s.size() and s[i] >= '0' and s[i] <= '9') {
+                        ++i;
+                    }
+
+                    if (i == integer_end + 1) {
+                        return false;
+                    }
+                }
+
+                if (i == s.size()) {
+                    return false;
+                }
+
+                size_t designator = next;
+                while (designators[designator] != '\\0' and
+                        designators[designator] != s[i]) {
+                    ++designator;
+                }
+
+                if (designators[designator] == '\\0') {
+                    return false;
+                }
+
+                switch (offset + designator) {
+                    case 0:
+                        parts->years = s.substr(start, i - start);
+                        break;
+                    case 1:
+                        parts->months = s.substr(start, i - start);
+                        break;
+                    case 2:
+                        parts->weeks = s.substr(start, i - start);
+                        break;
+                    case 3:
+                        parts->days = s.substr(start, i - start);
+                        break;
+                    case 4:
+                        parts->hours = s.substr(start, i - start);
+                        break;
+                    case 5:
+                        parts->minutes = s.substr(start, i - start);
+                        break;
+                    default:
+                        parts->seconds = s.substr(start, integer_end - start);
+                        if (i > integer_end) {
+                            parts->fraction = s.substr(
+                                integer_end + 1, i - integer_end - 1);
+                        }
+                        break;
+                }
+
+                next = designator + 1;
+                ++i;
+            }
+
+            return true;
+        }
+
         /**
          * parses the duration from a string.
          *
@@ -274,8 +381,8 @@ def _duration_from_string() -> str:
         std::chrono::nanoseconds duration_from_string(
                 const std::string& s,
                 std::string* error) {
-            std::smatch mtch;
-            const bool matched = std::regex_match(s, mtch, re::kDuration);
+            DurationParts parts;
+            const bool matched = scan_duration(s, &parts);
 
             if (!matched) {
                 std::stringstream sserr;
@@ -290,7 +397,7 @@ def _duration_from_string() -> str:
             // Extract nanoseconds
             ////
 
-            const std::string nanoseconds_str = mtch[31];
+            const std::string& nanoseconds_str = parts.fraction;
             rep_t nanoseconds;
             if (nanoseconds_str.size() == 0) {
                 // No nanoseconds specified
@@ -333,23 +440,23 @@ def _duration_from_string() -> str:
             // Extract all the other interval counts
             ////
 
-            const std::string sign_str = mtch[1];
+            const std::string& sign_str = parts.sign;
             const rep_t sign = (sign_str.empty() or sign_str == "+") ? 1 : -1;
 
             const double years(
-                (mtch[3].length() == 0) ? 0.0 : std::stod(mtch[3]));
+                parts.years.empty() ? 0.0 : std::stod(parts.years));
             const double months(
-                (mtch[7].length() == 0) ? 0.0 : std::stod(mtch[7]));
+                parts.months.empty() ? 0.0 : std::stod(parts.months));
             const double weeks(
-                (mtch[11].length() == 0) ? 0.0 : std::stod(mtch[11]));
+                parts.weeks.empty() ? 0.0 : std::stod(parts.weeks));
             const double days(
-                (mtch[15].length() == 0) ? 0.0 : std::stod(mtch[15]));
+                parts.days.empty() ? 0.0 : std::stod(parts.days));
             const double hours(
-                (mtch[20].length() == 0) ? 0.0 : std::stod(mtch[20]));
+                parts.hours.empty() ? 0.0 : std::stod(parts.hours));
             const double minutes(
-                (mtch[24].length() == 0) ? 0.0 : std::stod(mtch[24]));
+                parts.minutes.empty() ? 0.0 : std::stod(parts.minutes));
             const rep_t seconds(
-                (mtch[29].length() == 0) ? 0 : std::stol(mtch[29]));
+                parts.seconds.empty() ? 0 : std::stol(parts.seconds));
 
             ////
             // Sum
@@ -375,7 +482,7 @@ def _duration_from_string() -> str:
             }
             sum += seconds_as_ns;
 
-            bool overflows;
+            bool overflows = false;
 
             sum = add_rep_double(
                 sum, minutes * 6e10, &overflows);
@@ -441,6 +548,226 @@ def _duration_from_string() -> str:
         }''')
 
 
+def _fixed_width_function(
+        a_type: Union[mapry.Date, mapry.Datetime, mapry.Time]) -> Optional[str]:
+    """
+    Determine the name of the function parsing the date/time at fixed offsets.
+
+    :param a_type: mapry definition of the date/time type
+    :return: name of the function, or None if the format can not be compiled
+    """
+    fixed_width_format = mapry.strftime.fixed_width_format(format=a_type.format)
+
+    if fixed_width_format is None:
+        return None
+
+    return 'strptime_fixed_{}'.format(fixed_width_format.identifier)
+
+
+_FIXED_WIDTH_HELPERS_TPL = mapry.cpp.jinja2_env.ENV.from_string(
+    '''\
+/**
+ * parses the zero-padded decimal digits as an integer.
+ *
+ * @param[in] s string containing the digits
+ * @param[in] start position of the first digit
+ * @param[in] end position after the last digit
+ * @param[out] value parsed integer
+ * @return true if all the characters are ASCII digits
+ */
+bool fixed_digits(const std::string& s, size_t start, size_t end, int* value) {
+    int result = 0;
+    for (size_t i = start; i < end; ++i) {
+        if (s[i] < '0' or s[i] > '9') {
+            return false;
+        }
+        result = result * 10 + (s[i] - '0');
+    }
+
+    *value = result;
+    return true;
+}
+{% if has_date %}
+
+/**
+ * computes the number of days in the month of the Gregorian calendar.
+ *
+ * @param[in] year of the month
+ * @param[in] month starting at 1
+ * @return number of days
+ */
+int days_in_month(int year, int month) {
+    static const int kDays[] = {31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
+
+    if (month == 2 and
+            year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) {
+        return 29;
+    }
+
+    return kDays[month - 1];
+}
+
+/**
+ * sets the day of the week and the day of the year as strptime does.
+ *
+ * @param[in, out] t date whose year, month and day are set
+ */
+void set_wday_and_yday(struct tm* t) {
+    const int year = t->tm_year + 1900;
+
+    int yday = t->tm_mday - 1;
+    for (int month = 1; month < t->tm_mon + 1; ++month) {
+        yday += days_in_month(year, month);
+    }
+    t->tm_yday = yday;
+
+    // Sakamoto's method
+    static const int kOffsets[] = {0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4};
+    const int y = (t->tm_mon < 2) ? year - 1 : year;
+    t->tm_wday = (
+        y + y / 4 - y / 100 + y / 400 + kOffsets[t->tm_mon] + t->tm_mday) % 7;
+}
+{% endif %}{# /if has_date #}''')
+
+_FIXED_WIDTH_TPL = mapry.cpp.jinja2_env.ENV.from_string(
+    '''\
+/**
+ * parses the string in the format {{ format|escaped_str }}
+ * if the string is zero-padded and all its fields are within
+ * the regular ranges.
+ *
+ * @param[in] s string to be parsed
+ * @param[out] t parsed date/time; only the fields of the format are set
+ * @return true if parsed; otherwise, s needs to be parsed with strptime
+ */
+bool {{ function_name }}(
+        const std::string& s,
+        struct tm* t) {
+    if (s.size() != {{ length }}{% for literal in literals %} or
+            s.compare({{ literal.start }}, {{ literal.text|length }}, {{
+                literal.text|escaped_str }}) != 0{% endfor %}) {
+        return false;
+    }
+
+    {% for field in fields %}
+    int {{ variables[field.directive] }};
+    {% endfor %}
+    if ({{ digits[0] }}{% for digit in digits[1:] %} or
+            {{ digit }}{% endfor %}) {
+        return false;
+    }
+
+    if ({{ checks[0] }}{% for check in checks[1:] %} or
+            {{ check }}{% endfor %}) {
+        return false;
+    }
+
+    {% for assignment in assignments %}
+    {{ assignment }};
+    {% endfor %}
+    {% if has_date %}
+    set_wday_and_yday(t);
+    {% endif %}
+    return true;
+}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _fixed_width_parser(
+        fixed_width_format: mapry.strftime.FixedWidthFormat) -> str:
+    """
+    Generate the code to parse the date/time at fixed offsets.
+
+    :param fixed_width_format: compiled format of the date/time
+    :return: generated code
+    """
+    variables = collections.OrderedDict([('%Y', 'year'), ('%m', 'month'),
+                                         ('%d', 'day'), ('%H', 'hour'),
+                                         ('%M', 'minute'), ('%S', 'second')])
+
+    # Leave the years before the common era, the invalid days and
+    # the leap seconds to strptime.
+    ranges = {
+        '%Y': ['year < 1'],
+        '%m': ['month < 1', 'month > 12'],
+        '%d': ['day < 1', 'day > days_in_month(year, month)'],
+        '%H': ['hour > 23'],
+        '%M': ['minute > 59'],
+        '%S': ['second > 59']
+    }
+
+    assignments = {
+        '%Y': 't->tm_year = year - 1900',
+        '%m': 't->tm_mon = month - 1',
+        '%d': 't->tm_mday = day',
+        '%H': 't->tm_hour = hour',
+        '%M': 't->tm_min = minute',
+        '%S': 't->tm_sec = second'
+    }
+
+    directives = [
+        directive for directive in variables
+        if directive in fixed_width_format.directives
+    ]
+
+    return _FIXED_WIDTH_TPL.render(
+        function_name='strptime_fixed_{}'.format(fixed_width_format.identifier),
+        format=fixed_width_format.format,
+        length=fixed_width_format.length,
+        literals=fixed_width_format.literals,
+        fields=fixed_width_format.fields,
+        variables=variables,
+        digits=[
+            'not fixed_digits(s, {}, {}, &{})'.format(
+                field.start, field.end, variables[field.directive])
+            for field in fixed_width_format.fields
+        ],
+        checks=[
+            check for directive in directives for check in ranges[directive]
+        ],
+        assignments=[assignments[directive] for directive in directives],
+        has_date=fixed_width_format.has_date()).rstrip('\n')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _fixed_width_parsers(graph: mapry.Graph) -> str:
+    """
+    Generate the code to parse the dates/times whose formats have fixed offsets.
+
+    :param graph: mapry definition of the object graph
+    :return: generated code, empty if no format can be compiled
+    """
+    blocks = []  # type: List[str]
+    function_names = set()  # type: Set[str]
+    has_date = False
+
+    for a_type, _ in mapry.iterate_over_types(graph=graph):
+        if not isinstance(a_type, (mapry.Date, mapry.Datetime, mapry.Time)):
+            continue
+
+        function_name = _fixed_width_function(a_type=a_type)
+        if function_name is None or function_name in function_names:
+            continue
+
+        function_names.add(function_name)
+
+        fixed_width_format = mapry.strftime.fixed_width_format(
+            format=a_type.format)
+        assert fixed_width_format is not None
+
+        has_date = has_date or fixed_width_format.has_date()
+
+        blocks.append(
+            _fixed_width_parser(fixed_width_format=fixed_width_format))
+
+    if not blocks:
+        return ''
+
+    return '\n\n'.join(
+        [_FIXED_WIDTH_HELPERS_TPL.render(has_date=has_date).rstrip('\n')] +
+        blocks)
+
+
 @ensure(lambda result: not result.endswith('\n'))
 def _value_type_to_string() -> str:
     """
@@ -512,7 +839,7 @@ if (!{{ value }}.isBool()) {
         "Expected a bool, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -563,7 +890,7 @@ if (!{{ value }}.isInt64()) {
         "Expected an int64, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -585,7 +912,7 @@ if (!{{ value }}.isInt64()) {
             ", but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -603,7 +930,7 @@ if (!{{ value }}.isInt64()) {
             ", but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -662,7 +989,7 @@ if (!{{ value }}.isDouble()) {
         "Expected a double, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -684,7 +1011,7 @@ if (!{{ value }}.isDouble()) {
             ", but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -702,7 +1029,7 @@ if (!{{ value }}.isDouble()) {
             ", but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -760,7 +1087,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -782,7 +1109,7 @@ if (!{{ value }}.isString()) {
             ", but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -839,7 +1166,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -874,7 +1201,7 @@ if (!{{ value }}.isString()) {
             ", but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -933,7 +1260,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -942,26 +1269,37 @@ if (!{{ value }}.isString()) {
 } else {
     const std::string cast_{{ uid }} = {{ value }}.asString();
     struct tm tm_{{ uid }} = tm{0};
-    char* ret_{{ uid }} = strptime(
-        cast_{{ uid }}.c_str(),
-        {{ a_type.format|escaped_str }},
-        &tm_{{ uid }});
+{% set strptime_block %}
+char* ret_{{ uid }} = strptime(
+    cast_{{ uid }}.c_str(),
+    {{ a_type.format|escaped_str }},
+    &tm_{{ uid }});
 
-    if (ret_{{ uid }} == nullptr or *ret_{{ uid }} != '\\0') {
-        constexpr auto expected_but_got(
-            "Expected to strptime "
-            {{ a_type.format|escaped_str }}
-            ", but got: ");
+if (ret_{{ uid }} == nullptr or *ret_{{ uid }} != '\\0') {
+    constexpr auto expected_but_got(
+        "Expected to strptime "
+        {{ a_type.format|escaped_str }}
+        ", but got: ");
 
-        errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
-            message(
-                expected_but_got,
-                strlen(expected_but_got),
-                cast_{{ uid }}));
-    } else {
+    errors->add(
+        {{ ref_parts|lazy_ref|indent|indent }},
+        message(
+            expected_but_got,
+            strlen(expected_but_got),
+            cast_{{ uid }}));
+} else {
+    {{ target_expr }} = tm_{{ uid }};
+}{#
+#}{% endset %}{# /set strptime_block #}
+{% if fixed_width_function %}
+    if ({{ fixed_width_function }}(cast_{{ uid }}, &tm_{{ uid }})) {
         {{ target_expr }} = tm_{{ uid }};
+    } else {
+        {{ strptime_block|indent|indent }}
     }
+{% else %}
+    {{ strptime_block|indent }}
+{% endif %}{# /if fixed_width_function #}
 }''')
 
 _PARSE_DATE_TPL = mapry.cpp.jinja2_env.ENV.from_string(
@@ -980,7 +1318,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1001,7 +1339,7 @@ if (!{{ value }}.isString()) {
             ", but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -1035,7 +1373,9 @@ def _parse_date(
             value_expr=value_expr,
             ref_parts=ref_parts,
             target_expr=target_expr,
-            a_type=a_type).rstrip("\n")
+            a_type=a_type,
+            fixed_width_function=_fixed_width_function(
+                a_type=a_type)).rstrip("\n")
 
     if cpp.datetime_library == 'date.h':
         return _PARSE_DATE_TPL.render(
@@ -1074,7 +1414,9 @@ def _parse_date_time(
             value_expr=value_expr,
             ref_parts=ref_parts,
             target_expr=target_expr,
-            a_type=a_type).rstrip("\n")
+            a_type=a_type,
+            fixed_width_function=_fixed_width_function(
+                a_type=a_type)).rstrip("\n")
 
     if cpp.datetime_library == 'date.h':
         return _PARSE_DATE_TPL.render(
@@ -1104,7 +1446,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1126,7 +1468,7 @@ if (!{{ value }}.isString()) {
             ", but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -1163,7 +1505,9 @@ def _parse_time(
             value_expr=value_expr,
             ref_parts=ref_parts,
             target_expr=target_expr,
-            a_type=a_type).rstrip("\n")
+            a_type=a_type,
+            fixed_width_function=_fixed_width_function(
+                a_type=a_type)).rstrip("\n")
 
     elif cpp.datetime_library == 'date.h':
         return _PARSE_TIME_OF_DAY_TPL.render(
@@ -1194,7 +1538,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1220,7 +1564,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1236,7 +1580,7 @@ if (!{{ value }}.isString()) {
             "Expected a valid IANA time zone, but got: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -1300,7 +1644,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1317,7 +1661,7 @@ if (!{{ value }}.isString()) {
             "Invalid duration: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 invalid_duration,
                 strlen(invalid_duration),
@@ -1383,7 +1727,7 @@ if (!{{ value }}.isArray()) {
         "Expected an array, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1397,7 +1741,7 @@ if (!{{ value }}.isArray()) {
         ", but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1411,7 +1755,7 @@ if (!{{ value }}.isArray()) {
         ", but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1447,8 +1791,7 @@ def _parse_array(
     item_parsing = _parse_value(
         value_expr="item_{uid}".format(uid=uid),
         target_expr="target_{uid}.at(i_{uid})".format(uid=uid),
-        ref_parts=ref_parts +
-        ['"/"', 'std::to_string(i_{uid})'.format(uid=uid)],
+        ref_parts=ref_parts + ['i_{uid}'.format(uid=uid)],
         a_type=a_type.values,
         registry_exprs=registry_exprs,
         auto_id=auto_id,
@@ -1481,7 +1824,7 @@ if (!{{ value }}.isObject()) {
         "Expected an object, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1526,7 +1869,7 @@ def _parse_map(
     item_parsing = _parse_value(
         value_expr="*it_{uid}".format(uid=uid),
         target_expr="target_{uid}[it_{uid}.name()]".format(uid=uid),
-        ref_parts=ref_parts + ['"/"', 'it_{uid}.name()'.format(uid=uid)],
+        ref_parts=ref_parts + ['it_{uid}.name()'.format(uid=uid)],
         a_type=a_type.values,
         registry_exprs=registry_exprs,
         auto_id=auto_id,
@@ -1557,7 +1900,7 @@ if (!{{ value }}.isString()) {
         "Expected a string, but got: ");
 
     errors->add(
-        {{ ref_parts|join_strings|indent|indent }},
+        {{ ref_parts|lazy_ref|indent|indent }},
         message(
             expected_but_got,
             strlen(expected_but_got),
@@ -1572,7 +1915,7 @@ if (!{{ value }}.isString()) {
             " not found: ");
 
         errors->add(
-            {{ ref_parts|join_strings|indent|indent|indent }},
+            {{ ref_parts|lazy_ref|indent|indent|indent }},
             message(
                 reference_not_found,
                 strlen(reference_not_found),
@@ -1628,7 +1971,7 @@ const Json::Value& value_{{ uid }} = {{ value_expr }};
     {% for registry_expr in selected_registry_exprs %}
     {{ registry_expr }},
     {% endfor %}
-    {{ ref_parts|join_strings|indent }},
+    {{ ref_parts|lazy_ref|indent }},
     &{{ target_expr }},
     errors);''')
 
@@ -1833,7 +2176,7 @@ _PARSE_PROPERTY_TPL = mapry.cpp.jinja2_env.ENV.from_string(
 {% if not a_property.optional %}
 if (!{{value_obj_expr}}.isMember({{a_property.json|escaped_str}})) {
     errors->add(
-        {{ ref_obj_parts|join_strings|indent|indent }},
+        {{ ref_obj_parts|lazy_ref|indent|indent }},
         {{ "Property is missing: %s"|format(a_property.json)|escaped_str }});
 } else {
     {{ parsing|indent }}
@@ -1873,7 +2216,7 @@ def _parse_property(
     property_value_expr = "{}[{}]".format(
         value_obj_expr, mapry.cpp.generate.escaped_str(a_property.json))
     property_ref_parts = ref_obj_parts + [
-        mapry.cpp.generate.escaped_str("/" + a_property.json)
+        mapry.cpp.generate.escaped_str(a_property.json)
     ]
 
     # Special handling of the optional property
@@ -1918,7 +2261,7 @@ void {{ composite.name|as_variable }}_from(
             ref_cls.name|as_composite }}>>& {{
                 ref_cls.plural|as_variable }}_registry,
 {% endfor %}
-        std::string ref,
+        const parse::Ref& ref,
         {{ composite.name|as_composite }}* target,
         parse::Errors* errors) {
     if (!value.isObject()) {
@@ -2014,18 +2357,18 @@ void {{ graph.name|as_variable }}_from(
                     value.type())));
         return;
     }
+{% if graph.classes or property_parsings %}
+
+    const parse::Ref graph_ref(ref);
+{% endif %}
 {% for cls in graph.classes.values() %}
 
     ////
     // Pre-allocate {{ cls.plural|as_field }}
     ////
 
-    std::string {{ cls.plural|as_variable }}_ref;
-    {{ cls.plural|as_variable }}_ref.reserve(ref.size() + {{
-        "/%s"|format(cls.plural|json_plural)|length }});
-    {{ cls.plural|as_variable }}_ref += ref;
-    {{ cls.plural|as_variable }}_ref += {{
-        "/%s"|format(cls.plural|json_plural)|escaped_str }};
+    const parse::Ref {{ cls.plural|as_variable }}_ref(
+        graph_ref, {{ cls.plural|json_plural|escaped_str }});
 
     if (value.isMember({{ cls.plural|json_plural|escaped_str }})) {
         const Json::Value& obj = value[{{
@@ -2086,10 +2429,6 @@ void {{ graph.name|as_variable }}_from(
     if (!errors->empty()) {
         return;
     }
-
-    // Keep the prefix fixed in this buffer so that
-    // it is copied as little as possible
-    std::string instance_ref;
 {% endif %}
 {% for cls in graph.classes.values() %}
 
@@ -2097,32 +2436,21 @@ void {{ graph.name|as_variable }}_from(
     // Parse {{ cls.plural|as_field }}
     ////
 
-    // clear() does not shrink the reserved memory,
-    // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-    instance_ref.clear();
-    instance_ref += {{ cls.plural|as_variable }}_ref;
-    instance_ref += '/';
-
     if (value.isMember({{ cls.plural|json_plural|escaped_str }})) {
         const Json::Value& obj = value[{{
             cls.plural|json_plural|escaped_str }}];
 
         for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-            instance_ref.reserve(
-                {{ cls.plural|as_variable }}_ref.size() + 1 + it.name().size());
-            instance_ref.resize(
-                {{ cls.plural|as_variable }}_ref.size() + 1);
-            instance_ref.append(
-                it.name());
+            const std::string id = it.name();
 
             {{ cls.name|as_composite }}* instance(
-                target->{{ cls.plural|as_field }}.at(it.name()).get());
+                target->{{ cls.plural|as_field }}.at(id).get());
             {{ cls.name|as_variable }}_from(
                 *it,
                 {% for ref_cls in references[cls] %}
                 target->{{ ref_cls.plural|as_field }},
                 {% endfor %}
-                instance_ref,
+                parse::Ref({{ cls.plural|as_variable }}_ref, id),
                 instance,
                 errors);
 
@@ -2175,7 +2503,7 @@ def _parse_graph(graph: mapry.Graph, cpp: mapry.Cpp) -> str:
             _parse_property(
                 target_obj_expr="target",
                 value_obj_expr="value",
-                ref_obj_parts=['ref'],
+                ref_obj_parts=['graph_ref'],
                 a_property=prop,
                 registry_exprs=registry_exprs,
                 auto_id=auto_id,
@@ -2800,6 +3128,11 @@ def generate(
         defines parsing and serializing functions from/to Jsoncpp
     :return: content of the implementation file
     """
+    if cpp.trusted_input:
+        # The constraints are assumed to be satisfied so that
+        # no checks are generated for them.
+        graph = mapry.without_constraints(graph=graph)
+
     ##
     # Header
     ##
@@ -2837,6 +3170,11 @@ def generate(
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
         blocks.append(_duration_from_string())
 
+    if cpp.datetime_library == 'ctime':
+        fixed_width_parsers = _fixed_width_parsers(graph=graph)
+        if fixed_width_parsers:
+            blocks.append(fixed_width_parsers)
+
     blocks.append(_value_type_to_string())
 
     blocks.append(_parse_graph(graph=graph, cpp=cpp))
@@ -9,6 +9,62 @@ import mapry.cpp.generate
 import mapry.indention
 
 
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_ref() -> str:
+    """
+    Generate the implementation of the lazy reference.
+
+    :return: generated code
+    """
+    return textwrap.dedent(
+        '''\
+        Ref::Ref(const std::string& root) :
+            parent_(nullptr),
+            key_(root.c_str()),
+            key_size_(root.size()),
+            index_(0) {}
+
+        Ref::Ref(const Ref& parent, const char* key) :
+            parent_(&parent),
+            key_(key),
+            key_size_(strlen(key)),
+            index_(0) {}
+
+        Ref::Ref(const Ref& parent, const std::string& key) :
+            parent_(&parent),
+            key_(key.c_str()),
+            key_size_(key.size()),
+            index_(0) {}
+
+        Ref::Ref(const Ref& parent, size_t index) :
+            parent_(&parent),
+            key_(nullptr),
+            key_size_(0),
+            index_(index) {}
+
+        std::string Ref::str() const {
+            std::vector<const Ref*> refs;
+            for (const Ref* ref = this; ref != nullptr; ref = ref->parent_) {
+                refs.push_back(ref);
+            }
+
+            std::string result;
+            for (auto it = refs.rbegin(); it != refs.rend(); ++it) {
+                const Ref* ref = *it;
+                if (ref->parent_ != nullptr) {
+                    result += '/';
+                }
+
+                if (ref->key_ != nullptr) {
+                    result.append(ref->key_, ref->key_size_);
+                } else {
+                    result.append(std::to_string(ref->index_));
+                }
+            }
+            return result;
+        }''')
+
+
 @ensure(lambda result: not result.endswith('\n'))
 def _parse_errors() -> str:
     """
@@ -30,6 +86,12 @@ def _parse_errors() -> str:
             }
         }
 
+        void Errors::add(const Ref& ref, const std::string& message) {
+            if (errors_.size() < cap_) {
+                errors_.emplace_back(Error{ref.str(), message});
+            }
+        }
+
         bool Errors::full() const {
             return errors_.size() == cap_;
         }
@@ -57,6 +119,7 @@ def generate(cpp: mapry.Cpp, parse_header_path: str) -> str:
         mapry.cpp.generate.WARNING, '#include "{}"'.format(parse_header_path),
         textwrap.dedent(
             '''\
+            #include <cstring>
             #include <string>
             #include <vector>''')
     ]
@@ -72,6 +135,8 @@ def generate(cpp: mapry.Cpp, parse_header_path: str) -> str:
 
     blocks.append("namespace parse {")
 
+    blocks.append(_parse_ref())
+
     blocks.append(_parse_errors())
 
     blocks.append("}  // namespace parse")
@@ -23,6 +23,6 @@ ENV.filters.update({
     'escaped_str': mapry.cpp.generate.escaped_str,
     'json_plural': mapry.naming.json_plural,
     'is_variable': mapry.cpp.expr.is_variable,
-    'join_strings': mapry.cpp.expr.append_strings,
+    'lazy_ref': mapry.cpp.expr.lazy_ref,
     '_raise': _raise
 })
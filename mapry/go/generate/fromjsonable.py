@@ -1,8 +1,9 @@
 """Generate the code that parses the object graph from a JSONable structure."""
 
+import collections
 import textwrap
 from typing import (  # pylint: disable=unused-import
-    List, Mapping, MutableMapping, Optional, Pattern, Union)
+    List, Mapping, MutableMapping, Optional, Pattern, Set, Union)
 
 from icontract import ensure
 
@@ -46,7 +47,7 @@ def _imports(graph: mapry.Graph) -> str:
     :param go: Go settings
     :return: generated code
     """
-    import_set = {'strings', 'fmt'}
+    import_set = {'fmt'}
 
     if mapry.needs_type(a_type=graph, query=mapry.Integer):
         import_set.add('math')
@@ -61,8 +62,14 @@ def _imports(graph: mapry.Graph) -> str:
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
         import_set.add('math')
         import_set.add('time')
-        import_set.add('regexp')
         import_set.add('strconv')
+        import_set.add('strings')
+
+    if mapry.needs_type(a_type=graph, query=mapry.TimeZone):
+        import_set.add('sync')
+
+    if graph.classes:
+        import_set.add('sort')
 
     ##
     # Constrained by a pattern?
@@ -83,16 +90,227 @@ def _imports(graph: mapry.Graph) -> str:
     if has_pattern:
         import_set.add("regexp")
 
-    ##
-    # Any arrays?
-    ##
+    return mapry.go.generate.import_declarations(import_set)
 
-    if any(isinstance(a_type, mapry.Array)
-           for a_type, _ in mapry.iterate_over_types(graph=graph)):
-        # needed to convert indices to strings in error messages
-        import_set.add('strconv')
 
-    return mapry.go.generate.import_declarations(import_set)
+@ensure(lambda result: not result.endswith('\n'))
+def _location_cache() -> str:
+    """
+    Generate the code for caching the loaded time zone locations.
+
+    :return: generated code
+    """
+    return textwrap.dedent(
+        '''\
+    // locationCache maps time zone names to the loaded *time.Location's.
+    //
+    // time.LoadLocation reads the time zone database on every call so that
+    // the locations are loaded only once and shared among the values.
+    var locationCache sync.Map
+
+    // loadLocation gives the location with the given name.
+    //
+    // The location is loaded on the first request and cached afterwards.
+    // The names which could not be loaded are not cached.
+    //
+    // loadLocation is safe for concurrent use.
+    func loadLocation(name string) (*time.Location, error) {
+        cached, ok := locationCache.Load(name)
+        if ok {
+            return cached.(*time.Location), nil
+        }
+
+        loc, err := time.LoadLocation(name)
+        if err != nil {
+            return nil, err
+        }
+
+        actual, _ := locationCache.LoadOrStore(name, loc)
+        return actual.(*time.Location), nil
+    }
+
+    // PrewarmLocations loads the locations with the given names in advance
+    // so that the parsing needs not access the time zone database.
+    //
+    // All the names are loaded even if some fail. The first error is returned.
+    //
+    // PrewarmLocations is safe for concurrent use.
+    func PrewarmLocations(names ...string) (err error) {
+        for _, name := range names {
+            _, loadErr := loadLocation(name)
+            if loadErr != nil && err == nil {
+                err = loadErr
+            }
+        }
+        return
+    }''')
+
+
+def fixed_width_function(a_type: Union[mapry.Date, mapry.Datetime, mapry.Time]
+                         ) -> Optional[str]:
+    """
+    Determine the name of the function parsing the date/time at fixed offsets.
+
+    :param a_type: mapry definition of the date/time type
+    :return: name of the function, or None if the format can not be compiled
+    """
+    fixed_width_format = mapry.strftime.fixed_width_format(format=a_type.format)
+
+    if fixed_width_format is None:
+        return None
+
+    return 'timeFromFixed{}'.format(fixed_width_format.identifier)
+
+
+_FIXED_DIGITS_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+    for i := 0; i < len(text); i++ {
+        if text[i] < '0' || text[i] > '9' {
+            return 0, false
+        }
+        value = value*10 + int(text[i]-'0')
+    }
+    return value, true
+}''')
+
+_FIXED_WIDTH_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+// {{ function_name }} parses the text
+// in the layout {{ layout|escaped_str }} if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func {{ function_name }}(text string) (t time.Time, ok bool) {
+    if len(text) != {{ length }}{% for literal in literals %} ||
+        text[{{ literal.start }}:{{ literal.start + literal.text|length
+            }}] != {{ literal.text|escaped_str }}{% endfor %} {
+        return time.Time{}, false
+    }
+
+    {% for field in fields %}
+    {{ variables[field.directive] }}, ok := fixedDigits(text[{{
+        field.start }}:{{ field.end }}])
+    if !ok {
+        return time.Time{}, false
+    }
+
+    {% endfor %}
+    t = time.Date(
+        {% for argument in arguments %}
+        {{ argument }},
+        {% endfor %}
+        0,
+        time.UTC)
+
+    // Check that the fields have not been normalized.
+    if {{ checks[0] }}{% for check in checks[1:] %} ||
+        {{ check }}{% endfor %} {
+        return time.Time{}, false
+    }
+
+    return t, true
+}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _fixed_width_parser(
+        fixed_width_format: mapry.strftime.FixedWidthFormat) -> str:
+    """
+    Generate the code to parse the date/time at fixed offsets.
+
+    :param fixed_width_format: compiled format of the date/time
+    :return: generated code
+    """
+    variables = collections.OrderedDict([('%Y', 'year'), ('%m', 'month'),
+                                         ('%d', 'day'), ('%H', 'hour'),
+                                         ('%M', 'minute'), ('%S', 'second')])
+
+    # time.Parse defaults to January 1, year 0, at midnight.
+    defaults = {
+        '%Y': '0',
+        '%m': 'time.January',
+        '%d': '1',
+        '%H': '0',
+        '%M': '0',
+        '%S': '0'
+    }
+
+    getters = {
+        '%Y': 't.Year()',
+        '%m': 'int(t.Month())',
+        '%d': 't.Day()',
+        '%H': 't.Hour()',
+        '%M': 't.Minute()',
+        '%S': 't.Second()'
+    }
+
+    arguments = []  # type: List[str]
+    checks = []  # type: List[str]
+
+    if fixed_width_format.has_date():
+        # Leave the years before the common era to time.Parse.
+        checks.append('year < 1')
+
+    for directive, variable in variables.items():
+        if directive in fixed_width_format.directives:
+            checks.append('{} != {}'.format(getters[directive], variable))
+
+            if directive == '%m':
+                arguments.append('time.Month({})'.format(variable))
+            else:
+                arguments.append(variable)
+        else:
+            arguments.append(defaults[directive])
+
+    function_name = 'timeFromFixed{}'.format(fixed_width_format.identifier)
+
+    return _FIXED_WIDTH_TPL.render(
+        function_name=function_name,
+        layout=mapry.go.timeformat.convert(a_format=fixed_width_format.format),
+        length=fixed_width_format.length,
+        literals=fixed_width_format.literals,
+        fields=fixed_width_format.fields,
+        variables=variables,
+        arguments=arguments,
+        checks=checks).rstrip('\n')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _fixed_width_parsers(graph: mapry.Graph) -> str:
+    """
+    Generate the code to parse the dates/times whose formats have fixed offsets.
+
+    :param graph: mapry definition of the object graph
+    :return: generated code, empty if no format can be compiled
+    """
+    blocks = []  # type: List[str]
+    function_names = set()  # type: Set[str]
+
+    for a_type, _ in mapry.iterate_over_types(graph=graph):
+        if not isinstance(a_type, (mapry.Date, mapry.Datetime, mapry.Time)):
+            continue
+
+        function_name = fixed_width_function(a_type=a_type)
+        if function_name is None or function_name in function_names:
+            continue
+
+        function_names.add(function_name)
+
+        fixed_width_format = mapry.strftime.fixed_width_format(
+            format=a_type.format)
+        assert fixed_width_format is not None
+
+        blocks.append(
+            _fixed_width_parser(fixed_width_format=fixed_width_format))
+
+    if not blocks:
+        return ''
+
+    return '\n\n'.join([_FIXED_DIGITS_TPL.render()] + blocks)
 
 
 @ensure(lambda result: not result.endswith('\n'))
@@ -104,17 +322,116 @@ def _duration_from_string() -> str:
     """
     return textwrap.dedent(
         '''\
-    var durationRe = regexp.MustCompile(
-        `^(-|\\+)?P`+
-        `(((0|[1-9][0-9]*)(\.[0-9]+)?)Y)?`+
-        `(((0|[1-9][0-9]*)(\.[0-9]+)?)M)?`+
-        `(((0|[1-9][0-9]*)(\.[0-9]+)?)W)?`+
-        `(((0|[1-9][0-9]*)(\.[0-9]+)?)D)?`+
-        `(T`+
-        `(((0|[1-9][0-9]*)(\.[0-9]+)?)H)?`+
-        `(((0|[1-9][0-9]*)(\.[0-9]+)?)M)?`+
-        `(((0|[1-9][0-9]*)(\.([0-9]+))?)S)?`+
-        `)?$`)
+    // durationParts represents the components of a duration in ISO 8601
+    // format as they are written in the text.
+    //
+    // The components which are not specified are empty.
+    type durationParts struct {
+        sign     string
+        years    string
+        months   string
+        weeks    string
+        days     string
+        hours    string
+        minutes  string
+        seconds  string
+        fraction string
+    }
+
+    // scanDuration splits the duration in ISO 8601 format into its
+    // components in a single pass.
+    //
+    // ok is false if s does not conform to the format.
+    func scanDuration(s string) (parts durationParts, ok bool) {
+        i := 0
+        if i < len(s) && (s[i] == '+' || s[i] == '-') {
+            parts.sign = s[i : i+1]
+            i++
+        }
+
+        if i == len(s) || s[i] != 'P' {
+            return durationParts{}, false
+        }
+        i++
+
+        // Designators of the date part are followed by
+        // the designators of the time part.
+        designators := "YMWD"
+        offset := 0
+        next := 0
+
+        for i < len(s) {
+            if s[i] == 'T' && offset == 0 {
+                designators = "HMS"
+                offset = 4
+                next = 0
+                i++
+                continue
+            }
+
+            start := i
+
+            switch {
+            case s[i] == '0':
+                i++
+            case s[i] >= '1' && s[i] <= '9':
+                i++
+                for i < len(s) && s[i] >= '0' && s[i] <= '9' {
+                    i++
+                }
+            default:
+                return durationParts{}, false
+            }
+
+            integerEnd := i
+
+            if i < len(s) && s[i] == '.' {
+                i++
+                for i < len(s) && s[i] >= '0' && s[i] <= '9' {
+                    i++
+                }
+
+                if i == integerEnd+1 {
+                    return durationParts{}, false
+                }
+            }
+
+            if i == len(s) {
+                return durationParts{}, false
+            }
+
+            designator := strings.IndexByte(designators[next:], s[i])
+            if designator == -1 {
+                return durationParts{}, false
+            }
+            designator += next
+
+            switch offset + designator {
+            case 0:
+                parts.years = s[start:i]
+            case 1:
+                parts.months = s[start:i]
+            case 2:
+                parts.weeks = s[start:i]
+            case 3:
+                parts.days = s[start:i]
+            case 4:
+                parts.hours = s[start:i]
+            case 5:
+                parts.minutes = s[start:i]
+            default:
+                parts.seconds = s[start:integerEnd]
+                if i > integerEnd {
+                    parts.fraction = s[integerEnd+1 : i]
+                }
+            }
+
+            next = designator + 1
+            i++
+        }
+
+        return parts, true
+    }
 
     // addDuration adds right nanoseconds to the left duration.
     //
@@ -159,9 +476,9 @@ def _duration_from_string() -> str:
     // Since time.Duration is measured in nanoseconds, beware of overflow
     // issues due to finite representation of integers.
     func durationFromString(s string) (d time.Duration, err error) {
-        m := durationRe.FindStringSubmatch(s)
+        parts, ok := scanDuration(s)
 
-        if len(m) == 0 {
+        if !ok {
             err = fmt.Errorf("failed to match the duration pattern")
             return
         }
@@ -174,60 +491,60 @@ def _duration_from_string() -> str:
         var seconds, nanoseconds int64
 
         sign := int64(1)
-        if len(m[1]) > 0 && m[1][0] == '-' {
+        if len(parts.sign) > 0 && parts.sign[0] == '-' {
             sign = -1
         }
 
-        if len(m[3]) > 0 {
-            years, err = strconv.ParseFloat(m[3], 64)
+        if len(parts.years) > 0 {
+            years, err = strconv.ParseFloat(parts.years, 64)
             if err != nil {
                 err = fmt.Errorf("failed to parse the years: %s", err.Error())
                 return
             }
         }
 
-        if len(m[7]) > 0 {
-            months, err = strconv.ParseFloat(m[7], 64)
+        if len(parts.months) > 0 {
+            months, err = strconv.ParseFloat(parts.months, 64)
             if err != nil {
                 err = fmt.Errorf("failed to parse the months: %s", err.Error())
                 return
             }
         }
 
-        if len(m[11]) > 0 {
-            weeks, err = strconv.ParseFloat(m[11], 64)
+        if len(parts.weeks) > 0 {
+            weeks, err = strconv.ParseFloat(parts.weeks, 64)
             if err != nil {
                 err = fmt.Errorf("failed to parse the weeks: %s", err.Error())
                 return
             }
         }
 
-        if len(m[15]) > 0 {
-            days, err = strconv.ParseFloat(m[15], 64)
+        if len(parts.days) > 0 {
+            days, err = strconv.ParseFloat(parts.days, 64)
             if err != nil {
                 err = fmt.Errorf("failed to parse the days: %s", err.Error())
                 return
             }
         }
 
-        if len(m[20]) > 0 {
-            hours, err = strconv.ParseFloat(m[20], 64)
+        if len(parts.hours) > 0 {
+            hours, err = strconv.ParseFloat(parts.hours, 64)
             if err != nil {
                 err = fmt.Errorf("failed to parse the hours: %s", err.Error())
                 return
             }
         }
 
-        if len(m[24]) > 0 {
-            minutes, err = strconv.ParseFloat(m[24], 64)
+        if len(parts.minutes) > 0 {
+            minutes, err = strconv.ParseFloat(parts.minutes, 64)
             if err != nil {
                 err = fmt.Errorf("failed to parse the minutes: %s", err.Error())
                 return
             }
         }
 
-        if len(m[29]) > 0 {
-            seconds, err = strconv.ParseInt(m[29], 10, 64)
+        if len(parts.seconds) > 0 {
+            seconds, err = strconv.ParseInt(parts.seconds, 10, 64)
             if err != nil {
                 err = fmt.Errorf("failed to parse the seconds: %s", err.Error())
                 return
@@ -235,10 +552,10 @@ def _duration_from_string() -> str:
         }
 
         switch {
-        case len(m[31]) == 0:
+        case len(parts.fraction) == 0:
             // pass
-        case len(m[31]) <= 9:
-            trimmed := strings.TrimLeft(m[31], "0")
+        case len(parts.fraction) <= 9:
+            trimmed := strings.TrimLeft(parts.fraction, "0")
             if len(trimmed) > 0 {
                 nanoseconds, err = strconv.ParseInt(trimmed, 10, 64)
                 if err != nil {
@@ -247,7 +564,7 @@ def _duration_from_string() -> str:
                         err.Error())
                 }
 
-                order := 9 - len(m[31])
+                order := 9 - len(parts.fraction)
                 for i := 0; i < order; i++ {
                     nanoseconds *= 10
                 }
@@ -353,8 +670,7 @@ def _enumerate_type_patterns_recursively(
     return next_id
 
 
-def _enumerate_patterns(graph: mapry.Graph
-                        ) -> MutableMapping[Pattern[str], int]:
+def enumerate_patterns(graph: mapry.Graph) -> MutableMapping[Pattern[str], int]:
     """
     Map all the patterns to unique identifiers.
 
@@ -429,11 +745,8 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(bool)
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(bool)
 {% endif %}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a bool, but got: %T",
             {{ value_expr }}))
@@ -476,20 +789,14 @@ fcast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(float64)
 fcast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(float64)
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a float64, but got: %T",
             {{ value_expr }}))
 } else if fcast{{ uid }} != math.Trunc(fcast{{ uid }}) {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a whole number, but got: %f",
             fcast{{ uid }}))
@@ -498,11 +805,8 @@ if !ok{{ uid }} {
 } else if fcast{{ uid }} >= 9223372036854775808.0 ||
     fcast{{ uid }} < -9223372036854775808.0 {
 
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected the value to fit into int64, but got an overflow: %f",
             fcast{{ uid }}))
@@ -516,11 +820,8 @@ if !ok{{ uid }} {
     {% if a_type.minimum is not none %}
     {% set op = ">" if a_type.exclusive_minimum else ">="  %}
     if !(cast{{ uid }} {{ op }} {{ a_type.minimum }}) {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 {{ "expected %s %d, but got: %%d"|
                     format(op, a_type.minimum)|escaped_str }},
@@ -532,11 +833,8 @@ if !ok{{ uid }} {
     {{ '} else if'
         if got_cond_before else 'if'
     }} !(cast{{ uid }} {{ op }} {{ a_type.maximum }}) {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                    "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 {{ "expected %s %d, but got: %%d"|
                     format(op, a_type.maximum)|escaped_str }},
@@ -586,11 +884,8 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(float64)
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(float64)
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a float64, but got: %T",
             {{ value_expr }}))
@@ -602,11 +897,8 @@ if !ok{{ uid }} {
     {% if a_type.minimum is not none %}
     {% set op = ">" if a_type.exclusive_minimum else ">="  %}
     if !(cast{{ uid }} {{ op }} {{ a_type.minimum }}) {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 {{ "expected %s %f, but got: %%f"|
                     format(op, a_type.minimum)|escaped_str }},
@@ -618,11 +910,8 @@ if !ok{{ uid }} {
     {{ '} else if'
         if got_cond_before else 'if'
     }} !(cast{{ uid }} {{ op }} {{ a_type.maximum }}) {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                    "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 {{ "expected %s %f, but got: %%f"|
                     format(op, a_type.maximum)|escaped_str }},
@@ -672,11 +961,8 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(string)
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(string)
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a string, but got: %T",
             {{ value_expr }}))
@@ -685,11 +971,8 @@ if !ok{{ uid }} {
     {{ target_expr }} = cast{{ uid }}
     {% else %}
     if !pattern{{ pattern_uids[a_type.pattern] }}.MatchString(cast{{ uid }}) {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 {{ "expected to match %s, but got: %%s"|
                     format(a_type.pattern.pattern)|escaped_str }},
@@ -741,24 +1024,28 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(string)
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(string)
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a string, but got: %T",
             {{ value_expr }}))
 } else {
+{% if fixed_width_function %}
+    target{{ uid }}, fixed{{ uid }} := {{ fixed_width_function }}(cast{{ uid }})
+    var err{{ uid }} error
+    if !fixed{{ uid }} {
+        target{{ uid }}, err{{ uid }} = time.Parse(
+            {{ converted_format|escaped_str }},
+            cast{{ uid }})
+    }
+{% else %}
     target{{ uid }}, err{{ uid }} := time.Parse(
         {{ converted_format|escaped_str }},
         cast{{ uid }})
+{% endif %}{# /if fixed_width_function #}
     if err{{ uid }} != nil {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 {{ "expected layout %s, got: %%s"|
                     format(converted_format)|escaped_str }},
@@ -796,7 +1083,8 @@ def _parse_date_time(
         uid=uid,
         ref_parts=ref_parts,
         converted_format=converted_format,
-        target_expr=target_expr)
+        target_expr=target_expr,
+        fixed_width_function=fixed_width_function(a_type=a_type))
 
 
 _PARSE_TIME_ZONE_TPL = mapry.go.jinja2_env.ENV.from_string(
@@ -808,22 +1096,16 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(string)
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(string)
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a string, but got: %T",
             {{ value_expr }}))
 } else {
-    target{{ uid }}, err{{ uid }} := time.LoadLocation(cast{{ uid }})
+    target{{ uid }}, err{{ uid }} := loadLocation(cast{{ uid }})
     if err{{ uid }} != nil {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 "failed to load location from %#v: %s",
                 cast{{ uid }},
@@ -869,22 +1151,16 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(string)
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(string)
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a string, but got: %T",
             {{ value_expr }}))
 } else {
     target{{ uid }}, err{{ uid }} := durationFromString(cast{{uid}})
     if err{{ uid }} != nil {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 "failed to parse duration from %#v: %s",
                 cast{{ uid }},
@@ -943,21 +1219,15 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.([]interface{})
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).([]interface{})
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a []interface{}, but got: %T",
             {{ value_expr }}))
 {% if minimum_size is not none %}
 } else if len(cast{{ uid }}) < {{ minimum_size }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             {{ "expected an array of minimum size %d, but got: %%d"|
                 format(minimum_size)|escaped_str }},
@@ -965,11 +1235,8 @@ if !ok{{ uid }} {
 {% endif %}{# /if minimum_size is not none #}
 {% if maximum_size is not none %}
 } else if len(cast{{ uid }}) > {{ maximum_size }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             {{ "expected an array of maximum size %d, but got: %%d"|
                 format(maximum_size)|escaped_str }},
@@ -1008,7 +1275,7 @@ def _parse_array(
     item_parsing = _parse_value(
         value_expr="cast{uid}[i{uid}]".format(uid=uid),
         target_expr="target{uid}[i{uid}]".format(uid=uid),
-        ref_parts=ref_parts + ["strconv.Itoa(i{uid})".format(uid=uid)],
+        ref_parts=ref_parts + ["Index(i{uid})".format(uid=uid)],
         a_type=a_type.values,
         registry_exprs=registry_exprs,
         pattern_uids=pattern_uids,
@@ -1035,11 +1302,8 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(map[string]interface{})
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(map[string]interface{})
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a map[string]interface{}, but got: %T",
             {{ value_expr }}))
@@ -1095,7 +1359,7 @@ def _parse_map(
         intermediate_item_parsing = _parse_value(
             value_expr="cast{uid}[k{uid}]".format(uid=uid),
             target_expr="item{uid}".format(uid=uid),
-            ref_parts=ref_parts + ["k{uid}".format(uid=uid)],
+            ref_parts=ref_parts + ["Key(k{uid})".format(uid=uid)],
             a_type=a_type.values,
             registry_exprs=registry_exprs,
             pattern_uids=pattern_uids,
@@ -1112,7 +1376,7 @@ def _parse_map(
         item_parsing = _parse_value(
             value_expr="cast{uid}[k{uid}]".format(uid=uid),
             target_expr="target{uid}[k{uid}]".format(uid=uid),
-            ref_parts=ref_parts + ["k{uid}".format(uid=uid)],
+            ref_parts=ref_parts + ["Key(k{uid})".format(uid=uid)],
             a_type=a_type.values,
             registry_exprs=registry_exprs,
             pattern_uids=pattern_uids,
@@ -1265,12 +1529,9 @@ value{{ uid }}, ok{{ uid }} := {{ value_map_expr }}[
 
 {% if not a_property.optional %}
 if !ok{{ uid }} {
-    errors.Add(
+    errors.AddRef(
         {% if ref_obj_parts|length > 1 %}
-        strings.Join(
-            []string{
-                {{ ref_obj_parts|join(', ') }}},
-            "/"),
+        {{ ref_obj_parts|join('.') }},
         {% elif ref_obj_parts|length == 1 %}
         {{ ref_obj_parts[0] }},
         {% else %}
@@ -1319,8 +1580,9 @@ def _parse_property(
 
     field = mapry.naming.ucamel_case(identifier=a_property.name)
     property_target_expr = '{}.{}'.format(target_obj_expr, field)
-    property_ref_parts = (
-        ref_obj_parts + [mapry.go.generate.escaped_str(a_property.json)])
+    property_ref_parts = ref_obj_parts + [
+        'Key({})'.format(mapry.go.generate.escaped_str(a_property.json))
+    ]
 
     is_pointer_type = None  # type: Optional[bool]
 
@@ -1390,22 +1652,16 @@ cast{{ uid }}, ok{{ uid }} := {{ value_expr }}.(string)
 cast{{ uid }}, ok{{ uid }} := ({{ value_expr }}).(string)
 {% endif %}{# /if value_expr|is_variable #}
 if !ok{{ uid }} {
-    errors.Add(
-        strings.Join(
-            []string{
-                {{ ref_parts|join(', ') }}},
-            "/"),
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
         fmt.Sprintf(
             "expected a string, but got: %T",
             {{ value_expr }}))
 } else {
     target{{ uid }}, ok{{ uid }} := {{ registry_expr }}[cast{{ uid }}]
     if !ok{{ uid }} {
-        errors.Add(
-            strings.Join(
-                []string{
-                    {{ ref_parts|join(', ') }}},
-                "/"),
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
             fmt.Sprintf(
                 {{ "reference to an instance of class %s not found: %%s"
                     |format(class_name|ucamel_case)|escaped_str }},
@@ -1454,10 +1710,7 @@ _PARSE_EMBED_TPL = mapry.go.jinja2_env.ENV.from_string(
     {% for registry_expr in selected_registry_exprs %}
     {{ registry_expr }},
     {% endfor %}
-    strings.Join(
-        []string{
-            {{ ref_parts|join(', ') }}},
-        "/"),
+    {{ ref_parts|join('.') }},
     &({{ target_expr }}),
     errors)
 ''')
@@ -1519,7 +1772,7 @@ func {{ composite.name|ucamel_case }}FromJSONable(
     {{ ref_cls.plural|camel_case }}Registry map[string]*{{
         ref_cls.name|ucamel_case }},
     {% endfor %}
-    ref string,
+    ref *Ref,
     target *{{ composite.name|ucamel_case }},
     errors *Errors) {
 
@@ -1541,7 +1794,7 @@ func {{ composite.name|ucamel_case }}FromJSONable(
     _, ok := value.(map[string]interface{})
     {% endif %}{# /if property_parsings #}
     if !ok {
-        errors.Add(
+        errors.AddRef(
             ref,
             fmt.Sprintf(
                 "expected a map[string]interface{}, but got: %T",
@@ -1614,6 +1867,7 @@ def _parse_composite(
 
 _PARSE_GRAPH_TPL = mapry.go.jinja2_env.ENV.from_string(
     '''\
+{% if not parallel %}
 // {{ graph.name|ucamel_case }}FromJSONable parses {{
     graph.name|ucamel_case }} from a JSONable value.
 //
@@ -1628,6 +1882,30 @@ func {{ graph.name|ucamel_case }}FromJSONable(
     ref string,
     target *{{ graph.name|ucamel_case }},
     errors *Errors) {
+{% else %}
+// {{ graph.name|ucamel_case }}FromJSONableParallel parses {{
+    graph.name|ucamel_case }} from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike {{ graph.name|ucamel_case
+    }}FromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// {{ graph.name|ucamel_case }}FromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func {{ graph.name|ucamel_case }}FromJSONableParallel(
+    value interface{},
+    ref string,
+    target *{{ graph.name|ucamel_case }},
+    errors *Errors,
+    workers int) {
+{% endif %}{# /if not parallel #}
 
     if target == nil {
         panic("unexpected nil target")
@@ -1640,6 +1918,12 @@ func {{ graph.name|ucamel_case }}FromJSONable(
     if !errors.Empty() {
         panic("unexpected non-empty errors")
     }
+    {% if parallel %}
+
+    if workers < 1 {
+        panic("unexpected non-positive workers")
+    }
+    {% endif %}
 
     cast, ok := value.(map[string]interface{})
     if !ok {
@@ -1650,14 +1934,18 @@ func {{ graph.name|ucamel_case }}FromJSONable(
                 value))
         return
     }
+    {% if graph.classes or property_parsings %}
+
+    graphRef := NewRef(ref)
+    {% endif %}
     {% for cls in graph.classes.values() %}
 
     ////
     // Pre-allocate {{ cls.plural|ucamel_case }}
     ////
 
-    {{ cls.plural|camel_case }}Ref := ref+{{ "/%s"|
-        format(cls.plural|json_plural)|escaped_str }};
+    {{ cls.plural|camel_case }}Ref := graphRef.Key(
+        {{ cls.plural|json_plural|escaped_str }})
     var {{ cls.plural|camel_case }}Ok bool
     var {{ cls.plural|camel_case }}Value interface{}
     var {{ cls.plural|camel_case }}Map map[string]interface{}
@@ -1668,7 +1956,7 @@ func {{ graph.name|ucamel_case }}FromJSONable(
         {{ cls.plural|camel_case }}Map, ok = {{
             cls.plural|camel_case }}Value.(map[string]interface{})
         if !ok {
-            errors.Add(
+            errors.AddRef(
                 {{ cls.plural|camel_case }}Ref,
                 fmt.Sprintf(
                     "expected a map[string]interface{}, but got: %T",
@@ -1684,7 +1972,7 @@ func {{ graph.name|ucamel_case }}FromJSONable(
                 #}{% endset %}
                 {% if cls.id_pattern is not none %}
                 if !pattern{{ pattern_uids[cls.id_pattern] }}.MatchString(id) {
-                    errors.Add(
+                    errors.AddRef(
                         {{ cls.plural|camel_case }}Ref,
                         fmt.Sprintf(
                             {{ "expected ID to match %s, but got: %%s"|
@@ -1709,6 +1997,91 @@ func {{ graph.name|ucamel_case }}FromJSONable(
         return
     }
     {% endif %}
+    {% if parallel %}
+
+    ////
+    // Parse the instances of all the registries in parallel
+    ////
+
+    // instanceJob identifies an instance to be parsed.
+    type instanceJob struct {
+        // indicates the registry in the order of the classes.
+        registry int
+
+        id string
+
+        value interface{}
+    }
+
+    jobs := make([]instanceJob, 0, {% for cls in graph.classes.values()
+        %}{% if not loop.first %}+{% endif %}len({{
+            cls.plural|camel_case }}Map){% endfor %})
+    {% for cls in graph.classes.values() %}
+    for id, value := range {{ cls.plural|camel_case }}Map {
+        jobs = append(jobs, instanceJob{registry: {{
+            loop.index0 }}, id: id, value: value})
+    }
+    {% endfor %}{# /for cls #}
+
+    // Sort the instances so that the errors are deterministic.
+    sort.Slice(jobs, func(i, j int) bool {
+        if jobs[i].registry != jobs[j].registry {
+            return jobs[i].registry < jobs[j].registry
+        }
+        return jobs[i].id < jobs[j].id
+    })
+
+    chunks := parallelChunkCount(len(jobs), workers)
+    chunkErrors := make([][]Error, chunks)
+    workerErrors := make([]*Errors, workers)
+
+    forEachInParallel(chunks, workers, func(worker int, chunk int) {
+        instanceErrors := workerErrors[worker]
+        if instanceErrors == nil {
+            instanceErrors = NewErrors(errors.cap)
+            workerErrors[worker] = instanceErrors
+        }
+
+        start, end := parallelChunk(len(jobs), chunks, chunk)
+        for _, job := range jobs[start:end] {
+            switch job.registry {
+            {% for cls in graph.classes.values() %}
+            case {{ loop.index0 }}:
+                {{ cls.name|ucamel_case }}FromJSONable(
+                    job.value,
+                    job.id,
+                    {% for ref_cls in references[cls] %}
+                    target.{{ ref_cls.plural|ucamel_case }},
+                    {% endfor %}
+                    {{ cls.plural|camel_case }}Ref.Key(job.id),
+                    target.{{ cls.plural|ucamel_case }}[job.id],
+                    instanceErrors)
+            {% endfor %}{# /for cls #}
+            }
+
+            chunkErrors[chunk] = append(
+                chunkErrors[chunk], instanceErrors.values...)
+            instanceErrors.values = instanceErrors.values[:0]
+
+            // The subsequent errors of the chunk would be ignored anyway.
+            if errors.cap != 0 &&
+                uint64(len(chunkErrors[chunk])) >= errors.cap {
+                break
+            }
+        }
+    })
+
+    // Merge the errors in the order of the instances.
+    for _, values := range chunkErrors {
+        for _, e := range values {
+            errors.Add(e.Ref, e.Message)
+        }
+    }
+
+    if errors.Full() {
+        return
+    }
+    {% else %}
     {% for cls in graph.classes.values() %}
 
     ////
@@ -1723,8 +2096,7 @@ func {{ graph.name|ucamel_case }}FromJSONable(
                 {% for ref_cls in references[cls] %}
                 target.{{ ref_cls.plural|ucamel_case }},
                 {% endfor %}
-                strings.Join([]string{
-                    {{ cls.plural|camel_case }}Ref, id}, "/"),
+                {{ cls.plural|camel_case }}Ref.Key(id),
                 target.{{ cls.plural|ucamel_case }}[id],
                 errors)
 
@@ -1738,6 +2110,7 @@ func {{ graph.name|ucamel_case }}FromJSONable(
         return
     }
     {% endfor %}{# /for cls in graph.classes.values() #}
+    {% endif %}{# /if parallel #}
     {% for property_parsing in property_parsings %}
 
     {{ property_parsing|indent }}
@@ -1755,13 +2128,14 @@ func {{ graph.name|ucamel_case }}FromJSONable(
 @ensure(lambda result: not result.endswith('\n'))
 def _parse_graph(
         graph: mapry.Graph, pattern_uids: Mapping[Pattern[str], int],
-        go: mapry.Go) -> str:
+        go: mapry.Go, parallel: bool) -> str:
     """
     Generate the code that parses an object graph.
 
     :param graph: definition of the object graph
     :param pattern_uids: uniquely identified patterns
     :param go: Go settings
+    :param parallel: if set, the instances are parsed on a pool of goroutines
     :return: generated code
     """
     # Map mapry class -> referenced mapry classes
@@ -1790,7 +2164,7 @@ def _parse_graph(
             _parse_property(
                 target_obj_expr="target",
                 value_map_expr="cast",
-                ref_obj_parts=["ref"],
+                ref_obj_parts=["graphRef"],
                 a_property=prop,
                 registry_exprs=registry_exprs,
                 pattern_uids=pattern_uids,
@@ -1800,7 +2174,8 @@ def _parse_graph(
     text = _PARSE_GRAPH_TPL.render(
         graph=graph, package=go.package, references=references,
         pattern_uids=pattern_uids,
-        property_parsings=property_parsings)
+        property_parsings=property_parsings,
+        parallel=parallel)
 
     return text.rstrip("\n")
 
@@ -1814,6 +2189,11 @@ def generate(graph: mapry.Graph, go: mapry.Go) -> str:
     :param go: Go settings
     :return: content of the source file
     """
+    if go.trusted_input:
+        # The constraints are assumed to be satisfied so that
+        # no checks are generated for them.
+        graph = mapry.without_constraints(graph=graph)
+
     blocks = [
         'package {}'.format(go.package),
         mapry.go.generate.WARNING,
@@ -1823,7 +2203,14 @@ def generate(graph: mapry.Graph, go: mapry.Go) -> str:
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
         blocks.append(_duration_from_string())
 
-    pattern_uids = _enumerate_patterns(graph=graph)
+    if mapry.needs_type(a_type=graph, query=mapry.TimeZone):
+        blocks.append(_location_cache())
+
+    fixed_width_parsers = _fixed_width_parsers(graph=graph)
+    if fixed_width_parsers:
+        blocks.append(fixed_width_parsers)
+
+    pattern_uids = enumerate_patterns(graph=graph)
     if pattern_uids:
         blocks.append(_compile_regexes(pattern_uids=pattern_uids))
 
@@ -1836,7 +2223,14 @@ def generate(graph: mapry.Graph, go: mapry.Go) -> str:
             _parse_composite(
                 composite=class_or_embed, pattern_uids=pattern_uids, go=go))
 
-    blocks.append(_parse_graph(graph=graph, pattern_uids=pattern_uids, go=go))
+    blocks.append(
+        _parse_graph(
+            graph=graph, pattern_uids=pattern_uids, go=go, parallel=False))
+
+    if graph.classes:
+        blocks.append(
+            _parse_graph(
+                graph=graph, pattern_uids=pattern_uids, go=go, parallel=True))
 
     blocks.append(mapry.go.generate.WARNING)
 
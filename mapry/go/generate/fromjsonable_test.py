@@ -1,7 +1,6 @@
 """Generate the code to test parsing of object graphs from JSONables."""
 
 import textwrap
-from typing import Set  # pylint: disable=unused-import
 
 from icontract import ensure
 
@@ -19,11 +18,14 @@ def _imports(graph: mapry.Graph) -> str:
     :param graph: mapry definition of the object graph
     :return: generated code
     """
-    import_set = set()  # type: Set[str]
+    import_set = {'encoding/json', 'testing'}
 
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
         import_set.add('fmt')
 
+    if graph.classes:
+        import_set.add('runtime')
+
     return mapry.go.generate.import_declarations(import_set)
 
 
@@ -42,7 +44,7 @@ def _example_duration_from_string() -> str:
                 panic("Unexpected nil error");
             }
             fmt.Println(err.Error())
-            // Output: failed to match the duration pattern on: some wrong text
+            // Output: failed to match the duration pattern
         }
 
         func ExampleDurationFromString_oneYear() {
@@ -129,10 +131,110 @@ def _example_duration_from_string() -> str:
         func ExampleDurationFromString_overflow() {
             _, err := durationFromString("P300Y")
             fmt.Println(err.Error())
-            // Output: overflows in nanoseconds: P300Y
+            // Output: overflow in nanoseconds
+        }
+
+        func BenchmarkDurationFromString(b *testing.B) {
+            texts := []string{
+                "P10Y",
+                "P1M",
+                "P1W",
+                "P1D",
+                "PT1H1M1S",
+                "PT1H1M1.1S",
+                "PT",
+                "P1.1Y1.1M1.1W1.1DT1.1H1.1M1.1S",
+                "PT0.000001S",
+                "PT1.000S",
+                "-P1D"}
+
+            b.ReportAllocs()
+            for i := 0; i < b.N; i++ {
+                for _, text := range texts {
+                    _, err := durationFromString(text)
+                    if err != nil {
+                        b.Fatal(err)
+                    }
+                }
+            }
         }''')
 
 
+_BENCHMARKS_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+func Benchmark{{ graph.name|ucamel_case }}FromJSONable(b *testing.B) {
+    var value interface{}
+    err := json.Unmarshal(synthetic{{ graph.name|ucamel_case }}JSON(b), &value)
+    if err != nil {
+        b.Fatal(err)
+    }
+
+    b.ReportAllocs()
+    b.ResetTimer()
+
+    for i := 0; i < b.N; i++ {
+        errors := NewErrors(0)
+        {{ graph.name|ucamel_case }}FromJSONable(
+            value, "#", &{{ graph.name|ucamel_case }}{}, errors)
+        if !errors.Empty() {
+            b.Fatal(errors.Values()[0].Message)
+        }
+    }
+}
+{% if graph.classes %}
+
+func Benchmark{{ graph.name|ucamel_case }}FromJSONableParallel(b *testing.B) {
+    var value interface{}
+    err := json.Unmarshal(synthetic{{ graph.name|ucamel_case }}JSON(b), &value)
+    if err != nil {
+        b.Fatal(err)
+    }
+
+    workers := runtime.GOMAXPROCS(0)
+
+    b.ReportAllocs()
+    b.ResetTimer()
+
+    for i := 0; i < b.N; i++ {
+        errors := NewErrors(0)
+        {{ graph.name|ucamel_case }}FromJSONableParallel(
+            value, "#", &{{ graph.name|ucamel_case }}{}, errors, workers)
+        if !errors.Empty() {
+            b.Fatal(errors.Values()[0].Message)
+        }
+    }
+}
+{% endif %}{# /if graph.classes #}
+
+func Benchmark{{ graph.name|ucamel_case }}FromJSONBytes(b *testing.B) {
+    data := synthetic{{ graph.name|ucamel_case }}JSON(b)
+
+    b.ReportAllocs()
+    b.SetBytes(int64(len(data)))
+    b.ResetTimer()
+
+    for i := 0; i < b.N; i++ {
+        errors := NewErrors(0)
+        {{ graph.name|ucamel_case }}FromJSONBytes(
+            data, "#", &{{ graph.name|ucamel_case }}{}, errors)
+        if !errors.Empty() {
+            b.Fatal(errors.Values()[0].Message)
+        }
+    }
+}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _benchmarks(graph: mapry.Graph) -> str:
+    """
+    Generate the code to benchmark parsing of a synthetic object graph.
+
+    :param graph: mapry definition of the object graph
+    :return: generated code
+    """
+    return _BENCHMARKS_TPL.render(graph=graph).rstrip('\n')
+
+
 @ensure(lambda result: result.endswith('\n'))
 def generate(graph: mapry.Graph, go: mapry.Go) -> str:
     """
@@ -143,24 +245,15 @@ def generate(graph: mapry.Graph, go: mapry.Go) -> str:
     :return: content of the source file
     """
     blocks = [
-        'package {}'.format(go.package),
-        mapry.go.generate.WARNING,
+        'package {}'.format(go.package), mapry.go.generate.WARNING,
+        _imports(graph=graph)
     ]
 
-    has_body = False
-
-    import_decl = _imports(graph=graph)
-    if len(import_decl) > 0:
-        blocks.append(import_decl)
-        has_body = True
-
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
         blocks.append(_example_duration_from_string())
-        has_body = True
 
-    # Include the footer only if there was something after the header
-    if has_body:
-        blocks.append(mapry.go.generate.WARNING)
+    blocks.append(_benchmarks(graph=graph))
+    blocks.append(mapry.go.generate.WARNING)
 
     return mapry.indention.reindent(
         text='\n\n'.join(blocks) + '\n', indention='\t')
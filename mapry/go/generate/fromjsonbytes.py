@@ -0,0 +1,2143 @@
+"""Generate the code that parses the object graph directly from JSON bytes."""
+
+import textwrap
+from typing import (  # pylint: disable=unused-import
+    List, Mapping, Optional, Pattern, Set, Union)
+
+from icontract import ensure
+
+import mapry
+import mapry.go.generate
+import mapry.go.generate.fromjsonable
+import mapry.go.jinja2_env
+import mapry.go.timeformat
+import mapry.indention
+import mapry.naming
+
+
+def _spells_out_time(graph: mapry.Graph, go: mapry.Go) -> bool:
+    """
+    Check whether the generated code declares values of types from ``time``.
+
+    Durations and time zones are otherwise parsed by the helper functions
+    from the JSONable parsing without spelling out their type.
+
+    :param graph: mapry definition of the object graph
+    :param go: Go settings
+    :return: True if the type of a parsed value is spelled out
+    """
+    for a_type, _ in mapry.iterate_over_types(graph=graph):
+        if isinstance(a_type, (mapry.Array, mapry.Map)) and 'time.' in \
+                mapry.go.generate.type_repr(a_type=a_type, go=go):
+            return True
+
+    composites = [graph]  # type: List[mapry.Composite]
+    composites.extend(graph.classes.values())
+    composites.extend(graph.embeds.values())
+
+    for composite in composites:
+        for prop in composite.properties.values():
+            if (prop.optional
+                    and not mapry.go.generate.is_pointer_type(prop.type)
+                    and 'time.' in mapry.go.generate.type_repr(a_type=prop.type,
+                                                               go=go)):
+                return True
+
+    return False
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _imports(graph: mapry.Graph, go: mapry.Go) -> str:
+    """
+    Generate the import declaration.
+
+    :param graph: mapry definition of the object graph
+    :param go: Go settings
+    :return: generated code
+    """
+    # The scanner always needs these packages.
+    import_set = {
+        'bytes', 'fmt', 'strconv', 'unicode', 'unicode/utf16', 'unicode/utf8'
+    }
+
+    if mapry.needs_type(a_type=graph, query=mapry.Integer):
+        import_set.add('math')
+
+    # yapf: disable
+    if (any(mapry.needs_type(a_type=graph, query=query)
+            for query in (mapry.Date, mapry.Time, mapry.Datetime)) or
+            _spells_out_time(graph=graph, go=go)):
+        # yapf: enable
+        import_set.add('time')
+
+    return mapry.go.generate.import_declarations(import_set)
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _json_scanner() -> str:
+    """
+    Generate the code that validates and scans JSON texts.
+
+    :return: generated code
+    """
+    return textwrap.dedent(
+        '''\
+    // jsonMaxDepth limits the nesting of JSON values as encoding/json does.
+    const jsonMaxDepth = 10000
+
+    // jsonSyntaxError describes why a JSON text is invalid.
+    type jsonSyntaxError struct {
+        // gives the position of the offending byte in the text.
+        offset int
+
+        // describes the error.
+        message string
+    }
+
+    func (e *jsonSyntaxError) Error() string {
+        return fmt.Sprintf("%s at offset %d", e.message, e.offset)
+    }
+
+    // jsonUnexpected reports the unexpected byte at data[i] in the context.
+    func jsonUnexpected(data []byte, i int, context string) error {
+        if i >= len(data) {
+            return &jsonSyntaxError{
+                offset:  i,
+                message: "unexpected end of JSON input"}
+        }
+
+        return &jsonSyntaxError{
+            offset:  i,
+            message: fmt.Sprintf("invalid character %q %s", data[i], context)}
+    }
+
+    // jsonSkipSpace gives the position of the first non-whitespace byte
+    // at or after i.
+    func jsonSkipSpace(data []byte, i int) int {
+        for i < len(data) {
+            switch data[i] {
+            case ' ', '\\t', '\\n', '\\r':
+                i++
+            default:
+                return i
+            }
+        }
+        return i
+    }
+
+    // jsonValidate checks that data is a single valid JSON value surrounded
+    // by optional whitespace.
+    //
+    // The numbers which do not fit into float64 are rejected as well since
+    // encoding/json can not decode them into an interface{}.
+    func jsonValidate(data []byte) error {
+        i, err := jsonValidateValue(data, jsonSkipSpace(data, 0), 0)
+        if err != nil {
+            return err
+        }
+
+        i = jsonSkipSpace(data, i)
+        if i != len(data) {
+            return jsonUnexpected(data, i, "after top-level value")
+        }
+
+        return nil
+    }
+
+    // jsonValidateValue validates the JSON value starting at data[i].
+    //
+    // end points right after the value.
+    func jsonValidateValue(
+        data []byte, i int, depth int) (end int, err error) {
+
+        if i >= len(data) {
+            return i, jsonUnexpected(data, i, "")
+        }
+
+        switch c := data[i]; {
+        case c == '{' || c == '[':
+            if depth == jsonMaxDepth {
+                return i, &jsonSyntaxError{
+                    offset:  i,
+                    message: "exceeded max depth"}
+            }
+
+            closing := byte('}')
+            if c == '[' {
+                closing = ']'
+            }
+
+            i = jsonSkipSpace(data, i+1)
+            if i < len(data) && data[i] == closing {
+                return i + 1, nil
+            }
+
+            for {
+                if c == '{' {
+                    if i >= len(data) || data[i] != '"' {
+                        return i, jsonUnexpected(
+                            data, i,
+                            "looking for beginning of object key string")
+                    }
+
+                    i, err = jsonValidateString(data, i)
+                    if err != nil {
+                        return i, err
+                    }
+
+                    i = jsonSkipSpace(data, i)
+                    if i >= len(data) || data[i] != ':' {
+                        return i, jsonUnexpected(data, i, "after object key")
+                    }
+                    i = jsonSkipSpace(data, i+1)
+                }
+
+                i, err = jsonValidateValue(data, i, depth+1)
+                if err != nil {
+                    return i, err
+                }
+
+                i = jsonSkipSpace(data, i)
+                switch {
+                case i < len(data) && data[i] == ',':
+                    i = jsonSkipSpace(data, i+1)
+                case i < len(data) && data[i] == closing:
+                    return i + 1, nil
+                case c == '{':
+                    return i, jsonUnexpected(
+                        data, i, "after object key:value pair")
+                default:
+                    return i, jsonUnexpected(data, i, "after array element")
+                }
+            }
+
+        case c == '"':
+            return jsonValidateString(data, i)
+
+        case c == 't':
+            return jsonValidateLiteral(data, i, "true")
+
+        case c == 'f':
+            return jsonValidateLiteral(data, i, "false")
+
+        case c == 'n':
+            return jsonValidateLiteral(data, i, "null")
+
+        case c == '-' || (c >= '0' && c <= '9'):
+            return jsonValidateNumber(data, i)
+
+        default:
+            return i, jsonUnexpected(data, i, "looking for beginning of value")
+        }
+    }
+
+    // jsonValidateLiteral validates the literal starting at data[i].
+    func jsonValidateLiteral(
+        data []byte, i int, literal string) (end int, err error) {
+
+        for k := 0; k < len(literal); k++ {
+            if i+k >= len(data) || data[i+k] != literal[k] {
+                return i + k, jsonUnexpected(
+                    data, i+k, fmt.Sprintf("in literal %s", literal))
+            }
+        }
+        return i + len(literal), nil
+    }
+
+    // jsonValidateString validates the string starting at data[i].
+    func jsonValidateString(data []byte, i int) (end int, err error) {
+        i++
+        for i < len(data) {
+            c := data[i]
+            switch {
+            case c == '"':
+                return i + 1, nil
+
+            case c == '\\\\':
+                i++
+                if i >= len(data) {
+                    return i, jsonUnexpected(data, i, "")
+                }
+
+                switch data[i] {
+                case '"', '\\\\', '/', 'b', 'f', 'n', 'r', 't':
+                    i++
+                case 'u':
+                    for k := 1; k <= 4; k++ {
+                        if i+k >= len(data) || !jsonIsHex(data[i+k]) {
+                            return i + k, jsonUnexpected(
+                                data, i+k,
+                                "in \\\\u hexadecimal character escape")
+                        }
+                    }
+                    i += 5
+                default:
+                    return i, jsonUnexpected(data, i, "in string escape code")
+                }
+
+            case c < 0x20:
+                return i, jsonUnexpected(data, i, "in string literal")
+
+            default:
+                i++
+            }
+        }
+        return i, jsonUnexpected(data, i, "")
+    }
+
+    // jsonIsHex checks whether c is a hexadecimal digit.
+    func jsonIsHex(c byte) bool {
+        return (c >= '0' && c <= '9') ||
+            (c >= 'a' && c <= 'f') ||
+            (c >= 'A' && c <= 'F')
+    }
+
+    // jsonSkipDigits gives the position of the first non-digit at or after i.
+    func jsonSkipDigits(data []byte, i int) int {
+        for i < len(data) && data[i] >= '0' && data[i] <= '9' {
+            i++
+        }
+        return i
+    }
+
+    // jsonValidateNumber validates the number starting at data[i].
+    func jsonValidateNumber(data []byte, i int) (end int, err error) {
+        start := i
+        if data[i] == '-' {
+            i++
+        }
+
+        switch {
+        case i < len(data) && data[i] == '0':
+            i++
+        case i < len(data) && data[i] >= '1' && data[i] <= '9':
+            i = jsonSkipDigits(data, i+1)
+        default:
+            return i, jsonUnexpected(data, i, "in numeric literal")
+        }
+
+        integerDigits := i - start
+
+        if i < len(data) && data[i] == '.' {
+            i++
+            if i >= len(data) || data[i] < '0' || data[i] > '9' {
+                return i, jsonUnexpected(
+                    data, i, "after decimal point in numeric literal")
+            }
+            i = jsonSkipDigits(data, i)
+        }
+
+        hasExponent := false
+        if i < len(data) && (data[i] == 'e' || data[i] == 'E') {
+            hasExponent = true
+
+            i++
+            if i < len(data) && (data[i] == '+' || data[i] == '-') {
+                i++
+            }
+            if i >= len(data) || data[i] < '0' || data[i] > '9' {
+                return i, jsonUnexpected(
+                    data, i, "in exponent of numeric literal")
+            }
+            i = jsonSkipDigits(data, i)
+        }
+
+        // Only the numbers with an exponent or with more than 308
+        // integer digits can overflow float64.
+        if hasExponent || integerDigits > 308 {
+            _, parseErr := strconv.ParseFloat(string(data[start:i]), 64)
+            if parseErr != nil {
+                return i, &jsonSyntaxError{
+                    offset: start,
+                    message: fmt.Sprintf(
+                        "number %s does not fit into float64",
+                        data[start:i])}
+            }
+        }
+
+        return i, nil
+    }
+
+    // jsonSkipString gives the position right after the valid JSON string
+    // starting at data[i].
+    func jsonSkipString(data []byte, i int) int {
+        i++
+        for {
+            i += bytes.IndexByte(data[i:], '"')
+
+            // The quote is escaped if it is preceded by an odd number
+            // of backslashes.
+            backslashes := 0
+            for k := i - 1; data[k] == '\\\\'; k-- {
+                backslashes++
+            }
+
+            i++
+            if backslashes%2 == 0 {
+                return i
+            }
+        }
+    }
+
+    // jsonSkipValue gives the position right after the valid JSON value
+    // starting at data[i].
+    func jsonSkipValue(data []byte, i int) int {
+        switch data[i] {
+        case '"':
+            return jsonSkipString(data, i)
+
+        case '{', '[':
+            depth := 0
+            for {
+                switch data[i] {
+                case '"':
+                    i = jsonSkipString(data, i)
+                    continue
+                case '{', '[':
+                    depth++
+                case '}', ']':
+                    depth--
+                    if depth == 0 {
+                        return i + 1
+                    }
+                }
+                i++
+            }
+
+        default:
+            // Numbers and literals end at a delimiter.
+            for i < len(data) {
+                switch data[i] {
+                case ',', '}', ']', ' ', '\\t', '\\n', '\\r':
+                    return i
+                }
+                i++
+            }
+            return i
+        }
+    }
+
+    // jsonTypeName gives the type of the valid JSON value as
+    // encoding/json would decode it into an interface{}.
+    //
+    // The names correspond to the ones given by the %T verb of fmt.
+    func jsonTypeName(value []byte) string {
+        switch value[0] {
+        case '{':
+            return "map[string]interface {}"
+        case '[':
+            return "[]interface {}"
+        case '"':
+            return "string"
+        case 't', 'f':
+            return "bool"
+        case 'n':
+            return "<nil>"
+        default:
+            return "float64"
+        }
+    }
+
+    // jsonBool parses the valid JSON value as a bool.
+    //
+    // ok is false if the value is not a bool.
+    func jsonBool(value []byte) (b bool, ok bool) {
+        switch value[0] {
+        case 't':
+            return true, true
+        case 'f':
+            return false, true
+        default:
+            return false, false
+        }
+    }
+
+    // jsonFloat parses the valid JSON value as a float64.
+    //
+    // ok is false if the value is not a number.
+    func jsonFloat(value []byte) (f float64, ok bool) {
+        if value[0] != '-' && (value[0] < '0' || value[0] > '9') {
+            return 0, false
+        }
+
+        // The range has been already checked by jsonValidate.
+        f, _ = strconv.ParseFloat(string(value), 64)
+        return f, true
+    }
+
+    // jsonGetU4 decodes \\uXXXX from the beginning of s.
+    //
+    // The result is negative if s does not start with such an escape.
+    func jsonGetU4(s []byte) rune {
+        if len(s) < 6 || s[0] != '\\\\' || s[1] != 'u' {
+            return -1
+        }
+
+        var r rune
+        for _, c := range s[2:6] {
+            switch {
+            case '0' <= c && c <= '9':
+                c = c - '0'
+            case 'a' <= c && c <= 'f':
+                c = c - 'a' + 10
+            case 'A' <= c && c <= 'F':
+                c = c - 'A' + 10
+            default:
+                return -1
+            }
+            r = r*16 + rune(c)
+        }
+        return r
+    }
+
+    // jsonUnquote decodes the content of a valid JSON string
+    // given without the quotes.
+    //
+    // The content is returned as-is if it needs no decoding. Invalid UTF-8
+    // and invalid surrogates are replaced with U+FFFD as encoding/json does.
+    func jsonUnquote(s []byte) []byte {
+        r := 0
+        for r < len(s) {
+            c := s[r]
+            if c == '\\\\' {
+                break
+            }
+            if c < utf8.RuneSelf {
+                r++
+                continue
+            }
+            rr, size := utf8.DecodeRune(s[r:])
+            if rr == utf8.RuneError && size == 1 {
+                break
+            }
+            r += size
+        }
+        if r == len(s) {
+            return s
+        }
+
+        b := make([]byte, len(s)+2*utf8.UTFMax)
+        w := copy(b, s[0:r])
+        for r < len(s) {
+            // Out of room? Can only happen if s is full of
+            // malformed UTF-8 and we're replacing each
+            // byte with RuneError.
+            if w >= len(b)-2*utf8.UTFMax {
+                nb := make([]byte, (len(b)+utf8.UTFMax)*2)
+                copy(nb, b[0:w])
+                b = nb
+            }
+
+            switch c := s[r]; {
+            case c == '\\\\':
+                r++
+                switch s[r] {
+                case '"', '\\\\', '/':
+                    b[w] = s[r]
+                    r++
+                    w++
+                case 'b':
+                    b[w] = '\\b'
+                    r++
+                    w++
+                case 'f':
+                    b[w] = '\\f'
+                    r++
+                    w++
+                case 'n':
+                    b[w] = '\\n'
+                    r++
+                    w++
+                case 'r':
+                    b[w] = '\\r'
+                    r++
+                    w++
+                case 't':
+                    b[w] = '\\t'
+                    r++
+                    w++
+                case 'u':
+                    r--
+                    rr := jsonGetU4(s[r:])
+                    r += 6
+                    if utf16.IsSurrogate(rr) {
+                        rr1 := jsonGetU4(s[r:])
+                        dec := utf16.DecodeRune(rr, rr1)
+                        if dec != unicode.ReplacementChar {
+                            // A valid pair; consume.
+                            r += 6
+                            w += utf8.EncodeRune(b[w:], dec)
+                            break
+                        }
+                        // Invalid surrogate; fall back to replacement rune.
+                        rr = unicode.ReplacementChar
+                    }
+                    w += utf8.EncodeRune(b[w:], rr)
+                }
+
+            case c < utf8.RuneSelf:
+                b[w] = c
+                r++
+                w++
+
+            default:
+                rr, size := utf8.DecodeRune(s[r:])
+                r += size
+                w += utf8.EncodeRune(b[w:], rr)
+            }
+        }
+        return b[0:w]
+    }
+
+    // jsonString parses the valid JSON value as a string.
+    //
+    // ok is false if the value is not a string.
+    func jsonString(value []byte) (s string, ok bool) {
+        if value[0] != '"' {
+            return "", false
+        }
+        return string(jsonUnquote(value[1 : len(value)-1])), true
+    }
+
+    // jsonKey decodes the key given as a valid JSON string.
+    //
+    // The key is not copied if it needs no decoding.
+    func jsonKey(rawKey []byte) []byte {
+        return jsonUnquote(rawKey[1 : len(rawKey)-1])
+    }
+
+    // jsonObjectReader iterates over the members of a valid JSON object.
+    type jsonObjectReader struct {
+        // is the JSON text of the object.
+        data []byte
+
+        // points right after the last read member.
+        pos int
+    }
+
+    // newJSONObjectReader creates a reader of the valid JSON object
+    // whose text starts with '{'.
+    func newJSONObjectReader(data []byte) jsonObjectReader {
+        return jsonObjectReader{data: data, pos: 1}
+    }
+
+    // next reads the next member of the object.
+    //
+    // rawKey is the key as a JSON string and value the JSON text of
+    // the member's value. ok is false if there are no more members.
+    func (r *jsonObjectReader) next() (rawKey []byte, value []byte, ok bool) {
+        i := jsonSkipSpace(r.data, r.pos)
+        if r.data[i] == ',' {
+            i = jsonSkipSpace(r.data, i+1)
+        }
+
+        if r.data[i] == '}' {
+            r.pos = i
+            return nil, nil, false
+        }
+
+        keyEnd := jsonSkipString(r.data, i)
+        rawKey = r.data[i:keyEnd]
+
+        // Skip the colon.
+        i = jsonSkipSpace(r.data, jsonSkipSpace(r.data, keyEnd)+1)
+
+        valueEnd := jsonSkipValue(r.data, i)
+        value = r.data[i:valueEnd]
+
+        r.pos = valueEnd
+        return rawKey, value, true
+    }
+
+    // jsonMember represents a member of a JSON object.
+    type jsonMember struct {
+        // is the decoded key.
+        key string
+
+        // is the JSON text of the value.
+        value []byte
+    }
+
+    // jsonMembers lists the members of the valid JSON object in order.
+    func jsonMembers(data []byte) []jsonMember {
+        members := []jsonMember{}
+
+        reader := newJSONObjectReader(data)
+        for {
+            rawKey, value, ok := reader.next()
+            if !ok {
+                break
+            }
+
+            members = append(
+                members,
+                jsonMember{key: string(jsonKey(rawKey)), value: value})
+        }
+
+        return members
+    }
+
+    // jsonLastMembers keeps only the last of the members with the same key
+    // as encoding/json does.
+    func jsonLastMembers(members []jsonMember) []jsonMember {
+        last := make(map[string]int, len(members))
+        for i, member := range members {
+            last[member.key] = i
+        }
+
+        result := make([]jsonMember, 0, len(last))
+        for i, member := range members {
+            if last[member.key] == i {
+                result = append(result, member)
+            }
+        }
+
+        return result
+    }
+
+    // jsonArrayReader iterates over the items of a valid JSON array.
+    type jsonArrayReader struct {
+        // is the JSON text of the array.
+        data []byte
+
+        // points right after the last read item.
+        pos int
+    }
+
+    // newJSONArrayReader creates a reader of the valid JSON array
+    // whose text starts with '['.
+    func newJSONArrayReader(data []byte) jsonArrayReader {
+        return jsonArrayReader{data: data, pos: 1}
+    }
+
+    // next reads the JSON text of the next item.
+    //
+    // ok is false if there are no more items.
+    func (r *jsonArrayReader) next() (value []byte, ok bool) {
+        i := jsonSkipSpace(r.data, r.pos)
+        if r.data[i] == ',' {
+            i = jsonSkipSpace(r.data, i+1)
+        }
+
+        if r.data[i] == ']' {
+            r.pos = i
+            return nil, false
+        }
+
+        end := jsonSkipValue(r.data, i)
+        r.pos = end
+        return r.data[i:end], true
+    }
+
+    // jsonArrayLen counts the items of the valid JSON value.
+    //
+    // ok is false if the value is not an array.
+    func jsonArrayLen(value []byte) (length int, ok bool) {
+        if value[0] != '[' {
+            return 0, false
+        }
+
+        reader := newJSONArrayReader(value)
+        for {
+            _, ok = reader.next()
+            if !ok {
+                break
+            }
+            length++
+        }
+        return length, true
+    }''')
+
+
+_PARSE_BOOLEAN_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+cast{{ uid }}, ok{{ uid }} := jsonBool({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a bool, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else {
+    {{ target_expr }} = cast{{ uid }}
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_boolean(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to parse a boolean.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param auto_id: generator of unique identifiers
+    :return: Go code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_BOOLEAN_TPL.render(
+        uid=uid,
+        value_expr=value_expr,
+        ref_parts=ref_parts,
+        target_expr=target_expr).rstrip("\n")
+
+
+_PARSE_INTEGER_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+fcast{{ uid }}, ok{{ uid }} := jsonFloat({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a float64, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else if fcast{{ uid }} != math.Trunc(fcast{{ uid }}) {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a whole number, but got: %f",
+            fcast{{ uid }}))
+// 9223372036854775808.0 == 2^63 is the first float > MaxInt64.
+// -9223372036854775808.0 == -(2^63) is the last float >= MinInt64.
+} else if fcast{{ uid }} >= 9223372036854775808.0 ||
+    fcast{{ uid }} < -9223372036854775808.0 {
+
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected the value to fit into int64, but got an overflow: %f",
+            fcast{{ uid }}))
+} else {
+    {% if a_type.minimum is none and a_type.maximum is none %}
+    {{ target_expr }} = int64(fcast{{ uid }})
+    {% else %}
+    cast{{ uid }} := int64(fcast{{ uid }})
+
+    {% set got_cond_before = False %}
+    {% if a_type.minimum is not none %}
+    {% set op = ">" if a_type.exclusive_minimum else ">="  %}
+    if !(cast{{ uid }} {{ op }} {{ a_type.minimum }}) {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                {{ "expected %s %d, but got: %%d"|
+                    format(op, a_type.minimum)|escaped_str }},
+                cast{{ uid }}))
+    {% set got_cond_before = True %}
+    {% endif %}{# /if a_type.minimum is not none #}
+    {% if a_type.maximum is not none %}
+    {% set op = "<" if a_type.exclusive_maximum else "<=" %}
+    {{ '} else if'
+        if got_cond_before else 'if'
+    }} !(cast{{ uid }} {{ op }} {{ a_type.maximum }}) {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                {{ "expected %s %d, but got: %%d"|
+                    format(op, a_type.maximum)|escaped_str }},
+                cast{{ uid }}))
+    {% set got_cond_before = True %}
+    {% endif %}{# /if a_type.maximum is not none #}
+    } else {
+        {{ target_expr }} = cast{{ uid }}
+    }
+    {% endif %}{# /if a_type.minimum is none and a_type.maximum is none #}
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_integer(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: mapry.Integer, auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to parse an integer.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_INTEGER_TPL.render(
+        uid=uid,
+        value_expr=value_expr,
+        ref_parts=ref_parts,
+        target_expr=target_expr,
+        a_type=a_type).rstrip("\n")
+
+
+_PARSE_FLOAT_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+cast{{ uid }}, ok{{ uid }} := jsonFloat({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a float64, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else {
+    {% if a_type.minimum is none and a_type.maximum is none %}
+    {{ target_expr }} = cast{{ uid }}
+    {% else %}
+    {% set got_cond_before = False %}
+    {% if a_type.minimum is not none %}
+    {% set op = ">" if a_type.exclusive_minimum else ">="  %}
+    if !(cast{{ uid }} {{ op }} {{ a_type.minimum }}) {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                {{ "expected %s %f, but got: %%f"|
+                    format(op, a_type.minimum)|escaped_str }},
+                cast{{ uid }}))
+    {% set got_cond_before = True %}
+    {% endif %}{# /if a_type.minimum is not none #}
+    {% if a_type.maximum is not none %}
+    {% set op = "<" if a_type.exclusive_maximum else "<=" %}
+    {{ '} else if'
+        if got_cond_before else 'if'
+    }} !(cast{{ uid }} {{ op }} {{ a_type.maximum }}) {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                {{ "expected %s %f, but got: %%f"|
+                    format(op, a_type.maximum)|escaped_str }},
+                cast{{ uid }}))
+    {% set got_cond_before = True %}
+    {% endif %}{# /if a_type.maximum is not none #}
+    } else {
+        {{ target_expr }} = cast{{ uid }}
+    }
+    {% endif %}{# /if a_type.minimum is none and a_type.maximum is none #}
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_float(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: mapry.Float, auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to parse a floating-point number.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_FLOAT_TPL.render(
+        uid=uid,
+        value_expr=value_expr,
+        ref_parts=ref_parts,
+        target_expr=target_expr,
+        a_type=a_type).rstrip("\n")
+
+
+_PARSE_STRING_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+cast{{ uid }}, ok{{ uid }} := jsonString({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a string, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else {
+    {% if a_type.pattern is none %}
+    {{ target_expr }} = cast{{ uid }}
+    {% else %}
+    if !pattern{{ pattern_uids[a_type.pattern] }}.MatchString(cast{{ uid }}) {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                {{ "expected to match %s, but got: %%s"|
+                    format(a_type.pattern.pattern)|escaped_str }},
+                cast{{ uid }}))
+    } else {
+        {{ target_expr }} = cast{{ uid }}
+    }
+    {% endif %}{# /if a_type.pattern is none #}
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_string(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: Union[mapry.String, mapry.Path],
+        pattern_uids: Mapping[Pattern[str], int],
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to parse a string.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param pattern_uids: uniquely identified patterns
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_STRING_TPL.render(
+        uid=uid,
+        value_expr=value_expr,
+        ref_parts=ref_parts,
+        target_expr=target_expr,
+        a_type=a_type,
+        pattern_uids=pattern_uids).rstrip("\n")
+
+
+_PARSE_DATE_TIME_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+cast{{ uid }}, ok{{ uid }} := jsonString({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a string, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else {
+{% if fixed_width_function %}
+    target{{ uid }}, fixed{{ uid }} := {{ fixed_width_function }}(cast{{ uid }})
+    var err{{ uid }} error
+    if !fixed{{ uid }} {
+        target{{ uid }}, err{{ uid }} = time.Parse(
+            {{ converted_format|escaped_str }},
+            cast{{ uid }})
+    }
+{% else %}
+    target{{ uid }}, err{{ uid }} := time.Parse(
+        {{ converted_format|escaped_str }},
+        cast{{ uid }})
+{% endif %}{# /if fixed_width_function #}
+    if err{{ uid }} != nil {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                {{ "expected layout %s, got: %%s"|
+                    format(converted_format)|escaped_str }},
+                cast{{ uid }}))
+    } else {
+        {{ target_expr }} = target{{ uid }}
+    }
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_date_time(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: Union[mapry.Date, mapry.Datetime, mapry.Time],
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to parse a time.Time.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    converted_format = mapry.go.timeformat.convert(a_format=a_type.format)
+
+    return _PARSE_DATE_TIME_TPL.render(
+        value_expr=value_expr,
+        uid=uid,
+        ref_parts=ref_parts,
+        converted_format=converted_format,
+        target_expr=target_expr,
+        fixed_width_function=mapry.go.generate.fromjsonable.
+        fixed_width_function(a_type=a_type)).rstrip("\n")
+
+
+_PARSE_TIME_ZONE_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+cast{{ uid }}, ok{{ uid }} := jsonString({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a string, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else {
+    target{{ uid }}, err{{ uid }} := loadLocation(cast{{ uid }})
+    if err{{ uid }} != nil {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                "failed to load location from %#v: %s",
+                cast{{ uid }},
+                err{{ uid }}.Error()))
+    } else {
+        {{ target_expr }} = target{{ uid }}
+    }
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_time_zone(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to parse a time.Loc.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_TIME_ZONE_TPL.render(
+        value_expr=value_expr,
+        uid=uid,
+        ref_parts=ref_parts,
+        target_expr=target_expr).rstrip("\n")
+
+
+_PARSE_DURATION_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+cast{{ uid }}, ok{{ uid }} := jsonString({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a string, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else {
+    target{{ uid }}, err{{ uid }} := durationFromString(cast{{uid}})
+    if err{{ uid }} != nil {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                "failed to parse duration from %#v: %s",
+                cast{{ uid }},
+                err{{ uid }}.Error()))
+    } else {
+        {{ target_expr }} = target{{ uid }}
+    }
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_duration(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to parse a time.Duration.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_DURATION_TPL.render(
+        value_expr=value_expr,
+        uid=uid,
+        ref_parts=ref_parts,
+        target_expr=target_expr).rstrip("\n")
+
+
+_PARSE_ARRAY_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+len{{ uid }}, ok{{ uid }} := jsonArrayLen({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a []interface{}, but got: %s",
+            jsonTypeName({{ value_expr }})))
+{% if minimum_size is not none %}
+} else if len{{ uid }} < {{ minimum_size }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            {{ "expected an array of minimum size %d, but got: %%d"|
+                format(minimum_size)|escaped_str }},
+            len{{ uid }}))
+{% endif %}{# /if minimum_size is not none #}
+{% if maximum_size is not none %}
+} else if len{{ uid }} > {{ maximum_size }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            {{ "expected an array of maximum size %d, but got: %%d"|
+                format(maximum_size)|escaped_str }},
+            len{{ uid }}))
+{% endif %}{# /if maximum_size is not none #}
+} else {
+    target{{ uid }} := make(
+        {{ target_go_type }},
+        len{{ uid }})
+    reader{{ uid }} := newJSONArrayReader({{ value_expr }})
+    for i{{ uid }} := range target{{ uid }} {
+        item{{ uid }}, _ := reader{{ uid }}.next()
+
+        {{ item_parsing|indent|indent }}
+
+        if errors.Full() {
+            break;
+        }
+    }
+
+    {{ target_expr }} = target{{ uid }}
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_array(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: mapry.Array, registry_exprs: Mapping[mapry.Class, str],
+        pattern_uids: Mapping[Pattern[str], int],
+        auto_id: mapry.go.generate.AutoID, go: mapry.Go) -> str:
+    """
+    Generate the code to parse an array.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param registry_exprs:
+        map class to Go expression of the registry of the class instances
+    :param pattern_uids: uniquely identified patterns
+    :param auto_id: generator of unique identifiers
+    :param go: Go settings
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    item_parsing = _parse_value(
+        value_expr="item{uid}".format(uid=uid),
+        target_expr="target{uid}[i{uid}]".format(uid=uid),
+        ref_parts=ref_parts + ["Index(i{uid})".format(uid=uid)],
+        a_type=a_type.values,
+        registry_exprs=registry_exprs,
+        pattern_uids=pattern_uids,
+        auto_id=auto_id,
+        go=go)
+
+    return _PARSE_ARRAY_TPL.render(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        ref_parts=ref_parts,
+        uid=uid,
+        minimum_size=a_type.minimum_size,
+        maximum_size=a_type.maximum_size,
+        target_go_type=mapry.go.generate.type_repr(a_type=a_type, go=go),
+        item_parsing=item_parsing).rstrip('\n')
+
+
+_PARSE_MAP_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+if {{ value_expr }}[0] != '{' {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a map[string]interface{}, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else {
+    target{{ uid }} := make({{ target_go_type }})
+    reader{{ uid }} := newJSONObjectReader({{ value_expr }})
+    for {
+        rawKey{{ uid }}, member{{ uid }}, ok{{ uid }} := reader{{ uid }}.next()
+        if !ok{{ uid }} {
+            break
+        }
+        k{{ uid }} := string(jsonKey(rawKey{{ uid }}))
+
+        {{ item_parsing|indent|indent }}
+
+        if errors.Full() {
+            break;
+        }
+    }
+
+    {{ target_expr }} = target{{ uid }}
+}
+''')
+
+_PARSE_INTERMEDIATE_ITEM_OF_MAP_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+var item{{ uid }} {{ item_go_type }}
+{{ intermediate_item_parsing }}
+target{{ uid }}[k{{ uid }}] = item{{ uid }}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_map(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: mapry.Map, registry_exprs: Mapping[mapry.Class, str],
+        pattern_uids: Mapping[Pattern[str], int],
+        auto_id: mapry.go.generate.AutoID, go: mapry.Go) -> str:
+    """
+    Generate the code to parse a map.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param registry_exprs:
+        map class to Go expression of the registry of the class instances
+    :param pattern_uids: uniquely identified patterns
+    :param auto_id: generator of unique identifiers
+    :param go: Go settings
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    if isinstance(a_type.values, mapry.Embed):
+        # Go does not allow taking addresses of map values.
+        # Hence, we need to first parse the item and then assign it.
+        intermediate_item_parsing = _parse_value(
+            value_expr="member{uid}".format(uid=uid),
+            target_expr="item{uid}".format(uid=uid),
+            ref_parts=ref_parts + ["Key(k{uid})".format(uid=uid)],
+            a_type=a_type.values,
+            registry_exprs=registry_exprs,
+            pattern_uids=pattern_uids,
+            auto_id=auto_id,
+            go=go)
+
+        item_parsing = _PARSE_INTERMEDIATE_ITEM_OF_MAP_TPL.render(
+            uid=uid,
+            item_go_type=mapry.go.generate.type_repr(
+                a_type=a_type.values, go=go),
+            intermediate_item_parsing=intermediate_item_parsing).rstrip('\n')
+
+    else:
+        item_parsing = _parse_value(
+            value_expr="member{uid}".format(uid=uid),
+            target_expr="target{uid}[k{uid}]".format(uid=uid),
+            ref_parts=ref_parts + ["Key(k{uid})".format(uid=uid)],
+            a_type=a_type.values,
+            registry_exprs=registry_exprs,
+            pattern_uids=pattern_uids,
+            auto_id=auto_id,
+            go=go)
+
+    return _PARSE_MAP_TPL.render(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        ref_parts=ref_parts,
+        uid=uid,
+        target_go_type=mapry.go.generate.type_repr(a_type=a_type, go=go),
+        item_parsing=item_parsing).rstrip('\n')
+
+
+_PARSE_CLASS_REF_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+cast{{ uid }}, ok{{ uid }} := jsonString({{ value_expr }})
+if !ok{{ uid }} {
+    errors.AddRef(
+        {{ ref_parts|join('.') }},
+        fmt.Sprintf(
+            "expected a string, but got: %s",
+            jsonTypeName({{ value_expr }})))
+} else {
+    target{{ uid }}, ok{{ uid }} := {{ registry_expr }}[cast{{ uid }}]
+    if !ok{{ uid }} {
+        errors.AddRef(
+            {{ ref_parts|join('.') }},
+            fmt.Sprintf(
+                {{ "reference to an instance of class %s not found: %%s"
+                    |format(class_name|ucamel_case)|escaped_str }},
+                cast{{ uid }}))
+    } else {
+        {{ target_expr }} = target{{uid}}
+    }
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_instance_reference(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: mapry.Class, registry_expr: str,
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to parse a reference to an instance.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param registry_expr: Go expression of the registry of the class instances
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_CLASS_REF_TPL.render(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        ref_parts=ref_parts,
+        uid=uid,
+        class_name=a_type.name,
+        registry_expr=registry_expr).rstrip("\n")
+
+
+_PARSE_EMBED_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+{{ embed_name|camel_case }}FromJSONBytes(
+    {{ value_expr }},
+    {% for registry_expr in selected_registry_exprs %}
+    {{ registry_expr }},
+    {% endfor %}
+    {{ ref_parts|join('.') }},
+    &({{ target_expr }}),
+    errors)
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_embed(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: mapry.Embed, registry_exprs: Mapping[mapry.Class, str]) -> str:
+    """
+    Generate the code to parse an embeddable structure.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param registry_exprs:
+        map class to Go expression of the registry of the class instances
+    :return: generated code
+    """
+    references = mapry.references(a_type=a_type)
+
+    return _PARSE_EMBED_TPL.render(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        ref_parts=ref_parts,
+        embed_name=a_type.name,
+        selected_registry_exprs=[
+            registry_exprs[reference] for reference in references
+        ]).rstrip("\n")
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_value(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: mapry.Type, registry_exprs: Mapping[mapry.Class, str],
+        pattern_uids: Mapping[Pattern[str], int],
+        auto_id: mapry.go.generate.AutoID, go: mapry.Go) -> str:
+    """
+    Generate the code to parse a value.
+
+    The code parses the JSON text ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Go expression of the JSON text
+    :param target_expr: Go expression of where to store the parsed value
+    :param ref_parts: Go expression of reference path segments to the value
+    :param a_type: mapry type of the value
+    :param registry_exprs:
+        map class to Go expression of the registry of the class instances
+    :param pattern_uids: uniquely identified patterns
+    :param auto_id: generator of unique identifiers
+    :param go: Go settings
+    :return: generated code
+    """
+    # pylint: disable=too-many-branches
+    if isinstance(a_type, mapry.Boolean):
+        body = _parse_boolean(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            auto_id=auto_id)
+
+    elif isinstance(a_type, mapry.Integer):
+        body = _parse_integer(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            auto_id=auto_id)
+
+    elif isinstance(a_type, mapry.Float):
+        body = _parse_float(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            auto_id=auto_id)
+
+    elif isinstance(a_type, (mapry.String, mapry.Path)):
+        body = _parse_string(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            pattern_uids=pattern_uids,
+            auto_id=auto_id)
+
+    elif isinstance(a_type, (mapry.Date, mapry.Datetime, mapry.Time)):
+        body = _parse_date_time(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            auto_id=auto_id)
+
+    elif isinstance(a_type, mapry.TimeZone):
+        body = _parse_time_zone(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            auto_id=auto_id)
+
+    elif isinstance(a_type, mapry.Duration):
+        body = _parse_duration(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            auto_id=auto_id)
+
+    elif isinstance(a_type, mapry.Array):
+        body = _parse_array(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            registry_exprs=registry_exprs,
+            pattern_uids=pattern_uids,
+            auto_id=auto_id,
+            go=go)
+
+    elif isinstance(a_type, mapry.Map):
+        body = _parse_map(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            registry_exprs=registry_exprs,
+            pattern_uids=pattern_uids,
+            auto_id=auto_id,
+            go=go)
+
+    elif isinstance(a_type, mapry.Class):
+        body = _parse_instance_reference(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            registry_expr=registry_exprs[a_type],
+            auto_id=auto_id)
+
+    elif isinstance(a_type, mapry.Embed):
+        body = _parse_embed(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            registry_exprs=registry_exprs)
+
+    else:
+        raise NotImplementedError(
+            "Unhandled parsing of type: {}".format(a_type))
+
+    return body
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _member_variable(a_property: mapry.Property) -> str:
+    """
+    Generate the name of the variable holding the JSON text of the property.
+
+    :param a_property: mapry definition of the property
+    :return: Go variable name
+    """
+    return '{}Member'.format(mapry.naming.camel_case(a_property.name))
+
+
+_PARSE_PROPERTY_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+////
+// Parse {{ a_property.name|ucamel_case }}
+////
+
+{% if not a_property.optional %}
+if {{ member_expr }} == nil {
+    errors.AddRef(
+        {% if ref_obj_parts|length > 1 %}
+        {{ ref_obj_parts|join('.') }},
+        {% elif ref_obj_parts|length == 1 %}
+        {{ ref_obj_parts[0] }},
+        {% else %}
+        {{ _raise('Expected ref_obj_parts to be non-empty') }}
+        {% endif %}{# /if ref_obj_parts|length > 1 #}
+        {{ "property is missing: %s"|format(a_property.json)|escaped_str }})
+} else {
+    {{ parsing|indent }}
+}
+{% else %}
+if {{ member_expr }} != nil {
+    {% if not is_pointer_type %}
+    var target{{ uid }} {{ property_target_type }}
+    {{ parsing|indent }}
+
+    {{ property_target_expr }} = &target{{ uid }}
+    {% else %}
+    {{ parsing|indent }}
+    {% endif %}{# /if not is_pointer_type #}
+}
+{% endif %}{# /if not a_property.optional #}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_property(
+        target_obj_expr: str, ref_obj_parts: List[str],
+        a_property: mapry.Property, registry_exprs: Mapping[mapry.Class, str],
+        pattern_uids: Mapping[Pattern[str], int],
+        auto_id: mapry.go.generate.AutoID, go: mapry.Go) -> str:
+    """
+    Generate the code to parse a composite property from its JSON text.
+
+    The JSON text is expected in the variable given by
+    :py:func:`_member_variable` and nil if the property is missing.
+
+    :param target_obj_expr: Go expression of the object to store the properties
+    :param ref_obj_parts: Go expression of reference path segments to the object
+    :param a_property: mapry definition of the property
+    :param registry_exprs:
+        map class to Go expression of the registry of the class instances
+    :param pattern_uids: uniquely identified patterns
+    :param auto_id: generator of unique identifiers
+    :param go: Go settings
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    member_expr = _member_variable(a_property=a_property)
+
+    field = mapry.naming.ucamel_case(identifier=a_property.name)
+    property_target_expr = '{}.{}'.format(target_obj_expr, field)
+    property_ref_parts = ref_obj_parts + [
+        'Key({})'.format(mapry.go.generate.escaped_str(a_property.json))
+    ]
+
+    is_pointer_type = None  # type: Optional[bool]
+
+    if not a_property.optional:
+        target_expr = property_target_expr
+    else:
+        is_pointer_type = mapry.go.generate.is_pointer_type(
+            a_type=a_property.type)
+
+        # The target field of a non-pointer type is a pointer so the resulting
+        # field needs to reference the intermediate parsed value.
+        target_expr = (
+            property_target_expr if is_pointer_type else "target{uid}".format(
+                uid=uid))
+
+    parsing = _parse_value(
+        value_expr=member_expr,
+        target_expr=target_expr,
+        ref_parts=property_ref_parts,
+        a_type=a_property.type,
+        registry_exprs=registry_exprs,
+        pattern_uids=pattern_uids,
+        auto_id=auto_id,
+        go=go)
+
+    text = _PARSE_PROPERTY_TPL.render(
+        a_property=a_property,
+        member_expr=member_expr,
+        ref_obj_parts=ref_obj_parts,
+        uid=uid,
+        is_pointer_type=is_pointer_type,
+        property_target_type=mapry.go.generate.type_repr(
+            a_type=a_property.type, go=go),
+        parsing=parsing,
+        property_target_expr=property_target_expr)
+
+    return text.rstrip("\n")
+
+
+_COLLECT_MEMBERS_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{% for variable in variables %}
+var {{ variable }} []byte
+{% endfor %}
+
+reader := newJSONObjectReader(value)
+for {
+    rawKey, member, ok := reader.next()
+    if !ok {
+        break
+    }
+
+    switch string(jsonKey(rawKey)) {
+    {% for key, variable in keys_variables %}
+    case {{ key|escaped_str }}:
+        {{ variable }} = member
+    {% endfor %}
+    }
+}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _collect_members(keys_variables: List[List[str]]) -> str:
+    """
+    Generate the code that collects the JSON texts of the known members.
+
+    The members are collected in a single pass over the object in ``value``.
+    If a key is repeated, the last member wins as in encoding/json.
+
+    :param keys_variables: pairs of JSON keys and Go variables
+    :return: generated code
+    """
+    return _COLLECT_MEMBERS_TPL.render(
+        variables=[variable for _, variable in keys_variables],
+        keys_variables=keys_variables)
+
+
+_PARSE_COMPOSITE_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+// {{ composite.name|camel_case }}FromJSONBytes parses {{
+        composite.name|ucamel_case }} from a valid JSON text.
+//
+// The properties are parsed in the order of the schema so that the errors
+// are the same as the ones of {{ composite.name|ucamel_case }}FromJSONable.
+// If there are any errors, the state of the target is undefined.
+//
+// {{ composite.name|camel_case }}FromJSONBytes requires:
+//  * value is a valid JSON text
+//  * target != nil
+//  * errors != nil
+func {{ composite.name|camel_case }}FromJSONBytes(
+    value []byte,
+    {% if is_class %}
+    id string,
+    {% endif %}
+    {% for ref_cls in references %}
+    {{ ref_cls.plural|camel_case }}Registry map[string]*{{
+        ref_cls.name|ucamel_case }},
+    {% endfor %}
+    ref *Ref,
+    target *{{ composite.name|ucamel_case }},
+    errors *Errors) {
+
+    if target == nil {
+        panic("unexpected nil target")
+    }
+
+    if errors == nil {
+        panic("unexpected nil errors")
+    }
+
+    if value[0] != '{' {
+        errors.AddRef(
+            ref,
+            fmt.Sprintf(
+                "expected a map[string]interface{}, but got: %s",
+                jsonTypeName(value)))
+        return
+    }
+    {% if is_class %}
+
+    target.ID = id
+    {% endif %}
+    {% if property_parsings %}
+
+    {{ collect_members|indent }}
+    {% endif %}
+    {% for property_parsing in property_parsings %}
+
+    {{ property_parsing|indent }}
+
+    if errors.Full() {
+        return
+    }
+    {% endfor %}{# /for property_parsing #}
+
+    return
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_composite(
+        composite: Union[mapry.Class, mapry.Embed],
+        pattern_uids: Mapping[Pattern[str], int], go: mapry.Go) -> str:
+    """
+    Generate the code of the function that parses a composite.
+
+    :param composite: mapry definition of the composite
+    :param pattern_uids: uniquely identified patterns
+    :param go: Go settings
+    :return: generated code
+    """
+    references = mapry.references(a_type=composite)
+
+    # yapf: disable
+    registry_exprs = {
+        ref_cls: '{}Registry'.format(mapry.naming.camel_case(ref_cls.plural))
+        for ref_cls in references
+    }
+    # yapf: enable
+
+    auto_id = mapry.go.generate.AutoID()
+
+    # yapf: disable
+    property_parsings = [
+        _parse_property(
+            target_obj_expr="target",
+            ref_obj_parts=["ref"],
+            a_property=prop,
+            registry_exprs=registry_exprs,
+            pattern_uids=pattern_uids,
+            auto_id=auto_id,
+            go=go)
+        for prop in composite.properties.values()
+    ]
+
+    collect_members = _collect_members(
+        keys_variables=[
+            [prop.json, _member_variable(a_property=prop)]
+            for prop in composite.properties.values()
+        ])
+    # yapf: enable
+
+    return _PARSE_COMPOSITE_TPL.render(
+        composite=composite,
+        is_class=isinstance(composite, mapry.Class),
+        references=references,
+        collect_members=collect_members,
+        property_parsings=property_parsings).rstrip("\n")
+
+
+_PARSE_GRAPH_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+// {{ graph.name|ucamel_case }}FromJSONBytes parses {{
+    graph.name|ucamel_case }} from a JSON text.
+//
+// The text is scanned directly into target without decoding it first into
+// an interface{} so that no intermediate maps and boxed values need to be
+// allocated. The text is validated in a separate pass first. The members of
+// objects and the items of arrays are delimited by skipping over their values
+// so that a nested value is scanned once more for each level of nesting above
+// it.
+//
+// The errors are the same as the ones of
+// {{ graph.name|ucamel_case }}FromJSONable applied on the text decoded
+// with encoding/json, except that the instances of a class are parsed in
+// the order of the text. An invalid JSON text is reported as a single error.
+//
+// If there are any errors, the state of target is undefined.
+//
+// {{ graph.name|ucamel_case }}FromJSONBytes requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+func {{ graph.name|ucamel_case }}FromJSONBytes(
+    data []byte,
+    ref string,
+    target *{{ graph.name|ucamel_case }},
+    errors *Errors) {
+
+    if target == nil {
+        panic("unexpected nil target")
+    }
+
+    if errors == nil {
+        panic("unexpected nil errors")
+    }
+
+    if !errors.Empty() {
+        panic("unexpected non-empty errors")
+    }
+
+    err := jsonValidate(data)
+    if err != nil {
+        errors.Add(
+            ref,
+            fmt.Sprintf(
+                "expected a valid JSON text, but got: %s",
+                err.Error()))
+        return
+    }
+
+    start := jsonSkipSpace(data, 0)
+    value := data[start:jsonSkipValue(data, start)]
+
+    if value[0] != '{' {
+        errors.Add(
+            ref,
+            fmt.Sprintf(
+                "expected a map[string]interface{}, but got: %s",
+                jsonTypeName(value)))
+        return
+    }
+    {% if graph.classes or property_parsings %}
+
+    graphRef := NewRef(ref)
+
+    {{ collect_members|indent }}
+    {% endif %}
+    {% for cls in graph.classes.values() %}
+
+    ////
+    // Pre-allocate {{ cls.plural|ucamel_case }}
+    ////
+
+    {{ cls.plural|camel_case }}Ref := graphRef.Key(
+        {{ cls.plural|json_plural|escaped_str }})
+    var {{ cls.plural|camel_case }}Members []jsonMember
+
+    if {{ cls.plural|camel_case }}Value != nil {
+        if {{ cls.plural|camel_case }}Value[0] != '{' {
+            errors.AddRef(
+                {{ cls.plural|camel_case }}Ref,
+                fmt.Sprintf(
+                    "expected a map[string]interface{}, but got: %s",
+                    jsonTypeName({{ cls.plural|camel_case }}Value)))
+        } else {
+            {{ cls.plural|camel_case }}Members = jsonMembers(
+                {{ cls.plural|camel_case }}Value)
+
+            target.{{ cls.plural|ucamel_case }} = make(
+                map[string]*{{ cls.name|ucamel_case }},
+                len({{ cls.plural|camel_case }}Members))
+
+            for _, member := range {{ cls.plural|camel_case }}Members {
+                target.{{ cls.plural|ucamel_case }}[member.key] = &{{
+                    cls.name|ucamel_case }}{}
+            }
+
+            // Keep only the last of the repeated IDs as encoding/json does.
+            if len(target.{{ cls.plural|ucamel_case }}) < len({{
+                cls.plural|camel_case }}Members) {
+                {{ cls.plural|camel_case }}Members = jsonLastMembers(
+                    {{ cls.plural|camel_case }}Members)
+            }
+            {% if cls.id_pattern is not none %}
+
+            for _, member := range {{ cls.plural|camel_case }}Members {
+                if !pattern{{ pattern_uids[cls.id_pattern] }}.MatchString(
+                    member.key) {
+                    errors.AddRef(
+                        {{ cls.plural|camel_case }}Ref,
+                        fmt.Sprintf(
+                            {{ "expected ID to match %s, but got: %%s"|
+                                format(cls.id_pattern.pattern)|escaped_str }},
+                            member.key))
+                }
+            }
+            {% endif %}{# /if cls.id_pattern is not none #}
+        }
+    }
+    {% endfor %}{# /for cls in graph.classes.values() #}
+    {% if graph.classes %}
+
+    // Pre-allocating class instances is critical.
+    // If the pre-allocation failed, we can not continue to parse the instances.
+    if !errors.Empty() {
+        return
+    }
+    {% endif %}
+    {% for cls in graph.classes.values() %}
+
+    ////
+    // Parse {{ cls.plural|ucamel_case }}
+    ////
+
+    for _, member := range {{ cls.plural|camel_case }}Members {
+        {{ cls.name|camel_case }}FromJSONBytes(
+            member.value,
+            member.key,
+            {% for ref_cls in references[cls] %}
+            target.{{ ref_cls.plural|ucamel_case }},
+            {% endfor %}
+            {{ cls.plural|camel_case }}Ref.Key(member.key),
+            target.{{ cls.plural|ucamel_case }}[member.key],
+            errors)
+
+        if errors.Full() {
+            break
+        }
+    }
+
+    if errors.Full() {
+        return
+    }
+    {% endfor %}{# /for cls in graph.classes.values() #}
+    {% for property_parsing in property_parsings %}
+
+    {{ property_parsing|indent }}
+
+    if errors.Full() {
+        return
+    }
+    {% endfor %}{# /for property_parsing #}
+
+    return
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_graph(
+        graph: mapry.Graph, pattern_uids: Mapping[Pattern[str], int],
+        go: mapry.Go) -> str:
+    """
+    Generate the code that parses an object graph.
+
+    :param graph: definition of the object graph
+    :param pattern_uids: uniquely identified patterns
+    :param go: Go settings
+    :return: generated code
+    """
+    # Map mapry class -> referenced mapry classes
+    # yapf: disable
+    references = {
+        cls: mapry.references(a_type=cls)
+        for cls in graph.classes.values()
+    }
+    # yapf: enable
+
+    # Map mapry class -> Go expression of the instance registry
+    # yapf: disable
+    registry_exprs = {
+        cls: 'target.{}'.format(mapry.naming.ucamel_case(identifier=cls.plural))
+        for cls in graph.classes.values()
+    }
+    # yapf: enable
+
+    # Gather property parsings in a list
+    # so that they can be readily inserted in the template
+    property_parsings = []  # type: List[str]
+
+    auto_id = mapry.go.generate.AutoID()
+    for prop in graph.properties.values():
+        property_parsings.append(
+            _parse_property(
+                target_obj_expr="target",
+                ref_obj_parts=["graphRef"],
+                a_property=prop,
+                registry_exprs=registry_exprs,
+                pattern_uids=pattern_uids,
+                auto_id=auto_id,
+                go=go))
+
+    keys_variables = []  # type: List[List[str]]
+    for cls in graph.classes.values():
+        keys_variables.append([
+            mapry.naming.json_plural(cls.plural),
+            '{}Value'.format(mapry.naming.camel_case(cls.plural))
+        ])
+
+    for prop in graph.properties.values():
+        keys_variables.append([prop.json, _member_variable(a_property=prop)])
+
+    text = _PARSE_GRAPH_TPL.render(
+        graph=graph,
+        references=references,
+        pattern_uids=pattern_uids,
+        collect_members=_collect_members(keys_variables=keys_variables),
+        property_parsings=property_parsings)
+
+    return text.rstrip("\n")
+
+
+@ensure(lambda result: result.endswith('\n'))
+def generate(graph: mapry.Graph, go: mapry.Go) -> str:
+    """
+    Generate the source file to parse an object graph from JSON bytes.
+
+    The helper functions for durations, dates, times and time zones as well
+    as the compiled regular expressions are shared with the code generated
+    by :py:mod:`mapry.go.generate.fromjsonable`.
+
+    :param graph: mapry definition of the object graph
+    :param go: Go settings
+    :return: content of the source file
+    """
+    if go.trusted_input:
+        # The constraints are assumed to be satisfied so that
+        # no checks are generated for them.
+        graph = mapry.without_constraints(graph=graph)
+
+    blocks = [
+        'package {}'.format(go.package), mapry.go.generate.WARNING,
+        _imports(graph=graph, go=go),
+        _json_scanner()
+    ]
+
+    pattern_uids = mapry.go.generate.fromjsonable.enumerate_patterns(
+        graph=graph)
+
+    nongraph_composites = []  # type: List[Union[mapry.Class, mapry.Embed]]
+    nongraph_composites.extend(graph.classes.values())
+    nongraph_composites.extend(graph.embeds.values())
+
+    for class_or_embed in nongraph_composites:
+        blocks.append(
+            _parse_composite(
+                composite=class_or_embed, pattern_uids=pattern_uids, go=go))
+
+    blocks.append(_parse_graph(graph=graph, pattern_uids=pattern_uids, go=go))
+
+    blocks.append(mapry.go.generate.WARNING)
+
+    return mapry.indention.reindent(
+        text='\n\n'.join(blocks) + '\n', indention='\t')
@@ -0,0 +1,797 @@
+"""Generate the code building synthetic object graphs for the benchmarks."""
+
+import importlib
+import textwrap
+from typing import (  # pylint: disable=unused-import
+    Any, Callable, List, Mapping, Optional, Pattern, Set, Tuple, Union)
+
+from icontract import ensure
+
+import mapry
+import mapry.go.generate
+import mapry.go.jinja2_env
+import mapry.indention
+import mapry.naming
+
+try:
+    _SRE_PARSE = importlib.import_module('re._parser')  # type: Any
+except ImportError:
+    _SRE_PARSE = importlib.import_module('sre_parse')
+
+# Default number of instances in all the registries of a synthetic graph
+_TOTAL_REGISTRY_SIZE = 1000
+
+
+class _Unsamplable(Exception):
+    """Signal that no sample can be generated for a regular expression."""
+
+
+# Samples of the character categories of regular expressions
+_CATEGORY_SAMPLES = {
+    'CATEGORY_DIGIT': '0',
+    'CATEGORY_NOT_DIGIT': 'a',
+    'CATEGORY_SPACE': ' ',
+    'CATEGORY_NOT_SPACE': 'a',
+    'CATEGORY_WORD': 'a',
+    'CATEGORY_NOT_WORD': '-'
+}
+
+
+def _sample_char_set(items: List[Tuple[Any, Any]]) -> str:
+    """
+    Sample a character from the parsed character set of a regular expression.
+
+    :param items: parsed items of the character set
+    :return: sampled character
+    """
+    if not items:
+        raise _Unsamplable()
+
+    if str(items[0][0]) == 'NEGATE':
+        excluded = set()  # type: Set[str]
+        for operator, argument in items[1:]:
+            if str(operator) == 'LITERAL':
+                excluded.add(chr(argument))
+            elif str(operator) == 'RANGE':
+                excluded.update(
+                    chr(code) for code in range(argument[0], argument[1] + 1))
+            else:
+                raise _Unsamplable()
+
+        for candidate in 'az09_- ':
+            if candidate not in excluded:
+                return candidate
+
+        raise _Unsamplable()
+
+    operator, argument = items[0]
+    if str(operator) == 'LITERAL':
+        return chr(argument)
+
+    if str(operator) == 'RANGE':
+        return chr(argument[0])
+
+    if str(operator) == 'CATEGORY' and str(argument) in _CATEGORY_SAMPLES:
+        return _CATEGORY_SAMPLES[str(argument)]
+
+    raise _Unsamplable()
+
+
+def _sample_parsed(parsed: Any) -> str:
+    """
+    Sample a text matching the parsed regular expression.
+
+    :param parsed: parsed regular expression or its part
+    :return: sampled text
+    """
+    parts = []  # type: List[str]
+
+    for operator, argument in parsed:
+        name = str(operator)
+
+        if name == 'LITERAL':
+            parts.append(chr(argument))
+
+        elif name == 'NOT_LITERAL':
+            parts.append('a' if chr(argument) != 'a' else 'b')
+
+        elif name == 'ANY':
+            parts.append('a')
+
+        elif name == 'IN':
+            parts.append(_sample_char_set(items=argument))
+
+        elif name in ['MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT']:
+            minimum, _, subpattern = argument
+            parts.append(_sample_parsed(parsed=subpattern) * minimum)
+
+        elif name in ['SUBPATTERN', 'ATOMIC_GROUP']:
+            parts.append(
+                _sample_parsed(
+                    parsed=argument[-1] if isinstance(argument, tuple
+                                                      ) else argument))
+
+        elif name == 'BRANCH':
+            parts.append(_sample_parsed(parsed=argument[1][0]))
+
+        elif name == 'AT':
+            # Anchors do not consume any characters.
+            pass
+
+        else:
+            raise _Unsamplable()
+
+    return ''.join(parts)
+
+
+def _sample_pattern(pattern: Pattern[str]) -> Optional[str]:
+    """
+    Sample a text which the pattern matches.
+
+    Only the common constructs such as literals, character sets,
+    repetitions, groups and alternatives are supported.
+
+    :param pattern: regular expression
+    :return: sampled text, or None if no sample could be generated
+    """
+    try:
+        sample = _sample_parsed(parsed=_SRE_PARSE.parse(pattern.pattern))
+    except _Unsamplable:
+        return None
+
+    if pattern.search(sample) is None:
+        return None
+
+    return sample
+
+
+def _letters(index: int) -> str:
+    """
+    Represent the index with lowercase letters as the generated Go code does.
+
+    :param index: non-negative index
+    :return: letters encoding the index in base 26
+    """
+    result = chr(ord('a') + index % 26)
+    index //= 26
+    while index > 0:
+        index -= 1
+        result = chr(ord('a') + index % 26) + result
+        index //= 26
+
+    return result
+
+
+# Candidates for the IDs of synthetic instances given as
+# (Python function of an index, Go expression of the index ``i``)
+# yapf: disable
+_ID_CANDIDATES = [
+    ('id{}'.format, 'fmt.Sprintf("id%d", i)'),
+    ('{}'.format, 'fmt.Sprintf("%d", i)'),
+    ('ID{}'.format, 'fmt.Sprintf("ID%d", i)'),
+    ('id-{}'.format, 'fmt.Sprintf("id-%d", i)'),
+    ('id_{}'.format, 'fmt.Sprintf("id_%d", i)'),
+    (_letters, 'syntheticLetters(i)')
+]  # type: List[Tuple[Callable[[int], str], str]]
+# yapf: enable
+
+
+def _id_expr(cls: mapry.Class) -> str:
+    """
+    Generate the Go expression of the ID of the ``i``-th synthetic instance.
+
+    :param cls: mapry definition of the class
+    :return: Go expression
+    """
+    if cls.id_pattern is None:
+        return _ID_CANDIDATES[0][1]
+
+    for func, expr in _ID_CANDIDATES:
+        if all(cls.id_pattern.search(func(index)) is not None
+               for index in [0, 1, 9, 10, 27, 703, 123456]):
+            return expr
+
+    # The benchmarks are skipped since the graph does not satisfy the schema.
+    return _ID_CANDIDATES[0][1]
+
+
+class _Context:
+    """Represent the context of building a synthetic value."""
+
+    def __init__(
+            self, depth_expr: Optional[str],
+            instances_exprs: Mapping[mapry.Class, str],
+            auto_id: mapry.go.generate.AutoID, go: mapry.Go,
+            import_set: Set[str]) -> None:
+        """
+        Initialize with the given values.
+
+        :param depth_expr:
+            Go expression of the nesting depth of embeddable structures,
+            or None if the values are not nested
+        :param instances_exprs:
+            map class to Go expression of the slice of its synthetic instances
+        :param auto_id: generator of unique identifiers
+        :param go: Go settings
+        :param import_set: packages needed by the generated code
+        """
+        self.depth_expr = depth_expr
+        self.instances_exprs = instances_exprs
+        self.auto_id = auto_id
+        self.go = go
+        self.import_set = import_set
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _integer_expr(a_type: mapry.Integer, index_expr: str) -> str:
+    """
+    Generate the Go expression of a synthetic integer satisfying the bounds.
+
+    :param a_type: mapry definition of the integer
+    :param index_expr: Go expression of the index of the value
+    :return: Go expression
+    """
+    low = None  # type: Optional[int]
+    if a_type.minimum is not None:
+        low = a_type.minimum + (1 if a_type.exclusive_minimum else 0)
+
+    high = None  # type: Optional[int]
+    if a_type.maximum is not None:
+        high = a_type.maximum - (1 if a_type.exclusive_maximum else 0)
+
+    if low is not None and high is not None:
+        return 'int64({})'.format((low + high) // 2)
+
+    if low is not None:
+        return 'int64({}) + int64({}%100)'.format(low, index_expr)
+
+    if high is not None:
+        return 'int64({}) - int64({}%100)'.format(high, index_expr)
+
+    return 'int64({})'.format(index_expr)
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _float_expr(a_type: mapry.Float, index_expr: str) -> str:
+    """
+    Generate the Go expression of a synthetic float satisfying the bounds.
+
+    :param a_type: mapry definition of the float
+    :param index_expr: Go expression of the index of the value
+    :return: Go expression
+    """
+    if a_type.minimum is not None and a_type.maximum is not None:
+        return repr((a_type.minimum + a_type.maximum) / 2.0)
+
+    if a_type.minimum is not None:
+        return '{} + 1.0 + float64({}%100)'.format(
+            repr(float(a_type.minimum)), index_expr)
+
+    if a_type.maximum is not None:
+        return '{} - 1.0 - float64({}%100)'.format(
+            repr(float(a_type.maximum)), index_expr)
+
+    return 'float64({}) + 0.5'.format(index_expr)
+
+
+_BUILD_ARRAY_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+count{{ uid }} := syntheticSize(
+    *syntheticArrayLength, {{ depth_expr }}, {{ minimum_size }}, {{
+        maximum_size }})
+target{{ uid }} := make({{ go_type }}, count{{ uid }})
+for i{{ uid }} := range target{{ uid }} {
+    {{ item_building|indent }}
+}
+{{ target_expr }} = target{{ uid }}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _build_array(
+        target_expr: str, a_type: mapry.Array, context: _Context) -> str:
+    """
+    Generate the code to build a synthetic array.
+
+    :param target_expr: Go expression of where to store the value
+    :param a_type: mapry definition of the array
+    :param context: context of the building
+    :return: generated code
+    """
+    uid = context.auto_id.next_identifier()
+
+    item_building = _build_value(
+        target_expr='target{uid}[i{uid}]'.format(uid=uid),
+        index_expr='i{uid}'.format(uid=uid),
+        a_type=a_type.values,
+        context=context)
+
+    return _BUILD_ARRAY_TPL.render(
+        uid=uid,
+        depth_expr=context.depth_expr
+        if context.depth_expr is not None else '0',
+        minimum_size=a_type.minimum_size
+        if a_type.minimum_size is not None else -1,
+        maximum_size=a_type.maximum_size
+        if a_type.maximum_size is not None else -1,
+        go_type=mapry.go.generate.type_repr(a_type=a_type, go=context.go),
+        item_building=item_building,
+        target_expr=target_expr).rstrip('\n')
+
+
+_BUILD_MAP_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+count{{ uid }} := syntheticSize(*syntheticMapSize, {{ depth_expr }}, -1, -1)
+target{{ uid }} := make({{ go_type }}, count{{ uid }})
+for i{{ uid }} := 0; i{{ uid }} < count{{ uid }}; i{{ uid }}++ {
+    var item{{ uid }} {{ item_go_type }}
+    {{ item_building|indent }}
+    target{{ uid }}[fmt.Sprintf("key%d", i{{ uid }})] = item{{ uid }}
+}
+{{ target_expr }} = target{{ uid }}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _build_map(target_expr: str, a_type: mapry.Map, context: _Context) -> str:
+    """
+    Generate the code to build a synthetic map.
+
+    :param target_expr: Go expression of where to store the value
+    :param a_type: mapry definition of the map
+    :param context: context of the building
+    :return: generated code
+    """
+    uid = context.auto_id.next_identifier()
+    context.import_set.add('fmt')
+
+    item_building = _build_value(
+        target_expr='item{uid}'.format(uid=uid),
+        index_expr='i{uid}'.format(uid=uid),
+        a_type=a_type.values,
+        context=context)
+
+    return _BUILD_MAP_TPL.render(
+        uid=uid,
+        depth_expr=context.depth_expr
+        if context.depth_expr is not None else '0',
+        go_type=mapry.go.generate.type_repr(a_type=a_type, go=context.go),
+        item_go_type=mapry.go.generate.type_repr(
+            a_type=a_type.values, go=context.go),
+        item_building=item_building,
+        target_expr=target_expr).rstrip('\n')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _build_value(
+        target_expr: str, index_expr: str, a_type: mapry.Type,
+        context: _Context) -> str:
+    """
+    Generate the code to build a synthetic value.
+
+    :param target_expr: Go expression of where to store the value
+    :param index_expr: Go expression of the index of the value
+    :param a_type: mapry definition of the value type
+    :param context: context of the building
+    :return: generated code
+    """
+    # pylint: disable=too-many-return-statements
+    if isinstance(a_type, mapry.Boolean):
+        return '{} = {}%2 == 0'.format(target_expr, index_expr)
+
+    if isinstance(a_type, mapry.Integer):
+        return '{} = {}'.format(
+            target_expr, _integer_expr(a_type=a_type, index_expr=index_expr))
+
+    if isinstance(a_type, mapry.Float):
+        return '{} = {}'.format(
+            target_expr, _float_expr(a_type=a_type, index_expr=index_expr))
+
+    if isinstance(a_type, (mapry.String, mapry.Path)):
+        if a_type.pattern is None:
+            context.import_set.add('fmt')
+            return '{} = fmt.Sprintf("text%d", {})'.format(
+                target_expr, index_expr)
+
+        sample = _sample_pattern(pattern=a_type.pattern)
+
+        # The benchmarks are skipped if the pattern could not be sampled
+        # since the graph does not satisfy the schema.
+        text = sample if sample is not None else ''
+        return '{} = {}'.format(
+            target_expr, mapry.go.generate.escaped_str(text))
+
+    if isinstance(a_type, (mapry.Date, mapry.Datetime, mapry.Time)):
+        context.import_set.add('time')
+        return textwrap.dedent(
+            '''\
+            {} = time.Date(
+                2020, time.January, 1+{}%28, 12, 30, 15, 0, time.UTC)'''
+        ).format(target_expr, index_expr)
+
+    if isinstance(a_type, mapry.TimeZone):
+        context.import_set.add('time')
+        return '{} = time.UTC'.format(target_expr)
+
+    if isinstance(a_type, mapry.Duration):
+        context.import_set.add('time')
+        return '{} = time.Duration({}) * time.Second'.format(
+            target_expr, index_expr)
+
+    if isinstance(a_type, mapry.Array):
+        return _build_array(
+            target_expr=target_expr, a_type=a_type, context=context)
+
+    if isinstance(a_type, mapry.Map):
+        return _build_map(
+            target_expr=target_expr, a_type=a_type, context=context)
+
+    if isinstance(a_type, mapry.Class):
+        instances_expr = context.instances_exprs[a_type]
+        return '{0} = {1}[{2}%len({1})]'.format(
+            target_expr, instances_expr, index_expr)
+
+    if isinstance(a_type, mapry.Embed):
+        args = ['&{}'.format(target_expr), index_expr]
+        if context.depth_expr is not None:
+            args.append('{}+1'.format(context.depth_expr))
+        else:
+            args.append('1')
+        args.extend(
+            context.instances_exprs[reference]
+            for reference in mapry.references(a_type=a_type))
+
+        return 'synthetic{}({})'.format(
+            mapry.naming.ucamel_case(a_type.name), ', '.join(args))
+
+    raise NotImplementedError(
+        "Unhandled building of a synthetic value of type: {}".format(a_type))
+
+
+_BUILD_PROPERTY_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{% if not a_property.optional %}
+{{ building }}
+{% else %}
+{% if depth_expr is not none %}
+if {{ depth_expr }} < syntheticMaxDepth {
+{% else %}
+{
+{% endif %}
+    {% if is_pointer_type %}
+    {{ building|indent }}
+    {% else %}
+    var target{{ uid }} {{ go_type }}
+    {{ building|indent }}
+    {{ target_expr }} = &target{{ uid }}
+    {% endif %}{# /if is_pointer_type #}
+}
+{% endif %}{# /if not a_property.optional #}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _build_property(
+        target_obj_expr: str, index_expr: str, a_property: mapry.Property,
+        context: _Context) -> str:
+    """
+    Generate the code to build a synthetic property of a composite.
+
+    Optional properties are always set unless the nesting is too deep.
+
+    :param target_obj_expr: Go expression of the composite
+    :param index_expr: Go expression of the index of the composite
+    :param a_property: mapry definition of the property
+    :param context: context of the building
+    :return: generated code
+    """
+    uid = context.auto_id.next_identifier()
+
+    target_expr = '{}.{}'.format(
+        target_obj_expr, mapry.naming.ucamel_case(a_property.name))
+
+    is_pointer_type = mapry.go.generate.is_pointer_type(a_type=a_property.type)
+
+    building = _build_value(
+        target_expr=(
+            target_expr if not a_property.optional or is_pointer_type else
+            'target{}'.format(uid)),
+        index_expr=index_expr,
+        a_type=a_property.type,
+        context=context)
+
+    return _BUILD_PROPERTY_TPL.render(
+        a_property=a_property,
+        depth_expr=context.depth_expr,
+        is_pointer_type=is_pointer_type,
+        uid=uid,
+        go_type=mapry.go.generate.type_repr(
+            a_type=a_property.type, go=context.go),
+        building=building,
+        target_expr=target_expr).rstrip('\n')
+
+
+_BUILD_COMPOSITE_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+// synthetic{{ composite.name|ucamel_case }} fills the target with
+// the synthetic values of the i-th instance.
+func synthetic{{ composite.name|ucamel_case }}(
+    target *{{ composite.name|ucamel_case }},
+    i int,
+    depth int{% for ref_cls in references %},
+    {{ ref_cls.plural|camel_case }}Instances []*{{
+        ref_cls.name|ucamel_case }}{% endfor %}) {
+    {% for building in property_buildings %}
+
+    {{ building|indent }}
+    {% endfor %}{# /for building #}
+}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _build_composite(
+        composite: Union[mapry.Class, mapry.Embed], import_set: Set[str],
+        go: mapry.Go) -> str:
+    """
+    Generate the function that fills a synthetic class instance or embed.
+
+    :param composite: mapry definition of the class or the embeddable structure
+    :param import_set: packages needed by the generated code
+    :param go: Go settings
+    :return: generated code
+    """
+    references = mapry.references(a_type=composite)
+
+    context = _Context(
+        depth_expr='depth',
+        instances_exprs={
+            ref_cls:
+            '{}Instances'.format(mapry.naming.camel_case(ref_cls.plural))
+            for ref_cls in references
+        },
+        auto_id=mapry.go.generate.AutoID(),
+        go=go,
+        import_set=import_set)
+
+    property_buildings = [
+        _build_property(
+            target_obj_expr='target',
+            index_expr='i',
+            a_property=prop,
+            context=context) for prop in composite.properties.values()
+    ]
+
+    return _BUILD_COMPOSITE_TPL.render(
+        composite=composite,
+        references=references,
+        property_buildings=property_buildings)
+
+
+_BUILD_GRAPH_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+// newSynthetic{{ graph.name|ucamel_case }} builds a synthetic {{
+    graph.name|ucamel_case }} for the benchmarks.
+//
+// The sizes of the registries, arrays and maps are given by the flags.
+// Optional properties are always set unless the embeddable structures
+// are nested too deep.
+func newSynthetic{{ graph.name|ucamel_case }}() *{{ graph.name|ucamel_case }} {
+    target := &{{ graph.name|ucamel_case }}{}
+    {% if graph.classes %}
+
+    registrySize := *syntheticRegistrySize
+    if registrySize < 1 {
+        // Each registry needs at least an instance to be referenced.
+        registrySize = 1
+    }
+    {% for cls in graph.classes.values() %}
+
+    {{ cls.plural|camel_case }}Instances := make([]*{{
+        cls.name|ucamel_case }}, registrySize)
+    target.{{ cls.plural|ucamel_case }} = make(map[string]*{{
+        cls.name|ucamel_case }}, registrySize)
+    for i := range {{ cls.plural|camel_case }}Instances {
+        id := {{ id_exprs[cls] }}
+        instance := &{{ cls.name|ucamel_case }}{ID: id}
+        {{ cls.plural|camel_case }}Instances[i] = instance
+        target.{{ cls.plural|ucamel_case }}[id] = instance
+    }
+    {% endfor %}{# /for cls #}
+    {% for cls in graph.classes.values() %}
+
+    for i, instance := range {{ cls.plural|camel_case }}Instances {
+        synthetic{{ cls.name|ucamel_case }}(
+            instance,
+            i,
+            0{% for ref_cls in references[cls] %},
+            {{ ref_cls.plural|camel_case }}Instances{% endfor %})
+    }
+    {% endfor %}{# /for cls #}
+    {% endif %}{# /if graph.classes #}
+    {% for building in property_buildings %}
+
+    {{ building|indent }}
+    {% endfor %}{# /for building #}
+
+    return target
+}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _build_graph(graph: mapry.Graph, import_set: Set[str], go: mapry.Go) -> str:
+    """
+    Generate the function that builds a synthetic object graph.
+
+    :param graph: mapry definition of the object graph
+    :param import_set: packages needed by the generated code
+    :param go: Go settings
+    :return: generated code
+    """
+    id_exprs = {cls: _id_expr(cls=cls) for cls in graph.classes.values()}
+    if any(expr.startswith('fmt.') for expr in id_exprs.values()):
+        import_set.add('fmt')
+
+    context = _Context(
+        depth_expr=None,
+        instances_exprs={
+            cls: '{}Instances'.format(mapry.naming.camel_case(cls.plural))
+            for cls in graph.classes.values()
+        },
+        auto_id=mapry.go.generate.AutoID(),
+        go=go,
+        import_set=import_set)
+
+    property_buildings = [
+        _build_property(
+            target_obj_expr='target',
+            index_expr='0',
+            a_property=prop,
+            context=context) for prop in graph.properties.values()
+    ]
+
+    return _BUILD_GRAPH_TPL.render(
+        graph=graph,
+        id_exprs=id_exprs,
+        references={
+            cls: mapry.references(a_type=cls)
+            for cls in graph.classes.values()
+        },
+        property_buildings=property_buildings)
+
+
+_SYNTHETIC_JSON_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+// synthetic{{ graph.name|ucamel_case }}JSON gives the JSON text of
+// a synthetic {{ graph.name|ucamel_case }}.
+//
+// The benchmark is skipped if the synthetic graph does not satisfy
+// the schema, e.g., if a pattern could not be sampled.
+func synthetic{{ graph.name|ucamel_case }}JSON(b *testing.B) []byte {
+    jsonable, err := {{ graph.name|ucamel_case }}ToJSONable(
+        newSynthetic{{ graph.name|ucamel_case }}())
+    if err != nil {
+        b.Fatal(err)
+    }
+
+    data, err := json.Marshal(jsonable)
+    if err != nil {
+        b.Fatal(err)
+    }
+
+    errors := NewErrors(1)
+    {{ graph.name|ucamel_case }}FromJSONBytes(
+        data, "#", &{{ graph.name|ucamel_case }}{}, errors)
+    if !errors.Empty() {
+        e := errors.Values()[0]
+        b.Skipf(
+            "the synthetic graph does not satisfy the schema: %s: %s",
+            e.Ref, e.Message)
+    }
+
+    return data
+}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _flags(graph: mapry.Graph) -> str:
+    """
+    Generate the flags setting the sizes of the synthetic object graph.
+
+    The default registry size is scaled by the number of classes so that
+    the graphs of the schemas with many classes stay manageable.
+
+    :param graph: mapry definition of the object graph
+    :return: generated code
+    """
+    registry_size = max(10, _TOTAL_REGISTRY_SIZE // max(1, len(graph.classes)))
+
+    return textwrap.dedent(
+        '''\
+    // syntheticRegistrySize gives the number of instances in each registry
+    // of the synthetic graphs.
+    var syntheticRegistrySize = flag.Int(
+        "mapry.registry_size", {},
+        "number of instances in each registry of the synthetic graphs")
+
+    // syntheticArrayLength gives the length of the arrays of
+    // the synthetic graphs unless constrained by the schema.
+    var syntheticArrayLength = flag.Int(
+        "mapry.array_length", 10,
+        "length of the arrays in the synthetic graphs")
+
+    // syntheticMapSize gives the number of entries in the maps of
+    // the synthetic graphs.
+    var syntheticMapSize = flag.Int(
+        "mapry.map_size", 10,
+        "number of entries in the maps of the synthetic graphs")
+
+    // syntheticMaxDepth limits the nesting of the embeddable structures
+    // so that the recursive structures are finite.
+    const syntheticMaxDepth = 3
+
+    // syntheticSize clamps the size to the bounds given by the schema.
+    //
+    // The size is the minimum once the nesting is too deep.
+    // Negative bounds are ignored.
+    func syntheticSize(size int, depth int, minimum int, maximum int) int {{
+        if depth >= syntheticMaxDepth {{
+            size = 0
+        }}
+        if minimum >= 0 && size < minimum {{
+            size = minimum
+        }}
+        if maximum >= 0 && size > maximum {{
+            size = maximum
+        }}
+        return size
+    }}
+
+    // syntheticLetters encodes the index in lowercase letters.
+    func syntheticLetters(i int) string {{
+        result := []byte{{byte('a' + i%26)}}
+        i /= 26
+        for i > 0 {{
+            i--
+            result = append([]byte{{byte('a' + i%26)}}, result...)
+            i /= 26
+        }}
+        return string(result)
+    }}''').format(registry_size)
+
+
+@ensure(lambda result: result.endswith('\n'))
+def generate(graph: mapry.Graph, go: mapry.Go) -> str:
+    """
+    Generate the source file building synthetic object graphs.
+
+    The synthetic graphs are used by the benchmarks in the generated tests.
+
+    :param graph: mapry definition of the object graph
+    :param go: Go settings
+    :return: content of the source file
+    """
+    import_set = {'encoding/json', 'flag', 'testing'}
+
+    nongraph_composites = []  # type: List[Union[mapry.Class, mapry.Embed]]
+    nongraph_composites.extend(graph.classes.values())
+    nongraph_composites.extend(graph.embeds.values())
+
+    composite_blocks = [
+        _build_composite(composite=composite, import_set=import_set, go=go)
+        for composite in nongraph_composites
+    ]
+
+    graph_block = _build_graph(graph=graph, import_set=import_set, go=go)
+
+    blocks = [
+        'package {}'.format(go.package), mapry.go.generate.WARNING,
+        mapry.go.generate.import_declarations(import_set),
+        _flags(graph=graph)
+    ]
+    blocks.extend(composite_blocks)
+    blocks.append(graph_block)
+    blocks.append(_SYNTHETIC_JSON_TPL.render(graph=graph))
+    blocks.append(mapry.go.generate.WARNING)
+
+    return mapry.indention.reindent(
+        text='\n\n'.join(blocks) + '\n', indention='\t')
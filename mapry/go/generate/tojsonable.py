@@ -437,6 +437,7 @@ def _serialize_class_or_embed(
 
 _SERIALIZE_GRAPH_TPL = mapry.go.jinja2_env.ENV.from_string(
     '''\
+{% if not parallel %}
 // {{
     graph.name|ucamel_case
     }} converts the instance to a JSONable representation.
@@ -449,10 +450,33 @@ _SERIALIZE_GRAPH_TPL = mapry.go.jinja2_env.ENV.from_string(
 func {{ graph.name|ucamel_case }}ToJSONable(
     instance *{{ graph.name|ucamel_case }}) (
     target map[string]interface{}, err error) {
+{% else %}
+// {{ graph.name|ucamel_case }}ToJSONableParallel converts the instance to
+// a JSONable representation on a pool of at most workers goroutines.
+//
+// The instances of each registry are converted concurrently.
+//
+// {{ graph.name|ucamel_case }}ToJSONableParallel requires:
+//  * instance != nil
+//  * workers > 0
+//
+// {{ graph.name|ucamel_case }}ToJSONableParallel ensures:
+//  * (err == nil && target != nil) || (err != nil && target == nil)
+func {{ graph.name|ucamel_case }}ToJSONableParallel(
+    instance *{{ graph.name|ucamel_case }},
+    workers int) (
+    target map[string]interface{}, err error) {
+{% endif %}{# /if not parallel #}
 
     if instance == nil {
         panic("unexpected nil instance")
     }
+    {% if parallel %}
+
+    if workers < 1 {
+        panic("unexpected non-positive workers")
+    }
+    {% endif %}
 
     target = make(map[string]interface{})
     defer func() {
@@ -477,6 +501,38 @@ func {{ graph.name|ucamel_case }}ToJSONable(
     ////
 
     if len(instance.{{ cls.plural|ucamel_case }}) > 0 {
+        {% if parallel %}
+        ids := make([]string, 0, len(instance.{{ cls.plural|ucamel_case }}))
+        for id, {{ cls.name|camel_case }}Instance := range instance.{{
+            cls.plural|ucamel_case }} {
+            if id != {{ cls.name|camel_case }}Instance.ID {
+                err = fmt.Errorf(
+                    {{ "expected the instance of %s to have the ID %%s "
+                        "according to the registry, but got: %%s"
+                        |format(cls.name|ucamel_case)|escaped_str }},
+                    id, {{ cls.name|camel_case }}Instance.ID)
+                return
+            }
+
+            ids = append(ids, id)
+        }
+
+        jsonables := make([]map[string]interface{}, len(ids))
+        chunks := parallelChunkCount(len(ids), workers)
+        forEachInParallel(chunks, workers, func(worker int, chunk int) {
+            start, end := parallelChunk(len(ids), chunks, chunk)
+            for i := start; i < end; i++ {
+                jsonables[i] = {{ cls.name|ucamel_case }}ToJSONable(
+                    instance.{{ cls.plural|ucamel_case }}[ids[i]])
+            }
+        })
+
+        target{{ cls.plural|ucamel_case }} := make(
+            map[string]interface{}, len(ids))
+        for i, id := range ids {
+            target{{ cls.plural|ucamel_case }}[id] = jsonables[i]
+        }
+        {% else %}
         target{{ cls.plural|ucamel_case }} := make(map[string]interface{})
         for id := range instance.{{ cls.plural|ucamel_case }} {
             {{
@@ -497,6 +553,7 @@ func {{ graph.name|ucamel_case }}ToJSONable(
                     cls.name|ucamel_case }}ToJSONable(
                 {{ cls.name|camel_case }}Instance)
         }
+        {% endif %}{# /if parallel #}
 
         target[{{
             cls.plural|json_plural|escaped_str }}] = target{{
@@ -510,12 +567,14 @@ func {{ graph.name|ucamel_case }}ToJSONable(
 
 
 @ensure(lambda result: not result.endswith('\n'))
-def _serialize_graph(graph: mapry.Graph, go: mapry.Go) -> str:
+def _serialize_graph(graph: mapry.Graph, go: mapry.Go, parallel: bool) -> str:
     """
     Generate the function that serializes the object graph.
 
     :param graph: mapry definition of the object graph
     :param go: Go settings
+    :param parallel:
+        if set, the instances are serialized on a pool of goroutines
     :return: generated code
     """
     auto_id = mapry.go.generate.AutoID()
@@ -537,7 +596,8 @@ def _serialize_graph(graph: mapry.Graph, go: mapry.Go) -> str:
     return _SERIALIZE_GRAPH_TPL.render(
         graph=graph,
         property_serializations=property_serializations,
-        package=go.package).rstrip('\n')
+        package=go.package,
+        parallel=parallel).rstrip('\n')
 
 
 @ensure(lambda result: result.endswith('\n'))
@@ -569,7 +629,10 @@ def generate(graph: mapry.Graph, go: mapry.Go) -> str:
         blocks.append(
             _serialize_class_or_embed(class_or_embed=class_or_embed, go=go))
 
-    blocks.append(_serialize_graph(graph=graph, go=go))
+    blocks.append(_serialize_graph(graph=graph, go=go, parallel=False))
+
+    if graph.classes:
+        blocks.append(_serialize_graph(graph=graph, go=go, parallel=True))
 
     blocks.append(mapry.go.generate.WARNING)
 
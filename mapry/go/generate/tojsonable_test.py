@@ -1,7 +1,6 @@
 """Generate the code to test serializing object graphs to JSONables."""
 
 import textwrap
-from typing import Set  # pylint: disable=unused-import
 
 from icontract import ensure
 
@@ -19,7 +18,10 @@ def _imports(graph: mapry.Graph) -> str:
     :param graph: mapry definition of the object graph
     :return: generated code
     """
-    import_set = set()  # type: Set[str]
+    import_set = {'io/ioutil', 'testing'}
+
+    if graph.classes:
+        import_set.add('runtime')
 
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
         import_set.add('fmt')
@@ -87,6 +89,84 @@ def _example_duration_to_string() -> str:
     }''')
 
 
+_BENCHMARKS_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+func Benchmark{{ graph.name|ucamel_case }}ToJSONable(b *testing.B) {
+    instance := newSynthetic{{ graph.name|ucamel_case }}()
+
+    b.ReportAllocs()
+    b.ResetTimer()
+
+    for i := 0; i < b.N; i++ {
+        _, err := {{ graph.name|ucamel_case }}ToJSONable(instance)
+        if err != nil {
+            b.Fatal(err)
+        }
+    }
+}
+{% if graph.classes %}
+
+func Benchmark{{ graph.name|ucamel_case }}ToJSONableParallel(b *testing.B) {
+    instance := newSynthetic{{ graph.name|ucamel_case }}()
+    workers := runtime.GOMAXPROCS(0)
+
+    b.ReportAllocs()
+    b.ResetTimer()
+
+    for i := 0; i < b.N; i++ {
+        _, err := {{ graph.name|ucamel_case }}ToJSONableParallel(
+            instance, workers)
+        if err != nil {
+            b.Fatal(err)
+        }
+    }
+}
+{% endif %}{# /if graph.classes #}
+
+func Benchmark{{ graph.name|ucamel_case }}WriteJSON(b *testing.B) {
+    instance := newSynthetic{{ graph.name|ucamel_case }}()
+
+    b.ReportAllocs()
+    b.ResetTimer()
+
+    for i := 0; i < b.N; i++ {
+        err := {{ graph.name|ucamel_case }}WriteJSON(ioutil.Discard, instance)
+        if err != nil {
+            b.Fatal(err)
+        }
+    }
+}
+{% if graph.classes %}
+
+func Benchmark{{ graph.name|ucamel_case }}WriteJSONParallel(b *testing.B) {
+    instance := newSynthetic{{ graph.name|ucamel_case }}()
+    workers := runtime.GOMAXPROCS(0)
+
+    b.ReportAllocs()
+    b.ResetTimer()
+
+    for i := 0; i < b.N; i++ {
+        err := {{ graph.name|ucamel_case }}WriteJSONParallel(
+            ioutil.Discard, instance, workers)
+        if err != nil {
+            b.Fatal(err)
+        }
+    }
+}
+{% endif %}{# /if graph.classes #}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _benchmarks(graph: mapry.Graph) -> str:
+    """
+    Generate the code to benchmark serializing of a synthetic object graph.
+
+    :param graph: mapry definition of the object graph
+    :return: generated code
+    """
+    return _BENCHMARKS_TPL.render(graph=graph).rstrip('\n')
+
+
 @ensure(lambda result: result.endswith('\n'))
 def generate(graph: mapry.Graph, go: mapry.Go) -> str:
     """
@@ -97,24 +177,15 @@ def generate(graph: mapry.Graph, go: mapry.Go) -> str:
     :return: content of the source file
     """
     blocks = [
-        'package {}'.format(go.package),
-        mapry.go.generate.WARNING,
+        'package {}'.format(go.package), mapry.go.generate.WARNING,
+        _imports(graph=graph)
     ]
 
-    has_body = False
-
-    import_decl = _imports(graph=graph)
-    if len(import_decl) > 0:
-        blocks.append(import_decl)
-        has_body = True
-
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
         blocks.append(_example_duration_to_string())
-        has_body = True
 
-    # Include the footer only if there was something after the header
-    if has_body:
-        blocks.append(mapry.go.generate.WARNING)
+    blocks.append(_benchmarks(graph=graph))
+    blocks.append(mapry.go.generate.WARNING)
 
     return mapry.indention.reindent(
         text='\n\n'.join(blocks) + '\n', indention='\t')
@@ -0,0 +1,878 @@
+"""Generate the code that writes the object graph as a JSON text."""
+
+import json
+import textwrap
+from typing import List, Set, Tuple, Union  # pylint: disable=unused-import
+
+from icontract import ensure
+
+import mapry
+import mapry.go.generate
+import mapry.go.jinja2_env
+import mapry.go.timeformat
+import mapry.indention
+import mapry.naming
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _imports(graph: mapry.Graph) -> str:
+    """
+    Generate the import declaration.
+
+    :param graph: mapry definition of the object graph
+    :return: generated code
+    """
+    # The writer always needs these packages.
+    import_set = {
+        'encoding/json', 'fmt', 'io', 'math', 'strconv', 'sync', 'time',
+        'unicode/utf8'
+    }
+
+    if graph.classes or mapry.needs_type(a_type=graph, query=mapry.Map):
+        import_set.add('sort')
+
+    return mapry.go.generate.import_declarations(import_set)
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _json_writer() -> str:
+    """
+    Generate the code of the buffered writer and the JSON encoding of values.
+
+    :return: generated code
+    """
+    return textwrap.dedent(
+        '''\
+    // jsonFlushSize gives the size of the buffered JSON text which is
+    // passed on to the underlying writer.
+    const jsonFlushSize = 32 * 1024
+
+    // jsonWriter buffers the JSON text for an io.Writer.
+    //
+    // The first error is kept and all the subsequent writes are ignored.
+    type jsonWriter struct {
+        // is the underlying writer.
+        w io.Writer
+
+        // holds the JSON text which has not been written yet.
+        buf []byte
+
+        // is the first encountered error.
+        err error
+    }
+
+    // jsonWriterPool keeps the writers so that their buffers can be reused.
+    var jsonWriterPool = sync.Pool{
+        New: func() interface{} {
+            return &jsonWriter{buf: make([]byte, 0, 2*jsonFlushSize)}
+        },
+    }
+
+    // fail records the error unless an error has been already recorded.
+    func (jw *jsonWriter) fail(err error) {
+        if jw.err == nil {
+            jw.err = err
+        }
+    }
+
+    // flush writes the buffered text to the underlying writer.
+    func (jw *jsonWriter) flush() {
+        if jw.err == nil && len(jw.buf) > 0 {
+            _, jw.err = jw.w.Write(jw.buf)
+        }
+        jw.buf = jw.buf[:0]
+    }
+
+    // flushIfFull writes the buffered text to the underlying writer
+    // if the buffer is full.
+    //
+    // A writer without an underlying writer keeps the whole text
+    // in the buffer.
+    func (jw *jsonWriter) flushIfFull() {
+        if jw.w != nil && len(jw.buf) >= jsonFlushSize {
+            jw.flush()
+        }
+    }
+
+    // jsonHexDigits are used to encode the escaped characters.
+    const jsonHexDigits = "0123456789abcdef"
+
+    // jsonShortEscapes is set if encoding/json escapes the backspace and
+    // the form feed as \\b and \\f instead of \\u0008 and \\u000c.
+    //
+    // Go 1.22 changed these escapes in encoding/json so the writer asks
+    // the toolchain at hand in order to produce the same text.
+    var jsonShortEscapes = func() bool {
+        data, err := json.Marshal("\\b")
+        return err == nil && string(data) == `"\\b"`
+    }()
+
+    // jsonSafe checks whether c needs no escaping as encoding/json
+    // escapes the strings.
+    func jsonSafe(c byte) bool {
+        return c >= 0x20 && c < utf8.RuneSelf &&
+            c != '"' && c != '\\\\' && c != '<' && c != '>' && c != '&'
+    }
+
+    // jsonAppendString appends s as a JSON string to buf.
+    //
+    // The string is escaped as encoding/json escapes it including
+    // the HTML characters. Invalid UTF-8 is replaced with U+FFFD.
+    func jsonAppendString(buf []byte, s string) []byte {
+        buf = append(buf, '"')
+        start := 0
+        for i := 0; i < len(s); {
+            if c := s[i]; c < utf8.RuneSelf {
+                if jsonSafe(c) {
+                    i++
+                    continue
+                }
+
+                buf = append(buf, s[start:i]...)
+                switch c {
+                case '\\\\', '"':
+                    buf = append(buf, '\\\\', c)
+                case '\\n':
+                    buf = append(buf, '\\\\', 'n')
+                case '\\r':
+                    buf = append(buf, '\\\\', 'r')
+                case '\\t':
+                    buf = append(buf, '\\\\', 't')
+                case '\\b', '\\f':
+                    switch {
+                    case !jsonShortEscapes:
+                        buf = append(
+                            buf, '\\\\', 'u', '0', '0',
+                            jsonHexDigits[c>>4], jsonHexDigits[c&0xF])
+                    case c == '\\b':
+                        buf = append(buf, '\\\\', 'b')
+                    default:
+                        buf = append(buf, '\\\\', 'f')
+                    }
+                default:
+                    // This encodes the control characters as well as
+                    // <, > and &.
+                    buf = append(
+                        buf, '\\\\', 'u', '0', '0',
+                        jsonHexDigits[c>>4], jsonHexDigits[c&0xF])
+                }
+                i++
+                start = i
+                continue
+            }
+
+            r, size := utf8.DecodeRuneInString(s[i:])
+            if r == utf8.RuneError && size == 1 {
+                buf = append(buf, s[start:i]...)
+                buf = append(buf, `\\ufffd`...)
+                i += size
+                start = i
+                continue
+            }
+
+            // U+2028 and U+2029 are escaped for JSONP as encoding/json does.
+            if r == '\\u2028' || r == '\\u2029' {
+                buf = append(buf, s[start:i]...)
+                buf = append(
+                    buf, '\\\\', 'u', '2', '0', '2', jsonHexDigits[r&0xF])
+                i += size
+                start = i
+                continue
+            }
+
+            i += size
+        }
+        buf = append(buf, s[start:]...)
+        buf = append(buf, '"')
+        return buf
+    }
+
+    // appendString appends s as a JSON string.
+    func (jw *jsonWriter) appendString(s string) {
+        jw.buf = jsonAppendString(jw.buf, s)
+    }
+
+    // appendFloat appends f as a JSON number formatted as encoding/json
+    // formats float64.
+    //
+    // NaN and infinities can not be represented in JSON and are recorded
+    // as an error.
+    func (jw *jsonWriter) appendFloat(f float64) {
+        if math.IsInf(f, 0) || math.IsNaN(f) {
+            jw.fail(fmt.Errorf(
+                "unsupported float value: %s",
+                strconv.FormatFloat(f, 'g', -1, 64)))
+            return
+        }
+
+        abs := math.Abs(f)
+        format := byte('f')
+        if abs != 0 && (abs < 1e-6 || abs >= 1e21) {
+            format = 'e'
+        }
+
+        jw.buf = strconv.AppendFloat(jw.buf, f, format, -1, 64)
+
+        if format == 'e' {
+            // Clean up e-09 to e-9.
+            n := len(jw.buf)
+            if n >= 4 && jw.buf[n-4] == 'e' &&
+                jw.buf[n-3] == '-' && jw.buf[n-2] == '0' {
+
+                jw.buf[n-2] = jw.buf[n-1]
+                jw.buf = jw.buf[:n-1]
+            }
+        }
+    }
+
+    // appendTime appends t formatted with the layout as a JSON string.
+    //
+    // The time is formatted directly into the buffer and only escaped
+    // if the formatted text contains characters which need escaping.
+    func (jw *jsonWriter) appendTime(t time.Time, layout string) {
+        jw.buf = append(jw.buf, '"')
+        start := len(jw.buf)
+        jw.buf = t.AppendFormat(jw.buf, layout)
+
+        for _, c := range jw.buf[start:] {
+            if !jsonSafe(c) {
+                formatted := string(jw.buf[start:])
+                jw.buf = jsonAppendString(jw.buf[:start-1], formatted)
+                return
+            }
+        }
+
+        jw.buf = append(jw.buf, '"')
+    }''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_date_time(
+        value_expr: str,
+        a_type: Union[mapry.Date, mapry.Datetime, mapry.Time]) -> str:
+    """
+    Generate the code to write a date or a time.
+
+    :param value_expr: Go expression of the value to be written
+    :param a_type: the mapry type of the value
+    :return: generated code
+    """
+    dt_format = mapry.go.timeformat.convert(a_type.format)
+    if not dt_format:
+        return 'jw.buf = append(jw.buf, `""`...)'
+
+    return 'jw.appendTime({}, {})'.format(
+        value_expr, mapry.go.generate.escaped_str(dt_format))
+
+
+_WRITE_ARRAY_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+slice{{ uid }} := {{ value_expr }}
+jw.buf = append(jw.buf, '[')
+for i{{ uid }} := range slice{{ uid }} {
+    if i{{ uid }} > 0 {
+        jw.buf = append(jw.buf, ',')
+    }
+    {{ item_writing|indent }}
+    jw.flushIfFull()
+}
+jw.buf = append(jw.buf, ']')
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_array(
+        value_expr: str, a_type: mapry.Array,
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to write an array.
+
+    :param value_expr: Go expression of the value to be written
+    :param a_type: the mapry type of the value
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    item_writing = _write_value(
+        value_expr="slice{uid}[i{uid}]".format(uid=uid),
+        a_type=a_type.values,
+        auto_id=auto_id)
+
+    return _WRITE_ARRAY_TPL.render(
+        uid=uid, value_expr=value_expr, item_writing=item_writing).rstrip('\n')
+
+
+_WRITE_MAP_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+map{{ uid }} := {{ value_expr }}
+keys{{ uid }} := make([]string, 0, len(map{{ uid }}))
+for k{{ uid }} := range map{{ uid }} {
+    keys{{ uid }} = append(keys{{ uid }}, k{{ uid }})
+}
+sort.Strings(keys{{ uid }})
+
+jw.buf = append(jw.buf, '{')
+for i{{ uid }}, k{{ uid }} := range keys{{ uid }} {
+    if i{{ uid }} > 0 {
+        jw.buf = append(jw.buf, ',')
+    }
+    jw.appendString(k{{ uid }})
+    jw.buf = append(jw.buf, ':')
+
+    v{{ uid }} := map{{ uid }}[k{{ uid }}]
+    {{ item_writing|indent }}
+    jw.flushIfFull()
+}
+jw.buf = append(jw.buf, '}')
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_map(
+        value_expr: str, a_type: mapry.Map,
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to write a map with the keys in sorted order.
+
+    :param value_expr: Go expression of the value to be written
+    :param a_type: the mapry type of the value
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    item_writing = _write_value(
+        value_expr="v{uid}".format(uid=uid),
+        a_type=a_type.values,
+        auto_id=auto_id)
+
+    return _WRITE_MAP_TPL.render(
+        uid=uid, value_expr=value_expr, item_writing=item_writing).rstrip('\n')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_value(
+        value_expr: str, a_type: mapry.Type,
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to write a value.
+
+    :param value_expr: Go expression of the value to be written
+    :param a_type: the mapry type of the value
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    result = ''
+
+    if isinstance(a_type, mapry.Boolean):
+        result = 'jw.buf = strconv.AppendBool(jw.buf, {})'.format(value_expr)
+
+    elif isinstance(a_type, mapry.Integer):
+        result = 'jw.buf = strconv.AppendInt(jw.buf, {}, 10)'.format(value_expr)
+
+    elif isinstance(a_type, mapry.Float):
+        result = 'jw.appendFloat({})'.format(value_expr)
+
+    elif isinstance(a_type, (mapry.String, mapry.Path)):
+        result = 'jw.appendString({})'.format(value_expr)
+
+    elif isinstance(a_type, (mapry.Date, mapry.Datetime, mapry.Time)):
+        result = _write_date_time(value_expr=value_expr, a_type=a_type)
+
+    elif isinstance(a_type, mapry.TimeZone):
+        result = 'jw.appendString({}.String())'.format(value_expr)
+
+    elif isinstance(a_type, mapry.Duration):
+        # durationToString is defined in to_jsonable.go.
+        result = 'jw.appendString(durationToString({}))'.format(value_expr)
+
+    elif isinstance(a_type, mapry.Array):
+        result = _write_array(
+            value_expr=value_expr, a_type=a_type, auto_id=auto_id)
+
+    elif isinstance(a_type, mapry.Map):
+        result = _write_map(
+            value_expr=value_expr, a_type=a_type, auto_id=auto_id)
+
+    elif isinstance(a_type, mapry.Class):
+        result = 'jw.appendString({}.ID)'.format(value_expr)
+
+    elif isinstance(a_type, mapry.Embed):
+        result = '{}WriteJSON(jw, &{})'.format(
+            mapry.naming.camel_case(a_type.name), value_expr)
+
+    else:
+        raise NotImplementedError(
+            "Unhandled writing of type: {}".format(a_type))
+
+    return result
+
+
+class _Member:
+    """Represent a member of a JSON object whose key is known in advance."""
+
+    def __init__(self, key: str, optional: bool) -> None:
+        """
+        Initialize with the given values.
+
+        :param key: JSON key of the member
+        :param optional: if set, the member is not always written
+        """
+        self.key = key
+        self.optional = optional
+        self.prefix = ''
+        self.sets_wrote = False
+
+
+def _key_literal(key: str, comma: bool) -> str:
+    """
+    Generate the Go string literal of the key encoded as in encoding/json.
+
+    :param key: JSON key of the member
+    :param comma: if set, the key is preceded by a comma
+    :return: Go string literal
+    """
+    # yapf: disable
+    encoded = (
+        json.dumps(key, ensure_ascii=False)
+        .replace('<', '\\u003c')
+        .replace('>', '\\u003e')
+        .replace('&', '\\u0026')
+        .replace('\u2028', '\\u2028')
+        .replace('\u2029', '\\u2029'))
+    # yapf: enable
+
+    return mapry.go.generate.escaped_str((',' if comma else '') + encoded + ':')
+
+
+def _set_prefixes(members: List[_Member]) -> bool:
+    """
+    Generate the code preceding each member with the key and the comma.
+
+    The commas are written unconditionally once a mandatory member has
+    been written. Before that, the variable ``wrote`` tracks whether
+    an optional member has been written.
+
+    :param members: members of the object in the order of writing
+    :return: True if the variable ``wrote`` is needed
+    """
+    # Nothing has been written yet.
+    nothing = 'nothing'
+    maybe = 'maybe'
+    surely = 'surely'
+
+    state = nothing
+    needs_wrote = False
+
+    for member in members:
+        if state == nothing:
+            member.prefix = 'jw.buf = append(jw.buf, {}...)'.format(
+                _key_literal(key=member.key, comma=False))
+
+        elif state == maybe:
+            needs_wrote = True
+            member.prefix = textwrap.dedent(
+                '''\
+                if wrote {{
+                    jw.buf = append(jw.buf, ',')
+                }}
+                jw.buf = append(jw.buf, {}...)''').format(
+                    _key_literal(key=member.key, comma=False))
+
+        elif state == surely:
+            member.prefix = 'jw.buf = append(jw.buf, {}...)'.format(
+                _key_literal(key=member.key, comma=True))
+
+        else:
+            raise AssertionError("Unhandled state: {}".format(state))
+
+        if member.optional and state != surely:
+            member.sets_wrote = True
+
+        if not member.optional:
+            state = surely
+        elif state == nothing:
+            state = maybe
+
+    if not needs_wrote:
+        for member in members:
+            member.sets_wrote = False
+
+    return needs_wrote
+
+
+_WRITE_PROPERTY_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+////
+// Write {{ a_property.name|ucamel_case }}
+////
+
+{% if a_property.optional %}
+if {{ value_expr }} != nil {
+    {{ member.prefix|indent }}
+    {{ writing|indent }}
+    {% if member.sets_wrote %}
+    wrote = true
+    {% endif %}
+}
+{% else %}
+{{ member.prefix }}
+{{ writing }}
+{% endif %}{# /if a_property.optional #}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_property(
+        value_expr: str, a_property: mapry.Property, member: _Member,
+        auto_id: mapry.go.generate.AutoID) -> str:
+    """
+    Generate the code to write a property of a composite.
+
+    :param value_expr: Go expression of the value to be written
+    :param a_property: the property definition
+    :param member: JSON member corresponding to the property
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    if a_property.optional and not mapry.go.generate.is_pointer_type(
+            a_type=a_property.type):
+        deref_expr = "(*{})".format(value_expr)
+    else:
+        deref_expr = value_expr
+
+    writing = _write_value(
+        value_expr=deref_expr, a_type=a_property.type, auto_id=auto_id)
+
+    return _WRITE_PROPERTY_TPL.render(
+        a_property=a_property,
+        value_expr=value_expr,
+        member=member,
+        writing=writing).rstrip('\n')
+
+
+_WRITE_COMPOSITE_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+// {{ composite.name|camel_case }}WriteJSON appends the JSON text of
+// the instance to jw.
+//
+// The properties are written in the order of their JSON keys.
+func {{ composite.name|camel_case }}WriteJSON(
+    jw *jsonWriter,
+    instance *{{ composite.name|ucamel_case }}) {
+    {% if needs_wrote %}
+
+    wrote := false
+    {% endif %}
+
+    jw.buf = append(jw.buf, '{')
+    {% for writing in property_writings %}
+
+    {{ writing|indent }}
+    {% endfor %}{# /for writing #}
+
+    jw.buf = append(jw.buf, '}')
+}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_composite(composite: Union[mapry.Class, mapry.Embed]) -> str:
+    """
+    Generate the function that writes a class or an embeddable structure.
+
+    :param composite: mapry definition of the class or the embeddable structure
+    :return: generated code
+    """
+    props = sorted(composite.properties.values(), key=lambda prop: prop.json)
+    members = [_Member(key=prop.json, optional=prop.optional) for prop in props]
+    needs_wrote = _set_prefixes(members=members)
+
+    auto_id = mapry.go.generate.AutoID()
+
+    # yapf: disable
+    property_writings = [
+        _write_property(
+            value_expr="instance.{}".format(
+                mapry.naming.ucamel_case(prop.name)),
+            a_property=prop,
+            member=member,
+            auto_id=auto_id)
+        for prop, member in zip(props, members)
+    ]
+    # yapf: enable
+
+    return _WRITE_COMPOSITE_TPL.render(
+        composite=composite,
+        needs_wrote=needs_wrote,
+        property_writings=property_writings)
+
+
+_WRITE_REGISTRY_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+////
+// Write instance registry of {{ cls.name|ucamel_case }}
+////
+
+if len(instance.{{ cls.plural|ucamel_case }}) > 0 {
+    {{ member.prefix|indent }}
+    jw.buf = append(jw.buf, '{')
+
+    ids := make([]string, 0, len(instance.{{ cls.plural|ucamel_case }}))
+    for id := range instance.{{ cls.plural|ucamel_case }} {
+        ids = append(ids, id)
+    }
+    sort.Strings(ids)
+    {% if parallel %}
+
+    for _, id := range ids {
+        {{ cls.name|camel_case }}Instance := instance.{{
+            cls.plural|ucamel_case }}[id]
+
+        if id != {{ cls.name|camel_case }}Instance.ID {
+            jw.fail(fmt.Errorf(
+                {{ "expected the instance of %s to have the ID %%s "
+                    "according to the registry, but got: %%s"
+                    |format(cls.name|ucamel_case)|escaped_str }},
+                id, {{ cls.name|camel_case }}Instance.ID))
+            return jw.err
+        }
+    }
+
+    // The chunks are written in memory concurrently and
+    // then passed on to the underlying writer in order.
+    chunks := parallelChunkCount(len(ids), workers)
+    chunkWriters := make([]jsonWriter, chunks)
+    forEachInParallel(chunks, workers, func(worker int, chunk int) {
+        cw := &chunkWriters[chunk]
+
+        start, end := parallelChunk(len(ids), chunks, chunk)
+        for i := start; i < end; i++ {
+            if i > 0 {
+                cw.buf = append(cw.buf, ',')
+            }
+            cw.appendString(ids[i])
+            cw.buf = append(cw.buf, ':')
+            {{ cls.name|camel_case }}WriteJSON(
+                cw, instance.{{ cls.plural|ucamel_case }}[ids[i]])
+        }
+    })
+
+    for i := range chunkWriters {
+        if chunkWriters[i].err != nil {
+            jw.fail(chunkWriters[i].err)
+            return jw.err
+        }
+
+        jw.flush()
+        if jw.err == nil {
+            _, jw.err = jw.w.Write(chunkWriters[i].buf)
+        }
+        if jw.err != nil {
+            return jw.err
+        }
+    }
+    {% else %}
+
+    for i, id := range ids {
+        {{ cls.name|camel_case }}Instance := instance.{{
+            cls.plural|ucamel_case }}[id]
+
+        if id != {{ cls.name|camel_case }}Instance.ID {
+            jw.fail(fmt.Errorf(
+                {{ "expected the instance of %s to have the ID %%s "
+                    "according to the registry, but got: %%s"
+                    |format(cls.name|ucamel_case)|escaped_str }},
+                id, {{ cls.name|camel_case }}Instance.ID))
+            return jw.err
+        }
+
+        if i > 0 {
+            jw.buf = append(jw.buf, ',')
+        }
+        jw.appendString(id)
+        jw.buf = append(jw.buf, ':')
+        {{ cls.name|camel_case }}WriteJSON(
+            jw, {{ cls.name|camel_case }}Instance)
+
+        jw.flushIfFull()
+        if jw.err != nil {
+            return jw.err
+        }
+    }
+    {% endif %}{# /if parallel #}
+
+    jw.buf = append(jw.buf, '}')
+    {% if member.sets_wrote %}
+    wrote = true
+    {% endif %}
+}''')
+
+_WRITE_GRAPH_TPL = mapry.go.jinja2_env.ENV.from_string(
+    '''\
+{% if not parallel %}
+// {{ graph.name|ucamel_case }}WriteJSON writes the instance as a JSON text
+// to w.
+//
+// The text is written in chunks from a pooled buffer without building
+// a JSONable representation first. The keys are sorted so that the text
+// equals the one given by encoding/json for {{
+    graph.name|ucamel_case }}ToJSONable.
+//
+// If an error is returned, a part of the text might have been already
+// written to w.
+//
+// {{ graph.name|ucamel_case }}WriteJSON requires:
+//  * instance != nil
+func {{ graph.name|ucamel_case }}WriteJSON(
+    w io.Writer,
+    instance *{{ graph.name|ucamel_case }}) error {
+{% else %}
+// {{ graph.name|ucamel_case }}WriteJSONParallel writes the instance as
+// a JSON text to w on a pool of at most workers goroutines.
+//
+// The instances of each registry are written concurrently in memory
+// and then passed on to w in order so that the text equals the one
+// given by {{ graph.name|ucamel_case }}WriteJSON. Mind that the text of
+// a whole registry is kept in memory.
+//
+// If an error is returned, a part of the text might have been already
+// written to w.
+//
+// {{ graph.name|ucamel_case }}WriteJSONParallel requires:
+//  * instance != nil
+//  * workers > 0
+func {{ graph.name|ucamel_case }}WriteJSONParallel(
+    w io.Writer,
+    instance *{{ graph.name|ucamel_case }},
+    workers int) error {
+{% endif %}{# /if not parallel #}
+
+    if instance == nil {
+        panic("unexpected nil instance")
+    }
+    {% if parallel %}
+
+    if workers < 1 {
+        panic("unexpected non-positive workers")
+    }
+    {% endif %}
+
+    jw := jsonWriterPool.Get().(*jsonWriter)
+    jw.w = w
+    defer func() {
+        jw.w = nil
+        jw.err = nil
+        jw.buf = jw.buf[:0]
+
+        // Do not keep the buffers grown by large values.
+        if cap(jw.buf) <= 4*jsonFlushSize {
+            jsonWriterPool.Put(jw)
+        }
+    }()
+    {% if needs_wrote %}
+
+    wrote := false
+    {% endif %}
+
+    jw.buf = append(jw.buf, '{')
+    {% for writing in member_writings %}
+
+    {{ writing|indent }}
+    {% endfor %}{# /for writing #}
+
+    jw.buf = append(jw.buf, '}')
+    jw.flush()
+
+    return jw.err
+}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_graph(graph: mapry.Graph, parallel: bool) -> str:
+    """
+    Generate the function that writes the object graph.
+
+    :param graph: mapry definition of the object graph
+    :param parallel: if set, the instances are written on a pool of goroutines
+    :return: generated code
+    """
+    # Registries and properties are written together in the order of the keys.
+    # yapf: disable
+    entries = (
+        [(mapry.naming.json_plural(cls.plural), cls)
+         for cls in graph.classes.values()] +
+        [(prop.json, prop) for prop in graph.properties.values()]
+    )  # type: List[Tuple[str, Union[mapry.Class, mapry.Property]]]
+    # yapf: enable
+
+    entries.sort(key=lambda entry: entry[0])
+
+    members = [
+        _Member(
+            key=key,
+            optional=isinstance(obj, mapry.Class)
+            or (isinstance(obj, mapry.Property) and obj.optional))
+        for key, obj in entries
+    ]
+    needs_wrote = _set_prefixes(members=members)
+
+    auto_id = mapry.go.generate.AutoID()
+
+    member_writings = []  # type: List[str]
+    for (_, obj), member in zip(entries, members):
+        if isinstance(obj, mapry.Class):
+            member_writings.append(
+                _WRITE_REGISTRY_TPL.render(
+                    cls=obj, member=member, parallel=parallel))
+        else:
+            member_writings.append(
+                _write_property(
+                    value_expr="instance.{}".format(
+                        mapry.naming.ucamel_case(obj.name)),
+                    a_property=obj,
+                    member=member,
+                    auto_id=auto_id))
+
+    return _WRITE_GRAPH_TPL.render(
+        graph=graph,
+        needs_wrote=needs_wrote,
+        member_writings=member_writings,
+        parallel=parallel).rstrip('\n')
+
+
+@ensure(lambda result: result.endswith('\n'))
+def generate(graph: mapry.Graph, go: mapry.Go) -> str:
+    """
+    Generate the source file to write an object graph as a JSON text.
+
+    The durations are formatted by the helper function generated by
+    :py:mod:`mapry.go.generate.tojsonable`.
+
+    :param graph: mapry definition of the object graph
+    :param go: Go settings
+    :return: content of the source file
+    """
+    blocks = [
+        'package {}'.format(go.package), mapry.go.generate.WARNING,
+        _imports(graph=graph),
+        _json_writer()
+    ]
+
+    nongraph_composites = []  # type: List[Union[mapry.Class, mapry.Embed]]
+    nongraph_composites.extend(graph.classes.values())
+    nongraph_composites.extend(graph.embeds.values())
+
+    for class_or_embed in nongraph_composites:
+        blocks.append(_write_composite(composite=class_or_embed))
+
+    blocks.append(_write_graph(graph=graph, parallel=False))
+
+    if graph.classes:
+        blocks.append(_write_graph(graph=graph, parallel=True))
+
+    blocks.append(mapry.go.generate.WARNING)
+
+    return mapry.indention.reindent(
+        text='\n\n'.join(blocks) + '\n', indention='\t')
@@ -4,6 +4,7 @@
 import argparse
 import collections
 import pathlib
+import py_compile
 import sys
 from typing import Optional  # pylint: disable=unused-import
 
@@ -19,13 +20,17 @@ import mapry.cpp.validation
 import mapry.go.generate
 import mapry.go.generate.fromjsonable
 import mapry.go.generate.fromjsonable_test
+import mapry.go.generate.fromjsonbytes
 import mapry.go.generate.parse
+import mapry.go.generate.synthetic_test
 import mapry.go.generate.tojsonable
 import mapry.go.generate.tojsonable_test
 import mapry.go.generate.types
+import mapry.go.generate.writejson
 import mapry.go.validation
 import mapry.parse
 import mapry.py.generate
+import mapry.py.generate.build_native
 import mapry.py.generate.fromjsonable
 import mapry.py.generate.parse
 import mapry.py.generate.tojsonable
@@ -121,10 +126,16 @@ def generate_go(schema: mapry.Schema, outdir: pathlib.Path) -> int:
             graph=graph, go=go)),
         ('from_jsonable_test.go', mapry.go.generate.fromjsonable_test.generate(
             graph=graph, go=go)),
+        ('from_json_bytes.go', mapry.go.generate.fromjsonbytes.generate(
+            graph=graph, go=go)),
         ('to_jsonable.go', mapry.go.generate.tojsonable.generate(
             graph=graph, go=go)),
         ('to_jsonable_test.go', mapry.go.generate.tojsonable_test.generate(
             graph=graph, go=go)),
+        ('write_json.go', mapry.go.generate.writejson.generate(
+            graph=graph, go=go)),
+        ('synthetic_test.go', mapry.go.generate.synthetic_test.generate(
+            graph=graph, go=go)),
     ])
     # yapf: enable
 
@@ -172,19 +183,31 @@ def generate_py(schema: mapry.Schema, outdir: pathlib.Path) -> int:
             graph=graph, py=py)),
         ('parse.py', mapry.py.generate.parse.generate(
             graph=graph, py=py)),
-        ('fromjsonable.py', mapry.py.generate.fromjsonable.generate(
-            graph=graph, py=py)),
-        ('tojsonable.py', mapry.py.generate.tojsonable.generate(
-            graph=graph, py=py)),
     ])
     # yapf: enable
 
+    filename_to_code.update(
+        mapry.py.generate.fromjsonable.generate_files(graph=graph, py=py))
+    filename_to_code.update(
+        mapry.py.generate.tojsonable.generate_files(graph=graph, py=py))
+
+    if py.compile_ready:
+        filename_to_code['build_native.py'] = (
+            mapry.py.generate.build_native.generate(graph=graph, py=py))
+
     outdir.mkdir(exist_ok=True, parents=True)
 
     for filename, code in filename_to_code.items():
         pth = outdir / filename
+        pth.parent.mkdir(exist_ok=True, parents=True)
         pth.write_text(code)
 
+    if py.split_modules:
+        # Precompile the bytecode so that the submodules need not be compiled
+        # on the first import.
+        for filename in filename_to_code:
+            py_compile.compile(str(outdir / filename), doraise=True)
+
     print('Files generated in: {}'.format(outdir))
 
     return 0
@@ -233,6 +256,11 @@ def run(prog: str) -> int:
         "--outdir",
         help="path to the directory where the generated files should be stored",
         required=True)
+    parser_go.add_argument(
+        "--compile_ready",
+        help="if set, generate the code ready for the compilation with mypyc "
+        "and the script to compile it (overrides compile_ready in the schema)",
+        action='store_true')
 
     args = parser.parse_args()
 
@@ -269,6 +297,9 @@ def run(prog: str) -> int:
     elif command == 'py':
         assert outdir is not None, "Expected outdir to be specified"
         assert schema is not None, "Expected schema to be loaded"
+        if args.compile_ready and schema.py is not None:
+            schema.py.compile_ready = True
+
         return generate_py(schema=schema, outdir=outdir)
     else:
         raise NotImplementedError('command: {}'.format(command))
@@ -27,6 +27,9 @@ def _cpp_from_mapping(mapping: Mapping[str, Any]) -> mapry.Cpp:
 
     cpp.indention = mapping['indention'] if 'indention' in mapping else ' ' * 2
 
+    cpp.trusted_input = (
+        mapping['trusted_input'] if 'trusted_input' in mapping else False)
+
     return cpp
 
 
@@ -40,6 +43,9 @@ def _go_from_mapping(mapping: Mapping[str, Any]) -> mapry.Go:
     go = mapry.Go()  # pylint: disable=invalid-name
     go.package = mapping['package']
 
+    go.trusted_input = (
+        mapping['trusted_input'] if 'trusted_input' in mapping else False)
+
     return go
 
 
@@ -57,6 +63,42 @@ def _py_from_mapping(mapping: Mapping[str, Any]) -> mapry.Py:
 
     py.indention = mapping['indention'] if 'indention' in mapping else ' ' * 4
 
+    py.slots = mapping['slots'] if 'slots' in mapping else False
+
+    py.trusted_input = (
+        mapping['trusted_input'] if 'trusted_input' in mapping else False)
+
+    py.numeric_array_as = (
+        mapping['numeric_array_as']
+        if 'numeric_array_as' in mapping else 'list')
+
+    py.lazy_decoding = (
+        mapping['lazy_decoding'] if 'lazy_decoding' in mapping else False)
+
+    py.compact_pickling = (
+        mapping['compact_pickling'] if 'compact_pickling' in mapping else False)
+
+    py.track_changes = (
+        mapping['track_changes'] if 'track_changes' in mapping else False)
+
+    py.split_modules = (
+        mapping['split_modules'] if 'split_modules' in mapping else False)
+
+    py.compile_ready = (
+        mapping['compile_ready'] if 'compile_ready' in mapping else False)
+
+    py.lazy_registries = (
+        mapping['lazy_registries'] if 'lazy_registries' in mapping else False)
+
+    py.coroutines = (
+        mapping['coroutines'] if 'coroutines' in mapping else False)
+
+    py.parallel_parsing = (
+        mapping['parallel_parsing'] if 'parallel_parsing' in mapping else False)
+
+    py.iter_registries = (
+        mapping['iter_registries'] if 'iter_registries' in mapping else False)
+
     return py
 
 
@@ -1,7 +1,7 @@
 """Generate the Python code to parse and serialize a mapry object graph."""
 
 import re
-from typing import List, Mapping
+from typing import List, Mapping, Set, Union  # pylint: disable=unused-import
 
 import icontract
 from icontract import ensure, require
@@ -29,6 +29,113 @@ def comment(text: str) -> str:
     return '\n'.join(comment_lines)
 
 
+def is_numpy_array(a_type: mapry.Type, py: mapry.Py) -> bool:
+    """
+    Check whether the type is represented as a ``numpy.ndarray``.
+
+    :param a_type: in mapry
+    :param py: Python settings
+    :return: True if the type is an array of numbers represented with numpy
+    """
+    return (
+        py.numeric_array_as == 'numpy' and isinstance(a_type, mapry.Array)
+        and isinstance(a_type.values, (mapry.Integer, mapry.Float)))
+
+
+def numpy_dtype(a_type: mapry.Array) -> str:
+    """
+    Generate the numpy data type of the items of a numeric array.
+
+    :param a_type: mapry definition of the array of numbers
+    :return: numpy data type as a string
+    """
+    if isinstance(a_type.values, mapry.Integer):
+        return 'numpy.int64'
+
+    elif isinstance(a_type.values, mapry.Float):
+        return 'numpy.float64'
+
+    else:
+        raise NotImplementedError(
+            "Unhandled numpy data type of the items: {}".format(
+                type(a_type.values)))
+
+
+def is_lazily_decoded(prop: mapry.Property, py: mapry.Py) -> bool:
+    """
+    Check whether the property is decoded on the first access.
+
+    Only the properties of classes and embeddable structures are decoded
+    lazily. Moreover, only the types which can be validated without decoding
+    them qualify, namely the paths represented as ``pathlib.Path`` and
+    the time zones represented as ``pytz.timezone``.
+
+    :param prop: mapry definition of the property
+    :param py: Python settings
+    :return: True if the property is stored as a string until accessed
+    """
+    if not py.lazy_decoding or isinstance(prop.composite, mapry.Graph):
+        return False
+
+    a_type = prop.type
+    return ((isinstance(a_type, mapry.Path) and py.path_as == 'pathlib.Path')
+            or (
+                isinstance(a_type, mapry.TimeZone)
+                and py.timezone_as == 'pytz.timezone'))
+
+
+def stored_attribute(prop: mapry.Property, py: mapry.Py) -> str:
+    """
+    Determine the name of the instance attribute storing the property.
+
+    :param prop: mapry definition of the property
+    :param py: Python settings
+    :return: name of the attribute
+    """
+    attribute = mapry.py.naming.as_attribute(identifier=prop.name)
+
+    if is_lazily_decoded(prop=prop, py=py):
+        # The descriptor takes the name of the property.
+        return '_' + attribute
+
+    return attribute
+
+
+def lazily_decoded_types(graph: mapry.Graph, py: mapry.Py) -> Set[type]:
+    """
+    Collect the types of the properties of classes and embeds decoded lazily.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: mapry types (as Python classes) decoded on the first access
+    """
+    result = set()  # type: Set[type]
+
+    composites = []  # type: List[Union[mapry.Class, mapry.Embed]]
+    composites.extend(graph.classes.values())
+    composites.extend(graph.embeds.values())
+
+    for composite in composites:
+        for prop in composite.properties.values():
+            if is_lazily_decoded(prop=prop, py=py):
+                result.add(type(prop.type))
+
+    return result
+
+
+def needs_numpy(graph: mapry.Graph, py: mapry.Py) -> bool:
+    """
+    Check whether any type of the graph is represented with numpy.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: True if numpy needs to be imported
+    """
+    return any(
+        is_numpy_array(a_type=a_type, py=py)
+        for a_type, _ in mapry.iterate_over_types(graph=graph))
+
+
 def type_repr(a_type: mapry.Type, py: mapry.Py) -> str:
     """
     Generate the Python type representation of the given mapry type.
@@ -84,6 +191,9 @@ def type_repr(a_type: mapry.Type, py: mapry.Py) -> str:
         return "datetime.timedelta"
 
     elif isinstance(a_type, mapry.Array):
+        if is_numpy_array(a_type=a_type, py=py):
+            return "numpy.typing.NDArray[{}]".format(numpy_dtype(a_type=a_type))
+
         return "typing.List[{}]".format(type_repr(a_type=a_type.values, py=py))
 
     elif isinstance(a_type, mapry.Map):
@@ -0,0 +1,81 @@
+"""Generate the script that compiles the generated modules with mypyc."""
+
+from icontract import ensure
+
+import mapry
+import mapry.py.generate
+import mapry.py.jinja2_env
+import mapry.py.naming
+
+# Names of the generated modules compiled to native extensions
+#
+# The module defining the classes is not compiled so that its classes
+# remain regular Python classes. Placeholders with the attributes set to None,
+# pickling and subclassing of the instances thus work the same as before.
+COMPILED_MODULES = ['parse', 'fromjsonable', 'tojsonable']
+
+_BUILD_NATIVE_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+import os
+import pathlib
+import sys
+import typing
+
+import mypyc.build
+import setuptools  # type: ignore
+
+
+def main() -> int:
+    """
+    executes the main routine.
+
+    The modules are compiled in place next to their sources. The command-line
+    arguments are passed on to ``setup.py build_ext``.
+
+    :return: exit code
+    """
+    # Directory containing the top-level package of {{ py.module_name }}
+    root = pathlib.Path(os.path.realpath(__file__)).parents[{{
+        module_parts|length }}]
+
+    paths = [
+        {% for module in compiled_modules %}
+        {{ (module_parts + [module + '.py'])|join('/')|repr }},
+        {% endfor %}{# /for module #}
+    ]  # type: typing.List[str]
+
+    os.chdir(str(root))
+
+    setuptools.setup(
+        name={{ py.module_name|repr }},
+        ext_modules=mypyc.build.mypycify(paths),
+        script_args=['build_ext', '--inplace'] + sys.argv[1:])
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())''')
+
+
+@ensure(lambda result: result.endswith('\n'))
+def generate(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the script to compile the modules to native extensions.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: content of the source file
+    """
+    blocks = [
+        mapry.py.generate.WARNING,
+        mapry.py.generate.docstring(
+            "compiles {} to native extensions with mypyc.".format(
+                mapry.py.naming.as_composite(identifier=graph.name))),
+        _BUILD_NATIVE_TPL.render(
+            py=py,
+            module_parts=py.module_name.split('.'),
+            compiled_modules=COMPILED_MODULES), mapry.py.generate.WARNING
+    ]
+
+    return '\n\n\n'.join(blocks) + '\n'
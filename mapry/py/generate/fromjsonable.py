@@ -1,14 +1,19 @@
 """Generate the code that parses the object graph from a JSONable structure."""
+import collections
+import datetime
+import re
 import textwrap
 from typing import (  # pylint: disable=unused-import
-    Dict, List, Mapping, MutableMapping, Set, Union)
+    Any, Dict, List, Mapping, MutableMapping, Optional, Set, Tuple, Union)
 
 from icontract import ensure
 
 import mapry
 import mapry.py.generate
+import mapry.py.generate.submodules
 import mapry.py.jinja2_env
 import mapry.py.naming
+import mapry.strftime
 
 
 @ensure(lambda result: not result.endswith('\n'))
@@ -47,6 +52,9 @@ def _imports(graph: mapry.Graph, py: mapry.Py) -> str:
             raise NotImplementedError(
                 'Unhandled timezone_as: {}'.format(py.timezone_as))
 
+    if mapry.py.generate.needs_numpy(graph=graph, py=py):
+        third_party_block.update(('import numpy', 'import numpy.typing'))
+
     # yapf: disable
     if any(mapry.needs_type(a_type=graph, query=query)
            for query in
@@ -62,6 +70,13 @@ def _imports(graph: mapry.Graph, py: mapry.Py) -> str:
             'import collections'
         )  # needed for the initialization of class registries
 
+        if py.coroutines:
+            stdlib_block.add('import asyncio')
+
+        if py.parallel_parsing:
+            stdlib_block.update(
+                ('import concurrent.futures', 'import io', 'import pickle'))
+
     ##
     # Needs regex?
     ##
@@ -72,7 +87,8 @@ def _imports(graph: mapry.Graph, py: mapry.Py) -> str:
             import_re = True
             break
 
-        if isinstance(a_type, mapry.Duration):
+        if (isinstance(a_type, (mapry.Date, mapry.Datetime, mapry.Time))
+                and _fixed_width_function(a_type=a_type) is not None):
             import_re = True
             break
 
@@ -106,6 +122,41 @@ def _imports(graph: mapry.Graph, py: mapry.Py) -> str:
     return '\n\n'.join(block_strs)
 
 
+@ensure(lambda result: not result.endswith('\n'))
+def _is_pytz_timezone() -> str:
+    """
+    Generate the code that checks the time zones without loading them.
+
+    :return: generated code
+    """
+    return textwrap.dedent(
+        '''\
+        _PYTZ_TIMEZONES_LOWER = frozenset(
+            zone.lower() for zone in pytz.all_timezones)
+
+
+        def _is_pytz_timezone(text: str) -> bool:
+            """
+            checks whether ``pytz.timezone`` accepts the text.
+
+            The time zone is not loaded so that the check is cheap. The names
+            are matched in the same way as ``pytz.timezone`` matches them.
+
+            :param text: name of the time zone
+            :return: True if the time zone is known
+            """
+            if text.upper() == 'UTC':
+                return True
+
+            try:
+                text.encode('ascii')
+            except UnicodeEncodeError:
+                return False
+
+            unmunged = text.replace('_plus_', '+').replace('_minus_', '-')
+            return unmunged.lower() in _PYTZ_TIMEZONES_LOWER''')
+
+
 @ensure(lambda result: not result.endswith('\n'))
 def _duration_from_string() -> str:
     """
@@ -115,17 +166,90 @@ def _duration_from_string() -> str:
     """
     return textwrap.dedent(
         '''\
-    _DURATION_RE = re.compile(
-        r'^(?P<sign>\\+|-)?P'
-        r'((?P<years>(0|[1-9][0-9]*)(\.[0-9]+)?)Y)?'
-        r'((?P<months>(0|[1-9][0-9]*)(\.[0-9]+)?)M)?'
-        r'((?P<weeks>(0|[1-9][0-9]*)(\.[0-9]+)?)W)?'
-        r'((?P<days>(0|[1-9][0-9]*)(\.[0-9]+)?)D)?'
-        r'(T'
-        r'((?P<hours>(0|[1-9][0-9]*)(\.[0-9]+)?)H)?'
-        r'((?P<minutes>(0|[1-9][0-9]*)(\.[0-9]+)?)M)?'
-        r'(((?P<seconds>0|[1-9][0-9]*)(\.(?P<fraction>[0-9]+))?)S)?'
-        r')?$')
+    def _scan_duration(text: str) -> typing.Optional[typing.List[str]]:
+        """
+        scans the duration in ISO 8601 format in a single pass.
+
+        :param text: string to be scanned
+        :return:
+            sign, years, months, weeks, days, hours, minutes, seconds and
+            fraction of seconds as strings (empty if not specified),
+            or None if the text does not conform to the format
+
+        >>> _scan_duration('-P1.5YT2M3.04S')
+        ['-', '1.5', '', '', '', '', '2', '3', '04']
+
+        >>> _scan_duration('P01D') is None
+        True
+
+        """
+        # Accept a trailing new line for backward compatibility: the durations
+        # used to be matched by a regular expression ending in ``$``.
+        end = len(text) - 1 if text.endswith('\\n') else len(text)
+
+        groups = ['', '', '', '', '', '', '', '', '']
+
+        position = 0
+        if position < end and text[position] in '+-':
+            groups[0] = text[position]
+            position += 1
+
+        if position == end or text[position] != 'P':
+            return None
+        position += 1
+
+        # Designators of the date part are followed by
+        # the designators of the time part.
+        designators = 'YMWD'
+        offset = 1
+        next_designator = 0
+
+        while position < end:
+            if text[position] == 'T' and offset == 1:
+                designators = 'HMS'
+                offset = 5
+                next_designator = 0
+                position += 1
+                continue
+
+            start = position
+
+            if text[position] == '0':
+                position += 1
+            elif '1' <= text[position] <= '9':
+                position += 1
+                while position < end and '0' <= text[position] <= '9':
+                    position += 1
+            else:
+                return None
+
+            integer_end = position
+
+            if position < end and text[position] == '.':
+                position += 1
+                while position < end and '0' <= text[position] <= '9':
+                    position += 1
+
+                if position == integer_end + 1:
+                    return None
+
+            if position == end:
+                return None
+
+            designator = designators.find(text[position], next_designator)
+            if designator == -1:
+                return None
+
+            if offset + designator == 7:
+                groups[7] = text[start:integer_end]
+                groups[8] = text[integer_end + 1:position]
+            else:
+                groups[offset + designator] = text[start:position]
+
+            next_designator = designator + 1
+            position += 1
+
+        return groups
 
 
     def _duration_from_string(text: str) -> datetime.timedelta:
@@ -180,41 +304,29 @@ def _duration_from_string() -> str:
         datetime.timedelta(-1)
 
         """
-        match = _DURATION_RE.match(text)
+        groups = _scan_duration(text)
 
-        if not match:
+        if groups is None:
             raise ValueError(
                 'Failed to match the duration: {!r}'.format(
                     text))
 
-        sign_grp = match.group('sign')
+        (sign_grp, years_grp, months_grp, weeks_grp, days_grp, hours_grp,
+         minutes_grp, seconds_grp, fraction_grp) = groups
+
         if not sign_grp or sign_grp == '+':
             sign = 1
         else:
             sign = -1
 
-        years_grp = match.group('years')
         years = float(years_grp) if years_grp else 0.0
-
-        months_grp = match.group('months')
         months = float(months_grp) if months_grp else 0.0
-
-        weeks_grp = match.group('weeks')
         weeks = float(weeks_grp) if weeks_grp else 0.0
-
-        days_grp = match.group('days')
         days = float(days_grp) if days_grp else 0.0
-
-        hours_grp = match.group('hours')
         hours = float(hours_grp) if hours_grp else 0.0
-
-        minutes_grp = match.group('minutes')
         minutes = float(minutes_grp) if minutes_grp else 0.0
-
-        seconds_grp = match.group('seconds')
         seconds = int(seconds_grp) if seconds_grp else 0
 
-        fraction_grp = match.group('fraction')
         if not fraction_grp:
             microseconds = 0
 
@@ -245,6 +357,207 @@ def _duration_from_string() -> str:
                     text)) from err''')
 
 
+def _fixed_width_kind(
+        a_type: Union[mapry.Date, mapry.Datetime, mapry.Time]) -> str:
+    """
+    Determine the kind of the date/time value used in the generated identifiers.
+
+    :param a_type: mapry definition of the date/time type
+    :return: kind of the value
+    """
+    if isinstance(a_type, mapry.Date):
+        return 'date'
+
+    if isinstance(a_type, mapry.Datetime):
+        return 'datetime'
+
+    if isinstance(a_type, mapry.Time):
+        return 'time'
+
+    raise NotImplementedError("Unhandled date/time type: {}".format(a_type))
+
+
+def _fixed_width_function(
+        a_type: Union[mapry.Date, mapry.Datetime, mapry.Time]) -> Optional[str]:
+    """
+    Determine the name of the function parsing the date/time at fixed offsets.
+
+    :param a_type: mapry definition of the date/time type
+    :return: name of the function, or None if the format can not be compiled
+    """
+    fixed_width_format = mapry.strftime.fixed_width_format(format=a_type.format)
+
+    if fixed_width_format is None:
+        return None
+
+    return '_{}_from_string_{}'.format(
+        _fixed_width_kind(a_type=a_type), fixed_width_format.identifier)
+
+
+_FIXED_WIDTH_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{{ regex_name }} = re.compile(
+    {{ pattern_literal }})
+
+
+def {{ function_name }}(text: str) -> {{ py_type }}:
+{% set doctext %}
+parses the {{ kind }} from the string in the format {{ format|repr }}.
+
+The zero-padded strings are scanned at fixed offsets. All the other strings
+are parsed with ``datetime.datetime.strptime``.
+
+:param text: string to be parsed
+:return: {{ kind }}
+:raise: ValueError if the string could not be parsed
+
+>>> {{ function_name }}({{ example|repr }})
+{{ example_result }}
+{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    match = {{ regex_name }}.match(text)
+    if match is not None:
+        try:
+            return {{ py_type }}(
+                {% for arg in arguments %}
+                {{ arg }}{{ ')' if loop.last else ',' }}
+                {% endfor %}
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, {{ format|repr }}){{ suffix }}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _fixed_width_parser(
+        a_type: Union[mapry.Date, mapry.Datetime, mapry.Time],
+        fixed_width_format: mapry.strftime.FixedWidthFormat) -> str:
+    """
+    Generate the code to parse the date/time at fixed offsets.
+
+    :param a_type: mapry definition of the date/time type
+    :param fixed_width_format: compiled format of the date/time
+    :return: generated code
+    """
+    kind = _fixed_width_kind(a_type=a_type)
+    function_name = _fixed_width_function(a_type=a_type)
+    assert function_name is not None
+
+    regex_name = '_{}_{}_RE'.format(kind.upper(), fixed_width_format.identifier)
+
+    ##
+    # Compose the pattern
+    ##
+
+    # yapf: disable
+    elements = sorted(
+        [(field.start, '([0-9]{{{}}})'.format(field.end - field.start))
+         for field in fixed_width_format.fields] +
+        [(literal.start, re.escape(literal.text))
+         for literal in fixed_width_format.literals])
+    # yapf: enable
+
+    pattern = ''.join(element for _, element in elements) + r'\Z'
+
+    if "'" in pattern:
+        pattern_literal = repr(pattern)
+    else:
+        pattern_literal = "r'{}'".format(pattern)
+
+    ##
+    # Map the groups to the constructor arguments
+    ##
+
+    group_of = {
+        field.directive: i + 1
+        for i, field in enumerate(fixed_width_format.fields)
+    }
+
+    defaults = collections.OrderedDict([('%Y', '1900'), ('%m', '1'),
+                                        ('%d', '1'), ('%H', '0'), ('%M', '0'),
+                                        ('%S', '0')])
+
+    if kind == 'date':
+        directives = ['%Y', '%m', '%d']
+        py_type = 'datetime.date'
+        suffix = '.date()'
+    elif kind == 'datetime':
+        directives = ['%Y', '%m', '%d', '%H', '%M', '%S']
+        py_type = 'datetime.datetime'
+        suffix = ''
+    elif kind == 'time':
+        directives = ['%H', '%M', '%S']
+        py_type = 'datetime.time'
+        suffix = '.time()'
+    else:
+        raise NotImplementedError("Unhandled kind: {}".format(kind))
+
+    arguments = []  # type: List[str]
+    for directive in directives:
+        if directive in group_of:
+            arguments.append('int(match.group({}))'.format(group_of[directive]))
+        else:
+            arguments.append(defaults[directive])
+
+    ##
+    # Compose the example for the doctest
+    ##
+
+    example = datetime.datetime(2016, 7, 3, 12, 34,
+                                56).strftime(fixed_width_format.format)
+
+    example_result = datetime.datetime.strptime(
+        example, fixed_width_format.format)  # type: Any
+    if kind == 'date':
+        example_result = example_result.date()
+    elif kind == 'time':
+        example_result = example_result.time()
+
+    return _FIXED_WIDTH_TPL.render(
+        regex_name=regex_name,
+        pattern_literal=pattern_literal,
+        function_name=function_name,
+        py_type=py_type,
+        kind=kind,
+        format=fixed_width_format.format,
+        example=example,
+        example_result=repr(example_result),
+        arguments=arguments,
+        suffix=suffix)
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _fixed_width_parsers(graph: mapry.Graph) -> str:
+    """
+    Generate the code to parse the dates/times whose formats have fixed offsets.
+
+    :param graph: mapry definition of the object graph
+    :return: generated code, empty if no format can be compiled
+    """
+    blocks = []  # type: List[str]
+    function_names = set()  # type: Set[str]
+
+    for a_type, _ in mapry.iterate_over_types(graph=graph):
+        if not isinstance(a_type, (mapry.Date, mapry.Datetime, mapry.Time)):
+            continue
+
+        function_name = _fixed_width_function(a_type=a_type)
+        if function_name is None or function_name in function_names:
+            continue
+
+        function_names.add(function_name)
+
+        fixed_width_format = mapry.strftime.fixed_width_format(
+            format=a_type.format)
+        assert fixed_width_format is not None
+
+        blocks.append(
+            _fixed_width_parser(
+                a_type=a_type, fixed_width_format=fixed_width_format))
+
+    return '\n\n\n'.join(blocks)
+
+
 _PARSE_BOOLEAN_TPL = mapry.py.jinja2_env.ENV.from_string(
     '''\
 {# Assume `errors` is defined to collect errors. #}
@@ -258,8 +571,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, bool):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a bool, but got: {}".format(
             type({{ value }})))
 else:
@@ -303,8 +615,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}{# /value_expr|is_variable #}
 if not isinstance({{ value }}, int):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected an integer, but got: {}".format(
             type({{ value }})))
 else:
@@ -316,8 +627,7 @@ else:
     {% set op = ">" if a_type.exclusive_minimum else ">="  %}
     if not ({{ value }} {{ op }} {{ a_type.minimum }}):
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected %s %d, but got: {}"|
                 format(op, a_type.minimum)|repr }}.format(
                 {{ value }}))
@@ -329,8 +639,7 @@ else:
         'elif' if get_cond_before else 'if'
     }} not ({{ value }} {{ op }} {{ a_type.maximum }}):
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected %s %d, but got: {}"|
                 format(op, a_type.maximum)|repr }}.format(
                 {{ value }}))
@@ -381,8 +690,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, (int, float)):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         'Expected a number, but got: {}'.format(
             type({{ value }})))
 else:
@@ -394,8 +702,7 @@ else:
     {% set op = ">" if a_type.exclusive_minimum else ">="  %}
     if not ({{ value }} {{ op }} {{ a_type.minimum }}):
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected %s %d, but got: {}"|
                 format(op, a_type.minimum)|repr }}.format(
                 {{ value }}))
@@ -406,8 +713,7 @@ else:
     {{ 'elif' if get_cond_before else 'if'
         }} not ({{ value }} {{ op }} {{ a_type.maximum }}):
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected %s %d, but got: {}"|
                 format(op, a_type.maximum)|repr }}.format(
                 {{ value }}))
@@ -457,8 +763,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a string, but got: {}".format(
             type({{ value }})))
 else:
@@ -469,8 +774,7 @@ else:
             r'{{ a_type.pattern.pattern }}',
             {{ value }}):
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected to match %s, but got: {}"|
                 format(a_type.pattern.pattern)|repr }}.format(
                 {{ value }}))
@@ -519,8 +823,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a string, but got: {}".format(
             type({{ value }})))
 else:
@@ -543,8 +846,7 @@ else:
             r'{{ a_type.pattern.pattern }}',
             {{ value }}):
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected to match %s, but got: {}"|
                 format(a_type.pattern.pattern)|repr }}.format(
                 {{ value }}))
@@ -596,20 +898,23 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a string, but got: {}".format(
             type({{ value }})))
 else:
     try:
+        {% if fixed_width_function %}
+        {{ target_expr }} = {{ fixed_width_function }}(
+            {{ value }})
+        {% else %}
         {{ target_expr }} = datetime.datetime.strptime(
             {{ value }},
             {{ a_type.format|repr }}
         ).date()
+        {% endif %}{# /if fixed_width_function #}
     except ValueError:
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected to strptime %s, but got: {}"|
                 format(a_type.format)|repr }}.format(
                 {{ value }}))
@@ -639,7 +944,8 @@ def _parse_date(
         value_expr=value_expr,
         ref_parts=ref_parts,
         target_expr=target_expr,
-        a_type=a_type).rstrip("\n")
+        a_type=a_type,
+        fixed_width_function=_fixed_width_function(a_type=a_type)).rstrip("\n")
 
 
 _PARSE_DATE_TIME_TPL = mapry.py.jinja2_env.ENV.from_string(
@@ -655,19 +961,22 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a string, but got: {}".format(
             type({{ value }})))
 else:
     try:
+        {% if fixed_width_function %}
+        {{ target_expr }} = {{ fixed_width_function }}(
+            {{ value }})
+        {% else %}
         {{ target_expr }} = datetime.datetime.strptime(
             {{ value }},
             {{ a_type.format|repr }})
+        {% endif %}{# /if fixed_width_function #}
     except ValueError:
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected to strptime %s, but got: {}"|
                 format(a_type.format)|repr }}.format(
                 {{ value }}))
@@ -697,7 +1006,8 @@ def _parse_date_time(
         value_expr=value_expr,
         ref_parts=ref_parts,
         target_expr=target_expr,
-        a_type=a_type).rstrip("\n")
+        a_type=a_type,
+        fixed_width_function=_fixed_width_function(a_type=a_type)).rstrip("\n")
 
 
 _PARSE_TIME_TPL = mapry.py.jinja2_env.ENV.from_string(
@@ -713,20 +1023,23 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a string, but got: {}".format(
             type({{ value }})))
 else:
     try:
+        {% if fixed_width_function %}
+        {{ target_expr }} = {{ fixed_width_function }}(
+            {{ value }})
+        {% else %}
         {{ target_expr }} = datetime.datetime.strptime(
             {{ value }},
             {{ a_type.format|repr }}
         ).time()
+        {% endif %}{# /if fixed_width_function #}
     except ValueError:
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Expected to strptime %s, but got: {}"|
                 format(a_type.format)|repr }}.format(
                 {{ value }}))
@@ -756,7 +1069,8 @@ def _parse_time(
         value_expr=value_expr,
         ref_parts=ref_parts,
         target_expr=target_expr,
-        a_type=a_type).rstrip("\n")
+        a_type=a_type,
+        fixed_width_function=_fixed_width_function(a_type=a_type)).rstrip("\n")
 
 
 _PARSE_TIME_ZONE_AS_STR_TPL = mapry.py.jinja2_env.ENV.from_string(
@@ -772,8 +1086,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a string, but got: {}".format(
             type({{ value }})))
 else:
@@ -792,8 +1105,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a string, but got: {}".format(
             type({{ value }})))
 else:
@@ -802,8 +1114,7 @@ else:
             {{ value }})
     except pytz.exceptions.UnknownTimeZoneError:
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             "Expected a valid IANA time zone, but got: {}".format(
                 {{ value }}))
 ''')
@@ -862,8 +1173,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a string, but got: {}".format(
             type({{ value }})))
 else:
@@ -872,8 +1182,7 @@ else:
             {{ value }})
     except (ValueError, OverflowError) as err:
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             str(err))
 ''')
 
@@ -937,15 +1246,13 @@ for i_{{ uid }}, item_{{ uid }} in enumerate(
 {% endset %}
 if not isinstance({{ value}}, list):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a list, but got: {}".format(
             type({{ value }})))
 {% if minimum_size is not none %}
 elif len({{ value }}) < {{ minimum_size }}:
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a list of minimum size {{
             minimum_size }}, but got size: {}".format(
             len({{ value }})))
@@ -953,8 +1260,7 @@ elif len({{ value }}) < {{ minimum_size }}:
 {% if maximum_size is not none %}
 elif len({{ value }}) > {{ maximum_size }}:
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a list of maximum size {{
             maximum_size }}, but got size: {}".format(
             len({{ value }})))
@@ -963,6 +1269,204 @@ else:
     {{ set_target|indent }}
 ''')
 
+_PARSE_NUMPY_ARRAY_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+{% if value_expr|is_variable %}{## set value expression ##}
+{# Short-circuit value as value expression if it is a variable so that
+we don't end up with an unnecessary variable1 = variable2 statement.#}
+{% set value = value_expr %}
+{% else %}
+{% set value = "value_%s"|format(uid) %}
+value_{{ uid }} = {{ value_expr }}
+{% endif %}
+{% set item_ref_parts = ref_parts + ["i_%s"|format(uid)] %}
+{% set min_op = ">" if a_type.values.exclusive_minimum else ">=" %}
+{% set max_op = "<" if a_type.values.exclusive_maximum else "<=" %}
+{% set set_target %}{## set target block ##}
+target_{{ uid }} = (
+    None
+)  # type: typing.Optional[{{ array_py_type }}]
+
+# Convert all the items at once if they are all of the expected types.
+if set(map(type, {{ value }})) <= {{ item_types }}:
+    {% if is_integer %}
+    try:
+        target_{{ uid }} = numpy.array({{ value }}, dtype={{ dtype }})
+    except OverflowError:
+        pass
+    {% else %}
+    target_{{ uid }} = numpy.array({{ value }}, dtype={{ dtype }})
+    {% endif %}{# /if is_integer #}
+
+if target_{{ uid }} is not None:
+    {% if a_type.values.minimum is not none or
+        a_type.values.maximum is not none %}
+    # Check the constraints on all the items at once and
+    # report only the items violating them one by one.
+    for i_{{ uid }} in numpy.flatnonzero(
+            {{ invalid_mask }}).tolist():
+        item_{{ uid }} = {{ value }}[i_{{ uid }}]
+        {% if a_type.values.minimum is not none %}
+        if not (item_{{ uid }} {{ min_op }} {{ a_type.values.minimum }}):
+            errors.add(
+                ({{ item_ref_parts|join(', ') }}),
+                {{ "Expected %s %d, but got: {}"|
+                    format(min_op, a_type.values.minimum)|repr }}.format(
+                    item_{{ uid }}))
+        {% endif %}{# /if a_type.values.minimum is not none #}
+        {% if a_type.values.maximum is not none %}
+        if not (item_{{ uid }} {{ max_op }} {{ a_type.values.maximum }}):
+            errors.add(
+                ({{ item_ref_parts|join(', ') }}),
+                {{ "Expected %s %d, but got: {}"|
+                    format(max_op, a_type.values.maximum)|repr }}.format(
+                    item_{{ uid }}))
+        {% endif %}{# /if a_type.values.maximum is not none #}
+
+        if errors.full():
+            break
+
+    {% endif %}{# /if a_type.values.minimum ... #}
+    {{ target_expr }} = target_{{ uid }}
+else:
+    # Parse the items one by one to report the errors.
+    items_{{ uid }} = []  # type: typing.List[{{ item_py_type }}]
+    for i_{{ uid }}, item_{{ uid }} in enumerate(
+            {{ value }}):
+        target_item_{{ uid }} = (
+            None
+        )  # type: typing.Optional[{{ item_py_type }}]
+        {{ item_parsing|indent|indent }}
+
+        if target_item_{{ uid }} is not None:
+            items_{{ uid }}.append(
+                target_item_{{ uid }})
+
+        if errors.full():
+            break
+
+    if len(items_{{ uid }}) == len({{ value }}):
+        {% if is_integer %}
+        try:
+            {{ target_expr }} = numpy.array(
+                items_{{ uid }}, dtype={{ dtype }})
+        except OverflowError:
+            errors.add(
+                ({{ ref_parts|join(', ') }}),
+                "Expected all the integers to fit into 64 bits, "
+                "but got an overflow")
+        {% else %}
+        {{ target_expr }} = numpy.array(
+            items_{{ uid }}, dtype={{ dtype }})
+        {% endif %}{# /if is_integer #}
+{% endset %}
+if not isinstance({{ value}}, list):
+    errors.add(
+        ({{ ref_parts|join(', ') }}),
+        "Expected a list, but got: {}".format(
+            type({{ value }})))
+{% if a_type.minimum_size is not none %}
+elif len({{ value }}) < {{ a_type.minimum_size }}:
+    errors.add(
+        ({{ ref_parts|join(', ') }}),
+        "Expected a list of minimum size {{
+            a_type.minimum_size }}, but got size: {}".format(
+            len({{ value }})))
+{% endif %}{# /if a_type.minimum_size is not none #}
+{% if a_type.maximum_size is not none %}
+elif len({{ value }}) > {{ a_type.maximum_size }}:
+    errors.add(
+        ({{ ref_parts|join(', ') }}),
+        "Expected a list of maximum size {{
+            a_type.maximum_size }}, but got size: {}".format(
+            len({{ value }})))
+{% endif %}{# /if a_type.maximum_size is not none #}
+else:
+    {{ set_target|indent }}
+''')
+
+
+@ensure(lambda result: result is None or not result.endswith('\n'))
+def _numpy_invalid_mask(
+        array_expr: str,
+        a_type: Union[mapry.Integer, mapry.Float]) -> Optional[str]:
+    """
+    Generate the expression of the mask of the items violating the constraints.
+
+    :param array_expr: Python expression of the numpy array
+    :param a_type: mapry definition of the item type
+    :return: generated expression, or None if there are no constraints
+    """
+    conditions = []  # type: List[str]
+    if a_type.minimum is not None:
+        conditions.append(
+            '~({} {} {})'.format(
+                array_expr, '>' if a_type.exclusive_minimum else '>=',
+                a_type.minimum))
+
+    if a_type.maximum is not None:
+        conditions.append(
+            '~({} {} {})'.format(
+                array_expr, '<' if a_type.exclusive_maximum else '<=',
+                a_type.maximum))
+
+    if not conditions:
+        return None
+
+    return ' | '.join(conditions)
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_numpy_array(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: mapry.Array, registry_exprs: Mapping[mapry.Class, str],
+        auto_id: mapry.py.generate.AutoID, py: mapry.Py) -> str:
+    """
+    Generate the code to parse an array of numbers as a numpy array.
+
+    The code parses the JSONable ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Python expression of the JSONable value
+    :param target_expr: Python expression of where to store the parsed value
+    :param ref_parts: Python expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param registry_exprs:
+        map class to Python expression of the registry of the class instances
+    :param auto_id: generator of unique identifiers
+    :param py: Python settings
+    :return: generated code
+    """
+    assert isinstance(a_type.values, (mapry.Integer, mapry.Float))
+
+    uid = auto_id.next_identifier()
+
+    item_parsing = _parse_value(
+        value_expr="item_{uid}".format(uid=uid),
+        target_expr="target_item_{uid}".format(uid=uid),
+        ref_parts=ref_parts + ["i_{uid}".format(uid=uid)],
+        a_type=a_type.values,
+        registry_exprs=registry_exprs,
+        auto_id=auto_id,
+        py=py)
+
+    return _PARSE_NUMPY_ARRAY_TPL.render(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        ref_parts=ref_parts,
+        uid=uid,
+        a_type=a_type,
+        array_py_type=mapry.py.generate.type_repr(a_type=a_type, py=py),
+        item_py_type=mapry.py.generate.type_repr(a_type=a_type.values, py=py),
+        dtype=mapry.py.generate.numpy_dtype(a_type=a_type),
+        is_integer=isinstance(a_type.values, mapry.Integer),
+        item_types=(
+            '{int}'
+            if isinstance(a_type.values, mapry.Integer) else '{int, float}'),
+        invalid_mask=_numpy_invalid_mask(
+            array_expr='target_{}'.format(uid), a_type=a_type.values),
+        item_parsing=item_parsing).rstrip('\n')
+
 
 @ensure(lambda result: not result.endswith('\n'))
 def _parse_array(
@@ -984,12 +1488,22 @@ def _parse_array(
     :param py: Python settings
     :return: generated code
     """
+    if mapry.py.generate.is_numpy_array(a_type=a_type, py=py):
+        return _parse_numpy_array(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            ref_parts=ref_parts,
+            a_type=a_type,
+            registry_exprs=registry_exprs,
+            auto_id=auto_id,
+            py=py)
+
     uid = auto_id.next_identifier()
 
     item_parsing = _parse_value(
         value_expr="item_{uid}".format(uid=uid),
         target_expr="target_item_{uid}".format(uid=uid),
-        ref_parts=ref_parts + ["str(i_{uid})".format(uid=uid)],
+        ref_parts=ref_parts + ["i_{uid}".format(uid=uid)],
         a_type=a_type.values,
         registry_exprs=registry_exprs,
         auto_id=auto_id,
@@ -1019,8 +1533,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, dict):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a dict, but got: {}".format(
             type({{ value }})))
 else:
@@ -1036,8 +1549,7 @@ else:
     for key_{{ uid }}, value_{{ uid }} in {{ value }}.items():
         if not isinstance(key_{{ uid }}, str):
             errors.add(
-                '/'.join((
-                    {{ ref_parts|join(', ') }})),
+                ({{ ref_parts|join(', ') }}),
                 "Expected the key to be a str, but got: {}".format(
                     type(key_{{ uid }})))
 
@@ -1086,7 +1598,7 @@ def _parse_map(
     item_parsing = _parse_value(
         value_expr="value_{uid}".format(uid=uid),
         target_expr="target_item_{uid}".format(uid=uid),
-        ref_parts=ref_parts + ["repr(key_{uid})".format(uid=uid)],
+        ref_parts=ref_parts + ["(key_{uid}, )".format(uid=uid)],
         a_type=a_type.values,
         registry_exprs=registry_exprs,
         auto_id=auto_id,
@@ -1249,23 +1761,150 @@ def _parse_value(
     return body
 
 
-_PARSE_PROPERTY_TPL = mapry.py.jinja2_env.ENV.from_string(
+_PARSE_LAZILY_DECODED_TPL = mapry.py.jinja2_env.ENV.from_string(
     '''\
 {# Assume `errors` is defined to collect errors. #}
-##
-# Parse {{ a_property.name|as_attribute }}
-##
-
-value_{{ uid }} = {{ value_obj_expr }}.get(
-    {{ a_property.json|repr }},
-    None)
-
-{% if not a_property.optional %}
-if value_{{ uid }} is None:
+{% if value_expr|is_variable %}
+{# Short-circuit value as value expression if it is a variable so that
+we don't end up with an unnecessary variable1 = variable2 statement.#}
+{% set value = value_expr %}
+{% else %}
+{% set value = "value_%s"|format(uid) %}
+value_{{ uid }} = {{ value_expr }}
+{% endif %}
+if not isinstance({{ value }}, str):
+    errors.add(
+        ({{ ref_parts|join(', ') }}),
+        "Expected a string, but got: {}".format(
+            type({{ value }})))
+{% if is_time_zone %}
+elif not _is_pytz_timezone({{ value }}):
+    errors.add(
+        ({{ ref_parts|join(', ') }}),
+        "Expected a valid IANA time zone, but got: {}".format(
+            {{ value }}))
+{% elif a_type.pattern is not none %}
+elif not re.match(
+        r'{{ a_type.pattern.pattern }}',
+        {{ value }}):
+    errors.add(
+        ({{ ref_parts|join(', ') }}),
+        {{ "Expected to match %s, but got: {}"|
+            format(a_type.pattern.pattern)|repr }}.format(
+            {{ value }}))
+{% endif %}{# /if is_time_zone #}
+else:
+    # The value is decoded on the first access.
+    {{ target_expr }} = {{ value }}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_lazily_decoded(
+        value_expr: str, target_expr: str, ref_parts: List[str],
+        a_type: Union[mapry.Path, mapry.TimeZone],
+        auto_id: mapry.py.generate.AutoID) -> str:
+    """
+    Generate the code to validate a value which is decoded on the first access.
+
+    The code validates the JSONable ``value_expr`` and stores it as a string
+    into the ``target_expr``.
+
+    :param value_expr: Python expression of the JSONable value
+    :param target_expr: Python expression of where to store the string
+    :param ref_parts: Python expression of reference path segments to the value
+    :param a_type: mapry definition of the value type
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_LAZILY_DECODED_TPL.render(
+        uid=uid,
+        value_expr=value_expr,
+        ref_parts=ref_parts,
+        target_expr=target_expr,
+        a_type=a_type,
+        is_time_zone=isinstance(a_type, mapry.TimeZone)).rstrip("\n")
+
+
+def _constructs_once(composite: mapry.Composite, py: mapry.Py) -> bool:
+    """
+    Check if the composite is constructed after all its properties are parsed.
+
+    The instances of embeddable structures can not be referenced so that they
+    need not be pre-allocated as placeholders. Their properties are parsed
+    into local variables instead and the instance is constructed afterwards.
+    The lazily decoded properties are stored in other attributes than
+    the ones given to the constructor so that such structures are still
+    parsed into placeholders.
+
+    :param composite: mapry definition of the composite
+    :param py: Python settings
+    :return: True if the instance is constructed at the end of the parsing
+    """
+    return isinstance(composite, mapry.Embed) and not any(
+        mapry.py.generate.is_lazily_decoded(prop=prop, py=py)
+        for prop in composite.properties.values())
+
+
+def _class_constructs_once(
+        cls: mapry.Class, graph: mapry.Graph, py: mapry.Py) -> bool:
+    """
+    Check if the class instances are constructed once when parsing the graph.
+
+    The instances need to be pre-allocated as placeholders only if they can
+    be referenced before they are parsed, *i.e.*, if the class references
+    itself or is referenced by a class which is parsed before it. The other
+    classes are constructed once all their properties have been parsed,
+    unless they have lazily decoded properties.
+
+    :param cls: mapry definition of the class
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: True if the instance is constructed at the end of the parsing
+    """
+    if any(mapry.py.generate.is_lazily_decoded(prop=prop, py=py)
+           for prop in cls.properties.values()):
+        return False
+
+    for other_cls in graph.classes.values():
+        if cls in mapry.references(a_type=other_cls):
+            return False
+
+        if other_cls == cls:
+            break
+
+    return True
+
+
+def _parsed_variable(a_property: mapry.Property) -> str:
+    """
+    Name the local variable holding the parsed value of the property.
+
+    :param a_property: mapry definition of the property
+    :return: Python variable name
+    """
+    return 'parsed_{}'.format(
+        mapry.py.naming.as_attribute(identifier=a_property.name))
+
+
+_PARSE_PROPERTY_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{# Assume `errors` is defined to collect errors. #}
+##
+# Parse {{ a_property.name|as_attribute }}
+##
+
+value_{{ uid }} = {{ value_obj_expr }}.get(
+    {{ a_property.json|repr }},
+    None)
+
+{% if not a_property.optional %}
+if value_{{ uid }} is None:
     errors.add(
         {% if ref_obj_parts|length > 1 %}
-        '/'.join((
-            {{ ref_obj_parts|join(', ') }})),
+        ({{ ref_obj_parts|join(', ') }}),
         {% elif ref_obj_parts|length == 1 %}
         {{ ref_obj_parts[0] }},
         {% else %}
@@ -1282,9 +1921,14 @@ if value_{{ uid }} is not None:
 
 @ensure(lambda result: not result.endswith('\n'))
 def _parse_property(
-        target_obj_expr: str, value_obj_expr: str, ref_obj_parts: List[str],
-        a_property: mapry.Property, registry_exprs: Mapping[mapry.Class, str],
-        auto_id: mapry.py.generate.AutoID, py: mapry.Py) -> str:
+        target_obj_expr: str,
+        value_obj_expr: str,
+        ref_obj_parts: List[str],
+        a_property: mapry.Property,
+        registry_exprs: Mapping[mapry.Class, str],
+        auto_id: mapry.py.generate.AutoID,
+        py: mapry.Py,
+        into_local: bool = False) -> str:
     """
     Generate the code to parse a composite property from a JSONable object.
 
@@ -1298,24 +1942,40 @@ def _parse_property(
         map class to Python expression of the registry of the class instances
     :param auto_id: generator of unique identifiers
     :param py: Python settings
+    :param into_local:
+        if set, parse into the local variable instead of the attribute
     :return: generated code
     """
     uid = auto_id.next_identifier()
 
-    attribute = mapry.py.naming.as_attribute(identifier=a_property.name)
-    property_target_expr = '{}.{}'.format(target_obj_expr, attribute)
+    if into_local:
+        property_target_expr = _parsed_variable(a_property=a_property)
+    else:
+        attribute = mapry.py.naming.as_attribute(identifier=a_property.name)
+        property_target_expr = '{}.{}'.format(target_obj_expr, attribute)
+
     property_ref_parts = ref_obj_parts + [repr(a_property.json)]
 
-    # yapf: disable
-    parsing = _parse_value(
-        value_expr="value_{uid}".format(uid=uid),
-        target_expr=property_target_expr,
-        ref_parts=property_ref_parts,
-        a_type=a_property.type,
-        registry_exprs=registry_exprs,
-        auto_id=auto_id,
-        py=py)
-    # yapf: enable
+    if mapry.py.generate.is_lazily_decoded(prop=a_property, py=py):
+        assert isinstance(a_property.type, (mapry.Path, mapry.TimeZone))
+
+        parsing = _parse_lazily_decoded(
+            value_expr="value_{uid}".format(uid=uid),
+            target_expr=property_target_expr,
+            ref_parts=property_ref_parts,
+            a_type=a_property.type,
+            auto_id=auto_id)
+    else:
+        # yapf: disable
+        parsing = _parse_value(
+            value_expr="value_{uid}".format(uid=uid),
+            target_expr=property_target_expr,
+            ref_parts=property_ref_parts,
+            a_type=a_property.type,
+            registry_exprs=registry_exprs,
+            auto_id=auto_id,
+            py=py)
+        # yapf: enable
 
     text = _PARSE_PROPERTY_TPL.render(
         a_property=a_property,
@@ -1341,8 +2001,7 @@ value_{{ uid }} = {{ value_expr }}
 {% endif %}
 if not isinstance({{ value }}, str):
     errors.add(
-        '/'.join((
-            {{ ref_parts|join(', ') }})),
+        ({{ ref_parts|join(', ') }}),
         "Expected a str, but got: {}".format(
             type({{ value }})))
 else:
@@ -1351,8 +2010,7 @@ else:
         None)
     if target_{{ uid }} is None:
         errors.add(
-            '/'.join((
-                {{ ref_parts|join(', ') }})),
+            ({{ ref_parts|join(', ') }}),
             {{ "Reference to an instance of class %s not found: {}"|
                 format(class_name)|repr }}.format(
                 {{ value }}))
@@ -1401,6 +2059,17 @@ we don't end up with an unnecessary variable1 = variable2 statement.#}
 {% set value = "value_%s"|format(uid) %}
 value_{{ uid }} = {{ value_expr }}
 {% endif %}
+{% if constructs_once %}
+target_{{ uid }} = _{{ embed_name|as_variable }}_from(
+    {{ value }},
+    {% for registry_expr in selected_registry_exprs %}
+    {{ registry_expr }},
+    {% endfor %}
+    ({{ ref_parts|join(', ') }}),
+    errors)
+if target_{{ uid }} is not None:
+    {{ target_expr }} = target_{{ uid }}
+{% else %}
 target_{{ uid }} = (
     {{ py.module_name }}.parse.placeholder_{{ embed_name|as_variable }}()
 )
@@ -1409,11 +2078,11 @@ _{{ embed_name|as_variable }}_from(
     {% for registry_expr in selected_registry_exprs %}
     {{ registry_expr }},
     {% endfor %}
-    '/'.join((
-        {{ ref_parts|join(', ') }})),
+    ({{ ref_parts|join(', ') }}),
     target_{{ uid }},
     errors)
 {{ target_expr }} = target_{{ uid }}
+{% endif %}{# /if constructs_once #}
 ''')
 
 
@@ -1450,11 +2119,96 @@ def _parse_embed(
         selected_registry_exprs=[
             registry_exprs[reference] for reference in references
         ],
-        py=py)
+        constructs_once=_constructs_once(composite=a_type, py=py),
+        py=py).rstrip("\n")
 
 
 _PARSE_COMPOSITE_TPL = mapry.py.jinja2_env.ENV.from_string(
     '''\
+{% if constructs_once %}
+def _{{ composite.name|as_variable }}_{{
+        'construct' if is_class else 'from' }}(
+        value: typing.Any,
+        {% if is_class %}
+        id: str,
+        {% endif %}
+        {% for ref_cls in references %}
+        {{ ref_cls.plural|as_variable }}_registry: typing.Mapping[
+            str,
+            {{ py.module_name }}.{{ ref_cls.name|as_composite }}],
+        {% endfor %}
+        ref: {{ py.module_name }}.parse.Ref,
+        errors: {{ py.module_name }}.parse.Errors
+) -> typing.Optional[{{ py.module_name }}.{{ composite.name|as_composite }}]:
+{% set doctext %}
+parses {{ composite.name|as_composite }} from a JSONable value.
+
+The properties are parsed into local variables and the instance is
+constructed only once all of them have been parsed.
+
+:param value: JSONable value
+{% if is_class %}
+:param id: identifier of the instance
+{% endif %}
+{% for ref_cls in references %}
+:param {{ ref_cls.plural|as_variable }}_registry: registry of the {{
+    ref_cls.name|as_composite }} instances
+{% endfor %}
+:param ref:
+    reference to the value (e.g., a lazy reference path)
+:param errors: errors encountered during parsing
+:return: parsed instance, or None if parsing it added to ``errors``
+{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+    {% if composite.properties %}
+
+    errors_count = errors.count()
+    {% endif %}{# /if composite.properties #}
+    {% if optional_properties %}
+
+    {% for prop in optional_properties %}
+    {{ parsed_variables[prop] }} = None  # type: typing.Optional[{{
+        type_reprs[prop] }}]
+    {% endfor %}{# /for prop in optional_properties #}
+    {% endif %}{# /if optional_properties #}
+    {% for prop in composite.properties.values() %}
+
+    {{ local_property_parsing[prop]|indent }}
+    if errors.full():
+        return None
+    {% endfor %}{# /for prop in composite.properties.values() #}
+    {% if composite.properties %}
+
+    if errors.count() > errors_count:
+        return None
+    {% endif %}{# /if composite.properties #}
+
+    {% if composite.properties %}
+    return {{ py.module_name }}.{{ composite.name|as_composite }}(
+        {% if is_class %}
+        id=id,
+        {% endif %}
+        {% for prop in composite.properties.values() %}
+        {{ prop.name|as_attribute }}={{ parsed_variables[prop] }}{{
+            ')' if loop.last else ',' }}
+        {% endfor %}{# /for prop #}
+    {% elif is_class %}
+    return {{ py.module_name }}.{{ composite.name|as_composite }}(id=id)
+    {% else %}
+    return {{ py.module_name }}.{{ composite.name|as_composite }}()
+    {% endif %}{# /if composite.properties #}
+{% endif %}{# /if constructs_once #}
+{% if fills_target %}
+{% if constructs_once %}
+
+
+{% endif %}
 def _{{ composite.name|as_variable }}_from(
         value: typing.Any,
         {% for ref_cls in references %}
@@ -1462,7 +2216,7 @@ def _{{ composite.name|as_variable }}_from(
             str,
             {{ py.module_name }}.{{ ref_cls.name|as_composite }}],
         {% endfor %}
-        ref: str,
+        ref: {{ py.module_name }}.parse.Ref,
         target: {{ py.module_name }}.{{ composite.name|as_composite }},
         errors: {{ py.module_name }}.parse.Errors
 ) -> None:
@@ -1477,7 +2231,7 @@ If ``errors``, the attributes of ``target`` have undefined values.
     ref_cls.name|as_composite }} instances
 {% endfor %}
 :param ref:
-    reference to the value (e.g., a reference path)
+    reference to the value (e.g., a lazy reference path)
 :param target: parsed ``value`` as {{ composite.name|as_composite }}
 :param errors: errors encountered during parsing
 :return:
@@ -1495,6 +2249,7 @@ If ``errors``, the attributes of ``target`` have undefined values.
     if errors.full():
         return
     {% endfor %}{# /for prop in composite.properties.values() #}
+{% endif %}{# /if fills_target #}
 
 
 def {{ composite.name|as_variable }}_from(
@@ -1525,6 +2280,20 @@ parses {{ composite.name|as_composite }} from a JSONable value.
 :return: parsed instance, or None if ``errors``
 {% endset %}{# /set doctext #}
     {{ doctext|as_docstring|indent }}
+    {% if constructs_once %}
+    target = _{{ composite.name|as_variable }}_{{
+        'construct' if is_class else 'from' }}(
+        value=value,
+        {% if is_class %}
+        id=id,
+        {% endif %}
+        {% for ref_cls in references %}
+        {{ ref_cls.plural|as_variable }}_registry={{
+            ref_cls.plural|as_variable }}_registry,
+        {% endfor %}
+        ref=ref,
+        errors=errors)
+    {% else %}
     {% if is_class %}
     target = {{ py.module_name }}.parse.placeholder_{{
         composite.name|as_variable }}(id=id)
@@ -1542,6 +2311,7 @@ parses {{ composite.name|as_composite }} from a JSONable value.
         ref=ref,
         target=target,
         errors=errors)
+    {% endif %}{# /if constructs_once #}
 
     if not errors.empty():
        return None
@@ -1551,11 +2321,13 @@ parses {{ composite.name|as_composite }} from a JSONable value.
 
 @ensure(lambda result: not result.endswith('\n'))
 def _parse_composite(
-        composite: Union[mapry.Class, mapry.Embed], py: mapry.Py) -> str:
+        composite: Union[mapry.Class, mapry.Embed], graph: mapry.Graph,
+        py: mapry.Py) -> str:
     """
     Generate the function that parses a composite.
 
     :param composite: mapry definition of the composite
+    :param graph: mapry definition of the object graph
     :param py: Python settings
     :return: generated code
     """
@@ -1569,18 +2341,54 @@ def _parse_composite(
     }
     # yapf: enable
 
-    auto_id = mapry.py.generate.AutoID()
+    if isinstance(composite, mapry.Class):
+        constructs_once = _class_constructs_once(
+            cls=composite, graph=graph, py=py)
+
+        # The instances are still parsed into placeholders when the graph is
+        # parsed lazily, in parallel or updated.
+        fills_target = True
+    else:
+        constructs_once = _constructs_once(composite=composite, py=py)
+        fills_target = not constructs_once
+
+    # Map mapry property -> code parsing it into the attribute of the target
+    property_parsing = dict()  # type: Dict[mapry.Property, str]
+    if fills_target:
+        auto_id = mapry.py.generate.AutoID()
+        for prop in composite.properties.values():
+            property_parsing[prop] = _parse_property(
+                target_obj_expr="target",
+                value_obj_expr="value",
+                ref_obj_parts=["ref"],
+                a_property=prop,
+                registry_exprs=registry_exprs,
+                auto_id=auto_id,
+                py=py)
+
+    # Map mapry property -> code parsing it into a local variable
+    local_property_parsing = dict()  # type: Dict[mapry.Property, str]
+    if constructs_once:
+        auto_id = mapry.py.generate.AutoID()
+        for prop in composite.properties.values():
+            local_property_parsing[prop] = _parse_property(
+                target_obj_expr="target",
+                value_obj_expr="value",
+                ref_obj_parts=["ref"],
+                a_property=prop,
+                registry_exprs=registry_exprs,
+                auto_id=auto_id,
+                py=py,
+                into_local=True)
 
     # yapf: disable
-    property_parsing = {
-        prop: _parse_property(
-            target_obj_expr="target",
-            value_obj_expr="value",
-            ref_obj_parts=["ref"],
-            a_property=prop,
-            registry_exprs=registry_exprs,
-            auto_id=auto_id,
-            py=py)
+    parsed_variables = {
+        prop: _parsed_variable(a_property=prop)
+        for prop in composite.properties.values()
+    }
+
+    type_reprs = {
+        prop: mapry.py.generate.type_repr(a_type=prop.type, py=py)
         for prop in composite.properties.values()
     }
     # yapf: enable
@@ -1590,25 +2398,307 @@ def _parse_composite(
         is_class=isinstance(composite, mapry.Class),
         references=references,
         property_parsing=property_parsing,
+        local_property_parsing=local_property_parsing,
+        constructs_once=constructs_once,
+        fills_target=fills_target,
+        parsed_variables=parsed_variables,
+        type_reprs=type_reprs,
+        optional_properties=[
+            prop for prop in composite.properties.values() if prop.optional
+        ],
         py=py)
 
 
+_PARALLEL_PARSE_WORKER_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+# Registries of placeholders and the items of the registry values in
+# a worker process of ``{{ graph.name|as_variable }}_from_parallel``
+_WORKER_REGISTRIES = []  # type: typing.List[typing.Any]
+_WORKER_ITEMS = [
+]  # type: typing.List[typing.List[typing.Tuple[str, typing.Any]]]
+
+# Map generated class -> index of its registry in the parallel parsing
+_REGISTRY_INDICES = {
+    {% for cls in graph.classes.values() %}
+    {{ module_name }}.{{ cls.name|as_composite }}: {{ loop.index0 }},
+    {% endfor %}{# /for cls #}
+}  # type: typing.Mapping[type, int]
+
+
+{% if py.compile_ready %}
+def _{{ graph.name|as_variable }}_shard_persistent_id(
+        obj: typing.Any) -> typing.Any:
+    \"\"\"gives the registry index and the identifier of an instance.\"\"\"
+    registry_index = _REGISTRY_INDICES.get(type(obj), None)
+    if registry_index is None:
+        return None
+
+    return registry_index, obj.id
+
+
+class _{{ graph.name|as_composite }}ShardResolver:
+    \"\"\"resolves the identifiers pickled as references to the instances.\"\"\"
+
+    def __init__(self, registries: typing.List[typing.Any]) -> None:
+        \"\"\"
+        initializes the resolver.
+
+        :param registries: class registries in the order of their indices
+        \"\"\"
+        self.registries = registries
+
+    def persistent_load(self, pid: typing.Any) -> typing.Any:
+        \"\"\"gives the instance of the registry index and the ID.\"\"\"
+        registry_index, id = pid
+        return self.registries[registry_index][id]
+{% else %}
+class _{{ graph.name|as_composite }}ShardPickler(pickle.Pickler):
+    \"\"\"pickles the references to the instances as their identifiers.\"\"\"
+
+    def persistent_id(self, obj: typing.Any) -> typing.Any:
+        \"\"\"gives the registry index and the identifier of an instance.\"\"\"
+        registry_index = _REGISTRY_INDICES.get(type(obj), None)
+        if registry_index is None:
+            return None
+
+        return registry_index, obj.id
+
+
+class _{{ graph.name|as_composite }}ShardUnpickler(pickle.Unpickler):
+    \"\"\"resolves the identifiers pickled as references to the instances.\"\"\"
+
+    def __init__(
+            self, file: typing.BinaryIO,
+            registries: typing.List[typing.Any]) -> None:
+        \"\"\"
+        initializes the unpickler.
+
+        :param file: pickled data
+        :param registries: class registries in the order of their indices
+        \"\"\"
+        super().__init__(file)
+        self.registries = registries
+
+    def persistent_load(self, pid: typing.Any) -> typing.Any:
+        \"\"\"gives the instance of the registry index and the ID.\"\"\"
+        registry_index, id = pid
+        return self.registries[registry_index][id]
+{% endif %}{# /if py.compile_ready #}
+
+
+def _init_{{ graph.name|as_variable }}_worker(
+        registry_values: typing.List[typing.Any]) -> None:
+    \"\"\"
+    initializes the registries of placeholders in a worker process.
+
+    :param registry_values: JSONable values of the registries, if available
+    :return:
+    \"\"\"
+    _WORKER_ITEMS[:] = [
+        list(registry_value.items()) if registry_value is not None else []
+        for registry_value in registry_values
+    ]
+
+    _WORKER_REGISTRIES[:] = [
+        {% for cls in graph.classes.values() %}
+        {
+            id: {{ module_name }}.parse.placeholder_{{
+                cls.name|as_variable }}(id=id)
+            for id, _ in _WORKER_ITEMS[{{ loop.index0 }}]
+        },
+        {% endfor %}{# /for cls #}
+    ]
+
+
+def _parse_{{ graph.name|as_variable }}_shard(
+        registry_index: int,
+        start: int,
+        stop: int,
+        ref: str,
+        cap: int
+) -> typing.Tuple[typing.List[typing.Tuple[str, str]], bytes]:
+    \"\"\"
+    parses a shard of a class registry in a worker process.
+
+    The instances are pickled as tuples of their attributes where
+    the references to the instances are pickled as identifiers.
+
+    :param registry_index: index of the class registry
+    :param start: index of the first instance in the shard
+    :param stop: index after the last instance in the shard
+    :param ref: reference to the object graph (e.g., a reference path)
+    :param cap: maximum number of errors
+    :return: errors as (reference, message) and the pickled instances
+    \"\"\"
+    errors = {{ module_name }}.parse.Errors(cap=cap)
+    states = []  # type: typing.List[typing.Tuple[typing.Any, ...]]
+
+    items = _WORKER_ITEMS[registry_index][start:stop]
+
+    {% for cls in graph.classes.values() %}
+    {{ 'if' if loop.first else 'elif' }} registry_index == {{ loop.index0 }}:
+        for id, instance_value in items:
+            target_{{ cls.name|as_variable }} = _WORKER_REGISTRIES[{{
+                loop.index0 }}][id]
+            target_{{ cls.name|as_variable }}.id = id
+
+            _{{ cls.name|as_variable }}_from(
+                instance_value,
+                {% for ref_cls in references[cls] %}
+                _WORKER_REGISTRIES[{{ registry_indices[ref_cls] }}],
+                {% endfor %}
+                (ref, {{ cls.plural|json_plural|repr }}, (id, )),
+                target_{{ cls.name|as_variable }},
+                errors)
+
+            if errors.full():
+                break
+
+            states.append((
+                {% for expr in state_exprs[cls] %}
+                {{ expr }},
+                {% endfor %}{# /for expr #}
+            ))
+
+    {% endfor %}{# /for cls #}
+    else:
+        raise ValueError(
+            "Unexpected registry index: {}".format(registry_index))
+
+    if not errors.empty():
+        return [(error.ref, error.message) for error in errors.values()], b''
+
+    stream = io.BytesIO()
+    {% if py.compile_ready %}
+    # The hook is set on the instance since the compiled subclasses of
+    # pickle.Pickler are not supported.
+    pickler = pickle.Pickler(stream, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = (  # type: ignore
+        _{{ graph.name|as_variable }}_shard_persistent_id)
+    pickler.dump(states)
+    {% else %}
+    _{{ graph.name|as_composite }}ShardPickler(
+        stream, protocol=pickle.HIGHEST_PROTOCOL).dump(states)
+    {% endif %}{# /if py.compile_ready #}
+
+    return [], stream.getvalue()''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parallel_parse_worker(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the code which parses the shards of class registries in workers.
+
+    :param graph: definition of the object graph
+    :param py: Python settings
+    :return: generated code
+    """
+    references = dict()  # type: MutableMapping[mapry.Class, List[mapry.Class]]
+    for cls in graph.classes.values():
+        references[cls] = mapry.references(a_type=cls)
+
+    registry_indices = {
+        cls: i
+        for i, cls in enumerate(graph.classes.values())
+    }  # type: Mapping[mapry.Class, int]
+
+    # Map mapry class -> Python expressions of the pickled attributes
+    state_exprs = dict()  # type: MutableMapping[mapry.Class, List[str]]
+    for cls in graph.classes.values():
+        target = 'target_{}'.format(
+            mapry.py.naming.as_variable(identifier=cls.name))
+
+        exprs = ['{}.id'.format(target)]
+        for prop in mapry.py.generate.order_by_optional(cls.properties):
+            if mapry.py.generate.is_lazily_decoded(prop=prop, py=py):
+                # Avoid decoding the property in the worker.
+                exprs.append(
+                    'getattr({}, {!r})'.format(
+                        target,
+                        mapry.py.generate.stored_attribute(prop=prop, py=py)))
+            else:
+                exprs.append(
+                    '{}.{}'.format(
+                        target,
+                        mapry.py.naming.as_attribute(identifier=prop.name)))
+
+        state_exprs[cls] = exprs
+
+    return _PARALLEL_PARSE_WORKER_TPL.render(
+        graph=graph,
+        module_name=py.module_name,
+        references=references,
+        registry_indices=registry_indices,
+        state_exprs=state_exprs,
+        py=py).rstrip()
+
+
 _PARSE_GRAPH_TPL = mapry.py.jinja2_env.ENV.from_string(
     '''\
+{% if is_async %}
+async def {{ graph.name|as_variable }}_from_async(
+        value: typing.Any,
+        ref: str,
+        errors: {{ module_name }}.parse.Errors,
+        budget: int = 1000
+) -> typing.Optional[{{ module_name }}.{{ graph.name|as_composite }}]:
+{% elif is_parallel %}
+def {{ graph.name|as_variable }}_from_parallel(
+        value: typing.Any,
+        ref: str,
+        errors: {{ module_name }}.parse.Errors,
+        workers: typing.Optional[int] = None,
+        shard_size: int = 10000
+) -> typing.Optional[{{ module_name }}.{{ graph.name|as_composite }}]:
+{% else %}
 def {{ graph.name|as_variable }}_from(
         value: typing.Any,
         ref: str,
         errors: {{ module_name }}.parse.Errors
 ) -> typing.Optional[{{ module_name }}.{{ graph.name|as_composite }}]:
+{% endif %}{# /if is_async #}
 {% set doctext %}
 parses {{ graph.name|as_composite }} from a JSONable value.
+{% if is_async %}
+
+The control is yielded to the event loop after every ``budget`` instances.
+The result and the errors are the same as by ``{{
+    graph.name|as_variable }}_from``.
+{% elif is_parallel %}
+
+The class registries are split into shards which are parsed in a pool of
+worker processes. The workers pickle the references to the instances as
+identifiers which are resolved in this process. The result and the errors
+are the same as by ``{{ graph.name|as_variable }}_from``.
+
+If all the class registries fit in a single shard, the value is parsed
+serially in this process.
+{% endif %}{# /if is_async #}
 
 :param value: JSONable value
 :param ref: reference to the value (e.g., a reference path)
 :param errors: errors encountered during parsing
+{% if is_async %}
+:param budget: positive number of instances to process before yielding
+{% elif is_parallel %}
+:param workers:
+    maximum number of worker processes;
+    if None, the number of processors is used
+:param shard_size: positive number of instances parsed by a worker at once
+{% endif %}{# /if is_async #}
 :return: parsed {{ graph.name|as_composite }}, or None if ``errors``{#
+#}{% if is_parallel %}
+
+:raise: ValueError if ``shard_size`` is not positive{#
+#}{% endif %}{# /if is_parallel #}{#
 #}{% endset %}{# /set doctext #}
     {{ doctext|as_docstring|indent }}
+    {% if is_parallel %}
+    if shard_size <= 0:
+        raise ValueError(
+            "Expected a positive shard_size, but got: {}".format(shard_size))
+
+    {% endif %}{# /if is_parallel #}
     if errors.full():
         return None
 
@@ -1617,8 +2707,28 @@ parses {{ graph.name|as_composite }} from a JSONable value.
             ref,
             "Expected a dictionary, but got: {}".format(type(value)))
         return None
+    {% if is_parallel %}
+
+    # The worker processes do not pay off if all the class registries fit
+    # in a single shard.
+    if all(
+            not isinstance(registry_value, dict)
+            or len(registry_value) <= shard_size
+            for registry_value in [
+                {% for cls in graph.classes.values() %}
+                value.get({{ cls.plural|json_plural|repr }}, None),
+                {% endfor %}{# /for cls #}
+            ]):
+        return {{ graph.name|as_variable }}_from(
+            value=value, ref=ref, errors=errors)
+    {% endif %}{# /if is_parallel #}
 
     graph = {{ module_name }}.parse.placeholder_{{ graph.name|as_variable }}()
+    {% if is_async %}
+
+    # Number of the instances processed since the control was last yielded
+    processed = 0
+    {% endif %}{# /if is_async #}
     {% for cls in graph.classes.values() %}
 
     ##
@@ -1630,8 +2740,7 @@ parses {{ graph.name|as_composite }} from a JSONable value.
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, {{ cls.plural|json_plural|repr }})),
+                (ref, {{ cls.plural|json_plural|repr }}),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -1639,17 +2748,48 @@ parses {{ graph.name|as_composite }} from a JSONable value.
                 graph.{{ cls.plural|as_attribute }} = collections.OrderedDict()
             else:
                 graph.{{ cls.plural|as_attribute }} = dict()
+            {% if cls in constructed_classes %}
+            {% if cls.id_pattern %}
 
-            {{ cls.plural|as_attribute }}_registry = graph.{{
-                cls.plural|as_attribute }}
+            # Only the IDs are checked since the instances are constructed
+            # when they are parsed.
             for id in registry_value:
-                {% if cls.id_pattern %}
+                {% if is_async %}
+                processed += 1
+                if processed >= budget:
+                    processed = 0
+                    await asyncio.sleep(0)
+
+                {% endif %}{# /if is_async #}
+                if not re.match(
+                        r'{{ cls.id_pattern.pattern }}',
+                        id):
+                    errors.add(
+                        (ref, {{ cls.plural|json_plural|repr }}),
+                        {{ "Expected ID to match %s, but got: "|
+                            format(cls.id_pattern.pattern)|repr }} + id)
+
+                    if errors.full():
+                        break
+            {% endif %}{# /if cls.id_pattern #}
+            {% else %}
+
+            {{ cls.plural|as_attribute }}_registry = graph.{{
+                cls.plural|as_attribute }}
+            for id in registry_value:
+                {% if is_async %}
+                processed += 1
+                if processed >= budget:
+                    processed = 0
+                    await asyncio.sleep(0)
+
+                {% endif %}{# /if is_async #}
+                {% if cls.id_pattern %}
                 if not re.match(
                         r'{{ cls.id_pattern.pattern }}',
                         id):
                     errors.add(
-                        '/'.join((
-                            ref, {{ cls.plural|json_plural|repr }})),
+                        (ref, {{ cls.plural|json_plural|repr }}),
                         {{ "Expected ID to match %s, but got: "|
                             format(cls.id_pattern.pattern)|repr }} + id)
 
@@ -1664,6 +2804,7 @@ parses {{ graph.name|as_composite }} from a JSONable value.
                     }}_registry[id] = {{ module_name }}.parse.placeholder_{{
                         cls.name|as_variable }}(id=id)
                 {% endif %}{# /if cls.id_pattern #}
+            {% endif %}{# /if cls in constructed_classes #}
 
     if errors.full():
         return None
@@ -1674,6 +2815,93 @@ parses {{ graph.name|as_composite }} from a JSONable value.
     if not errors.empty():
         return None
     {% endif %}
+    {% if is_parallel %}
+
+    ##
+    # Parse the class registries in the worker processes
+    ##
+
+    registries = [
+        {% for cls in graph.classes.values() %}
+        graph.{{ cls.plural|as_attribute }},
+        {% endfor %}{# /for cls #}
+    ]  # type: typing.List[typing.Any]
+
+    # The registry values are inherited by the workers if the processes are
+    # forked and pickled otherwise.
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_{{ graph.name|as_variable }}_worker,
+            initargs=([
+                {% for cls in graph.classes.values() %}
+                value.get({{ cls.plural|json_plural|repr }}, None),
+                {% endfor %}{# /for cls #}
+            ], )) as executor:
+        {% for cls in graph.classes.values() %}
+        {{ cls.plural|as_variable }}_futures = [
+            executor.submit(
+                _parse_{{ graph.name|as_variable }}_shard,
+                {{ loop.index0 }},
+                start,
+                start + shard_size,
+                ref,
+                errors.cap)
+            for start in range(
+                0, len(graph.{{ cls.plural|as_attribute }}), shard_size)
+        ]
+
+        {% endfor %}{# /for cls #}
+        futures = (
+            {% for cls in graph.classes.values() %}
+            {{ cls.plural|as_variable }}_futures{{
+                ' +' if not loop.last else '' }}
+            {% endfor %}{# /for cls #}
+        )
+
+        # The shards are merged in the order of the serial parsing so that
+        # the errors are reported in the same order.
+        {% for cls in graph.classes.values() %}
+        for future in {{ cls.plural|as_variable }}_futures:
+            shard_errors, data = future.result()
+            for error_ref, message in shard_errors:
+                errors.add(error_ref, message)
+
+            if errors.full():
+                for pending in futures:
+                    pending.cancel()
+
+                return None
+
+            if not errors.empty():
+                # The graph is discarded anyway.
+                continue
+
+            {% if py.compile_ready %}
+            # The hook is set on the instance since the compiled subclasses
+            # of pickle.Unpickler are not supported.
+            unpickler = pickle.Unpickler(io.BytesIO(data))
+            unpickler.persistent_load = (  # type: ignore
+                _{{ graph.name|as_composite }}ShardResolver(
+                    registries).persistent_load)
+            states = unpickler.load()
+            {% else %}
+            states = _{{ graph.name|as_composite }}ShardUnpickler(
+                io.BytesIO(data), registries).load()
+            {% endif %}{# /if py.compile_ready #}
+
+            for state in states:
+                target_{{ cls.name|as_variable }} = graph.{{
+                    cls.plural|as_attribute }}[state[0]]
+                (
+                    {% for target in state_targets[cls] %}
+                    target_{{ cls.name|as_variable }}.{{ target }},
+                    {% endfor %}{# /for target #}
+                ) = state
+        {% if not loop.last %}
+
+        {% endif %}
+        {% endfor %}{# /for cls #}
+    {% else %}
     {% for cls in graph.classes.values() %}
 
     ##
@@ -1683,6 +2911,34 @@ parses {{ graph.name|as_composite }} from a JSONable value.
     if {{ cls.plural|json_plural|repr }} in value:
         registry_value = value[{{ cls.plural|json_plural|repr }}]
         for id, instance_value in registry_value.items():
+            {% if is_async %}
+            processed += 1
+            if processed >= budget:
+                processed = 0
+                await asyncio.sleep(0)
+
+            {% endif %}{# /if is_async #}
+            {% if cls in constructed_classes %}
+            instance_{{ cls.name|as_variable }} = _{{
+                cls.name|as_variable }}_construct(
+                instance_value,
+                id,
+                {% for ref_cls in references[cls] %}
+                graph.{{ ref_cls.plural|as_attribute }},
+                {% endfor %}
+                (ref, {{ cls.plural|json_plural|repr }}, (id, )),
+                errors)
+
+            if instance_{{ cls.name|as_variable }} is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_{{ cls.name|as_variable }} = {{
+                    module_name }}.parse.placeholder_{{
+                        cls.name|as_variable }}(id=id)
+
+            graph.{{ cls.plural|as_attribute }}[id] = instance_{{
+                cls.name|as_variable }}
+            {% else %}
             target_{{ cls.name|as_variable }} = graph.{{
                 cls.plural|as_attribute }}[id]
             target_{{ cls.name|as_variable }}.id = id
@@ -1692,14 +2948,15 @@ parses {{ graph.name|as_composite }} from a JSONable value.
                 {% for ref_cls in references[cls] %}
                 graph.{{ ref_cls.plural|as_attribute }},
                 {% endfor %}
-                '/'.join((
-                    ref, {{ cls.plural|json_plural|repr }}, repr(id))),
+                (ref, {{ cls.plural|json_plural|repr }}, (id, )),
                 target_{{ cls.name|as_variable }},
                 errors)
+            {% endif %}{# /if cls in constructed_classes #}
 
             if errors.full():
                 return None
     {% endfor %}{# /for cls #}
+    {% endif %}{# /if is_parallel #}
     {% for property_parsing in property_parsings %}
 
     {{ property_parsing|indent }}
@@ -1716,14 +2973,27 @@ parses {{ graph.name|as_composite }} from a JSONable value.
 
 
 @ensure(lambda result: not result.endswith('\n'))
-def _parse_graph(graph: mapry.Graph, py: mapry.Py) -> str:
+def _parse_graph(
+        graph: mapry.Graph,
+        py: mapry.Py,
+        is_async: bool = False,
+        is_parallel: bool = False) -> str:
     """
     Generate the code that parses an object graph.
 
     :param graph: definition of the object graph
     :param py: Python settings
+    :param is_async:
+        if set, generates the coroutine which yields to the event loop
+        while parsing the class registries
+    :param is_parallel:
+        if set, generates the function which parses the class registries
+        in worker processes
     :return: generated code
     """
+    assert not (is_async and is_parallel), \
+        "Expected either the coroutine or the parallel parsing, but not both"
+
     # Map mapry class -> referenced mapry classes
     references = dict()  # type: MutableMapping[mapry.Class, List[mapry.Class]]
     for cls in graph.classes.values():
@@ -1751,40 +3021,1732 @@ def _parse_graph(graph: mapry.Graph, py: mapry.Py) -> str:
                 auto_id=auto_id,
                 py=py))
 
+    # Map mapry class -> attributes restored from the pickled instances
+    state_targets = dict()  # type: MutableMapping[mapry.Class, List[str]]
+    for cls in graph.classes.values():
+        state_targets[cls] = ['id'] + [
+            mapry.py.naming.as_attribute(identifier=prop.name)
+            for prop in mapry.py.generate.order_by_optional(cls.properties)
+        ]
+
+    # Classes whose instances are constructed instead of filled into
+    # the pre-allocated placeholders. The parallel parsing restores
+    # the instances from the states pickled by the workers into placeholders.
+    constructed_classes = set()  # type: Set[mapry.Class]
+    if not is_parallel:
+        constructed_classes.update(
+            cls for cls in graph.classes.values()
+            if _class_constructs_once(cls=cls, graph=graph, py=py))
+
     text = _PARSE_GRAPH_TPL.render(
         graph=graph,
         module_name=py.module_name,
         references=references,
-        property_parsings=property_parsings)
+        property_parsings=property_parsings,
+        is_async=is_async,
+        is_parallel=is_parallel,
+        state_targets=state_targets,
+        constructed_classes=constructed_classes,
+        py=py)
 
     return text.rstrip("\n")
 
 
-@ensure(lambda result: result.endswith('\n'))
-def generate(graph: mapry.Graph, py: mapry.Py) -> str:
+_PARSE_PRIMITIVE_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{# Assume that the exceptions propagate to the fast-path entry point. #}
+{% if needs_variable %}
+{% if value_expr|is_variable %}
+{# Short-circuit value as value expression if it is a variable so that
+we don't end up with an unnecessary variable1 = variable2 statement.#}
+{% set value = value_expr %}
+{% else %}
+{% set value = "value_%s"|format(uid) %}
+value_{{ uid }} = {{ value_expr }}
+{% endif %}{# /if value_expr|is_variable #}
+{% else %}
+{% set value = value_expr %}
+{% endif %}{# /if needs_variable #}
+{% if kind == "boolean" %}
+if not isinstance({{ value }}, bool):
+    raise TypeError("Expected a bool")
+{{ target_expr }} = {{ value }}
+{% elif kind == "integer" or kind == "float" %}
+{% if kind == "integer" %}
+if not isinstance({{ value }}, int):
+    raise TypeError("Expected an integer")
+{% else %}
+if not isinstance({{ value }}, (int, float)):
+    raise TypeError("Expected a number")
+{% endif %}{# /if kind == "integer" #}
+{% if a_type.minimum is not none %}
+{% set op = ">" if a_type.exclusive_minimum else ">="  %}
+if not ({{ value }} {{ op }} {{ a_type.minimum }}):
+    raise ValueError({{ "Expected %s %d"|format(op, a_type.minimum)|repr }})
+{% endif %}{# /if a_type.minimum is not none #}
+{% if a_type.maximum is not none %}
+{% set op = "<" if a_type.exclusive_maximum else "<=" %}
+if not ({{ value }} {{ op }} {{ a_type.maximum }}):
+    raise ValueError({{ "Expected %s %d"|format(op, a_type.maximum)|repr }})
+{% endif %}{# /if a_type.maximum is not none #}
+{% if kind == "integer" %}
+{{ target_expr }} = {{ value }}
+{% else %}
+{{ target_expr }} = float({{ value }})
+{% endif %}{# /if kind == "integer" #}
+{% elif kind == "string" or kind == "path" %}
+if not isinstance({{ value }}, str):
+    raise TypeError("Expected a string")
+{% if a_type.pattern is not none %}
+if not re.match(
+        r'{{ a_type.pattern.pattern }}',
+        {{ value }}):
+    raise ValueError({{
+        "Expected to match %s"|format(a_type.pattern.pattern)|repr }})
+{% endif %}{# /if a_type.pattern is not none #}
+{% if kind == "path" and py.path_as == "pathlib.Path" %}
+{{ target_expr }} = pathlib.Path(
+    {{ value }})
+{% else %}
+{{ target_expr }} = {{ value }}
+{% endif %}{# /if kind == "path" and py.path_as == "pathlib.Path" #}
+{% elif kind in ["date", "datetime", "time"] and fixed_width_function %}
+{{ target_expr }} = {{ fixed_width_function }}(
+    {{ value }})
+{% elif kind == "date" %}
+{{ target_expr }} = datetime.datetime.strptime(
+    {{ value }},
+    {{ a_type.format|repr }}
+).date()
+{% elif kind == "datetime" %}
+{{ target_expr }} = datetime.datetime.strptime(
+    {{ value }},
+    {{ a_type.format|repr }})
+{% elif kind == "time" %}
+{{ target_expr }} = datetime.datetime.strptime(
+    {{ value }},
+    {{ a_type.format|repr }}
+).time()
+{% elif kind == "time_zone" %}
+if not isinstance({{ value }}, str):
+    raise TypeError("Expected a string")
+{% if py.timezone_as == "pytz.timezone" %}
+{{ target_expr }} = pytz.timezone(
+    {{ value }})
+{% else %}
+{{ target_expr }} = {{ value }}
+{% endif %}{# /if py.timezone_as == "pytz.timezone" #}
+{% elif kind == "duration" %}
+if not isinstance({{ value }}, str):
+    raise TypeError("Expected a string")
+{{ target_expr }} = _duration_from_string(
+    {{ value }})
+{% elif kind == "instance_reference" %}
+{{ target_expr }} = {{ registry_expr }}[
+    {{ value }}]
+{% else %}
+{{ _raise("Unhandled kind: %s"|format(kind)) }}
+{% endif %}{# /if kind #}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_primitive_fast(
+        value_expr: str, target_expr: str, a_type: mapry.Type,
+        registry_exprs: Mapping[mapry.Class, str],
+        auto_id: mapry.py.generate.AutoID, py: mapry.Py) -> str:
     """
-    Generate the source file to parse an object graph from a JSONable object.
+    Generate the code to parse optimistically a value of a non-aggregate type.
 
-    :param graph: mapry definition of the object graph
+    The code parses the JSONable ``value_expr`` into the ``target_expr``.
+    Where the conversion itself does not reject an invalid value with
+    an exception, the value is checked explicitly.
+
+    :param value_expr: Python expression of the JSONable value
+    :param target_expr: Python expression of where to store the parsed value
+    :param a_type: mapry definition of the value type
+    :param registry_exprs:
+        map class to Python expression of the registry of the class instances
+    :param auto_id: generator of unique identifiers
     :param py: Python settings
-    :return: content of the source file
+    :return: generated code
     """
-    blocks = [
-        mapry.py.generate.WARNING,
-        mapry.py.generate.docstring("parses JSONable objects."),
-        _imports(graph=graph, py=py)
-    ]
+    # yapf: disable
+    kinds = [
+        (mapry.Boolean, 'boolean', True),
+        (mapry.Integer, 'integer', True),
+        (mapry.Float, 'float', True),
+        (mapry.String, 'string', True),
+        (mapry.Path, 'path', True),
+        (mapry.Date, 'date', False),
+        (mapry.Datetime, 'datetime', False),
+        (mapry.Time, 'time', False),
+        (mapry.TimeZone, 'time_zone', True),
+        (mapry.Duration, 'duration', True),
+        (mapry.Class, 'instance_reference', False)]
+    # yapf: enable
 
-    if mapry.needs_type(a_type=graph, query=mapry.Duration):
-        blocks.append(_duration_from_string())
+    for cls, kind, needs_variable in kinds:
+        if isinstance(a_type, cls):
+            break
+    else:
+        raise NotImplementedError(
+            "Unhandled fast parsing of type: {}".format(a_type))
 
-    nongraph_composites = []  # type: List[Union[mapry.Class, mapry.Embed]]
-    nongraph_composites.extend(graph.classes.values())
-    nongraph_composites.extend(graph.embeds.values())
+    uid = auto_id.next_identifier()
 
-    for class_or_embed in nongraph_composites:
-        blocks.append(_parse_composite(composite=class_or_embed, py=py))
+    return _PARSE_PRIMITIVE_FAST_TPL.render(
+        uid=uid,
+        kind=kind,
+        needs_variable=needs_variable,
+        value_expr=value_expr,
+        target_expr=target_expr,
+        a_type=a_type,
+        registry_expr=(
+            registry_exprs[a_type]
+            if isinstance(a_type, mapry.Class) else None),
+        fixed_width_function=(
+            _fixed_width_function(a_type=a_type) if isinstance(
+                a_type, (mapry.Date, mapry.Datetime, mapry.Time)) else None),
+        py=py).rstrip('\n')
 
-    blocks.append(_parse_graph(graph=graph, py=py))
 
-    return '\n\n\n'.join(blocks) + '\n'
+_PARSE_ARRAY_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{% if value_expr|is_variable %}
+{# Short-circuit value as value expression if it is a variable so that
+we don't end up with an unnecessary variable1 = variable2 statement.#}
+{% set value = value_expr %}
+{% else %}
+{% set value = "value_%s"|format(uid) %}
+value_{{ uid }} = {{ value_expr }}
+{% endif %}
+if not isinstance({{ value }}, list):
+    raise TypeError("Expected a list")
+{% if minimum_size is not none %}
+if len({{ value }}) < {{ minimum_size }}:
+    raise ValueError("Expected a list of minimum size {{ minimum_size }}")
+{% endif %}{# /if minimum_size is not none #}
+{% if maximum_size is not none %}
+if len({{ value }}) > {{ maximum_size }}:
+    raise ValueError("Expected a list of maximum size {{ maximum_size }}")
+{% endif %}{# /if maximum_size is not none #}
+target_{{ uid }} = (
+    []
+)  # type: typing.List[{{ value_py_type }}]
+for item_{{ uid }} in {{ value }}:
+    {{ item_parsing|indent }}
+    target_{{ uid }}.append(
+        target_item_{{ uid }})
+{{ target_expr }} = target_{{ uid }}''')
+
+_PARSE_NUMPY_ARRAY_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{% if value_expr|is_variable %}
+{# Short-circuit value as value expression if it is a variable so that
+we don't end up with an unnecessary variable1 = variable2 statement.#}
+{% set value = value_expr %}
+{% else %}
+{% set value = "value_%s"|format(uid) %}
+value_{{ uid }} = {{ value_expr }}
+{% endif %}
+if not isinstance({{ value }}, list):
+    raise TypeError("Expected a list")
+{% if a_type.minimum_size is not none %}
+if len({{ value }}) < {{ a_type.minimum_size }}:
+    raise ValueError("Expected a list of minimum size {{
+        a_type.minimum_size }}")
+{% endif %}{# /if a_type.minimum_size is not none #}
+{% if a_type.maximum_size is not none %}
+if len({{ value }}) > {{ a_type.maximum_size }}:
+    raise ValueError("Expected a list of maximum size {{
+        a_type.maximum_size }}")
+{% endif %}{# /if a_type.maximum_size is not none #}
+if not set(map(type, {{ value }})) <= {{ item_types }}:
+    raise TypeError("Expected a list of {{ item_kind }}")
+target_{{ uid }} = numpy.array({{ value }}, dtype={{ dtype }})
+{% if invalid_mask %}
+if numpy.any({{ invalid_mask }}):
+    raise ValueError("Expected the items to satisfy the constraints")
+{% endif %}{# /if invalid_mask #}
+{{ target_expr }} = target_{{ uid }}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_array_fast(
+        value_expr: str, target_expr: str, a_type: mapry.Array,
+        registry_exprs: Mapping[mapry.Class, str],
+        auto_id: mapry.py.generate.AutoID, py: mapry.Py) -> str:
+    """
+    Generate the code to parse optimistically an array.
+
+    The code parses the JSONable ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Python expression of the JSONable value
+    :param target_expr: Python expression of where to store the parsed value
+    :param a_type: mapry definition of the value type
+    :param registry_exprs:
+        map class to Python expression of the registry of the class instances
+    :param auto_id: generator of unique identifiers
+    :param py: Python settings
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    if mapry.py.generate.is_numpy_array(a_type=a_type, py=py):
+        assert isinstance(a_type.values, (mapry.Integer, mapry.Float))
+
+        return _PARSE_NUMPY_ARRAY_FAST_TPL.render(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            uid=uid,
+            a_type=a_type,
+            dtype=mapry.py.generate.numpy_dtype(a_type=a_type),
+            item_types=(
+                '{int}' if isinstance(a_type.values, mapry.Integer) else
+                '{int, float}'),
+            item_kind=(
+                'integers'
+                if isinstance(a_type.values, mapry.Integer) else 'numbers'),
+            invalid_mask=_numpy_invalid_mask(
+                array_expr='target_{}'.format(uid), a_type=a_type.values))
+
+    item_parsing = _parse_value_fast(
+        value_expr="item_{uid}".format(uid=uid),
+        target_expr="target_item_{uid}".format(uid=uid),
+        a_type=a_type.values,
+        registry_exprs=registry_exprs,
+        auto_id=auto_id,
+        py=py)
+
+    return _PARSE_ARRAY_FAST_TPL.render(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        uid=uid,
+        minimum_size=a_type.minimum_size,
+        maximum_size=a_type.maximum_size,
+        value_py_type=mapry.py.generate.type_repr(a_type=a_type.values, py=py),
+        item_parsing=item_parsing)
+
+
+_PARSE_MAP_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{% if value_expr|is_variable %}
+{# Short-circuit value as value expression if it is a variable so that
+we don't end up with an unnecessary variable1 = variable2 statement.#}
+{% set value = value_expr %}
+{% else %}
+{% set value = "value_%s"|format(uid) %}
+value_{{ uid }} = {{ value_expr }}
+{% endif %}
+if not isinstance({{ value }}, dict):
+    raise TypeError("Expected a dict")
+if isinstance({{ value }}, collections.OrderedDict):
+    target_{{ uid }} = (
+        collections.OrderedDict()
+    )  # type: typing.MutableMapping[str, {{ value_py_type }}]
+else:
+    target_{{ uid }} = (
+        dict()
+    )
+for key_{{ uid }}, item_{{ uid }} in {{ value }}.items():
+    if not isinstance(key_{{ uid }}, str):
+        raise TypeError("Expected the key to be a str")
+    {{ item_parsing|indent }}
+    target_{{ uid }}[key_{{ uid }}] = target_item_{{ uid }}
+{{ target_expr }} = target_{{ uid }}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_map_fast(
+        value_expr: str, target_expr: str, a_type: mapry.Map,
+        registry_exprs: Mapping[mapry.Class, str],
+        auto_id: mapry.py.generate.AutoID, py: mapry.Py) -> str:
+    """
+    Generate the code to parse optimistically a map.
+
+    The code parses the JSONable ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Python expression of the JSONable value
+    :param target_expr: Python expression of where to store the parsed value
+    :param a_type: mapry definition of the value type
+    :param registry_exprs:
+        map class to Python expression of the registry of the class instances
+    :param auto_id: generator of unique identifiers
+    :param py: Python settings
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    item_parsing = _parse_value_fast(
+        value_expr="item_{uid}".format(uid=uid),
+        target_expr="target_item_{uid}".format(uid=uid),
+        a_type=a_type.values,
+        registry_exprs=registry_exprs,
+        auto_id=auto_id,
+        py=py)
+
+    return _PARSE_MAP_FAST_TPL.render(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        uid=uid,
+        value_py_type=mapry.py.generate.type_repr(a_type=a_type.values, py=py),
+        item_parsing=item_parsing)
+
+
+_PARSE_EMBED_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{% if constructs_once %}
+{{ target_expr }} = _{{ embed_name|as_variable }}_from_fast(
+    {{ value_expr }}{{ ',' if selected_registry_exprs else ')' }}
+    {% for registry_expr in selected_registry_exprs %}
+    {{ registry_expr }}{{ ')' if loop.last else ',' }}
+    {% endfor %}
+{% else %}
+target_{{ uid }} = (
+    {{ py.module_name }}.parse.placeholder_{{ embed_name|as_variable }}()
+)
+_{{ embed_name|as_variable }}_from_fast(
+    {{ value_expr }},
+    {% for registry_expr in selected_registry_exprs %}
+    {{ registry_expr }},
+    {% endfor %}
+    target_{{ uid }})
+{{ target_expr }} = target_{{ uid }}
+{% endif %}{# /if constructs_once #}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_embed_fast(
+        value_expr: str, target_expr: str, a_type: mapry.Embed,
+        registry_exprs: Mapping[mapry.Class, str],
+        auto_id: mapry.py.generate.AutoID, py: mapry.Py) -> str:
+    """
+    Generate the code to parse optimistically an embeddable structure.
+
+    The code parses the ``value_expr`` into the ``target_expr``.
+
+    :param value_expr: Python expression of the JSONable value
+    :param target_expr: Python expression of where to store the parsed value
+    :param a_type: mapry definition of the value type
+    :param registry_exprs:
+        map class to Python expression of the registry of the class instances
+    :param auto_id: generator of unique identifiers
+    :param py: Python settings
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    references = mapry.references(a_type=a_type)
+
+    return _PARSE_EMBED_FAST_TPL.render(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        uid=uid,
+        embed_name=a_type.name,
+        selected_registry_exprs=[
+            registry_exprs[reference] for reference in references
+        ],
+        constructs_once=_constructs_once(composite=a_type, py=py),
+        py=py).rstrip("\n")
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_value_fast(
+        value_expr: str, target_expr: str, a_type: mapry.Type,
+        registry_exprs: Mapping[mapry.Class, str],
+        auto_id: mapry.py.generate.AutoID, py: mapry.Py) -> str:
+    """
+    Generate the code to parse optimistically a JSONable value.
+
+    The code parses the ``value_expr`` into the ``target_expr``. An invalid
+    value raises a KeyError, TypeError, ValueError or OverflowError.
+
+    :param value_expr: Python expression of the JSONable value
+    :param target_expr: Python expression of where to store the parsed value
+    :param a_type: mapry type of the value
+    :param registry_exprs:
+        map class to Python expression of the registry of the class instances
+    :param auto_id: generator of unique identifiers
+    :param py: Python settings
+    :return: generated code
+    """
+    if isinstance(a_type, mapry.Array):
+        return _parse_array_fast(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            a_type=a_type,
+            registry_exprs=registry_exprs,
+            auto_id=auto_id,
+            py=py)
+
+    if isinstance(a_type, mapry.Map):
+        return _parse_map_fast(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            a_type=a_type,
+            registry_exprs=registry_exprs,
+            auto_id=auto_id,
+            py=py)
+
+    if isinstance(a_type, mapry.Embed):
+        return _parse_embed_fast(
+            value_expr=value_expr,
+            target_expr=target_expr,
+            a_type=a_type,
+            registry_exprs=registry_exprs,
+            auto_id=auto_id,
+            py=py)
+
+    return _parse_primitive_fast(
+        value_expr=value_expr,
+        target_expr=target_expr,
+        a_type=a_type,
+        registry_exprs=registry_exprs,
+        auto_id=auto_id,
+        py=py)
+
+
+_PARSE_LAZILY_DECODED_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{% if value_expr|is_variable %}
+{# Short-circuit value as value expression if it is a variable so that
+we don't end up with an unnecessary variable1 = variable2 statement.#}
+{% set value = value_expr %}
+{% else %}
+{% set value = "value_%s"|format(uid) %}
+value_{{ uid }} = {{ value_expr }}
+{% endif %}
+if not isinstance({{ value }}, str):
+    raise TypeError("Expected a string")
+{% if is_time_zone %}
+if not _is_pytz_timezone({{ value }}):
+    raise ValueError("Expected a valid IANA time zone")
+{% elif a_type.pattern is not none %}
+if not re.match(
+        r'{{ a_type.pattern.pattern }}',
+        {{ value }}):
+    raise ValueError({{
+        "Expected to match %s"|format(a_type.pattern.pattern)|repr }})
+{% endif %}{# /if is_time_zone #}
+{{ target_expr }} = {{ value }}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_lazily_decoded_fast(
+        value_expr: str, target_expr: str,
+        a_type: Union[mapry.Path, mapry.TimeZone],
+        auto_id: mapry.py.generate.AutoID) -> str:
+    """
+    Generate the code to validate optimistically a lazily decoded value.
+
+    :param value_expr: Python expression of the JSONable value
+    :param target_expr: Python expression of where to store the string
+    :param a_type: mapry definition of the value type
+    :param auto_id: generator of unique identifiers
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    return _PARSE_LAZILY_DECODED_FAST_TPL.render(
+        uid=uid,
+        value_expr=value_expr,
+        target_expr=target_expr,
+        a_type=a_type,
+        is_time_zone=isinstance(a_type, mapry.TimeZone)).rstrip('\n')
+
+
+_PARSE_PROPERTY_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+##
+# Parse {{ a_property.name|as_attribute }}
+##
+
+{% if not a_property.optional %}
+{{ parsing }}
+{% else %}
+value_{{ uid }} = {{ value_obj_expr }}.get(
+    {{ a_property.json|repr }},
+    None)
+if value_{{ uid }} is not None:
+    {{ parsing|indent }}
+{% endif %}{# /if not a_property.optional #}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_property_fast(
+        target_obj_expr: str,
+        value_obj_expr: str,
+        a_property: mapry.Property,
+        registry_exprs: Mapping[mapry.Class, str],
+        auto_id: mapry.py.generate.AutoID,
+        py: mapry.Py,
+        into_local: bool = False) -> str:
+    """
+    Generate the code to parse optimistically a property of a JSONable object.
+
+    A missing mandatory property raises a KeyError.
+
+    :param target_obj_expr:
+        Python expression of the object to store the properties
+    :param value_obj_expr: Python expression of the JSONable object
+    :param a_property: mapry definition of the property
+    :param registry_exprs:
+        map class to Python expression of the registry of the class instances
+    :param auto_id: generator of unique identifiers
+    :param py: Python settings
+    :param into_local:
+        if set, parse into the local variable instead of the attribute
+    :return: generated code
+    """
+    uid = auto_id.next_identifier()
+
+    if into_local:
+        property_target_expr = _parsed_variable(a_property=a_property)
+    else:
+        attribute = mapry.py.naming.as_attribute(identifier=a_property.name)
+        property_target_expr = '{}.{}'.format(target_obj_expr, attribute)
+
+    if a_property.optional:
+        value_expr = "value_{uid}".format(uid=uid)
+    else:
+        value_expr = "{}[{!r}]".format(value_obj_expr, a_property.json)
+
+    if mapry.py.generate.is_lazily_decoded(prop=a_property, py=py):
+        assert isinstance(a_property.type, (mapry.Path, mapry.TimeZone))
+
+        parsing = _parse_lazily_decoded_fast(
+            value_expr=value_expr,
+            target_expr=property_target_expr,
+            a_type=a_property.type,
+            auto_id=auto_id)
+    else:
+        parsing = _parse_value_fast(
+            value_expr=value_expr,
+            target_expr=property_target_expr,
+            a_type=a_property.type,
+            registry_exprs=registry_exprs,
+            auto_id=auto_id,
+            py=py)
+
+    return _PARSE_PROPERTY_FAST_TPL.render(
+        a_property=a_property,
+        value_obj_expr=value_obj_expr,
+        uid=uid,
+        parsing=parsing).rstrip("\n")
+
+
+_PARSE_COMPOSITE_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{% if constructs_once %}
+def _{{ composite.name|as_variable }}_{{
+        'construct' if is_class else 'from' }}_fast(
+        value: typing.Any{{ ',' if references or is_class else '' }}
+        {% if is_class %}
+        id: str{{ ',' if references else '' }}
+        {% endif %}
+        {% for ref_cls in references %}
+        {{ ref_cls.plural|as_variable }}_registry: typing.Mapping[
+            str,
+            {{ py.module_name }}.{{ ref_cls.name|as_composite }}]{{
+                ',' if not loop.last else '' }}
+        {% endfor %}
+) -> {{ py.module_name }}.{{ composite.name|as_composite }}:
+{% set doctext %}
+parses {{ composite.name|as_composite }} optimistically from a JSONable value.
+
+The instance is constructed once all the properties have been parsed.
+
+:param value: JSONable value assumed to be valid
+{% if is_class %}
+:param id: identifier of the instance
+{% endif %}
+{% for ref_cls in references %}
+:param {{ ref_cls.plural|as_variable }}_registry: registry of the {{
+    ref_cls.name|as_composite }} instances
+{% endfor %}
+:return: parsed instance
+:raise:
+    KeyError, TypeError, ValueError or OverflowError
+    if ``value`` is invalid{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+    {% if optional_properties %}
+
+    {% for prop in optional_properties %}
+    {{ parsed_variables[prop] }} = None  # type: typing.Optional[{{
+        type_reprs[prop] }}]
+    {% endfor %}{# /for prop in optional_properties #}
+    {% endif %}{# /if optional_properties #}
+    {% for prop in composite.properties.values() %}
+
+    {{ local_property_parsing[prop]|indent }}
+    {% endfor %}{# /for prop in composite.properties.values() #}
+
+    {% if composite.properties %}
+    return {{ py.module_name }}.{{ composite.name|as_composite }}(
+        {% if is_class %}
+        id=id,
+        {% endif %}
+        {% for prop in composite.properties.values() %}
+        {{ prop.name|as_attribute }}={{ parsed_variables[prop] }}{{
+            ')' if loop.last else ',' }}
+        {% endfor %}{# /for prop #}
+    {% elif is_class %}
+    return {{ py.module_name }}.{{ composite.name|as_composite }}(id=id)
+    {% else %}
+    return {{ py.module_name }}.{{ composite.name|as_composite }}()
+    {% endif %}{# /if composite.properties #}
+{% endif %}{# /if constructs_once #}
+{% if fills_target %}
+{% if constructs_once %}
+
+
+{% endif %}
+def _{{ composite.name|as_variable }}_from_fast(
+        value: typing.Any,
+        {% for ref_cls in references %}
+        {{ ref_cls.plural|as_variable }}_registry: typing.Mapping[
+            str,
+            {{ py.module_name }}.{{ ref_cls.name|as_composite }}],
+        {% endfor %}
+        target: {{ py.module_name }}.{{ composite.name|as_composite }}
+) -> None:
+{% set doctext %}
+parses {{ composite.name|as_composite }} optimistically from a JSONable value.
+
+:param value: JSONable value assumed to be valid
+{% for ref_cls in references %}
+:param {{ ref_cls.plural|as_variable }}_registry: registry of the {{
+    ref_cls.name|as_composite }} instances
+{% endfor %}
+:param target: parsed ``value`` as {{ composite.name|as_composite }}
+:return:
+:raise:
+    KeyError, TypeError, ValueError or OverflowError
+    if ``value`` is invalid{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+    {% for prop in composite.properties.values() %}
+
+    {{ property_parsing[prop]|indent }}
+    {% endfor %}{# /for prop in composite.properties.values() #}
+{% endif %}{# /if fills_target #}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_composite_fast(
+        composite: Union[mapry.Class, mapry.Embed], graph: mapry.Graph,
+        py: mapry.Py) -> str:
+    """
+    Generate the function that parses optimistically a composite.
+
+    :param composite: mapry definition of the composite
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: generated code
+    """
+    references = mapry.references(a_type=composite)
+
+    # yapf: disable
+    registry_exprs = {
+        ref_cls: '{}_registry'.format(
+            mapry.py.naming.as_variable(ref_cls.plural))
+        for ref_cls in references
+    }
+    # yapf: enable
+
+    if isinstance(composite, mapry.Class):
+        constructs_once = _class_constructs_once(
+            cls=composite, graph=graph, py=py)
+    else:
+        constructs_once = _constructs_once(composite=composite, py=py)
+
+    # The optimistic parsers are called only by the optimistic parsing of
+    # the graph which uses the constructing variant if it is available.
+    fills_target = not constructs_once
+
+    # Map mapry property -> code parsing it into the attribute of the target
+    property_parsing = dict()  # type: Dict[mapry.Property, str]
+    if fills_target:
+        auto_id = mapry.py.generate.AutoID()
+        for prop in composite.properties.values():
+            property_parsing[prop] = _parse_property_fast(
+                target_obj_expr="target",
+                value_obj_expr="value",
+                a_property=prop,
+                registry_exprs=registry_exprs,
+                auto_id=auto_id,
+                py=py)
+
+    # Map mapry property -> code parsing it into a local variable
+    local_property_parsing = dict()  # type: Dict[mapry.Property, str]
+    if constructs_once:
+        auto_id = mapry.py.generate.AutoID()
+        for prop in composite.properties.values():
+            local_property_parsing[prop] = _parse_property_fast(
+                target_obj_expr="target",
+                value_obj_expr="value",
+                a_property=prop,
+                registry_exprs=registry_exprs,
+                auto_id=auto_id,
+                py=py,
+                into_local=True)
+
+    # yapf: disable
+    parsed_variables = {
+        prop: _parsed_variable(a_property=prop)
+        for prop in composite.properties.values()
+    }
+
+    type_reprs = {
+        prop: mapry.py.generate.type_repr(a_type=prop.type, py=py)
+        for prop in composite.properties.values()
+    }
+    # yapf: enable
+
+    return _PARSE_COMPOSITE_FAST_TPL.render(
+        composite=composite,
+        is_class=isinstance(composite, mapry.Class),
+        references=references,
+        property_parsing=property_parsing,
+        local_property_parsing=local_property_parsing,
+        constructs_once=constructs_once,
+        fills_target=fills_target,
+        parsed_variables=parsed_variables,
+        type_reprs=type_reprs,
+        optional_properties=[
+            prop for prop in composite.properties.values() if prop.optional
+        ],
+        py=py).rstrip("\n")
+
+
+_PARSE_GRAPH_FAST_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+def _{{ graph.name|as_variable }}_from_fast(
+        value: typing.Any
+) -> {{ module_name }}.{{ graph.name|as_composite }}:
+{% set doctext %}
+parses {{ graph.name|as_composite }} optimistically from a JSONable value.
+
+:param value: JSONable value assumed to be valid
+:return: parsed {{ graph.name|as_composite }}
+:raise:
+    KeyError, TypeError, ValueError or OverflowError
+    if ``value`` is invalid{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = {{ module_name }}.parse.placeholder_{{ graph.name|as_variable }}()
+    {% for cls in graph.classes.values() %}
+
+    ##
+    # Pre-allocate {{ cls.plural|as_attribute }}
+    ##
+
+    registry_value = value.get({{ cls.plural|json_plural|repr }}, None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.{{ cls.plural|as_attribute }} = collections.OrderedDict()
+        else:
+            graph.{{ cls.plural|as_attribute }} = dict()
+        {% if cls in constructed_classes %}
+        {% if cls.id_pattern %}
+
+        # Only the IDs are checked since the instances are constructed
+        # when they are parsed.
+        for id in registry_value:
+            if not re.match(
+                    r'{{ cls.id_pattern.pattern }}',
+                    id):
+                raise ValueError({{ "Expected ID to match %s"|
+                    format(cls.id_pattern.pattern)|repr }})
+        {% endif %}{# /if cls.id_pattern #}
+        {% else %}
+
+        {{ cls.plural|as_attribute }}_registry = graph.{{
+            cls.plural|as_attribute }}
+        for id in registry_value:
+            {% if cls.id_pattern %}
+            if not re.match(
+                    r'{{ cls.id_pattern.pattern }}',
+                    id):
+                raise ValueError({{ "Expected ID to match %s"|
+                    format(cls.id_pattern.pattern)|repr }})
+
+            {% endif %}{# /if cls.id_pattern #}
+            {{ cls.plural|as_attribute
+                }}_registry[id] = {{ module_name }}.parse.placeholder_{{
+                    cls.name|as_variable }}(id=id)
+        {% endif %}{# /if cls in constructed_classes #}
+    {% endfor %}{# /for cls #}
+    {% for cls in graph.classes.values() %}
+
+    ##
+    # Parse {{ cls.plural|as_attribute }}
+    ##
+
+    if {{ cls.plural|json_plural|repr }} in value:
+        registry_value = value[{{ cls.plural|json_plural|repr }}]
+        for id, instance_value in registry_value.items():
+            {% if cls in constructed_classes %}
+            graph.{{ cls.plural|as_attribute }}[id] = _{{
+                cls.name|as_variable }}_construct_fast(
+                instance_value,
+                id{{ ',' if references[cls] else ')' }}
+                {% for ref_cls in references[cls] %}
+                graph.{{ ref_cls.plural|as_attribute }}{{
+                    ')' if loop.last else ',' }}
+                {% endfor %}
+            {% else %}
+            _{{ cls.name|as_variable }}_from_fast(
+                instance_value,
+                {% for ref_cls in references[cls] %}
+                graph.{{ ref_cls.plural|as_attribute }},
+                {% endfor %}
+                graph.{{ cls.plural|as_attribute }}[id])
+            {% endif %}{# /if cls in constructed_classes #}
+    {% endfor %}{# /for cls #}
+    {% for property_parsing in property_parsings %}
+
+    {{ property_parsing|indent }}
+    {% endfor %}{# /for property_parsing #}
+
+    return graph
+
+
+def {{ graph.name|as_variable }}_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: {{ module_name }}.parse.Errors
+) -> typing.Optional[{{ module_name }}.{{ graph.name|as_composite }}]:
+{% set doctext %}
+parses {{ graph.name|as_composite }} from a JSONable value assumed to be valid.
+
+The value is first parsed optimistically without keeping track of
+the reference paths and the errors. Only if the value turns out to be
+invalid, it is parsed again with :py:func:`{{ graph.name|as_variable }}_from`
+to collect the errors.
+
+:param value: JSONable value
+:param ref: reference to the value (e.g., a reference path)
+:param errors: errors encountered during parsing
+:return: parsed {{ graph.name|as_composite }}, or None if ``errors``{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if errors.empty():
+        try:
+            return _{{ graph.name|as_variable }}_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return {{ graph.name|as_variable }}_from(
+        value=value,
+        ref=ref,
+        errors=errors)''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_graph_fast(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the code that parses optimistically an object graph.
+
+    :param graph: definition of the object graph
+    :param py: Python settings
+    :return: generated code
+    """
+    # Map mapry class -> referenced mapry classes
+    references = dict()  # type: MutableMapping[mapry.Class, List[mapry.Class]]
+    for cls in graph.classes.values():
+        references[cls] = mapry.references(a_type=cls)
+
+    # Map mapry class -> Python expression of the instance registry
+    registry_exprs = dict()  # type: Dict[mapry.Class, str]
+    for cls in graph.classes.values():
+        plural_attribute = mapry.py.naming.as_attribute(identifier=cls.plural)
+        registry_exprs[cls] = 'graph.{}'.format(plural_attribute)
+
+    property_parsings = []  # type: List[str]
+
+    auto_id = mapry.py.generate.AutoID()
+    for prop in graph.properties.values():
+        property_parsings.append(
+            _parse_property_fast(
+                target_obj_expr="graph",
+                value_obj_expr="value",
+                a_property=prop,
+                registry_exprs=registry_exprs,
+                auto_id=auto_id,
+                py=py))
+
+    # Classes whose instances are constructed instead of filled into
+    # the pre-allocated placeholders
+    constructed_classes = set(
+        cls for cls in graph.classes.values()
+        if _class_constructs_once(cls=cls, graph=graph, py=py))
+
+    text = _PARSE_GRAPH_FAST_TPL.render(
+        graph=graph,
+        module_name=py.module_name,
+        references=references,
+        property_parsings=property_parsings,
+        constructed_classes=constructed_classes)
+
+    return text.rstrip("\n")
+
+
+_PARSE_GRAPH_LAZY_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+def {{ graph.name|as_variable }}_from_lazy(
+        value: typing.Any,
+        ref: str,
+        errors: {{ module_name }}.parse.Errors
+) -> typing.Optional[{{ module_name }}.{{ graph.name|as_composite }}]:
+{% set doctext %}
+parses {{ graph.name|as_composite }} from a JSONable value lazily.
+
+The class registries are given as {{ module_name }}.parse.LazyRegistry
+which parse the instances only on the first access. Only the properties
+of the graph and the instances they reference are parsed immediately.
+
+Call ``materialize_{{ graph.name|as_variable }}`` to parse and validate
+all the remaining instances.
+
+:param value: JSONable value
+:param ref: reference to the value (e.g., a reference path)
+:param errors: errors encountered during parsing
+:return: parsed {{ graph.name|as_composite }}, or None if ``errors``{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    graph = {{ module_name }}.parse.placeholder_{{ graph.name|as_variable }}()
+    context = {{ module_name }}.parse.LazyContext(cap=errors.cap)
+    {% for cls in graph.classes.values() %}
+
+    ##
+    # Set up {{ cls.plural|as_attribute }}
+    ##
+
+    registry_value = value.get({{ cls.plural|json_plural|repr }}, None)
+
+    if registry_value is None:
+        registry_value = dict()
+
+    if not isinstance(registry_value, dict):
+        errors.add(
+            (ref, {{ cls.plural|json_plural|repr }}),
+            "Expected a dictionary, but got: {}".format(
+                type(registry_value)))
+    else:
+        {% if cls.id_pattern %}
+        for id in registry_value:
+            if not re.match(
+                    r'{{ cls.id_pattern.pattern }}',
+                    id):
+                errors.add(
+                    (ref, {{ cls.plural|json_plural|repr }}),
+                    {{ "Expected ID to match %s, but got: "|
+                        format(cls.id_pattern.pattern)|repr }} + id)
+
+                if errors.full():
+                    return None
+
+        {% endif %}{# /if cls.id_pattern #}
+        graph.{{ cls.plural|as_attribute }} = {{
+            module_name }}.parse.LazyRegistry(
+            values=registry_value,
+            ref=(ref, {{ cls.plural|json_plural|repr }}),
+            placeholder={{ module_name }}.parse.placeholder_{{
+                cls.name|as_variable }},
+            parse=lambda item_value, item_ref, target, item_errors: (
+                _{{ cls.name|as_variable }}_from(
+                    item_value,
+                    {% for ref_cls in references[cls] %}
+                    graph.{{ ref_cls.plural|as_attribute }},
+                    {% endfor %}
+                    item_ref,
+                    target,
+                    item_errors)),
+            context=context)
+
+    if errors.full():
+        return None
+    {% endfor %}{# /for cls #}
+
+    # Errors from setting up the registries are considered critical.
+    if not errors.empty():
+        return None
+
+    # The instances referenced by the properties are only scheduled
+    # and parsed afterwards.
+    context.parsing = True
+    {% for property_parsing in property_parsings %}
+
+    {{ property_parsing|indent }}
+
+    if errors.full():
+        return None
+    {% endfor %}{# /for property_parsing #}
+
+    context.parse_scheduled(errors=errors)
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def materialize_{{ graph.name|as_variable }}(
+        graph: {{ module_name }}.{{ graph.name|as_composite }},
+        errors: {{ module_name }}.parse.Errors) -> None:
+{% set doctext %}
+parses all the remaining instances of the lazily parsed {{
+    graph.name|as_composite }}.
+
+The instances are parsed in the same order as by ``{{
+    graph.name|as_variable }}_from``.
+If there are any errors, the instances parsed in this call are discarded
+and parsed anew on the next access.
+
+:param graph: {{ graph.name|as_composite }} parsed by ``{{
+    graph.name|as_variable }}_from_lazy``
+:param errors: errors encountered during parsing
+:return:{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    # All the lazy registries of the graph share the same context.
+    {% for cls in graph.classes.values() %}
+    if isinstance(
+            graph.{{ cls.plural|as_attribute }},
+            {{ module_name }}.parse.LazyRegistry):
+        graph.{{ cls.plural|as_attribute }}.materialize_all(errors=errors)
+        return
+    {% if not loop.last %}
+
+    {% endif %}
+    {% endfor %}{# /for cls #}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _parse_graph_lazy(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the code that parses an object graph with lazy registries.
+
+    :param graph: definition of the object graph
+    :param py: Python settings
+    :return: generated code
+    """
+    # Map mapry class -> referenced mapry classes
+    references = dict()  # type: MutableMapping[mapry.Class, List[mapry.Class]]
+    for cls in graph.classes.values():
+        references[cls] = mapry.references(a_type=cls)
+
+    # Map mapry class -> Python expression of the instance registry
+    registry_exprs = dict()  # type: Dict[mapry.Class, str]
+    for cls in graph.classes.values():
+        plural_attribute = mapry.py.naming.as_attribute(identifier=cls.plural)
+        registry_exprs[cls] = 'graph.{}'.format(plural_attribute)
+
+    property_parsings = []  # type: List[str]
+
+    auto_id = mapry.py.generate.AutoID()
+    for prop in graph.properties.values():
+        property_parsings.append(
+            _parse_property(
+                target_obj_expr="graph",
+                value_obj_expr="value",
+                ref_obj_parts=["ref"],
+                a_property=prop,
+                registry_exprs=registry_exprs,
+                auto_id=auto_id,
+                py=py))
+
+    text = _PARSE_GRAPH_LAZY_TPL.render(
+        graph=graph,
+        module_name=py.module_name,
+        references=references,
+        property_parsings=property_parsings)
+
+    return text.rstrip("\n")
+
+
+_MENTIONS_ANY = '''\
+def _mentions_any(value: typing.Any, ids: typing.AbstractSet[str]) -> bool:
+    """
+    checks whether any of the strings in the JSONable value is in ``ids``.
+
+    The keys of the dictionaries are not considered since they can not refer
+    to instances.
+
+    :param value: JSONable value
+    :param ids: identifiers of the instances
+    :return: True if any identifier is mentioned
+    """
+    if isinstance(value, str):
+        return value in ids
+
+    if isinstance(value, dict):
+        return any(_mentions_any(item, ids) for item in value.values())
+
+    if isinstance(value, list):
+        return any(_mentions_any(item, ids) for item in value)
+
+    return False'''
+
+_SAME_JSONABLE = '''\
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)'''
+
+_UPDATE_GRAPH_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+def {{ graph.name|as_variable }}_update_from(
+        previous: {{ module_name }}.{{ graph.name|as_composite }},
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: {{ module_name }}.parse.Errors
+) -> typing.Optional[{{ module_name }}.{{ graph.name|as_composite }}]:
+{% set doctext %}
+parses {{ graph.name|as_composite
+    }} reusing the instances of the previous graph.
+
+An instance of the previous graph is reused if its JSONable value equals
+the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+refer to any changed, new or removed instance.
+All the other instances are parsed anew. The previous graph is left
+untouched and shares the reused instances with the new one.
+
+The result and the errors are the same as by ``{{
+    graph.name|as_variable }}_from``.
+
+:param previous: previously parsed {{ graph.name|as_composite }}
+:param previous_value: JSONable value ``previous`` was parsed from
+:param value: JSONable value
+:param ref: reference to the value (e.g., a reference path)
+:param errors: errors encountered during parsing
+:return: parsed {{ graph.name|as_composite }}, or None if ``errors``{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = {{ module_name }}.parse.placeholder_{{ graph.name|as_variable }}()
+
+    # IDs of the instances which are new, changed or removed
+    {% for cls in graph.classes.values() %}
+    changed_{{ cls.plural|as_variable }} = set()  # type: typing.Set[str]
+    {% endfor %}{# /for cls #}
+    {% for cls in graph.classes.values() %}
+
+    ##
+    # Pre-allocate {{ cls.plural|as_attribute }} reusing the unchanged instances
+    ##
+
+    registry_value = value.get({{ cls.plural|json_plural|repr }}, None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, {{ cls.plural|json_plural|repr }}),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.{{ cls.plural|as_attribute }} = collections.OrderedDict()
+            else:
+                graph.{{ cls.plural|as_attribute }} = dict()
+
+            {{ cls.plural|as_attribute }}_registry = graph.{{
+                cls.plural|as_attribute }}
+            previous_{{ cls.plural|as_variable }} = previous.{{
+                cls.plural|as_attribute }}
+
+            previous_registry_value = previous_value.get(
+                {{ cls.plural|json_plural|repr }}, None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                {% if cls.id_pattern %}
+                if not re.match(
+                        r'{{ cls.id_pattern.pattern }}',
+                        id):
+                    errors.add(
+                        (ref, {{ cls.plural|json_plural|repr }}),
+                        {{ "Expected ID to match %s, but got: "|
+                            format(cls.id_pattern.pattern)|repr }} + id)
+
+                    if errors.full():
+                        break
+
+                {% endif %}{# /if cls.id_pattern #}
+                target_{{ cls.name|as_variable }} = previous_{{
+                    cls.plural|as_variable }}.get(id, None)
+                if (target_{{ cls.name|as_variable }} is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_{{ cls.name|as_variable }} = {{
+                        module_name }}.parse.placeholder_{{
+                            cls.name|as_variable }}(id=id)
+                    changed_{{ cls.plural|as_variable }}.add(id)
+
+                {{ cls.plural|as_attribute }}_registry[id] = target_{{
+                    cls.name|as_variable }}
+
+    changed_{{ cls.plural|as_variable }}.update(
+        id for id in previous.{{ cls.plural|as_attribute }}
+        if id not in graph.{{ cls.plural|as_attribute }})
+
+    if errors.full():
+        return None
+    {% endfor %}{# /for cls #}
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+    {% if referring_classes %}
+
+    ##
+    # Parse anew the instances referring to the new, changed or removed
+    # instances until no more instances need to be parsed anew.
+    ##
+
+    has_changed = True
+    while has_changed:
+        has_changed = False
+        {% for cls in referring_classes %}
+
+        referred = {{ referred_exprs[cls] }}
+
+        registry_value = value.get({{ cls.plural|json_plural|repr }}, None)
+        if referred and registry_value is not None:
+            for id, instance_value in registry_value.items():
+                if (id not in changed_{{ cls.plural|as_variable }} and
+                        _mentions_any(instance_value, referred)):
+                    graph.{{ cls.plural|as_attribute }}[id] = {{
+                        module_name }}.parse.placeholder_{{
+                            cls.name|as_variable }}(id=id)
+                    changed_{{ cls.plural|as_variable }}.add(id)
+                    has_changed = True
+        {% endfor %}{# /for cls #}
+    {% endif %}{# /if referring_classes #}
+    {% for cls in graph.classes.values() %}
+
+    ##
+    # Parse the new and changed {{ cls.plural|as_attribute }}
+    ##
+
+    registry_value = value.get({{ cls.plural|json_plural|repr }}, None)
+    if registry_value is not None and changed_{{ cls.plural|as_variable }}:
+        for id, instance_value in registry_value.items():
+            if id not in changed_{{ cls.plural|as_variable }}:
+                continue
+
+            _{{ cls.name|as_variable }}_from(
+                instance_value,
+                {% for ref_cls in references[cls] %}
+                graph.{{ ref_cls.plural|as_attribute }},
+                {% endfor %}
+                (ref, {{ cls.plural|json_plural|repr }}, (id, )),
+                graph.{{ cls.plural|as_attribute }}[id],
+                errors)
+
+            if errors.full():
+                return None
+    {% endfor %}{# /for cls #}
+    {% for property_parsing in property_parsings %}
+
+    {{ property_parsing|indent }}
+
+    if errors.full():
+        return None
+    {% endfor %}{# /for property_parsing #}
+
+    if not errors.empty():
+        return None
+
+    return graph
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _update_graph(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the code that parses an object graph reusing a previous one.
+
+    :param graph: definition of the object graph
+    :param py: Python settings
+    :return: generated code
+    """
+    # Map mapry class -> referenced mapry classes
+    references = dict()  # type: MutableMapping[mapry.Class, List[mapry.Class]]
+    for cls in graph.classes.values():
+        references[cls] = mapry.references(a_type=cls)
+
+    # Map mapry class -> Python expression of the instance registry
+    registry_exprs = dict()  # type: Dict[mapry.Class, str]
+    for cls in graph.classes.values():
+        plural_attribute = mapry.py.naming.as_attribute(identifier=cls.plural)
+        registry_exprs[cls] = 'graph.{}'.format(plural_attribute)
+
+    # Map mapry class -> Python expression of the changed referred IDs
+    referred_exprs = dict()  # type: Dict[mapry.Class, str]
+    for cls in graph.classes.values():
+        referred_exprs[cls] = ' | '.join(
+            'changed_{}'.format(
+                mapry.py.naming.as_variable(identifier=ref_cls.plural))
+            for ref_cls in references[cls])
+
+    property_parsings = []  # type: List[str]
+
+    auto_id = mapry.py.generate.AutoID()
+    for prop in graph.properties.values():
+        property_parsings.append(
+            _parse_property(
+                target_obj_expr="graph",
+                value_obj_expr="value",
+                ref_obj_parts=["ref"],
+                a_property=prop,
+                registry_exprs=registry_exprs,
+                auto_id=auto_id,
+                py=py))
+
+    referring_classes = [
+        cls for cls in graph.classes.values() if references[cls]
+    ]
+
+    text = _UPDATE_GRAPH_TPL.render(
+        graph=graph,
+        module_name=py.module_name,
+        references=references,
+        referring_classes=referring_classes,
+        referred_exprs=referred_exprs,
+        property_parsings=property_parsings)
+
+    # The references are propagated only if a class refers to a class.
+    helpers = [_MENTIONS_ANY] if referring_classes else []
+    helpers.append(_SAME_JSONABLE)
+
+    return '\n\n\n'.join(helpers + [text.rstrip("\n")])
+
+
+_ITERATE_REGISTRY_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+def iter_{{ cls.plural|as_variable }}(
+        fp: typing.TextIO,
+        ref: str,
+        errors: {{ module_name }}.parse.Errors,
+        chunk_size: int = 65536
+) -> typing.Iterator[{{ module_name }}.{{ cls.name|as_composite }}]:
+{% set doctext %}
+parses the instances of {{ cls.name|as_composite
+    }} one at a time from a JSON file.
+
+The JSON file is expected to contain {{ graph.name|as_composite }}. The file is
+read incrementally and only the instances of the registry
+{{ cls.plural|json_plural|repr }} are decoded, one at a time, so that
+the memory is bounded by the size of a single instance. The rest of the file
+after the registry is not read.
+{% if references[cls] %}
+
+The references to the instances are not resolved: they are given as
+placeholders with only the identifier set and their existence is not checked.
+{% endif %}{# /if references[cls] #}
+
+The iteration stops at the first error.
+
+:param fp: text stream of the JSON file
+:param ref: reference to the file (e.g., a reference path)
+:param errors: errors encountered during parsing
+:param chunk_size: number of characters read from ``fp`` at once
+:return: parsed instances of {{ cls.name|as_composite
+    }} in the order of the file{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if errors.full():
+        return
+
+    error_count = errors.count()
+    stream = {{ module_name }}.parse.JSONStream(fp=fp, chunk_size=chunk_size)
+    {% for ref_cls in references[cls] %}
+
+    {{ ref_cls.plural|as_variable }}_registry = (
+        {{ module_name }}.parse.UnresolvedRegistry(
+            placeholder={{ module_name }}.parse.placeholder_{{
+                ref_cls.name|as_variable }}))
+    {% endfor %}{# /for ref_cls #}
+
+    try:
+        if stream.next_char() != '{':
+            errors.add(
+                ref,
+                "Expected a dictionary, but got: {}".format(
+                    type(stream.read_value())))
+            return
+
+        for key in stream.iterate_object():
+            if key != {{ cls.plural|json_plural|repr }}:
+                stream.skip_value()
+                continue
+
+            if stream.next_char() != '{':
+                registry_value = stream.read_value()
+                if registry_value is not None:
+                    errors.add(
+                        (ref, {{ cls.plural|json_plural|repr }}),
+                        "Expected a dictionary, but got: {}".format(
+                            type(registry_value)))
+                return
+
+            for id in stream.iterate_object():
+                {% if cls.id_pattern %}
+                if not re.match(
+                        r'{{ cls.id_pattern.pattern }}',
+                        id):
+                    errors.add(
+                        (ref, {{ cls.plural|json_plural|repr }}),
+                        {{ "Expected ID to match %s, but got: "|
+                            format(cls.id_pattern.pattern)|repr }} + id)
+                    return
+
+                {% endif %}{# /if cls.id_pattern #}
+                instance_value = stream.read_value()
+
+                target = {{ module_name }}.parse.placeholder_{{
+                    cls.name|as_variable }}(id=id)
+
+                _{{ cls.name|as_variable }}_from(
+                    instance_value,
+                    {% for ref_cls in references[cls] %}
+                    {{ ref_cls.plural|as_variable }}_registry,
+                    {% endfor %}{# /for ref_cls #}
+                    (ref, {{ cls.plural|json_plural|repr }}, (id, )),
+                    target,
+                    errors)
+
+                if errors.count() > error_count:
+                    return
+
+                yield target
+
+            return
+
+    except ValueError as err:
+        errors.add(
+            ref,
+            "Expected a valid JSON text, but got: {}".format(err))''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _iterate_registry(
+        graph: mapry.Graph, cls: mapry.Class, py: mapry.Py) -> str:
+    """
+    Generate the code that iterates over a class registry in a JSON file.
+
+    :param graph: definition of the object graph
+    :param cls: definition of the class whose registry is iterated over
+    :param py: Python settings
+    :return: generated code
+    """
+    return _ITERATE_REGISTRY_TPL.render(
+        graph=graph,
+        cls=cls,
+        references={
+            cls: mapry.references(a_type=cls)
+        },
+        module_name=py.module_name).rstrip()
+
+
+def _blocks(graph: mapry.Graph, py: mapry.Py) -> List[Tuple[str, str]]:
+    """
+    Generate the blocks of the code which parses the object graph.
+
+    Each block is assigned to the submodule where it is defined if
+    the module is split into submodules.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: pairs of the submodule name and the generated code in order
+    """
+    common = mapry.py.generate.submodules.COMMON
+    graph_submodule = mapry.py.generate.submodules.name(composite=graph)
+
+    blocks = []  # type: List[Tuple[str, str]]
+
+    if mapry.needs_type(a_type=graph, query=mapry.Duration):
+        blocks.append((common, _duration_from_string()))
+
+    if mapry.TimeZone in mapry.py.generate.lazily_decoded_types(graph=graph,
+                                                                py=py):
+        blocks.append((common, _is_pytz_timezone()))
+
+    fixed_width_parsers = _fixed_width_parsers(graph=graph)
+    if fixed_width_parsers:
+        blocks.append((common, fixed_width_parsers))
+
+    nongraph_composites = []  # type: List[Union[mapry.Class, mapry.Embed]]
+    nongraph_composites.extend(graph.classes.values())
+    nongraph_composites.extend(graph.embeds.values())
+
+    submodule = {
+        composite: mapry.py.generate.submodules.name(composite=composite)
+        for composite in nongraph_composites
+    }  # type: Mapping[Union[mapry.Class, mapry.Embed], str]
+
+    for class_or_embed in nongraph_composites:
+        blocks.append((
+            submodule[class_or_embed],
+            _parse_composite(composite=class_or_embed, graph=graph, py=py)))
+
+    blocks.append((graph_submodule, _parse_graph(graph=graph, py=py)))
+
+    for class_or_embed in nongraph_composites:
+        blocks.append((
+            submodule[class_or_embed],
+            _parse_composite_fast(composite=class_or_embed, graph=graph,
+                                  py=py)))
+
+    blocks.append((graph_submodule, _parse_graph_fast(graph=graph, py=py)))
+
+    if graph.classes:
+        if py.coroutines:
+            blocks.append((
+                graph_submodule,
+                _parse_graph(graph=graph, py=py, is_async=True)))
+
+        if py.parallel_parsing:
+            blocks.append(
+                (graph_submodule, _parallel_parse_worker(graph=graph, py=py)))
+            blocks.append((
+                graph_submodule,
+                _parse_graph(graph=graph, py=py, is_parallel=True)))
+
+        if py.iter_registries:
+            for cls in graph.classes.values():
+                blocks.append((
+                    submodule[cls],
+                    _iterate_registry(graph=graph, cls=cls, py=py)))
+
+        if py.lazy_registries:
+            blocks.append(
+                (graph_submodule, _parse_graph_lazy(graph=graph, py=py)))
+
+        blocks.append((graph_submodule, _update_graph(graph=graph, py=py)))
+
+    return blocks
+
+
+@ensure(lambda result: result.endswith('\n'))
+def generate(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the source file to parse an object graph from a JSONable object.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: content of the source file
+    """
+    if py.trusted_input:
+        # The constraints are assumed to be satisfied so that
+        # no checks are generated for them.
+        graph = mapry.without_constraints(graph=graph)
+
+    blocks = [
+        mapry.py.generate.WARNING,
+        mapry.py.generate.docstring("parses JSONable objects."),
+        _imports(graph=graph, py=py)
+    ]
+
+    blocks.extend(code for _, code in _blocks(graph=graph, py=py))
+
+    return '\n\n\n'.join(blocks) + '\n'
+
+
+def generate_files(graph: mapry.Graph,
+                   py: mapry.Py) -> MutableMapping[str, str]:
+    """
+    Generate the source files to parse an object graph from a JSONable object.
+
+    If ``split_modules`` is set, the code is split into a package with
+    a submodule for each class and embeddable structure.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: content of the source files relative to the generated directory
+    """
+    if not py.split_modules:
+        return collections.OrderedDict([
+            ('fromjsonable.py', generate(graph=graph, py=py))
+        ])
+
+    if py.trusted_input:
+        # The constraints are assumed to be satisfied so that
+        # no checks are generated for them.
+        graph = mapry.without_constraints(graph=graph)
+
+    submodules = collections.OrderedDict(
+    )  # type: MutableMapping[str, List[str]]
+    for submodule, code in _blocks(graph=graph, py=py):
+        submodules.setdefault(submodule, []).append(code)
+
+    files = mapry.py.generate.submodules.split(
+        package='{}.fromjsonable'.format(py.module_name),
+        docstring="parses JSONable objects.",
+        imports=_imports(graph=graph, py=py),
+        submodules=submodules,
+        submodule_descriptions=mapry.py.generate.submodules.descriptions(
+            graph=graph, template="parses {} from JSONable objects."))
+
+    return collections.OrderedDict(('fromjsonable/{}'.format(filename), code)
+                                   for filename, code in files.items())
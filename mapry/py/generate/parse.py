@@ -9,22 +9,60 @@ import mapry.py.naming
 
 
 @ensure(lambda result: not result.endswith('\n'))
-def _imports(py: mapry.Py) -> str:
+def _imports(graph: mapry.Graph, py: mapry.Py) -> str:
     """
     Generate the import statements.
 
+    :param graph: mapry definition of the object graph
     :param py: Python settings
     :return: generated code
     """
     # pylint: disable=too-many-branches
     # pylint: disable=too-many-statements
     stdlib_block = {'import typing'}
+    if graph.classes:
+        if py.lazy_registries:
+            stdlib_block.add('import collections')
+
+        if py.iter_registries:
+            stdlib_block.update(('import json', 'import re'))
     first_party_block = {'import {}'.format(py.module_name)}
 
     return '\n\n'.join(sorted(stdlib_block) + sorted(first_party_block))
 
 
 _DEFINE_ERROR_AND_ERRORS = '''\
+# Ref represents a reference path to a value lazily.
+#
+# The reference is either a string or a tuple of the parent reference
+# followed by the path segments. String segments are rendered verbatim,
+# integer segments are indices and a segment wrapped in a one-tuple is
+# a key rendered with repr. Building a tuple is much cheaper than joining
+# the strings so that the reference is only rendered with ``render_ref``
+# when an error is actually added.
+Ref = typing.Union[str, typing.Tuple[typing.Any, ...]]
+
+
+def render_ref(ref: Ref) -> str:
+    """
+    renders the lazy reference as a string.
+
+    :param ref: reference to the value
+    :return: rendered reference path
+    """
+    if isinstance(ref, str):
+        return ref
+
+    parts = [render_ref(ref[0])]
+    for segment in ref[1:]:
+        if isinstance(segment, tuple):
+            parts.append(repr(segment[0]))
+        else:
+            parts.append(str(segment))
+
+    return '/'.join(parts)
+
+
 class Error:
     """represents an error occurred while parsing."""
 
@@ -55,15 +93,19 @@ class Errors:
         self.cap = cap
         self._values = []  # type: typing.List[Error]
 
-    def add(self, ref: str, message: str) -> None:
+    def add(self, ref: Ref, message: str) -> None:
         """
         adds an error to the container.
 
+        The reference is rendered to a string only if the error is
+        actually stored.
+
         :param ref: references the cause (e.g., a reference path)
         :param message: describes the error
         """
         if len(self._values) < self.cap:
-            self._values.append(Error(ref=ref, message=message))
+            self._values.append(
+                Error(ref=render_ref(ref), message=message))
 
     def full(self) -> bool:
         """gives True when there are exactly ``cap`` errors contained."""
@@ -81,6 +123,458 @@ class Errors:
         """gives an iterator over the errors."""
         return iter(self._values)'''
 
+_DEFINE_TYPE_VARIABLE = "T = typing.TypeVar('T')"
+
+_DEFINE_LAZY_REGISTRY = '''\
+class LazyContext:
+    """
+    keeps track of the instances of lazy registries waiting to be parsed.
+
+    All the lazy registries of an object graph share the same context.
+    A reference to an instance which has not been parsed yet is resolved to
+    its placeholder and the placeholder is scheduled for parsing. This way
+    the references are resolved without recursion and each instance is
+    parsed at most once.
+    """
+
+    def __init__(self, cap: int) -> None:
+        """
+        initializes the context.
+
+        :param cap: maximum number of errors reported when parsing on access
+        """
+        self.cap = cap
+        self.parsing = False
+        self.registries = []  # type: typing.List[typing.Any]
+
+        # Placeholders waiting to be parsed as (registry, ID, placeholder)
+        self._scheduled = collections.deque(
+        )  # type: typing.Deque[typing.Tuple[typing.Any, str, typing.Any]]
+
+    def schedule(
+            self, registry: typing.Any, id: str,
+            instance: typing.Any) -> None:
+        """
+        schedules the placeholder instance for parsing.
+
+        :param registry: registry of the instance
+        :param id: identifier of the instance
+        :param instance: placeholder to be filled out
+        :return:
+        """
+        self._scheduled.append((registry, id, instance))
+
+    def parse_scheduled(self, errors: Errors) -> None:
+        """
+        parses the scheduled instances including the ones they reference.
+
+        If any error occurs, all the instances parsed in this call are
+        discarded from their registries so that they are parsed anew on
+        the next access.
+
+        :param errors: errors encountered during parsing
+        :return:
+        """
+        count = errors.count()
+
+        parsed = []  # type: typing.List[typing.Tuple[typing.Any, str]]
+        self.parsing = True
+        try:
+            while self._scheduled and not errors.full():
+                registry, id, instance = self._scheduled.popleft()
+                parsed.append((registry, id))
+                registry.parse_instance(
+                    id=id, instance=instance, errors=errors)
+        finally:
+            self.parsing = False
+
+        if errors.count() > count or self._scheduled:
+            parsed.extend(
+                (registry, id) for registry, id, _ in self._scheduled)
+            self._scheduled.clear()
+
+            for registry, id in parsed:
+                registry.discard(id=id)
+
+    def parse_on_access(self) -> None:
+        """
+        parses the scheduled instances on access to a lazy registry.
+
+        :return:
+        :raise ValueError: if the instances could not be parsed
+        """
+        errors = Errors(cap=self.cap)
+        self.parse_scheduled(errors=errors)
+
+        if not errors.empty():
+            raise ValueError("Failed to parse the instance(s):\\n{}".format(
+                '\\n'.join(
+                    '{}: {}'.format(error.ref, error.message)
+                    for error in errors.values())))
+
+    def materialize_all(self, errors: Errors) -> None:
+        """
+        parses all the instances of all the lazy registries.
+
+        The instances are parsed in the same order as in the eager parsing
+        so that the value is fully validated.
+
+        :param errors: errors encountered during parsing
+        :return:
+        """
+        for registry in self.registries:
+            registry.schedule_all()
+
+        self.parse_scheduled(errors=errors)
+
+
+class LazyRegistry(typing.MutableMapping[str, T]):
+    """
+    maps identifiers to the instances parsed only on the first access.
+
+    The registry keeps the JSONable value of each instance. The first access
+    to an instance parses it together with the instances it references.
+    If the parsing fails, ValueError is raised listing the errors.
+    """
+
+    def __init__(
+            self, values: typing.Mapping[str, typing.Any], ref: Ref,
+            placeholder: typing.Callable[[str], T],
+            parse: typing.Callable[[typing.Any, Ref, T, Errors], None],
+            context: LazyContext) -> None:
+        """
+        initializes the registry and registers it with the context.
+
+        :param values: JSONable values of the instances
+        :param ref: reference to the registry
+        :param placeholder: creates an empty instance given its identifier
+        :param parse: parses a JSONable value into an instance
+        :param context: context shared by all the registries of the graph
+        """
+        if isinstance(values, collections.OrderedDict):
+            self._values = collections.OrderedDict(
+                values)  # type: typing.MutableMapping[str, typing.Any]
+        else:
+            self._values = dict(values)
+
+        self._instances = dict()  # type: typing.Dict[str, T]
+        self.ref = ref
+        self.placeholder = placeholder
+        self.parse = parse
+        self.context = context
+
+        context.registries.append(self)
+
+    def __getitem__(self, id: str) -> T:
+        """
+        gives the instance, parsing it first if necessary.
+
+        :param id: identifier of the instance
+        :return: instance
+        :raise KeyError: if there is no such instance in the registry
+        :raise ValueError: if the instance could not be parsed
+        """
+        if id in self._instances:
+            return self._instances[id]
+
+        if id not in self._values:
+            raise KeyError(id)
+
+        instance = self.placeholder(id)
+        self._instances[id] = instance
+        self.context.schedule(registry=self, id=id, instance=instance)
+
+        if not self.context.parsing:
+            self.context.parse_on_access()
+
+        return instance
+
+    def __setitem__(self, id: str, instance: T) -> None:
+        """sets the instance, replacing its JSONable value."""
+        self._values[id] = None
+        self._instances[id] = instance
+
+    def __delitem__(self, id: str) -> None:
+        """removes the instance from the registry."""
+        del self._values[id]
+        if id in self._instances:
+            del self._instances[id]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """iterates over the identifiers without parsing the instances."""
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """gives the number of instances, parsed or not."""
+        return len(self._values)
+
+    def __contains__(self, id: object) -> bool:
+        """checks whether there is the instance without parsing it."""
+        return id in self._values
+
+    def parse_instance(self, id: str, instance: T, errors: Errors) -> None:
+        """
+        parses the JSONable value of the instance into its placeholder.
+
+        :param id: identifier of the instance
+        :param instance: placeholder to be filled out
+        :param errors: errors encountered during parsing
+        :return:
+        """
+        self.parse(self._values[id], (self.ref, (id, )), instance, errors)
+
+    def discard(self, id: str) -> None:
+        """discards the instance so that it is parsed anew on next access."""
+        if id in self._instances:
+            del self._instances[id]
+
+    def schedule_all(self) -> None:
+        """schedules all the instances not parsed yet for parsing."""
+        for id in self._values:
+            if id not in self._instances:
+                instance = self.placeholder(id)
+                self._instances[id] = instance
+                self.context.schedule(registry=self, id=id, instance=instance)
+
+    def materialize_all(self, errors: Errors) -> None:
+        """
+        parses all the instances of all the registries of the graph.
+
+        :param errors: errors encountered during parsing
+        :return:
+        """
+        self.context.materialize_all(errors=errors)'''
+
+_DEFINE_JSON_STREAM = '''\
+_NON_WHITESPACE_RE = re.compile(r'[^ \\t\\n\\r]')
+_STRUCTURE_RE = re.compile(r'["{}\\[\\]]')
+
+
+class JSONStream:
+    """
+    reads a JSON text incrementally from a text stream.
+
+    Only the objects which are iterated over are followed character by
+    character. All the other values are decoded (or skipped) one at a time
+    so that the memory is bounded by the largest value read.
+    """
+
+    def __init__(self, fp: typing.TextIO, chunk_size: int = 65536) -> None:
+        """
+        initializes the reader.
+
+        :param fp: text stream of the JSON text
+        :param chunk_size: number of characters read from ``fp`` at once
+        """
+        self.fp = fp
+        self.chunk_size = chunk_size
+
+        self._buffer = ''
+        self._pos = 0
+
+        # Number of the characters discarded before the buffer
+        self._offset = 0
+
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """
+        reads the next chunk into the buffer discarding the consumed text.
+
+        The chunk is at least as large as the pending text so that a long
+        value is decoded in amortized linear time.
+
+        :return: False if the end of the stream has been reached
+        """
+        pending = self._buffer[self._pos:]
+        chunk = self.fp.read(max(self.chunk_size, len(pending)))
+        if not chunk:
+            return False
+
+        self._offset += self._pos
+        self._buffer = pending + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, expected: str) -> ValueError:
+        """creates the error about the unexpected next character."""
+        char = self.next_char()
+        return ValueError("Expected {} at character {}, but got: {}".format(
+            expected, self._offset + self._pos,
+            repr(char) if char else "the end of the text"))
+
+    def next_char(self) -> str:
+        """
+        skips the whitespace and gives the next character.
+
+        :return: next character, or an empty string at the end of the text
+        """
+        while True:
+            match = _NON_WHITESPACE_RE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        """
+        consumes the expected next character.
+
+        :param char: expected character
+        :return:
+        :raise ValueError: if the next character is not the expected one
+        """
+        if self.next_char() != char:
+            raise self._error(expected=repr(char))
+
+        self._pos += 1
+
+    def read_value(self) -> typing.Any:
+        """
+        decodes the next value.
+
+        :return: decoded value
+        :raise ValueError: if the value is not a valid JSON
+        """
+        if self.next_char() == '':
+            raise self._error(expected="a value")
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as err:
+                # The value might continue in the next chunk.
+                if self._fill():
+                    continue
+
+                raise ValueError("{} at character {}".format(
+                    err.msg, self._offset + err.pos))
+
+            if end == len(self._buffer) and self._fill():
+                # A number might continue in the next chunk.
+                continue
+
+            self._pos = end
+            return value
+
+    def _skip_string(self) -> None:
+        """skips the string starting at the current position."""
+        while True:
+            try:
+                _, end = json.decoder.scanstring(  # type: ignore
+                    self._buffer, self._pos + 1)
+            except json.JSONDecodeError as err:
+                if self._fill():
+                    continue
+
+                raise ValueError("{} at character {}".format(
+                    err.msg, self._offset + err.pos))
+
+            self._pos = end
+            return
+
+    def skip_value(self) -> None:
+        """
+        skips the next value without decoding the nested values.
+
+        Only the nesting of the skipped value is checked.
+
+        :return:
+        :raise ValueError: if the value is not terminated
+        """
+        if self.next_char() not in ('{', '['):
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            match = _STRUCTURE_RE.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise self._error(expected="the end of the value")
+
+                continue
+
+            if match.group() == '"':
+                self._pos = match.start()
+                self._skip_string()
+                continue
+
+            self._pos = match.end()
+            if match.group() in ('{', '['):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def iterate_object(self) -> typing.Iterator[str]:
+        """
+        iterates over the keys of the next object.
+
+        The caller needs to consume the value of each key before
+        continuing the iteration.
+
+        :return: keys of the object
+        :raise ValueError: if the object is not a valid JSON
+        """
+        self.expect('{')
+        if self.next_char() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            if self.next_char() != '"':
+                raise self._error(expected="a key")
+
+            key = self.read_value()
+            self.expect(':')
+
+            yield key
+
+            char = self.next_char()
+            if char == ',':
+                self._pos += 1
+            elif char == '}':
+                self._pos += 1
+                return
+            else:
+                raise self._error(expected="',' or '}'")
+
+
+class UnresolvedRegistry(typing.Mapping[str, T]):
+    """
+    gives a new placeholder for any identifier.
+
+    The references parsed against this registry are not resolved: they are
+    given as placeholders with only the identifier set, and their existence
+    is not checked.
+    """
+
+    def __init__(self, placeholder: typing.Callable[[str], T]) -> None:
+        """
+        initializes the registry.
+
+        :param placeholder: creates a placeholder instance given an identifier
+        """
+        self.placeholder = placeholder
+
+    def __getitem__(self, id: str) -> T:
+        """gives a new placeholder with the identifier."""
+        return self.placeholder(id)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """gives an empty iterator since no instance is known."""
+        return iter(())
+
+    def __len__(self) -> int:
+        """gives zero since no instance is known."""
+        return 0'''
+
 _CLASS_PLACEHOLDER_FUNCTION_TPL = mapry.py.jinja2_env.ENV.from_string(
     '''\
 def placeholder_{{ cls.name | as_variable }}(
@@ -103,7 +597,8 @@ Consider a placeholder an empty shell to be filled out during parsing.
     return {{ module_name }}.{{ cls.name|as_composite }}(  # type: ignore
         id=id,
         {% for prop in required_properties %}
-        {{ prop.name|as_attribute }}=None{{ ')' if loop.last else ',' }}
+        {{ prop.name|as_attribute }}=None{{ ')' if loop.last else ',' }}{#
+        #}{{ '  # type: ignore' if py.compile_ready }}
         {% endfor %}{# /for prop #}
     {% endif %}{# /if not required_properties #}
 ''')
@@ -125,7 +620,8 @@ def _class_placeholder_function(cls: mapry.Class, py: mapry.Py) -> str:
         required_properties=[
             prop for prop in cls.properties.values() if not prop.optional
         ],
-        module_name=py.module_name).rstrip()
+        module_name=py.module_name,
+        py=py).rstrip()
 
 
 _EMBED_PLACEHOLDER_FUNCTION_TPL = mapry.py.jinja2_env.ENV.from_string(
@@ -147,7 +643,8 @@ Consider a placeholder an empty shell to be filled out during parsing.
     {% else %}
     return {{ module_name }}.{{ embed.name|as_composite }}(  # type: ignore
         {% for prop in required_properties %}
-        {{ prop.name|as_attribute }}=None{{ ')' if loop.last else ',' }}
+        {{ prop.name|as_attribute }}=None{{ ')' if loop.last else ',' }}{#
+        #}{{ '  # type: ignore' if py.compile_ready }}
         {% endfor %}{# /for prop #}
     {% endif %}{# /if not required_properties #}
 ''')
@@ -169,7 +666,8 @@ def _embed_placeholder_function(embed: mapry.Embed, py: mapry.Py) -> str:
         required_properties=[
             prop for prop in embed.properties.values() if not prop.optional
         ],
-        module_name=py.module_name).rstrip()
+        module_name=py.module_name,
+        py=py).rstrip()
 
 
 _GRAPH_PLACEHOLDER_FUNCTION_TPL = mapry.py.jinja2_env.ENV.from_string(
@@ -191,7 +689,8 @@ Consider a placeholder an empty shell to be filled out during parsing.
     {% else %}
     return {{ module_name }}.{{ graph.name|as_composite }}(  # type: ignore
         {% for prop in required_properties %}
-        {{ prop.name|as_attribute }}=None{{ ')' if loop.last else ',' }}
+        {{ prop.name|as_attribute }}=None{{ ')' if loop.last else ',' }}{#
+        #}{{ '  # type: ignore' if py.compile_ready }}
         {% endfor %}{# /for prop #}
     {% endif %}{# /if not required_properties #}
 ''')
@@ -211,6 +710,7 @@ def _graph_placeholder_function(graph: mapry.Graph, py: mapry.Py) -> str:
     return _GRAPH_PLACEHOLDER_FUNCTION_TPL.render(
         graph=graph,
         module_name=py.module_name,
+        py=py,
         required_properties=[
             prop for prop in graph.properties.values() if not prop.optional
         ]).rstrip()
@@ -229,9 +729,19 @@ def generate(graph: mapry.Graph, py: mapry.Py) -> str:
         mapry.py.generate.WARNING,
         mapry.py.generate.docstring(
             "provides general structures and functions for parsing."),
-        _imports(py=py), _DEFINE_ERROR_AND_ERRORS
+        _imports(graph=graph, py=py), _DEFINE_ERROR_AND_ERRORS
     ]
 
+    if graph.classes:
+        if py.lazy_registries or py.iter_registries:
+            blocks.append(_DEFINE_TYPE_VARIABLE)
+
+        if py.lazy_registries:
+            blocks.append(_DEFINE_LAZY_REGISTRY)
+
+        if py.iter_registries:
+            blocks.append(_DEFINE_JSON_STREAM)
+
     for embed in graph.embeds.values():
         blocks.append(_embed_placeholder_function(embed=embed, py=py))
 
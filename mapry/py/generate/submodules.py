@@ -0,0 +1,296 @@
+"""Split a generated module into submodules which are imported lazily."""
+
+import ast
+import collections
+import keyword
+import re
+from typing import List, Mapping, MutableMapping, Set
+
+from icontract import ensure
+
+import mapry
+import mapry.py.generate
+import mapry.py.jinja2_env
+import mapry.py.naming
+
+# Name of the submodule defining the helpers shared by the other submodules
+COMMON = '_common'
+
+_IMPORT_RE = re.compile(r'^import (?P<module>[a-zA-Z_0-9.]+)')
+
+
+def name(composite: mapry.Composite) -> str:
+    """
+    Name the submodule defining the code of the composite.
+
+    :param composite: mapry definition of a class, an embed or the graph
+    :return: name of the submodule
+    """
+    result = mapry.py.naming.as_variable(identifier=composite.name)
+
+    if keyword.iskeyword(result):
+        result += '_'
+
+    return result
+
+
+def descriptions(graph: mapry.Graph, template: str) -> Mapping[str, str]:
+    """
+    Describe the submodules of the composites and the common submodule.
+
+    The submodules are named after the classes, the embeddable structures
+    and the graph itself.
+
+    :param graph: mapry definition of the object graph
+    :param template: description of a submodule given the composite name
+    :return: description of each submodule
+    """
+    result = {COMMON: "provides the helpers shared by the submodules."}
+
+    composites = []  # type: List[mapry.Composite]
+    composites.extend(graph.classes.values())
+    composites.extend(graph.embeds.values())
+    composites.append(graph)
+
+    for composite in composites:
+        result[name(composite=composite)] = (
+            template.format(
+                mapry.py.naming.as_composite(identifier=composite.name)))
+
+    return result
+
+
+def _defined_names(code: str) -> List[str]:
+    """
+    List the names defined at the top level of the code.
+
+    :param code: generated code
+    :return: names of the functions, classes and variables in order
+    """
+    names = []  # type: List[str]
+    for node in ast.parse(code).body:
+        if isinstance(node,
+                      (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    names.append(target.id)
+
+    return names
+
+
+def _referenced_names(code: str) -> Set[str]:
+    """
+    Collect all the names referred to in the code.
+
+    :param code: generated code
+    :return: referred names
+    """
+    return {
+        node.id
+        for node in ast.walk(ast.parse(code)) if isinstance(node, ast.Name)
+    }
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _filter_imports(imports: str, code: str) -> str:
+    """
+    Filter the import statements to the modules which the code refers to.
+
+    The references are searched in the text so that the modules referred to
+    only in the type comments are kept as well.
+
+    :param imports: generated blocks of import statements
+    :param code: generated code of the submodule
+    :return: generated blocks of the necessary import statements
+    """
+    blocks = []  # type: List[str]
+    for block in imports.split('\n\n'):
+        lines = []  # type: List[str]
+        for line in block.splitlines():
+            mtch = _IMPORT_RE.match(line)
+            if not mtch:
+                raise NotImplementedError(
+                    "Unhandled import statement: {!r}".format(line))
+
+            pattern = r'(?<![a-zA-Z_0-9.]){}\b'.format(
+                re.escape(mtch.group('module')))
+
+            if re.search(pattern, code):
+                lines.append(line)
+
+        if lines:
+            blocks.append('\n'.join(lines))
+
+    return '\n\n'.join(blocks)
+
+
+_SUBMODULE_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{{ warning }}
+
+
+{{ docstring }}
+{% if imports %}
+
+
+{{ imports }}
+{% endif %}{# /if imports #}
+
+
+{{ code }}
+{% if cross_imports %}
+
+
+# The names of the other submodules are imported at the end so that
+# the submodules can refer to each other regardless of the import order.
+{% for submodule, names in cross_imports.items() %}
+{% for name in names %}
+from {{ package }}.{{ submodule }} import {{ name }}
+{% endfor %}{# /for name #}
+{% endfor %}{# /for submodule, names #}
+{% endif %}{# /if cross_imports #}
+
+
+{{ warning }}
+''')
+
+_PACKAGE_INIT_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+{{ warning }}
+
+
+{{ docstring }}
+
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    # The names are imported only for the type checkers. At run time,
+    # they are resolved by ``__getattr__`` on the first access.
+    {% for submodule, names in public_names.items() %}
+    from {{ package }}.{{ submodule }} import (
+        {% for name in names %}
+        {{ name }} as {{ name }}{{ ')' if loop.last else ',' }}
+        {% endfor %}{# /for name #}
+    {% endfor %}{# /for submodule, names #}
+
+# Names of the submodules defining the public names of this module
+_SUBMODULES = {
+    {% for submodule, names in public_names.items() %}
+    {% for name in names %}
+    {{ name|repr }}: {{ submodule|repr }},
+    {% endfor %}{# /for name #}
+    {% endfor %}{# /for submodule, names #}
+}  # type: typing.Mapping[str, str]
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    imports the submodule defining the name on the first access.
+
+    :param name: name of the attribute
+    :return: the attribute
+    :raise AttributeError: if no submodule defines the name
+    """
+    submodule = _SUBMODULES.get(name, None)
+    if submodule is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+
+    value = getattr(
+        importlib.import_module('{}.{}'.format(__name__, submodule)), name)
+
+    # Cache the value so that __getattr__ is not called again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    """lists the names of this module including the ones of the submodules."""
+    return sorted(set(globals()) | set(_SUBMODULES))
+
+
+{{ warning }}
+''')
+
+
+def split(
+        package: str, docstring: str, imports: str,
+        submodules: Mapping[str, List[str]],
+        submodule_descriptions: Mapping[str, str]) -> MutableMapping[str, str]:
+    """
+    Split the generated code into the submodules of a package.
+
+    The package ``__init__.py`` resolves the public names lazily through
+    the module-level ``__getattr__`` so that only the submodules which are
+    actually used are imported.
+
+    :param package: fully qualified name of the package
+    :param docstring: description of the package
+    :param imports: generated import statements needed by all the code
+    :param submodules: generated code blocks of each submodule
+    :param submodule_descriptions: description of each submodule
+    :return: generated code of each file relative to the package directory
+    """
+    codes = collections.OrderedDict((submodule, '\n\n\n'.join(blocks))
+                                    for submodule, blocks in submodules.items())
+
+    definitions = collections.OrderedDict(
+    )  # type: MutableMapping[str, List[str]]
+    definer = dict()  # type: MutableMapping[str, str]
+    for submodule, code in codes.items():
+        definitions[submodule] = _defined_names(code=code)
+
+        for defined_name in definitions[submodule]:
+            if defined_name in definer:
+                raise AssertionError(
+                    "Expected {!r} to be defined only in a single submodule, "
+                    "but it is defined in {!r} and {!r}".format(
+                        defined_name, definer[defined_name], submodule))
+
+            definer[defined_name] = submodule
+
+    result = collections.OrderedDict()  # type: MutableMapping[str, str]
+
+    # yapf: disable
+    public_names = collections.OrderedDict(
+        (submodule, [
+            defined_name for defined_name in names
+            if not defined_name.startswith('_')])
+        for submodule, names in definitions.items()
+        if any(not defined_name.startswith('_') for defined_name in names))
+    # yapf: enable
+
+    result['__init__.py'] = _PACKAGE_INIT_TPL.render(
+        warning=mapry.py.generate.WARNING,
+        docstring=mapry.py.generate.docstring(docstring),
+        package=package,
+        public_names=public_names) + '\n'
+
+    for submodule, code in codes.items():
+        own_names = set(definitions[submodule])
+        cross_imports = collections.OrderedDict(
+        )  # type: MutableMapping[str, List[str]]
+
+        for referenced_name in sorted(_referenced_names(code=code)):
+            if (referenced_name in own_names or referenced_name not in definer):
+                continue
+
+            cross_imports.setdefault(definer[referenced_name],
+                                     []).append(referenced_name)
+
+        result[submodule + '.py'] = _SUBMODULE_TPL.render(
+            warning=mapry.py.generate.WARNING,
+            docstring=mapry.py.generate.docstring(
+                submodule_descriptions[submodule]),
+            imports=_filter_imports(imports=imports, code=code),
+            code=code,
+            package=package,
+            cross_imports=collections.OrderedDict(
+                sorted(cross_imports.items()))) + '\n'
+
+    return result
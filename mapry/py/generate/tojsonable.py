@@ -1,12 +1,17 @@
 """Generate the code that serializes the object graph to a JSONable."""
 
+import collections
+import json
 import textwrap
-from typing import List, Optional, Union  # pylint: disable=unused-import
+from typing import (  # pylint: disable=unused-import
+    List, MutableMapping, Optional, Tuple, Union)
 
 from icontract import ensure
 
 import mapry
+import mapry.naming
 import mapry.py.generate
+import mapry.py.generate.submodules
 import mapry.py.jinja2_env
 import mapry.py.naming
 
@@ -22,7 +27,7 @@ def _imports(graph: mapry.Graph, py: mapry.Py) -> str:
     """
     # pylint: disable=too-many-branches
     # pylint: disable=too-many-statements
-    stdlib_block = {'import collections', 'import typing'}
+    stdlib_block = {'import collections', 'import json', 'import typing'}
 
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
         stdlib_block.add('import datetime')
@@ -31,6 +36,9 @@ def _imports(graph: mapry.Graph, py: mapry.Py) -> str:
             or mapry.needs_type(a_type=graph, query=mapry.Embed)):
         stdlib_block.add('import collections')
 
+    if graph.classes and py.coroutines:
+        stdlib_block.add('import asyncio')
+
     first_party_block = {'import {}'.format(py.module_name)}
 
     # yapf: disable
@@ -406,7 +414,11 @@ def _serialization_expr(value_expr: str, a_type: mapry.Type,
         result = '_duration_to_string({})'.format(value_expr)
 
     elif isinstance(a_type, mapry.Array):
-        result = None
+        if mapry.py.generate.is_numpy_array(a_type=a_type, py=py):
+            # The items are converted to Python numbers in a single call.
+            result = '{}.tolist()'.format(value_expr)
+        else:
+            result = None
 
     elif isinstance(a_type, mapry.Map):
         result = None
@@ -582,12 +594,25 @@ def _serialize_class_or_embed(
 
 _SERIALIZE_GRAPH_TPL = mapry.py.jinja2_env.ENV.from_string(
     '''\
+{% if is_async %}
+async def serialize_{{ graph.name|as_variable }}_async(
+        instance: {{ py.module_name }}.{{ graph.name|as_composite }},
+        ordered: bool = False,
+        budget: int = 1000
+) -> typing.MutableMapping[str, typing.Any]:
+{% else %}
 def serialize_{{ graph.name|as_variable }}(
         instance: {{ py.module_name }}.{{ graph.name|as_composite }},
         ordered: bool = False
 ) -> typing.MutableMapping[str, typing.Any]:
+{% endif %}{# /if is_async #}
 {% set doctext %}
 serializes an instance of {{ graph.name|as_composite }} to a JSONable.
+{% if is_async %}
+
+The control is yielded to the event loop after every ``budget`` instances.
+The result is the same as by ``serialize_{{ graph.name|as_variable }}``.
+{% endif %}{# /if is_async #}
 
 :param instance: the instance of {{ graph.name|as_composite }} to be serialized
 :param ordered:
@@ -598,6 +623,9 @@ serializes an instance of {{ graph.name|as_composite }} to a JSONable.
     If set, represents the instance properties as a ``collections.OrderedDict``.
     {% endif %}{# /if graph.classes #}
     Otherwise, they are represented as a ``dict``.
+{% if is_async %}
+:param budget: positive number of instances to process before yielding
+{% endif %}{# /if is_async #}
 :return: JSONable representation{#
 #}{% endset %}{# /set doctext #}
     {{ doctext|as_docstring|indent }}
@@ -607,6 +635,11 @@ serializes an instance of {{ graph.name|as_composite }} to a JSONable.
         )  # type: typing.MutableMapping[str, typing.Any]
     else:
         target = dict()
+    {% if is_async %}
+
+    # Number of the instances processed since the control was last yielded
+    processed = 0
+    {% endif %}{# /if is_async #}
     {% for serialization in property_serializations %}{##
 
         Serialize graph properties
@@ -635,6 +668,13 @@ serializes an instance of {{ graph.name|as_composite }} to a JSONable.
 
         for id, {{ cls.name|as_variable }}_instance in instance.{{
             cls.plural|as_attribute }}.items():
+            {% if is_async %}
+            processed += 1
+            if processed >= budget:
+                processed = 0
+                await asyncio.sleep(0)
+
+            {% endif %}{# /if is_async #}
             if id != {{ cls.name|as_variable }}_instance.id:
                 raise ValueError(
                     {{ "Expected ID {!r} of the instance of %s, but got: {!r}"|
@@ -654,12 +694,16 @@ serializes an instance of {{ graph.name|as_composite }} to a JSONable.
 
 
 @ensure(lambda result: not result.endswith('\n'))
-def _serialize_graph(graph: mapry.Graph, py: mapry.Py) -> str:
+def _serialize_graph(
+        graph: mapry.Graph, py: mapry.Py, is_async: bool = False) -> str:
     """
     Generate the implementation of the function that serializes a mapry graph.
 
     :param graph: mapry definition of the object graph
     :param py: Python settings
+    :param is_async:
+        if set, generates the coroutine which yields to the event loop
+        while serializing the class registries
     :return: generated code
     """
     auto_id = mapry.py.generate.AutoID()
@@ -678,38 +722,483 @@ def _serialize_graph(graph: mapry.Graph, py: mapry.Py) -> str:
     # yapf: enable
 
     return _SERIALIZE_GRAPH_TPL.render(
+        graph=graph,
+        property_serializations=property_serializations,
+        py=py,
+        is_async=is_async).rstrip('\n')
+
+
+_SERIALIZE_GRAPH_DELTA_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+def serialize_{{ graph.name|as_variable }}_delta(
+        instance: {{ py.module_name }}.{{ graph.name|as_composite }},
+        since: int,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+{% set doctext %}
+serializes the changes of {{ graph.name|as_composite }} after the checkpoint.
+
+{% if property_serializations %}
+If any property of the graph has been set after the checkpoint, the delta
+contains all the properties of the graph under ``properties``.
+{% endif %}{# /if property_serializations #}
+{% if graph.classes %}
+For each class registry with changes, the delta contains under
+``registries`` the serialized instances which have been added or changed
+(``changed``) and the identifiers of the removed instances (``removed``),
+both in the order of the changes. The unchanged instances are not visited.
+{% endif %}{# /if graph.classes #}
+
+Only setting the attributes and changing the class registries are recorded.
+{% if graph.classes %}
+If you modify a value in place (*e.g.*, append to a list), call ``touch`` on
+the class registry.
+{% endif %}{# /if graph.classes #}
+
+:param instance: the instance of {{ graph.name|as_composite }} to be serialized
+:param since: revision given by ``{{ py.module_name }}.checkpoint()``
+:param ordered:
+    If set, represents the delta as a ``collections.OrderedDict``.
+    Otherwise, it is represented as a ``dict``.
+:return: JSONable representation of the changes{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+    {% if property_serializations %}
+
+    if getattr(instance, '_revision', 0) > since:
+        if ordered:
+            properties = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, typing.Any]
+        else:
+            properties = dict()
+        {% for serialization in property_serializations %}
+
+        {{ serialization|indent|indent }}
+        {% endfor %}{# /for serialization #}
+
+        target['properties'] = properties
+    {% endif %}{# /if property_serializations #}
+    {% if graph.classes %}
+
+    if ordered:
+        registries = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        registries = dict()
+    {% for cls in graph.classes.values() %}
+
+    ##
+    # Serialize changes of instance registry of {{ cls.name|as_composite }}
+    ##
+
+    registry_{{ cls.plural|as_variable }} = instance.{{
+        cls.plural|as_attribute }}
+    if not isinstance(
+            registry_{{ cls.plural|as_variable }},
+            {{ py.module_name }}.TrackedRegistry):
+        raise ValueError(
+            {{ "Expected the registry %s to be tracked, but got: {}"|
+                format(cls.plural|as_attribute)|repr }}.format(
+                type(registry_{{ cls.plural|as_variable }})))
+
+    changed_ids_{{ cls.plural|as_variable }} = registry_{{
+        cls.plural|as_variable }}.changed_since(since)
+    if changed_ids_{{ cls.plural|as_variable }}:
+        if ordered:
+            changed_{{ cls.plural|as_variable }} = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, typing.Any]
+        else:
+            changed_{{ cls.plural|as_variable }} = dict()
+
+        removed_{{ cls.plural|as_variable }} = []  # type: typing.List[str]
+
+        for id in changed_ids_{{ cls.plural|as_variable }}:
+            {{ cls.name|as_variable }}_instance = registry_{{
+                cls.plural|as_variable }}.get(id, None)
+            if {{ cls.name|as_variable }}_instance is None:
+                removed_{{ cls.plural|as_variable }}.append(id)
+                continue
+
+            if id != {{ cls.name|as_variable }}_instance.id:
+                raise ValueError(
+                    {{ "Expected ID {!r} of the instance of %s, but got: {!r}"|
+                        format(cls.name|as_composite)|repr }}.format(
+                        id, {{ cls.name|as_variable }}_instance.id))
+
+            changed_{{ cls.plural|as_variable }}[id] = serialize_{{
+                cls.name|as_variable }}(
+                instance={{ cls.name|as_variable }}_instance,
+                ordered=ordered)
+
+        if ordered:
+            target_{{ cls.plural|as_variable }} = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, typing.Any]
+        else:
+            target_{{ cls.plural|as_variable }} = dict()
+
+        if changed_{{ cls.plural|as_variable }}:
+            target_{{ cls.plural|as_variable }}['changed'] = changed_{{
+                cls.plural|as_variable }}
+
+        if removed_{{ cls.plural|as_variable }}:
+            target_{{ cls.plural|as_variable }}['removed'] = removed_{{
+                cls.plural|as_variable }}
+
+        registries[{{ cls.plural|json_plural|repr }}] = target_{{
+            cls.plural|as_variable }}
+    {% endfor %}{# /for cls #}
+
+    if registries:
+        target['registries'] = registries
+    {% endif %}{# /if graph.classes #}
+
+    return target
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _serialize_graph_delta(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the function that serializes the changes of a mapry graph.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: generated code
+    """
+    auto_id = mapry.py.generate.AutoID()
+
+    # yapf: disable
+    property_serializations = [
+        _serialize_property(
+            target_expr="properties[{}]".format(repr(prop.json)),
+            value_expr="instance.{}".format(
+                mapry.py.naming.as_attribute(prop.name)),
+            a_property=prop,
+            auto_id=auto_id,
+            py=py)
+        for prop in graph.properties.values()
+    ]
+    # yapf: enable
+
+    return _SERIALIZE_GRAPH_DELTA_TPL.render(
         graph=graph, property_serializations=property_serializations,
         py=py).rstrip('\n')
 
 
-@ensure(lambda result: result.endswith('\n'))
-def generate(graph: mapry.Graph, py: mapry.Py) -> str:
+@ensure(lambda result: not result.endswith('\n'))
+def _write_buffer() -> str:
     """
-    Generate the source file to parse an object graph from a JSONable object.
+    Generate the buffer which bounds the writes of the JSON text.
+
+    :return: generated code
+    """
+    return textwrap.dedent(
+        '''\
+        class _WriteBuffer:
+            """buffers the chunks of text before writing them to a file."""
+
+            def __init__(self, fp: typing.TextIO, size: int) -> None:
+                """
+                initializes the buffer.
+
+                :param fp: file-like object to write to
+                :param size: number of characters to buffer before writing
+                """
+                self.fp = fp
+                self.size = size
+                self._chunks = []  # type: typing.List[str]
+                self._length = 0
+
+            def write(self, text: str) -> None:
+                """buffers the text and writes it out if the buffer is full."""
+                self._chunks.append(text)
+                self._length += len(text)
+
+                if self._length >= self.size:
+                    self.flush()
+
+            def flush(self) -> None:
+                """writes out the buffered text."""
+                if self._chunks:
+                    self.fp.write(''.join(self._chunks))
+                    self._chunks = []
+                    self._length = 0''')
+
+
+_WRITE_PROPERTY_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+##
+# Write {{ a_property.name|as_attribute }}
+##
+
+{% if a_property.optional %}
+if {{ value_expr }} is not None:
+    {{ serialization|indent }}
+    buffer.write(delimiter)
+    buffer.write({{ key_text|repr }})
+    buffer.write(json.dumps({{ target_expr }}))
+    delimiter = ', '
+{% else %}
+{{ serialization }}
+buffer.write(delimiter)
+buffer.write({{ key_text|repr }})
+buffer.write(json.dumps({{ target_expr }}))
+delimiter = ', '
+{% endif %}{# /if a_property.optional #}
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_property(
+        a_property: mapry.Property, auto_id: mapry.py.generate.AutoID,
+        py: mapry.Py) -> str:
+    """
+    Generate the code to write a property of the graph as JSON text.
+
+    :param a_property: the property definition
+    :param auto_id: generator of unique identifiers
+    :param py: Python settings
+    :return: generated code
+    """
+    target_expr = 'jsonable_{}'.format(
+        mapry.py.naming.as_attribute(a_property.name))
+    value_expr = 'instance.{}'.format(
+        mapry.py.naming.as_attribute(a_property.name))
+
+    serialization = _serialize_value(
+        target_expr=target_expr,
+        value_expr=value_expr,
+        a_type=a_property.type,
+        auto_id=auto_id,
+        py=py)
+
+    return _WRITE_PROPERTY_TPL.render(
+        a_property=a_property,
+        value_expr=value_expr,
+        target_expr=target_expr,
+        key_text='{}: '.format(json.dumps(a_property.json)),
+        serialization=serialization).rstrip('\n')
+
+
+_WRITE_GRAPH_JSON_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+def write_{{ graph.name|as_variable }}_json(
+        instance: {{ py.module_name }}.{{ graph.name|as_composite }},
+        fp: typing.TextIO,
+        buffer_size: int = 65536
+) -> None:
+{% set doctext %}
+writes an instance of {{ graph.name|as_composite }} as JSON text to ``fp``.
+
+The text is the same as ``json.dumps(serialize_{{
+    graph.name|as_variable }}(instance))``, but
+{% if graph.classes %}
+the properties and the class instances are serialized one at a time
+{% else %}
+the properties are serialized one at a time
+{% endif %}{# /if graph.classes #}
+so that the whole JSONable never needs to be held in memory.
+
+:param instance: the instance of {{ graph.name|as_composite }} to be written
+:param fp: file-like object to write the JSON text to
+:param buffer_size:
+    number of characters buffered before they are written to ``fp``
+:return:{#
+#}{% endset %}{# /set doctext #}
+    {{ doctext|as_docstring|indent }}
+    buffer = _WriteBuffer(fp=fp, size=buffer_size)
+
+    buffer.write('{')
+    {% if property_writes or graph.classes %}
+    delimiter = ''
+    {% endif %}{# /if property_writes or graph.classes #}
+    {% for property_write in property_writes %}{##
+
+        Write graph properties
+
+    ##}
+
+    {{ property_write|indent }}
+    {% endfor %}{# /for property_write #}
+    {% for cls in graph.classes.values() %}{##
+
+        Write class registries
+
+    ##}
+
+    ##
+    # Write instance registry of {{ cls.name|as_composite }}
+    ##
+
+    if len(instance.{{ cls.plural|as_attribute }}) > 0:
+        buffer.write(delimiter)
+        buffer.write({{ registry_key_texts[cls.name]|repr }})
+
+        registry_delimiter = ''
+        for id, {{ cls.name|as_variable }}_instance in instance.{{
+            cls.plural|as_attribute }}.items():
+            if id != {{ cls.name|as_variable }}_instance.id:
+                raise ValueError(
+                    {{ "Expected ID {!r} of the instance of %s, but got: {!r}"|
+                        format(cls.name|as_composite)|repr }}.format(
+                        id, {{ cls.name|as_variable }}_instance.id))
+
+            buffer.write(registry_delimiter)
+            buffer.write(json.dumps(id))
+            buffer.write(': ')
+            buffer.write(
+                json.dumps(
+                    serialize_{{ cls.name|as_variable }}(
+                        instance={{ cls.name|as_variable }}_instance)))
+            registry_delimiter = ', '
+
+        buffer.write('}')
+        delimiter = ', '
+    {% endfor %}{# /for cls #}
+
+    buffer.write('}')
+    buffer.flush()
+''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _write_graph_json(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the function that writes a mapry graph as JSON text to a file.
 
     :param graph: mapry definition of the object graph
     :param py: Python settings
-    :return: content of the source file
+    :return: generated code
     """
-    blocks = [
-        mapry.py.generate.WARNING,
-        mapry.py.generate.docstring("serializes to JSONable objects."),
-        _imports(graph=graph, py=py)
+    auto_id = mapry.py.generate.AutoID()
+
+    # yapf: disable
+    property_writes = [
+        _write_property(a_property=prop, auto_id=auto_id, py=py)
+        for prop in graph.properties.values()
     ]
+    # yapf: enable
+
+    registry_key_texts = {
+        cls.name: '{}: {{'.format(
+            json.dumps(mapry.naming.json_plural(a_plural=cls.plural)))
+        for cls in graph.classes.values()
+    }
+
+    return _WRITE_GRAPH_JSON_TPL.render(
+        graph=graph,
+        property_writes=property_writes,
+        registry_key_texts=registry_key_texts,
+        py=py).rstrip('\n')
+
+
+def _blocks(graph: mapry.Graph, py: mapry.Py) -> List[Tuple[str, str]]:
+    """
+    Generate the blocks of the code which serializes the object graph.
+
+    Each block is assigned to the submodule where it is defined if
+    the module is split into submodules.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: pairs of the submodule name and the generated code in order
+    """
+    graph_submodule = mapry.py.generate.submodules.name(composite=graph)
+
+    blocks = []  # type: List[Tuple[str, str]]
 
     if mapry.needs_type(a_type=graph, query=mapry.Duration):
-        blocks.append(_duration_to_string())
+        blocks.append(
+            (mapry.py.generate.submodules.COMMON, _duration_to_string()))
 
     nongraph_composites = []  # type: List[Union[mapry.Class, mapry.Embed]]
     nongraph_composites.extend(graph.classes.values())
     nongraph_composites.extend(graph.embeds.values())
 
     for class_or_embed in nongraph_composites:
+        blocks.append((
+            mapry.py.generate.submodules.name(composite=class_or_embed),
+            _serialize_class_or_embed(class_or_embed=class_or_embed, py=py)))
+
+    blocks.append((graph_submodule, _serialize_graph(graph=graph, py=py)))
+
+    if graph.classes and py.coroutines:
+        blocks.append((
+            graph_submodule,
+            _serialize_graph(graph=graph, py=py, is_async=True)))
+
+    if py.track_changes:
         blocks.append(
-            _serialize_class_or_embed(class_or_embed=class_or_embed, py=py))
+            (graph_submodule, _serialize_graph_delta(graph=graph, py=py)))
+
+    blocks.append((graph_submodule, _write_buffer()))
+
+    blocks.append((graph_submodule, _write_graph_json(graph=graph, py=py)))
 
-    blocks.append(_serialize_graph(graph=graph, py=py))
+    return blocks
+
+
+@ensure(lambda result: result.endswith('\n'))
+def generate(graph: mapry.Graph, py: mapry.Py) -> str:
+    """
+    Generate the source file to parse an object graph from a JSONable object.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: content of the source file
+    """
+    blocks = [
+        mapry.py.generate.WARNING,
+        mapry.py.generate.docstring("serializes to JSONable objects."),
+        _imports(graph=graph, py=py)
+    ]
+
+    blocks.extend(code for _, code in _blocks(graph=graph, py=py))
 
     blocks.append(mapry.py.generate.WARNING)
 
     return '\n\n\n'.join(blocks) + '\n'
+
+
+def generate_files(graph: mapry.Graph,
+                   py: mapry.Py) -> MutableMapping[str, str]:
+    """
+    Generate the source files to serialize an object graph to a JSONable.
+
+    If ``split_modules`` is set, the code is split into a package with
+    a submodule for each class and embeddable structure.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :return: content of the source files relative to the generated directory
+    """
+    if not py.split_modules:
+        return collections.OrderedDict([
+            ('tojsonable.py', generate(graph=graph, py=py))
+        ])
+
+    submodules = collections.OrderedDict(
+    )  # type: MutableMapping[str, List[str]]
+    for submodule, code in _blocks(graph=graph, py=py):
+        submodules.setdefault(submodule, []).append(code)
+
+    files = mapry.py.generate.submodules.split(
+        package='{}.tojsonable'.format(py.module_name),
+        docstring="serializes to JSONable objects.",
+        imports=_imports(graph=graph, py=py),
+        submodules=submodules,
+        submodule_descriptions=mapry.py.generate.submodules.descriptions(
+            graph=graph, template="serializes {} to JSONable objects."))
+
+    return collections.OrderedDict(('tojsonable/{}'.format(filename), code)
+                                   for filename, code in files.items())
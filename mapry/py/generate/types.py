@@ -1,5 +1,5 @@
 """Generate the code that defines the types of the object graph."""
-from typing import List  # pylint: disable=unused-import
+from typing import List, Optional, Set  # pylint: disable=unused-import
 
 from icontract import ensure
 
@@ -55,7 +55,24 @@ def _imports(graph: mapry.Graph, py: mapry.Py) -> str:
         # Needed for the initialization of class registries
         stdlib_block.add('import collections')
 
-    return '\n'.join(sorted(stdlib_block))
+    if py.track_changes:
+        stdlib_block.add('import itertools')
+
+    block_strs = ['\n'.join(sorted(stdlib_block))]
+
+    third_party_block = set()  # type: Set[str]
+
+    if mapry.py.generate.needs_numpy(graph=graph, py=py):
+        third_party_block.update(('import numpy', 'import numpy.typing'))
+
+    if mapry.TimeZone in mapry.py.generate.lazily_decoded_types(graph=graph,
+                                                                py=py):
+        third_party_block.add('import pytz')
+
+    if third_party_block:
+        block_strs.append('\n'.join(sorted(third_party_block)))
+
+    return '\n\n'.join(block_strs)
 
 
 @ensure(lambda result: result == result.strip())
@@ -86,6 +103,9 @@ def _type_repr(
         return repr(mapry.py.naming.as_composite(a_type.name))
 
     elif isinstance(a_type, mapry.Array):
+        if mapry.py.generate.is_numpy_array(a_type=a_type, py=py):
+            return mapry.py.generate.type_repr(a_type=a_type, py=py)
+
         return 'typing.List[{}]'.format(
             _type_repr(
                 a_type=a_type.values,
@@ -103,6 +123,319 @@ def _type_repr(
         return mapry.py.generate.type_repr(a_type=a_type, py=py)
 
 
+_DEFINE_LAZILY_DECODED = '''\
+T = typing.TypeVar('T')
+
+
+class _LazilyDecoded(typing.Generic[T]):
+    """
+    decodes the string stored in an attribute on the first access.
+
+    The parsers store the validated string so that the value is decoded only
+    if it is actually accessed. The decoded value replaces the string.
+    Assigning a decoded value stores it as-is.
+    """
+
+    def __init__(self, name: str, decode: typing.Callable[[str], T]) -> None:
+        """
+        initializes the descriptor.
+
+        :param name: name of the attribute storing the string or the value
+        :param decode: decodes the value from the string
+        """
+        self.name = name
+        self.decode = decode
+
+    @typing.overload
+    def __get__(
+            self, instance: None, owner: typing.Any) -> '_LazilyDecoded[T]':
+        ...
+
+    @typing.overload
+    def __get__(self, instance: object, owner: typing.Any) -> T:
+        ...
+
+    def __get__(
+            self, instance: typing.Optional[object],
+            owner: typing.Any) -> typing.Any:
+        """gives the value decoding the stored string if necessary."""
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.name)
+        if isinstance(value, str):
+            value = self.decode(value)
+            object.__setattr__(instance, self.name, value)
+
+        return value
+
+    def __set__(self, instance: object, value: typing.Union[str, T]) -> None:
+        """stores the string to be decoded or the decoded value."""
+        setattr(instance, self.name, value)'''
+
+
+@ensure(lambda result: all(not line.endswith('\n') for line in result))
+def _descriptors(properties: List[mapry.Property], py: mapry.Py) -> List[str]:
+    """
+    Generate the definitions of the descriptors of lazily decoded properties.
+
+    :param properties: properties of the composite
+    :param py: Python settings
+    :return: generated code of a descriptor for each lazily decoded property
+    """
+    result = []  # type: List[str]
+    for prop in properties:
+        if not mapry.py.generate.is_lazily_decoded(prop=prop, py=py):
+            continue
+
+        attribute = mapry.py.naming.as_attribute(identifier=prop.name)
+
+        if isinstance(prop.type, mapry.Path):
+            decode = 'pathlib.Path'
+        elif isinstance(prop.type, mapry.TimeZone):
+            decode = 'pytz.timezone'
+        else:
+            raise NotImplementedError(
+                "Unhandled lazy decoding of type: {}".format(prop.type))
+
+        value_type = mapry.py.generate.type_repr(a_type=prop.type, py=py)
+        if prop.optional:
+            value_type = 'typing.Optional[{}]'.format(value_type)
+
+        result.append(
+            '{0} = _LazilyDecoded(\n'
+            '    {1!r}, {2}\n'
+            ')  # type: _LazilyDecoded[{3}]'.format(
+                attribute, '_' + attribute, decode, value_type))
+
+    return result
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _slots(attributes: List[str]) -> str:
+    """
+    Generate the ``__slots__`` declaration of a composite.
+
+    :param attributes: names of the instance attributes
+    :return: generated code
+    """
+    if not attributes:
+        return '__slots__ = ()'
+
+    parts = ['__slots__ = (']
+    for attribute in attributes:
+        parts.append('    {!r},'.format(attribute))
+    parts.append(')')
+
+    return '\n'.join(parts)
+
+
+_DEFINE_CHANGE_TRACKING = '''\
+# Revisions are drawn from a single counter so that the changes of all
+# the object graphs can be compared against a checkpoint.
+_REVISIONS = itertools.count(1)
+
+
+def checkpoint() -> int:
+    """
+    marks the point after which the changes are serialized by the deltas.
+
+    :return: revision to be passed as ``since`` to the delta serialization
+    """
+    return next(_REVISIONS)'''
+
+_DEFINE_TRACKED_REGISTRY = '''\
+class TrackedRegistry(collections.OrderedDict):  # type: ignore
+    """
+    records the changes of a class registry.
+
+    The registry keeps the revision of the last change for each identifier of
+    an added, changed or removed instance in the order of the changes so that
+    the changes since a checkpoint are listed without visiting the unchanged
+    instances.
+
+    The instances notify the registry they were last inserted into whenever
+    their attributes are set. Call ``touch`` if you modify an attribute
+    in place (*e.g.*, append to a list).
+    """
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """initializes the registry recording the given instances as added."""
+        self.revisions = collections.OrderedDict(
+        )  # type: collections.OrderedDict[str, int]
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, id: str, instance: typing.Any) -> None:
+        """inserts the instance and records it as changed."""
+        super().__setitem__(id, instance)
+        object.__setattr__(instance, '_tracker', self)
+        self.touch(id)
+
+    def __delitem__(self, id: str) -> None:
+        """removes the instance and records it as removed."""
+        instance = self[id]
+        super().__delitem__(id)
+        if getattr(instance, '_tracker', None) is self:
+            object.__setattr__(instance, '_tracker', None)
+        self.touch(id)
+
+    def pop(self, id: str, *args: typing.Any) -> typing.Any:
+        """removes the instance and records it as removed."""
+        if args and id not in self:
+            return args[0]
+
+        instance = self[id]
+        del self[id]
+        return instance
+
+    def popitem(self, last: bool = True) -> typing.Tuple[str, typing.Any]:
+        """removes the last or the first instance and records it as removed."""
+        if not self:
+            raise KeyError('dictionary is empty')
+
+        id = next(reversed(self)) if last else next(iter(self))
+        return id, self.pop(id)
+
+    def clear(self) -> None:
+        """removes all the instances and records them as removed."""
+        for id in list(self):
+            del self[id]
+
+    def touch(self, id: str) -> None:
+        """
+        records that the instance has been changed.
+
+        :param id: identifier of the instance
+        """
+        self.revisions[id] = next(_REVISIONS)
+        self.revisions.move_to_end(id)
+
+    def changed_since(self, since: int) -> typing.List[str]:
+        """
+        lists the identifiers of the instances changed after the checkpoint.
+
+        :param since: revision given by ``checkpoint()``
+        :return:
+            identifiers of the added, changed and removed instances
+            in the order of the changes
+        """
+        result = []  # type: typing.List[str]
+        for id in reversed(self.revisions):
+            if self.revisions[id] <= since:
+                break
+
+            result.append(id)
+
+        result.reverse()
+        return result
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """pickles the instances without the revisions."""
+        return (self.__class__, (), None, None, iter(self.items()))'''
+
+_TRACKING_SETATTR = '''\
+def __setattr__(self, name: str, value: typing.Any) -> None:
+    """sets the attribute and records the change in the registry."""
+    object.__setattr__(self, name, value)
+
+    tracker = getattr(self, '_tracker', None)
+    if tracker is not None:
+        tracker.touch(self.id)'''
+
+_GRAPH_TRACKING_SETATTR_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+def __setattr__(self, name: str, value: typing.Any) -> None:
+    {% if graph.classes %}
+    """
+    sets the attribute and records the change.
+
+    The class registries given as dictionaries are converted to
+    TrackedRegistry. Replacing a registry records all its instances
+    as changed and the instances missing from it as removed.
+    """
+    if name not in (
+            {% for cls in graph.classes.values() %}
+            {{ cls.plural|as_attribute|repr }},
+            {% endfor %}{# /for cls #}
+    ):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_revision', next(_REVISIONS))
+        return
+
+    previous = getattr(self, name, None)
+    if isinstance(value, dict) and value is not previous:
+        if isinstance(value, TrackedRegistry):
+            for id in value:
+                value.touch(id)
+        else:
+            value = TrackedRegistry(value)
+
+        if previous is not None:
+            for id in previous:
+                if id not in value:
+                    value.touch(id)
+
+    object.__setattr__(self, name, value)
+    {% else %}
+    """sets the attribute and records the change."""
+    object.__setattr__(self, name, value)
+    object.__setattr__(self, '_revision', next(_REVISIONS))
+    {% endif %}{# /if graph.classes #}''')
+
+_PICKLING_TPL = mapry.py.jinja2_env.ENV.from_string(
+    '''\
+def __getstate__(self) -> typing.Tuple[typing.Any, ...]:
+    """gives the attributes in the order of the properties for pickling."""
+    return (
+        {% for expr in state_exprs %}
+        {{ expr }},
+        {% endfor %}{# /for expr #}
+    )
+
+def __setstate__(self, state: typing.Tuple[typing.Any, ...]) -> None:
+    """restores the attributes from the state given by ``__getstate__``."""
+    (
+        {% for target in state_targets %}
+        {{ target }},
+        {% endfor %}{# /for target #}
+    ) = state
+    {% for cls in classes %}
+
+    self.{{ cls.plural|as_attribute }} = collections.OrderedDict(
+        (instance.id, instance) for instance in {{ cls.plural|as_variable }})
+    {% endfor %}{# /for cls #}''')
+
+
+@ensure(lambda result: not result.endswith('\n'))
+def _pickling(attributes: List[str], classes: List[mapry.Class]) -> str:
+    """
+    Generate the methods which pickle a composite as a tuple of attributes.
+
+    The default pickling stores the name of every attribute with each
+    instance, while the tuple stores only the values.
+
+    The class registries are pickled as lists of instances and restored as
+    ordered dictionaries keyed by the instance identifiers so that
+    the identifiers are not stored twice.
+
+    :param attributes: names of the instance attributes
+    :param classes: classes whose registries are stored after the attributes
+    :return: generated code
+    """
+    state_exprs = ['self.{}'.format(attribute) for attribute in attributes]
+    state_targets = list(state_exprs)
+
+    for cls in classes:
+        state_exprs.append(
+            'list(self.{}.values())'.format(
+                mapry.py.naming.as_attribute(identifier=cls.plural)))
+        state_targets.append(mapry.py.naming.as_variable(identifier=cls.plural))
+
+    return _PICKLING_TPL.render(
+        state_exprs=state_exprs, state_targets=state_targets,
+        classes=classes).rstrip()
+
+
 _DEFINE_CLASS_TPL = mapry.py.jinja2_env.ENV.from_string(
     '''\
 class {{ cls.name|as_composite }}:
@@ -110,6 +443,14 @@ class {{ cls.name|as_composite }}:
     {{ cls.description|as_docstring|indent }}
 
     {% endif %}{# /if cls.description #}
+    {% if slots %}
+    {{ slots|indent }}
+
+    {% endif %}{# /if slots #}
+    {% for descriptor in descriptors %}
+    {{ descriptor|indent }}
+
+    {% endfor %}{# /for descriptor #}
     def __init__(
             self,
             id: str{{ ',' if properties else ') -> None:' }}
@@ -142,6 +483,14 @@ initializes an instance of {{ cls.name|as_composite }} with the given values.
                 prop.name|as_attribute }} is not None else None
         {% endif %}{# /if not prop.optional #}
         {% endfor %}{# /for prop #}
+    {% if tracking %}
+
+    {{ tracking|indent }}
+    {% endif %}{# /if tracking #}
+    {% if pickling %}
+
+    {{ pickling|indent }}
+    {% endif %}{# /if pickling #}
 ''')
 
 _DEFINE_PROPERTYLESS_STRUCTURE_TPL = mapry.py.jinja2_env.ENV.from_string(
@@ -149,6 +498,12 @@ _DEFINE_PROPERTYLESS_STRUCTURE_TPL = mapry.py.jinja2_env.ENV.from_string(
 class {{ composite.name|as_composite }}:
     {% if composite.description %}
     {{ composite.description|as_docstring|indent }}
+    {% if slots %}
+
+    {{ slots|indent }}
+    {% endif %}{# /if slots #}
+    {% elif slots %}
+    {{ slots|indent }}
     {% else %}
     pass
     {% endif %}{# /if composite.description #}
@@ -161,6 +516,14 @@ class {{ embed.name|as_composite }}:
     {{ embed.description|as_docstring|indent }}
 
     {% endif %}{# /if embed.description #}
+    {% if slots %}
+    {{ slots|indent }}
+
+    {% endif %}{# /if slots #}
+    {% for descriptor in descriptors %}
+    {{ descriptor|indent }}
+
+    {% endfor %}{# /for descriptor #}
     def __init__(
             self,
         {% for prop in properties %}
@@ -190,6 +553,10 @@ initializes an instance of {{ embed.name|as_composite }} with the given values.
                 prop.name|as_attribute }} is not None else None
         {% endif %}{# /if not prop.optional #}
         {% endfor %}{# /for prop #}
+    {% if pickling %}
+
+    {{ pickling|indent }}
+    {% endif %}{# /if pickling #}
 ''')
 
 
@@ -222,8 +589,25 @@ def _define_class(
     }
     # yapf: enable
 
+    attributes = ['id'] + [
+        mapry.py.generate.stored_attribute(prop=prop, py=py)
+        for prop in properties
+    ]
+
+    # The registry is notified about the changes through this attribute.
+    slotted_attributes = (
+        attributes + ['_tracker'] if py.track_changes else attributes)
+
     return _DEFINE_CLASS_TPL.render(
-        cls=cls, properties=properties, property_type=property_type).rstrip()
+        cls=cls,
+        properties=properties,
+        property_type=property_type,
+        slots=_slots(attributes=slotted_attributes) if py.slots else None,
+        descriptors=_descriptors(properties=properties, py=py),
+        tracking=_TRACKING_SETATTR if py.track_changes else None,
+        pickling=(
+            _pickling(attributes=attributes, classes=[])
+            if py.compact_pickling else None)).rstrip()
 
 
 @ensure(lambda result: not result.endswith('\n'))
@@ -240,7 +624,8 @@ def _define_embed(
     """
     if len(embed.properties) == 0:
         return _DEFINE_PROPERTYLESS_STRUCTURE_TPL.render(
-            composite=embed).rstrip()
+            composite=embed,
+            slots=_slots(attributes=[]) if py.slots else None).rstrip()
 
     properties = mapry.py.generate.order_by_optional(embed.properties)
 
@@ -259,9 +644,20 @@ def _define_embed(
     }
     # yapf: enable
 
+    attributes = [
+        mapry.py.generate.stored_attribute(prop=prop, py=py)
+        for prop in properties
+    ]
+
     return _DEFINE_EMBED_TPL.render(
-        embed=embed, properties=properties,
-        property_type=property_type).rstrip()
+        embed=embed,
+        properties=properties,
+        property_type=property_type,
+        slots=_slots(attributes=attributes) if py.slots else None,
+        descriptors=_descriptors(properties=properties, py=py),
+        pickling=(
+            _pickling(attributes=attributes, classes=[])
+            if py.compact_pickling else None)).rstrip()
 
 
 _DEFINE_GRAPH_TPL = mapry.py.jinja2_env.ENV.from_string(
@@ -270,6 +666,10 @@ _DEFINE_GRAPH_TPL = mapry.py.jinja2_env.ENV.from_string(
     {{ graph.description|as_docstring|indent }}
 
     {% endif %}{# /if graph.description #}
+    {% if slots %}
+    {{ slots|indent }}
+
+    {% endif %}{# /if slots #}
     def __init__(
             self,
             {% for arg in arguments %}
@@ -309,6 +709,14 @@ The class registries are initialized with empty ordered dictionaries.
         else:
             self.{{ cls.plural|as_attribute }} = collections.OrderedDict()
         {% endfor %}{# /for cls in graph.classes.values() #}
+    {% if tracking %}
+
+    {{ tracking|indent }}
+    {% endif %}{# /if tracking #}
+    {% if pickling %}
+
+    {{ pickling|indent }}
+    {% endif %}{# /if pickling #}
 ''')
 
 
@@ -326,7 +734,8 @@ def _define_graph(
     """
     if len(graph.properties) == 0 and len(graph.classes) == 0:
         return _DEFINE_PROPERTYLESS_STRUCTURE_TPL.render(
-            composite=graph).rstrip()
+            composite=graph,
+            slots=_slots(attributes=[]) if py.slots else None).rstrip()
 
     composite_i = definition_order.index(graph)
     assert composite_i != -1, \
@@ -365,12 +774,43 @@ def _define_graph(
             "{}: typing.Optional[typing.MutableMapping[str, {}]] = None".format(
                 argname, type_annotation))
 
+    slots = None  # type: Optional[str]
+    if py.slots:
+        # yapf: disable
+        slots = _slots(
+            attributes=[
+                mapry.py.naming.as_attribute(identifier=prop.name)
+                for prop in properties
+            ] + [
+                mapry.py.naming.as_attribute(identifier=cls.plural)
+                for cls in graph.classes.values()
+            ] + (['_revision'] if py.track_changes else []))
+        # yapf: enable
+
+    pickling = None  # type: Optional[str]
+    if py.compact_pickling:
+        pickling = _pickling(
+            attributes=[
+                mapry.py.naming.as_attribute(identifier=prop.name)
+                for prop in properties
+            ],
+            classes=list(graph.classes.values()))
+
     ##
     # Render the template
     ##
 
+    tracking = None  # type: Optional[str]
+    if py.track_changes:
+        tracking = _GRAPH_TRACKING_SETATTR_TPL.render(graph=graph).rstrip()
+
     return _DEFINE_GRAPH_TPL.render(
-        graph=graph, arguments=arguments, properties=properties).rstrip()
+        graph=graph,
+        arguments=arguments,
+        properties=properties,
+        slots=slots,
+        tracking=tracking,
+        pickling=pickling).rstrip()
 
 
 @ensure(lambda result: result.endswith('\n'))
@@ -389,6 +829,15 @@ def generate(graph: mapry.Graph, py: mapry.Py) -> str:
 
     blocks.append(_imports(graph=graph, py=py))
 
+    if mapry.py.generate.lazily_decoded_types(graph=graph, py=py):
+        blocks.append(_DEFINE_LAZILY_DECODED)
+
+    if py.track_changes:
+        blocks.append(_DEFINE_CHANGE_TRACKING)
+
+        if graph.classes:
+            blocks.append(_DEFINE_TRACKED_REGISTRY)
+
     definition_order = []  # type: List[mapry.Composite]
     definition_order.extend(graph.classes.values())
     definition_order.extend(graph.embeds.values())
@@ -269,4 +269,15 @@ def validate_schema(schema: mapry.Schema) -> List[mapry.validation.SchemaError]:
     # (including the class registries)
     errs.extend(_validate_graph_attributes(graph=schema.graph))
 
+    # Check that the settings are compatible
+    if (schema.py is not None and schema.py.compile_ready
+            and schema.py.split_modules):
+        errs.append(
+            mapry.validation.SchemaError(
+                message=(
+                    "The Python settings compile_ready and split_modules "
+                    "are mutually exclusive since only the modules which are "
+                    "not split can be compiled"),
+                ref='{}/py'.format(schema.graph.ref)))
+
     return errs
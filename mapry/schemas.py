@@ -98,6 +98,13 @@ GRAPH = {
                     "defines the indention of the generated code."
                     "Defaults to two spaces.",
                     "pattern": "^[ \t]*$"
+                },
+                "trusted_input": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the generated parsers skip checking "
+                    "the constraints on the values. Defaults to false."
                 }
             },
             "required":
@@ -113,6 +120,13 @@ GRAPH = {
                     "description":
                     "indicates the package of the generated code.",
                     "pattern": "^[a-zA-Z][a-zA-Z0-9_]*"
+                },
+                "trusted_input": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the generated parsers skip checking "
+                    "the constraints on the values. Defaults to false."
                 }
             },
             "required": ["package"],
@@ -149,6 +163,99 @@ GRAPH = {
                     "defines the indention of the generated code. "
                     "Defaults to four spaces.",
                     "pattern": "^[ \t]*$"
+                },
+                "slots": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the generated classes define "
+                    "__slots__. Defaults to false."
+                },
+                "trusted_input": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the generated parsers skip checking "
+                    "the constraints on the values. Defaults to false."
+                },
+                "numeric_array_as": {
+                    "type":
+                    "string",
+                    "description":
+                    "defines the type of the arrays of integers and floats "
+                    "in the generated code. Defaults to list.",
+                    "enum": ["list", "numpy"]
+                },
+                "lazy_decoding": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the properties represented as "
+                    "pathlib.Path or pytz.timezone are decoded only "
+                    "on the first access. Defaults to false."
+                },
+                "compact_pickling": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the generated classes pickle their "
+                    "attributes as tuples. Defaults to false."
+                },
+                "track_changes": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the generated classes record "
+                    "the changes so that only the changes can be serialized. "
+                    "Defaults to false."
+                },
+                "split_modules": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the parsing and the serialization "
+                    "modules are split into a package with a submodule "
+                    "per class and embeddable structure imported on demand. "
+                    "Defaults to false."
+                },
+                "compile_ready": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the generated code avoids "
+                    "the constructs which prevent the compilation with mypyc "
+                    "and a build script is generated. Defaults to false."
+                },
+                "lazy_registries": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the graph can be parsed lazily so "
+                    "that the instances are parsed only on the first access "
+                    "to a registry. Defaults to false."
+                },
+                "coroutines": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the coroutines are generated to parse"
+                    " and serialize the graph in an asyncio event loop. "
+                    "Defaults to false."
+                },
+                "parallel_parsing": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the graph can be parsed in a pool of "
+                    "worker processes. Defaults to false."
+                },
+                "iter_registries": {
+                    "type":
+                    "boolean",
+                    "description":
+                    "indicates whether the instances of a class registry can"
+                    " be iterated over incrementally from a JSON file. "
+                    "Defaults to false."
                 }
             },
             "required": ['module_name', 'path_as', 'timezone_as'],
@@ -148,3 +148,183 @@ def validate_time_tokens(token_lines: List[List[lexery.Token]]
                         token.content))
 
     return None
+
+
+# Numeric directives which are zero-padded to a fixed width
+# mapped to their width.
+FIXED_WIDTH_DIRECTIVES = collections.OrderedDict([
+    ("%Y", 4),  # Year with century
+    ("%m", 2),  # Month of the year (01..12)
+    ("%d", 2),  # Day of the month (01..31)
+    ("%H", 2),  # Hour of the day, 24-hour clock (00..23)
+    ("%M", 2),  # Minute of the hour (00..59)
+    ("%S", 2),  # Second of the minute (00..59)
+])
+
+
+class FixedWidthField:
+    """Represent a fixed-width numeric field of a date/time string."""
+
+    def __init__(self, directive: str, start: int, end: int) -> None:
+        """
+        Initialize with the given values.
+
+        :param directive: strftime directive of the field
+        :param start: offset of the first digit
+        :param end: offset after the last digit
+        """
+        self.directive = directive
+        self.start = start
+        self.end = end
+
+
+class FixedWidthLiteral:
+    """Represent a literal text of a date/time string at a fixed offset."""
+
+    def __init__(self, text: str, start: int) -> None:
+        """
+        Initialize with the given values.
+
+        :param text: content of the literal
+        :param start: offset of the literal
+        """
+        self.text = text
+        self.start = start
+
+
+class FixedWidthFormat:
+    """Represent a date/time format whose all fields are at fixed offsets."""
+
+    def __init__(
+            self, format: str, identifier: str, length: int,
+            fields: List[FixedWidthField],
+            literals: List[FixedWidthLiteral]) -> None:
+        """
+        Initialize with the given values.
+
+        :param format: strftime format
+        :param identifier:
+            identifier derived from the format; it is unique for each format
+            and can be used as a part of the identifiers in the generated code
+        :param length: length of the date/time string
+        :param fields: numeric fields in order of appearance
+        :param literals: literal texts in order of appearance
+        """
+        # pylint: disable=redefined-builtin
+        self.format = format
+        self.identifier = identifier
+        self.length = length
+        self.fields = fields
+        self.literals = literals
+
+        self.directives = {field.directive for field in fields}
+
+    def has_date(self) -> bool:
+        """Return True if the format contains the date fields."""
+        return "%Y" in self.directives
+
+
+def fixed_width_format(format: str) -> Optional[FixedWidthFormat]:
+    """
+    Compile the date/time format to fixed offsets, if possible.
+
+    The format can be compiled if it consists only of fixed-width numeric
+    directives and literal text, no directive repeats and the date is either
+    given completely (year, month and day) or not at all. Only ASCII formats
+    are compiled so that the offsets are the same for characters and bytes.
+
+    The compiled format allows the generated code to scan the zero-padded
+    date/time strings directly instead of calling a general-purpose parsing
+    routine. The generated code still needs to fall back to
+    the general-purpose routine for all the other strings (*e.g.*, without
+    zero padding).
+
+    :param format: strftime format
+    :return: compiled format, or None if the format can not be compiled
+
+    >>> fmt = fixed_width_format(format='%Y-%m-%dT%H:%M:%SZ')
+    >>> fmt.length
+    20
+    >>> for field in fmt.fields:
+    ...     print(field.directive, field.start, field.end)
+    %Y 0 4
+    %m 5 7
+    %d 8 10
+    %H 11 13
+    %M 14 16
+    %S 17 19
+    >>> [(literal.text, literal.start) for literal in fmt.literals]
+    [('-', 4), ('-', 7), ('T', 10), (':', 13), (':', 16), ('Z', 19)]
+    >>> fmt.identifier
+    'Y_45_m_45_d_84_H_58_M_58_S_90'
+
+    >>> fixed_width_format(format='%Y-%m-%d %Z') is None
+    True
+
+    >>> fixed_width_format(format='%m/%d') is None
+    True
+
+    """
+    # pylint: disable=redefined-builtin
+    # pylint: disable=too-many-return-statements
+    if any(ord(char) >= 128 for char in format):
+        return None
+
+    try:
+        token_lines = tokenize(format=format)
+    except (lexery.Error, NotImplementedError):
+        return None
+
+    # Multi-line formats are not supported since the tokenizer drops
+    # the new lines.
+    if len(token_lines) != 1:
+        return None
+
+    fields = []  # type: List[FixedWidthField]
+    literals = []  # type: List[FixedWidthLiteral]
+    identifier_parts = []  # type: List[str]
+
+    offset = 0
+    for token in token_lines[0]:
+        if token.identifier == 'directive' and token.content == '%%':
+            literals.append(FixedWidthLiteral(text='%', start=offset))
+            identifier_parts.append(str(ord('%')))
+            offset += 1
+
+        elif token.identifier == 'directive':
+            if token.content not in FIXED_WIDTH_DIRECTIVES:
+                return None
+
+            if any(field.directive == token.content for field in fields):
+                return None
+
+            width = FIXED_WIDTH_DIRECTIVES[token.content]
+            fields.append(
+                FixedWidthField(
+                    directive=token.content, start=offset, end=offset + width))
+            identifier_parts.append(token.content[1:])
+            offset += width
+
+        elif token.identifier == 'text':
+            literals.append(FixedWidthLiteral(text=token.content, start=offset))
+            identifier_parts.extend(str(ord(char)) for char in token.content)
+            offset += len(token.content)
+
+        else:
+            raise NotImplementedError(
+                "Unhandled token: {}".format(token.identifier))
+
+    directives = {field.directive for field in fields}
+    if not directives:
+        return None
+
+    date_directives = directives.intersection({"%Y", "%m", "%d"})
+    if date_directives and len(date_directives) != 3:
+        return None
+
+    return FixedWidthFormat(
+        format=format,
+        identifier='_'.join(identifier_parts),
+        length=offset,
+        fields=fields,
+        literals=literals)
@@ -63,6 +63,7 @@ setup(
             'temppathlib>=1.0.3,<2',
         ],
         'testpy': [
+            'numpy>=1.21',
             'pytz==2018.9',
             'temppathlib>=1.0.3,<2',
 
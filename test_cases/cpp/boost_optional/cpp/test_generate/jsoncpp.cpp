@@ -89,14 +89,14 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Pre-allocate empties
   ////
 
-  std::string empties_ref;
-  empties_ref.reserve(ref.size() + 8);
-  empties_ref += ref;
-  empties_ref += "/empties";
+  const parse::Ref empties_ref(
+    graph_ref, "empties");
 
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
@@ -148,36 +148,21 @@ void some_graph_from(
     return;
   }
 
-  // Keep the prefix fixed in this buffer so that
-  // it is copied as little as possible
-  std::string instance_ref;
-
   ////
   // Parse empties
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += empties_ref;
-  instance_ref += '/';
-
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        empties_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        empties_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       Empty* instance(
-        target->empties.at(it.name()).get());
+        target->empties.at(id).get());
       empty_from(
         *it,
-        instance_ref,
+        parse::Ref(empties_ref, id),
         instance,
         errors);
 
@@ -201,8 +186,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_reference"),
+        parse::Ref(graph_ref, "optional_reference"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -217,8 +201,7 @@ void some_graph_from(
           " not found: ");
 
         errors->add(
-          std::string(ref)
-            .append("/optional_reference"),
+          parse::Ref(graph_ref, "optional_reference"),
           message(
             reference_not_found,
             strlen(reference_not_found),
@@ -243,8 +226,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_path"),
+        parse::Ref(graph_ref, "optional_path"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -272,8 +254,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_array"),
+        parse::Ref(graph_ref, "optional_array"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -289,10 +270,7 @@ void some_graph_from(
             "Expected an int64, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/optional_array")
-              .append("/")
-              .append(std::to_string(i_2)),
+            parse::Ref(parse::Ref(graph_ref, "optional_array"), i_2),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -326,8 +304,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_map"),
+        parse::Ref(graph_ref, "optional_map"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -342,10 +319,7 @@ void some_graph_from(
             "Expected an int64, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/optional_map")
-              .append("/")
-              .append(it_4.name()),
+            parse::Ref(parse::Ref(graph_ref, "optional_map"), it_4.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -368,7 +342,7 @@ void some_graph_from(
 
 void empty_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     Empty* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -83,14 +83,14 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Pre-allocate errors
   ////
 
-  std::string errors_ref;
-  errors_ref.reserve(ref.size() + 7);
-  errors_ref += ref;
-  errors_ref += "/errors";
+  const parse::Ref errors_ref(
+    graph_ref, "errors");
 
   if (value.isMember("errors")) {
     const Json::Value& obj = value["errors"];
@@ -122,36 +122,21 @@ void some_graph_from(
     return;
   }
 
-  // Keep the prefix fixed in this buffer so that
-  // it is copied as little as possible
-  std::string instance_ref;
-
   ////
   // Parse errors
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += errors_ref;
-  instance_ref += '/';
-
   if (value.isMember("errors")) {
     const Json::Value& obj = value["errors"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        errors_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        errors_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       Error* instance(
-        target->errors.at(it.name()).get());
+        target->errors.at(id).get());
       error_from(
         *it,
-        instance_ref,
+        parse::Ref(errors_ref, id),
         instance,
         errors);
 
@@ -167,7 +152,7 @@ void some_graph_from(
 
 void error_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     Error* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
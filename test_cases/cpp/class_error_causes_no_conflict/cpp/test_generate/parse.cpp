@@ -2,6 +2,7 @@
 
 #include "parse.h"
 
+#include <cstring>
 #include <string>
 #include <vector>
 
@@ -10,6 +11,52 @@ namespace graph {
 
 namespace parse {
 
+Ref::Ref(const std::string& root) :
+  parent_(nullptr),
+  key_(root.c_str()),
+  key_size_(root.size()),
+  index_(0) {}
+
+Ref::Ref(const Ref& parent, const char* key) :
+  parent_(&parent),
+  key_(key),
+  key_size_(strlen(key)),
+  index_(0) {}
+
+Ref::Ref(const Ref& parent, const std::string& key) :
+  parent_(&parent),
+  key_(key.c_str()),
+  key_size_(key.size()),
+  index_(0) {}
+
+Ref::Ref(const Ref& parent, size_t index) :
+  parent_(&parent),
+  key_(nullptr),
+  key_size_(0),
+  index_(index) {}
+
+std::string Ref::str() const {
+  std::vector<const Ref*> refs;
+  for (const Ref* ref = this; ref != nullptr; ref = ref->parent_) {
+    refs.push_back(ref);
+  }
+
+  std::string result;
+  for (auto it = refs.rbegin(); it != refs.rend(); ++it) {
+    const Ref* ref = *it;
+    if (ref->parent_ != nullptr) {
+      result += '/';
+    }
+
+    if (ref->key_ != nullptr) {
+      result.append(ref->key_, ref->key_size_);
+    } else {
+      result.append(std::to_string(ref->index_));
+    }
+  }
+  return result;
+}
+
 Errors::Errors(size_t cap) : cap_(cap) {}
 
 void Errors::reserve(size_t expected_errors) {
@@ -22,6 +69,12 @@ void Errors::add(const std::string& ref, const std::string& message) {
   }
 }
 
+void Errors::add(const Ref& ref, const std::string& message) {
+  if (errors_.size() < cap_) {
+    errors_.emplace_back(Error{ref.str(), message});
+  }
+}
+
 bool Errors::full() const {
   return errors_.size() == cap_;
 }
@@ -85,13 +85,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_date
   ////
 
   if (!value.isMember("some_date")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_date");
   } else {
     const Json::Value& value_0 = value["some_date"];
@@ -100,8 +102,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_date"),
+        parse::Ref(graph_ref, "some_date"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -122,8 +123,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_date"),
+          parse::Ref(graph_ref, "some_date"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -141,7 +141,7 @@ void some_graph_from(
 
   if (!value.isMember("formatless_date")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: formatless_date");
   } else {
     const Json::Value& value_1 = value["formatless_date"];
@@ -150,8 +150,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/formatless_date"),
+        parse::Ref(graph_ref, "formatless_date"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -172,8 +171,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/formatless_date"),
+          parse::Ref(graph_ref, "formatless_date"),
           message(
             expected_but_got,
             strlen(expected_but_got),
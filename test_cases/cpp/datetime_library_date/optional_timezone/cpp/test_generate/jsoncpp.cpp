@@ -85,6 +85,8 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_time_zone
   ////
@@ -96,8 +98,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_time_zone"),
+        parse::Ref(graph_ref, "some_time_zone"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -113,8 +114,7 @@ void some_graph_from(
           "Expected a valid IANA time zone, but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_time_zone"),
+          parse::Ref(graph_ref, "some_time_zone"),
           message(
             expected_but_got,
             strlen(expected_but_got),
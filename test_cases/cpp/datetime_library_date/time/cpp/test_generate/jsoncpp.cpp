@@ -85,13 +85,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_time
   ////
 
   if (!value.isMember("some_time")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_time");
   } else {
     const Json::Value& value_0 = value["some_time"];
@@ -100,8 +102,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_time"),
+        parse::Ref(graph_ref, "some_time"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -123,8 +124,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_time"),
+          parse::Ref(graph_ref, "some_time"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -145,7 +145,7 @@ void some_graph_from(
 
   if (!value.isMember("formatless_time")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: formatless_time");
   } else {
     const Json::Value& value_1 = value["formatless_time"];
@@ -154,8 +154,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/formatless_time"),
+        parse::Ref(graph_ref, "formatless_time"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -177,8 +176,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/formatless_time"),
+          parse::Ref(graph_ref, "formatless_time"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_float
   ////
 
   if (!value.isMember("some_float")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_float");
   } else {
     const Json::Value& value_0 = value["some_float"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected a double, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_float"),
+        parse::Ref(graph_ref, "some_float"),
         message(
           expected_but_got,
           strlen(expected_but_got),
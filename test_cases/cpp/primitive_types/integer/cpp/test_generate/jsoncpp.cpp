@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_int
   ////
 
   if (!value.isMember("some_int")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_int");
   } else {
     const Json::Value& value_0 = value["some_int"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an int64, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_int"),
+        parse::Ref(graph_ref, "some_int"),
         message(
           expected_but_got,
           strlen(expected_but_got),
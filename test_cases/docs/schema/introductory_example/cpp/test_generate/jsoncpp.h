@@ -33,13 +33,13 @@ void pipeline_from(
  * parses Address from a JSON value.
  *
  * @param [in] value to be parsed
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
 void address_from(
   const Json::Value& value,
-  std::string ref,
+  const parse::Ref& ref,
   Address* target,
   parse::Errors* errors);
 
@@ -47,13 +47,13 @@ void address_from(
  * parses Person from a JSON value.
  *
  * @param [in] value to be parsed
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
 void person_from(
   const Json::Value& value,
-  std::string ref,
+  const parse::Ref& ref,
   Person* target,
   parse::Errors* errors);
 
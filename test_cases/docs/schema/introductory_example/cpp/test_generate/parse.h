@@ -10,6 +10,66 @@ namespace address {
 
 namespace parse {
 
+/**
+ * references a value lazily as a path from the root.
+ *
+ * The reference points to the reference of its parent so that
+ * referencing a nested value requires no string allocations.
+ * The path is rendered only when it is actually needed
+ * (e.g., when an error is added).
+ *
+ * The parent reference and the key need to outlive the reference.
+ */
+class Ref {
+public:
+  /**
+   * creates the root reference.
+   *
+   * @param root path to the root value
+   */
+  explicit Ref(const std::string& root);
+
+  /**
+   * creates the reference to a property of the parent.
+   *
+   * @param parent reference to the parent object
+   * @param key name of the property
+   */
+  Ref(const Ref& parent, const char* key);
+
+  /**
+   * creates the reference to a value of the parent.
+   *
+   * @param parent reference to the parent object
+   * @param key key of the value
+   */
+  Ref(const Ref& parent, const std::string& key);
+
+  /**
+   * creates the reference to an item of the parent array.
+   *
+   * @param parent reference to the parent array
+   * @param index index of the item
+   */
+  Ref(const Ref& parent, size_t index);
+
+  /**
+   * renders the reference as a path.
+   *
+   * @return segments of the path joined by "/"
+   */
+  std::string str() const;
+
+private:
+  const Ref* parent_;
+
+  // key of the value, nullptr if the value is an array item.
+  const char* key_;
+  size_t key_size_;
+
+  size_t index_;
+};
+
 /**
  * represents an error occurred while parsing.
  */
@@ -47,6 +107,14 @@ public:
    */
   void add(const std::string& ref, const std::string& message);
 
+  /**
+   * adds an error to the container.
+   *
+   * The reference is rendered only if the error is actually added.
+   * If the container is already full, the error is ignored.
+   */
+  void add(const Ref& ref, const std::string& message);
+
   /**
    * @return true when there are exactly cap errors.
    */
@@ -4,10 +4,71 @@ package address
 
 import (
 	"fmt"
-	"strings"
+	"sort"
 	"time"
 )
 
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+	for i := 0; i < len(text); i++ {
+		if text[i] < '0' || text[i] > '9' {
+			return 0, false
+		}
+		value = value*10 + int(text[i]-'0')
+	}
+	return value, true
+}
+
+// timeFromFixedY_45_m_45_d parses the text
+// in the layout "2006-01-02" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_45_m_45_d(text string) (t time.Time, ok bool) {
+	if len(text) != 10 ||
+		text[4:5] != "-" ||
+		text[7:8] != "-" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		0,
+		0,
+		0,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
 // PersonFromJSONable parses Person from a JSONable value.
 //
 // If there are any errors, the state of the target is undefined.
@@ -19,7 +80,7 @@ import (
 func PersonFromJSONable(
 	value interface{},
 	id string,
-	ref string,
+	ref *Ref,
 	target *Person,
 	errors *Errors) {
 
@@ -37,7 +98,7 @@ func PersonFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -55,17 +116,14 @@ func PersonFromJSONable(
 		"full_name"]
 
 	if !ok0 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: full_name")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "full_name"},
-					"/"),
+			errors.AddRef(
+				ref.Key("full_name"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
@@ -86,30 +144,28 @@ func PersonFromJSONable(
 		"birthday"]
 
 	if !ok2 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: birthday")
 	} else {
 		cast3, ok3 := value2.(string)
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "birthday"},
-					"/"),
+			errors.AddRef(
+				ref.Key("birthday"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value2))
 		} else {
-			target3, err3 := time.Parse(
-				"2006-01-02",
-				cast3)
+			target3, fixed3 := timeFromFixedY_45_m_45_d(cast3)
+			var err3 error
+			if !fixed3 {
+				target3, err3 = time.Parse(
+					"2006-01-02",
+					cast3)
+			}
 			if err3 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "birthday"},
-						"/"),
+				errors.AddRef(
+					ref.Key("birthday"),
 					fmt.Sprintf(
 						"expected layout 2006-01-02, got: %s",
 						cast3))
@@ -131,16 +187,13 @@ func PersonFromJSONable(
 		"address"]
 
 	if !ok4 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: address")
 	} else {
 		AddressFromJSONable(
 			value4,
-			strings.Join(
-				[]string{
-					ref, "address"},
-				"/"),
+			ref.Key("address"),
 			&(target.Address),
 			errors)
 	}
@@ -162,7 +215,7 @@ func PersonFromJSONable(
 //  * errors.Empty()
 func AddressFromJSONable(
 	value interface{},
-	ref string,
+	ref *Ref,
 	target *Address,
 	errors *Errors) {
 
@@ -180,7 +233,7 @@ func AddressFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -196,17 +249,14 @@ func AddressFromJSONable(
 		"text"]
 
 	if !ok0 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: text")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "text"},
-					"/"),
+			errors.AddRef(
+				ref.Key("text"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
@@ -258,11 +308,14 @@ func PipelineFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Pre-allocate Persons
 	////
 
-	personsRef := ref+"/persons";
+	personsRef := graphRef.Key(
+		"persons")
 	var personsOk bool
 	var personsValue interface{}
 	var personsMap map[string]interface{}
@@ -272,7 +325,7 @@ func PipelineFromJSONable(
 	if personsOk {
 		personsMap, ok = personsValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				personsRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -302,8 +355,7 @@ func PipelineFromJSONable(
 			PersonFromJSONable(
 				value,
 				id,
-				strings.Join([]string{
-					personsRef, id}, "/"),
+				personsRef.Key(id),
 				target.Persons[id],
 				errors)
 
@@ -325,28 +377,220 @@ func PipelineFromJSONable(
 		"maintainer"]
 
 	if !ok0 {
+		errors.AddRef(
+			graphRef,
+			"property is missing: maintainer")
+	} else {
+		cast1, ok1 := value0.(string)
+		if !ok1 {
+			errors.AddRef(
+				graphRef.Key("maintainer"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value0))
+		} else {
+			target1, ok1 := target.Persons[cast1]
+			if !ok1 {
+				errors.AddRef(
+					graphRef.Key("maintainer"),
+					fmt.Sprintf(
+						"reference to an instance of class Person not found: %s",
+						value0))
+			} else {
+				target.Maintainer = target1
+			}
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// PipelineFromJSONableParallel parses Pipeline from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike PipelineFromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// PipelineFromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func PipelineFromJSONableParallel(
+	value interface{},
+	ref string,
+	target *Pipeline,
+	errors *Errors,
+	workers int) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
 		errors.Add(
 			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate Persons
+	////
+
+	personsRef := graphRef.Key(
+		"persons")
+	var personsOk bool
+	var personsValue interface{}
+	var personsMap map[string]interface{}
+
+	personsValue, personsOk = cast[
+		"persons"]
+	if personsOk {
+		personsMap, ok = personsValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				personsRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					personsValue));
+		} else {
+			target.Persons = make(
+				map[string]*Person)
+
+			for id := range personsMap {
+				target.Persons[id] = &Person{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse the instances of all the registries in parallel
+	////
+
+	// instanceJob identifies an instance to be parsed.
+	type instanceJob struct {
+		// indicates the registry in the order of the classes.
+		registry int
+
+		id string
+
+		value interface{}
+	}
+
+	jobs := make([]instanceJob, 0, len(personsMap))
+	for id, value := range personsMap {
+		jobs = append(jobs, instanceJob{registry: 0, id: id, value: value})
+	}
+
+	// Sort the instances so that the errors are deterministic.
+	sort.Slice(jobs, func(i, j int) bool {
+		if jobs[i].registry != jobs[j].registry {
+			return jobs[i].registry < jobs[j].registry
+		}
+		return jobs[i].id < jobs[j].id
+	})
+
+	chunks := parallelChunkCount(len(jobs), workers)
+	chunkErrors := make([][]Error, chunks)
+	workerErrors := make([]*Errors, workers)
+
+	forEachInParallel(chunks, workers, func(worker int, chunk int) {
+		instanceErrors := workerErrors[worker]
+		if instanceErrors == nil {
+			instanceErrors = NewErrors(errors.cap)
+			workerErrors[worker] = instanceErrors
+		}
+
+		start, end := parallelChunk(len(jobs), chunks, chunk)
+		for _, job := range jobs[start:end] {
+			switch job.registry {
+			case 0:
+				PersonFromJSONable(
+					job.value,
+					job.id,
+					personsRef.Key(job.id),
+					target.Persons[job.id],
+					instanceErrors)
+			}
+
+			chunkErrors[chunk] = append(
+				chunkErrors[chunk], instanceErrors.values...)
+			instanceErrors.values = instanceErrors.values[:0]
+
+			// The subsequent errors of the chunk would be ignored anyway.
+			if errors.cap != 0 &&
+				uint64(len(chunkErrors[chunk])) >= errors.cap {
+				break
+			}
+		}
+	})
+
+	// Merge the errors in the order of the instances.
+	for _, values := range chunkErrors {
+		for _, e := range values {
+			errors.Add(e.Ref, e.Message)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse Maintainer
+	////
+
+	value0, ok0 := cast[
+		"maintainer"]
+
+	if !ok0 {
+		errors.AddRef(
+			graphRef,
 			"property is missing: maintainer")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "maintainer"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("maintainer"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
 			target1, ok1 := target.Persons[cast1]
 			if !ok1 {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "maintainer"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("maintainer"),
 					fmt.Sprintf(
 						"reference to an instance of class Person not found: %s",
 						value0))
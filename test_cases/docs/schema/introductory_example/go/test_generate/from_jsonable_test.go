@@ -1,3 +1,70 @@
 package address
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"encoding/json"
+	"runtime"
+	"testing"
+)
+
+func BenchmarkPipelineFromJSONable(b *testing.B) {
+	var value interface{}
+	err := json.Unmarshal(syntheticPipelineJSON(b), &value)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		errors := NewErrors(0)
+		PipelineFromJSONable(
+			value, "#", &Pipeline{}, errors)
+		if !errors.Empty() {
+			b.Fatal(errors.Values()[0].Message)
+		}
+	}
+}
+
+func BenchmarkPipelineFromJSONableParallel(b *testing.B) {
+	var value interface{}
+	err := json.Unmarshal(syntheticPipelineJSON(b), &value)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	workers := runtime.GOMAXPROCS(0)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		errors := NewErrors(0)
+		PipelineFromJSONableParallel(
+			value, "#", &Pipeline{}, errors, workers)
+		if !errors.Empty() {
+			b.Fatal(errors.Values()[0].Message)
+		}
+	}
+}
+
+func BenchmarkPipelineFromJSONBytes(b *testing.B) {
+	data := syntheticPipelineJSON(b)
+
+	b.ReportAllocs()
+	b.SetBytes(int64(len(data)))
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		errors := NewErrors(0)
+		PipelineFromJSONBytes(
+			data, "#", &Pipeline{}, errors)
+		if !errors.Empty() {
+			b.Fatal(errors.Values()[0].Message)
+		}
+	}
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -2,6 +2,65 @@ package address
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
+import (
+	"strconv"
+	"strings"
+	"sync"
+	"sync/atomic"
+)
+
+// Ref references a value lazily as a path from the root.
+//
+// Ref points to the reference of its parent so that referencing a nested
+// value requires no string concatenation. The path is rendered only when
+// it is actually needed (e.g., when an error is added).
+type Ref struct {
+	// points to the reference of the parent, nil if this is the root.
+	parent *Ref
+
+	// gives the root path or the key of the value within the parent.
+	key string
+
+	// gives the position of the value within the parent array if isIndex.
+	index int
+
+	// indicates whether the value is an item of the parent array.
+	isIndex bool
+}
+
+// NewRef creates the root reference given as a path.
+func NewRef(path string) *Ref {
+	return &Ref{key: path}
+}
+
+// Key creates a reference to the value at the key of the parent.
+func (r *Ref) Key(key string) *Ref {
+	return &Ref{parent: r, key: key}
+}
+
+// Index creates a reference to the item at the index of the parent array.
+func (r *Ref) Index(index int) *Ref {
+	return &Ref{parent: r, index: index, isIndex: true}
+}
+
+// String renders the reference as a path joined by "/".
+func (r *Ref) String() string {
+	segments := []string{}
+	for cur := r; cur != nil; cur = cur.parent {
+		if cur.isIndex {
+			segments = append(segments, strconv.Itoa(cur.index))
+		} else {
+			segments = append(segments, cur.key)
+		}
+	}
+
+	for i, j := 0, len(segments)-1; i < j; i, j = i+1, j-1 {
+		segments[i], segments[j] = segments[j], segments[i]
+	}
+
+	return strings.Join(segments, "/")
+}
+
 // Error represents a parsing error.
 type Error struct {
 	// references the cause (e.g., a reference path).
@@ -49,6 +108,18 @@ func (e *Errors) Add(ref string, message string) {
 	}
 }
 
+// AddRef inserts the error into the container.
+//
+// ref indicates the cause and is rendered only if the error is inserted.
+// message describes the error.
+// If the capacity is full, the subsequent surplus errors are ignored.
+func (e *Errors) AddRef(ref *Ref, message string) {
+	if e.cap == 0 || uint64(len(e.values)) < e.cap {
+		e.values = append(
+			e.values, Error{Ref: ref.String(), Message: message})
+	}
+}
+
 // Full indicates whether the container is full.
 func (e *Errors) Full() bool {
 	return e.cap != 0 && uint64(len(e.values)) == e.cap
@@ -59,4 +130,50 @@ func (e *Errors) Empty() bool {
 	return uint64(len(e.values)) == 0
 }
 
+// parallelChunkCount gives the number of chunks in which count items are
+// split so that the work is balanced among the workers.
+func parallelChunkCount(count int, workers int) int {
+	chunks := 4 * workers
+	if chunks > count {
+		chunks = count
+	}
+	return chunks
+}
+
+// parallelChunk gives the range [start, end) of the items in the chunk.
+func parallelChunk(count int, chunks int, chunk int) (start int, end int) {
+	return chunk * count / chunks, (chunk + 1) * count / chunks
+}
+
+// forEachInParallel calls do for each index in [0, count) on a pool of
+// at most workers goroutines and waits for all the calls to finish.
+//
+// do is also given the index of the worker so that it can reuse
+// the state of the worker.
+func forEachInParallel(count int, workers int, do func(worker int, i int)) {
+	if workers > count {
+		workers = count
+	}
+
+	next := int64(-1)
+
+	var wg sync.WaitGroup
+	wg.Add(workers)
+	for worker := 0; worker < workers; worker++ {
+		go func(worker int) {
+			defer wg.Done()
+
+			for {
+				i := int(atomic.AddInt64(&next, 1))
+				if i >= count {
+					return
+				}
+
+				do(worker, i)
+			}
+		}(worker)
+	}
+	wg.Wait()
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
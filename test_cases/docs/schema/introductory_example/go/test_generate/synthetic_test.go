@@ -0,0 +1,154 @@
+package address
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"encoding/json"
+	"flag"
+	"fmt"
+	"testing"
+	"time"
+)
+
+// syntheticRegistrySize gives the number of instances in each registry
+// of the synthetic graphs.
+var syntheticRegistrySize = flag.Int(
+	"mapry.registry_size", 1000,
+	"number of instances in each registry of the synthetic graphs")
+
+// syntheticArrayLength gives the length of the arrays of
+// the synthetic graphs unless constrained by the schema.
+var syntheticArrayLength = flag.Int(
+	"mapry.array_length", 10,
+	"length of the arrays in the synthetic graphs")
+
+// syntheticMapSize gives the number of entries in the maps of
+// the synthetic graphs.
+var syntheticMapSize = flag.Int(
+	"mapry.map_size", 10,
+	"number of entries in the maps of the synthetic graphs")
+
+// syntheticMaxDepth limits the nesting of the embeddable structures
+// so that the recursive structures are finite.
+const syntheticMaxDepth = 3
+
+// syntheticSize clamps the size to the bounds given by the schema.
+//
+// The size is the minimum once the nesting is too deep.
+// Negative bounds are ignored.
+func syntheticSize(size int, depth int, minimum int, maximum int) int {
+	if depth >= syntheticMaxDepth {
+		size = 0
+	}
+	if minimum >= 0 && size < minimum {
+		size = minimum
+	}
+	if maximum >= 0 && size > maximum {
+		size = maximum
+	}
+	return size
+}
+
+// syntheticLetters encodes the index in lowercase letters.
+func syntheticLetters(i int) string {
+	result := []byte{byte('a' + i%26)}
+	i /= 26
+	for i > 0 {
+		i--
+		result = append([]byte{byte('a' + i%26)}, result...)
+		i /= 26
+	}
+	return string(result)
+}
+
+// syntheticPerson fills the target with
+// the synthetic values of the i-th instance.
+func syntheticPerson(
+	target *Person,
+	i int,
+	depth int) {
+
+	target.FullName = fmt.Sprintf("text%d", i)
+
+	target.Birthday = time.Date(
+		2020, time.January, 1+i%28, 12, 30, 15, 0, time.UTC)
+
+	syntheticAddress(&target.Address, i, depth+1)
+}
+
+// syntheticAddress fills the target with
+// the synthetic values of the i-th instance.
+func syntheticAddress(
+	target *Address,
+	i int,
+	depth int) {
+
+	target.Text = fmt.Sprintf("text%d", i)
+}
+
+// newSyntheticPipeline builds a synthetic Pipeline for the benchmarks.
+//
+// The sizes of the registries, arrays and maps are given by the flags.
+// Optional properties are always set unless the embeddable structures
+// are nested too deep.
+func newSyntheticPipeline() *Pipeline {
+	target := &Pipeline{}
+
+	registrySize := *syntheticRegistrySize
+	if registrySize < 1 {
+		// Each registry needs at least an instance to be referenced.
+		registrySize = 1
+	}
+
+	personsInstances := make([]*Person, registrySize)
+	target.Persons = make(map[string]*Person, registrySize)
+	for i := range personsInstances {
+		id := fmt.Sprintf("id%d", i)
+		instance := &Person{ID: id}
+		personsInstances[i] = instance
+		target.Persons[id] = instance
+	}
+
+	for i, instance := range personsInstances {
+		syntheticPerson(
+			instance,
+			i,
+			0)
+	}
+
+	target.Maintainer = personsInstances[0%len(personsInstances)]
+
+	return target
+}
+
+// syntheticPipelineJSON gives the JSON text of
+// a synthetic Pipeline.
+//
+// The benchmark is skipped if the synthetic graph does not satisfy
+// the schema, e.g., if a pattern could not be sampled.
+func syntheticPipelineJSON(b *testing.B) []byte {
+	jsonable, err := PipelineToJSONable(
+		newSyntheticPipeline())
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	data, err := json.Marshal(jsonable)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	errors := NewErrors(1)
+	PipelineFromJSONBytes(
+		data, "#", &Pipeline{}, errors)
+	if !errors.Empty() {
+		e := errors.Values()[0]
+		b.Skipf(
+			"the synthetic graph does not satisfy the schema: %s: %s",
+			e.Ref, e.Message)
+	}
+
+	return data
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -125,4 +125,79 @@ func PipelineToJSONable(
 	return
 }
 
+// PipelineToJSONableParallel converts the instance to
+// a JSONable representation on a pool of at most workers goroutines.
+//
+// The instances of each registry are converted concurrently.
+//
+// PipelineToJSONableParallel requires:
+//  * instance != nil
+//  * workers > 0
+//
+// PipelineToJSONableParallel ensures:
+//  * (err == nil && target != nil) || (err != nil && target == nil)
+func PipelineToJSONableParallel(
+	instance *Pipeline,
+	workers int) (
+	target map[string]interface{}, err error) {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	target = make(map[string]interface{})
+	defer func() {
+		if err != nil {
+			target = nil
+		}
+	}()
+	////
+	// Serialize Maintainer
+	////
+
+	target["maintainer"] = instance.Maintainer.ID
+
+	////
+	// Serialize instance registry of Person
+	////
+
+	if len(instance.Persons) > 0 {
+		ids := make([]string, 0, len(instance.Persons))
+		for id, personInstance := range instance.Persons {
+			if id != personInstance.ID {
+				err = fmt.Errorf(
+					"expected the instance of Person to have the ID %s according to the registry, but got: %s",
+					id, personInstance.ID)
+				return
+			}
+
+			ids = append(ids, id)
+		}
+
+		jsonables := make([]map[string]interface{}, len(ids))
+		chunks := parallelChunkCount(len(ids), workers)
+		forEachInParallel(chunks, workers, func(worker int, chunk int) {
+			start, end := parallelChunk(len(ids), chunks, chunk)
+			for i := start; i < end; i++ {
+				jsonables[i] = PersonToJSONable(
+					instance.Persons[ids[i]])
+			}
+		})
+
+		targetPersons := make(
+			map[string]interface{}, len(ids))
+		for i, id := range ids {
+			targetPersons[id] = jsonables[i]
+		}
+
+		target["persons"] = targetPersons
+	}
+
+	return
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
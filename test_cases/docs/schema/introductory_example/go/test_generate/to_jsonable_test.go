@@ -1,3 +1,71 @@
 package address
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"io/ioutil"
+	"runtime"
+	"testing"
+)
+
+func BenchmarkPipelineToJSONable(b *testing.B) {
+	instance := newSyntheticPipeline()
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		_, err := PipelineToJSONable(instance)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkPipelineToJSONableParallel(b *testing.B) {
+	instance := newSyntheticPipeline()
+	workers := runtime.GOMAXPROCS(0)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		_, err := PipelineToJSONableParallel(
+			instance, workers)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkPipelineWriteJSON(b *testing.B) {
+	instance := newSyntheticPipeline()
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		err := PipelineWriteJSON(ioutil.Discard, instance)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkPipelineWriteJSONParallel(b *testing.B) {
+	instance := newSyntheticPipeline()
+	workers := runtime.GOMAXPROCS(0)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		err := PipelineWriteJSONParallel(
+			ioutil.Discard, instance, workers)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -6,15 +6,162 @@
 
 import collections
 import datetime
+import re
 import typing
 
 import book.address
 import book.address.parse
 
 
+_DATE_Y_45_m_45_d_RE = re.compile(
+    r'([0-9]{4})\-([0-9]{2})\-([0-9]{2})\Z')
+
+
+def _date_from_string_Y_45_m_45_d(text: str) -> datetime.date:
+    """
+    parses the date from the string in the format '%Y-%m-%d'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: date
+    :raise: ValueError if the string could not be parsed
+
+    >>> _date_from_string_Y_45_m_45_d('2016-07-03')
+    datetime.date(2016, 7, 3)
+
+    """
+    match = _DATE_Y_45_m_45_d_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.date(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y-%m-%d').date()
+
+
+def _person_construct(
+        value: typing.Any,
+        id: str,
+        ref: book.address.parse.Ref,
+        errors: book.address.parse.Errors
+) -> typing.Optional[book.address.Person]:
+    """
+    parses Person from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    ##
+    # Parse full_name
+    ##
+
+    value_0 = value.get(
+        'full_name',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: full_name')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'full_name'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        else:
+            parsed_full_name = value_0
+    if errors.full():
+        return None
+
+    ##
+    # Parse birthday
+    ##
+
+    value_2 = value.get(
+        'birthday',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: birthday')
+    else:
+        if not isinstance(value_2, str):
+            errors.add(
+                (ref, 'birthday'),
+                "Expected a string, but got: {}".format(
+                    type(value_2)))
+        else:
+            try:
+                parsed_birthday = _date_from_string_Y_45_m_45_d(
+                    value_2)
+            except ValueError:
+                errors.add(
+                    (ref, 'birthday'),
+                    'Expected to strptime %Y-%m-%d, but got: {}'.format(
+                        value_2))
+    if errors.full():
+        return None
+
+    ##
+    # Parse address
+    ##
+
+    value_4 = value.get(
+        'address',
+        None)
+
+    if value_4 is None:
+        errors.add(
+            ref,
+            'Property is missing: address')
+    else:
+        target_5 = _address_from(
+            value_4,
+            (ref, 'address'),
+            errors)
+        if target_5 is not None:
+            parsed_address = target_5
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return book.address.Person(
+        id=id,
+        full_name=parsed_full_name,
+        birthday=parsed_birthday,
+        address=parsed_address)
+
+
 def _person_from(
         value: typing.Any,
-        ref: str,
+        ref: book.address.parse.Ref,
         target: book.address.Person,
         errors: book.address.parse.Errors
 ) -> None:
@@ -25,7 +172,7 @@ def _person_from(
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as Person
     :param errors: errors encountered during parsing
     :return:
@@ -53,8 +200,7 @@ def _person_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'full_name')),
+                (ref, 'full_name'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
@@ -77,20 +223,16 @@ def _person_from(
     else:
         if not isinstance(value_2, str):
             errors.add(
-                '/'.join((
-                    ref, 'birthday')),
+                (ref, 'birthday'),
                 "Expected a string, but got: {}".format(
                     type(value_2)))
         else:
             try:
-                target.birthday = datetime.datetime.strptime(
-                    value_2,
-                    '%Y-%m-%d'
-                ).date()
+                target.birthday = _date_from_string_Y_45_m_45_d(
+                    value_2)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'birthday')),
+                    (ref, 'birthday'),
                     'Expected to strptime %Y-%m-%d, but got: {}'.format(
                         value_2))
     if errors.full():
@@ -109,16 +251,12 @@ def _person_from(
             ref,
             'Property is missing: address')
     else:
-        target_5 = (
-            book.address.parse.placeholder_address()
-        )
-        _address_from(
+        target_5 = _address_from(
             value_4,
-            '/'.join((
-                ref, 'address')),
-            target_5,
+            (ref, 'address'),
             errors)
-        target.address = target_5
+        if target_5 is not None:
+            target.address = target_5
     if errors.full():
         return
 
@@ -140,12 +278,10 @@ def person_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = book.address.parse.placeholder_person(id=id)
-
-    _person_from(
+    target = _person_construct(
         value=value,
+        id=id,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -156,21 +292,20 @@ def person_from(
 
 def _address_from(
         value: typing.Any,
-        ref: str,
-        target: book.address.Address,
+        ref: book.address.parse.Ref,
         errors: book.address.parse.Errors
-) -> None:
+) -> typing.Optional[book.address.Address]:
     """
     parses Address from a JSONable value.
 
-    If ``errors``, the attributes of ``target`` have undefined values.
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
-    :param target: parsed ``value`` as Address
+        reference to the value (e.g., a lazy reference path)
     :param errors: errors encountered during parsing
-    :return:
+    :return: parsed instance, or None if parsing it added to ``errors``
 
     """
     if not isinstance(value, dict):
@@ -178,7 +313,9 @@ def _address_from(
             ref,
             "Expected a dictionary, but got: {}".format(
                 type(value)))
-        return
+        return None
+
+    errors_count = errors.count()
 
     ##
     # Parse text
@@ -195,14 +332,19 @@ def _address_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'text')),
+                (ref, 'text'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
-            target.text = value_0
+            parsed_text = value_0
     if errors.full():
-        return
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return book.address.Address(
+        text=parsed_text)
 
 
 def address_from(
@@ -221,12 +363,9 @@ def address_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = book.address.parse.placeholder_address()
-
-    _address_from(
+    target = _address_from(
         value=value,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -268,8 +407,7 @@ def pipeline_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'persons')),
+                (ref, 'persons'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -278,10 +416,6 @@ def pipeline_from(
             else:
                 graph.persons = dict()
 
-            persons_registry = graph.persons
-            for id in registry_value:
-                persons_registry[id] = book.address.parse.placeholder_person(id=id)
-
     if errors.full():
         return None
 
@@ -296,14 +430,355 @@ def pipeline_from(
     if 'persons' in value:
         registry_value = value['persons']
         for id, instance_value in registry_value.items():
-            target_person = graph.persons[id]
-            target_person.id = id
+            instance_person = _person_construct(
+                instance_value,
+                id,
+                (ref, 'persons', (id, )),
+                errors)
+
+            if instance_person is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_person = book.address.parse.placeholder_person(id=id)
+
+            graph.persons[id] = instance_person
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse maintainer
+    ##
+
+    value_0 = value.get(
+        'maintainer',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: maintainer')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'maintainer'),
+                "Expected a str, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = graph.persons.get(
+                value_0,
+                None)
+            if target_1 is None:
+                errors.add(
+                    (ref, 'maintainer'),
+                    'Reference to an instance of class Person not found: {}'.format(
+                        value_0))
+            else:
+                graph.maintainer = target_1
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _person_construct_fast(
+        value: typing.Any,
+        id: str
+) -> book.address.Person:
+    """
+    parses Person optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse full_name
+    ##
+
+    value_1 = value['full_name']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    parsed_full_name = value_1
+
+    ##
+    # Parse birthday
+    ##
+
+    parsed_birthday = _date_from_string_Y_45_m_45_d(
+        value['birthday'])
+
+    ##
+    # Parse address
+    ##
+
+    parsed_address = _address_from_fast(
+        value['address'])
+
+    return book.address.Person(
+        id=id,
+        full_name=parsed_full_name,
+        birthday=parsed_birthday,
+        address=parsed_address)
+
+
+def _address_from_fast(
+        value: typing.Any
+) -> book.address.Address:
+    """
+    parses Address optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse text
+    ##
+
+    value_1 = value['text']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    parsed_text = value_1
+
+    return book.address.Address(
+        text=parsed_text)
+
+
+def _pipeline_from_fast(
+        value: typing.Any
+) -> book.address.Pipeline:
+    """
+    parses Pipeline optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed Pipeline
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = book.address.parse.placeholder_pipeline()
+
+    ##
+    # Pre-allocate persons
+    ##
+
+    registry_value = value.get('persons', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.persons = collections.OrderedDict()
+        else:
+            graph.persons = dict()
+
+    ##
+    # Parse persons
+    ##
+
+    if 'persons' in value:
+        registry_value = value['persons']
+        for id, instance_value in registry_value.items():
+            graph.persons[id] = _person_construct_fast(
+                instance_value,
+                id)
+
+    ##
+    # Parse maintainer
+    ##
+
+    graph.maintainer = graph.persons[
+        value['maintainer']]
+
+    return graph
+
+
+def pipeline_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: book.address.parse.Errors
+) -> typing.Optional[book.address.Pipeline]:
+    """
+    parses Pipeline from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`pipeline_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed Pipeline, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _pipeline_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return pipeline_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def pipeline_update_from(
+        previous: book.address.Pipeline,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: book.address.parse.Errors
+) -> typing.Optional[book.address.Pipeline]:
+    """
+    parses Pipeline reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``pipeline_from``.
+
+    :param previous: previously parsed Pipeline
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed Pipeline, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = book.address.parse.placeholder_pipeline()
+
+    # IDs of the instances which are new, changed or removed
+    changed_persons = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate persons reusing the unchanged instances
+    ##
+
+    registry_value = value.get('persons', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'persons'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.persons = collections.OrderedDict()
+            else:
+                graph.persons = dict()
+
+            persons_registry = graph.persons
+            previous_persons = previous.persons
+
+            previous_registry_value = previous_value.get(
+                'persons', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_person = previous_persons.get(id, None)
+                if (target_person is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_person = book.address.parse.placeholder_person(id=id)
+                    changed_persons.add(id)
+
+                persons_registry[id] = target_person
+
+    changed_persons.update(
+        id for id in previous.persons
+        if id not in graph.persons)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse the new and changed persons
+    ##
+
+    registry_value = value.get('persons', None)
+    if registry_value is not None and changed_persons:
+        for id, instance_value in registry_value.items():
+            if id not in changed_persons:
+                continue
 
             _person_from(
                 instance_value,
-                '/'.join((
-                    ref, 'persons', repr(id))),
-                target_person,
+                (ref, 'persons', (id, )),
+                graph.persons[id],
                 errors)
 
             if errors.full():
@@ -324,8 +799,7 @@ def pipeline_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'maintainer')),
+                (ref, 'maintainer'),
                 "Expected a str, but got: {}".format(
                     type(value_0)))
         else:
@@ -334,8 +808,7 @@ def pipeline_from(
                 None)
             if target_1 is None:
                 errors.add(
-                    '/'.join((
-                        ref, 'maintainer')),
+                    (ref, 'maintainer'),
                     'Reference to an instance of class Person not found: {}'.format(
                         value_0))
             else:
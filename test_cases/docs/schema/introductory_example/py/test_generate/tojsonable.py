@@ -5,6 +5,7 @@
 
 
 import collections
+import json
 import typing
 
 import book.address
@@ -133,4 +134,99 @@ def serialize_pipeline(
     return target
 
 
+class _WriteBuffer:
+    """buffers the chunks of text before writing them to a file."""
+
+    def __init__(self, fp: typing.TextIO, size: int) -> None:
+        """
+        initializes the buffer.
+
+        :param fp: file-like object to write to
+        :param size: number of characters to buffer before writing
+        """
+        self.fp = fp
+        self.size = size
+        self._chunks = []  # type: typing.List[str]
+        self._length = 0
+
+    def write(self, text: str) -> None:
+        """buffers the text and writes it out if the buffer is full."""
+        self._chunks.append(text)
+        self._length += len(text)
+
+        if self._length >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        """writes out the buffered text."""
+        if self._chunks:
+            self.fp.write(''.join(self._chunks))
+            self._chunks = []
+            self._length = 0
+
+
+def write_pipeline_json(
+        instance: book.address.Pipeline,
+        fp: typing.TextIO,
+        buffer_size: int = 65536
+) -> None:
+    """
+    writes an instance of Pipeline as JSON text to ``fp``.
+
+    The text is the same as ``json.dumps(serialize_pipeline(instance))``, but
+    the properties and the class instances are serialized one at a time
+    so that the whole JSONable never needs to be held in memory.
+
+    :param instance: the instance of Pipeline to be written
+    :param fp: file-like object to write the JSON text to
+    :param buffer_size:
+        number of characters buffered before they are written to ``fp``
+    :return:
+    """
+    buffer = _WriteBuffer(fp=fp, size=buffer_size)
+
+    buffer.write('{')
+    delimiter = ''
+
+    ##
+    # Write maintainer
+    ##
+
+    jsonable_maintainer = instance.maintainer.id
+    buffer.write(delimiter)
+    buffer.write('"maintainer": ')
+    buffer.write(json.dumps(jsonable_maintainer))
+    delimiter = ', '
+
+    ##
+    # Write instance registry of Person
+    ##
+
+    if len(instance.persons) > 0:
+        buffer.write(delimiter)
+        buffer.write('"persons": {')
+
+        registry_delimiter = ''
+        for id, person_instance in instance.persons.items():
+            if id != person_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of Person, but got: {!r}'.format(
+                        id, person_instance.id))
+
+            buffer.write(registry_delimiter)
+            buffer.write(json.dumps(id))
+            buffer.write(': ')
+            buffer.write(
+                json.dumps(
+                    serialize_person(
+                        instance=person_instance)))
+            registry_delimiter = ', '
+
+        buffer.write('}')
+        delimiter = ', '
+
+    buffer.write('}')
+    buffer.flush()
+
+
 # File automatically generated by mapry. DO NOT EDIT OR APPEND!
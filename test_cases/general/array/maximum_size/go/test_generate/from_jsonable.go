@@ -2,11 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strconv"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -44,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfBooleans
 	////
@@ -52,26 +50,20 @@ func SomeGraphFromJSONable(
 		"array_of_booleans"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_booleans")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_booleans"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_booleans"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
 		} else if len(cast1) > 1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_booleans"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_booleans"),
 				fmt.Sprintf(
 					"expected an array of maximum size 1, but got: %d",
 					len(cast1)))
@@ -82,11 +74,8 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				cast2, ok2 := (cast1[i1]).(bool)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_booleans", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_booleans").Index(i1),
 						fmt.Sprintf(
 							"expected a bool, but got: %T",
 							cast1[i1]))
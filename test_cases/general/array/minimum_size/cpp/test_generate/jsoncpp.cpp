@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse array_of_booleans
   ////
 
   if (!value.isMember("array_of_booleans")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: array_of_booleans");
   } else {
     const Json::Value& value_0 = value["array_of_booleans"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_booleans"),
+        parse::Ref(graph_ref, "array_of_booleans"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -112,8 +113,7 @@ void some_graph_from(
         ", but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_booleans"),
+        parse::Ref(graph_ref, "array_of_booleans"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -128,10 +128,7 @@ void some_graph_from(
             "Expected a bool, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_booleans")
-              .append("/")
-              .append(std::to_string(i_0)),
+            parse::Ref(parse::Ref(graph_ref, "array_of_booleans"), i_0),
             message(
               expected_but_got,
               strlen(expected_but_got),
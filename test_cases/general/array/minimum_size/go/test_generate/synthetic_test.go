@@ -0,0 +1,111 @@
+package somegraph
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"encoding/json"
+	"flag"
+	"testing"
+)
+
+// syntheticRegistrySize gives the number of instances in each registry
+// of the synthetic graphs.
+var syntheticRegistrySize = flag.Int(
+	"mapry.registry_size", 1000,
+	"number of instances in each registry of the synthetic graphs")
+
+// syntheticArrayLength gives the length of the arrays of
+// the synthetic graphs unless constrained by the schema.
+var syntheticArrayLength = flag.Int(
+	"mapry.array_length", 10,
+	"length of the arrays in the synthetic graphs")
+
+// syntheticMapSize gives the number of entries in the maps of
+// the synthetic graphs.
+var syntheticMapSize = flag.Int(
+	"mapry.map_size", 10,
+	"number of entries in the maps of the synthetic graphs")
+
+// syntheticMaxDepth limits the nesting of the embeddable structures
+// so that the recursive structures are finite.
+const syntheticMaxDepth = 3
+
+// syntheticSize clamps the size to the bounds given by the schema.
+//
+// The size is the minimum once the nesting is too deep.
+// Negative bounds are ignored.
+func syntheticSize(size int, depth int, minimum int, maximum int) int {
+	if depth >= syntheticMaxDepth {
+		size = 0
+	}
+	if minimum >= 0 && size < minimum {
+		size = minimum
+	}
+	if maximum >= 0 && size > maximum {
+		size = maximum
+	}
+	return size
+}
+
+// syntheticLetters encodes the index in lowercase letters.
+func syntheticLetters(i int) string {
+	result := []byte{byte('a' + i%26)}
+	i /= 26
+	for i > 0 {
+		i--
+		result = append([]byte{byte('a' + i%26)}, result...)
+		i /= 26
+	}
+	return string(result)
+}
+
+// newSyntheticSomeGraph builds a synthetic SomeGraph for the benchmarks.
+//
+// The sizes of the registries, arrays and maps are given by the flags.
+// Optional properties are always set unless the embeddable structures
+// are nested too deep.
+func newSyntheticSomeGraph() *SomeGraph {
+	target := &SomeGraph{}
+
+	count1 := syntheticSize(
+		*syntheticArrayLength, 0, 1, -1)
+	target1 := make([]bool, count1)
+	for i1 := range target1 {
+		target1[i1] = i1%2 == 0
+	}
+	target.ArrayOfBooleans = target1
+
+	return target
+}
+
+// syntheticSomeGraphJSON gives the JSON text of
+// a synthetic SomeGraph.
+//
+// The benchmark is skipped if the synthetic graph does not satisfy
+// the schema, e.g., if a pattern could not be sampled.
+func syntheticSomeGraphJSON(b *testing.B) []byte {
+	jsonable, err := SomeGraphToJSONable(
+		newSyntheticSomeGraph())
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	data, err := json.Marshal(jsonable)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	errors := NewErrors(1)
+	SomeGraphFromJSONBytes(
+		data, "#", &SomeGraph{}, errors)
+	if !errors.Empty() {
+		e := errors.Values()[0]
+		b.Skipf(
+			"the synthetic graph does not satisfy the schema: %s: %s",
+			e.Ref, e.Message)
+	}
+
+	return data
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,275 @@
+package somegraph
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"encoding/json"
+	"fmt"
+	"io"
+	"math"
+	"strconv"
+	"sync"
+	"time"
+	"unicode/utf8"
+)
+
+// jsonFlushSize gives the size of the buffered JSON text which is
+// passed on to the underlying writer.
+const jsonFlushSize = 32 * 1024
+
+// jsonWriter buffers the JSON text for an io.Writer.
+//
+// The first error is kept and all the subsequent writes are ignored.
+type jsonWriter struct {
+	// is the underlying writer.
+	w io.Writer
+
+	// holds the JSON text which has not been written yet.
+	buf []byte
+
+	// is the first encountered error.
+	err error
+}
+
+// jsonWriterPool keeps the writers so that their buffers can be reused.
+var jsonWriterPool = sync.Pool{
+	New: func() interface{} {
+		return &jsonWriter{buf: make([]byte, 0, 2*jsonFlushSize)}
+	},
+}
+
+// fail records the error unless an error has been already recorded.
+func (jw *jsonWriter) fail(err error) {
+	if jw.err == nil {
+		jw.err = err
+	}
+}
+
+// flush writes the buffered text to the underlying writer.
+func (jw *jsonWriter) flush() {
+	if jw.err == nil && len(jw.buf) > 0 {
+		_, jw.err = jw.w.Write(jw.buf)
+	}
+	jw.buf = jw.buf[:0]
+}
+
+// flushIfFull writes the buffered text to the underlying writer
+// if the buffer is full.
+//
+// A writer without an underlying writer keeps the whole text
+// in the buffer.
+func (jw *jsonWriter) flushIfFull() {
+	if jw.w != nil && len(jw.buf) >= jsonFlushSize {
+		jw.flush()
+	}
+}
+
+// jsonHexDigits are used to encode the escaped characters.
+const jsonHexDigits = "0123456789abcdef"
+
+// jsonShortEscapes is set if encoding/json escapes the backspace and
+// the form feed as \b and \f instead of \u0008 and \u000c.
+//
+// Go 1.22 changed these escapes in encoding/json so the writer asks
+// the toolchain at hand in order to produce the same text.
+var jsonShortEscapes = func() bool {
+	data, err := json.Marshal("\b")
+	return err == nil && string(data) == `"\b"`
+}()
+
+// jsonSafe checks whether c needs no escaping as encoding/json
+// escapes the strings.
+func jsonSafe(c byte) bool {
+	return c >= 0x20 && c < utf8.RuneSelf &&
+		c != '"' && c != '\\' && c != '<' && c != '>' && c != '&'
+}
+
+// jsonAppendString appends s as a JSON string to buf.
+//
+// The string is escaped as encoding/json escapes it including
+// the HTML characters. Invalid UTF-8 is replaced with U+FFFD.
+func jsonAppendString(buf []byte, s string) []byte {
+	buf = append(buf, '"')
+	start := 0
+	for i := 0; i < len(s); {
+		if c := s[i]; c < utf8.RuneSelf {
+			if jsonSafe(c) {
+				i++
+				continue
+			}
+
+			buf = append(buf, s[start:i]...)
+			switch c {
+			case '\\', '"':
+				buf = append(buf, '\\', c)
+			case '\n':
+				buf = append(buf, '\\', 'n')
+			case '\r':
+				buf = append(buf, '\\', 'r')
+			case '\t':
+				buf = append(buf, '\\', 't')
+			case '\b', '\f':
+				switch {
+				case !jsonShortEscapes:
+					buf = append(
+						buf, '\\', 'u', '0', '0',
+						jsonHexDigits[c>>4], jsonHexDigits[c&0xF])
+				case c == '\b':
+					buf = append(buf, '\\', 'b')
+				default:
+					buf = append(buf, '\\', 'f')
+				}
+			default:
+				// This encodes the control characters as well as
+				// <, > and &.
+				buf = append(
+					buf, '\\', 'u', '0', '0',
+					jsonHexDigits[c>>4], jsonHexDigits[c&0xF])
+			}
+			i++
+			start = i
+			continue
+		}
+
+		r, size := utf8.DecodeRuneInString(s[i:])
+		if r == utf8.RuneError && size == 1 {
+			buf = append(buf, s[start:i]...)
+			buf = append(buf, `\ufffd`...)
+			i += size
+			start = i
+			continue
+		}
+
+		// U+2028 and U+2029 are escaped for JSONP as encoding/json does.
+		if r == '\u2028' || r == '\u2029' {
+			buf = append(buf, s[start:i]...)
+			buf = append(
+				buf, '\\', 'u', '2', '0', '2', jsonHexDigits[r&0xF])
+			i += size
+			start = i
+			continue
+		}
+
+		i += size
+	}
+	buf = append(buf, s[start:]...)
+	buf = append(buf, '"')
+	return buf
+}
+
+// appendString appends s as a JSON string.
+func (jw *jsonWriter) appendString(s string) {
+	jw.buf = jsonAppendString(jw.buf, s)
+}
+
+// appendFloat appends f as a JSON number formatted as encoding/json
+// formats float64.
+//
+// NaN and infinities can not be represented in JSON and are recorded
+// as an error.
+func (jw *jsonWriter) appendFloat(f float64) {
+	if math.IsInf(f, 0) || math.IsNaN(f) {
+		jw.fail(fmt.Errorf(
+			"unsupported float value: %s",
+			strconv.FormatFloat(f, 'g', -1, 64)))
+		return
+	}
+
+	abs := math.Abs(f)
+	format := byte('f')
+	if abs != 0 && (abs < 1e-6 || abs >= 1e21) {
+		format = 'e'
+	}
+
+	jw.buf = strconv.AppendFloat(jw.buf, f, format, -1, 64)
+
+	if format == 'e' {
+		// Clean up e-09 to e-9.
+		n := len(jw.buf)
+		if n >= 4 && jw.buf[n-4] == 'e' &&
+			jw.buf[n-3] == '-' && jw.buf[n-2] == '0' {
+
+			jw.buf[n-2] = jw.buf[n-1]
+			jw.buf = jw.buf[:n-1]
+		}
+	}
+}
+
+// appendTime appends t formatted with the layout as a JSON string.
+//
+// The time is formatted directly into the buffer and only escaped
+// if the formatted text contains characters which need escaping.
+func (jw *jsonWriter) appendTime(t time.Time, layout string) {
+	jw.buf = append(jw.buf, '"')
+	start := len(jw.buf)
+	jw.buf = t.AppendFormat(jw.buf, layout)
+
+	for _, c := range jw.buf[start:] {
+		if !jsonSafe(c) {
+			formatted := string(jw.buf[start:])
+			jw.buf = jsonAppendString(jw.buf[:start-1], formatted)
+			return
+		}
+	}
+
+	jw.buf = append(jw.buf, '"')
+}
+
+// SomeGraphWriteJSON writes the instance as a JSON text
+// to w.
+//
+// The text is written in chunks from a pooled buffer without building
+// a JSONable representation first. The keys are sorted so that the text
+// equals the one given by encoding/json for SomeGraphToJSONable.
+//
+// If an error is returned, a part of the text might have been already
+// written to w.
+//
+// SomeGraphWriteJSON requires:
+//  * instance != nil
+func SomeGraphWriteJSON(
+	w io.Writer,
+	instance *SomeGraph) error {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	jw := jsonWriterPool.Get().(*jsonWriter)
+	jw.w = w
+	defer func() {
+		jw.w = nil
+		jw.err = nil
+		jw.buf = jw.buf[:0]
+
+		// Do not keep the buffers grown by large values.
+		if cap(jw.buf) <= 4*jsonFlushSize {
+			jsonWriterPool.Put(jw)
+		}
+	}()
+
+	jw.buf = append(jw.buf, '{')
+
+	////
+	// Write ArrayOfBooleans
+	////
+
+	jw.buf = append(jw.buf, "\"array_of_booleans\":"...)
+	slice0 := instance.ArrayOfBooleans
+	jw.buf = append(jw.buf, '[')
+	for i0 := range slice0 {
+		if i0 > 0 {
+			jw.buf = append(jw.buf, ',')
+		}
+		jw.buf = strconv.AppendBool(jw.buf, slice0[i0])
+		jw.flushIfFull()
+	}
+	jw.buf = append(jw.buf, ']')
+
+	jw.buf = append(jw.buf, '}')
+	jw.flush()
+
+	return jw.err
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
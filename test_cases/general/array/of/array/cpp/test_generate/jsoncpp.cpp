@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse array_of_arrays
   ////
 
   if (!value.isMember("array_of_arrays")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: array_of_arrays");
   } else {
     const Json::Value& value_0 = value["array_of_arrays"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_arrays"),
+        parse::Ref(graph_ref, "array_of_arrays"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -115,10 +116,7 @@ void some_graph_from(
             "Expected an array, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_arrays")
-              .append("/")
-              .append(std::to_string(i_0)),
+            parse::Ref(parse::Ref(graph_ref, "array_of_arrays"), i_0),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -134,12 +132,7 @@ void some_graph_from(
                 "Expected a bool, but got: ");
 
               errors->add(
-                std::string(ref)
-                  .append("/array_of_arrays")
-                  .append("/")
-                  .append(std::to_string(i_0))
-                  .append("/")
-                  .append(std::to_string(i_1)),
+                parse::Ref(parse::Ref(parse::Ref(graph_ref, "array_of_arrays"), i_0), i_1),
                 message(
                   expected_but_got,
                   strlen(expected_but_got),
@@ -2,11 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strconv"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -44,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfArrays
 	////
@@ -52,17 +50,14 @@ func SomeGraphFromJSONable(
 		"array_of_arrays"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_arrays")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_arrays"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_arrays"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -73,11 +68,8 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				cast2, ok2 := (cast1[i1]).([]interface{})
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_arrays", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_arrays").Index(i1),
 						fmt.Sprintf(
 							"expected a []interface{}, but got: %T",
 							cast1[i1]))
@@ -88,11 +80,8 @@ func SomeGraphFromJSONable(
 					for i2 := range cast2 {
 						cast3, ok3 := (cast2[i2]).(bool)
 						if !ok3 {
-							errors.Add(
-								strings.Join(
-									[]string{
-										ref, "array_of_arrays", strconv.Itoa(i1), strconv.Itoa(i2)},
-									"/"),
+							errors.AddRef(
+								graphRef.Key("array_of_arrays").Index(i1).Index(i2),
 								fmt.Sprintf(
 									"expected a bool, but got: %T",
 									cast2[i2]))
@@ -0,0 +1,808 @@
+package somegraph
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"bytes"
+	"fmt"
+	"strconv"
+	"unicode"
+	"unicode/utf16"
+	"unicode/utf8"
+)
+
+// jsonMaxDepth limits the nesting of JSON values as encoding/json does.
+const jsonMaxDepth = 10000
+
+// jsonSyntaxError describes why a JSON text is invalid.
+type jsonSyntaxError struct {
+	// gives the position of the offending byte in the text.
+	offset int
+
+	// describes the error.
+	message string
+}
+
+func (e *jsonSyntaxError) Error() string {
+	return fmt.Sprintf("%s at offset %d", e.message, e.offset)
+}
+
+// jsonUnexpected reports the unexpected byte at data[i] in the context.
+func jsonUnexpected(data []byte, i int, context string) error {
+	if i >= len(data) {
+		return &jsonSyntaxError{
+			offset:  i,
+			message: "unexpected end of JSON input"}
+	}
+
+	return &jsonSyntaxError{
+		offset:  i,
+		message: fmt.Sprintf("invalid character %q %s", data[i], context)}
+}
+
+// jsonSkipSpace gives the position of the first non-whitespace byte
+// at or after i.
+func jsonSkipSpace(data []byte, i int) int {
+	for i < len(data) {
+		switch data[i] {
+		case ' ', '\t', '\n', '\r':
+			i++
+		default:
+			return i
+		}
+	}
+	return i
+}
+
+// jsonValidate checks that data is a single valid JSON value surrounded
+// by optional whitespace.
+//
+// The numbers which do not fit into float64 are rejected as well since
+// encoding/json can not decode them into an interface{}.
+func jsonValidate(data []byte) error {
+	i, err := jsonValidateValue(data, jsonSkipSpace(data, 0), 0)
+	if err != nil {
+		return err
+	}
+
+	i = jsonSkipSpace(data, i)
+	if i != len(data) {
+		return jsonUnexpected(data, i, "after top-level value")
+	}
+
+	return nil
+}
+
+// jsonValidateValue validates the JSON value starting at data[i].
+//
+// end points right after the value.
+func jsonValidateValue(
+	data []byte, i int, depth int) (end int, err error) {
+
+	if i >= len(data) {
+		return i, jsonUnexpected(data, i, "")
+	}
+
+	switch c := data[i]; {
+	case c == '{' || c == '[':
+		if depth == jsonMaxDepth {
+			return i, &jsonSyntaxError{
+				offset:  i,
+				message: "exceeded max depth"}
+		}
+
+		closing := byte('}')
+		if c == '[' {
+			closing = ']'
+		}
+
+		i = jsonSkipSpace(data, i+1)
+		if i < len(data) && data[i] == closing {
+			return i + 1, nil
+		}
+
+		for {
+			if c == '{' {
+				if i >= len(data) || data[i] != '"' {
+					return i, jsonUnexpected(
+						data, i,
+						"looking for beginning of object key string")
+				}
+
+				i, err = jsonValidateString(data, i)
+				if err != nil {
+					return i, err
+				}
+
+				i = jsonSkipSpace(data, i)
+				if i >= len(data) || data[i] != ':' {
+					return i, jsonUnexpected(data, i, "after object key")
+				}
+				i = jsonSkipSpace(data, i+1)
+			}
+
+			i, err = jsonValidateValue(data, i, depth+1)
+			if err != nil {
+				return i, err
+			}
+
+			i = jsonSkipSpace(data, i)
+			switch {
+			case i < len(data) && data[i] == ',':
+				i = jsonSkipSpace(data, i+1)
+			case i < len(data) && data[i] == closing:
+				return i + 1, nil
+			case c == '{':
+				return i, jsonUnexpected(
+					data, i, "after object key:value pair")
+			default:
+				return i, jsonUnexpected(data, i, "after array element")
+			}
+		}
+
+	case c == '"':
+		return jsonValidateString(data, i)
+
+	case c == 't':
+		return jsonValidateLiteral(data, i, "true")
+
+	case c == 'f':
+		return jsonValidateLiteral(data, i, "false")
+
+	case c == 'n':
+		return jsonValidateLiteral(data, i, "null")
+
+	case c == '-' || (c >= '0' && c <= '9'):
+		return jsonValidateNumber(data, i)
+
+	default:
+		return i, jsonUnexpected(data, i, "looking for beginning of value")
+	}
+}
+
+// jsonValidateLiteral validates the literal starting at data[i].
+func jsonValidateLiteral(
+	data []byte, i int, literal string) (end int, err error) {
+
+	for k := 0; k < len(literal); k++ {
+		if i+k >= len(data) || data[i+k] != literal[k] {
+			return i + k, jsonUnexpected(
+				data, i+k, fmt.Sprintf("in literal %s", literal))
+		}
+	}
+	return i + len(literal), nil
+}
+
+// jsonValidateString validates the string starting at data[i].
+func jsonValidateString(data []byte, i int) (end int, err error) {
+	i++
+	for i < len(data) {
+		c := data[i]
+		switch {
+		case c == '"':
+			return i + 1, nil
+
+		case c == '\\':
+			i++
+			if i >= len(data) {
+				return i, jsonUnexpected(data, i, "")
+			}
+
+			switch data[i] {
+			case '"', '\\', '/', 'b', 'f', 'n', 'r', 't':
+				i++
+			case 'u':
+				for k := 1; k <= 4; k++ {
+					if i+k >= len(data) || !jsonIsHex(data[i+k]) {
+						return i + k, jsonUnexpected(
+							data, i+k,
+							"in \\u hexadecimal character escape")
+					}
+				}
+				i += 5
+			default:
+				return i, jsonUnexpected(data, i, "in string escape code")
+			}
+
+		case c < 0x20:
+			return i, jsonUnexpected(data, i, "in string literal")
+
+		default:
+			i++
+		}
+	}
+	return i, jsonUnexpected(data, i, "")
+}
+
+// jsonIsHex checks whether c is a hexadecimal digit.
+func jsonIsHex(c byte) bool {
+	return (c >= '0' && c <= '9') ||
+		(c >= 'a' && c <= 'f') ||
+		(c >= 'A' && c <= 'F')
+}
+
+// jsonSkipDigits gives the position of the first non-digit at or after i.
+func jsonSkipDigits(data []byte, i int) int {
+	for i < len(data) && data[i] >= '0' && data[i] <= '9' {
+		i++
+	}
+	return i
+}
+
+// jsonValidateNumber validates the number starting at data[i].
+func jsonValidateNumber(data []byte, i int) (end int, err error) {
+	start := i
+	if data[i] == '-' {
+		i++
+	}
+
+	switch {
+	case i < len(data) && data[i] == '0':
+		i++
+	case i < len(data) && data[i] >= '1' && data[i] <= '9':
+		i = jsonSkipDigits(data, i+1)
+	default:
+		return i, jsonUnexpected(data, i, "in numeric literal")
+	}
+
+	integerDigits := i - start
+
+	if i < len(data) && data[i] == '.' {
+		i++
+		if i >= len(data) || data[i] < '0' || data[i] > '9' {
+			return i, jsonUnexpected(
+				data, i, "after decimal point in numeric literal")
+		}
+		i = jsonSkipDigits(data, i)
+	}
+
+	hasExponent := false
+	if i < len(data) && (data[i] == 'e' || data[i] == 'E') {
+		hasExponent = true
+
+		i++
+		if i < len(data) && (data[i] == '+' || data[i] == '-') {
+			i++
+		}
+		if i >= len(data) || data[i] < '0' || data[i] > '9' {
+			return i, jsonUnexpected(
+				data, i, "in exponent of numeric literal")
+		}
+		i = jsonSkipDigits(data, i)
+	}
+
+	// Only the numbers with an exponent or with more than 308
+	// integer digits can overflow float64.
+	if hasExponent || integerDigits > 308 {
+		_, parseErr := strconv.ParseFloat(string(data[start:i]), 64)
+		if parseErr != nil {
+			return i, &jsonSyntaxError{
+				offset: start,
+				message: fmt.Sprintf(
+					"number %s does not fit into float64",
+					data[start:i])}
+		}
+	}
+
+	return i, nil
+}
+
+// jsonSkipString gives the position right after the valid JSON string
+// starting at data[i].
+func jsonSkipString(data []byte, i int) int {
+	i++
+	for {
+		i += bytes.IndexByte(data[i:], '"')
+
+		// The quote is escaped if it is preceded by an odd number
+		// of backslashes.
+		backslashes := 0
+		for k := i - 1; data[k] == '\\'; k-- {
+			backslashes++
+		}
+
+		i++
+		if backslashes%2 == 0 {
+			return i
+		}
+	}
+}
+
+// jsonSkipValue gives the position right after the valid JSON value
+// starting at data[i].
+func jsonSkipValue(data []byte, i int) int {
+	switch data[i] {
+	case '"':
+		return jsonSkipString(data, i)
+
+	case '{', '[':
+		depth := 0
+		for {
+			switch data[i] {
+			case '"':
+				i = jsonSkipString(data, i)
+				continue
+			case '{', '[':
+				depth++
+			case '}', ']':
+				depth--
+				if depth == 0 {
+					return i + 1
+				}
+			}
+			i++
+		}
+
+	default:
+		// Numbers and literals end at a delimiter.
+		for i < len(data) {
+			switch data[i] {
+			case ',', '}', ']', ' ', '\t', '\n', '\r':
+				return i
+			}
+			i++
+		}
+		return i
+	}
+}
+
+// jsonTypeName gives the type of the valid JSON value as
+// encoding/json would decode it into an interface{}.
+//
+// The names correspond to the ones given by the %T verb of fmt.
+func jsonTypeName(value []byte) string {
+	switch value[0] {
+	case '{':
+		return "map[string]interface {}"
+	case '[':
+		return "[]interface {}"
+	case '"':
+		return "string"
+	case 't', 'f':
+		return "bool"
+	case 'n':
+		return "<nil>"
+	default:
+		return "float64"
+	}
+}
+
+// jsonBool parses the valid JSON value as a bool.
+//
+// ok is false if the value is not a bool.
+func jsonBool(value []byte) (b bool, ok bool) {
+	switch value[0] {
+	case 't':
+		return true, true
+	case 'f':
+		return false, true
+	default:
+		return false, false
+	}
+}
+
+// jsonFloat parses the valid JSON value as a float64.
+//
+// ok is false if the value is not a number.
+func jsonFloat(value []byte) (f float64, ok bool) {
+	if value[0] != '-' && (value[0] < '0' || value[0] > '9') {
+		return 0, false
+	}
+
+	// The range has been already checked by jsonValidate.
+	f, _ = strconv.ParseFloat(string(value), 64)
+	return f, true
+}
+
+// jsonGetU4 decodes \uXXXX from the beginning of s.
+//
+// The result is negative if s does not start with such an escape.
+func jsonGetU4(s []byte) rune {
+	if len(s) < 6 || s[0] != '\\' || s[1] != 'u' {
+		return -1
+	}
+
+	var r rune
+	for _, c := range s[2:6] {
+		switch {
+		case '0' <= c && c <= '9':
+			c = c - '0'
+		case 'a' <= c && c <= 'f':
+			c = c - 'a' + 10
+		case 'A' <= c && c <= 'F':
+			c = c - 'A' + 10
+		default:
+			return -1
+		}
+		r = r*16 + rune(c)
+	}
+	return r
+}
+
+// jsonUnquote decodes the content of a valid JSON string
+// given without the quotes.
+//
+// The content is returned as-is if it needs no decoding. Invalid UTF-8
+// and invalid surrogates are replaced with U+FFFD as encoding/json does.
+func jsonUnquote(s []byte) []byte {
+	r := 0
+	for r < len(s) {
+		c := s[r]
+		if c == '\\' {
+			break
+		}
+		if c < utf8.RuneSelf {
+			r++
+			continue
+		}
+		rr, size := utf8.DecodeRune(s[r:])
+		if rr == utf8.RuneError && size == 1 {
+			break
+		}
+		r += size
+	}
+	if r == len(s) {
+		return s
+	}
+
+	b := make([]byte, len(s)+2*utf8.UTFMax)
+	w := copy(b, s[0:r])
+	for r < len(s) {
+		// Out of room? Can only happen if s is full of
+		// malformed UTF-8 and we're replacing each
+		// byte with RuneError.
+		if w >= len(b)-2*utf8.UTFMax {
+			nb := make([]byte, (len(b)+utf8.UTFMax)*2)
+			copy(nb, b[0:w])
+			b = nb
+		}
+
+		switch c := s[r]; {
+		case c == '\\':
+			r++
+			switch s[r] {
+			case '"', '\\', '/':
+				b[w] = s[r]
+				r++
+				w++
+			case 'b':
+				b[w] = '\b'
+				r++
+				w++
+			case 'f':
+				b[w] = '\f'
+				r++
+				w++
+			case 'n':
+				b[w] = '\n'
+				r++
+				w++
+			case 'r':
+				b[w] = '\r'
+				r++
+				w++
+			case 't':
+				b[w] = '\t'
+				r++
+				w++
+			case 'u':
+				r--
+				rr := jsonGetU4(s[r:])
+				r += 6
+				if utf16.IsSurrogate(rr) {
+					rr1 := jsonGetU4(s[r:])
+					dec := utf16.DecodeRune(rr, rr1)
+					if dec != unicode.ReplacementChar {
+						// A valid pair; consume.
+						r += 6
+						w += utf8.EncodeRune(b[w:], dec)
+						break
+					}
+					// Invalid surrogate; fall back to replacement rune.
+					rr = unicode.ReplacementChar
+				}
+				w += utf8.EncodeRune(b[w:], rr)
+			}
+
+		case c < utf8.RuneSelf:
+			b[w] = c
+			r++
+			w++
+
+		default:
+			rr, size := utf8.DecodeRune(s[r:])
+			r += size
+			w += utf8.EncodeRune(b[w:], rr)
+		}
+	}
+	return b[0:w]
+}
+
+// jsonString parses the valid JSON value as a string.
+//
+// ok is false if the value is not a string.
+func jsonString(value []byte) (s string, ok bool) {
+	if value[0] != '"' {
+		return "", false
+	}
+	return string(jsonUnquote(value[1 : len(value)-1])), true
+}
+
+// jsonKey decodes the key given as a valid JSON string.
+//
+// The key is not copied if it needs no decoding.
+func jsonKey(rawKey []byte) []byte {
+	return jsonUnquote(rawKey[1 : len(rawKey)-1])
+}
+
+// jsonObjectReader iterates over the members of a valid JSON object.
+type jsonObjectReader struct {
+	// is the JSON text of the object.
+	data []byte
+
+	// points right after the last read member.
+	pos int
+}
+
+// newJSONObjectReader creates a reader of the valid JSON object
+// whose text starts with '{'.
+func newJSONObjectReader(data []byte) jsonObjectReader {
+	return jsonObjectReader{data: data, pos: 1}
+}
+
+// next reads the next member of the object.
+//
+// rawKey is the key as a JSON string and value the JSON text of
+// the member's value. ok is false if there are no more members.
+func (r *jsonObjectReader) next() (rawKey []byte, value []byte, ok bool) {
+	i := jsonSkipSpace(r.data, r.pos)
+	if r.data[i] == ',' {
+		i = jsonSkipSpace(r.data, i+1)
+	}
+
+	if r.data[i] == '}' {
+		r.pos = i
+		return nil, nil, false
+	}
+
+	keyEnd := jsonSkipString(r.data, i)
+	rawKey = r.data[i:keyEnd]
+
+	// Skip the colon.
+	i = jsonSkipSpace(r.data, jsonSkipSpace(r.data, keyEnd)+1)
+
+	valueEnd := jsonSkipValue(r.data, i)
+	value = r.data[i:valueEnd]
+
+	r.pos = valueEnd
+	return rawKey, value, true
+}
+
+// jsonMember represents a member of a JSON object.
+type jsonMember struct {
+	// is the decoded key.
+	key string
+
+	// is the JSON text of the value.
+	value []byte
+}
+
+// jsonMembers lists the members of the valid JSON object in order.
+func jsonMembers(data []byte) []jsonMember {
+	members := []jsonMember{}
+
+	reader := newJSONObjectReader(data)
+	for {
+		rawKey, value, ok := reader.next()
+		if !ok {
+			break
+		}
+
+		members = append(
+			members,
+			jsonMember{key: string(jsonKey(rawKey)), value: value})
+	}
+
+	return members
+}
+
+// jsonLastMembers keeps only the last of the members with the same key
+// as encoding/json does.
+func jsonLastMembers(members []jsonMember) []jsonMember {
+	last := make(map[string]int, len(members))
+	for i, member := range members {
+		last[member.key] = i
+	}
+
+	result := make([]jsonMember, 0, len(last))
+	for i, member := range members {
+		if last[member.key] == i {
+			result = append(result, member)
+		}
+	}
+
+	return result
+}
+
+// jsonArrayReader iterates over the items of a valid JSON array.
+type jsonArrayReader struct {
+	// is the JSON text of the array.
+	data []byte
+
+	// points right after the last read item.
+	pos int
+}
+
+// newJSONArrayReader creates a reader of the valid JSON array
+// whose text starts with '['.
+func newJSONArrayReader(data []byte) jsonArrayReader {
+	return jsonArrayReader{data: data, pos: 1}
+}
+
+// next reads the JSON text of the next item.
+//
+// ok is false if there are no more items.
+func (r *jsonArrayReader) next() (value []byte, ok bool) {
+	i := jsonSkipSpace(r.data, r.pos)
+	if r.data[i] == ',' {
+		i = jsonSkipSpace(r.data, i+1)
+	}
+
+	if r.data[i] == ']' {
+		r.pos = i
+		return nil, false
+	}
+
+	end := jsonSkipValue(r.data, i)
+	r.pos = end
+	return r.data[i:end], true
+}
+
+// jsonArrayLen counts the items of the valid JSON value.
+//
+// ok is false if the value is not an array.
+func jsonArrayLen(value []byte) (length int, ok bool) {
+	if value[0] != '[' {
+		return 0, false
+	}
+
+	reader := newJSONArrayReader(value)
+	for {
+		_, ok = reader.next()
+		if !ok {
+			break
+		}
+		length++
+	}
+	return length, true
+}
+
+// SomeGraphFromJSONBytes parses SomeGraph from a JSON text.
+//
+// The text is scanned directly into target without decoding it first into
+// an interface{} so that no intermediate maps and boxed values need to be
+// allocated. The text is validated in a separate pass first. The members of
+// objects and the items of arrays are delimited by skipping over their values
+// so that a nested value is scanned once more for each level of nesting above
+// it.
+//
+// The errors are the same as the ones of
+// SomeGraphFromJSONable applied on the text decoded
+// with encoding/json, except that the instances of a class are parsed in
+// the order of the text. An invalid JSON text is reported as a single error.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONBytes requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+func SomeGraphFromJSONBytes(
+	data []byte,
+	ref string,
+	target *SomeGraph,
+	errors *Errors) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	err := jsonValidate(data)
+	if err != nil {
+		errors.Add(
+			ref,
+			fmt.Sprintf(
+				"expected a valid JSON text, but got: %s",
+				err.Error()))
+		return
+	}
+
+	start := jsonSkipSpace(data, 0)
+	value := data[start:jsonSkipValue(data, start)]
+
+	if value[0] != '{' {
+		errors.Add(
+			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %s",
+				jsonTypeName(value)))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	var arrayOfBooleansMember []byte
+
+	reader := newJSONObjectReader(value)
+	for {
+		rawKey, member, ok := reader.next()
+		if !ok {
+			break
+		}
+
+		switch string(jsonKey(rawKey)) {
+		case "array_of_booleans":
+			arrayOfBooleansMember = member
+		}
+	}
+
+	////
+	// Parse ArrayOfBooleans
+	////
+
+	if arrayOfBooleansMember == nil {
+		errors.AddRef(
+			graphRef,
+			"property is missing: array_of_booleans")
+	} else {
+		len1, ok1 := jsonArrayLen(arrayOfBooleansMember)
+		if !ok1 {
+			errors.AddRef(
+				graphRef.Key("array_of_booleans"),
+				fmt.Sprintf(
+					"expected a []interface{}, but got: %s",
+					jsonTypeName(arrayOfBooleansMember)))
+		} else {
+			target1 := make(
+				[]bool,
+				len1)
+			reader1 := newJSONArrayReader(arrayOfBooleansMember)
+			for i1 := range target1 {
+				item1, _ := reader1.next()
+
+				cast2, ok2 := jsonBool(item1)
+				if !ok2 {
+					errors.AddRef(
+						graphRef.Key("array_of_booleans").Index(i1),
+						fmt.Sprintf(
+							"expected a bool, but got: %s",
+							jsonTypeName(item1)))
+				} else {
+					target1[i1] = cast2
+				}
+
+				if errors.Full() {
+					break;
+				}
+			}
+
+			target.ArrayOfBooleans = target1
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
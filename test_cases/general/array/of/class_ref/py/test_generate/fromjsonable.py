@@ -11,9 +11,39 @@ import some.graph
 import some.graph.parse
 
 
+def _empty_construct(
+        value: typing.Any,
+        id: str,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.Empty]:
+    """
+    parses Empty from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    return some.graph.Empty(id=id)
+
+
 def _empty_from(
         value: typing.Any,
-        ref: str,
+        ref: some.graph.parse.Ref,
         target: some.graph.Empty,
         errors: some.graph.parse.Errors
 ) -> None:
@@ -24,7 +54,7 @@ def _empty_from(
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as Empty
     :param errors: errors encountered during parsing
     :return:
@@ -55,12 +85,10 @@ def empty_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_empty(id=id)
-
-    _empty_from(
+    target = _empty_construct(
         value=value,
+        id=id,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -102,8 +130,7 @@ def some_graph_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'empties')),
+                (ref, 'empties'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -112,10 +139,6 @@ def some_graph_from(
             else:
                 graph.empties = dict()
 
-            empties_registry = graph.empties
-            for id in registry_value:
-                empties_registry[id] = some.graph.parse.placeholder_empty(id=id)
-
     if errors.full():
         return None
 
@@ -130,14 +153,331 @@ def some_graph_from(
     if 'empties' in value:
         registry_value = value['empties']
         for id, instance_value in registry_value.items():
-            target_empty = graph.empties[id]
-            target_empty.id = id
+            instance_empty = _empty_construct(
+                instance_value,
+                id,
+                (ref, 'empties', (id, )),
+                errors)
+
+            if instance_empty is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_empty = some.graph.parse.placeholder_empty(id=id)
+
+            graph.empties[id] = instance_empty
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse array_of_class_refs
+    ##
+
+    value_0 = value.get(
+        'array_of_class_refs',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: array_of_class_refs')
+    else:
+        if not isinstance(value_0, list):
+            errors.add(
+                (ref, 'array_of_class_refs'),
+                "Expected a list, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = (
+                []
+            )  # type: typing.List[some.graph.Empty]
+            for i_1, item_1 in enumerate(
+                    value_0):
+                target_item_1 = (
+                    None
+                )  # type: typing.Optional[some.graph.Empty]
+                if not isinstance(item_1, str):
+                    errors.add(
+                        (ref, 'array_of_class_refs', i_1),
+                        "Expected a str, but got: {}".format(
+                            type(item_1)))
+                else:
+                    target_2 = graph.empties.get(
+                        item_1,
+                        None)
+                    if target_2 is None:
+                        errors.add(
+                            (ref, 'array_of_class_refs', i_1),
+                            'Reference to an instance of class Empty not found: {}'.format(
+                                item_1))
+                    else:
+                        target_item_1 = target_2
+
+                if target_item_1 is not None:
+                    target_1.append(
+                        target_item_1)
+
+                if errors.full():
+                    break
+
+            graph.array_of_class_refs = target_1
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _empty_construct_fast(
+        value: typing.Any,
+        id: str
+) -> some.graph.Empty:
+    """
+    parses Empty optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    return some.graph.Empty(id=id)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate empties
+    ##
+
+    registry_value = value.get('empties', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.empties = collections.OrderedDict()
+        else:
+            graph.empties = dict()
+
+    ##
+    # Parse empties
+    ##
+
+    if 'empties' in value:
+        registry_value = value['empties']
+        for id, instance_value in registry_value.items():
+            graph.empties[id] = _empty_construct_fast(
+                instance_value,
+                id)
+
+    ##
+    # Parse array_of_class_refs
+    ##
+
+    value_1 = value['array_of_class_refs']
+    if not isinstance(value_1, list):
+        raise TypeError("Expected a list")
+    target_1 = (
+        []
+    )  # type: typing.List[some.graph.Empty]
+    for item_1 in value_1:
+        target_item_1 = graph.empties[
+            item_1]
+        target_1.append(
+            target_item_1)
+    graph.array_of_class_refs = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_empties = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate empties reusing the unchanged instances
+    ##
+
+    registry_value = value.get('empties', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'empties'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.empties = collections.OrderedDict()
+            else:
+                graph.empties = dict()
+
+            empties_registry = graph.empties
+            previous_empties = previous.empties
+
+            previous_registry_value = previous_value.get(
+                'empties', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_empty = previous_empties.get(id, None)
+                if (target_empty is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_empty = some.graph.parse.placeholder_empty(id=id)
+                    changed_empties.add(id)
+
+                empties_registry[id] = target_empty
+
+    changed_empties.update(
+        id for id in previous.empties
+        if id not in graph.empties)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse the new and changed empties
+    ##
+
+    registry_value = value.get('empties', None)
+    if registry_value is not None and changed_empties:
+        for id, instance_value in registry_value.items():
+            if id not in changed_empties:
+                continue
 
             _empty_from(
                 instance_value,
-                '/'.join((
-                    ref, 'empties', repr(id))),
-                target_empty,
+                (ref, 'empties', (id, )),
+                graph.empties[id],
                 errors)
 
             if errors.full():
@@ -158,8 +498,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_class_refs')),
+                (ref, 'array_of_class_refs'),
                 "Expected a list, but got: {}".format(
                     type(value_0)))
         else:
@@ -173,8 +512,7 @@ def some_graph_from(
                 )  # type: typing.Optional[some.graph.Empty]
                 if not isinstance(item_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'array_of_class_refs', str(i_1))),
+                        (ref, 'array_of_class_refs', i_1),
                         "Expected a str, but got: {}".format(
                             type(item_1)))
                 else:
@@ -183,8 +521,7 @@ def some_graph_from(
                         None)
                     if target_2 is None:
                         errors.add(
-                            '/'.join((
-                                ref, 'array_of_class_refs', str(i_1))),
+                            (ref, 'array_of_class_refs', i_1),
                             'Reference to an instance of class Empty not found: {}'.format(
                                 item_1))
                     else:
@@ -32,6 +32,109 @@ std::string message(const char* cc, size_t cc_size, std::string s) {
   return result;
 }
 
+/**
+ * parses the zero-padded decimal digits as an integer.
+ *
+ * @param[in] s string containing the digits
+ * @param[in] start position of the first digit
+ * @param[in] end position after the last digit
+ * @param[out] value parsed integer
+ * @return true if all the characters are ASCII digits
+ */
+bool fixed_digits(const std::string& s, size_t start, size_t end, int* value) {
+  int result = 0;
+  for (size_t i = start; i < end; ++i) {
+    if (s[i] < '0' or s[i] > '9') {
+      return false;
+    }
+    result = result * 10 + (s[i] - '0');
+  }
+
+  *value = result;
+  return true;
+}
+
+/**
+ * computes the number of days in the month of the Gregorian calendar.
+ *
+ * @param[in] year of the month
+ * @param[in] month starting at 1
+ * @return number of days
+ */
+int days_in_month(int year, int month) {
+  static const int kDays[] = {31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
+
+  if (month == 2 and
+      year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) {
+    return 29;
+  }
+
+  return kDays[month - 1];
+}
+
+/**
+ * sets the day of the week and the day of the year as strptime does.
+ *
+ * @param[in, out] t date whose year, month and day are set
+ */
+void set_wday_and_yday(struct tm* t) {
+  const int year = t->tm_year + 1900;
+
+  int yday = t->tm_mday - 1;
+  for (int month = 1; month < t->tm_mon + 1; ++month) {
+    yday += days_in_month(year, month);
+  }
+  t->tm_yday = yday;
+
+  // Sakamoto's method
+  static const int kOffsets[] = {0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4};
+  const int y = (t->tm_mon < 2) ? year - 1 : year;
+  t->tm_wday = (
+    y + y / 4 - y / 100 + y / 400 + kOffsets[t->tm_mon] + t->tm_mday) % 7;
+}
+
+/**
+ * parses the string in the format "%Y-%m-%d"
+ * if the string is zero-padded and all its fields are within
+ * the regular ranges.
+ *
+ * @param[in] s string to be parsed
+ * @param[out] t parsed date/time; only the fields of the format are set
+ * @return true if parsed; otherwise, s needs to be parsed with strptime
+ */
+bool strptime_fixed_Y_45_m_45_d(
+    const std::string& s,
+    struct tm* t) {
+  if (s.size() != 10 or
+      s.compare(4, 1, "-") != 0 or
+      s.compare(7, 1, "-") != 0) {
+    return false;
+  }
+
+  int year;
+  int month;
+  int day;
+  if (not fixed_digits(s, 0, 4, &year) or
+      not fixed_digits(s, 5, 7, &month) or
+      not fixed_digits(s, 8, 10, &day)) {
+    return false;
+  }
+
+  if (year < 1 or
+      month < 1 or
+      month > 12 or
+      day < 1 or
+      day > days_in_month(year, month)) {
+    return false;
+  }
+
+  t->tm_year = year - 1900;
+  t->tm_mon = month - 1;
+  t->tm_mday = day;
+  set_wday_and_yday(t);
+  return true;
+}
+
 /**
  * converts a JSON value type to a human-readable string representation.
  *
@@ -83,13 +186,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse array_of_dates
   ////
 
   if (!value.isMember("array_of_dates")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: array_of_dates");
   } else {
     const Json::Value& value_0 = value["array_of_dates"];
@@ -98,8 +203,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_dates"),
+        parse::Ref(graph_ref, "array_of_dates"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -115,10 +219,7 @@ void some_graph_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_dates")
-              .append("/")
-              .append(std::to_string(i_0)),
+            parse::Ref(parse::Ref(graph_ref, "array_of_dates"), i_0),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -127,28 +228,29 @@ void some_graph_from(
         } else {
           const std::string cast_1 = item_0.asString();
           struct tm tm_1 = tm{0};
-          char* ret_1 = strptime(
-            cast_1.c_str(),
-            "%Y-%m-%d",
-            &tm_1);
-
-          if (ret_1 == nullptr or *ret_1 != '\0') {
-            constexpr auto expected_but_got(
-              "Expected to strptime "
-              "%Y-%m-%d"
-              ", but got: ");
-
-            errors->add(
-              std::string(ref)
-                .append("/array_of_dates")
-                .append("/")
-                .append(std::to_string(i_0)),
-              message(
-                expected_but_got,
-                strlen(expected_but_got),
-                cast_1));
-          } else {
+          if (strptime_fixed_Y_45_m_45_d(cast_1, &tm_1)) {
             target_0.at(i_0) = tm_1;
+          } else {
+            char* ret_1 = strptime(
+              cast_1.c_str(),
+              "%Y-%m-%d",
+              &tm_1);
+
+            if (ret_1 == nullptr or *ret_1 != '\0') {
+              constexpr auto expected_but_got(
+                "Expected to strptime "
+                "%Y-%m-%d"
+                ", but got: ");
+
+              errors->add(
+                parse::Ref(parse::Ref(graph_ref, "array_of_dates"), i_0),
+                message(
+                  expected_but_got,
+                  strlen(expected_but_got),
+                  cast_1));
+            } else {
+              target_0.at(i_0) = tm_1;
+            }
           }
         }
         ++i_0;
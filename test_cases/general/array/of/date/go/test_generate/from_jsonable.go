@@ -4,11 +4,70 @@ package somegraph
 
 import (
 	"fmt"
-	"strconv"
-	"strings"
 	"time"
 )
 
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+	for i := 0; i < len(text); i++ {
+		if text[i] < '0' || text[i] > '9' {
+			return 0, false
+		}
+		value = value*10 + int(text[i]-'0')
+	}
+	return value, true
+}
+
+// timeFromFixedY_45_m_45_d parses the text
+// in the layout "2006-01-02" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_45_m_45_d(text string) (t time.Time, ok bool) {
+	if len(text) != 10 ||
+		text[4:5] != "-" ||
+		text[7:8] != "-" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		0,
+		0,
+		0,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
 // If there are any errors, the state of target is undefined.
@@ -45,6 +104,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfDates
 	////
@@ -53,17 +114,14 @@ func SomeGraphFromJSONable(
 		"array_of_dates"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_dates")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_dates"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_dates"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -74,24 +132,22 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				cast2, ok2 := (cast1[i1]).(string)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_dates", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_dates").Index(i1),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast1[i1]))
 				} else {
-					target2, err2 := time.Parse(
-						"2006-01-02",
-						cast2)
+					target2, fixed2 := timeFromFixedY_45_m_45_d(cast2)
+					var err2 error
+					if !fixed2 {
+						target2, err2 = time.Parse(
+							"2006-01-02",
+							cast2)
+					}
 					if err2 != nil {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "array_of_dates", strconv.Itoa(i1)},
-								"/"),
+						errors.AddRef(
+							graphRef.Key("array_of_dates").Index(i1),
 							fmt.Sprintf(
 								"expected layout 2006-01-02, got: %s",
 								cast2))
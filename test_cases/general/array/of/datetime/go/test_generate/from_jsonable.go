@@ -4,11 +4,92 @@ package somegraph
 
 import (
 	"fmt"
-	"strconv"
-	"strings"
 	"time"
 )
 
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+	for i := 0; i < len(text); i++ {
+		if text[i] < '0' || text[i] > '9' {
+			return 0, false
+		}
+		value = value*10 + int(text[i]-'0')
+	}
+	return value, true
+}
+
+// timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90 parses the text
+// in the layout "2006-01-02T15:04:05Z" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90(text string) (t time.Time, ok bool) {
+	if len(text) != 20 ||
+		text[4:5] != "-" ||
+		text[7:8] != "-" ||
+		text[10:11] != "T" ||
+		text[13:14] != ":" ||
+		text[16:17] != ":" ||
+		text[19:20] != "Z" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	hour, ok := fixedDigits(text[11:13])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	minute, ok := fixedDigits(text[14:16])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	second, ok := fixedDigits(text[17:19])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		hour,
+		minute,
+		second,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day ||
+		t.Hour() != hour ||
+		t.Minute() != minute ||
+		t.Second() != second {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
 // If there are any errors, the state of target is undefined.
@@ -45,6 +126,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfDatetimes
 	////
@@ -53,17 +136,14 @@ func SomeGraphFromJSONable(
 		"array_of_datetimes"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_datetimes")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_datetimes"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_datetimes"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -74,24 +154,22 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				cast2, ok2 := (cast1[i1]).(string)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_datetimes", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_datetimes").Index(i1),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast1[i1]))
 				} else {
-					target2, err2 := time.Parse(
-						"2006-01-02T15:04:05Z",
-						cast2)
+					target2, fixed2 := timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90(cast2)
+					var err2 error
+					if !fixed2 {
+						target2, err2 = time.Parse(
+							"2006-01-02T15:04:05Z",
+							cast2)
+					}
 					if err2 != nil {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "array_of_datetimes", strconv.Itoa(i1)},
-								"/"),
+						errors.AddRef(
+							graphRef.Key("array_of_datetimes").Index(i1),
 							fmt.Sprintf(
 								"expected layout 2006-01-02T15:04:05Z, got: %s",
 								cast2))
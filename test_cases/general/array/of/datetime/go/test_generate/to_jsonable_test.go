@@ -1,3 +1,38 @@
 package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"io/ioutil"
+	"testing"
+)
+
+func BenchmarkSomeGraphToJSONable(b *testing.B) {
+	instance := newSyntheticSomeGraph()
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		_, err := SomeGraphToJSONable(instance)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkSomeGraphWriteJSON(b *testing.B) {
+	instance := newSyntheticSomeGraph()
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		err := SomeGraphWriteJSON(ioutil.Discard, instance)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
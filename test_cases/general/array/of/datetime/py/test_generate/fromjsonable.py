@@ -5,12 +5,48 @@
 
 
 import datetime
+import re
 import typing
 
 import some.graph
 import some.graph.parse
 
 
+_DATETIME_Y_45_m_45_d_84_H_58_M_58_S_90_RE = re.compile(
+    r'([0-9]{4})\-([0-9]{2})\-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})Z\Z')
+
+
+def _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(text: str) -> datetime.datetime:
+    """
+    parses the datetime from the string in the format '%Y-%m-%dT%H:%M:%SZ'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: datetime
+    :raise: ValueError if the string could not be parsed
+
+    >>> _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90('2016-07-03T12:34:56Z')
+    datetime.datetime(2016, 7, 3, 12, 34, 56)
+
+    """
+    match = _DATETIME_Y_45_m_45_d_84_H_58_M_58_S_90_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.datetime(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)),
+                int(match.group(4)),
+                int(match.group(5)),
+                int(match.group(6)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y-%m-%dT%H:%M:%SZ')
+
+
 def some_graph_from(
         value: typing.Any,
         ref: str,
@@ -50,8 +86,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_datetimes')),
+                (ref, 'array_of_datetimes'),
                 "Expected a list, but got: {}".format(
                     type(value_0)))
         else:
@@ -65,19 +100,16 @@ def some_graph_from(
                 )  # type: typing.Optional[datetime.datetime]
                 if not isinstance(item_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'array_of_datetimes', str(i_1))),
+                        (ref, 'array_of_datetimes', i_1),
                         "Expected a string, but got: {}".format(
                             type(item_1)))
                 else:
                     try:
-                        target_item_1 = datetime.datetime.strptime(
-                            item_1,
-                            '%Y-%m-%dT%H:%M:%SZ')
+                        target_item_1 = _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(
+                            item_1)
                     except ValueError:
                         errors.add(
-                            '/'.join((
-                                ref, 'array_of_datetimes', str(i_1))),
+                            (ref, 'array_of_datetimes', i_1),
                             'Expected to strptime %Y-%m-%dT%H:%M:%SZ, but got: {}'.format(
                                 item_1))
 
@@ -97,3 +129,70 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse array_of_datetimes
+    ##
+
+    value_1 = value['array_of_datetimes']
+    if not isinstance(value_1, list):
+        raise TypeError("Expected a list")
+    target_1 = (
+        []
+    )  # type: typing.List[datetime.datetime]
+    for item_1 in value_1:
+        target_item_1 = _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(
+            item_1)
+        target_1.append(
+            target_item_1)
+    graph.array_of_datetimes = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -5,24 +5,96 @@
 
 
 import datetime
-import re
 import typing
 
 import some.graph
 import some.graph.parse
 
 
-_DURATION_RE = re.compile(
-    r'^(?P<sign>\+|-)?P'
-    r'((?P<years>(0|[1-9][0-9]*)(\.[0-9]+)?)Y)?'
-    r'((?P<months>(0|[1-9][0-9]*)(\.[0-9]+)?)M)?'
-    r'((?P<weeks>(0|[1-9][0-9]*)(\.[0-9]+)?)W)?'
-    r'((?P<days>(0|[1-9][0-9]*)(\.[0-9]+)?)D)?'
-    r'(T'
-    r'((?P<hours>(0|[1-9][0-9]*)(\.[0-9]+)?)H)?'
-    r'((?P<minutes>(0|[1-9][0-9]*)(\.[0-9]+)?)M)?'
-    r'(((?P<seconds>0|[1-9][0-9]*)(\.(?P<fraction>[0-9]+))?)S)?'
-    r')?$')
+def _scan_duration(text: str) -> typing.Optional[typing.List[str]]:
+    """
+    scans the duration in ISO 8601 format in a single pass.
+
+    :param text: string to be scanned
+    :return:
+        sign, years, months, weeks, days, hours, minutes, seconds and
+        fraction of seconds as strings (empty if not specified),
+        or None if the text does not conform to the format
+
+    >>> _scan_duration('-P1.5YT2M3.04S')
+    ['-', '1.5', '', '', '', '', '2', '3', '04']
+
+    >>> _scan_duration('P01D') is None
+    True
+
+    """
+    # Accept a trailing new line for backward compatibility: the durations
+    # used to be matched by a regular expression ending in ``$``.
+    end = len(text) - 1 if text.endswith('\n') else len(text)
+
+    groups = ['', '', '', '', '', '', '', '', '']
+
+    position = 0
+    if position < end and text[position] in '+-':
+        groups[0] = text[position]
+        position += 1
+
+    if position == end or text[position] != 'P':
+        return None
+    position += 1
+
+    # Designators of the date part are followed by
+    # the designators of the time part.
+    designators = 'YMWD'
+    offset = 1
+    next_designator = 0
+
+    while position < end:
+        if text[position] == 'T' and offset == 1:
+            designators = 'HMS'
+            offset = 5
+            next_designator = 0
+            position += 1
+            continue
+
+        start = position
+
+        if text[position] == '0':
+            position += 1
+        elif '1' <= text[position] <= '9':
+            position += 1
+            while position < end and '0' <= text[position] <= '9':
+                position += 1
+        else:
+            return None
+
+        integer_end = position
+
+        if position < end and text[position] == '.':
+            position += 1
+            while position < end and '0' <= text[position] <= '9':
+                position += 1
+
+            if position == integer_end + 1:
+                return None
+
+        if position == end:
+            return None
+
+        designator = designators.find(text[position], next_designator)
+        if designator == -1:
+            return None
+
+        if offset + designator == 7:
+            groups[7] = text[start:integer_end]
+            groups[8] = text[integer_end + 1:position]
+        else:
+            groups[offset + designator] = text[start:position]
+
+        next_designator = designator + 1
+        position += 1
+
+    return groups
 
 
 def _duration_from_string(text: str) -> datetime.timedelta:
@@ -77,41 +149,29 @@ def _duration_from_string(text: str) -> datetime.timedelta:
     datetime.timedelta(-1)
 
     """
-    match = _DURATION_RE.match(text)
+    groups = _scan_duration(text)
 
-    if not match:
+    if groups is None:
         raise ValueError(
             'Failed to match the duration: {!r}'.format(
                 text))
 
-    sign_grp = match.group('sign')
+    (sign_grp, years_grp, months_grp, weeks_grp, days_grp, hours_grp,
+     minutes_grp, seconds_grp, fraction_grp) = groups
+
     if not sign_grp or sign_grp == '+':
         sign = 1
     else:
         sign = -1
 
-    years_grp = match.group('years')
     years = float(years_grp) if years_grp else 0.0
-
-    months_grp = match.group('months')
     months = float(months_grp) if months_grp else 0.0
-
-    weeks_grp = match.group('weeks')
     weeks = float(weeks_grp) if weeks_grp else 0.0
-
-    days_grp = match.group('days')
     days = float(days_grp) if days_grp else 0.0
-
-    hours_grp = match.group('hours')
     hours = float(hours_grp) if hours_grp else 0.0
-
-    minutes_grp = match.group('minutes')
     minutes = float(minutes_grp) if minutes_grp else 0.0
-
-    seconds_grp = match.group('seconds')
     seconds = int(seconds_grp) if seconds_grp else 0
 
-    fraction_grp = match.group('fraction')
     if not fraction_grp:
         microseconds = 0
 
@@ -181,8 +241,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_durations')),
+                (ref, 'array_of_durations'),
                 "Expected a list, but got: {}".format(
                     type(value_0)))
         else:
@@ -196,8 +255,7 @@ def some_graph_from(
                 )  # type: typing.Optional[datetime.timedelta]
                 if not isinstance(item_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'array_of_durations', str(i_1))),
+                        (ref, 'array_of_durations', i_1),
                         "Expected a string, but got: {}".format(
                             type(item_1)))
                 else:
@@ -206,8 +264,7 @@ def some_graph_from(
                             item_1)
                     except (ValueError, OverflowError) as err:
                         errors.add(
-                            '/'.join((
-                                ref, 'array_of_durations', str(i_1))),
+                            (ref, 'array_of_durations', i_1),
                             str(err))
 
                 if target_item_1 is not None:
@@ -226,3 +283,72 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse array_of_durations
+    ##
+
+    value_1 = value['array_of_durations']
+    if not isinstance(value_1, list):
+        raise TypeError("Expected a list")
+    target_1 = (
+        []
+    )  # type: typing.List[datetime.timedelta]
+    for item_1 in value_1:
+        if not isinstance(item_1, str):
+            raise TypeError("Expected a string")
+        target_item_1 = _duration_from_string(
+            item_1)
+        target_1.append(
+            target_item_1)
+    graph.array_of_durations = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse array_of_embeds
   ////
 
   if (!value.isMember("array_of_embeds")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: array_of_embeds");
   } else {
     const Json::Value& value_0 = value["array_of_embeds"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_embeds"),
+        parse::Ref(graph_ref, "array_of_embeds"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -112,10 +113,7 @@ void some_graph_from(
       for (const Json::Value& item_0 : value_0) {
         empty_from(
           item_0,
-          std::string(ref)
-            .append("/array_of_embeds")
-            .append("/")
-            .append(std::to_string(i_0)),
+          parse::Ref(parse::Ref(graph_ref, "array_of_embeds"), i_0),
           &target_0.at(i_0),
           errors);
         ++i_0;
@@ -134,7 +132,7 @@ void some_graph_from(
 
 void empty_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     Empty* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
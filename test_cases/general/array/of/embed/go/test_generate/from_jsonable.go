@@ -2,11 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strconv"
-	"strings"
-)
+import "fmt"
 
 // EmptyFromJSONable parses Empty from a JSONable value.
 //
@@ -18,7 +14,7 @@ import (
 //  * errors.Empty()
 func EmptyFromJSONable(
 	value interface{},
-	ref string,
+	ref *Ref,
 	target *Empty,
 	errors *Errors) {
 
@@ -36,7 +32,7 @@ func EmptyFromJSONable(
 
 	_, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -83,6 +79,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfEmbeds
 	////
@@ -91,17 +89,14 @@ func SomeGraphFromJSONable(
 		"array_of_embeds"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_embeds")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_embeds"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_embeds"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -112,10 +107,7 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				EmptyFromJSONable(
 					cast1[i1],
-					strings.Join(
-						[]string{
-							ref, "array_of_embeds", strconv.Itoa(i1)},
-						"/"),
+					graphRef.Key("array_of_embeds").Index(i1),
 					&(target1[i1]),
 					errors)
 
@@ -12,21 +12,20 @@ import some.graph.parse
 
 def _empty_from(
         value: typing.Any,
-        ref: str,
-        target: some.graph.Empty,
+        ref: some.graph.parse.Ref,
         errors: some.graph.parse.Errors
-) -> None:
+) -> typing.Optional[some.graph.Empty]:
     """
     parses Empty from a JSONable value.
 
-    If ``errors``, the attributes of ``target`` have undefined values.
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
-    :param target: parsed ``value`` as Empty
+        reference to the value (e.g., a lazy reference path)
     :param errors: errors encountered during parsing
-    :return:
+    :return: parsed instance, or None if parsing it added to ``errors``
 
     """
     if not isinstance(value, dict):
@@ -34,7 +33,9 @@ def _empty_from(
             ref,
             "Expected a dictionary, but got: {}".format(
                 type(value)))
-        return
+        return None
+
+    return some.graph.Empty()
 
 
 def empty_from(
@@ -53,12 +54,9 @@ def empty_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_empty()
-
-    _empty_from(
+    target = _empty_from(
         value=value,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -106,8 +104,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_embeds')),
+                (ref, 'array_of_embeds'),
                 "Expected a list, but got: {}".format(
                     type(value_0)))
         else:
@@ -119,16 +116,12 @@ def some_graph_from(
                 target_item_1 = (
                     None
                 )  # type: typing.Optional[some.graph.Empty]
-                target_2 = (
-                    some.graph.parse.placeholder_empty()
-                )
-                _empty_from(
+                target_2 = _empty_from(
                     item_1,
-                    '/'.join((
-                        ref, 'array_of_embeds', str(i_1))),
-                    target_2,
+                    (ref, 'array_of_embeds', i_1),
                     errors)
-                target_item_1 = target_2
+                if target_2 is not None:
+                    target_item_1 = target_2
 
                 if target_item_1 is not None:
                     target_1.append(
@@ -146,3 +139,90 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _empty_from_fast(
+        value: typing.Any
+) -> some.graph.Empty:
+    """
+    parses Empty optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    return some.graph.Empty()
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse array_of_embeds
+    ##
+
+    value_1 = value['array_of_embeds']
+    if not isinstance(value_1, list):
+        raise TypeError("Expected a list")
+    target_1 = (
+        []
+    )  # type: typing.List[some.graph.Empty]
+    for item_1 in value_1:
+        target_item_1 = _empty_from_fast(
+            item_1)
+        target_1.append(
+            target_item_1)
+    graph.array_of_embeds = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse array_of_floats
   ////
 
   if (!value.isMember("array_of_floats")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: array_of_floats");
   } else {
     const Json::Value& value_0 = value["array_of_floats"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_floats"),
+        parse::Ref(graph_ref, "array_of_floats"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -115,10 +116,7 @@ void some_graph_from(
             "Expected a double, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_floats")
-              .append("/")
-              .append(std::to_string(i_0)),
+            parse::Ref(parse::Ref(graph_ref, "array_of_floats"), i_0),
             message(
               expected_but_got,
               strlen(expected_but_got),
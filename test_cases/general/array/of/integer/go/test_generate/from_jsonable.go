@@ -5,8 +5,6 @@ package somegraph
 import (
 	"fmt"
 	"math"
-	"strconv"
-	"strings"
 )
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
@@ -45,6 +43,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfIntegers
 	////
@@ -53,17 +53,14 @@ func SomeGraphFromJSONable(
 		"array_of_integers"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_integers")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_integers"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_integers"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -74,20 +71,14 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				fcast2, ok2 := (cast1[i1]).(float64)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_integers", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_integers").Index(i1),
 						fmt.Sprintf(
 							"expected a float64, but got: %T",
 							cast1[i1]))
 				} else if fcast2 != math.Trunc(fcast2) {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_integers", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_integers").Index(i1),
 						fmt.Sprintf(
 							"expected a whole number, but got: %f",
 							fcast2))
@@ -96,11 +87,8 @@ func SomeGraphFromJSONable(
 				} else if fcast2 >= 9223372036854775808.0 ||
 					fcast2 < -9223372036854775808.0 {
 
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_integers", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_integers").Index(i1),
 						fmt.Sprintf(
 							"expected the value to fit into int64, but got an overflow: %f",
 							fcast2))
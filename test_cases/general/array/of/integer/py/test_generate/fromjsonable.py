@@ -49,8 +49,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_integers')),
+                (ref, 'array_of_integers'),
                 "Expected a list, but got: {}".format(
                     type(value_0)))
         else:
@@ -64,8 +63,7 @@ def some_graph_from(
                 )  # type: typing.Optional[int]
                 if not isinstance(item_1, int):
                     errors.add(
-                        '/'.join((
-                            ref, 'array_of_integers', str(i_1))),
+                        (ref, 'array_of_integers', i_1),
                         "Expected an integer, but got: {}".format(
                             type(item_1)))
                 else:
@@ -87,3 +85,71 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse array_of_integers
+    ##
+
+    value_1 = value['array_of_integers']
+    if not isinstance(value_1, list):
+        raise TypeError("Expected a list")
+    target_1 = (
+        []
+    )  # type: typing.List[int]
+    for item_1 in value_1:
+        if not isinstance(item_1, int):
+            raise TypeError("Expected an integer")
+        target_item_1 = item_1
+        target_1.append(
+            target_item_1)
+    graph.array_of_integers = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
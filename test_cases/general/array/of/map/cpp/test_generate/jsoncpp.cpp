@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse array_of_maps
   ////
 
   if (!value.isMember("array_of_maps")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: array_of_maps");
   } else {
     const Json::Value& value_0 = value["array_of_maps"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_maps"),
+        parse::Ref(graph_ref, "array_of_maps"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -115,10 +116,7 @@ void some_graph_from(
             "Expected an object, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_maps")
-              .append("/")
-              .append(std::to_string(i_0)),
+            parse::Ref(parse::Ref(graph_ref, "array_of_maps"), i_0),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -133,12 +131,7 @@ void some_graph_from(
                 "Expected a bool, but got: ");
 
               errors->add(
-                std::string(ref)
-                  .append("/array_of_maps")
-                  .append("/")
-                  .append(std::to_string(i_0))
-                  .append("/")
-                  .append(it_1.name()),
+                parse::Ref(parse::Ref(parse::Ref(graph_ref, "array_of_maps"), i_0), it_1.name()),
                 message(
                   expected_but_got,
                   strlen(expected_but_got),
@@ -2,11 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strconv"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -44,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfMaps
 	////
@@ -52,17 +50,14 @@ func SomeGraphFromJSONable(
 		"array_of_maps"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_maps")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_maps"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_maps"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -73,11 +68,8 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				cast2, ok2 := (cast1[i1]).(map[string]interface{})
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_maps", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_maps").Index(i1),
 						fmt.Sprintf(
 							"expected a map[string]interface{}, but got: %T",
 							cast1[i1]))
@@ -86,11 +78,8 @@ func SomeGraphFromJSONable(
 					for k2 := range cast2 {
 						cast3, ok3 := (cast2[k2]).(bool)
 						if !ok3 {
-							errors.Add(
-								strings.Join(
-									[]string{
-										ref, "array_of_maps", strconv.Itoa(i1), k2},
-									"/"),
+							errors.AddRef(
+								graphRef.Key("array_of_maps").Index(i1).Key(k2),
 								fmt.Sprintf(
 									"expected a bool, but got: %T",
 									cast2[k2]))
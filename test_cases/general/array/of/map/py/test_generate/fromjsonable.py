@@ -50,8 +50,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_maps')),
+                (ref, 'array_of_maps'),
                 "Expected a list, but got: {}".format(
                     type(value_0)))
         else:
@@ -65,8 +64,7 @@ def some_graph_from(
                 )  # type: typing.Optional[typing.MutableMapping[str, bool]]
                 if not isinstance(item_1, dict):
                     errors.add(
-                        '/'.join((
-                            ref, 'array_of_maps', str(i_1))),
+                        (ref, 'array_of_maps', i_1),
                         "Expected a dict, but got: {}".format(
                             type(item_1)))
                 else:
@@ -82,8 +80,7 @@ def some_graph_from(
                     for key_2, value_2 in item_1.items():
                         if not isinstance(key_2, str):
                             errors.add(
-                                '/'.join((
-                                    ref, 'array_of_maps', str(i_1))),
+                                (ref, 'array_of_maps', i_1),
                                 "Expected the key to be a str, but got: {}".format(
                                     type(key_2)))
 
@@ -97,8 +94,7 @@ def some_graph_from(
                         )  # type: typing.Optional[bool]
                         if not isinstance(value_2, bool):
                             errors.add(
-                                '/'.join((
-                                    ref, 'array_of_maps', str(i_1), repr(key_2))),
+                                (ref, 'array_of_maps', i_1, (key_2, )),
                                 "Expected a bool, but got: {}".format(
                                     type(value_2)))
                         else:
@@ -129,3 +125,86 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse array_of_maps
+    ##
+
+    value_1 = value['array_of_maps']
+    if not isinstance(value_1, list):
+        raise TypeError("Expected a list")
+    target_1 = (
+        []
+    )  # type: typing.List[typing.MutableMapping[str, bool]]
+    for item_1 in value_1:
+        if not isinstance(item_1, dict):
+            raise TypeError("Expected a dict")
+        if isinstance(item_1, collections.OrderedDict):
+            target_2 = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, bool]
+        else:
+            target_2 = (
+                dict()
+            )
+        for key_2, item_2 in item_1.items():
+            if not isinstance(key_2, str):
+                raise TypeError("Expected the key to be a str")
+            if not isinstance(item_2, bool):
+                raise TypeError("Expected a bool")
+            target_item_2 = item_2
+            target_2[key_2] = target_item_2
+        target_item_1 = target_2
+        target_1.append(
+            target_item_1)
+    graph.array_of_maps = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse array_of_paths
   ////
 
   if (!value.isMember("array_of_paths")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: array_of_paths");
   } else {
     const Json::Value& value_0 = value["array_of_paths"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_paths"),
+        parse::Ref(graph_ref, "array_of_paths"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -115,10 +116,7 @@ void some_graph_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_paths")
-              .append("/")
-              .append(std::to_string(i_0)),
+            parse::Ref(parse::Ref(graph_ref, "array_of_paths"), i_0),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -32,6 +32,67 @@ std::string message(const char* cc, size_t cc_size, std::string s) {
   return result;
 }
 
+/**
+ * parses the zero-padded decimal digits as an integer.
+ *
+ * @param[in] s string containing the digits
+ * @param[in] start position of the first digit
+ * @param[in] end position after the last digit
+ * @param[out] value parsed integer
+ * @return true if all the characters are ASCII digits
+ */
+bool fixed_digits(const std::string& s, size_t start, size_t end, int* value) {
+  int result = 0;
+  for (size_t i = start; i < end; ++i) {
+    if (s[i] < '0' or s[i] > '9') {
+      return false;
+    }
+    result = result * 10 + (s[i] - '0');
+  }
+
+  *value = result;
+  return true;
+}
+
+/**
+ * parses the string in the format "%H:%M:%S"
+ * if the string is zero-padded and all its fields are within
+ * the regular ranges.
+ *
+ * @param[in] s string to be parsed
+ * @param[out] t parsed date/time; only the fields of the format are set
+ * @return true if parsed; otherwise, s needs to be parsed with strptime
+ */
+bool strptime_fixed_H_58_M_58_S(
+    const std::string& s,
+    struct tm* t) {
+  if (s.size() != 8 or
+      s.compare(2, 1, ":") != 0 or
+      s.compare(5, 1, ":") != 0) {
+    return false;
+  }
+
+  int hour;
+  int minute;
+  int second;
+  if (not fixed_digits(s, 0, 2, &hour) or
+      not fixed_digits(s, 3, 5, &minute) or
+      not fixed_digits(s, 6, 8, &second)) {
+    return false;
+  }
+
+  if (hour > 23 or
+      minute > 59 or
+      second > 59) {
+    return false;
+  }
+
+  t->tm_hour = hour;
+  t->tm_min = minute;
+  t->tm_sec = second;
+  return true;
+}
+
 /**
  * converts a JSON value type to a human-readable string representation.
  *
@@ -83,13 +144,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse array_of_times
   ////
 
   if (!value.isMember("array_of_times")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: array_of_times");
   } else {
     const Json::Value& value_0 = value["array_of_times"];
@@ -98,8 +161,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_times"),
+        parse::Ref(graph_ref, "array_of_times"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -115,10 +177,7 @@ void some_graph_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_times")
-              .append("/")
-              .append(std::to_string(i_0)),
+            parse::Ref(parse::Ref(graph_ref, "array_of_times"), i_0),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -127,28 +186,29 @@ void some_graph_from(
         } else {
           const std::string cast_1 = item_0.asString();
           struct tm tm_1 = tm{0};
-          char* ret_1 = strptime(
-            cast_1.c_str(),
-            "%H:%M:%S",
-            &tm_1);
-
-          if (ret_1 == nullptr or *ret_1 != '\0') {
-            constexpr auto expected_but_got(
-              "Expected to strptime "
-              "%H:%M:%S"
-              ", but got: ");
-
-            errors->add(
-              std::string(ref)
-                .append("/array_of_times")
-                .append("/")
-                .append(std::to_string(i_0)),
-              message(
-                expected_but_got,
-                strlen(expected_but_got),
-                cast_1));
-          } else {
+          if (strptime_fixed_H_58_M_58_S(cast_1, &tm_1)) {
             target_0.at(i_0) = tm_1;
+          } else {
+            char* ret_1 = strptime(
+              cast_1.c_str(),
+              "%H:%M:%S",
+              &tm_1);
+
+            if (ret_1 == nullptr or *ret_1 != '\0') {
+              constexpr auto expected_but_got(
+                "Expected to strptime "
+                "%H:%M:%S"
+                ", but got: ");
+
+              errors->add(
+                parse::Ref(parse::Ref(graph_ref, "array_of_times"), i_0),
+                message(
+                  expected_but_got,
+                  strlen(expected_but_got),
+                  cast_1));
+            } else {
+              target_0.at(i_0) = tm_1;
+            }
           }
         }
         ++i_0;
@@ -4,11 +4,69 @@ package somegraph
 
 import (
 	"fmt"
-	"strconv"
-	"strings"
 	"time"
 )
 
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+	for i := 0; i < len(text); i++ {
+		if text[i] < '0' || text[i] > '9' {
+			return 0, false
+		}
+		value = value*10 + int(text[i]-'0')
+	}
+	return value, true
+}
+
+// timeFromFixedH_58_M_58_S parses the text
+// in the layout "15:04:05" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedH_58_M_58_S(text string) (t time.Time, ok bool) {
+	if len(text) != 8 ||
+		text[2:3] != ":" ||
+		text[5:6] != ":" {
+		return time.Time{}, false
+	}
+
+	hour, ok := fixedDigits(text[0:2])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	minute, ok := fixedDigits(text[3:5])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	second, ok := fixedDigits(text[6:8])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		0,
+		time.January,
+		1,
+		hour,
+		minute,
+		second,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if t.Hour() != hour ||
+		t.Minute() != minute ||
+		t.Second() != second {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
 // If there are any errors, the state of target is undefined.
@@ -45,6 +103,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfTimes
 	////
@@ -53,17 +113,14 @@ func SomeGraphFromJSONable(
 		"array_of_times"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_times")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_times"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_times"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -74,24 +131,22 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				cast2, ok2 := (cast1[i1]).(string)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_times", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_times").Index(i1),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast1[i1]))
 				} else {
-					target2, err2 := time.Parse(
-						"15:04:05",
-						cast2)
+					target2, fixed2 := timeFromFixedH_58_M_58_S(cast2)
+					var err2 error
+					if !fixed2 {
+						target2, err2 = time.Parse(
+							"15:04:05",
+							cast2)
+					}
 					if err2 != nil {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "array_of_times", strconv.Itoa(i1)},
-								"/"),
+						errors.AddRef(
+							graphRef.Key("array_of_times").Index(i1),
 							fmt.Sprintf(
 								"expected layout 15:04:05, got: %s",
 								cast2))
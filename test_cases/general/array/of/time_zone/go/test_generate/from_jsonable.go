@@ -4,11 +4,53 @@ package somegraph
 
 import (
 	"fmt"
-	"strconv"
-	"strings"
+	"sync"
 	"time"
 )
 
+// locationCache maps time zone names to the loaded *time.Location's.
+//
+// time.LoadLocation reads the time zone database on every call so that
+// the locations are loaded only once and shared among the values.
+var locationCache sync.Map
+
+// loadLocation gives the location with the given name.
+//
+// The location is loaded on the first request and cached afterwards.
+// The names which could not be loaded are not cached.
+//
+// loadLocation is safe for concurrent use.
+func loadLocation(name string) (*time.Location, error) {
+	cached, ok := locationCache.Load(name)
+	if ok {
+		return cached.(*time.Location), nil
+	}
+
+	loc, err := time.LoadLocation(name)
+	if err != nil {
+		return nil, err
+	}
+
+	actual, _ := locationCache.LoadOrStore(name, loc)
+	return actual.(*time.Location), nil
+}
+
+// PrewarmLocations loads the locations with the given names in advance
+// so that the parsing needs not access the time zone database.
+//
+// All the names are loaded even if some fail. The first error is returned.
+//
+// PrewarmLocations is safe for concurrent use.
+func PrewarmLocations(names ...string) (err error) {
+	for _, name := range names {
+		_, loadErr := loadLocation(name)
+		if loadErr != nil && err == nil {
+			err = loadErr
+		}
+	}
+	return
+}
+
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
 // If there are any errors, the state of target is undefined.
@@ -45,6 +87,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse ArrayOfTimeZones
 	////
@@ -53,17 +97,14 @@ func SomeGraphFromJSONable(
 		"array_of_time_zones"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: array_of_time_zones")
 	} else {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_time_zones"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("array_of_time_zones"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -74,22 +115,16 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				cast2, ok2 := (cast1[i1]).(string)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_time_zones", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("array_of_time_zones").Index(i1),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast1[i1]))
 				} else {
-					target2, err2 := time.LoadLocation(cast2)
+					target2, err2 := loadLocation(cast2)
 					if err2 != nil {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "array_of_time_zones", strconv.Itoa(i1)},
-								"/"),
+						errors.AddRef(
+							graphRef.Key("array_of_time_zones").Index(i1),
 							fmt.Sprintf(
 								"failed to load location from %#v: %s",
 								cast2,
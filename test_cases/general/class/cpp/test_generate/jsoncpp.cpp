@@ -89,14 +89,14 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Pre-allocate empties
   ////
 
-  std::string empties_ref;
-  empties_ref.reserve(ref.size() + 8);
-  empties_ref += ref;
-  empties_ref += "/empties";
+  const parse::Ref empties_ref(
+    graph_ref, "empties");
 
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
@@ -146,10 +146,8 @@ void some_graph_from(
   // Pre-allocate with_references
   ////
 
-  std::string with_references_ref;
-  with_references_ref.reserve(ref.size() + 16);
-  with_references_ref += ref;
-  with_references_ref += "/with_references";
+  const parse::Ref with_references_ref(
+    graph_ref, "with_references");
 
   if (value.isMember("with_references")) {
     const Json::Value& obj = value["with_references"];
@@ -181,36 +179,21 @@ void some_graph_from(
     return;
   }
 
-  // Keep the prefix fixed in this buffer so that
-  // it is copied as little as possible
-  std::string instance_ref;
-
   ////
   // Parse empties
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += empties_ref;
-  instance_ref += '/';
-
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        empties_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        empties_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       Empty* instance(
-        target->empties.at(it.name()).get());
+        target->empties.at(id).get());
       empty_from(
         *it,
-        instance_ref,
+        parse::Ref(empties_ref, id),
         instance,
         errors);
 
@@ -227,29 +210,18 @@ void some_graph_from(
   // Parse with_references
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += with_references_ref;
-  instance_ref += '/';
-
   if (value.isMember("with_references")) {
     const Json::Value& obj = value["with_references"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        with_references_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        with_references_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       WithReference* instance(
-        target->with_references.at(it.name()).get());
+        target->with_references.at(id).get());
       with_reference_from(
         *it,
         target->empties,
-        instance_ref,
+        parse::Ref(with_references_ref, id),
         instance,
         errors);
 
@@ -268,7 +240,7 @@ void some_graph_from(
 
   if (!value.isMember("global_reference_to_an_empty")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: global_reference_to_an_empty");
   } else {
     const Json::Value& value_0 = value["global_reference_to_an_empty"];
@@ -277,8 +249,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/global_reference_to_an_empty"),
+        parse::Ref(graph_ref, "global_reference_to_an_empty"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -293,8 +264,7 @@ void some_graph_from(
           " not found: ");
 
         errors->add(
-          std::string(ref)
-            .append("/global_reference_to_an_empty"),
+          parse::Ref(graph_ref, "global_reference_to_an_empty"),
           message(
             reference_not_found,
             strlen(reference_not_found),
@@ -311,7 +281,7 @@ void some_graph_from(
 
 void empty_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     Empty* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -332,7 +302,7 @@ void empty_from(
 void with_reference_from(
     const Json::Value& value,
     const std::map<std::string, std::unique_ptr<Empty>>& empties_registry,
-    std::string ref,
+    const parse::Ref& ref,
     WithReference* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -364,8 +334,7 @@ void with_reference_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/reference_to_an_empty"),
+        parse::Ref(ref, "reference_to_an_empty"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -380,8 +349,7 @@ void with_reference_from(
           " not found: ");
 
         errors->add(
-          std::string(ref)
-            .append("/reference_to_an_empty"),
+          parse::Ref(ref, "reference_to_an_empty"),
           message(
             reference_not_found,
             strlen(reference_not_found),
@@ -410,8 +378,7 @@ void with_reference_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_empties"),
+        parse::Ref(ref, "array_of_empties"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -427,10 +394,7 @@ void with_reference_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_empties")
-              .append("/")
-              .append(std::to_string(i_1)),
+            parse::Ref(parse::Ref(ref, "array_of_empties"), i_1),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -445,10 +409,7 @@ void with_reference_from(
               " not found: ");
 
             errors->add(
-              std::string(ref)
-                .append("/array_of_empties")
-                .append("/")
-                .append(std::to_string(i_1)),
+              parse::Ref(parse::Ref(ref, "array_of_empties"), i_1),
               message(
                 reference_not_found,
                 strlen(reference_not_found),
@@ -485,8 +446,7 @@ void with_reference_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_empties"),
+        parse::Ref(ref, "map_of_empties"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -501,10 +461,7 @@ void with_reference_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_empties")
-              .append("/")
-              .append(it_3.name()),
+            parse::Ref(parse::Ref(ref, "map_of_empties"), it_3.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -519,10 +476,7 @@ void with_reference_from(
               " not found: ");
 
             errors->add(
-              std::string(ref)
-                .append("/map_of_empties")
-                .append("/")
-                .append(it_3.name()),
+              parse::Ref(parse::Ref(ref, "map_of_empties"), it_3.name()),
               message(
                 reference_not_found,
                 strlen(reference_not_found),
@@ -33,13 +33,13 @@ void some_graph_from(
  * parses Empty from a JSON value.
  *
  * @param [in] value to be parsed
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
 void empty_from(
   const Json::Value& value,
-  std::string ref,
+  const parse::Ref& ref,
   Empty* target,
   parse::Errors* errors);
 
@@ -48,14 +48,14 @@ void empty_from(
  *
  * @param [in] value to be parsed
  * @param empties_registry registry of the Empty instances
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
 void with_reference_from(
   const Json::Value& value,
   const std::map<std::string, std::unique_ptr<Empty>>& empties_registry,
-  std::string ref,
+  const parse::Ref& ref,
   WithReference* target,
   parse::Errors* errors);
 
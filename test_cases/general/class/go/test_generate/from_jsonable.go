@@ -5,8 +5,7 @@ package somegraph
 import (
 	"fmt"
 	"regexp"
-	"strconv"
-	"strings"
+	"sort"
 )
 
 var pattern0 = regexp.MustCompile(
@@ -23,7 +22,7 @@ var pattern0 = regexp.MustCompile(
 func EmptyFromJSONable(
 	value interface{},
 	id string,
-	ref string,
+	ref *Ref,
 	target *Empty,
 	errors *Errors) {
 
@@ -41,7 +40,7 @@ func EmptyFromJSONable(
 
 	_, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -66,7 +65,7 @@ func WithReferenceFromJSONable(
 	value interface{},
 	id string,
 	emptiesRegistry map[string]*Empty,
-	ref string,
+	ref *Ref,
 	target *WithReference,
 	errors *Errors) {
 
@@ -84,7 +83,7 @@ func WithReferenceFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -102,28 +101,22 @@ func WithReferenceFromJSONable(
 		"reference_to_an_empty"]
 
 	if !ok0 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: reference_to_an_empty")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "reference_to_an_empty"},
-					"/"),
+			errors.AddRef(
+				ref.Key("reference_to_an_empty"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
 			target1, ok1 := emptiesRegistry[cast1]
 			if !ok1 {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "reference_to_an_empty"},
-						"/"),
+				errors.AddRef(
+					ref.Key("reference_to_an_empty"),
 					fmt.Sprintf(
 						"reference to an instance of class Empty not found: %s",
 						value0))
@@ -145,17 +138,14 @@ func WithReferenceFromJSONable(
 		"array_of_empties"]
 
 	if !ok2 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: array_of_empties")
 	} else {
 		cast3, ok3 := value2.([]interface{})
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_empties"},
-					"/"),
+			errors.AddRef(
+				ref.Key("array_of_empties"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value2))
@@ -166,22 +156,16 @@ func WithReferenceFromJSONable(
 			for i3 := range cast3 {
 				cast4, ok4 := (cast3[i3]).(string)
 				if !ok4 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_empties", strconv.Itoa(i3)},
-							"/"),
+					errors.AddRef(
+						ref.Key("array_of_empties").Index(i3),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast3[i3]))
 				} else {
 					target4, ok4 := emptiesRegistry[cast4]
 					if !ok4 {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "array_of_empties", strconv.Itoa(i3)},
-								"/"),
+						errors.AddRef(
+							ref.Key("array_of_empties").Index(i3),
 							fmt.Sprintf(
 								"reference to an instance of class Empty not found: %s",
 								cast3[i3]))
@@ -211,17 +195,14 @@ func WithReferenceFromJSONable(
 		"map_of_empties"]
 
 	if !ok5 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: map_of_empties")
 	} else {
 		cast6, ok6 := value5.(map[string]interface{})
 		if !ok6 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_empties"},
-					"/"),
+			errors.AddRef(
+				ref.Key("map_of_empties"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value5))
@@ -230,22 +211,16 @@ func WithReferenceFromJSONable(
 			for k6 := range cast6 {
 				cast7, ok7 := (cast6[k6]).(string)
 				if !ok7 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_empties", k6},
-							"/"),
+					errors.AddRef(
+						ref.Key("map_of_empties").Key(k6),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast6[k6]))
 				} else {
 					target7, ok7 := emptiesRegistry[cast7]
 					if !ok7 {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "map_of_empties", k6},
-								"/"),
+						errors.AddRef(
+							ref.Key("map_of_empties").Key(k6),
 							fmt.Sprintf(
 								"reference to an instance of class Empty not found: %s",
 								cast6[k6]))
@@ -306,11 +281,14 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Pre-allocate Empties
 	////
 
-	emptiesRef := ref+"/empties";
+	emptiesRef := graphRef.Key(
+		"empties")
 	var emptiesOk bool
 	var emptiesValue interface{}
 	var emptiesMap map[string]interface{}
@@ -320,7 +298,7 @@ func SomeGraphFromJSONable(
 	if emptiesOk {
 		emptiesMap, ok = emptiesValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				emptiesRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -331,7 +309,7 @@ func SomeGraphFromJSONable(
 
 			for id := range emptiesMap {
 				if !pattern0.MatchString(id) {
-					errors.Add(
+					errors.AddRef(
 						emptiesRef,
 						fmt.Sprintf(
 							"expected ID to match ^[a-zA-Z_\\-][a-zA-Z_0-9\\-]*$, but got: %s",
@@ -347,7 +325,8 @@ func SomeGraphFromJSONable(
 	// Pre-allocate WithReferences
 	////
 
-	withReferencesRef := ref+"/with_references";
+	withReferencesRef := graphRef.Key(
+		"with_references")
 	var withReferencesOk bool
 	var withReferencesValue interface{}
 	var withReferencesMap map[string]interface{}
@@ -357,7 +336,7 @@ func SomeGraphFromJSONable(
 	if withReferencesOk {
 		withReferencesMap, ok = withReferencesValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				withReferencesRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -387,8 +366,7 @@ func SomeGraphFromJSONable(
 			EmptyFromJSONable(
 				value,
 				id,
-				strings.Join([]string{
-					emptiesRef, id}, "/"),
+				emptiesRef.Key(id),
 				target.Empties[id],
 				errors)
 
@@ -412,8 +390,7 @@ func SomeGraphFromJSONable(
 				value,
 				id,
 				target.Empties,
-				strings.Join([]string{
-					withReferencesRef, id}, "/"),
+				withReferencesRef.Key(id),
 				target.WithReferences[id],
 				errors)
 
@@ -435,28 +412,269 @@ func SomeGraphFromJSONable(
 		"global_reference_to_an_empty"]
 
 	if !ok0 {
+		errors.AddRef(
+			graphRef,
+			"property is missing: global_reference_to_an_empty")
+	} else {
+		cast1, ok1 := value0.(string)
+		if !ok1 {
+			errors.AddRef(
+				graphRef.Key("global_reference_to_an_empty"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value0))
+		} else {
+			target1, ok1 := target.Empties[cast1]
+			if !ok1 {
+				errors.AddRef(
+					graphRef.Key("global_reference_to_an_empty"),
+					fmt.Sprintf(
+						"reference to an instance of class Empty not found: %s",
+						value0))
+			} else {
+				target.GlobalReferenceToAnEmpty = target1
+			}
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// SomeGraphFromJSONableParallel parses SomeGraph from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike SomeGraphFromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func SomeGraphFromJSONableParallel(
+	value interface{},
+	ref string,
+	target *SomeGraph,
+	errors *Errors,
+	workers int) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
 		errors.Add(
 			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate Empties
+	////
+
+	emptiesRef := graphRef.Key(
+		"empties")
+	var emptiesOk bool
+	var emptiesValue interface{}
+	var emptiesMap map[string]interface{}
+
+	emptiesValue, emptiesOk = cast[
+		"empties"]
+	if emptiesOk {
+		emptiesMap, ok = emptiesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				emptiesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					emptiesValue));
+		} else {
+			target.Empties = make(
+				map[string]*Empty)
+
+			for id := range emptiesMap {
+				if !pattern0.MatchString(id) {
+					errors.AddRef(
+						emptiesRef,
+						fmt.Sprintf(
+							"expected ID to match ^[a-zA-Z_\\-][a-zA-Z_0-9\\-]*$, but got: %s",
+							id))
+				} else {
+					target.Empties[id] = &Empty{}
+				}
+			}
+		}
+	}
+
+	////
+	// Pre-allocate WithReferences
+	////
+
+	withReferencesRef := graphRef.Key(
+		"with_references")
+	var withReferencesOk bool
+	var withReferencesValue interface{}
+	var withReferencesMap map[string]interface{}
+
+	withReferencesValue, withReferencesOk = cast[
+		"with_references"]
+	if withReferencesOk {
+		withReferencesMap, ok = withReferencesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				withReferencesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					withReferencesValue));
+		} else {
+			target.WithReferences = make(
+				map[string]*WithReference)
+
+			for id := range withReferencesMap {
+				target.WithReferences[id] = &WithReference{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse the instances of all the registries in parallel
+	////
+
+	// instanceJob identifies an instance to be parsed.
+	type instanceJob struct {
+		// indicates the registry in the order of the classes.
+		registry int
+
+		id string
+
+		value interface{}
+	}
+
+	jobs := make([]instanceJob, 0, len(emptiesMap)+len(withReferencesMap))
+	for id, value := range emptiesMap {
+		jobs = append(jobs, instanceJob{registry: 0, id: id, value: value})
+	}
+	for id, value := range withReferencesMap {
+		jobs = append(jobs, instanceJob{registry: 1, id: id, value: value})
+	}
+
+	// Sort the instances so that the errors are deterministic.
+	sort.Slice(jobs, func(i, j int) bool {
+		if jobs[i].registry != jobs[j].registry {
+			return jobs[i].registry < jobs[j].registry
+		}
+		return jobs[i].id < jobs[j].id
+	})
+
+	chunks := parallelChunkCount(len(jobs), workers)
+	chunkErrors := make([][]Error, chunks)
+	workerErrors := make([]*Errors, workers)
+
+	forEachInParallel(chunks, workers, func(worker int, chunk int) {
+		instanceErrors := workerErrors[worker]
+		if instanceErrors == nil {
+			instanceErrors = NewErrors(errors.cap)
+			workerErrors[worker] = instanceErrors
+		}
+
+		start, end := parallelChunk(len(jobs), chunks, chunk)
+		for _, job := range jobs[start:end] {
+			switch job.registry {
+			case 0:
+				EmptyFromJSONable(
+					job.value,
+					job.id,
+					emptiesRef.Key(job.id),
+					target.Empties[job.id],
+					instanceErrors)
+			case 1:
+				WithReferenceFromJSONable(
+					job.value,
+					job.id,
+					target.Empties,
+					withReferencesRef.Key(job.id),
+					target.WithReferences[job.id],
+					instanceErrors)
+			}
+
+			chunkErrors[chunk] = append(
+				chunkErrors[chunk], instanceErrors.values...)
+			instanceErrors.values = instanceErrors.values[:0]
+
+			// The subsequent errors of the chunk would be ignored anyway.
+			if errors.cap != 0 &&
+				uint64(len(chunkErrors[chunk])) >= errors.cap {
+				break
+			}
+		}
+	})
+
+	// Merge the errors in the order of the instances.
+	for _, values := range chunkErrors {
+		for _, e := range values {
+			errors.Add(e.Ref, e.Message)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse GlobalReferenceToAnEmpty
+	////
+
+	value0, ok0 := cast[
+		"global_reference_to_an_empty"]
+
+	if !ok0 {
+		errors.AddRef(
+			graphRef,
 			"property is missing: global_reference_to_an_empty")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "global_reference_to_an_empty"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("global_reference_to_an_empty"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
 			target1, ok1 := target.Empties[cast1]
 			if !ok1 {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "global_reference_to_an_empty"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("global_reference_to_an_empty"),
 					fmt.Sprintf(
 						"reference to an instance of class Empty not found: %s",
 						value0))
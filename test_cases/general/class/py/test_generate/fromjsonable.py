@@ -12,9 +12,39 @@ import some.graph
 import some.graph.parse
 
 
+def _empty_construct(
+        value: typing.Any,
+        id: str,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.Empty]:
+    """
+    parses Empty from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    return some.graph.Empty(id=id)
+
+
 def _empty_from(
         value: typing.Any,
-        ref: str,
+        ref: some.graph.parse.Ref,
         target: some.graph.Empty,
         errors: some.graph.parse.Errors
 ) -> None:
@@ -25,7 +55,7 @@ def _empty_from(
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as Empty
     :param errors: errors encountered during parsing
     :return:
@@ -56,12 +86,10 @@ def empty_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_empty(id=id)
-
-    _empty_from(
+    target = _empty_construct(
         value=value,
+        id=id,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -70,12 +98,213 @@ def empty_from(
     return target
 
 
+def _with_reference_construct(
+        value: typing.Any,
+        id: str,
+        empties_registry: typing.Mapping[
+            str,
+            some.graph.Empty],
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.WithReference]:
+    """
+    parses WithReference from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param empties_registry: registry of the Empty instances
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    ##
+    # Parse reference_to_an_empty
+    ##
+
+    value_0 = value.get(
+        'reference_to_an_empty',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: reference_to_an_empty')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'reference_to_an_empty'),
+                "Expected a str, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = empties_registry.get(
+                value_0,
+                None)
+            if target_1 is None:
+                errors.add(
+                    (ref, 'reference_to_an_empty'),
+                    'Reference to an instance of class Empty not found: {}'.format(
+                        value_0))
+            else:
+                parsed_reference_to_an_empty = target_1
+    if errors.full():
+        return None
+
+    ##
+    # Parse array_of_empties
+    ##
+
+    value_2 = value.get(
+        'array_of_empties',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: array_of_empties')
+    else:
+        if not isinstance(value_2, list):
+            errors.add(
+                (ref, 'array_of_empties'),
+                "Expected a list, but got: {}".format(
+                    type(value_2)))
+        else:
+            target_3 = (
+                []
+            )  # type: typing.List[some.graph.Empty]
+            for i_3, item_3 in enumerate(
+                    value_2):
+                target_item_3 = (
+                    None
+                )  # type: typing.Optional[some.graph.Empty]
+                if not isinstance(item_3, str):
+                    errors.add(
+                        (ref, 'array_of_empties', i_3),
+                        "Expected a str, but got: {}".format(
+                            type(item_3)))
+                else:
+                    target_4 = empties_registry.get(
+                        item_3,
+                        None)
+                    if target_4 is None:
+                        errors.add(
+                            (ref, 'array_of_empties', i_3),
+                            'Reference to an instance of class Empty not found: {}'.format(
+                                item_3))
+                    else:
+                        target_item_3 = target_4
+
+                if target_item_3 is not None:
+                    target_3.append(
+                        target_item_3)
+
+                if errors.full():
+                    break
+
+            parsed_array_of_empties = target_3
+    if errors.full():
+        return None
+
+    ##
+    # Parse map_of_empties
+    ##
+
+    value_5 = value.get(
+        'map_of_empties',
+        None)
+
+    if value_5 is None:
+        errors.add(
+            ref,
+            'Property is missing: map_of_empties')
+    else:
+        if not isinstance(value_5, dict):
+            errors.add(
+                (ref, 'map_of_empties'),
+                "Expected a dict, but got: {}".format(
+                    type(value_5)))
+        else:
+            if isinstance(value_5, collections.OrderedDict):
+                target_6 = (
+                    collections.OrderedDict()
+                )  # type: typing.MutableMapping[str, some.graph.Empty]
+            else:
+                target_6 = (
+                    dict()
+                )
+
+            for key_6, value_6 in value_5.items():
+                if not isinstance(key_6, str):
+                    errors.add(
+                        (ref, 'map_of_empties'),
+                        "Expected the key to be a str, but got: {}".format(
+                            type(key_6)))
+
+                    if errors.full():
+                        break
+                    else:
+                        continue
+
+                target_item_6 = (
+                    None
+                )  # type: typing.Optional[some.graph.Empty]
+                if not isinstance(value_6, str):
+                    errors.add(
+                        (ref, 'map_of_empties', (key_6, )),
+                        "Expected a str, but got: {}".format(
+                            type(value_6)))
+                else:
+                    target_7 = empties_registry.get(
+                        value_6,
+                        None)
+                    if target_7 is None:
+                        errors.add(
+                            (ref, 'map_of_empties', (key_6, )),
+                            'Reference to an instance of class Empty not found: {}'.format(
+                                value_6))
+                    else:
+                        target_item_6 = target_7
+
+                if target_item_6 is not None:
+                    target_6[key_6] = target_item_6
+
+                if errors.full():
+                    break
+
+            if target_6 is not None:
+                parsed_map_of_empties = target_6
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.WithReference(
+        id=id,
+        reference_to_an_empty=parsed_reference_to_an_empty,
+        array_of_empties=parsed_array_of_empties,
+        map_of_empties=parsed_map_of_empties)
+
+
 def _with_reference_from(
         value: typing.Any,
         empties_registry: typing.Mapping[
             str,
             some.graph.Empty],
-        ref: str,
+        ref: some.graph.parse.Ref,
         target: some.graph.WithReference,
         errors: some.graph.parse.Errors
 ) -> None:
@@ -87,7 +316,7 @@ def _with_reference_from(
     :param value: JSONable value
     :param empties_registry: registry of the Empty instances
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as WithReference
     :param errors: errors encountered during parsing
     :return:
@@ -115,8 +344,7 @@ def _with_reference_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'reference_to_an_empty')),
+                (ref, 'reference_to_an_empty'),
                 "Expected a str, but got: {}".format(
                     type(value_0)))
         else:
@@ -125,8 +353,7 @@ def _with_reference_from(
                 None)
             if target_1 is None:
                 errors.add(
-                    '/'.join((
-                        ref, 'reference_to_an_empty')),
+                    (ref, 'reference_to_an_empty'),
                     'Reference to an instance of class Empty not found: {}'.format(
                         value_0))
             else:
@@ -149,8 +376,7 @@ def _with_reference_from(
     else:
         if not isinstance(value_2, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_empties')),
+                (ref, 'array_of_empties'),
                 "Expected a list, but got: {}".format(
                     type(value_2)))
         else:
@@ -164,8 +390,7 @@ def _with_reference_from(
                 )  # type: typing.Optional[some.graph.Empty]
                 if not isinstance(item_3, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'array_of_empties', str(i_3))),
+                        (ref, 'array_of_empties', i_3),
                         "Expected a str, but got: {}".format(
                             type(item_3)))
                 else:
@@ -174,8 +399,7 @@ def _with_reference_from(
                         None)
                     if target_4 is None:
                         errors.add(
-                            '/'.join((
-                                ref, 'array_of_empties', str(i_3))),
+                            (ref, 'array_of_empties', i_3),
                             'Reference to an instance of class Empty not found: {}'.format(
                                 item_3))
                     else:
@@ -207,8 +431,7 @@ def _with_reference_from(
     else:
         if not isinstance(value_5, dict):
             errors.add(
-                '/'.join((
-                    ref, 'map_of_empties')),
+                (ref, 'map_of_empties'),
                 "Expected a dict, but got: {}".format(
                     type(value_5)))
         else:
@@ -224,8 +447,7 @@ def _with_reference_from(
             for key_6, value_6 in value_5.items():
                 if not isinstance(key_6, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_empties')),
+                        (ref, 'map_of_empties'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_6)))
 
@@ -239,8 +461,7 @@ def _with_reference_from(
                 )  # type: typing.Optional[some.graph.Empty]
                 if not isinstance(value_6, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_empties', repr(key_6))),
+                        (ref, 'map_of_empties', (key_6, )),
                         "Expected a str, but got: {}".format(
                             type(value_6)))
                 else:
@@ -249,8 +470,7 @@ def _with_reference_from(
                         None)
                     if target_7 is None:
                         errors.add(
-                            '/'.join((
-                                ref, 'map_of_empties', repr(key_6))),
+                            (ref, 'map_of_empties', (key_6, )),
                             'Reference to an instance of class Empty not found: {}'.format(
                                 value_6))
                     else:
@@ -290,13 +510,11 @@ def with_reference_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_with_reference(id=id)
-
-    _with_reference_from(
+    target = _with_reference_construct(
         value=value,
+        id=id,
         empties_registry=empties_registry,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -338,8 +556,7 @@ def some_graph_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'empties')),
+                (ref, 'empties'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -348,21 +565,19 @@ def some_graph_from(
             else:
                 graph.empties = dict()
 
-            empties_registry = graph.empties
+            # Only the IDs are checked since the instances are constructed
+            # when they are parsed.
             for id in registry_value:
                 if not re.match(
                         r'^[a-zA-Z_\-][a-zA-Z_0-9\-]*$',
                         id):
                     errors.add(
-                        '/'.join((
-                            ref, 'empties')),
+                        (ref, 'empties'),
                         'Expected ID to match ^[a-zA-Z_\\-][a-zA-Z_0-9\\-]*$, but got: ' + id)
 
                     if errors.full():
                         break
 
-                empties_registry[id] = some.graph.parse.placeholder_empty(id=id)
-
     if errors.full():
         return None
 
@@ -375,8 +590,7 @@ def some_graph_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'with_references')),
+                (ref, 'with_references'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -385,10 +599,6 @@ def some_graph_from(
             else:
                 graph.with_references = dict()
 
-            with_references_registry = graph.with_references
-            for id in registry_value:
-                with_references_registry[id] = some.graph.parse.placeholder_with_reference(id=id)
-
     if errors.full():
         return None
 
@@ -403,19 +613,250 @@ def some_graph_from(
     if 'empties' in value:
         registry_value = value['empties']
         for id, instance_value in registry_value.items():
-            target_empty = graph.empties[id]
-            target_empty.id = id
+            instance_empty = _empty_construct(
+                instance_value,
+                id,
+                (ref, 'empties', (id, )),
+                errors)
 
-            _empty_from(
+            if instance_empty is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_empty = some.graph.parse.placeholder_empty(id=id)
+
+            graph.empties[id] = instance_empty
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse with_references
+    ##
+
+    if 'with_references' in value:
+        registry_value = value['with_references']
+        for id, instance_value in registry_value.items():
+            instance_with_reference = _with_reference_construct(
                 instance_value,
-                '/'.join((
-                    ref, 'empties', repr(id))),
-                target_empty,
+                id,
+                graph.empties,
+                (ref, 'with_references', (id, )),
                 errors)
 
+            if instance_with_reference is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_with_reference = some.graph.parse.placeholder_with_reference(id=id)
+
+            graph.with_references[id] = instance_with_reference
+
             if errors.full():
                 return None
 
+    ##
+    # Parse global_reference_to_an_empty
+    ##
+
+    value_0 = value.get(
+        'global_reference_to_an_empty',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: global_reference_to_an_empty')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'global_reference_to_an_empty'),
+                "Expected a str, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = graph.empties.get(
+                value_0,
+                None)
+            if target_1 is None:
+                errors.add(
+                    (ref, 'global_reference_to_an_empty'),
+                    'Reference to an instance of class Empty not found: {}'.format(
+                        value_0))
+            else:
+                graph.global_reference_to_an_empty = target_1
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _empty_construct_fast(
+        value: typing.Any,
+        id: str
+) -> some.graph.Empty:
+    """
+    parses Empty optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    return some.graph.Empty(id=id)
+
+
+def _with_reference_construct_fast(
+        value: typing.Any,
+        id: str,
+        empties_registry: typing.Mapping[
+            str,
+            some.graph.Empty]
+) -> some.graph.WithReference:
+    """
+    parses WithReference optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :param empties_registry: registry of the Empty instances
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse reference_to_an_empty
+    ##
+
+    parsed_reference_to_an_empty = empties_registry[
+        value['reference_to_an_empty']]
+
+    ##
+    # Parse array_of_empties
+    ##
+
+    value_3 = value['array_of_empties']
+    if not isinstance(value_3, list):
+        raise TypeError("Expected a list")
+    target_3 = (
+        []
+    )  # type: typing.List[some.graph.Empty]
+    for item_3 in value_3:
+        target_item_3 = empties_registry[
+            item_3]
+        target_3.append(
+            target_item_3)
+    parsed_array_of_empties = target_3
+
+    ##
+    # Parse map_of_empties
+    ##
+
+    value_6 = value['map_of_empties']
+    if not isinstance(value_6, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_6, collections.OrderedDict):
+        target_6 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, some.graph.Empty]
+    else:
+        target_6 = (
+            dict()
+        )
+    for key_6, item_6 in value_6.items():
+        if not isinstance(key_6, str):
+            raise TypeError("Expected the key to be a str")
+        target_item_6 = empties_registry[
+            item_6]
+        target_6[key_6] = target_item_6
+    parsed_map_of_empties = target_6
+
+    return some.graph.WithReference(
+        id=id,
+        reference_to_an_empty=parsed_reference_to_an_empty,
+        array_of_empties=parsed_array_of_empties,
+        map_of_empties=parsed_map_of_empties)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate empties
+    ##
+
+    registry_value = value.get('empties', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.empties = collections.OrderedDict()
+        else:
+            graph.empties = dict()
+
+        # Only the IDs are checked since the instances are constructed
+        # when they are parsed.
+        for id in registry_value:
+            if not re.match(
+                    r'^[a-zA-Z_\-][a-zA-Z_0-9\-]*$',
+                    id):
+                raise ValueError('Expected ID to match ^[a-zA-Z_\\-][a-zA-Z_0-9\\-]*$')
+
+    ##
+    # Pre-allocate with_references
+    ##
+
+    registry_value = value.get('with_references', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.with_references = collections.OrderedDict()
+        else:
+            graph.with_references = dict()
+
+    ##
+    # Parse empties
+    ##
+
+    if 'empties' in value:
+        registry_value = value['empties']
+        for id, instance_value in registry_value.items():
+            graph.empties[id] = _empty_construct_fast(
+                instance_value,
+                id)
+
     ##
     # Parse with_references
     ##
@@ -423,15 +864,301 @@ def some_graph_from(
     if 'with_references' in value:
         registry_value = value['with_references']
         for id, instance_value in registry_value.items():
-            target_with_reference = graph.with_references[id]
-            target_with_reference.id = id
+            graph.with_references[id] = _with_reference_construct_fast(
+                instance_value,
+                id,
+                graph.empties)
+
+    ##
+    # Parse global_reference_to_an_empty
+    ##
+
+    graph.global_reference_to_an_empty = graph.empties[
+        value['global_reference_to_an_empty']]
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _mentions_any(value: typing.Any, ids: typing.AbstractSet[str]) -> bool:
+    """
+    checks whether any of the strings in the JSONable value is in ``ids``.
+
+    The keys of the dictionaries are not considered since they can not refer
+    to instances.
+
+    :param value: JSONable value
+    :param ids: identifiers of the instances
+    :return: True if any identifier is mentioned
+    """
+    if isinstance(value, str):
+        return value in ids
+
+    if isinstance(value, dict):
+        return any(_mentions_any(item, ids) for item in value.values())
+
+    if isinstance(value, list):
+        return any(_mentions_any(item, ids) for item in value)
+
+    return False
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_empties = set()  # type: typing.Set[str]
+    changed_with_references = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate empties reusing the unchanged instances
+    ##
+
+    registry_value = value.get('empties', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'empties'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.empties = collections.OrderedDict()
+            else:
+                graph.empties = dict()
+
+            empties_registry = graph.empties
+            previous_empties = previous.empties
+
+            previous_registry_value = previous_value.get(
+                'empties', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                if not re.match(
+                        r'^[a-zA-Z_\-][a-zA-Z_0-9\-]*$',
+                        id):
+                    errors.add(
+                        (ref, 'empties'),
+                        'Expected ID to match ^[a-zA-Z_\\-][a-zA-Z_0-9\\-]*$, but got: ' + id)
+
+                    if errors.full():
+                        break
+
+                target_empty = previous_empties.get(id, None)
+                if (target_empty is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_empty = some.graph.parse.placeholder_empty(id=id)
+                    changed_empties.add(id)
+
+                empties_registry[id] = target_empty
+
+    changed_empties.update(
+        id for id in previous.empties
+        if id not in graph.empties)
+
+    if errors.full():
+        return None
+
+    ##
+    # Pre-allocate with_references reusing the unchanged instances
+    ##
+
+    registry_value = value.get('with_references', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'with_references'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.with_references = collections.OrderedDict()
+            else:
+                graph.with_references = dict()
+
+            with_references_registry = graph.with_references
+            previous_with_references = previous.with_references
+
+            previous_registry_value = previous_value.get(
+                'with_references', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_with_reference = previous_with_references.get(id, None)
+                if (target_with_reference is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_with_reference = some.graph.parse.placeholder_with_reference(id=id)
+                    changed_with_references.add(id)
+
+                with_references_registry[id] = target_with_reference
+
+    changed_with_references.update(
+        id for id in previous.with_references
+        if id not in graph.with_references)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse anew the instances referring to the new, changed or removed
+    # instances until no more instances need to be parsed anew.
+    ##
+
+    has_changed = True
+    while has_changed:
+        has_changed = False
+
+        referred = changed_empties
+
+        registry_value = value.get('with_references', None)
+        if referred and registry_value is not None:
+            for id, instance_value in registry_value.items():
+                if (id not in changed_with_references and
+                        _mentions_any(instance_value, referred)):
+                    graph.with_references[id] = some.graph.parse.placeholder_with_reference(id=id)
+                    changed_with_references.add(id)
+                    has_changed = True
+
+    ##
+    # Parse the new and changed empties
+    ##
+
+    registry_value = value.get('empties', None)
+    if registry_value is not None and changed_empties:
+        for id, instance_value in registry_value.items():
+            if id not in changed_empties:
+                continue
+
+            _empty_from(
+                instance_value,
+                (ref, 'empties', (id, )),
+                graph.empties[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse the new and changed with_references
+    ##
+
+    registry_value = value.get('with_references', None)
+    if registry_value is not None and changed_with_references:
+        for id, instance_value in registry_value.items():
+            if id not in changed_with_references:
+                continue
 
             _with_reference_from(
                 instance_value,
                 graph.empties,
-                '/'.join((
-                    ref, 'with_references', repr(id))),
-                target_with_reference,
+                (ref, 'with_references', (id, )),
+                graph.with_references[id],
                 errors)
 
             if errors.full():
@@ -452,8 +1179,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'global_reference_to_an_empty')),
+                (ref, 'global_reference_to_an_empty'),
                 "Expected a str, but got: {}".format(
                     type(value_0)))
         else:
@@ -462,8 +1188,7 @@ def some_graph_from(
                 None)
             if target_1 is None:
                 errors.add(
-                    '/'.join((
-                        ref, 'global_reference_to_an_empty')),
+                    (ref, 'global_reference_to_an_empty'),
                     'Reference to an instance of class Empty not found: {}'.format(
                         value_0))
             else:
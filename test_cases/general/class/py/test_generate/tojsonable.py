@@ -5,6 +5,7 @@
 
 
 import collections
+import json
 import typing
 
 import some.graph
@@ -163,4 +164,126 @@ def serialize_some_graph(
     return target
 
 
+class _WriteBuffer:
+    """buffers the chunks of text before writing them to a file."""
+
+    def __init__(self, fp: typing.TextIO, size: int) -> None:
+        """
+        initializes the buffer.
+
+        :param fp: file-like object to write to
+        :param size: number of characters to buffer before writing
+        """
+        self.fp = fp
+        self.size = size
+        self._chunks = []  # type: typing.List[str]
+        self._length = 0
+
+    def write(self, text: str) -> None:
+        """buffers the text and writes it out if the buffer is full."""
+        self._chunks.append(text)
+        self._length += len(text)
+
+        if self._length >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        """writes out the buffered text."""
+        if self._chunks:
+            self.fp.write(''.join(self._chunks))
+            self._chunks = []
+            self._length = 0
+
+
+def write_some_graph_json(
+        instance: some.graph.SomeGraph,
+        fp: typing.TextIO,
+        buffer_size: int = 65536
+) -> None:
+    """
+    writes an instance of SomeGraph as JSON text to ``fp``.
+
+    The text is the same as ``json.dumps(serialize_some_graph(instance))``, but
+    the properties and the class instances are serialized one at a time
+    so that the whole JSONable never needs to be held in memory.
+
+    :param instance: the instance of SomeGraph to be written
+    :param fp: file-like object to write the JSON text to
+    :param buffer_size:
+        number of characters buffered before they are written to ``fp``
+    :return:
+    """
+    buffer = _WriteBuffer(fp=fp, size=buffer_size)
+
+    buffer.write('{')
+    delimiter = ''
+
+    ##
+    # Write global_reference_to_an_empty
+    ##
+
+    jsonable_global_reference_to_an_empty = instance.global_reference_to_an_empty.id
+    buffer.write(delimiter)
+    buffer.write('"global_reference_to_an_empty": ')
+    buffer.write(json.dumps(jsonable_global_reference_to_an_empty))
+    delimiter = ', '
+
+    ##
+    # Write instance registry of Empty
+    ##
+
+    if len(instance.empties) > 0:
+        buffer.write(delimiter)
+        buffer.write('"empties": {')
+
+        registry_delimiter = ''
+        for id, empty_instance in instance.empties.items():
+            if id != empty_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of Empty, but got: {!r}'.format(
+                        id, empty_instance.id))
+
+            buffer.write(registry_delimiter)
+            buffer.write(json.dumps(id))
+            buffer.write(': ')
+            buffer.write(
+                json.dumps(
+                    serialize_empty(
+                        instance=empty_instance)))
+            registry_delimiter = ', '
+
+        buffer.write('}')
+        delimiter = ', '
+
+    ##
+    # Write instance registry of WithReference
+    ##
+
+    if len(instance.with_references) > 0:
+        buffer.write(delimiter)
+        buffer.write('"with_references": {')
+
+        registry_delimiter = ''
+        for id, with_reference_instance in instance.with_references.items():
+            if id != with_reference_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of WithReference, but got: {!r}'.format(
+                        id, with_reference_instance.id))
+
+            buffer.write(registry_delimiter)
+            buffer.write(json.dumps(id))
+            buffer.write(': ')
+            buffer.write(
+                json.dumps(
+                    serialize_with_reference(
+                        instance=with_reference_instance)))
+            registry_delimiter = ', '
+
+        buffer.write('}')
+        delimiter = ', '
+
+    buffer.write('}')
+    buffer.flush()
+
+
 # File automatically generated by mapry. DO NOT EDIT OR APPEND!
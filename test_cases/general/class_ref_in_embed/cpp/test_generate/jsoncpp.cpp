@@ -83,14 +83,14 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Pre-allocate empties
   ////
 
-  std::string empties_ref;
-  empties_ref.reserve(ref.size() + 8);
-  empties_ref += ref;
-  empties_ref += "/empties";
+  const parse::Ref empties_ref(
+    graph_ref, "empties");
 
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
@@ -122,36 +122,21 @@ void some_graph_from(
     return;
   }
 
-  // Keep the prefix fixed in this buffer so that
-  // it is copied as little as possible
-  std::string instance_ref;
-
   ////
   // Parse empties
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += empties_ref;
-  instance_ref += '/';
-
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        empties_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        empties_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       Empty* instance(
-        target->empties.at(it.name()).get());
+        target->empties.at(id).get());
       empty_from(
         *it,
-        instance_ref,
+        parse::Ref(empties_ref, id),
         instance,
         errors);
 
@@ -170,15 +155,14 @@ void some_graph_from(
 
   if (!value.isMember("some_embed")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_embed");
   } else {
     const Json::Value& value_0 = value["some_embed"];
     embed_with_ref_from(
       value_0,
       target->empties,
-      std::string(ref)
-        .append("/some_embed"),
+      parse::Ref(graph_ref, "some_embed"),
       &target->some_embed,
       errors);
   }
@@ -189,7 +173,7 @@ void some_graph_from(
 
 void empty_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     Empty* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -210,7 +194,7 @@ void empty_from(
 void embed_with_ref_from(
     const Json::Value& value,
     const std::map<std::string, std::unique_ptr<Empty>>& empties_registry,
-    std::string ref,
+    const parse::Ref& ref,
     EmbedWithRef* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -242,8 +226,7 @@ void embed_with_ref_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/reference_to_empty"),
+        parse::Ref(ref, "reference_to_empty"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -258,8 +241,7 @@ void embed_with_ref_from(
           " not found: ");
 
         errors->add(
-          std::string(ref)
-            .append("/reference_to_empty"),
+          parse::Ref(ref, "reference_to_empty"),
           message(
             reference_not_found,
             strlen(reference_not_found),
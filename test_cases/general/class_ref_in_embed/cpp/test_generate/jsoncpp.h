@@ -34,14 +34,14 @@ void some_graph_from(
  *
  * @param [in] value to be parsed
  * @param empties_registry registry of the Empty instances
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
 void embed_with_ref_from(
   const Json::Value& value,
   const std::map<std::string, std::unique_ptr<Empty>>& empties_registry,
-  std::string ref,
+  const parse::Ref& ref,
   EmbedWithRef* target,
   parse::Errors* errors);
 
@@ -49,13 +49,13 @@ void embed_with_ref_from(
  * parses Empty from a JSON value.
  *
  * @param [in] value to be parsed
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
 void empty_from(
   const Json::Value& value,
-  std::string ref,
+  const parse::Ref& ref,
   Empty* target,
   parse::Errors* errors);
 
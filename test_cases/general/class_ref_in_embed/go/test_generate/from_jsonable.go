@@ -4,7 +4,7 @@ package somegraph
 
 import (
 	"fmt"
-	"strings"
+	"sort"
 )
 
 // EmptyFromJSONable parses Empty from a JSONable value.
@@ -18,7 +18,7 @@ import (
 func EmptyFromJSONable(
 	value interface{},
 	id string,
-	ref string,
+	ref *Ref,
 	target *Empty,
 	errors *Errors) {
 
@@ -36,7 +36,7 @@ func EmptyFromJSONable(
 
 	_, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -60,7 +60,7 @@ func EmptyFromJSONable(
 func EmbedWithRefFromJSONable(
 	value interface{},
 	emptiesRegistry map[string]*Empty,
-	ref string,
+	ref *Ref,
 	target *EmbedWithRef,
 	errors *Errors) {
 
@@ -78,7 +78,7 @@ func EmbedWithRefFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -94,28 +94,22 @@ func EmbedWithRefFromJSONable(
 		"reference_to_empty"]
 
 	if !ok0 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: reference_to_empty")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "reference_to_empty"},
-					"/"),
+			errors.AddRef(
+				ref.Key("reference_to_empty"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
 			target1, ok1 := emptiesRegistry[cast1]
 			if !ok1 {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "reference_to_empty"},
-						"/"),
+				errors.AddRef(
+					ref.Key("reference_to_empty"),
 					fmt.Sprintf(
 						"reference to an instance of class Empty not found: %s",
 						value0))
@@ -168,11 +162,14 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Pre-allocate Empties
 	////
 
-	emptiesRef := ref+"/empties";
+	emptiesRef := graphRef.Key(
+		"empties")
 	var emptiesOk bool
 	var emptiesValue interface{}
 	var emptiesMap map[string]interface{}
@@ -182,7 +179,7 @@ func SomeGraphFromJSONable(
 	if emptiesOk {
 		emptiesMap, ok = emptiesValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				emptiesRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -212,8 +209,7 @@ func SomeGraphFromJSONable(
 			EmptyFromJSONable(
 				value,
 				id,
-				strings.Join([]string{
-					emptiesRef, id}, "/"),
+				emptiesRef.Key(id),
 				target.Empties[id],
 				errors)
 
@@ -235,17 +231,199 @@ func SomeGraphFromJSONable(
 		"some_embed"]
 
 	if !ok0 {
+		errors.AddRef(
+			graphRef,
+			"property is missing: some_embed")
+	} else {
+		EmbedWithRefFromJSONable(
+			value0,
+			target.Empties,
+			graphRef.Key("some_embed"),
+			&(target.SomeEmbed),
+			errors)
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// SomeGraphFromJSONableParallel parses SomeGraph from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike SomeGraphFromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func SomeGraphFromJSONableParallel(
+	value interface{},
+	ref string,
+	target *SomeGraph,
+	errors *Errors,
+	workers int) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
 		errors.Add(
 			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate Empties
+	////
+
+	emptiesRef := graphRef.Key(
+		"empties")
+	var emptiesOk bool
+	var emptiesValue interface{}
+	var emptiesMap map[string]interface{}
+
+	emptiesValue, emptiesOk = cast[
+		"empties"]
+	if emptiesOk {
+		emptiesMap, ok = emptiesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				emptiesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					emptiesValue));
+		} else {
+			target.Empties = make(
+				map[string]*Empty)
+
+			for id := range emptiesMap {
+				target.Empties[id] = &Empty{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse the instances of all the registries in parallel
+	////
+
+	// instanceJob identifies an instance to be parsed.
+	type instanceJob struct {
+		// indicates the registry in the order of the classes.
+		registry int
+
+		id string
+
+		value interface{}
+	}
+
+	jobs := make([]instanceJob, 0, len(emptiesMap))
+	for id, value := range emptiesMap {
+		jobs = append(jobs, instanceJob{registry: 0, id: id, value: value})
+	}
+
+	// Sort the instances so that the errors are deterministic.
+	sort.Slice(jobs, func(i, j int) bool {
+		if jobs[i].registry != jobs[j].registry {
+			return jobs[i].registry < jobs[j].registry
+		}
+		return jobs[i].id < jobs[j].id
+	})
+
+	chunks := parallelChunkCount(len(jobs), workers)
+	chunkErrors := make([][]Error, chunks)
+	workerErrors := make([]*Errors, workers)
+
+	forEachInParallel(chunks, workers, func(worker int, chunk int) {
+		instanceErrors := workerErrors[worker]
+		if instanceErrors == nil {
+			instanceErrors = NewErrors(errors.cap)
+			workerErrors[worker] = instanceErrors
+		}
+
+		start, end := parallelChunk(len(jobs), chunks, chunk)
+		for _, job := range jobs[start:end] {
+			switch job.registry {
+			case 0:
+				EmptyFromJSONable(
+					job.value,
+					job.id,
+					emptiesRef.Key(job.id),
+					target.Empties[job.id],
+					instanceErrors)
+			}
+
+			chunkErrors[chunk] = append(
+				chunkErrors[chunk], instanceErrors.values...)
+			instanceErrors.values = instanceErrors.values[:0]
+
+			// The subsequent errors of the chunk would be ignored anyway.
+			if errors.cap != 0 &&
+				uint64(len(chunkErrors[chunk])) >= errors.cap {
+				break
+			}
+		}
+	})
+
+	// Merge the errors in the order of the instances.
+	for _, values := range chunkErrors {
+		for _, e := range values {
+			errors.Add(e.Ref, e.Message)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse SomeEmbed
+	////
+
+	value0, ok0 := cast[
+		"some_embed"]
+
+	if !ok0 {
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_embed")
 	} else {
 		EmbedWithRefFromJSONable(
 			value0,
 			target.Empties,
-			strings.Join(
-				[]string{
-					ref, "some_embed"},
-				"/"),
+			graphRef.Key("some_embed"),
 			&(target.SomeEmbed),
 			errors)
 	}
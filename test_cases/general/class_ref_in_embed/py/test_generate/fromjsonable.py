@@ -11,9 +11,39 @@ import some.graph
 import some.graph.parse
 
 
+def _empty_construct(
+        value: typing.Any,
+        id: str,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.Empty]:
+    """
+    parses Empty from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    return some.graph.Empty(id=id)
+
+
 def _empty_from(
         value: typing.Any,
-        ref: str,
+        ref: some.graph.parse.Ref,
         target: some.graph.Empty,
         errors: some.graph.parse.Errors
 ) -> None:
@@ -24,7 +54,7 @@ def _empty_from(
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as Empty
     :param errors: errors encountered during parsing
     :return:
@@ -55,12 +85,10 @@ def empty_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_empty(id=id)
-
-    _empty_from(
+    target = _empty_construct(
         value=value,
+        id=id,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -74,22 +102,21 @@ def _embed_with_ref_from(
         empties_registry: typing.Mapping[
             str,
             some.graph.Empty],
-        ref: str,
-        target: some.graph.EmbedWithRef,
+        ref: some.graph.parse.Ref,
         errors: some.graph.parse.Errors
-) -> None:
+) -> typing.Optional[some.graph.EmbedWithRef]:
     """
     parses EmbedWithRef from a JSONable value.
 
-    If ``errors``, the attributes of ``target`` have undefined values.
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
 
     :param value: JSONable value
     :param empties_registry: registry of the Empty instances
     :param ref:
-        reference to the value (e.g., a reference path)
-    :param target: parsed ``value`` as EmbedWithRef
+        reference to the value (e.g., a lazy reference path)
     :param errors: errors encountered during parsing
-    :return:
+    :return: parsed instance, or None if parsing it added to ``errors``
 
     """
     if not isinstance(value, dict):
@@ -97,7 +124,9 @@ def _embed_with_ref_from(
             ref,
             "Expected a dictionary, but got: {}".format(
                 type(value)))
-        return
+        return None
+
+    errors_count = errors.count()
 
     ##
     # Parse reference_to_empty
@@ -114,8 +143,7 @@ def _embed_with_ref_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'reference_to_empty')),
+                (ref, 'reference_to_empty'),
                 "Expected a str, but got: {}".format(
                     type(value_0)))
         else:
@@ -124,14 +152,19 @@ def _embed_with_ref_from(
                 None)
             if target_1 is None:
                 errors.add(
-                    '/'.join((
-                        ref, 'reference_to_empty')),
+                    (ref, 'reference_to_empty'),
                     'Reference to an instance of class Empty not found: {}'.format(
                         value_0))
             else:
-                target.reference_to_empty = target_1
+                parsed_reference_to_empty = target_1
     if errors.full():
-        return
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.EmbedWithRef(
+        reference_to_empty=parsed_reference_to_empty)
 
 
 def embed_with_ref_from(
@@ -155,13 +188,10 @@ def embed_with_ref_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_embed_with_ref()
-
-    _embed_with_ref_from(
+    target = _embed_with_ref_from(
         value=value,
         empties_registry=empties_registry,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -203,8 +233,7 @@ def some_graph_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'empties')),
+                (ref, 'empties'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -213,10 +242,6 @@ def some_graph_from(
             else:
                 graph.empties = dict()
 
-            empties_registry = graph.empties
-            for id in registry_value:
-                empties_registry[id] = some.graph.parse.placeholder_empty(id=id)
-
     if errors.full():
         return None
 
@@ -231,14 +256,322 @@ def some_graph_from(
     if 'empties' in value:
         registry_value = value['empties']
         for id, instance_value in registry_value.items():
-            target_empty = graph.empties[id]
-            target_empty.id = id
+            instance_empty = _empty_construct(
+                instance_value,
+                id,
+                (ref, 'empties', (id, )),
+                errors)
+
+            if instance_empty is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_empty = some.graph.parse.placeholder_empty(id=id)
+
+            graph.empties[id] = instance_empty
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_embed
+    ##
+
+    value_0 = value.get(
+        'some_embed',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_embed')
+    else:
+        target_1 = _embed_with_ref_from(
+            value_0,
+            graph.empties,
+            (ref, 'some_embed'),
+            errors)
+        if target_1 is not None:
+            graph.some_embed = target_1
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _empty_construct_fast(
+        value: typing.Any,
+        id: str
+) -> some.graph.Empty:
+    """
+    parses Empty optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    return some.graph.Empty(id=id)
+
+
+def _embed_with_ref_from_fast(
+        value: typing.Any,
+        empties_registry: typing.Mapping[
+            str,
+            some.graph.Empty]
+) -> some.graph.EmbedWithRef:
+    """
+    parses EmbedWithRef optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param empties_registry: registry of the Empty instances
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse reference_to_empty
+    ##
+
+    parsed_reference_to_empty = empties_registry[
+        value['reference_to_empty']]
+
+    return some.graph.EmbedWithRef(
+        reference_to_empty=parsed_reference_to_empty)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate empties
+    ##
+
+    registry_value = value.get('empties', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.empties = collections.OrderedDict()
+        else:
+            graph.empties = dict()
+
+    ##
+    # Parse empties
+    ##
+
+    if 'empties' in value:
+        registry_value = value['empties']
+        for id, instance_value in registry_value.items():
+            graph.empties[id] = _empty_construct_fast(
+                instance_value,
+                id)
+
+    ##
+    # Parse some_embed
+    ##
+
+    graph.some_embed = _embed_with_ref_from_fast(
+        value['some_embed'],
+        graph.empties)
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_empties = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate empties reusing the unchanged instances
+    ##
+
+    registry_value = value.get('empties', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'empties'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.empties = collections.OrderedDict()
+            else:
+                graph.empties = dict()
+
+            empties_registry = graph.empties
+            previous_empties = previous.empties
+
+            previous_registry_value = previous_value.get(
+                'empties', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_empty = previous_empties.get(id, None)
+                if (target_empty is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_empty = some.graph.parse.placeholder_empty(id=id)
+                    changed_empties.add(id)
+
+                empties_registry[id] = target_empty
+
+    changed_empties.update(
+        id for id in previous.empties
+        if id not in graph.empties)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse the new and changed empties
+    ##
+
+    registry_value = value.get('empties', None)
+    if registry_value is not None and changed_empties:
+        for id, instance_value in registry_value.items():
+            if id not in changed_empties:
+                continue
 
             _empty_from(
                 instance_value,
-                '/'.join((
-                    ref, 'empties', repr(id))),
-                target_empty,
+                (ref, 'empties', (id, )),
+                graph.empties[id],
                 errors)
 
             if errors.full():
@@ -257,17 +590,13 @@ def some_graph_from(
             ref,
             'Property is missing: some_embed')
     else:
-        target_1 = (
-            some.graph.parse.placeholder_embed_with_ref()
-        )
-        _embed_with_ref_from(
+        target_1 = _embed_with_ref_from(
             value_0,
             graph.empties,
-            '/'.join((
-                ref, 'some_embed')),
-            target_1,
+            (ref, 'some_embed'),
             errors)
-        graph.some_embed = target_1
+        if target_1 is not None:
+            graph.some_embed = target_1
 
     if errors.full():
         return None
@@ -9,6 +9,37 @@ import typing
 import some.graph
 
 
+# Ref represents a reference path to a value lazily.
+#
+# The reference is either a string or a tuple of the parent reference
+# followed by the path segments. String segments are rendered verbatim,
+# integer segments are indices and a segment wrapped in a one-tuple is
+# a key rendered with repr. Building a tuple is much cheaper than joining
+# the strings so that the reference is only rendered with ``render_ref``
+# when an error is actually added.
+Ref = typing.Union[str, typing.Tuple[typing.Any, ...]]
+
+
+def render_ref(ref: Ref) -> str:
+    """
+    renders the lazy reference as a string.
+
+    :param ref: reference to the value
+    :return: rendered reference path
+    """
+    if isinstance(ref, str):
+        return ref
+
+    parts = [render_ref(ref[0])]
+    for segment in ref[1:]:
+        if isinstance(segment, tuple):
+            parts.append(repr(segment[0]))
+        else:
+            parts.append(str(segment))
+
+    return '/'.join(parts)
+
+
 class Error:
     """represents an error occurred while parsing."""
 
@@ -39,15 +70,19 @@ class Errors:
         self.cap = cap
         self._values = []  # type: typing.List[Error]
 
-    def add(self, ref: str, message: str) -> None:
+    def add(self, ref: Ref, message: str) -> None:
         """
         adds an error to the container.
 
+        The reference is rendered to a string only if the error is
+        actually stored.
+
         :param ref: references the cause (e.g., a reference path)
         :param message: describes the error
         """
         if len(self._values) < self.cap:
-            self._values.append(Error(ref=ref, message=message))
+            self._values.append(
+                Error(ref=render_ref(ref), message=message))
 
     def full(self) -> bool:
         """gives True when there are exactly ``cap`` errors contained."""
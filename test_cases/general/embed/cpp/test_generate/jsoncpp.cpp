@@ -83,20 +83,21 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_embed
   ////
 
   if (!value.isMember("some_embed")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_embed");
   } else {
     const Json::Value& value_0 = value["some_embed"];
     non_empty_from(
       value_0,
-      std::string(ref)
-        .append("/some_embed"),
+      parse::Ref(graph_ref, "some_embed"),
       &target->some_embed,
       errors);
   }
@@ -107,7 +108,7 @@ void some_graph_from(
 
 void empty_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     Empty* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -127,7 +128,7 @@ void empty_from(
 
 void non_empty_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     NonEmpty* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -156,8 +157,7 @@ void non_empty_from(
     const Json::Value& value_0 = value["empty"];
     empty_from(
       value_0,
-      std::string(ref)
-        .append("/empty"),
+      parse::Ref(ref, "empty"),
       &target->empty,
       errors);
   }
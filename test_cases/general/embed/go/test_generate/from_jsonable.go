@@ -2,10 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strings"
-)
+import "fmt"
 
 // EmptyFromJSONable parses Empty from a JSONable value.
 //
@@ -17,7 +14,7 @@ import (
 //  * errors.Empty()
 func EmptyFromJSONable(
 	value interface{},
-	ref string,
+	ref *Ref,
 	target *Empty,
 	errors *Errors) {
 
@@ -35,7 +32,7 @@ func EmptyFromJSONable(
 
 	_, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -56,7 +53,7 @@ func EmptyFromJSONable(
 //  * errors.Empty()
 func NonEmptyFromJSONable(
 	value interface{},
-	ref string,
+	ref *Ref,
 	target *NonEmpty,
 	errors *Errors) {
 
@@ -74,7 +71,7 @@ func NonEmptyFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -90,16 +87,13 @@ func NonEmptyFromJSONable(
 		"empty"]
 
 	if !ok0 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: empty")
 	} else {
 		EmptyFromJSONable(
 			value0,
-			strings.Join(
-				[]string{
-					ref, "empty"},
-				"/"),
+			ref.Key("empty"),
 			&(target.Empty),
 			errors)
 	}
@@ -147,6 +141,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeEmbed
 	////
@@ -155,16 +151,13 @@ func SomeGraphFromJSONable(
 		"some_embed"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_embed")
 	} else {
 		NonEmptyFromJSONable(
 			value0,
-			strings.Join(
-				[]string{
-					ref, "some_embed"},
-				"/"),
+			graphRef.Key("some_embed"),
 			&(target.SomeEmbed),
 			errors)
 	}
@@ -12,21 +12,20 @@ import some.graph.parse
 
 def _empty_from(
         value: typing.Any,
-        ref: str,
-        target: some.graph.Empty,
+        ref: some.graph.parse.Ref,
         errors: some.graph.parse.Errors
-) -> None:
+) -> typing.Optional[some.graph.Empty]:
     """
     parses Empty from a JSONable value.
 
-    If ``errors``, the attributes of ``target`` have undefined values.
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
-    :param target: parsed ``value`` as Empty
+        reference to the value (e.g., a lazy reference path)
     :param errors: errors encountered during parsing
-    :return:
+    :return: parsed instance, or None if parsing it added to ``errors``
 
     """
     if not isinstance(value, dict):
@@ -34,7 +33,9 @@ def _empty_from(
             ref,
             "Expected a dictionary, but got: {}".format(
                 type(value)))
-        return
+        return None
+
+    return some.graph.Empty()
 
 
 def empty_from(
@@ -53,12 +54,9 @@ def empty_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_empty()
-
-    _empty_from(
+    target = _empty_from(
         value=value,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -69,21 +67,20 @@ def empty_from(
 
 def _non_empty_from(
         value: typing.Any,
-        ref: str,
-        target: some.graph.NonEmpty,
+        ref: some.graph.parse.Ref,
         errors: some.graph.parse.Errors
-) -> None:
+) -> typing.Optional[some.graph.NonEmpty]:
     """
     parses NonEmpty from a JSONable value.
 
-    If ``errors``, the attributes of ``target`` have undefined values.
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
-    :param target: parsed ``value`` as NonEmpty
+        reference to the value (e.g., a lazy reference path)
     :param errors: errors encountered during parsing
-    :return:
+    :return: parsed instance, or None if parsing it added to ``errors``
 
     """
     if not isinstance(value, dict):
@@ -91,7 +88,9 @@ def _non_empty_from(
             ref,
             "Expected a dictionary, but got: {}".format(
                 type(value)))
-        return
+        return None
+
+    errors_count = errors.count()
 
     ##
     # Parse empty
@@ -106,18 +105,20 @@ def _non_empty_from(
             ref,
             'Property is missing: empty')
     else:
-        target_1 = (
-            some.graph.parse.placeholder_empty()
-        )
-        _empty_from(
+        target_1 = _empty_from(
             value_0,
-            '/'.join((
-                ref, 'empty')),
-            target_1,
+            (ref, 'empty'),
             errors)
-        target.empty = target_1
+        if target_1 is not None:
+            parsed_empty = target_1
     if errors.full():
-        return
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.NonEmpty(
+        empty=parsed_empty)
 
 
 def non_empty_from(
@@ -136,12 +137,9 @@ def non_empty_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_non_empty()
-
-    _non_empty_from(
+    target = _non_empty_from(
         value=value,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -187,16 +185,12 @@ def some_graph_from(
             ref,
             'Property is missing: some_embed')
     else:
-        target_1 = (
-            some.graph.parse.placeholder_non_empty()
-        )
-        _non_empty_from(
+        target_1 = _non_empty_from(
             value_0,
-            '/'.join((
-                ref, 'some_embed')),
-            target_1,
+            (ref, 'some_embed'),
             errors)
-        graph.some_embed = target_1
+        if target_1 is not None:
+            graph.some_embed = target_1
 
     if errors.full():
         return None
@@ -205,3 +199,108 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _empty_from_fast(
+        value: typing.Any
+) -> some.graph.Empty:
+    """
+    parses Empty optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    return some.graph.Empty()
+
+
+def _non_empty_from_fast(
+        value: typing.Any
+) -> some.graph.NonEmpty:
+    """
+    parses NonEmpty optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse empty
+    ##
+
+    parsed_empty = _empty_from_fast(
+        value['empty'])
+
+    return some.graph.NonEmpty(
+        empty=parsed_empty)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse some_embed
+    ##
+
+    graph.some_embed = _non_empty_from_fast(
+        value['some_embed'])
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
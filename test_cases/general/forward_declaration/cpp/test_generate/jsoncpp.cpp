@@ -83,14 +83,14 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Pre-allocate some_classes
   ////
 
-  std::string some_classes_ref;
-  some_classes_ref.reserve(ref.size() + 13);
-  some_classes_ref += ref;
-  some_classes_ref += "/some_classes";
+  const parse::Ref some_classes_ref(
+    graph_ref, "some_classes");
 
   if (value.isMember("some_classes")) {
     const Json::Value& obj = value["some_classes"];
@@ -120,10 +120,8 @@ void some_graph_from(
   // Pre-allocate other_classes
   ////
 
-  std::string other_classes_ref;
-  other_classes_ref.reserve(ref.size() + 14);
-  other_classes_ref += ref;
-  other_classes_ref += "/other_classes";
+  const parse::Ref other_classes_ref(
+    graph_ref, "other_classes");
 
   if (value.isMember("other_classes")) {
     const Json::Value& obj = value["other_classes"];
@@ -155,38 +153,23 @@ void some_graph_from(
     return;
   }
 
-  // Keep the prefix fixed in this buffer so that
-  // it is copied as little as possible
-  std::string instance_ref;
-
   ////
   // Parse some_classes
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += some_classes_ref;
-  instance_ref += '/';
-
   if (value.isMember("some_classes")) {
     const Json::Value& obj = value["some_classes"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        some_classes_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        some_classes_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       SomeClass* instance(
-        target->some_classes.at(it.name()).get());
+        target->some_classes.at(id).get());
       some_class_from(
         *it,
         target->other_classes,
         target->some_classes,
-        instance_ref,
+        parse::Ref(some_classes_ref, id),
         instance,
         errors);
 
@@ -203,30 +186,19 @@ void some_graph_from(
   // Parse other_classes
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += other_classes_ref;
-  instance_ref += '/';
-
   if (value.isMember("other_classes")) {
     const Json::Value& obj = value["other_classes"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        other_classes_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        other_classes_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       OtherClass* instance(
-        target->other_classes.at(it.name()).get());
+        target->other_classes.at(id).get());
       other_class_from(
         *it,
         target->other_classes,
         target->some_classes,
-        instance_ref,
+        parse::Ref(other_classes_ref, id),
         instance,
         errors);
 
@@ -244,7 +216,7 @@ void some_class_from(
     const Json::Value& value,
     const std::map<std::string, std::unique_ptr<OtherClass>>& other_classes_registry,
     const std::map<std::string, std::unique_ptr<SomeClass>>& some_classes_registry,
-    std::string ref,
+    const parse::Ref& ref,
     SomeClass* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -276,8 +248,7 @@ void some_class_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/reference_other"),
+        parse::Ref(ref, "reference_other"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -292,8 +263,7 @@ void some_class_from(
           " not found: ");
 
         errors->add(
-          std::string(ref)
-            .append("/reference_other"),
+          parse::Ref(ref, "reference_other"),
           message(
             reference_not_found,
             strlen(reference_not_found),
@@ -322,8 +292,7 @@ void some_class_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_others"),
+        parse::Ref(ref, "array_of_others"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -339,10 +308,7 @@ void some_class_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_others")
-              .append("/")
-              .append(std::to_string(i_1)),
+            parse::Ref(parse::Ref(ref, "array_of_others"), i_1),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -357,10 +323,7 @@ void some_class_from(
               " not found: ");
 
             errors->add(
-              std::string(ref)
-                .append("/array_of_others")
-                .append("/")
-                .append(std::to_string(i_1)),
+              parse::Ref(parse::Ref(ref, "array_of_others"), i_1),
               message(
                 reference_not_found,
                 strlen(reference_not_found),
@@ -397,8 +360,7 @@ void some_class_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_others"),
+        parse::Ref(ref, "map_of_others"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -413,10 +375,7 @@ void some_class_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_others")
-              .append("/")
-              .append(it_3.name()),
+            parse::Ref(parse::Ref(ref, "map_of_others"), it_3.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -431,10 +390,7 @@ void some_class_from(
               " not found: ");
 
             errors->add(
-              std::string(ref)
-                .append("/map_of_others")
-                .append("/")
-                .append(it_3.name()),
+              parse::Ref(parse::Ref(ref, "map_of_others"), it_3.name()),
               message(
                 reference_not_found,
                 strlen(reference_not_found),
@@ -459,7 +415,7 @@ void other_class_from(
     const Json::Value& value,
     const std::map<std::string, std::unique_ptr<OtherClass>>& other_classes_registry,
     const std::map<std::string, std::unique_ptr<SomeClass>>& some_classes_registry,
-    std::string ref,
+    const parse::Ref& ref,
     OtherClass* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -491,8 +447,7 @@ void other_class_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/reference_some"),
+        parse::Ref(ref, "reference_some"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -507,8 +462,7 @@ void other_class_from(
           " not found: ");
 
         errors->add(
-          std::string(ref)
-            .append("/reference_some"),
+          parse::Ref(ref, "reference_some"),
           message(
             reference_not_found,
             strlen(reference_not_found),
@@ -537,8 +491,7 @@ void other_class_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/array_of_somes"),
+        parse::Ref(ref, "array_of_somes"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -554,10 +507,7 @@ void other_class_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/array_of_somes")
-              .append("/")
-              .append(std::to_string(i_1)),
+            parse::Ref(parse::Ref(ref, "array_of_somes"), i_1),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -572,10 +522,7 @@ void other_class_from(
               " not found: ");
 
             errors->add(
-              std::string(ref)
-                .append("/array_of_somes")
-                .append("/")
-                .append(std::to_string(i_1)),
+              parse::Ref(parse::Ref(ref, "array_of_somes"), i_1),
               message(
                 reference_not_found,
                 strlen(reference_not_found),
@@ -612,8 +559,7 @@ void other_class_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_somes"),
+        parse::Ref(ref, "map_of_somes"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -628,10 +574,7 @@ void other_class_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_somes")
-              .append("/")
-              .append(it_3.name()),
+            parse::Ref(parse::Ref(ref, "map_of_somes"), it_3.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -646,10 +589,7 @@ void other_class_from(
               " not found: ");
 
             errors->add(
-              std::string(ref)
-                .append("/map_of_somes")
-                .append("/")
-                .append(it_3.name()),
+              parse::Ref(parse::Ref(ref, "map_of_somes"), it_3.name()),
               message(
                 reference_not_found,
                 strlen(reference_not_found),
@@ -35,7 +35,7 @@ void some_graph_from(
  * @param [in] value to be parsed
  * @param other_classes_registry registry of the OtherClass instances
  * @param some_classes_registry registry of the SomeClass instances
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
@@ -43,7 +43,7 @@ void some_class_from(
   const Json::Value& value,
   const std::map<std::string, std::unique_ptr<OtherClass>>& other_classes_registry,
   const std::map<std::string, std::unique_ptr<SomeClass>>& some_classes_registry,
-  std::string ref,
+  const parse::Ref& ref,
   SomeClass* target,
   parse::Errors* errors);
 
@@ -53,7 +53,7 @@ void some_class_from(
  * @param [in] value to be parsed
  * @param other_classes_registry registry of the OtherClass instances
  * @param some_classes_registry registry of the SomeClass instances
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
@@ -61,7 +61,7 @@ void other_class_from(
   const Json::Value& value,
   const std::map<std::string, std::unique_ptr<OtherClass>>& other_classes_registry,
   const std::map<std::string, std::unique_ptr<SomeClass>>& some_classes_registry,
-  std::string ref,
+  const parse::Ref& ref,
   OtherClass* target,
   parse::Errors* errors);
 
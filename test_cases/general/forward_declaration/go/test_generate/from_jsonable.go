@@ -4,8 +4,7 @@ package somegraph
 
 import (
 	"fmt"
-	"strconv"
-	"strings"
+	"sort"
 )
 
 // SomeClassFromJSONable parses SomeClass from a JSONable value.
@@ -21,7 +20,7 @@ func SomeClassFromJSONable(
 	id string,
 	otherClassesRegistry map[string]*OtherClass,
 	someClassesRegistry map[string]*SomeClass,
-	ref string,
+	ref *Ref,
 	target *SomeClass,
 	errors *Errors) {
 
@@ -39,7 +38,7 @@ func SomeClassFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -57,28 +56,22 @@ func SomeClassFromJSONable(
 		"reference_other"]
 
 	if !ok0 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: reference_other")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "reference_other"},
-					"/"),
+			errors.AddRef(
+				ref.Key("reference_other"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
 			target1, ok1 := otherClassesRegistry[cast1]
 			if !ok1 {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "reference_other"},
-						"/"),
+				errors.AddRef(
+					ref.Key("reference_other"),
 					fmt.Sprintf(
 						"reference to an instance of class OtherClass not found: %s",
 						value0))
@@ -100,17 +93,14 @@ func SomeClassFromJSONable(
 		"array_of_others"]
 
 	if !ok2 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: array_of_others")
 	} else {
 		cast3, ok3 := value2.([]interface{})
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_others"},
-					"/"),
+			errors.AddRef(
+				ref.Key("array_of_others"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value2))
@@ -121,22 +111,16 @@ func SomeClassFromJSONable(
 			for i3 := range cast3 {
 				cast4, ok4 := (cast3[i3]).(string)
 				if !ok4 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_others", strconv.Itoa(i3)},
-							"/"),
+					errors.AddRef(
+						ref.Key("array_of_others").Index(i3),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast3[i3]))
 				} else {
 					target4, ok4 := otherClassesRegistry[cast4]
 					if !ok4 {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "array_of_others", strconv.Itoa(i3)},
-								"/"),
+						errors.AddRef(
+							ref.Key("array_of_others").Index(i3),
 							fmt.Sprintf(
 								"reference to an instance of class OtherClass not found: %s",
 								cast3[i3]))
@@ -166,17 +150,14 @@ func SomeClassFromJSONable(
 		"map_of_others"]
 
 	if !ok5 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: map_of_others")
 	} else {
 		cast6, ok6 := value5.(map[string]interface{})
 		if !ok6 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_others"},
-					"/"),
+			errors.AddRef(
+				ref.Key("map_of_others"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value5))
@@ -185,22 +166,16 @@ func SomeClassFromJSONable(
 			for k6 := range cast6 {
 				cast7, ok7 := (cast6[k6]).(string)
 				if !ok7 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_others", k6},
-							"/"),
+					errors.AddRef(
+						ref.Key("map_of_others").Key(k6),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast6[k6]))
 				} else {
 					target7, ok7 := otherClassesRegistry[cast7]
 					if !ok7 {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "map_of_others", k6},
-								"/"),
+						errors.AddRef(
+							ref.Key("map_of_others").Key(k6),
 							fmt.Sprintf(
 								"reference to an instance of class OtherClass not found: %s",
 								cast6[k6]))
@@ -238,7 +213,7 @@ func OtherClassFromJSONable(
 	id string,
 	otherClassesRegistry map[string]*OtherClass,
 	someClassesRegistry map[string]*SomeClass,
-	ref string,
+	ref *Ref,
 	target *OtherClass,
 	errors *Errors) {
 
@@ -256,7 +231,7 @@ func OtherClassFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -274,28 +249,22 @@ func OtherClassFromJSONable(
 		"reference_some"]
 
 	if !ok0 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: reference_some")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "reference_some"},
-					"/"),
+			errors.AddRef(
+				ref.Key("reference_some"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
 			target1, ok1 := someClassesRegistry[cast1]
 			if !ok1 {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "reference_some"},
-						"/"),
+				errors.AddRef(
+					ref.Key("reference_some"),
 					fmt.Sprintf(
 						"reference to an instance of class SomeClass not found: %s",
 						value0))
@@ -317,17 +286,14 @@ func OtherClassFromJSONable(
 		"array_of_somes"]
 
 	if !ok2 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: array_of_somes")
 	} else {
 		cast3, ok3 := value2.([]interface{})
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "array_of_somes"},
-					"/"),
+			errors.AddRef(
+				ref.Key("array_of_somes"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value2))
@@ -338,22 +304,16 @@ func OtherClassFromJSONable(
 			for i3 := range cast3 {
 				cast4, ok4 := (cast3[i3]).(string)
 				if !ok4 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "array_of_somes", strconv.Itoa(i3)},
-							"/"),
+					errors.AddRef(
+						ref.Key("array_of_somes").Index(i3),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast3[i3]))
 				} else {
 					target4, ok4 := someClassesRegistry[cast4]
 					if !ok4 {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "array_of_somes", strconv.Itoa(i3)},
-								"/"),
+						errors.AddRef(
+							ref.Key("array_of_somes").Index(i3),
 							fmt.Sprintf(
 								"reference to an instance of class SomeClass not found: %s",
 								cast3[i3]))
@@ -383,17 +343,14 @@ func OtherClassFromJSONable(
 		"map_of_somes"]
 
 	if !ok5 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: map_of_somes")
 	} else {
 		cast6, ok6 := value5.(map[string]interface{})
 		if !ok6 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_somes"},
-					"/"),
+			errors.AddRef(
+				ref.Key("map_of_somes"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value5))
@@ -402,22 +359,16 @@ func OtherClassFromJSONable(
 			for k6 := range cast6 {
 				cast7, ok7 := (cast6[k6]).(string)
 				if !ok7 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_somes", k6},
-							"/"),
+					errors.AddRef(
+						ref.Key("map_of_somes").Key(k6),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast6[k6]))
 				} else {
 					target7, ok7 := someClassesRegistry[cast7]
 					if !ok7 {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "map_of_somes", k6},
-								"/"),
+						errors.AddRef(
+							ref.Key("map_of_somes").Key(k6),
 							fmt.Sprintf(
 								"reference to an instance of class SomeClass not found: %s",
 								cast6[k6]))
@@ -478,11 +429,14 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Pre-allocate SomeClasses
 	////
 
-	someClassesRef := ref+"/some_classes";
+	someClassesRef := graphRef.Key(
+		"some_classes")
 	var someClassesOk bool
 	var someClassesValue interface{}
 	var someClassesMap map[string]interface{}
@@ -492,7 +446,7 @@ func SomeGraphFromJSONable(
 	if someClassesOk {
 		someClassesMap, ok = someClassesValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				someClassesRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -511,7 +465,8 @@ func SomeGraphFromJSONable(
 	// Pre-allocate OtherClasses
 	////
 
-	otherClassesRef := ref+"/other_classes";
+	otherClassesRef := graphRef.Key(
+		"other_classes")
 	var otherClassesOk bool
 	var otherClassesValue interface{}
 	var otherClassesMap map[string]interface{}
@@ -521,7 +476,7 @@ func SomeGraphFromJSONable(
 	if otherClassesOk {
 		otherClassesMap, ok = otherClassesValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				otherClassesRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -553,8 +508,7 @@ func SomeGraphFromJSONable(
 				id,
 				target.OtherClasses,
 				target.SomeClasses,
-				strings.Join([]string{
-					someClassesRef, id}, "/"),
+				someClassesRef.Key(id),
 				target.SomeClasses[id],
 				errors)
 
@@ -579,8 +533,7 @@ func SomeGraphFromJSONable(
 				id,
 				target.OtherClasses,
 				target.SomeClasses,
-				strings.Join([]string{
-					otherClassesRef, id}, "/"),
+				otherClassesRef.Key(id),
 				target.OtherClasses[id],
 				errors)
 
@@ -597,4 +550,209 @@ func SomeGraphFromJSONable(
 	return
 }
 
+// SomeGraphFromJSONableParallel parses SomeGraph from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike SomeGraphFromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func SomeGraphFromJSONableParallel(
+	value interface{},
+	ref string,
+	target *SomeGraph,
+	errors *Errors,
+	workers int) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
+		errors.Add(
+			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate SomeClasses
+	////
+
+	someClassesRef := graphRef.Key(
+		"some_classes")
+	var someClassesOk bool
+	var someClassesValue interface{}
+	var someClassesMap map[string]interface{}
+
+	someClassesValue, someClassesOk = cast[
+		"some_classes"]
+	if someClassesOk {
+		someClassesMap, ok = someClassesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				someClassesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					someClassesValue));
+		} else {
+			target.SomeClasses = make(
+				map[string]*SomeClass)
+
+			for id := range someClassesMap {
+				target.SomeClasses[id] = &SomeClass{}
+			}
+		}
+	}
+
+	////
+	// Pre-allocate OtherClasses
+	////
+
+	otherClassesRef := graphRef.Key(
+		"other_classes")
+	var otherClassesOk bool
+	var otherClassesValue interface{}
+	var otherClassesMap map[string]interface{}
+
+	otherClassesValue, otherClassesOk = cast[
+		"other_classes"]
+	if otherClassesOk {
+		otherClassesMap, ok = otherClassesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				otherClassesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					otherClassesValue));
+		} else {
+			target.OtherClasses = make(
+				map[string]*OtherClass)
+
+			for id := range otherClassesMap {
+				target.OtherClasses[id] = &OtherClass{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse the instances of all the registries in parallel
+	////
+
+	// instanceJob identifies an instance to be parsed.
+	type instanceJob struct {
+		// indicates the registry in the order of the classes.
+		registry int
+
+		id string
+
+		value interface{}
+	}
+
+	jobs := make([]instanceJob, 0, len(someClassesMap)+len(otherClassesMap))
+	for id, value := range someClassesMap {
+		jobs = append(jobs, instanceJob{registry: 0, id: id, value: value})
+	}
+	for id, value := range otherClassesMap {
+		jobs = append(jobs, instanceJob{registry: 1, id: id, value: value})
+	}
+
+	// Sort the instances so that the errors are deterministic.
+	sort.Slice(jobs, func(i, j int) bool {
+		if jobs[i].registry != jobs[j].registry {
+			return jobs[i].registry < jobs[j].registry
+		}
+		return jobs[i].id < jobs[j].id
+	})
+
+	chunks := parallelChunkCount(len(jobs), workers)
+	chunkErrors := make([][]Error, chunks)
+	workerErrors := make([]*Errors, workers)
+
+	forEachInParallel(chunks, workers, func(worker int, chunk int) {
+		instanceErrors := workerErrors[worker]
+		if instanceErrors == nil {
+			instanceErrors = NewErrors(errors.cap)
+			workerErrors[worker] = instanceErrors
+		}
+
+		start, end := parallelChunk(len(jobs), chunks, chunk)
+		for _, job := range jobs[start:end] {
+			switch job.registry {
+			case 0:
+				SomeClassFromJSONable(
+					job.value,
+					job.id,
+					target.OtherClasses,
+					target.SomeClasses,
+					someClassesRef.Key(job.id),
+					target.SomeClasses[job.id],
+					instanceErrors)
+			case 1:
+				OtherClassFromJSONable(
+					job.value,
+					job.id,
+					target.OtherClasses,
+					target.SomeClasses,
+					otherClassesRef.Key(job.id),
+					target.OtherClasses[job.id],
+					instanceErrors)
+			}
+
+			chunkErrors[chunk] = append(
+				chunkErrors[chunk], instanceErrors.values...)
+			instanceErrors.values = instanceErrors.values[:0]
+
+			// The subsequent errors of the chunk would be ignored anyway.
+			if errors.cap != 0 &&
+				uint64(len(chunkErrors[chunk])) >= errors.cap {
+				break
+			}
+		}
+	})
+
+	// Merge the errors in the order of the instances.
+	for _, values := range chunkErrors {
+		for _, e := range values {
+			errors.Add(e.Ref, e.Message)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
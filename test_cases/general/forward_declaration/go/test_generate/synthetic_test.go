@@ -0,0 +1,204 @@
+package somegraph
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"encoding/json"
+	"flag"
+	"fmt"
+	"testing"
+)
+
+// syntheticRegistrySize gives the number of instances in each registry
+// of the synthetic graphs.
+var syntheticRegistrySize = flag.Int(
+	"mapry.registry_size", 500,
+	"number of instances in each registry of the synthetic graphs")
+
+// syntheticArrayLength gives the length of the arrays of
+// the synthetic graphs unless constrained by the schema.
+var syntheticArrayLength = flag.Int(
+	"mapry.array_length", 10,
+	"length of the arrays in the synthetic graphs")
+
+// syntheticMapSize gives the number of entries in the maps of
+// the synthetic graphs.
+var syntheticMapSize = flag.Int(
+	"mapry.map_size", 10,
+	"number of entries in the maps of the synthetic graphs")
+
+// syntheticMaxDepth limits the nesting of the embeddable structures
+// so that the recursive structures are finite.
+const syntheticMaxDepth = 3
+
+// syntheticSize clamps the size to the bounds given by the schema.
+//
+// The size is the minimum once the nesting is too deep.
+// Negative bounds are ignored.
+func syntheticSize(size int, depth int, minimum int, maximum int) int {
+	if depth >= syntheticMaxDepth {
+		size = 0
+	}
+	if minimum >= 0 && size < minimum {
+		size = minimum
+	}
+	if maximum >= 0 && size > maximum {
+		size = maximum
+	}
+	return size
+}
+
+// syntheticLetters encodes the index in lowercase letters.
+func syntheticLetters(i int) string {
+	result := []byte{byte('a' + i%26)}
+	i /= 26
+	for i > 0 {
+		i--
+		result = append([]byte{byte('a' + i%26)}, result...)
+		i /= 26
+	}
+	return string(result)
+}
+
+// syntheticSomeClass fills the target with
+// the synthetic values of the i-th instance.
+func syntheticSomeClass(
+	target *SomeClass,
+	i int,
+	depth int,
+	otherClassesInstances []*OtherClass,
+	someClassesInstances []*SomeClass) {
+
+	target.ReferenceOther = otherClassesInstances[i%len(otherClassesInstances)]
+
+	count2 := syntheticSize(
+		*syntheticArrayLength, depth, -1, -1)
+	target2 := make([]*OtherClass, count2)
+	for i2 := range target2 {
+		target2[i2] = otherClassesInstances[i2%len(otherClassesInstances)]
+	}
+	target.ArrayOfOthers = target2
+
+	count4 := syntheticSize(*syntheticMapSize, depth, -1, -1)
+	target4 := make(map[string]*OtherClass, count4)
+	for i4 := 0; i4 < count4; i4++ {
+		var item4 *OtherClass
+		item4 = otherClassesInstances[i4%len(otherClassesInstances)]
+		target4[fmt.Sprintf("key%d", i4)] = item4
+	}
+	target.MapOfOthers = target4
+}
+
+// syntheticOtherClass fills the target with
+// the synthetic values of the i-th instance.
+func syntheticOtherClass(
+	target *OtherClass,
+	i int,
+	depth int,
+	otherClassesInstances []*OtherClass,
+	someClassesInstances []*SomeClass) {
+
+	target.ReferenceSome = someClassesInstances[i%len(someClassesInstances)]
+
+	count2 := syntheticSize(
+		*syntheticArrayLength, depth, -1, -1)
+	target2 := make([]*SomeClass, count2)
+	for i2 := range target2 {
+		target2[i2] = someClassesInstances[i2%len(someClassesInstances)]
+	}
+	target.ArrayOfSomes = target2
+
+	count4 := syntheticSize(*syntheticMapSize, depth, -1, -1)
+	target4 := make(map[string]*SomeClass, count4)
+	for i4 := 0; i4 < count4; i4++ {
+		var item4 *SomeClass
+		item4 = someClassesInstances[i4%len(someClassesInstances)]
+		target4[fmt.Sprintf("key%d", i4)] = item4
+	}
+	target.MapOfSomes = target4
+}
+
+// newSyntheticSomeGraph builds a synthetic SomeGraph for the benchmarks.
+//
+// The sizes of the registries, arrays and maps are given by the flags.
+// Optional properties are always set unless the embeddable structures
+// are nested too deep.
+func newSyntheticSomeGraph() *SomeGraph {
+	target := &SomeGraph{}
+
+	registrySize := *syntheticRegistrySize
+	if registrySize < 1 {
+		// Each registry needs at least an instance to be referenced.
+		registrySize = 1
+	}
+
+	someClassesInstances := make([]*SomeClass, registrySize)
+	target.SomeClasses = make(map[string]*SomeClass, registrySize)
+	for i := range someClassesInstances {
+		id := fmt.Sprintf("id%d", i)
+		instance := &SomeClass{ID: id}
+		someClassesInstances[i] = instance
+		target.SomeClasses[id] = instance
+	}
+
+	otherClassesInstances := make([]*OtherClass, registrySize)
+	target.OtherClasses = make(map[string]*OtherClass, registrySize)
+	for i := range otherClassesInstances {
+		id := fmt.Sprintf("id%d", i)
+		instance := &OtherClass{ID: id}
+		otherClassesInstances[i] = instance
+		target.OtherClasses[id] = instance
+	}
+
+	for i, instance := range someClassesInstances {
+		syntheticSomeClass(
+			instance,
+			i,
+			0,
+			otherClassesInstances,
+			someClassesInstances)
+	}
+
+	for i, instance := range otherClassesInstances {
+		syntheticOtherClass(
+			instance,
+			i,
+			0,
+			otherClassesInstances,
+			someClassesInstances)
+	}
+
+	return target
+}
+
+// syntheticSomeGraphJSON gives the JSON text of
+// a synthetic SomeGraph.
+//
+// The benchmark is skipped if the synthetic graph does not satisfy
+// the schema, e.g., if a pattern could not be sampled.
+func syntheticSomeGraphJSON(b *testing.B) []byte {
+	jsonable, err := SomeGraphToJSONable(
+		newSyntheticSomeGraph())
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	data, err := json.Marshal(jsonable)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	errors := NewErrors(1)
+	SomeGraphFromJSONBytes(
+		data, "#", &SomeGraph{}, errors)
+	if !errors.Empty() {
+		e := errors.Values()[0]
+		b.Skipf(
+			"the synthetic graph does not satisfy the schema: %s: %s",
+			e.Ref, e.Message)
+	}
+
+	return data
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
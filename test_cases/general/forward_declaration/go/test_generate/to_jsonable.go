@@ -174,4 +174,109 @@ func SomeGraphToJSONable(
 	return
 }
 
+// SomeGraphToJSONableParallel converts the instance to
+// a JSONable representation on a pool of at most workers goroutines.
+//
+// The instances of each registry are converted concurrently.
+//
+// SomeGraphToJSONableParallel requires:
+//  * instance != nil
+//  * workers > 0
+//
+// SomeGraphToJSONableParallel ensures:
+//  * (err == nil && target != nil) || (err != nil && target == nil)
+func SomeGraphToJSONableParallel(
+	instance *SomeGraph,
+	workers int) (
+	target map[string]interface{}, err error) {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	target = make(map[string]interface{})
+	defer func() {
+		if err != nil {
+			target = nil
+		}
+	}()
+	////
+	// Serialize instance registry of SomeClass
+	////
+
+	if len(instance.SomeClasses) > 0 {
+		ids := make([]string, 0, len(instance.SomeClasses))
+		for id, someClassInstance := range instance.SomeClasses {
+			if id != someClassInstance.ID {
+				err = fmt.Errorf(
+					"expected the instance of SomeClass to have the ID %s according to the registry, but got: %s",
+					id, someClassInstance.ID)
+				return
+			}
+
+			ids = append(ids, id)
+		}
+
+		jsonables := make([]map[string]interface{}, len(ids))
+		chunks := parallelChunkCount(len(ids), workers)
+		forEachInParallel(chunks, workers, func(worker int, chunk int) {
+			start, end := parallelChunk(len(ids), chunks, chunk)
+			for i := start; i < end; i++ {
+				jsonables[i] = SomeClassToJSONable(
+					instance.SomeClasses[ids[i]])
+			}
+		})
+
+		targetSomeClasses := make(
+			map[string]interface{}, len(ids))
+		for i, id := range ids {
+			targetSomeClasses[id] = jsonables[i]
+		}
+
+		target["some_classes"] = targetSomeClasses
+	}
+
+	////
+	// Serialize instance registry of OtherClass
+	////
+
+	if len(instance.OtherClasses) > 0 {
+		ids := make([]string, 0, len(instance.OtherClasses))
+		for id, otherClassInstance := range instance.OtherClasses {
+			if id != otherClassInstance.ID {
+				err = fmt.Errorf(
+					"expected the instance of OtherClass to have the ID %s according to the registry, but got: %s",
+					id, otherClassInstance.ID)
+				return
+			}
+
+			ids = append(ids, id)
+		}
+
+		jsonables := make([]map[string]interface{}, len(ids))
+		chunks := parallelChunkCount(len(ids), workers)
+		forEachInParallel(chunks, workers, func(worker int, chunk int) {
+			start, end := parallelChunk(len(ids), chunks, chunk)
+			for i := start; i < end; i++ {
+				jsonables[i] = OtherClassToJSONable(
+					instance.OtherClasses[ids[i]])
+			}
+		})
+
+		targetOtherClasses := make(
+			map[string]interface{}, len(ids))
+		for i, id := range ids {
+			targetOtherClasses[id] = jsonables[i]
+		}
+
+		target["other_classes"] = targetOtherClasses
+	}
+
+	return
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
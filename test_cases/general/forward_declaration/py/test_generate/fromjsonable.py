@@ -19,7 +19,7 @@ def _some_class_from(
         some_classes_registry: typing.Mapping[
             str,
             some.graph.SomeClass],
-        ref: str,
+        ref: some.graph.parse.Ref,
         target: some.graph.SomeClass,
         errors: some.graph.parse.Errors
 ) -> None:
@@ -32,7 +32,7 @@ def _some_class_from(
     :param other_classes_registry: registry of the OtherClass instances
     :param some_classes_registry: registry of the SomeClass instances
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as SomeClass
     :param errors: errors encountered during parsing
     :return:
@@ -60,8 +60,7 @@ def _some_class_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'reference_other')),
+                (ref, 'reference_other'),
                 "Expected a str, but got: {}".format(
                     type(value_0)))
         else:
@@ -70,8 +69,7 @@ def _some_class_from(
                 None)
             if target_1 is None:
                 errors.add(
-                    '/'.join((
-                        ref, 'reference_other')),
+                    (ref, 'reference_other'),
                     'Reference to an instance of class Other_class not found: {}'.format(
                         value_0))
             else:
@@ -94,8 +92,7 @@ def _some_class_from(
     else:
         if not isinstance(value_2, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_others')),
+                (ref, 'array_of_others'),
                 "Expected a list, but got: {}".format(
                     type(value_2)))
         else:
@@ -109,8 +106,7 @@ def _some_class_from(
                 )  # type: typing.Optional[some.graph.OtherClass]
                 if not isinstance(item_3, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'array_of_others', str(i_3))),
+                        (ref, 'array_of_others', i_3),
                         "Expected a str, but got: {}".format(
                             type(item_3)))
                 else:
@@ -119,8 +115,7 @@ def _some_class_from(
                         None)
                     if target_4 is None:
                         errors.add(
-                            '/'.join((
-                                ref, 'array_of_others', str(i_3))),
+                            (ref, 'array_of_others', i_3),
                             'Reference to an instance of class Other_class not found: {}'.format(
                                 item_3))
                     else:
@@ -152,8 +147,7 @@ def _some_class_from(
     else:
         if not isinstance(value_5, dict):
             errors.add(
-                '/'.join((
-                    ref, 'map_of_others')),
+                (ref, 'map_of_others'),
                 "Expected a dict, but got: {}".format(
                     type(value_5)))
         else:
@@ -169,8 +163,7 @@ def _some_class_from(
             for key_6, value_6 in value_5.items():
                 if not isinstance(key_6, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_others')),
+                        (ref, 'map_of_others'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_6)))
 
@@ -184,8 +177,7 @@ def _some_class_from(
                 )  # type: typing.Optional[some.graph.OtherClass]
                 if not isinstance(value_6, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_others', repr(key_6))),
+                        (ref, 'map_of_others', (key_6, )),
                         "Expected a str, but got: {}".format(
                             type(value_6)))
                 else:
@@ -194,8 +186,7 @@ def _some_class_from(
                         None)
                     if target_7 is None:
                         errors.add(
-                            '/'.join((
-                                ref, 'map_of_others', repr(key_6))),
+                            (ref, 'map_of_others', (key_6, )),
                             'Reference to an instance of class Other_class not found: {}'.format(
                                 value_6))
                     else:
@@ -264,7 +255,7 @@ def _other_class_from(
         some_classes_registry: typing.Mapping[
             str,
             some.graph.SomeClass],
-        ref: str,
+        ref: some.graph.parse.Ref,
         target: some.graph.OtherClass,
         errors: some.graph.parse.Errors
 ) -> None:
@@ -277,7 +268,7 @@ def _other_class_from(
     :param other_classes_registry: registry of the OtherClass instances
     :param some_classes_registry: registry of the SomeClass instances
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as OtherClass
     :param errors: errors encountered during parsing
     :return:
@@ -305,8 +296,7 @@ def _other_class_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'reference_some')),
+                (ref, 'reference_some'),
                 "Expected a str, but got: {}".format(
                     type(value_0)))
         else:
@@ -315,8 +305,7 @@ def _other_class_from(
                 None)
             if target_1 is None:
                 errors.add(
-                    '/'.join((
-                        ref, 'reference_some')),
+                    (ref, 'reference_some'),
                     'Reference to an instance of class Some_class not found: {}'.format(
                         value_0))
             else:
@@ -339,8 +328,7 @@ def _other_class_from(
     else:
         if not isinstance(value_2, list):
             errors.add(
-                '/'.join((
-                    ref, 'array_of_somes')),
+                (ref, 'array_of_somes'),
                 "Expected a list, but got: {}".format(
                     type(value_2)))
         else:
@@ -354,8 +342,7 @@ def _other_class_from(
                 )  # type: typing.Optional[some.graph.SomeClass]
                 if not isinstance(item_3, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'array_of_somes', str(i_3))),
+                        (ref, 'array_of_somes', i_3),
                         "Expected a str, but got: {}".format(
                             type(item_3)))
                 else:
@@ -364,8 +351,7 @@ def _other_class_from(
                         None)
                     if target_4 is None:
                         errors.add(
-                            '/'.join((
-                                ref, 'array_of_somes', str(i_3))),
+                            (ref, 'array_of_somes', i_3),
                             'Reference to an instance of class Some_class not found: {}'.format(
                                 item_3))
                     else:
@@ -397,8 +383,7 @@ def _other_class_from(
     else:
         if not isinstance(value_5, dict):
             errors.add(
-                '/'.join((
-                    ref, 'map_of_somes')),
+                (ref, 'map_of_somes'),
                 "Expected a dict, but got: {}".format(
                     type(value_5)))
         else:
@@ -414,8 +399,7 @@ def _other_class_from(
             for key_6, value_6 in value_5.items():
                 if not isinstance(key_6, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_somes')),
+                        (ref, 'map_of_somes'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_6)))
 
@@ -429,8 +413,7 @@ def _other_class_from(
                 )  # type: typing.Optional[some.graph.SomeClass]
                 if not isinstance(value_6, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_somes', repr(key_6))),
+                        (ref, 'map_of_somes', (key_6, )),
                         "Expected a str, but got: {}".format(
                             type(value_6)))
                 else:
@@ -439,8 +422,7 @@ def _other_class_from(
                         None)
                     if target_7 is None:
                         errors.add(
-                            '/'.join((
-                                ref, 'map_of_somes', repr(key_6))),
+                            (ref, 'map_of_somes', (key_6, )),
                             'Reference to an instance of class Some_class not found: {}'.format(
                                 value_6))
                     else:
@@ -534,8 +516,7 @@ def some_graph_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'some_classes')),
+                (ref, 'some_classes'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -560,8 +541,7 @@ def some_graph_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'other_classes')),
+                (ref, 'other_classes'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -595,8 +575,7 @@ def some_graph_from(
                 instance_value,
                 graph.other_classes,
                 graph.some_classes,
-                '/'.join((
-                    ref, 'some_classes', repr(id))),
+                (ref, 'some_classes', (id, )),
                 target_some_class,
                 errors)
 
@@ -617,8 +596,7 @@ def some_graph_from(
                 instance_value,
                 graph.other_classes,
                 graph.some_classes,
-                '/'.join((
-                    ref, 'other_classes', repr(id))),
+                (ref, 'other_classes', (id, )),
                 target_other_class,
                 errors)
 
@@ -629,3 +607,528 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_class_from_fast(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        some_classes_registry: typing.Mapping[
+            str,
+            some.graph.SomeClass],
+        target: some.graph.SomeClass
+) -> None:
+    """
+    parses SomeClass optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :param other_classes_registry: registry of the OtherClass instances
+    :param some_classes_registry: registry of the SomeClass instances
+    :param target: parsed ``value`` as SomeClass
+    :return:
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse reference_other
+    ##
+
+    target.reference_other = other_classes_registry[
+        value['reference_other']]
+
+    ##
+    # Parse array_of_others
+    ##
+
+    value_3 = value['array_of_others']
+    if not isinstance(value_3, list):
+        raise TypeError("Expected a list")
+    target_3 = (
+        []
+    )  # type: typing.List[some.graph.OtherClass]
+    for item_3 in value_3:
+        target_item_3 = other_classes_registry[
+            item_3]
+        target_3.append(
+            target_item_3)
+    target.array_of_others = target_3
+
+    ##
+    # Parse map_of_others
+    ##
+
+    value_6 = value['map_of_others']
+    if not isinstance(value_6, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_6, collections.OrderedDict):
+        target_6 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, some.graph.OtherClass]
+    else:
+        target_6 = (
+            dict()
+        )
+    for key_6, item_6 in value_6.items():
+        if not isinstance(key_6, str):
+            raise TypeError("Expected the key to be a str")
+        target_item_6 = other_classes_registry[
+            item_6]
+        target_6[key_6] = target_item_6
+    target.map_of_others = target_6
+
+
+def _other_class_from_fast(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        some_classes_registry: typing.Mapping[
+            str,
+            some.graph.SomeClass],
+        target: some.graph.OtherClass
+) -> None:
+    """
+    parses OtherClass optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :param other_classes_registry: registry of the OtherClass instances
+    :param some_classes_registry: registry of the SomeClass instances
+    :param target: parsed ``value`` as OtherClass
+    :return:
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse reference_some
+    ##
+
+    target.reference_some = some_classes_registry[
+        value['reference_some']]
+
+    ##
+    # Parse array_of_somes
+    ##
+
+    value_3 = value['array_of_somes']
+    if not isinstance(value_3, list):
+        raise TypeError("Expected a list")
+    target_3 = (
+        []
+    )  # type: typing.List[some.graph.SomeClass]
+    for item_3 in value_3:
+        target_item_3 = some_classes_registry[
+            item_3]
+        target_3.append(
+            target_item_3)
+    target.array_of_somes = target_3
+
+    ##
+    # Parse map_of_somes
+    ##
+
+    value_6 = value['map_of_somes']
+    if not isinstance(value_6, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_6, collections.OrderedDict):
+        target_6 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, some.graph.SomeClass]
+    else:
+        target_6 = (
+            dict()
+        )
+    for key_6, item_6 in value_6.items():
+        if not isinstance(key_6, str):
+            raise TypeError("Expected the key to be a str")
+        target_item_6 = some_classes_registry[
+            item_6]
+        target_6[key_6] = target_item_6
+    target.map_of_somes = target_6
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.some_classes = collections.OrderedDict()
+        else:
+            graph.some_classes = dict()
+
+        some_classes_registry = graph.some_classes
+        for id in registry_value:
+            some_classes_registry[id] = some.graph.parse.placeholder_some_class(id=id)
+
+    ##
+    # Pre-allocate other_classes
+    ##
+
+    registry_value = value.get('other_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.other_classes = collections.OrderedDict()
+        else:
+            graph.other_classes = dict()
+
+        other_classes_registry = graph.other_classes
+        for id in registry_value:
+            other_classes_registry[id] = some.graph.parse.placeholder_other_class(id=id)
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            _some_class_from_fast(
+                instance_value,
+                graph.other_classes,
+                graph.some_classes,
+                graph.some_classes[id])
+
+    ##
+    # Parse other_classes
+    ##
+
+    if 'other_classes' in value:
+        registry_value = value['other_classes']
+        for id, instance_value in registry_value.items():
+            _other_class_from_fast(
+                instance_value,
+                graph.other_classes,
+                graph.some_classes,
+                graph.other_classes[id])
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _mentions_any(value: typing.Any, ids: typing.AbstractSet[str]) -> bool:
+    """
+    checks whether any of the strings in the JSONable value is in ``ids``.
+
+    The keys of the dictionaries are not considered since they can not refer
+    to instances.
+
+    :param value: JSONable value
+    :param ids: identifiers of the instances
+    :return: True if any identifier is mentioned
+    """
+    if isinstance(value, str):
+        return value in ids
+
+    if isinstance(value, dict):
+        return any(_mentions_any(item, ids) for item in value.values())
+
+    if isinstance(value, list):
+        return any(_mentions_any(item, ids) for item in value)
+
+    return False
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_some_classes = set()  # type: typing.Set[str]
+    changed_other_classes = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate some_classes reusing the unchanged instances
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+            some_classes_registry = graph.some_classes
+            previous_some_classes = previous.some_classes
+
+            previous_registry_value = previous_value.get(
+                'some_classes', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_some_class = previous_some_classes.get(id, None)
+                if (target_some_class is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_some_class = some.graph.parse.placeholder_some_class(id=id)
+                    changed_some_classes.add(id)
+
+                some_classes_registry[id] = target_some_class
+
+    changed_some_classes.update(
+        id for id in previous.some_classes
+        if id not in graph.some_classes)
+
+    if errors.full():
+        return None
+
+    ##
+    # Pre-allocate other_classes reusing the unchanged instances
+    ##
+
+    registry_value = value.get('other_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'other_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.other_classes = collections.OrderedDict()
+            else:
+                graph.other_classes = dict()
+
+            other_classes_registry = graph.other_classes
+            previous_other_classes = previous.other_classes
+
+            previous_registry_value = previous_value.get(
+                'other_classes', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_other_class = previous_other_classes.get(id, None)
+                if (target_other_class is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_other_class = some.graph.parse.placeholder_other_class(id=id)
+                    changed_other_classes.add(id)
+
+                other_classes_registry[id] = target_other_class
+
+    changed_other_classes.update(
+        id for id in previous.other_classes
+        if id not in graph.other_classes)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse anew the instances referring to the new, changed or removed
+    # instances until no more instances need to be parsed anew.
+    ##
+
+    has_changed = True
+    while has_changed:
+        has_changed = False
+
+        referred = changed_other_classes | changed_some_classes
+
+        registry_value = value.get('some_classes', None)
+        if referred and registry_value is not None:
+            for id, instance_value in registry_value.items():
+                if (id not in changed_some_classes and
+                        _mentions_any(instance_value, referred)):
+                    graph.some_classes[id] = some.graph.parse.placeholder_some_class(id=id)
+                    changed_some_classes.add(id)
+                    has_changed = True
+
+        referred = changed_other_classes | changed_some_classes
+
+        registry_value = value.get('other_classes', None)
+        if referred and registry_value is not None:
+            for id, instance_value in registry_value.items():
+                if (id not in changed_other_classes and
+                        _mentions_any(instance_value, referred)):
+                    graph.other_classes[id] = some.graph.parse.placeholder_other_class(id=id)
+                    changed_other_classes.add(id)
+                    has_changed = True
+
+    ##
+    # Parse the new and changed some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+    if registry_value is not None and changed_some_classes:
+        for id, instance_value in registry_value.items():
+            if id not in changed_some_classes:
+                continue
+
+            _some_class_from(
+                instance_value,
+                graph.other_classes,
+                graph.some_classes,
+                (ref, 'some_classes', (id, )),
+                graph.some_classes[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse the new and changed other_classes
+    ##
+
+    registry_value = value.get('other_classes', None)
+    if registry_value is not None and changed_other_classes:
+        for id, instance_value in registry_value.items():
+            if id not in changed_other_classes:
+                continue
+
+            _other_class_from(
+                instance_value,
+                graph.other_classes,
+                graph.some_classes,
+                (ref, 'other_classes', (id, )),
+                graph.other_classes[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    if not errors.empty():
+        return None
+
+    return graph
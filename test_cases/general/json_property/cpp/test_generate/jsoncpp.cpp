@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_bool
   ////
 
   if (!value.isMember("SOME-BOOL")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: SOME-BOOL");
   } else {
     const Json::Value& value_0 = value["SOME-BOOL"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected a bool, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/SOME-BOOL"),
+        parse::Ref(graph_ref, "SOME-BOOL"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -2,10 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -43,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeBool
 	////
@@ -51,17 +50,14 @@ func SomeGraphFromJSONable(
 		"SOME-BOOL"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: SOME-BOOL")
 	} else {
 		cast1, ok1 := value0.(bool)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "SOME-BOOL"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("SOME-BOOL"),
 				fmt.Sprintf(
 					"expected a bool, but got: %T",
 					value0))
@@ -2,10 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -43,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse MapOfBooleans
 	////
@@ -51,17 +50,14 @@ func SomeGraphFromJSONable(
 		"map_of_booleans"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: map_of_booleans")
 	} else {
 		cast1, ok1 := value0.(map[string]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_booleans"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("map_of_booleans"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value0))
@@ -70,11 +66,8 @@ func SomeGraphFromJSONable(
 			for k1 := range cast1 {
 				cast2, ok2 := (cast1[k1]).(bool)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_booleans", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_booleans").Key(k1),
 						fmt.Sprintf(
 							"expected a bool, but got: %T",
 							cast1[k1]))
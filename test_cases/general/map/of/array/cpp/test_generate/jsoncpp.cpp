@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse map_of_arrays
   ////
 
   if (!value.isMember("map_of_arrays")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_arrays");
   } else {
     const Json::Value& value_0 = value["map_of_arrays"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_arrays"),
+        parse::Ref(graph_ref, "map_of_arrays"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -114,10 +115,7 @@ void some_graph_from(
             "Expected an array, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_arrays")
-              .append("/")
-              .append(it_0.name()),
+            parse::Ref(parse::Ref(graph_ref, "map_of_arrays"), it_0.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -133,12 +131,7 @@ void some_graph_from(
                 "Expected a bool, but got: ");
 
               errors->add(
-                std::string(ref)
-                  .append("/map_of_arrays")
-                  .append("/")
-                  .append(it_0.name())
-                  .append("/")
-                  .append(std::to_string(i_1)),
+                parse::Ref(parse::Ref(parse::Ref(graph_ref, "map_of_arrays"), it_0.name()), i_1),
                 message(
                   expected_but_got,
                   strlen(expected_but_got),
@@ -2,11 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strconv"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -44,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse MapOfArrays
 	////
@@ -52,17 +50,14 @@ func SomeGraphFromJSONable(
 		"map_of_arrays"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: map_of_arrays")
 	} else {
 		cast1, ok1 := value0.(map[string]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_arrays"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("map_of_arrays"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value0))
@@ -71,11 +66,8 @@ func SomeGraphFromJSONable(
 			for k1 := range cast1 {
 				cast2, ok2 := (cast1[k1]).([]interface{})
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_arrays", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_arrays").Key(k1),
 						fmt.Sprintf(
 							"expected a []interface{}, but got: %T",
 							cast1[k1]))
@@ -86,11 +78,8 @@ func SomeGraphFromJSONable(
 					for i2 := range cast2 {
 						cast3, ok3 := (cast2[i2]).(bool)
 						if !ok3 {
-							errors.Add(
-								strings.Join(
-									[]string{
-										ref, "map_of_arrays", k1, strconv.Itoa(i2)},
-									"/"),
+							errors.AddRef(
+								graphRef.Key("map_of_arrays").Key(k1).Index(i2),
 								fmt.Sprintf(
 									"expected a bool, but got: %T",
 									cast2[i2]))
@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse map_of_booleans
   ////
 
   if (!value.isMember("map_of_booleans")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_booleans");
   } else {
     const Json::Value& value_0 = value["map_of_booleans"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_booleans"),
+        parse::Ref(graph_ref, "map_of_booleans"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -114,10 +115,7 @@ void some_graph_from(
             "Expected a bool, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_booleans")
-              .append("/")
-              .append(it_0.name()),
+            parse::Ref(parse::Ref(graph_ref, "map_of_booleans"), it_0.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -50,8 +50,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, dict):
             errors.add(
-                '/'.join((
-                    ref, 'map_of_booleans')),
+                (ref, 'map_of_booleans'),
                 "Expected a dict, but got: {}".format(
                     type(value_0)))
         else:
@@ -67,8 +66,7 @@ def some_graph_from(
             for key_1, value_1 in value_0.items():
                 if not isinstance(key_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_booleans')),
+                        (ref, 'map_of_booleans'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_1)))
 
@@ -82,8 +80,7 @@ def some_graph_from(
                 )  # type: typing.Optional[bool]
                 if not isinstance(value_1, bool):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_booleans', repr(key_1))),
+                        (ref, 'map_of_booleans', (key_1, )),
                         "Expected a bool, but got: {}".format(
                             type(value_1)))
                 else:
@@ -105,3 +102,77 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse map_of_booleans
+    ##
+
+    value_1 = value['map_of_booleans']
+    if not isinstance(value_1, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_1, collections.OrderedDict):
+        target_1 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, bool]
+    else:
+        target_1 = (
+            dict()
+        )
+    for key_1, item_1 in value_1.items():
+        if not isinstance(key_1, str):
+            raise TypeError("Expected the key to be a str")
+        if not isinstance(item_1, bool):
+            raise TypeError("Expected a bool")
+        target_item_1 = item_1
+        target_1[key_1] = target_item_1
+    graph.map_of_booleans = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -83,14 +83,14 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Pre-allocate empties
   ////
 
-  std::string empties_ref;
-  empties_ref.reserve(ref.size() + 8);
-  empties_ref += ref;
-  empties_ref += "/empties";
+  const parse::Ref empties_ref(
+    graph_ref, "empties");
 
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
@@ -122,36 +122,21 @@ void some_graph_from(
     return;
   }
 
-  // Keep the prefix fixed in this buffer so that
-  // it is copied as little as possible
-  std::string instance_ref;
-
   ////
   // Parse empties
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += empties_ref;
-  instance_ref += '/';
-
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        empties_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        empties_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       Empty* instance(
-        target->empties.at(it.name()).get());
+        target->empties.at(id).get());
       empty_from(
         *it,
-        instance_ref,
+        parse::Ref(empties_ref, id),
         instance,
         errors);
 
@@ -170,7 +155,7 @@ void some_graph_from(
 
   if (!value.isMember("map_of_class_refs")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_class_refs");
   } else {
     const Json::Value& value_0 = value["map_of_class_refs"];
@@ -179,8 +164,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_class_refs"),
+        parse::Ref(graph_ref, "map_of_class_refs"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -195,10 +179,7 @@ void some_graph_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_class_refs")
-              .append("/")
-              .append(it_0.name()),
+            parse::Ref(parse::Ref(graph_ref, "map_of_class_refs"), it_0.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -213,10 +194,7 @@ void some_graph_from(
               " not found: ");
 
             errors->add(
-              std::string(ref)
-                .append("/map_of_class_refs")
-                .append("/")
-                .append(it_0.name()),
+              parse::Ref(parse::Ref(graph_ref, "map_of_class_refs"), it_0.name()),
               message(
                 reference_not_found,
                 strlen(reference_not_found),
@@ -239,7 +217,7 @@ void some_graph_from(
 
 void empty_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     Empty* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
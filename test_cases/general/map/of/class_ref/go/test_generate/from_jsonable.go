@@ -4,7 +4,7 @@ package somegraph
 
 import (
 	"fmt"
-	"strings"
+	"sort"
 )
 
 // EmptyFromJSONable parses Empty from a JSONable value.
@@ -18,7 +18,7 @@ import (
 func EmptyFromJSONable(
 	value interface{},
 	id string,
-	ref string,
+	ref *Ref,
 	target *Empty,
 	errors *Errors) {
 
@@ -36,7 +36,7 @@ func EmptyFromJSONable(
 
 	_, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -85,11 +85,14 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Pre-allocate Empties
 	////
 
-	emptiesRef := ref+"/empties";
+	emptiesRef := graphRef.Key(
+		"empties")
 	var emptiesOk bool
 	var emptiesValue interface{}
 	var emptiesMap map[string]interface{}
@@ -99,7 +102,7 @@ func SomeGraphFromJSONable(
 	if emptiesOk {
 		emptiesMap, ok = emptiesValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				emptiesRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -129,8 +132,7 @@ func SomeGraphFromJSONable(
 			EmptyFromJSONable(
 				value,
 				id,
-				strings.Join([]string{
-					emptiesRef, id}, "/"),
+				emptiesRef.Key(id),
 				target.Empties[id],
 				errors)
 
@@ -152,17 +154,230 @@ func SomeGraphFromJSONable(
 		"map_of_class_refs"]
 
 	if !ok0 {
+		errors.AddRef(
+			graphRef,
+			"property is missing: map_of_class_refs")
+	} else {
+		cast1, ok1 := value0.(map[string]interface{})
+		if !ok1 {
+			errors.AddRef(
+				graphRef.Key("map_of_class_refs"),
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					value0))
+		} else {
+			target1 := make(map[string]*Empty)
+			for k1 := range cast1 {
+				cast2, ok2 := (cast1[k1]).(string)
+				if !ok2 {
+					errors.AddRef(
+						graphRef.Key("map_of_class_refs").Key(k1),
+						fmt.Sprintf(
+							"expected a string, but got: %T",
+							cast1[k1]))
+				} else {
+					target2, ok2 := target.Empties[cast2]
+					if !ok2 {
+						errors.AddRef(
+							graphRef.Key("map_of_class_refs").Key(k1),
+							fmt.Sprintf(
+								"reference to an instance of class Empty not found: %s",
+								cast1[k1]))
+					} else {
+						target1[k1] = target2
+					}
+				}
+
+				if errors.Full() {
+					break;
+				}
+			}
+
+			target.MapOfClassRefs = target1
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// SomeGraphFromJSONableParallel parses SomeGraph from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike SomeGraphFromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func SomeGraphFromJSONableParallel(
+	value interface{},
+	ref string,
+	target *SomeGraph,
+	errors *Errors,
+	workers int) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
 		errors.Add(
 			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate Empties
+	////
+
+	emptiesRef := graphRef.Key(
+		"empties")
+	var emptiesOk bool
+	var emptiesValue interface{}
+	var emptiesMap map[string]interface{}
+
+	emptiesValue, emptiesOk = cast[
+		"empties"]
+	if emptiesOk {
+		emptiesMap, ok = emptiesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				emptiesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					emptiesValue));
+		} else {
+			target.Empties = make(
+				map[string]*Empty)
+
+			for id := range emptiesMap {
+				target.Empties[id] = &Empty{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse the instances of all the registries in parallel
+	////
+
+	// instanceJob identifies an instance to be parsed.
+	type instanceJob struct {
+		// indicates the registry in the order of the classes.
+		registry int
+
+		id string
+
+		value interface{}
+	}
+
+	jobs := make([]instanceJob, 0, len(emptiesMap))
+	for id, value := range emptiesMap {
+		jobs = append(jobs, instanceJob{registry: 0, id: id, value: value})
+	}
+
+	// Sort the instances so that the errors are deterministic.
+	sort.Slice(jobs, func(i, j int) bool {
+		if jobs[i].registry != jobs[j].registry {
+			return jobs[i].registry < jobs[j].registry
+		}
+		return jobs[i].id < jobs[j].id
+	})
+
+	chunks := parallelChunkCount(len(jobs), workers)
+	chunkErrors := make([][]Error, chunks)
+	workerErrors := make([]*Errors, workers)
+
+	forEachInParallel(chunks, workers, func(worker int, chunk int) {
+		instanceErrors := workerErrors[worker]
+		if instanceErrors == nil {
+			instanceErrors = NewErrors(errors.cap)
+			workerErrors[worker] = instanceErrors
+		}
+
+		start, end := parallelChunk(len(jobs), chunks, chunk)
+		for _, job := range jobs[start:end] {
+			switch job.registry {
+			case 0:
+				EmptyFromJSONable(
+					job.value,
+					job.id,
+					emptiesRef.Key(job.id),
+					target.Empties[job.id],
+					instanceErrors)
+			}
+
+			chunkErrors[chunk] = append(
+				chunkErrors[chunk], instanceErrors.values...)
+			instanceErrors.values = instanceErrors.values[:0]
+
+			// The subsequent errors of the chunk would be ignored anyway.
+			if errors.cap != 0 &&
+				uint64(len(chunkErrors[chunk])) >= errors.cap {
+				break
+			}
+		}
+	})
+
+	// Merge the errors in the order of the instances.
+	for _, values := range chunkErrors {
+		for _, e := range values {
+			errors.Add(e.Ref, e.Message)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse MapOfClassRefs
+	////
+
+	value0, ok0 := cast[
+		"map_of_class_refs"]
+
+	if !ok0 {
+		errors.AddRef(
+			graphRef,
 			"property is missing: map_of_class_refs")
 	} else {
 		cast1, ok1 := value0.(map[string]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_class_refs"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("map_of_class_refs"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value0))
@@ -171,22 +386,16 @@ func SomeGraphFromJSONable(
 			for k1 := range cast1 {
 				cast2, ok2 := (cast1[k1]).(string)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_class_refs", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_class_refs").Key(k1),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast1[k1]))
 				} else {
 					target2, ok2 := target.Empties[cast2]
 					if !ok2 {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "map_of_class_refs", k1},
-								"/"),
+						errors.AddRef(
+							graphRef.Key("map_of_class_refs").Key(k1),
 							fmt.Sprintf(
 								"reference to an instance of class Empty not found: %s",
 								cast1[k1]))
@@ -83,4 +83,84 @@ func SomeGraphToJSONable(
 	return
 }
 
+// SomeGraphToJSONableParallel converts the instance to
+// a JSONable representation on a pool of at most workers goroutines.
+//
+// The instances of each registry are converted concurrently.
+//
+// SomeGraphToJSONableParallel requires:
+//  * instance != nil
+//  * workers > 0
+//
+// SomeGraphToJSONableParallel ensures:
+//  * (err == nil && target != nil) || (err != nil && target == nil)
+func SomeGraphToJSONableParallel(
+	instance *SomeGraph,
+	workers int) (
+	target map[string]interface{}, err error) {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	target = make(map[string]interface{})
+	defer func() {
+		if err != nil {
+			target = nil
+		}
+	}()
+	////
+	// Serialize MapOfClassRefs
+	////
+
+	target0 := make(map[string]interface{})
+	map0 := instance.MapOfClassRefs
+	for k0, v0 := range map0 {
+		target0[k0] = v0.ID
+	}
+	target["map_of_class_refs"] = target0
+
+	////
+	// Serialize instance registry of Empty
+	////
+
+	if len(instance.Empties) > 0 {
+		ids := make([]string, 0, len(instance.Empties))
+		for id, emptyInstance := range instance.Empties {
+			if id != emptyInstance.ID {
+				err = fmt.Errorf(
+					"expected the instance of Empty to have the ID %s according to the registry, but got: %s",
+					id, emptyInstance.ID)
+				return
+			}
+
+			ids = append(ids, id)
+		}
+
+		jsonables := make([]map[string]interface{}, len(ids))
+		chunks := parallelChunkCount(len(ids), workers)
+		forEachInParallel(chunks, workers, func(worker int, chunk int) {
+			start, end := parallelChunk(len(ids), chunks, chunk)
+			for i := start; i < end; i++ {
+				jsonables[i] = EmptyToJSONable(
+					instance.Empties[ids[i]])
+			}
+		})
+
+		targetEmpties := make(
+			map[string]interface{}, len(ids))
+		for i, id := range ids {
+			targetEmpties[id] = jsonables[i]
+		}
+
+		target["empties"] = targetEmpties
+	}
+
+	return
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -6,12 +6,45 @@
 
 import collections
 import datetime
+import re
 import typing
 
 import some.graph
 import some.graph.parse
 
 
+_DATE_Y_45_m_45_d_RE = re.compile(
+    r'([0-9]{4})\-([0-9]{2})\-([0-9]{2})\Z')
+
+
+def _date_from_string_Y_45_m_45_d(text: str) -> datetime.date:
+    """
+    parses the date from the string in the format '%Y-%m-%d'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: date
+    :raise: ValueError if the string could not be parsed
+
+    >>> _date_from_string_Y_45_m_45_d('2016-07-03')
+    datetime.date(2016, 7, 3)
+
+    """
+    match = _DATE_Y_45_m_45_d_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.date(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y-%m-%d').date()
+
+
 def some_graph_from(
         value: typing.Any,
         ref: str,
@@ -51,8 +84,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, dict):
             errors.add(
-                '/'.join((
-                    ref, 'map_of_dates')),
+                (ref, 'map_of_dates'),
                 "Expected a dict, but got: {}".format(
                     type(value_0)))
         else:
@@ -68,8 +100,7 @@ def some_graph_from(
             for key_1, value_1 in value_0.items():
                 if not isinstance(key_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_dates')),
+                        (ref, 'map_of_dates'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_1)))
 
@@ -83,20 +114,16 @@ def some_graph_from(
                 )  # type: typing.Optional[datetime.date]
                 if not isinstance(value_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_dates', repr(key_1))),
+                        (ref, 'map_of_dates', (key_1, )),
                         "Expected a string, but got: {}".format(
                             type(value_1)))
                 else:
                     try:
-                        target_item_1 = datetime.datetime.strptime(
-                            value_1,
-                            '%Y-%m-%d'
-                        ).date()
+                        target_item_1 = _date_from_string_Y_45_m_45_d(
+                            value_1)
                     except ValueError:
                         errors.add(
-                            '/'.join((
-                                ref, 'map_of_dates', repr(key_1))),
+                            (ref, 'map_of_dates', (key_1, )),
                             'Expected to strptime %Y-%m-%d, but got: {}'.format(
                                 value_1))
 
@@ -116,3 +143,76 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse map_of_dates
+    ##
+
+    value_1 = value['map_of_dates']
+    if not isinstance(value_1, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_1, collections.OrderedDict):
+        target_1 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, datetime.date]
+    else:
+        target_1 = (
+            dict()
+        )
+    for key_1, item_1 in value_1.items():
+        if not isinstance(key_1, str):
+            raise TypeError("Expected the key to be a str")
+        target_item_1 = _date_from_string_Y_45_m_45_d(
+            item_1)
+        target_1[key_1] = target_item_1
+    graph.map_of_dates = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
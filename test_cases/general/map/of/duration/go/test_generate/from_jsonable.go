@@ -5,23 +5,121 @@ package somegraph
 import (
 	"fmt"
 	"math"
-	"regexp"
 	"strconv"
 	"strings"
 	"time"
 )
 
-var durationRe = regexp.MustCompile(
-	`^(-|\+)?P`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)Y)?`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)M)?`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)W)?`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)D)?`+
-	`(T`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)H)?`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)M)?`+
-	`(((0|[1-9][0-9]*)(\.([0-9]+))?)S)?`+
-	`)?$`)
+// durationParts represents the components of a duration in ISO 8601
+// format as they are written in the text.
+//
+// The components which are not specified are empty.
+type durationParts struct {
+	sign     string
+	years    string
+	months   string
+	weeks    string
+	days     string
+	hours    string
+	minutes  string
+	seconds  string
+	fraction string
+}
+
+// scanDuration splits the duration in ISO 8601 format into its
+// components in a single pass.
+//
+// ok is false if s does not conform to the format.
+func scanDuration(s string) (parts durationParts, ok bool) {
+	i := 0
+	if i < len(s) && (s[i] == '+' || s[i] == '-') {
+		parts.sign = s[i : i+1]
+		i++
+	}
+
+	if i == len(s) || s[i] != 'P' {
+		return durationParts{}, false
+	}
+	i++
+
+	// Designators of the date part are followed by
+	// the designators of the time part.
+	designators := "YMWD"
+	offset := 0
+	next := 0
+
+	for i < len(s) {
+		if s[i] == 'T' && offset == 0 {
+			designators = "HMS"
+			offset = 4
+			next = 0
+			i++
+			continue
+		}
+
+		start := i
+
+		switch {
+		case s[i] == '0':
+			i++
+		case s[i] >= '1' && s[i] <= '9':
+			i++
+			for i < len(s) && s[i] >= '0' && s[i] <= '9' {
+				i++
+			}
+		default:
+			return durationParts{}, false
+		}
+
+		integerEnd := i
+
+		if i < len(s) && s[i] == '.' {
+			i++
+			for i < len(s) && s[i] >= '0' && s[i] <= '9' {
+				i++
+			}
+
+			if i == integerEnd+1 {
+				return durationParts{}, false
+			}
+		}
+
+		if i == len(s) {
+			return durationParts{}, false
+		}
+
+		designator := strings.IndexByte(designators[next:], s[i])
+		if designator == -1 {
+			return durationParts{}, false
+		}
+		designator += next
+
+		switch offset + designator {
+		case 0:
+			parts.years = s[start:i]
+		case 1:
+			parts.months = s[start:i]
+		case 2:
+			parts.weeks = s[start:i]
+		case 3:
+			parts.days = s[start:i]
+		case 4:
+			parts.hours = s[start:i]
+		case 5:
+			parts.minutes = s[start:i]
+		default:
+			parts.seconds = s[start:integerEnd]
+			if i > integerEnd {
+				parts.fraction = s[integerEnd+1 : i]
+			}
+		}
+
+		next = designator + 1
+		i++
+	}
+
+	return parts, true
+}
 
 // addDuration adds right nanoseconds to the left duration.
 //
@@ -66,9 +164,9 @@ func addDuration(
 // Since time.Duration is measured in nanoseconds, beware of overflow
 // issues due to finite representation of integers.
 func durationFromString(s string) (d time.Duration, err error) {
-	m := durationRe.FindStringSubmatch(s)
+	parts, ok := scanDuration(s)
 
-	if len(m) == 0 {
+	if !ok {
 		err = fmt.Errorf("failed to match the duration pattern")
 		return
 	}
@@ -81,60 +179,60 @@ func durationFromString(s string) (d time.Duration, err error) {
 	var seconds, nanoseconds int64
 
 	sign := int64(1)
-	if len(m[1]) > 0 && m[1][0] == '-' {
+	if len(parts.sign) > 0 && parts.sign[0] == '-' {
 		sign = -1
 	}
 
-	if len(m[3]) > 0 {
-		years, err = strconv.ParseFloat(m[3], 64)
+	if len(parts.years) > 0 {
+		years, err = strconv.ParseFloat(parts.years, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the years: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[7]) > 0 {
-		months, err = strconv.ParseFloat(m[7], 64)
+	if len(parts.months) > 0 {
+		months, err = strconv.ParseFloat(parts.months, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the months: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[11]) > 0 {
-		weeks, err = strconv.ParseFloat(m[11], 64)
+	if len(parts.weeks) > 0 {
+		weeks, err = strconv.ParseFloat(parts.weeks, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the weeks: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[15]) > 0 {
-		days, err = strconv.ParseFloat(m[15], 64)
+	if len(parts.days) > 0 {
+		days, err = strconv.ParseFloat(parts.days, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the days: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[20]) > 0 {
-		hours, err = strconv.ParseFloat(m[20], 64)
+	if len(parts.hours) > 0 {
+		hours, err = strconv.ParseFloat(parts.hours, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the hours: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[24]) > 0 {
-		minutes, err = strconv.ParseFloat(m[24], 64)
+	if len(parts.minutes) > 0 {
+		minutes, err = strconv.ParseFloat(parts.minutes, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the minutes: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[29]) > 0 {
-		seconds, err = strconv.ParseInt(m[29], 10, 64)
+	if len(parts.seconds) > 0 {
+		seconds, err = strconv.ParseInt(parts.seconds, 10, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the seconds: %s", err.Error())
 			return
@@ -142,10 +240,10 @@ func durationFromString(s string) (d time.Duration, err error) {
 	}
 
 	switch {
-	case len(m[31]) == 0:
+	case len(parts.fraction) == 0:
 		// pass
-	case len(m[31]) <= 9:
-		trimmed := strings.TrimLeft(m[31], "0")
+	case len(parts.fraction) <= 9:
+		trimmed := strings.TrimLeft(parts.fraction, "0")
 		if len(trimmed) > 0 {
 			nanoseconds, err = strconv.ParseInt(trimmed, 10, 64)
 			if err != nil {
@@ -154,7 +252,7 @@ func durationFromString(s string) (d time.Duration, err error) {
 					err.Error())
 			}
 
-			order := 9 - len(m[31])
+			order := 9 - len(parts.fraction)
 			for i := 0; i < order; i++ {
 				nanoseconds *= 10
 			}
@@ -264,6 +362,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse MapOfDurations
 	////
@@ -272,17 +372,14 @@ func SomeGraphFromJSONable(
 		"map_of_durations"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: map_of_durations")
 	} else {
 		cast1, ok1 := value0.(map[string]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_durations"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("map_of_durations"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value0))
@@ -291,22 +388,16 @@ func SomeGraphFromJSONable(
 			for k1 := range cast1 {
 				cast2, ok2 := (cast1[k1]).(string)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_durations", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_durations").Key(k1),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast1[k1]))
 				} else {
 					target2, err2 := durationFromString(cast2)
 					if err2 != nil {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "map_of_durations", k1},
-								"/"),
+						errors.AddRef(
+							graphRef.Key("map_of_durations").Key(k1),
 							fmt.Sprintf(
 								"failed to parse duration from %#v: %s",
 								cast2,
@@ -6,24 +6,96 @@
 
 import collections
 import datetime
-import re
 import typing
 
 import some.graph
 import some.graph.parse
 
 
-_DURATION_RE = re.compile(
-    r'^(?P<sign>\+|-)?P'
-    r'((?P<years>(0|[1-9][0-9]*)(\.[0-9]+)?)Y)?'
-    r'((?P<months>(0|[1-9][0-9]*)(\.[0-9]+)?)M)?'
-    r'((?P<weeks>(0|[1-9][0-9]*)(\.[0-9]+)?)W)?'
-    r'((?P<days>(0|[1-9][0-9]*)(\.[0-9]+)?)D)?'
-    r'(T'
-    r'((?P<hours>(0|[1-9][0-9]*)(\.[0-9]+)?)H)?'
-    r'((?P<minutes>(0|[1-9][0-9]*)(\.[0-9]+)?)M)?'
-    r'(((?P<seconds>0|[1-9][0-9]*)(\.(?P<fraction>[0-9]+))?)S)?'
-    r')?$')
+def _scan_duration(text: str) -> typing.Optional[typing.List[str]]:
+    """
+    scans the duration in ISO 8601 format in a single pass.
+
+    :param text: string to be scanned
+    :return:
+        sign, years, months, weeks, days, hours, minutes, seconds and
+        fraction of seconds as strings (empty if not specified),
+        or None if the text does not conform to the format
+
+    >>> _scan_duration('-P1.5YT2M3.04S')
+    ['-', '1.5', '', '', '', '', '2', '3', '04']
+
+    >>> _scan_duration('P01D') is None
+    True
+
+    """
+    # Accept a trailing new line for backward compatibility: the durations
+    # used to be matched by a regular expression ending in ``$``.
+    end = len(text) - 1 if text.endswith('\n') else len(text)
+
+    groups = ['', '', '', '', '', '', '', '', '']
+
+    position = 0
+    if position < end and text[position] in '+-':
+        groups[0] = text[position]
+        position += 1
+
+    if position == end or text[position] != 'P':
+        return None
+    position += 1
+
+    # Designators of the date part are followed by
+    # the designators of the time part.
+    designators = 'YMWD'
+    offset = 1
+    next_designator = 0
+
+    while position < end:
+        if text[position] == 'T' and offset == 1:
+            designators = 'HMS'
+            offset = 5
+            next_designator = 0
+            position += 1
+            continue
+
+        start = position
+
+        if text[position] == '0':
+            position += 1
+        elif '1' <= text[position] <= '9':
+            position += 1
+            while position < end and '0' <= text[position] <= '9':
+                position += 1
+        else:
+            return None
+
+        integer_end = position
+
+        if position < end and text[position] == '.':
+            position += 1
+            while position < end and '0' <= text[position] <= '9':
+                position += 1
+
+            if position == integer_end + 1:
+                return None
+
+        if position == end:
+            return None
+
+        designator = designators.find(text[position], next_designator)
+        if designator == -1:
+            return None
+
+        if offset + designator == 7:
+            groups[7] = text[start:integer_end]
+            groups[8] = text[integer_end + 1:position]
+        else:
+            groups[offset + designator] = text[start:position]
+
+        next_designator = designator + 1
+        position += 1
+
+    return groups
 
 
 def _duration_from_string(text: str) -> datetime.timedelta:
@@ -78,41 +150,29 @@ def _duration_from_string(text: str) -> datetime.timedelta:
     datetime.timedelta(-1)
 
     """
-    match = _DURATION_RE.match(text)
+    groups = _scan_duration(text)
 
-    if not match:
+    if groups is None:
         raise ValueError(
             'Failed to match the duration: {!r}'.format(
                 text))
 
-    sign_grp = match.group('sign')
+    (sign_grp, years_grp, months_grp, weeks_grp, days_grp, hours_grp,
+     minutes_grp, seconds_grp, fraction_grp) = groups
+
     if not sign_grp or sign_grp == '+':
         sign = 1
     else:
         sign = -1
 
-    years_grp = match.group('years')
     years = float(years_grp) if years_grp else 0.0
-
-    months_grp = match.group('months')
     months = float(months_grp) if months_grp else 0.0
-
-    weeks_grp = match.group('weeks')
     weeks = float(weeks_grp) if weeks_grp else 0.0
-
-    days_grp = match.group('days')
     days = float(days_grp) if days_grp else 0.0
-
-    hours_grp = match.group('hours')
     hours = float(hours_grp) if hours_grp else 0.0
-
-    minutes_grp = match.group('minutes')
     minutes = float(minutes_grp) if minutes_grp else 0.0
-
-    seconds_grp = match.group('seconds')
     seconds = int(seconds_grp) if seconds_grp else 0
 
-    fraction_grp = match.group('fraction')
     if not fraction_grp:
         microseconds = 0
 
@@ -182,8 +242,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, dict):
             errors.add(
-                '/'.join((
-                    ref, 'map_of_durations')),
+                (ref, 'map_of_durations'),
                 "Expected a dict, but got: {}".format(
                     type(value_0)))
         else:
@@ -199,8 +258,7 @@ def some_graph_from(
             for key_1, value_1 in value_0.items():
                 if not isinstance(key_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_durations')),
+                        (ref, 'map_of_durations'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_1)))
 
@@ -214,8 +272,7 @@ def some_graph_from(
                 )  # type: typing.Optional[datetime.timedelta]
                 if not isinstance(value_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_durations', repr(key_1))),
+                        (ref, 'map_of_durations', (key_1, )),
                         "Expected a string, but got: {}".format(
                             type(value_1)))
                 else:
@@ -224,8 +281,7 @@ def some_graph_from(
                             value_1)
                     except (ValueError, OverflowError) as err:
                         errors.add(
-                            '/'.join((
-                                ref, 'map_of_durations', repr(key_1))),
+                            (ref, 'map_of_durations', (key_1, )),
                             str(err))
 
                 if target_item_1 is not None:
@@ -244,3 +300,78 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse map_of_durations
+    ##
+
+    value_1 = value['map_of_durations']
+    if not isinstance(value_1, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_1, collections.OrderedDict):
+        target_1 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, datetime.timedelta]
+    else:
+        target_1 = (
+            dict()
+        )
+    for key_1, item_1 in value_1.items():
+        if not isinstance(key_1, str):
+            raise TypeError("Expected the key to be a str")
+        if not isinstance(item_1, str):
+            raise TypeError("Expected a string")
+        target_item_1 = _duration_from_string(
+            item_1)
+        target_1[key_1] = target_item_1
+    graph.map_of_durations = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse map_of_embeds
   ////
 
   if (!value.isMember("map_of_embeds")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_embeds");
   } else {
     const Json::Value& value_0 = value["map_of_embeds"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_embeds"),
+        parse::Ref(graph_ref, "map_of_embeds"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -111,10 +112,7 @@ void some_graph_from(
         const Json::Value& value_1 = *it_0;
         someembed_from(
           value_1,
-          std::string(ref)
-            .append("/map_of_embeds")
-            .append("/")
-            .append(it_0.name()),
+          parse::Ref(parse::Ref(graph_ref, "map_of_embeds"), it_0.name()),
           &target_0[it_0.name()],
           errors);
 
@@ -131,7 +129,7 @@ void some_graph_from(
 
 void someembed_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     SomeEmbed* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -163,8 +161,7 @@ void someembed_from(
         "Expected a bool, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_property"),
+        parse::Ref(ref, "some_property"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -2,10 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strings"
-)
+import "fmt"
 
 // SomeEmbedFromJSONable parses SomeEmbed from a JSONable value.
 //
@@ -17,7 +14,7 @@ import (
 //  * errors.Empty()
 func SomeEmbedFromJSONable(
 	value interface{},
-	ref string,
+	ref *Ref,
 	target *SomeEmbed,
 	errors *Errors) {
 
@@ -35,7 +32,7 @@ func SomeEmbedFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -51,17 +48,14 @@ func SomeEmbedFromJSONable(
 		"some_property"]
 
 	if !ok0 {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			"property is missing: some_property")
 	} else {
 		cast1, ok1 := value0.(bool)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_property"},
-					"/"),
+			errors.AddRef(
+				ref.Key("some_property"),
 				fmt.Sprintf(
 					"expected a bool, but got: %T",
 					value0))
@@ -113,6 +107,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse MapOfEmbeds
 	////
@@ -121,17 +117,14 @@ func SomeGraphFromJSONable(
 		"map_of_embeds"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: map_of_embeds")
 	} else {
 		cast1, ok1 := value0.(map[string]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_embeds"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("map_of_embeds"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value0))
@@ -141,10 +134,7 @@ func SomeGraphFromJSONable(
 				var item1 SomeEmbed
 				SomeEmbedFromJSONable(
 					cast1[k1],
-					strings.Join(
-						[]string{
-							ref, "map_of_embeds", k1},
-						"/"),
+					graphRef.Key("map_of_embeds").Key(k1),
 					&(item1),
 					errors)
 				target1[k1] = item1
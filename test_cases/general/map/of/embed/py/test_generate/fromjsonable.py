@@ -13,21 +13,20 @@ import some.graph.parse
 
 def _someembed_from(
         value: typing.Any,
-        ref: str,
-        target: some.graph.SomeEmbed,
+        ref: some.graph.parse.Ref,
         errors: some.graph.parse.Errors
-) -> None:
+) -> typing.Optional[some.graph.SomeEmbed]:
     """
     parses SomeEmbed from a JSONable value.
 
-    If ``errors``, the attributes of ``target`` have undefined values.
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
-    :param target: parsed ``value`` as SomeEmbed
+        reference to the value (e.g., a lazy reference path)
     :param errors: errors encountered during parsing
-    :return:
+    :return: parsed instance, or None if parsing it added to ``errors``
 
     """
     if not isinstance(value, dict):
@@ -35,7 +34,9 @@ def _someembed_from(
             ref,
             "Expected a dictionary, but got: {}".format(
                 type(value)))
-        return
+        return None
+
+    errors_count = errors.count()
 
     ##
     # Parse some_property
@@ -52,14 +53,19 @@ def _someembed_from(
     else:
         if not isinstance(value_0, bool):
             errors.add(
-                '/'.join((
-                    ref, 'some_property')),
+                (ref, 'some_property'),
                 "Expected a bool, but got: {}".format(
                     type(value_0)))
         else:
-            target.some_property = value_0
+            parsed_some_property = value_0
     if errors.full():
-        return
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.SomeEmbed(
+        some_property=parsed_some_property)
 
 
 def someembed_from(
@@ -78,12 +84,9 @@ def someembed_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_someembed()
-
-    _someembed_from(
+    target = _someembed_from(
         value=value,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -131,8 +134,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, dict):
             errors.add(
-                '/'.join((
-                    ref, 'map_of_embeds')),
+                (ref, 'map_of_embeds'),
                 "Expected a dict, but got: {}".format(
                     type(value_0)))
         else:
@@ -148,8 +150,7 @@ def some_graph_from(
             for key_1, value_1 in value_0.items():
                 if not isinstance(key_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_embeds')),
+                        (ref, 'map_of_embeds'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_1)))
 
@@ -161,16 +162,12 @@ def some_graph_from(
                 target_item_1 = (
                     None
                 )  # type: typing.Optional[some.graph.SomeEmbed]
-                target_2 = (
-                    some.graph.parse.placeholder_someembed()
-                )
-                _someembed_from(
+                target_2 = _someembed_from(
                     value_1,
-                    '/'.join((
-                        ref, 'map_of_embeds', repr(key_1))),
-                    target_2,
+                    (ref, 'map_of_embeds', (key_1, )),
                     errors)
-                target_item_1 = target_2
+                if target_2 is not None:
+                    target_item_1 = target_2
 
                 if target_item_1 is not None:
                     target_1[key_1] = target_item_1
@@ -188,3 +185,106 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _someembed_from_fast(
+        value: typing.Any
+) -> some.graph.SomeEmbed:
+    """
+    parses SomeEmbed optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse some_property
+    ##
+
+    value_1 = value['some_property']
+    if not isinstance(value_1, bool):
+        raise TypeError("Expected a bool")
+    parsed_some_property = value_1
+
+    return some.graph.SomeEmbed(
+        some_property=parsed_some_property)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse map_of_embeds
+    ##
+
+    value_1 = value['map_of_embeds']
+    if not isinstance(value_1, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_1, collections.OrderedDict):
+        target_1 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, some.graph.SomeEmbed]
+    else:
+        target_1 = (
+            dict()
+        )
+    for key_1, item_1 in value_1.items():
+        if not isinstance(key_1, str):
+            raise TypeError("Expected the key to be a str")
+        target_item_1 = _someembed_from_fast(
+            item_1)
+        target_1[key_1] = target_item_1
+    graph.map_of_embeds = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
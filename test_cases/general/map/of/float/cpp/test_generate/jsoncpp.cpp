@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse map_of_floats
   ////
 
   if (!value.isMember("map_of_floats")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_floats");
   } else {
     const Json::Value& value_0 = value["map_of_floats"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_floats"),
+        parse::Ref(graph_ref, "map_of_floats"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -114,10 +115,7 @@ void some_graph_from(
             "Expected a double, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_floats")
-              .append("/")
-              .append(it_0.name()),
+            parse::Ref(parse::Ref(graph_ref, "map_of_floats"), it_0.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -5,7 +5,6 @@ package somegraph
 import (
 	"fmt"
 	"math"
-	"strings"
 )
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
@@ -44,6 +43,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse MapOfIntegers
 	////
@@ -52,17 +53,14 @@ func SomeGraphFromJSONable(
 		"map_of_integers"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: map_of_integers")
 	} else {
 		cast1, ok1 := value0.(map[string]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_integers"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("map_of_integers"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value0))
@@ -71,20 +69,14 @@ func SomeGraphFromJSONable(
 			for k1 := range cast1 {
 				fcast2, ok2 := (cast1[k1]).(float64)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_integers", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_integers").Key(k1),
 						fmt.Sprintf(
 							"expected a float64, but got: %T",
 							cast1[k1]))
 				} else if fcast2 != math.Trunc(fcast2) {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_integers", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_integers").Key(k1),
 						fmt.Sprintf(
 							"expected a whole number, but got: %f",
 							fcast2))
@@ -93,11 +85,8 @@ func SomeGraphFromJSONable(
 				} else if fcast2 >= 9223372036854775808.0 ||
 					fcast2 < -9223372036854775808.0 {
 
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_integers", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_integers").Key(k1),
 						fmt.Sprintf(
 							"expected the value to fit into int64, but got an overflow: %f",
 							fcast2))
@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse map_of_maps
   ////
 
   if (!value.isMember("map_of_maps")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_maps");
   } else {
     const Json::Value& value_0 = value["map_of_maps"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_maps"),
+        parse::Ref(graph_ref, "map_of_maps"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -114,10 +115,7 @@ void some_graph_from(
             "Expected an object, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_maps")
-              .append("/")
-              .append(it_0.name()),
+            parse::Ref(parse::Ref(graph_ref, "map_of_maps"), it_0.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -132,12 +130,7 @@ void some_graph_from(
                 "Expected a bool, but got: ");
 
               errors->add(
-                std::string(ref)
-                  .append("/map_of_maps")
-                  .append("/")
-                  .append(it_0.name())
-                  .append("/")
-                  .append(it_1.name()),
+                parse::Ref(parse::Ref(parse::Ref(graph_ref, "map_of_maps"), it_0.name()), it_1.name()),
                 message(
                   expected_but_got,
                   strlen(expected_but_got),
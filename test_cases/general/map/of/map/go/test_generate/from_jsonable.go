@@ -2,10 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -43,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse MapOfMaps
 	////
@@ -51,17 +50,14 @@ func SomeGraphFromJSONable(
 		"map_of_maps"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: map_of_maps")
 	} else {
 		cast1, ok1 := value0.(map[string]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_maps"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("map_of_maps"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value0))
@@ -70,11 +66,8 @@ func SomeGraphFromJSONable(
 			for k1 := range cast1 {
 				cast2, ok2 := (cast1[k1]).(map[string]interface{})
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_maps", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_maps").Key(k1),
 						fmt.Sprintf(
 							"expected a map[string]interface{}, but got: %T",
 							cast1[k1]))
@@ -83,11 +76,8 @@ func SomeGraphFromJSONable(
 					for k2 := range cast2 {
 						cast3, ok3 := (cast2[k2]).(bool)
 						if !ok3 {
-							errors.Add(
-								strings.Join(
-									[]string{
-										ref, "map_of_maps", k1, k2},
-									"/"),
+							errors.AddRef(
+								graphRef.Key("map_of_maps").Key(k1).Key(k2),
 								fmt.Sprintf(
 									"expected a bool, but got: %T",
 									cast2[k2]))
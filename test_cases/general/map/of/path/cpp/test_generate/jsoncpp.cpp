@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse map_of_paths
   ////
 
   if (!value.isMember("map_of_paths")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_paths");
   } else {
     const Json::Value& value_0 = value["map_of_paths"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_paths"),
+        parse::Ref(graph_ref, "map_of_paths"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -114,10 +115,7 @@ void some_graph_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_paths")
-              .append("/")
-              .append(it_0.name()),
+            parse::Ref(parse::Ref(graph_ref, "map_of_paths"), it_0.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -84,13 +84,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse map_of_strings
   ////
 
   if (!value.isMember("map_of_strings")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_strings");
   } else {
     const Json::Value& value_0 = value["map_of_strings"];
@@ -99,8 +101,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_strings"),
+        parse::Ref(graph_ref, "map_of_strings"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -115,10 +116,7 @@ void some_graph_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_strings")
-              .append("/")
-              .append(it_0.name()),
+            parse::Ref(parse::Ref(graph_ref, "map_of_strings"), it_0.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -137,10 +135,7 @@ void some_graph_from(
               ", but got: ");
 
             errors->add(
-              std::string(ref)
-                .append("/map_of_strings")
-                .append("/")
-                .append(it_0.name()),
+              parse::Ref(parse::Ref(graph_ref, "map_of_strings"), it_0.name()),
               message(
                 expected_but_got,
                 strlen(expected_but_got),
@@ -5,7 +5,6 @@ package somegraph
 import (
 	"fmt"
 	"regexp"
-	"strings"
 )
 
 var pattern0 = regexp.MustCompile(
@@ -47,6 +46,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse MapOfStrings
 	////
@@ -55,17 +56,14 @@ func SomeGraphFromJSONable(
 		"map_of_strings"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: map_of_strings")
 	} else {
 		cast1, ok1 := value0.(map[string]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "map_of_strings"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("map_of_strings"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value0))
@@ -74,21 +72,15 @@ func SomeGraphFromJSONable(
 			for k1 := range cast1 {
 				cast2, ok2 := (cast1[k1]).(string)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "map_of_strings", k1},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("map_of_strings").Key(k1),
 						fmt.Sprintf(
 							"expected a string, but got: %T",
 							cast1[k1]))
 				} else {
 					if !pattern0.MatchString(cast2) {
-						errors.Add(
-							strings.Join(
-								[]string{
-									ref, "map_of_strings", k1},
-								"/"),
+						errors.AddRef(
+							graphRef.Key("map_of_strings").Key(k1),
 							fmt.Sprintf(
 								"expected to match ^hello.*$, but got: %s",
 								cast2))
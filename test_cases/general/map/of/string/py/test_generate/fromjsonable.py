@@ -51,8 +51,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, dict):
             errors.add(
-                '/'.join((
-                    ref, 'map_of_strings')),
+                (ref, 'map_of_strings'),
                 "Expected a dict, but got: {}".format(
                     type(value_0)))
         else:
@@ -68,8 +67,7 @@ def some_graph_from(
             for key_1, value_1 in value_0.items():
                 if not isinstance(key_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_strings')),
+                        (ref, 'map_of_strings'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_1)))
 
@@ -83,8 +81,7 @@ def some_graph_from(
                 )  # type: typing.Optional[str]
                 if not isinstance(value_1, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'map_of_strings', repr(key_1))),
+                        (ref, 'map_of_strings', (key_1, )),
                         "Expected a string, but got: {}".format(
                             type(value_1)))
                 else:
@@ -92,8 +89,7 @@ def some_graph_from(
                             r'^hello.*$',
                             value_1):
                         errors.add(
-                            '/'.join((
-                                ref, 'map_of_strings', repr(key_1))),
+                            (ref, 'map_of_strings', (key_1, )),
                             'Expected to match ^hello.*$, but got: {}'.format(
                                 value_1))
                     else:
@@ -115,3 +111,81 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse map_of_strings
+    ##
+
+    value_1 = value['map_of_strings']
+    if not isinstance(value_1, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_1, collections.OrderedDict):
+        target_1 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, str]
+    else:
+        target_1 = (
+            dict()
+        )
+    for key_1, item_1 in value_1.items():
+        if not isinstance(key_1, str):
+            raise TypeError("Expected the key to be a str")
+        if not isinstance(item_1, str):
+            raise TypeError("Expected a string")
+        if not re.match(
+                r'^hello.*$',
+                item_1):
+            raise ValueError('Expected to match ^hello.*$')
+        target_item_1 = item_1
+        target_1[key_1] = target_item_1
+    graph.map_of_strings = target_1
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
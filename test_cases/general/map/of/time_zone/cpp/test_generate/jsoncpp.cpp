@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse map_of_time_zones
   ////
 
   if (!value.isMember("map_of_time_zones")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: map_of_time_zones");
   } else {
     const Json::Value& value_0 = value["map_of_time_zones"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/map_of_time_zones"),
+        parse::Ref(graph_ref, "map_of_time_zones"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -114,10 +115,7 @@ void some_graph_from(
             "Expected a string, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/map_of_time_zones")
-              .append("/")
-              .append(it_0.name()),
+            parse::Ref(parse::Ref(graph_ref, "map_of_time_zones"), it_0.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
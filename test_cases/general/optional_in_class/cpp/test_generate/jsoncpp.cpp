@@ -83,14 +83,14 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Pre-allocate with_optionals
   ////
 
-  std::string with_optionals_ref;
-  with_optionals_ref.reserve(ref.size() + 15);
-  with_optionals_ref += ref;
-  with_optionals_ref += "/with_optionals";
+  const parse::Ref with_optionals_ref(
+    graph_ref, "with_optionals");
 
   if (value.isMember("with_optionals")) {
     const Json::Value& obj = value["with_optionals"];
@@ -122,36 +122,21 @@ void some_graph_from(
     return;
   }
 
-  // Keep the prefix fixed in this buffer so that
-  // it is copied as little as possible
-  std::string instance_ref;
-
   ////
   // Parse with_optionals
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += with_optionals_ref;
-  instance_ref += '/';
-
   if (value.isMember("with_optionals")) {
     const Json::Value& obj = value["with_optionals"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        with_optionals_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        with_optionals_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       WithOptional* instance(
-        target->with_optionals.at(it.name()).get());
+        target->with_optionals.at(id).get());
       with_optional_from(
         *it,
-        instance_ref,
+        parse::Ref(with_optionals_ref, id),
         instance,
         errors);
 
@@ -167,7 +152,7 @@ void some_graph_from(
 
 void with_optional_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     WithOptional* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -195,8 +180,7 @@ void with_optional_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_text"),
+        parse::Ref(ref, "some_text"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -4,7 +4,7 @@ package somegraph
 
 import (
 	"fmt"
-	"strings"
+	"sort"
 )
 
 // WithOptionalFromJSONable parses WithOptional from a JSONable value.
@@ -18,7 +18,7 @@ import (
 func WithOptionalFromJSONable(
 	value interface{},
 	id string,
-	ref string,
+	ref *Ref,
 	target *WithOptional,
 	errors *Errors) {
 
@@ -36,7 +36,7 @@ func WithOptionalFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -57,11 +57,8 @@ func WithOptionalFromJSONable(
 		var target0 string
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_text"},
-					"/"),
+			errors.AddRef(
+				ref.Key("some_text"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
@@ -115,11 +112,14 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Pre-allocate WithOptionals
 	////
 
-	withOptionalsRef := ref+"/with_optionals";
+	withOptionalsRef := graphRef.Key(
+		"with_optionals")
 	var withOptionalsOk bool
 	var withOptionalsValue interface{}
 	var withOptionalsMap map[string]interface{}
@@ -129,7 +129,7 @@ func SomeGraphFromJSONable(
 	if withOptionalsOk {
 		withOptionalsMap, ok = withOptionalsValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				withOptionalsRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -159,8 +159,7 @@ func SomeGraphFromJSONable(
 			WithOptionalFromJSONable(
 				value,
 				id,
-				strings.Join([]string{
-					withOptionalsRef, id}, "/"),
+				withOptionalsRef.Key(id),
 				target.WithOptionals[id],
 				errors)
 
@@ -177,4 +176,165 @@ func SomeGraphFromJSONable(
 	return
 }
 
+// SomeGraphFromJSONableParallel parses SomeGraph from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike SomeGraphFromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func SomeGraphFromJSONableParallel(
+	value interface{},
+	ref string,
+	target *SomeGraph,
+	errors *Errors,
+	workers int) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
+		errors.Add(
+			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate WithOptionals
+	////
+
+	withOptionalsRef := graphRef.Key(
+		"with_optionals")
+	var withOptionalsOk bool
+	var withOptionalsValue interface{}
+	var withOptionalsMap map[string]interface{}
+
+	withOptionalsValue, withOptionalsOk = cast[
+		"with_optionals"]
+	if withOptionalsOk {
+		withOptionalsMap, ok = withOptionalsValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				withOptionalsRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					withOptionalsValue));
+		} else {
+			target.WithOptionals = make(
+				map[string]*WithOptional)
+
+			for id := range withOptionalsMap {
+				target.WithOptionals[id] = &WithOptional{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse the instances of all the registries in parallel
+	////
+
+	// instanceJob identifies an instance to be parsed.
+	type instanceJob struct {
+		// indicates the registry in the order of the classes.
+		registry int
+
+		id string
+
+		value interface{}
+	}
+
+	jobs := make([]instanceJob, 0, len(withOptionalsMap))
+	for id, value := range withOptionalsMap {
+		jobs = append(jobs, instanceJob{registry: 0, id: id, value: value})
+	}
+
+	// Sort the instances so that the errors are deterministic.
+	sort.Slice(jobs, func(i, j int) bool {
+		if jobs[i].registry != jobs[j].registry {
+			return jobs[i].registry < jobs[j].registry
+		}
+		return jobs[i].id < jobs[j].id
+	})
+
+	chunks := parallelChunkCount(len(jobs), workers)
+	chunkErrors := make([][]Error, chunks)
+	workerErrors := make([]*Errors, workers)
+
+	forEachInParallel(chunks, workers, func(worker int, chunk int) {
+		instanceErrors := workerErrors[worker]
+		if instanceErrors == nil {
+			instanceErrors = NewErrors(errors.cap)
+			workerErrors[worker] = instanceErrors
+		}
+
+		start, end := parallelChunk(len(jobs), chunks, chunk)
+		for _, job := range jobs[start:end] {
+			switch job.registry {
+			case 0:
+				WithOptionalFromJSONable(
+					job.value,
+					job.id,
+					withOptionalsRef.Key(job.id),
+					target.WithOptionals[job.id],
+					instanceErrors)
+			}
+
+			chunkErrors[chunk] = append(
+				chunkErrors[chunk], instanceErrors.values...)
+			instanceErrors.values = instanceErrors.values[:0]
+
+			// The subsequent errors of the chunk would be ignored anyway.
+			if errors.cap != 0 &&
+				uint64(len(chunkErrors[chunk])) >= errors.cap {
+				break
+			}
+		}
+	})
+
+	// Merge the errors in the order of the instances.
+	for _, values := range chunkErrors {
+		for _, e := range values {
+			errors.Add(e.Ref, e.Message)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -80,4 +80,73 @@ func SomeGraphToJSONable(
 	return
 }
 
+// SomeGraphToJSONableParallel converts the instance to
+// a JSONable representation on a pool of at most workers goroutines.
+//
+// The instances of each registry are converted concurrently.
+//
+// SomeGraphToJSONableParallel requires:
+//  * instance != nil
+//  * workers > 0
+//
+// SomeGraphToJSONableParallel ensures:
+//  * (err == nil && target != nil) || (err != nil && target == nil)
+func SomeGraphToJSONableParallel(
+	instance *SomeGraph,
+	workers int) (
+	target map[string]interface{}, err error) {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	target = make(map[string]interface{})
+	defer func() {
+		if err != nil {
+			target = nil
+		}
+	}()
+	////
+	// Serialize instance registry of WithOptional
+	////
+
+	if len(instance.WithOptionals) > 0 {
+		ids := make([]string, 0, len(instance.WithOptionals))
+		for id, withOptionalInstance := range instance.WithOptionals {
+			if id != withOptionalInstance.ID {
+				err = fmt.Errorf(
+					"expected the instance of WithOptional to have the ID %s according to the registry, but got: %s",
+					id, withOptionalInstance.ID)
+				return
+			}
+
+			ids = append(ids, id)
+		}
+
+		jsonables := make([]map[string]interface{}, len(ids))
+		chunks := parallelChunkCount(len(ids), workers)
+		forEachInParallel(chunks, workers, func(worker int, chunk int) {
+			start, end := parallelChunk(len(ids), chunks, chunk)
+			for i := start; i < end; i++ {
+				jsonables[i] = WithOptionalToJSONable(
+					instance.WithOptionals[ids[i]])
+			}
+		})
+
+		targetWithOptionals := make(
+			map[string]interface{}, len(ids))
+		for i, id := range ids {
+			targetWithOptionals[id] = jsonables[i]
+		}
+
+		target["with_optionals"] = targetWithOptionals
+	}
+
+	return
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -11,9 +11,67 @@ import some.graph
 import some.graph.parse
 
 
+def _with_optional_construct(
+        value: typing.Any,
+        id: str,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.WithOptional]:
+    """
+    parses WithOptional from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    parsed_some_text = None  # type: typing.Optional[str]
+
+    ##
+    # Parse some_text
+    ##
+
+    value_0 = value.get(
+        'some_text',
+        None)
+
+    if value_0 is not None:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_text'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        else:
+            parsed_some_text = value_0
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.WithOptional(
+        id=id,
+        some_text=parsed_some_text)
+
+
 def _with_optional_from(
         value: typing.Any,
-        ref: str,
+        ref: some.graph.parse.Ref,
         target: some.graph.WithOptional,
         errors: some.graph.parse.Errors
 ) -> None:
@@ -24,7 +82,7 @@ def _with_optional_from(
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as WithOptional
     :param errors: errors encountered during parsing
     :return:
@@ -48,8 +106,7 @@ def _with_optional_from(
     if value_0 is not None:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'some_text')),
+                (ref, 'some_text'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
@@ -75,12 +132,10 @@ def with_optional_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_with_optional(id=id)
-
-    _with_optional_from(
+    target = _with_optional_construct(
         value=value,
+        id=id,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -122,8 +177,7 @@ def some_graph_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'with_optionals')),
+                (ref, 'with_optionals'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -132,10 +186,6 @@ def some_graph_from(
             else:
                 graph.with_optionals = dict()
 
-            with_optionals_registry = graph.with_optionals
-            for id in registry_value:
-                with_optionals_registry[id] = some.graph.parse.placeholder_with_optional(id=id)
-
     if errors.full():
         return None
 
@@ -150,14 +200,274 @@ def some_graph_from(
     if 'with_optionals' in value:
         registry_value = value['with_optionals']
         for id, instance_value in registry_value.items():
-            target_with_optional = graph.with_optionals[id]
-            target_with_optional.id = id
+            instance_with_optional = _with_optional_construct(
+                instance_value,
+                id,
+                (ref, 'with_optionals', (id, )),
+                errors)
+
+            if instance_with_optional is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_with_optional = some.graph.parse.placeholder_with_optional(id=id)
+
+            graph.with_optionals[id] = instance_with_optional
+
+            if errors.full():
+                return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _with_optional_construct_fast(
+        value: typing.Any,
+        id: str
+) -> some.graph.WithOptional:
+    """
+    parses WithOptional optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    parsed_some_text = None  # type: typing.Optional[str]
+
+    ##
+    # Parse some_text
+    ##
+
+    value_0 = value.get(
+        'some_text',
+        None)
+    if value_0 is not None:
+        if not isinstance(value_0, str):
+            raise TypeError("Expected a string")
+        parsed_some_text = value_0
+
+    return some.graph.WithOptional(
+        id=id,
+        some_text=parsed_some_text)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate with_optionals
+    ##
+
+    registry_value = value.get('with_optionals', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.with_optionals = collections.OrderedDict()
+        else:
+            graph.with_optionals = dict()
+
+    ##
+    # Parse with_optionals
+    ##
+
+    if 'with_optionals' in value:
+        registry_value = value['with_optionals']
+        for id, instance_value in registry_value.items():
+            graph.with_optionals[id] = _with_optional_construct_fast(
+                instance_value,
+                id)
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_with_optionals = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate with_optionals reusing the unchanged instances
+    ##
+
+    registry_value = value.get('with_optionals', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'with_optionals'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.with_optionals = collections.OrderedDict()
+            else:
+                graph.with_optionals = dict()
+
+            with_optionals_registry = graph.with_optionals
+            previous_with_optionals = previous.with_optionals
+
+            previous_registry_value = previous_value.get(
+                'with_optionals', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_with_optional = previous_with_optionals.get(id, None)
+                if (target_with_optional is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_with_optional = some.graph.parse.placeholder_with_optional(id=id)
+                    changed_with_optionals.add(id)
+
+                with_optionals_registry[id] = target_with_optional
+
+    changed_with_optionals.update(
+        id for id in previous.with_optionals
+        if id not in graph.with_optionals)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse the new and changed with_optionals
+    ##
+
+    registry_value = value.get('with_optionals', None)
+    if registry_value is not None and changed_with_optionals:
+        for id, instance_value in registry_value.items():
+            if id not in changed_with_optionals:
+                continue
 
             _with_optional_from(
                 instance_value,
-                '/'.join((
-                    ref, 'with_optionals', repr(id))),
-                target_with_optional,
+                (ref, 'with_optionals', (id, )),
+                graph.with_optionals[id],
                 errors)
 
             if errors.full():
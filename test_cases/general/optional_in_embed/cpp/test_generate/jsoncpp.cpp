@@ -83,20 +83,21 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_property
   ////
 
   if (!value.isMember("some_property")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_property");
   } else {
     const Json::Value& value_0 = value["some_property"];
     with_optional_from(
       value_0,
-      std::string(ref)
-        .append("/some_property"),
+      parse::Ref(graph_ref, "some_property"),
       &target->some_property,
       errors);
   }
@@ -107,7 +108,7 @@ void some_graph_from(
 
 void with_optional_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     WithOptional* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -135,8 +136,7 @@ void with_optional_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_text"),
+        parse::Ref(ref, "some_text"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -33,13 +33,13 @@ void some_graph_from(
  * parses WithOptional from a JSON value.
  *
  * @param [in] value to be parsed
- * @param ref reference to the value (e.g., a reference path)
+ * @param ref lazy reference to the value (e.g., a reference path)
  * @param [out] target parsed data
  * @param [out] errors encountered during parsing
  */
 void with_optional_from(
   const Json::Value& value,
-  std::string ref,
+  const parse::Ref& ref,
   WithOptional* target,
   parse::Errors* errors);
 
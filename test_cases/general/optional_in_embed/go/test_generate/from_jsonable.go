@@ -2,10 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strings"
-)
+import "fmt"
 
 // WithOptionalFromJSONable parses WithOptional from a JSONable value.
 //
@@ -17,7 +14,7 @@ import (
 //  * errors.Empty()
 func WithOptionalFromJSONable(
 	value interface{},
-	ref string,
+	ref *Ref,
 	target *WithOptional,
 	errors *Errors) {
 
@@ -35,7 +32,7 @@ func WithOptionalFromJSONable(
 
 	cast, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -54,11 +51,8 @@ func WithOptionalFromJSONable(
 		var target0 string
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_text"},
-					"/"),
+			errors.AddRef(
+				ref.Key("some_text"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
@@ -112,6 +106,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeProperty
 	////
@@ -120,16 +116,13 @@ func SomeGraphFromJSONable(
 		"some_property"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_property")
 	} else {
 		WithOptionalFromJSONable(
 			value0,
-			strings.Join(
-				[]string{
-					ref, "some_property"},
-				"/"),
+			graphRef.Key("some_property"),
 			&(target.SomeProperty),
 			errors)
 	}
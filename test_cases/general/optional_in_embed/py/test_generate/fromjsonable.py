@@ -12,21 +12,20 @@ import some.graph.parse
 
 def _with_optional_from(
         value: typing.Any,
-        ref: str,
-        target: some.graph.WithOptional,
+        ref: some.graph.parse.Ref,
         errors: some.graph.parse.Errors
-) -> None:
+) -> typing.Optional[some.graph.WithOptional]:
     """
     parses WithOptional from a JSONable value.
 
-    If ``errors``, the attributes of ``target`` have undefined values.
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
-    :param target: parsed ``value`` as WithOptional
+        reference to the value (e.g., a lazy reference path)
     :param errors: errors encountered during parsing
-    :return:
+    :return: parsed instance, or None if parsing it added to ``errors``
 
     """
     if not isinstance(value, dict):
@@ -34,7 +33,11 @@ def _with_optional_from(
             ref,
             "Expected a dictionary, but got: {}".format(
                 type(value)))
-        return
+        return None
+
+    errors_count = errors.count()
+
+    parsed_some_text = None  # type: typing.Optional[str]
 
     ##
     # Parse some_text
@@ -47,14 +50,19 @@ def _with_optional_from(
     if value_0 is not None:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'some_text')),
+                (ref, 'some_text'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
-            target.some_text = value_0
+            parsed_some_text = value_0
     if errors.full():
-        return
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.WithOptional(
+        some_text=parsed_some_text)
 
 
 def with_optional_from(
@@ -73,12 +81,9 @@ def with_optional_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_with_optional()
-
-    _with_optional_from(
+    target = _with_optional_from(
         value=value,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -124,16 +129,12 @@ def some_graph_from(
             ref,
             'Property is missing: some_property')
     else:
-        target_1 = (
-            some.graph.parse.placeholder_with_optional()
-        )
-        _with_optional_from(
+        target_1 = _with_optional_from(
             value_0,
-            '/'.join((
-                ref, 'some_property')),
-            target_1,
+            (ref, 'some_property'),
             errors)
-        graph.some_property = target_1
+        if target_1 is not None:
+            graph.some_property = target_1
 
     if errors.full():
         return None
@@ -142,3 +143,95 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _with_optional_from_fast(
+        value: typing.Any
+) -> some.graph.WithOptional:
+    """
+    parses WithOptional optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    parsed_some_text = None  # type: typing.Optional[str]
+
+    ##
+    # Parse some_text
+    ##
+
+    value_0 = value.get(
+        'some_text',
+        None)
+    if value_0 is not None:
+        if not isinstance(value_0, str):
+            raise TypeError("Expected a string")
+        parsed_some_text = value_0
+
+    return some.graph.WithOptional(
+        some_text=parsed_some_text)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse some_property
+    ##
+
+    graph.some_property = _with_optional_from_fast(
+        value['some_property'])
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -9,7 +9,6 @@
 #include <iomanip>
 #include <limits>
 #include <memory>
-#include <regex>
 #include <sstream>
 #include <stdexcept>
 #include <string>
@@ -36,19 +35,6 @@ std::string message(const char* cc, size_t cc_size, std::string s) {
   return result;
 }
 
-namespace re {
-const std::regex kDuration(
-  "^(\\+|-)?P(((0|[1-9][0-9]*)(\\.[0-9]+)?)Y)?"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)M)?"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)W)?"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)D)?"
-  "(T"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)H)?"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)M)?"
-  "(((0|[1-9][0-9]*)(\\.([0-9]+))?)S)?"
-  ")?$");
-}  // namespace re
-
 /**
  * adds the left and the right and checks for the overflow.
  *
@@ -86,6 +72,133 @@ rep_t add_rep_double(rep_t left, double right, bool* overflows) {
   return rightRep + left;
 }
 
+/**
+ * represents the components of a duration in ISO 8601 format
+ * as they are written in the text.
+ *
+ * The components which are not specified are empty.
+ */
+struct DurationParts {
+  std::string sign;
+  std::string years;
+  std::string months;
+  std::string weeks;
+  std::string days;
+  std::string hours;
+  std::string minutes;
+  std::string seconds;
+  std::string fraction;
+};
+
+/**
+ * scans the duration in ISO 8601 format in a single pass.
+ *
+ * @param[in] s string to scan
+ * @param[out] parts components of the duration
+ * @return true if s conforms to the format
+ */
+bool scan_duration(const std::string& s, DurationParts* parts) {
+  size_t i = 0;
+  if (i < s.size() and (s[i] == '+' or s[i] == '-')) {
+    parts->sign = s.substr(i, 1);
+    ++i;
+  }
+
+  if (i == s.size() or s[i] != 'P') {
+    return false;
+  }
+  ++i;
+
+  // Designators of the date part are followed by
+  // the designators of the time part.
+  const char* designators = "YMWD";
+  size_t offset = 0;
+  size_t next = 0;
+
+  while (i < s.size()) {
+    if (s[i] == 'T' and offset == 0) {
+      designators = "HMS";
+      offset = 4;
+      next = 0;
+      ++i;
+      continue;
+    }
+
+    const size_t start = i;
+
+    if (s[i] == '0') {
+      ++i;
+    } else if (s[i] >= '1' and s[i] <= '9') {
+      ++i;
+      while (i < s.size() and s[i] >= '0' and s[i] <= '9') {
+        ++i;
+      }
+    } else {
+      return false;
+    }
+
+    const size_t integer_end = i;
+
+    if (i < s.size() and s[i] == '.') {
+      ++i;
+      while (i < s.size() and s[i] >= '0' and s[i] <= '9') {
+        ++i;
+      }
+
+      if (i == integer_end + 1) {
+        return false;
+      }
+    }
+
+    if (i == s.size()) {
+      return false;
+    }
+
+    size_t designator = next;
+    while (designators[designator] != '\0' and
+        designators[designator] != s[i]) {
+      ++designator;
+    }
+
+    if (designators[designator] == '\0') {
+      return false;
+    }
+
+    switch (offset + designator) {
+      case 0:
+        parts->years = s.substr(start, i - start);
+        break;
+      case 1:
+        parts->months = s.substr(start, i - start);
+        break;
+      case 2:
+        parts->weeks = s.substr(start, i - start);
+        break;
+      case 3:
+        parts->days = s.substr(start, i - start);
+        break;
+      case 4:
+        parts->hours = s.substr(start, i - start);
+        break;
+      case 5:
+        parts->minutes = s.substr(start, i - start);
+        break;
+      default:
+        parts->seconds = s.substr(start, integer_end - start);
+        if (i > integer_end) {
+          parts->fraction = s.substr(
+            integer_end + 1, i - integer_end - 1);
+        }
+        break;
+    }
+
+    next = designator + 1;
+    ++i;
+  }
+
+  return true;
+}
+
 /**
  * parses the duration from a string.
  *
@@ -103,8 +216,8 @@ rep_t add_rep_double(rep_t left, double right, bool* overflows) {
 std::chrono::nanoseconds duration_from_string(
     const std::string& s,
     std::string* error) {
-  std::smatch mtch;
-  const bool matched = std::regex_match(s, mtch, re::kDuration);
+  DurationParts parts;
+  const bool matched = scan_duration(s, &parts);
 
   if (!matched) {
     std::stringstream sserr;
@@ -119,7 +232,7 @@ std::chrono::nanoseconds duration_from_string(
   // Extract nanoseconds
   ////
 
-  const std::string nanoseconds_str = mtch[31];
+  const std::string& nanoseconds_str = parts.fraction;
   rep_t nanoseconds;
   if (nanoseconds_str.size() == 0) {
     // No nanoseconds specified
@@ -162,23 +275,23 @@ std::chrono::nanoseconds duration_from_string(
   // Extract all the other interval counts
   ////
 
-  const std::string sign_str = mtch[1];
+  const std::string& sign_str = parts.sign;
   const rep_t sign = (sign_str.empty() or sign_str == "+") ? 1 : -1;
 
   const double years(
-    (mtch[3].length() == 0) ? 0.0 : std::stod(mtch[3]));
+    parts.years.empty() ? 0.0 : std::stod(parts.years));
   const double months(
-    (mtch[7].length() == 0) ? 0.0 : std::stod(mtch[7]));
+    parts.months.empty() ? 0.0 : std::stod(parts.months));
   const double weeks(
-    (mtch[11].length() == 0) ? 0.0 : std::stod(mtch[11]));
+    parts.weeks.empty() ? 0.0 : std::stod(parts.weeks));
   const double days(
-    (mtch[15].length() == 0) ? 0.0 : std::stod(mtch[15]));
+    parts.days.empty() ? 0.0 : std::stod(parts.days));
   const double hours(
-    (mtch[20].length() == 0) ? 0.0 : std::stod(mtch[20]));
+    parts.hours.empty() ? 0.0 : std::stod(parts.hours));
   const double minutes(
-    (mtch[24].length() == 0) ? 0.0 : std::stod(mtch[24]));
+    parts.minutes.empty() ? 0.0 : std::stod(parts.minutes));
   const rep_t seconds(
-    (mtch[29].length() == 0) ? 0 : std::stol(mtch[29]));
+    parts.seconds.empty() ? 0 : std::stol(parts.seconds));
 
   ////
   // Sum
@@ -204,7 +317,7 @@ std::chrono::nanoseconds duration_from_string(
   }
   sum += seconds_as_ns;
 
-  bool overflows;
+  bool overflows = false;
 
   sum = add_rep_double(
     sum, minutes * 6e10, &overflows);
@@ -269,6 +382,206 @@ std::chrono::nanoseconds duration_from_string(
   return std::chrono::nanoseconds(sum);
 }
 
+/**
+ * parses the zero-padded decimal digits as an integer.
+ *
+ * @param[in] s string containing the digits
+ * @param[in] start position of the first digit
+ * @param[in] end position after the last digit
+ * @param[out] value parsed integer
+ * @return true if all the characters are ASCII digits
+ */
+bool fixed_digits(const std::string& s, size_t start, size_t end, int* value) {
+  int result = 0;
+  for (size_t i = start; i < end; ++i) {
+    if (s[i] < '0' or s[i] > '9') {
+      return false;
+    }
+    result = result * 10 + (s[i] - '0');
+  }
+
+  *value = result;
+  return true;
+}
+
+/**
+ * computes the number of days in the month of the Gregorian calendar.
+ *
+ * @param[in] year of the month
+ * @param[in] month starting at 1
+ * @return number of days
+ */
+int days_in_month(int year, int month) {
+  static const int kDays[] = {31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
+
+  if (month == 2 and
+      year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) {
+    return 29;
+  }
+
+  return kDays[month - 1];
+}
+
+/**
+ * sets the day of the week and the day of the year as strptime does.
+ *
+ * @param[in, out] t date whose year, month and day are set
+ */
+void set_wday_and_yday(struct tm* t) {
+  const int year = t->tm_year + 1900;
+
+  int yday = t->tm_mday - 1;
+  for (int month = 1; month < t->tm_mon + 1; ++month) {
+    yday += days_in_month(year, month);
+  }
+  t->tm_yday = yday;
+
+  // Sakamoto's method
+  static const int kOffsets[] = {0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4};
+  const int y = (t->tm_mon < 2) ? year - 1 : year;
+  t->tm_wday = (
+    y + y / 4 - y / 100 + y / 400 + kOffsets[t->tm_mon] + t->tm_mday) % 7;
+}
+
+/**
+ * parses the string in the format "%Y-%m-%d"
+ * if the string is zero-padded and all its fields are within
+ * the regular ranges.
+ *
+ * @param[in] s string to be parsed
+ * @param[out] t parsed date/time; only the fields of the format are set
+ * @return true if parsed; otherwise, s needs to be parsed with strptime
+ */
+bool strptime_fixed_Y_45_m_45_d(
+    const std::string& s,
+    struct tm* t) {
+  if (s.size() != 10 or
+      s.compare(4, 1, "-") != 0 or
+      s.compare(7, 1, "-") != 0) {
+    return false;
+  }
+
+  int year;
+  int month;
+  int day;
+  if (not fixed_digits(s, 0, 4, &year) or
+      not fixed_digits(s, 5, 7, &month) or
+      not fixed_digits(s, 8, 10, &day)) {
+    return false;
+  }
+
+  if (year < 1 or
+      month < 1 or
+      month > 12 or
+      day < 1 or
+      day > days_in_month(year, month)) {
+    return false;
+  }
+
+  t->tm_year = year - 1900;
+  t->tm_mon = month - 1;
+  t->tm_mday = day;
+  set_wday_and_yday(t);
+  return true;
+}
+
+/**
+ * parses the string in the format "%Y-%m-%dT%H:%M:%SZ"
+ * if the string is zero-padded and all its fields are within
+ * the regular ranges.
+ *
+ * @param[in] s string to be parsed
+ * @param[out] t parsed date/time; only the fields of the format are set
+ * @return true if parsed; otherwise, s needs to be parsed with strptime
+ */
+bool strptime_fixed_Y_45_m_45_d_84_H_58_M_58_S_90(
+    const std::string& s,
+    struct tm* t) {
+  if (s.size() != 20 or
+      s.compare(4, 1, "-") != 0 or
+      s.compare(7, 1, "-") != 0 or
+      s.compare(10, 1, "T") != 0 or
+      s.compare(13, 1, ":") != 0 or
+      s.compare(16, 1, ":") != 0 or
+      s.compare(19, 1, "Z") != 0) {
+    return false;
+  }
+
+  int year;
+  int month;
+  int day;
+  int hour;
+  int minute;
+  int second;
+  if (not fixed_digits(s, 0, 4, &year) or
+      not fixed_digits(s, 5, 7, &month) or
+      not fixed_digits(s, 8, 10, &day) or
+      not fixed_digits(s, 11, 13, &hour) or
+      not fixed_digits(s, 14, 16, &minute) or
+      not fixed_digits(s, 17, 19, &second)) {
+    return false;
+  }
+
+  if (year < 1 or
+      month < 1 or
+      month > 12 or
+      day < 1 or
+      day > days_in_month(year, month) or
+      hour > 23 or
+      minute > 59 or
+      second > 59) {
+    return false;
+  }
+
+  t->tm_year = year - 1900;
+  t->tm_mon = month - 1;
+  t->tm_mday = day;
+  t->tm_hour = hour;
+  t->tm_min = minute;
+  t->tm_sec = second;
+  set_wday_and_yday(t);
+  return true;
+}
+
+/**
+ * parses the string in the format "%H:%M:%S"
+ * if the string is zero-padded and all its fields are within
+ * the regular ranges.
+ *
+ * @param[in] s string to be parsed
+ * @param[out] t parsed date/time; only the fields of the format are set
+ * @return true if parsed; otherwise, s needs to be parsed with strptime
+ */
+bool strptime_fixed_H_58_M_58_S(
+    const std::string& s,
+    struct tm* t) {
+  if (s.size() != 8 or
+      s.compare(2, 1, ":") != 0 or
+      s.compare(5, 1, ":") != 0) {
+    return false;
+  }
+
+  int hour;
+  int minute;
+  int second;
+  if (not fixed_digits(s, 0, 2, &hour) or
+      not fixed_digits(s, 3, 5, &minute) or
+      not fixed_digits(s, 6, 8, &second)) {
+    return false;
+  }
+
+  if (hour > 23 or
+      minute > 59 or
+      second > 59) {
+    return false;
+  }
+
+  t->tm_hour = hour;
+  t->tm_min = minute;
+  t->tm_sec = second;
+  return true;
+}
+
 /**
  * converts a JSON value type to a human-readable string representation.
  *
@@ -320,14 +633,14 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Pre-allocate empties
   ////
 
-  std::string empties_ref;
-  empties_ref.reserve(ref.size() + 8);
-  empties_ref += ref;
-  empties_ref += "/empties";
+  const parse::Ref empties_ref(
+    graph_ref, "empties");
 
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
@@ -359,36 +672,21 @@ void some_graph_from(
     return;
   }
 
-  // Keep the prefix fixed in this buffer so that
-  // it is copied as little as possible
-  std::string instance_ref;
-
   ////
   // Parse empties
   ////
 
-  // clear() does not shrink the reserved memory,
-  // see https://en.cppreference.com/w/cpp/string/basic_string/clear
-  instance_ref.clear();
-  instance_ref += empties_ref;
-  instance_ref += '/';
-
   if (value.isMember("empties")) {
     const Json::Value& obj = value["empties"];
 
     for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
-      instance_ref.reserve(
-        empties_ref.size() + 1 + it.name().size());
-      instance_ref.resize(
-        empties_ref.size() + 1);
-      instance_ref.append(
-        it.name());
+      const std::string id = it.name();
 
       Empty* instance(
-        target->empties.at(it.name()).get());
+        target->empties.at(id).get());
       empty_from(
         *it,
-        instance_ref,
+        parse::Ref(empties_ref, id),
         instance,
         errors);
 
@@ -413,8 +711,7 @@ void some_graph_from(
         "Expected an array, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_array"),
+        parse::Ref(graph_ref, "optional_array"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -430,10 +727,7 @@ void some_graph_from(
             "Expected an int64, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/optional_array")
-              .append("/")
-              .append(std::to_string(i_0)),
+            parse::Ref(parse::Ref(graph_ref, "optional_array"), i_0),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -466,8 +760,7 @@ void some_graph_from(
         "Expected a bool, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_boolean"),
+        parse::Ref(graph_ref, "optional_boolean"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -492,8 +785,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_date"),
+        parse::Ref(graph_ref, "optional_date"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -502,26 +794,29 @@ void some_graph_from(
     } else {
       const std::string cast_3 = value_3.asString();
       struct tm tm_3 = tm{0};
-      char* ret_3 = strptime(
-        cast_3.c_str(),
-        "%Y-%m-%d",
-        &tm_3);
+      if (strptime_fixed_Y_45_m_45_d(cast_3, &tm_3)) {
+        target->optional_date = tm_3;
+      } else {
+        char* ret_3 = strptime(
+          cast_3.c_str(),
+          "%Y-%m-%d",
+          &tm_3);
 
-      if (ret_3 == nullptr or *ret_3 != '\0') {
-        constexpr auto expected_but_got(
-          "Expected to strptime "
-          "%Y-%m-%d"
-          ", but got: ");
+        if (ret_3 == nullptr or *ret_3 != '\0') {
+          constexpr auto expected_but_got(
+            "Expected to strptime "
+            "%Y-%m-%d"
+            ", but got: ");
 
-        errors->add(
-          std::string(ref)
-            .append("/optional_date"),
-          message(
-            expected_but_got,
-            strlen(expected_but_got),
-            cast_3));
-      } else {
-        target->optional_date = tm_3;
+          errors->add(
+            parse::Ref(graph_ref, "optional_date"),
+            message(
+              expected_but_got,
+              strlen(expected_but_got),
+              cast_3));
+        } else {
+          target->optional_date = tm_3;
+        }
       }
     }
   }
@@ -540,8 +835,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_datetime"),
+        parse::Ref(graph_ref, "optional_datetime"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -550,26 +844,29 @@ void some_graph_from(
     } else {
       const std::string cast_4 = value_4.asString();
       struct tm tm_4 = tm{0};
-      char* ret_4 = strptime(
-        cast_4.c_str(),
-        "%Y-%m-%dT%H:%M:%SZ",
-        &tm_4);
+      if (strptime_fixed_Y_45_m_45_d_84_H_58_M_58_S_90(cast_4, &tm_4)) {
+        target->optional_datetime = tm_4;
+      } else {
+        char* ret_4 = strptime(
+          cast_4.c_str(),
+          "%Y-%m-%dT%H:%M:%SZ",
+          &tm_4);
 
-      if (ret_4 == nullptr or *ret_4 != '\0') {
-        constexpr auto expected_but_got(
-          "Expected to strptime "
-          "%Y-%m-%dT%H:%M:%SZ"
-          ", but got: ");
+        if (ret_4 == nullptr or *ret_4 != '\0') {
+          constexpr auto expected_but_got(
+            "Expected to strptime "
+            "%Y-%m-%dT%H:%M:%SZ"
+            ", but got: ");
 
-        errors->add(
-          std::string(ref)
-            .append("/optional_datetime"),
-          message(
-            expected_but_got,
-            strlen(expected_but_got),
-            cast_4));
-      } else {
-        target->optional_datetime = tm_4;
+          errors->add(
+            parse::Ref(graph_ref, "optional_datetime"),
+            message(
+              expected_but_got,
+              strlen(expected_but_got),
+              cast_4));
+        } else {
+          target->optional_datetime = tm_4;
+        }
       }
     }
   }
@@ -588,8 +885,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_duration"),
+        parse::Ref(graph_ref, "optional_duration"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -606,8 +902,7 @@ void some_graph_from(
           "Invalid duration: ");
 
         errors->add(
-          std::string(ref)
-            .append("/optional_duration"),
+          parse::Ref(graph_ref, "optional_duration"),
           message(
             invalid_duration,
             strlen(invalid_duration),
@@ -632,8 +927,7 @@ void some_graph_from(
         "Expected a double, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_float"),
+        parse::Ref(graph_ref, "optional_float"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -658,8 +952,7 @@ void some_graph_from(
         "Expected an int64, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_integer"),
+        parse::Ref(graph_ref, "optional_integer"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -685,8 +978,7 @@ void some_graph_from(
         "Expected an object, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_map"),
+        parse::Ref(graph_ref, "optional_map"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -701,10 +993,7 @@ void some_graph_from(
             "Expected an int64, but got: ");
 
           errors->add(
-            std::string(ref)
-              .append("/optional_map")
-              .append("/")
-              .append(it_8.name()),
+            parse::Ref(parse::Ref(graph_ref, "optional_map"), it_8.name()),
             message(
               expected_but_got,
               strlen(expected_but_got),
@@ -735,8 +1024,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_path"),
+        parse::Ref(graph_ref, "optional_path"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -763,8 +1051,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_string"),
+        parse::Ref(graph_ref, "optional_string"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -789,8 +1076,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_time"),
+        parse::Ref(graph_ref, "optional_time"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -799,26 +1085,29 @@ void some_graph_from(
     } else {
       const std::string cast_12 = value_12.asString();
       struct tm tm_12 = tm{0};
-      char* ret_12 = strptime(
-        cast_12.c_str(),
-        "%H:%M:%S",
-        &tm_12);
+      if (strptime_fixed_H_58_M_58_S(cast_12, &tm_12)) {
+        target->optional_time = tm_12;
+      } else {
+        char* ret_12 = strptime(
+          cast_12.c_str(),
+          "%H:%M:%S",
+          &tm_12);
 
-      if (ret_12 == nullptr or *ret_12 != '\0') {
-        constexpr auto expected_but_got(
-          "Expected to strptime "
-          "%H:%M:%S"
-          ", but got: ");
+        if (ret_12 == nullptr or *ret_12 != '\0') {
+          constexpr auto expected_but_got(
+            "Expected to strptime "
+            "%H:%M:%S"
+            ", but got: ");
 
-        errors->add(
-          std::string(ref)
-            .append("/optional_time"),
-          message(
-            expected_but_got,
-            strlen(expected_but_got),
-            cast_12));
-      } else {
-        target->optional_time = tm_12;
+          errors->add(
+            parse::Ref(graph_ref, "optional_time"),
+            message(
+              expected_but_got,
+              strlen(expected_but_got),
+              cast_12));
+        } else {
+          target->optional_time = tm_12;
+        }
       }
     }
   }
@@ -837,8 +1126,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_time_zone"),
+        parse::Ref(graph_ref, "optional_time_zone"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -863,8 +1151,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/optional_reference"),
+        parse::Ref(graph_ref, "optional_reference"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -879,8 +1166,7 @@ void some_graph_from(
           " not found: ");
 
         errors->add(
-          std::string(ref)
-            .append("/optional_reference"),
+          parse::Ref(graph_ref, "optional_reference"),
           message(
             reference_not_found,
             strlen(reference_not_found),
@@ -903,8 +1189,7 @@ void some_graph_from(
     const Json::Value& value_15 = value["optional_embed"];
     some_embed_from(
       value_15,
-      std::string(ref)
-        .append("/optional_embed"),
+      parse::Ref(graph_ref, "optional_embed"),
       &(*target->optional_embed),
       errors);
   }
@@ -1025,7 +1310,7 @@ std::string duration_to_string(const std::chrono::nanoseconds& d) {
 
 void empty_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     Empty* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -1045,7 +1330,7 @@ void empty_from(
 
 void some_embed_from(
     const Json::Value& value,
-    std::string ref,
+    const parse::Ref& ref,
     SomeEmbed* target,
     parse::Errors* errors) {
   if (!value.isObject()) {
@@ -5,23 +5,123 @@ package somegraph
 import (
 	"fmt"
 	"math"
-	"regexp"
+	"sort"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 )
 
-var durationRe = regexp.MustCompile(
-	`^(-|\+)?P`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)Y)?`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)M)?`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)W)?`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)D)?`+
-	`(T`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)H)?`+
-	`(((0|[1-9][0-9]*)(\.[0-9]+)?)M)?`+
-	`(((0|[1-9][0-9]*)(\.([0-9]+))?)S)?`+
-	`)?$`)
+// durationParts represents the components of a duration in ISO 8601
+// format as they are written in the text.
+//
+// The components which are not specified are empty.
+type durationParts struct {
+	sign     string
+	years    string
+	months   string
+	weeks    string
+	days     string
+	hours    string
+	minutes  string
+	seconds  string
+	fraction string
+}
+
+// scanDuration splits the duration in ISO 8601 format into its
+// components in a single pass.
+//
+// ok is false if s does not conform to the format.
+func scanDuration(s string) (parts durationParts, ok bool) {
+	i := 0
+	if i < len(s) && (s[i] == '+' || s[i] == '-') {
+		parts.sign = s[i : i+1]
+		i++
+	}
+
+	if i == len(s) || s[i] != 'P' {
+		return durationParts{}, false
+	}
+	i++
+
+	// Designators of the date part are followed by
+	// the designators of the time part.
+	designators := "YMWD"
+	offset := 0
+	next := 0
+
+	for i < len(s) {
+		if s[i] == 'T' && offset == 0 {
+			designators = "HMS"
+			offset = 4
+			next = 0
+			i++
+			continue
+		}
+
+		start := i
+
+		switch {
+		case s[i] == '0':
+			i++
+		case s[i] >= '1' && s[i] <= '9':
+			i++
+			for i < len(s) && s[i] >= '0' && s[i] <= '9' {
+				i++
+			}
+		default:
+			return durationParts{}, false
+		}
+
+		integerEnd := i
+
+		if i < len(s) && s[i] == '.' {
+			i++
+			for i < len(s) && s[i] >= '0' && s[i] <= '9' {
+				i++
+			}
+
+			if i == integerEnd+1 {
+				return durationParts{}, false
+			}
+		}
+
+		if i == len(s) {
+			return durationParts{}, false
+		}
+
+		designator := strings.IndexByte(designators[next:], s[i])
+		if designator == -1 {
+			return durationParts{}, false
+		}
+		designator += next
+
+		switch offset + designator {
+		case 0:
+			parts.years = s[start:i]
+		case 1:
+			parts.months = s[start:i]
+		case 2:
+			parts.weeks = s[start:i]
+		case 3:
+			parts.days = s[start:i]
+		case 4:
+			parts.hours = s[start:i]
+		case 5:
+			parts.minutes = s[start:i]
+		default:
+			parts.seconds = s[start:integerEnd]
+			if i > integerEnd {
+				parts.fraction = s[integerEnd+1 : i]
+			}
+		}
+
+		next = designator + 1
+		i++
+	}
+
+	return parts, true
+}
 
 // addDuration adds right nanoseconds to the left duration.
 //
@@ -66,9 +166,9 @@ func addDuration(
 // Since time.Duration is measured in nanoseconds, beware of overflow
 // issues due to finite representation of integers.
 func durationFromString(s string) (d time.Duration, err error) {
-	m := durationRe.FindStringSubmatch(s)
+	parts, ok := scanDuration(s)
 
-	if len(m) == 0 {
+	if !ok {
 		err = fmt.Errorf("failed to match the duration pattern")
 		return
 	}
@@ -81,60 +181,60 @@ func durationFromString(s string) (d time.Duration, err error) {
 	var seconds, nanoseconds int64
 
 	sign := int64(1)
-	if len(m[1]) > 0 && m[1][0] == '-' {
+	if len(parts.sign) > 0 && parts.sign[0] == '-' {
 		sign = -1
 	}
 
-	if len(m[3]) > 0 {
-		years, err = strconv.ParseFloat(m[3], 64)
+	if len(parts.years) > 0 {
+		years, err = strconv.ParseFloat(parts.years, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the years: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[7]) > 0 {
-		months, err = strconv.ParseFloat(m[7], 64)
+	if len(parts.months) > 0 {
+		months, err = strconv.ParseFloat(parts.months, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the months: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[11]) > 0 {
-		weeks, err = strconv.ParseFloat(m[11], 64)
+	if len(parts.weeks) > 0 {
+		weeks, err = strconv.ParseFloat(parts.weeks, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the weeks: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[15]) > 0 {
-		days, err = strconv.ParseFloat(m[15], 64)
+	if len(parts.days) > 0 {
+		days, err = strconv.ParseFloat(parts.days, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the days: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[20]) > 0 {
-		hours, err = strconv.ParseFloat(m[20], 64)
+	if len(parts.hours) > 0 {
+		hours, err = strconv.ParseFloat(parts.hours, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the hours: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[24]) > 0 {
-		minutes, err = strconv.ParseFloat(m[24], 64)
+	if len(parts.minutes) > 0 {
+		minutes, err = strconv.ParseFloat(parts.minutes, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the minutes: %s", err.Error())
 			return
 		}
 	}
 
-	if len(m[29]) > 0 {
-		seconds, err = strconv.ParseInt(m[29], 10, 64)
+	if len(parts.seconds) > 0 {
+		seconds, err = strconv.ParseInt(parts.seconds, 10, 64)
 		if err != nil {
 			err = fmt.Errorf("failed to parse the seconds: %s", err.Error())
 			return
@@ -142,10 +242,10 @@ func durationFromString(s string) (d time.Duration, err error) {
 	}
 
 	switch {
-	case len(m[31]) == 0:
+	case len(parts.fraction) == 0:
 		// pass
-	case len(m[31]) <= 9:
-		trimmed := strings.TrimLeft(m[31], "0")
+	case len(parts.fraction) <= 9:
+		trimmed := strings.TrimLeft(parts.fraction, "0")
 		if len(trimmed) > 0 {
 			nanoseconds, err = strconv.ParseInt(trimmed, 10, 64)
 			if err != nil {
@@ -154,7 +254,7 @@ func durationFromString(s string) (d time.Duration, err error) {
 					err.Error())
 			}
 
-			order := 9 - len(m[31])
+			order := 9 - len(parts.fraction)
 			for i := 0; i < order; i++ {
 				nanoseconds *= 10
 			}
@@ -228,6 +328,227 @@ func durationFromString(s string) (d time.Duration, err error) {
 	return
 }
 
+// locationCache maps time zone names to the loaded *time.Location's.
+//
+// time.LoadLocation reads the time zone database on every call so that
+// the locations are loaded only once and shared among the values.
+var locationCache sync.Map
+
+// loadLocation gives the location with the given name.
+//
+// The location is loaded on the first request and cached afterwards.
+// The names which could not be loaded are not cached.
+//
+// loadLocation is safe for concurrent use.
+func loadLocation(name string) (*time.Location, error) {
+	cached, ok := locationCache.Load(name)
+	if ok {
+		return cached.(*time.Location), nil
+	}
+
+	loc, err := time.LoadLocation(name)
+	if err != nil {
+		return nil, err
+	}
+
+	actual, _ := locationCache.LoadOrStore(name, loc)
+	return actual.(*time.Location), nil
+}
+
+// PrewarmLocations loads the locations with the given names in advance
+// so that the parsing needs not access the time zone database.
+//
+// All the names are loaded even if some fail. The first error is returned.
+//
+// PrewarmLocations is safe for concurrent use.
+func PrewarmLocations(names ...string) (err error) {
+	for _, name := range names {
+		_, loadErr := loadLocation(name)
+		if loadErr != nil && err == nil {
+			err = loadErr
+		}
+	}
+	return
+}
+
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+	for i := 0; i < len(text); i++ {
+		if text[i] < '0' || text[i] > '9' {
+			return 0, false
+		}
+		value = value*10 + int(text[i]-'0')
+	}
+	return value, true
+}
+
+// timeFromFixedY_45_m_45_d parses the text
+// in the layout "2006-01-02" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_45_m_45_d(text string) (t time.Time, ok bool) {
+	if len(text) != 10 ||
+		text[4:5] != "-" ||
+		text[7:8] != "-" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		0,
+		0,
+		0,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
+// timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90 parses the text
+// in the layout "2006-01-02T15:04:05Z" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90(text string) (t time.Time, ok bool) {
+	if len(text) != 20 ||
+		text[4:5] != "-" ||
+		text[7:8] != "-" ||
+		text[10:11] != "T" ||
+		text[13:14] != ":" ||
+		text[16:17] != ":" ||
+		text[19:20] != "Z" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	hour, ok := fixedDigits(text[11:13])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	minute, ok := fixedDigits(text[14:16])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	second, ok := fixedDigits(text[17:19])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		hour,
+		minute,
+		second,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day ||
+		t.Hour() != hour ||
+		t.Minute() != minute ||
+		t.Second() != second {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
+// timeFromFixedH_58_M_58_S parses the text
+// in the layout "15:04:05" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedH_58_M_58_S(text string) (t time.Time, ok bool) {
+	if len(text) != 8 ||
+		text[2:3] != ":" ||
+		text[5:6] != ":" {
+		return time.Time{}, false
+	}
+
+	hour, ok := fixedDigits(text[0:2])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	minute, ok := fixedDigits(text[3:5])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	second, ok := fixedDigits(text[6:8])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		0,
+		time.January,
+		1,
+		hour,
+		minute,
+		second,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if t.Hour() != hour ||
+		t.Minute() != minute ||
+		t.Second() != second {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
 // EmptyFromJSONable parses Empty from a JSONable value.
 //
 // If there are any errors, the state of the target is undefined.
@@ -239,7 +560,7 @@ func durationFromString(s string) (d time.Duration, err error) {
 func EmptyFromJSONable(
 	value interface{},
 	id string,
-	ref string,
+	ref *Ref,
 	target *Empty,
 	errors *Errors) {
 
@@ -257,7 +578,7 @@ func EmptyFromJSONable(
 
 	_, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -280,7 +601,7 @@ func EmptyFromJSONable(
 //  * errors.Empty()
 func SomeEmbedFromJSONable(
 	value interface{},
-	ref string,
+	ref *Ref,
 	target *SomeEmbed,
 	errors *Errors) {
 
@@ -298,7 +619,7 @@ func SomeEmbedFromJSONable(
 
 	_, ok := value.(map[string]interface{})
 	if !ok {
-		errors.Add(
+		errors.AddRef(
 			ref,
 			fmt.Sprintf(
 				"expected a map[string]interface{}, but got: %T",
@@ -345,11 +666,14 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Pre-allocate Empties
 	////
 
-	emptiesRef := ref+"/empties";
+	emptiesRef := graphRef.Key(
+		"empties")
 	var emptiesOk bool
 	var emptiesValue interface{}
 	var emptiesMap map[string]interface{}
@@ -359,7 +683,7 @@ func SomeGraphFromJSONable(
 	if emptiesOk {
 		emptiesMap, ok = emptiesValue.(map[string]interface{})
 		if !ok {
-			errors.Add(
+			errors.AddRef(
 				emptiesRef,
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
@@ -389,8 +713,7 @@ func SomeGraphFromJSONable(
 			EmptyFromJSONable(
 				value,
 				id,
-				strings.Join([]string{
-					emptiesRef, id}, "/"),
+				emptiesRef.Key(id),
 				target.Empties[id],
 				errors)
 
@@ -414,11 +737,8 @@ func SomeGraphFromJSONable(
 	if ok0 {
 		cast1, ok1 := value0.([]interface{})
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_array"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_array"),
 				fmt.Sprintf(
 					"expected a []interface{}, but got: %T",
 					value0))
@@ -429,20 +749,14 @@ func SomeGraphFromJSONable(
 			for i1 := range cast1 {
 				fcast2, ok2 := (cast1[i1]).(float64)
 				if !ok2 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "optional_array", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("optional_array").Index(i1),
 						fmt.Sprintf(
 							"expected a float64, but got: %T",
 							cast1[i1]))
 				} else if fcast2 != math.Trunc(fcast2) {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "optional_array", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("optional_array").Index(i1),
 						fmt.Sprintf(
 							"expected a whole number, but got: %f",
 							fcast2))
@@ -451,11 +765,8 @@ func SomeGraphFromJSONable(
 				} else if fcast2 >= 9223372036854775808.0 ||
 					fcast2 < -9223372036854775808.0 {
 
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "optional_array", strconv.Itoa(i1)},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("optional_array").Index(i1),
 						fmt.Sprintf(
 							"expected the value to fit into int64, but got an overflow: %f",
 							fcast2))
@@ -487,11 +798,8 @@ func SomeGraphFromJSONable(
 		var target3 bool
 		cast4, ok4 := value3.(bool)
 		if !ok4 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_boolean"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_boolean"),
 				fmt.Sprintf(
 					"expected a bool, but got: %T",
 					value3))
@@ -517,24 +825,22 @@ func SomeGraphFromJSONable(
 		var target5 time.Time
 		cast6, ok6 := value5.(string)
 		if !ok6 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_date"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_date"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value5))
 		} else {
-			target6, err6 := time.Parse(
-				"2006-01-02",
-				cast6)
+			target6, fixed6 := timeFromFixedY_45_m_45_d(cast6)
+			var err6 error
+			if !fixed6 {
+				target6, err6 = time.Parse(
+					"2006-01-02",
+					cast6)
+			}
 			if err6 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "optional_date"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("optional_date"),
 					fmt.Sprintf(
 						"expected layout 2006-01-02, got: %s",
 						cast6))
@@ -561,24 +867,22 @@ func SomeGraphFromJSONable(
 		var target7 time.Time
 		cast8, ok8 := value7.(string)
 		if !ok8 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_datetime"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_datetime"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value7))
 		} else {
-			target8, err8 := time.Parse(
-				"2006-01-02T15:04:05Z",
-				cast8)
+			target8, fixed8 := timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90(cast8)
+			var err8 error
+			if !fixed8 {
+				target8, err8 = time.Parse(
+					"2006-01-02T15:04:05Z",
+					cast8)
+			}
 			if err8 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "optional_datetime"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("optional_datetime"),
 					fmt.Sprintf(
 						"expected layout 2006-01-02T15:04:05Z, got: %s",
 						cast8))
@@ -605,22 +909,16 @@ func SomeGraphFromJSONable(
 		var target9 time.Duration
 		cast10, ok10 := value9.(string)
 		if !ok10 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_duration"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_duration"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value9))
 		} else {
 			target10, err10 := durationFromString(cast10)
 			if err10 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "optional_duration"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("optional_duration"),
 					fmt.Sprintf(
 						"failed to parse duration from %#v: %s",
 						cast10,
@@ -648,11 +946,8 @@ func SomeGraphFromJSONable(
 		var target11 float64
 		cast12, ok12 := value11.(float64)
 		if !ok12 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_float"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_float"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value11))
@@ -678,20 +973,14 @@ func SomeGraphFromJSONable(
 		var target13 int64
 		fcast14, ok14 := value13.(float64)
 		if !ok14 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_integer"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_integer"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value13))
 		} else if fcast14 != math.Trunc(fcast14) {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_integer"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_integer"),
 				fmt.Sprintf(
 					"expected a whole number, but got: %f",
 					fcast14))
@@ -700,11 +989,8 @@ func SomeGraphFromJSONable(
 		} else if fcast14 >= 9223372036854775808.0 ||
 			fcast14 < -9223372036854775808.0 {
 
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_integer"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_integer"),
 				fmt.Sprintf(
 					"expected the value to fit into int64, but got an overflow: %f",
 					fcast14))
@@ -729,11 +1015,8 @@ func SomeGraphFromJSONable(
 	if ok15 {
 		cast16, ok16 := value15.(map[string]interface{})
 		if !ok16 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_map"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_map"),
 				fmt.Sprintf(
 					"expected a map[string]interface{}, but got: %T",
 					value15))
@@ -742,20 +1025,14 @@ func SomeGraphFromJSONable(
 			for k16 := range cast16 {
 				fcast17, ok17 := (cast16[k16]).(float64)
 				if !ok17 {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "optional_map", k16},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("optional_map").Key(k16),
 						fmt.Sprintf(
 							"expected a float64, but got: %T",
 							cast16[k16]))
 				} else if fcast17 != math.Trunc(fcast17) {
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "optional_map", k16},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("optional_map").Key(k16),
 						fmt.Sprintf(
 							"expected a whole number, but got: %f",
 							fcast17))
@@ -764,11 +1041,8 @@ func SomeGraphFromJSONable(
 				} else if fcast17 >= 9223372036854775808.0 ||
 					fcast17 < -9223372036854775808.0 {
 
-					errors.Add(
-						strings.Join(
-							[]string{
-								ref, "optional_map", k16},
-							"/"),
+					errors.AddRef(
+						graphRef.Key("optional_map").Key(k16),
 						fmt.Sprintf(
 							"expected the value to fit into int64, but got an overflow: %f",
 							fcast17))
@@ -800,11 +1074,8 @@ func SomeGraphFromJSONable(
 		var target18 string
 		cast19, ok19 := value18.(string)
 		if !ok19 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_path"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_path"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value18))
@@ -830,11 +1101,8 @@ func SomeGraphFromJSONable(
 		var target20 string
 		cast21, ok21 := value20.(string)
 		if !ok21 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_string"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_string"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value20))
@@ -860,24 +1128,704 @@ func SomeGraphFromJSONable(
 		var target22 time.Time
 		cast23, ok23 := value22.(string)
 		if !ok23 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_time"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_time"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value22))
 		} else {
-			target23, err23 := time.Parse(
-				"15:04:05",
-				cast23)
+			target23, fixed23 := timeFromFixedH_58_M_58_S(cast23)
+			var err23 error
+			if !fixed23 {
+				target23, err23 = time.Parse(
+					"15:04:05",
+					cast23)
+			}
+			if err23 != nil {
+				errors.AddRef(
+					graphRef.Key("optional_time"),
+					fmt.Sprintf(
+						"expected layout 15:04:05, got: %s",
+						cast23))
+			} else {
+				target22 = target23
+			}
+		}
+
+		target.OptionalTime = &target22
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalTimeZone
+	////
+
+	value24, ok24 := cast[
+		"optional_time_zone"]
+
+	if ok24 {
+		cast25, ok25 := value24.(string)
+		if !ok25 {
+			errors.AddRef(
+				graphRef.Key("optional_time_zone"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value24))
+		} else {
+			target25, err25 := loadLocation(cast25)
+			if err25 != nil {
+				errors.AddRef(
+					graphRef.Key("optional_time_zone"),
+					fmt.Sprintf(
+						"failed to load location from %#v: %s",
+						cast25,
+						err25.Error()))
+			} else {
+				target.OptionalTimeZone = target25
+			}
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalReference
+	////
+
+	value26, ok26 := cast[
+		"optional_reference"]
+
+	if ok26 {
+		cast27, ok27 := value26.(string)
+		if !ok27 {
+			errors.AddRef(
+				graphRef.Key("optional_reference"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value26))
+		} else {
+			target27, ok27 := target.Empties[cast27]
+			if !ok27 {
+				errors.AddRef(
+					graphRef.Key("optional_reference"),
+					fmt.Sprintf(
+						"reference to an instance of class Empty not found: %s",
+						value26))
+			} else {
+				target.OptionalReference = target27
+			}
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalEmbed
+	////
+
+	value28, ok28 := cast[
+		"optional_embed"]
+
+	if ok28 {
+		var target28 SomeEmbed
+		SomeEmbedFromJSONable(
+			value28,
+			graphRef.Key("optional_embed"),
+			&(target28),
+			errors)
+
+		target.OptionalEmbed = &target28
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// SomeGraphFromJSONableParallel parses SomeGraph from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike SomeGraphFromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func SomeGraphFromJSONableParallel(
+	value interface{},
+	ref string,
+	target *SomeGraph,
+	errors *Errors,
+	workers int) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
+		errors.Add(
+			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate Empties
+	////
+
+	emptiesRef := graphRef.Key(
+		"empties")
+	var emptiesOk bool
+	var emptiesValue interface{}
+	var emptiesMap map[string]interface{}
+
+	emptiesValue, emptiesOk = cast[
+		"empties"]
+	if emptiesOk {
+		emptiesMap, ok = emptiesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				emptiesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					emptiesValue));
+		} else {
+			target.Empties = make(
+				map[string]*Empty)
+
+			for id := range emptiesMap {
+				target.Empties[id] = &Empty{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse the instances of all the registries in parallel
+	////
+
+	// instanceJob identifies an instance to be parsed.
+	type instanceJob struct {
+		// indicates the registry in the order of the classes.
+		registry int
+
+		id string
+
+		value interface{}
+	}
+
+	jobs := make([]instanceJob, 0, len(emptiesMap))
+	for id, value := range emptiesMap {
+		jobs = append(jobs, instanceJob{registry: 0, id: id, value: value})
+	}
+
+	// Sort the instances so that the errors are deterministic.
+	sort.Slice(jobs, func(i, j int) bool {
+		if jobs[i].registry != jobs[j].registry {
+			return jobs[i].registry < jobs[j].registry
+		}
+		return jobs[i].id < jobs[j].id
+	})
+
+	chunks := parallelChunkCount(len(jobs), workers)
+	chunkErrors := make([][]Error, chunks)
+	workerErrors := make([]*Errors, workers)
+
+	forEachInParallel(chunks, workers, func(worker int, chunk int) {
+		instanceErrors := workerErrors[worker]
+		if instanceErrors == nil {
+			instanceErrors = NewErrors(errors.cap)
+			workerErrors[worker] = instanceErrors
+		}
+
+		start, end := parallelChunk(len(jobs), chunks, chunk)
+		for _, job := range jobs[start:end] {
+			switch job.registry {
+			case 0:
+				EmptyFromJSONable(
+					job.value,
+					job.id,
+					emptiesRef.Key(job.id),
+					target.Empties[job.id],
+					instanceErrors)
+			}
+
+			chunkErrors[chunk] = append(
+				chunkErrors[chunk], instanceErrors.values...)
+			instanceErrors.values = instanceErrors.values[:0]
+
+			// The subsequent errors of the chunk would be ignored anyway.
+			if errors.cap != 0 &&
+				uint64(len(chunkErrors[chunk])) >= errors.cap {
+				break
+			}
+		}
+	})
+
+	// Merge the errors in the order of the instances.
+	for _, values := range chunkErrors {
+		for _, e := range values {
+			errors.Add(e.Ref, e.Message)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalArray
+	////
+
+	value0, ok0 := cast[
+		"optional_array"]
+
+	if ok0 {
+		cast1, ok1 := value0.([]interface{})
+		if !ok1 {
+			errors.AddRef(
+				graphRef.Key("optional_array"),
+				fmt.Sprintf(
+					"expected a []interface{}, but got: %T",
+					value0))
+		} else {
+			target1 := make(
+				[]int64,
+				len(cast1))
+			for i1 := range cast1 {
+				fcast2, ok2 := (cast1[i1]).(float64)
+				if !ok2 {
+					errors.AddRef(
+						graphRef.Key("optional_array").Index(i1),
+						fmt.Sprintf(
+							"expected a float64, but got: %T",
+							cast1[i1]))
+				} else if fcast2 != math.Trunc(fcast2) {
+					errors.AddRef(
+						graphRef.Key("optional_array").Index(i1),
+						fmt.Sprintf(
+							"expected a whole number, but got: %f",
+							fcast2))
+				// 9223372036854775808.0 == 2^63 is the first float > MaxInt64.
+				// -9223372036854775808.0 == -(2^63) is the last float >= MinInt64.
+				} else if fcast2 >= 9223372036854775808.0 ||
+					fcast2 < -9223372036854775808.0 {
+
+					errors.AddRef(
+						graphRef.Key("optional_array").Index(i1),
+						fmt.Sprintf(
+							"expected the value to fit into int64, but got an overflow: %f",
+							fcast2))
+				} else {
+					target1[i1] = int64(fcast2)
+				}
+
+				if errors.Full() {
+					break;
+				}
+			}
+
+			target.OptionalArray = target1
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalBoolean
+	////
+
+	value3, ok3 := cast[
+		"optional_boolean"]
+
+	if ok3 {
+		var target3 bool
+		cast4, ok4 := value3.(bool)
+		if !ok4 {
+			errors.AddRef(
+				graphRef.Key("optional_boolean"),
+				fmt.Sprintf(
+					"expected a bool, but got: %T",
+					value3))
+		} else {
+			target3 = cast4
+		}
+
+		target.OptionalBoolean = &target3
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalDate
+	////
+
+	value5, ok5 := cast[
+		"optional_date"]
+
+	if ok5 {
+		var target5 time.Time
+		cast6, ok6 := value5.(string)
+		if !ok6 {
+			errors.AddRef(
+				graphRef.Key("optional_date"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value5))
+		} else {
+			target6, fixed6 := timeFromFixedY_45_m_45_d(cast6)
+			var err6 error
+			if !fixed6 {
+				target6, err6 = time.Parse(
+					"2006-01-02",
+					cast6)
+			}
+			if err6 != nil {
+				errors.AddRef(
+					graphRef.Key("optional_date"),
+					fmt.Sprintf(
+						"expected layout 2006-01-02, got: %s",
+						cast6))
+			} else {
+				target5 = target6
+			}
+		}
+
+		target.OptionalDate = &target5
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalDatetime
+	////
+
+	value7, ok7 := cast[
+		"optional_datetime"]
+
+	if ok7 {
+		var target7 time.Time
+		cast8, ok8 := value7.(string)
+		if !ok8 {
+			errors.AddRef(
+				graphRef.Key("optional_datetime"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value7))
+		} else {
+			target8, fixed8 := timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90(cast8)
+			var err8 error
+			if !fixed8 {
+				target8, err8 = time.Parse(
+					"2006-01-02T15:04:05Z",
+					cast8)
+			}
+			if err8 != nil {
+				errors.AddRef(
+					graphRef.Key("optional_datetime"),
+					fmt.Sprintf(
+						"expected layout 2006-01-02T15:04:05Z, got: %s",
+						cast8))
+			} else {
+				target7 = target8
+			}
+		}
+
+		target.OptionalDatetime = &target7
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalDuration
+	////
+
+	value9, ok9 := cast[
+		"optional_duration"]
+
+	if ok9 {
+		var target9 time.Duration
+		cast10, ok10 := value9.(string)
+		if !ok10 {
+			errors.AddRef(
+				graphRef.Key("optional_duration"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value9))
+		} else {
+			target10, err10 := durationFromString(cast10)
+			if err10 != nil {
+				errors.AddRef(
+					graphRef.Key("optional_duration"),
+					fmt.Sprintf(
+						"failed to parse duration from %#v: %s",
+						cast10,
+						err10.Error()))
+			} else {
+				target9 = target10
+			}
+		}
+
+		target.OptionalDuration = &target9
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalFloat
+	////
+
+	value11, ok11 := cast[
+		"optional_float"]
+
+	if ok11 {
+		var target11 float64
+		cast12, ok12 := value11.(float64)
+		if !ok12 {
+			errors.AddRef(
+				graphRef.Key("optional_float"),
+				fmt.Sprintf(
+					"expected a float64, but got: %T",
+					value11))
+		} else {
+			target11 = cast12
+		}
+
+		target.OptionalFloat = &target11
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalInteger
+	////
+
+	value13, ok13 := cast[
+		"optional_integer"]
+
+	if ok13 {
+		var target13 int64
+		fcast14, ok14 := value13.(float64)
+		if !ok14 {
+			errors.AddRef(
+				graphRef.Key("optional_integer"),
+				fmt.Sprintf(
+					"expected a float64, but got: %T",
+					value13))
+		} else if fcast14 != math.Trunc(fcast14) {
+			errors.AddRef(
+				graphRef.Key("optional_integer"),
+				fmt.Sprintf(
+					"expected a whole number, but got: %f",
+					fcast14))
+		// 9223372036854775808.0 == 2^63 is the first float > MaxInt64.
+		// -9223372036854775808.0 == -(2^63) is the last float >= MinInt64.
+		} else if fcast14 >= 9223372036854775808.0 ||
+			fcast14 < -9223372036854775808.0 {
+
+			errors.AddRef(
+				graphRef.Key("optional_integer"),
+				fmt.Sprintf(
+					"expected the value to fit into int64, but got an overflow: %f",
+					fcast14))
+		} else {
+			target13 = int64(fcast14)
+		}
+
+		target.OptionalInteger = &target13
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalMap
+	////
+
+	value15, ok15 := cast[
+		"optional_map"]
+
+	if ok15 {
+		cast16, ok16 := value15.(map[string]interface{})
+		if !ok16 {
+			errors.AddRef(
+				graphRef.Key("optional_map"),
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					value15))
+		} else {
+			target16 := make(map[string]int64)
+			for k16 := range cast16 {
+				fcast17, ok17 := (cast16[k16]).(float64)
+				if !ok17 {
+					errors.AddRef(
+						graphRef.Key("optional_map").Key(k16),
+						fmt.Sprintf(
+							"expected a float64, but got: %T",
+							cast16[k16]))
+				} else if fcast17 != math.Trunc(fcast17) {
+					errors.AddRef(
+						graphRef.Key("optional_map").Key(k16),
+						fmt.Sprintf(
+							"expected a whole number, but got: %f",
+							fcast17))
+				// 9223372036854775808.0 == 2^63 is the first float > MaxInt64.
+				// -9223372036854775808.0 == -(2^63) is the last float >= MinInt64.
+				} else if fcast17 >= 9223372036854775808.0 ||
+					fcast17 < -9223372036854775808.0 {
+
+					errors.AddRef(
+						graphRef.Key("optional_map").Key(k16),
+						fmt.Sprintf(
+							"expected the value to fit into int64, but got an overflow: %f",
+							fcast17))
+				} else {
+					target16[k16] = int64(fcast17)
+				}
+
+				if errors.Full() {
+					break;
+				}
+			}
+
+			target.OptionalMap = target16
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalPath
+	////
+
+	value18, ok18 := cast[
+		"optional_path"]
+
+	if ok18 {
+		var target18 string
+		cast19, ok19 := value18.(string)
+		if !ok19 {
+			errors.AddRef(
+				graphRef.Key("optional_path"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value18))
+		} else {
+			target18 = cast19
+		}
+
+		target.OptionalPath = &target18
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalString
+	////
+
+	value20, ok20 := cast[
+		"optional_string"]
+
+	if ok20 {
+		var target20 string
+		cast21, ok21 := value20.(string)
+		if !ok21 {
+			errors.AddRef(
+				graphRef.Key("optional_string"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value20))
+		} else {
+			target20 = cast21
+		}
+
+		target.OptionalString = &target20
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse OptionalTime
+	////
+
+	value22, ok22 := cast[
+		"optional_time"]
+
+	if ok22 {
+		var target22 time.Time
+		cast23, ok23 := value22.(string)
+		if !ok23 {
+			errors.AddRef(
+				graphRef.Key("optional_time"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value22))
+		} else {
+			target23, fixed23 := timeFromFixedH_58_M_58_S(cast23)
+			var err23 error
+			if !fixed23 {
+				target23, err23 = time.Parse(
+					"15:04:05",
+					cast23)
+			}
 			if err23 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "optional_time"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("optional_time"),
 					fmt.Sprintf(
 						"expected layout 15:04:05, got: %s",
 						cast23))
@@ -903,22 +1851,16 @@ func SomeGraphFromJSONable(
 	if ok24 {
 		cast25, ok25 := value24.(string)
 		if !ok25 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_time_zone"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_time_zone"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value24))
 		} else {
-			target25, err25 := time.LoadLocation(cast25)
+			target25, err25 := loadLocation(cast25)
 			if err25 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "optional_time_zone"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("optional_time_zone"),
 					fmt.Sprintf(
 						"failed to load location from %#v: %s",
 						cast25,
@@ -943,22 +1885,16 @@ func SomeGraphFromJSONable(
 	if ok26 {
 		cast27, ok27 := value26.(string)
 		if !ok27 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "optional_reference"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("optional_reference"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value26))
 		} else {
 			target27, ok27 := target.Empties[cast27]
 			if !ok27 {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "optional_reference"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("optional_reference"),
 					fmt.Sprintf(
 						"reference to an instance of class Empty not found: %s",
 						value26))
@@ -983,10 +1919,7 @@ func SomeGraphFromJSONable(
 		var target28 SomeEmbed
 		SomeEmbedFromJSONable(
 			value28,
-			strings.Join(
-				[]string{
-					ref, "optional_embed"},
-				"/"),
+			graphRef.Key("optional_embed"),
 			&(target28),
 			errors)
 
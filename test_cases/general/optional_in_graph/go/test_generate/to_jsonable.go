@@ -308,4 +308,201 @@ func SomeGraphToJSONable(
 	return
 }
 
+// SomeGraphToJSONableParallel converts the instance to
+// a JSONable representation on a pool of at most workers goroutines.
+//
+// The instances of each registry are converted concurrently.
+//
+// SomeGraphToJSONableParallel requires:
+//  * instance != nil
+//  * workers > 0
+//
+// SomeGraphToJSONableParallel ensures:
+//  * (err == nil && target != nil) || (err != nil && target == nil)
+func SomeGraphToJSONableParallel(
+	instance *SomeGraph,
+	workers int) (
+	target map[string]interface{}, err error) {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	target = make(map[string]interface{})
+	defer func() {
+		if err != nil {
+			target = nil
+		}
+	}()
+	////
+	// Serialize OptionalArray
+	////
+
+	if instance.OptionalArray != nil {
+		count0 := len(instance.OptionalArray)
+		slice0 := instance.OptionalArray
+		target0 := make([]interface{}, count0)
+		for i0 := 0; i0 < count0; i0++ {
+			target0[i0] = slice0[i0]
+		}
+		target["optional_array"] = target0
+	}
+
+	////
+	// Serialize OptionalBoolean
+	////
+
+	if instance.OptionalBoolean != nil {
+		target["optional_boolean"] = (*instance.OptionalBoolean)
+	}
+
+	////
+	// Serialize OptionalDate
+	////
+
+	if instance.OptionalDate != nil {
+		target["optional_date"] = (*instance.OptionalDate).Format(
+			"2006-01-02")
+	}
+
+	////
+	// Serialize OptionalDatetime
+	////
+
+	if instance.OptionalDatetime != nil {
+		target["optional_datetime"] = (*instance.OptionalDatetime).Format(
+			"2006-01-02T15:04:05Z")
+	}
+
+	////
+	// Serialize OptionalDuration
+	////
+
+	if instance.OptionalDuration != nil {
+		target["optional_duration"] = durationToString(
+			(*instance.OptionalDuration))
+	}
+
+	////
+	// Serialize OptionalFloat
+	////
+
+	if instance.OptionalFloat != nil {
+		target["optional_float"] = (*instance.OptionalFloat)
+	}
+
+	////
+	// Serialize OptionalInteger
+	////
+
+	if instance.OptionalInteger != nil {
+		target["optional_integer"] = (*instance.OptionalInteger)
+	}
+
+	////
+	// Serialize OptionalMap
+	////
+
+	if instance.OptionalMap != nil {
+		target1 := make(map[string]interface{})
+		map1 := instance.OptionalMap
+		for k1, v1 := range map1 {
+			target1[k1] = v1
+		}
+		target["optional_map"] = target1
+	}
+
+	////
+	// Serialize OptionalPath
+	////
+
+	if instance.OptionalPath != nil {
+		target["optional_path"] = (*instance.OptionalPath)
+	}
+
+	////
+	// Serialize OptionalString
+	////
+
+	if instance.OptionalString != nil {
+		target["optional_string"] = (*instance.OptionalString)
+	}
+
+	////
+	// Serialize OptionalTime
+	////
+
+	if instance.OptionalTime != nil {
+		target["optional_time"] = (*instance.OptionalTime).Format(
+			"15:04:05")
+	}
+
+	////
+	// Serialize OptionalTimeZone
+	////
+
+	if instance.OptionalTimeZone != nil {
+		target["optional_time_zone"] = instance.OptionalTimeZone.String()
+	}
+
+	////
+	// Serialize OptionalReference
+	////
+
+	if instance.OptionalReference != nil {
+		target["optional_reference"] = instance.OptionalReference.ID
+	}
+
+	////
+	// Serialize OptionalEmbed
+	////
+
+	if instance.OptionalEmbed != nil {
+		target["optional_embed"] = SomeEmbedToJSONable(
+			&(*instance.OptionalEmbed))
+	}
+
+	////
+	// Serialize instance registry of Empty
+	////
+
+	if len(instance.Empties) > 0 {
+		ids := make([]string, 0, len(instance.Empties))
+		for id, emptyInstance := range instance.Empties {
+			if id != emptyInstance.ID {
+				err = fmt.Errorf(
+					"expected the instance of Empty to have the ID %s according to the registry, but got: %s",
+					id, emptyInstance.ID)
+				return
+			}
+
+			ids = append(ids, id)
+		}
+
+		jsonables := make([]map[string]interface{}, len(ids))
+		chunks := parallelChunkCount(len(ids), workers)
+		forEachInParallel(chunks, workers, func(worker int, chunk int) {
+			start, end := parallelChunk(len(ids), chunks, chunk)
+			for i := start; i < end; i++ {
+				jsonables[i] = EmptyToJSONable(
+					instance.Empties[ids[i]])
+			}
+		})
+
+		targetEmpties := make(
+			map[string]interface{}, len(ids))
+		for i, id := range ids {
+			targetEmpties[id] = jsonables[i]
+		}
+
+		target["empties"] = targetEmpties
+	}
+
+	return
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
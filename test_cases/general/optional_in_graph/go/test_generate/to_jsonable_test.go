@@ -4,6 +4,9 @@ package somegraph
 
 import (
 	"fmt"
+	"io/ioutil"
+	"runtime"
+	"testing"
 	"time"
 )
 
@@ -56,4 +59,64 @@ func ExampleDurationToString_nanoseconds() {
 	// Output: PT0.000000001S
 }
 
+func BenchmarkSomeGraphToJSONable(b *testing.B) {
+	instance := newSyntheticSomeGraph()
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		_, err := SomeGraphToJSONable(instance)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkSomeGraphToJSONableParallel(b *testing.B) {
+	instance := newSyntheticSomeGraph()
+	workers := runtime.GOMAXPROCS(0)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		_, err := SomeGraphToJSONableParallel(
+			instance, workers)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkSomeGraphWriteJSON(b *testing.B) {
+	instance := newSyntheticSomeGraph()
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		err := SomeGraphWriteJSON(ioutil.Discard, instance)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkSomeGraphWriteJSONParallel(b *testing.B) {
+	instance := newSyntheticSomeGraph()
+	workers := runtime.GOMAXPROCS(0)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		err := SomeGraphWriteJSONParallel(
+			ioutil.Discard, instance, workers)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -14,17 +14,90 @@ import some.graph
 import some.graph.parse
 
 
-_DURATION_RE = re.compile(
-    r'^(?P<sign>\+|-)?P'
-    r'((?P<years>(0|[1-9][0-9]*)(\.[0-9]+)?)Y)?'
-    r'((?P<months>(0|[1-9][0-9]*)(\.[0-9]+)?)M)?'
-    r'((?P<weeks>(0|[1-9][0-9]*)(\.[0-9]+)?)W)?'
-    r'((?P<days>(0|[1-9][0-9]*)(\.[0-9]+)?)D)?'
-    r'(T'
-    r'((?P<hours>(0|[1-9][0-9]*)(\.[0-9]+)?)H)?'
-    r'((?P<minutes>(0|[1-9][0-9]*)(\.[0-9]+)?)M)?'
-    r'(((?P<seconds>0|[1-9][0-9]*)(\.(?P<fraction>[0-9]+))?)S)?'
-    r')?$')
+def _scan_duration(text: str) -> typing.Optional[typing.List[str]]:
+    """
+    scans the duration in ISO 8601 format in a single pass.
+
+    :param text: string to be scanned
+    :return:
+        sign, years, months, weeks, days, hours, minutes, seconds and
+        fraction of seconds as strings (empty if not specified),
+        or None if the text does not conform to the format
+
+    >>> _scan_duration('-P1.5YT2M3.04S')
+    ['-', '1.5', '', '', '', '', '2', '3', '04']
+
+    >>> _scan_duration('P01D') is None
+    True
+
+    """
+    # Accept a trailing new line for backward compatibility: the durations
+    # used to be matched by a regular expression ending in ``$``.
+    end = len(text) - 1 if text.endswith('\n') else len(text)
+
+    groups = ['', '', '', '', '', '', '', '', '']
+
+    position = 0
+    if position < end and text[position] in '+-':
+        groups[0] = text[position]
+        position += 1
+
+    if position == end or text[position] != 'P':
+        return None
+    position += 1
+
+    # Designators of the date part are followed by
+    # the designators of the time part.
+    designators = 'YMWD'
+    offset = 1
+    next_designator = 0
+
+    while position < end:
+        if text[position] == 'T' and offset == 1:
+            designators = 'HMS'
+            offset = 5
+            next_designator = 0
+            position += 1
+            continue
+
+        start = position
+
+        if text[position] == '0':
+            position += 1
+        elif '1' <= text[position] <= '9':
+            position += 1
+            while position < end and '0' <= text[position] <= '9':
+                position += 1
+        else:
+            return None
+
+        integer_end = position
+
+        if position < end and text[position] == '.':
+            position += 1
+            while position < end and '0' <= text[position] <= '9':
+                position += 1
+
+            if position == integer_end + 1:
+                return None
+
+        if position == end:
+            return None
+
+        designator = designators.find(text[position], next_designator)
+        if designator == -1:
+            return None
+
+        if offset + designator == 7:
+            groups[7] = text[start:integer_end]
+            groups[8] = text[integer_end + 1:position]
+        else:
+            groups[offset + designator] = text[start:position]
+
+        next_designator = designator + 1
+        position += 1
+
+    return groups
 
 
 def _duration_from_string(text: str) -> datetime.timedelta:
@@ -79,41 +152,29 @@ def _duration_from_string(text: str) -> datetime.timedelta:
     datetime.timedelta(-1)
 
     """
-    match = _DURATION_RE.match(text)
+    groups = _scan_duration(text)
 
-    if not match:
+    if groups is None:
         raise ValueError(
             'Failed to match the duration: {!r}'.format(
                 text))
 
-    sign_grp = match.group('sign')
+    (sign_grp, years_grp, months_grp, weeks_grp, days_grp, hours_grp,
+     minutes_grp, seconds_grp, fraction_grp) = groups
+
     if not sign_grp or sign_grp == '+':
         sign = 1
     else:
         sign = -1
 
-    years_grp = match.group('years')
     years = float(years_grp) if years_grp else 0.0
-
-    months_grp = match.group('months')
     months = float(months_grp) if months_grp else 0.0
-
-    weeks_grp = match.group('weeks')
     weeks = float(weeks_grp) if weeks_grp else 0.0
-
-    days_grp = match.group('days')
     days = float(days_grp) if days_grp else 0.0
-
-    hours_grp = match.group('hours')
     hours = float(hours_grp) if hours_grp else 0.0
-
-    minutes_grp = match.group('minutes')
     minutes = float(minutes_grp) if minutes_grp else 0.0
-
-    seconds_grp = match.group('seconds')
     seconds = int(seconds_grp) if seconds_grp else 0
 
-    fraction_grp = match.group('fraction')
     if not fraction_grp:
         microseconds = 0
 
@@ -144,9 +205,138 @@ def _duration_from_string(text: str) -> datetime.timedelta:
                 text)) from err
 
 
+_DATE_Y_45_m_45_d_RE = re.compile(
+    r'([0-9]{4})\-([0-9]{2})\-([0-9]{2})\Z')
+
+
+def _date_from_string_Y_45_m_45_d(text: str) -> datetime.date:
+    """
+    parses the date from the string in the format '%Y-%m-%d'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: date
+    :raise: ValueError if the string could not be parsed
+
+    >>> _date_from_string_Y_45_m_45_d('2016-07-03')
+    datetime.date(2016, 7, 3)
+
+    """
+    match = _DATE_Y_45_m_45_d_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.date(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y-%m-%d').date()
+
+
+_DATETIME_Y_45_m_45_d_84_H_58_M_58_S_90_RE = re.compile(
+    r'([0-9]{4})\-([0-9]{2})\-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})Z\Z')
+
+
+def _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(text: str) -> datetime.datetime:
+    """
+    parses the datetime from the string in the format '%Y-%m-%dT%H:%M:%SZ'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: datetime
+    :raise: ValueError if the string could not be parsed
+
+    >>> _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90('2016-07-03T12:34:56Z')
+    datetime.datetime(2016, 7, 3, 12, 34, 56)
+
+    """
+    match = _DATETIME_Y_45_m_45_d_84_H_58_M_58_S_90_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.datetime(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)),
+                int(match.group(4)),
+                int(match.group(5)),
+                int(match.group(6)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y-%m-%dT%H:%M:%SZ')
+
+
+_TIME_H_58_M_58_S_RE = re.compile(
+    r'([0-9]{2}):([0-9]{2}):([0-9]{2})\Z')
+
+
+def _time_from_string_H_58_M_58_S(text: str) -> datetime.time:
+    """
+    parses the time from the string in the format '%H:%M:%S'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: time
+    :raise: ValueError if the string could not be parsed
+
+    >>> _time_from_string_H_58_M_58_S('12:34:56')
+    datetime.time(12, 34, 56)
+
+    """
+    match = _TIME_H_58_M_58_S_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.time(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%H:%M:%S').time()
+
+
+def _empty_construct(
+        value: typing.Any,
+        id: str,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.Empty]:
+    """
+    parses Empty from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    return some.graph.Empty(id=id)
+
+
 def _empty_from(
         value: typing.Any,
-        ref: str,
+        ref: some.graph.parse.Ref,
         target: some.graph.Empty,
         errors: some.graph.parse.Errors
 ) -> None:
@@ -157,7 +347,7 @@ def _empty_from(
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
+        reference to the value (e.g., a lazy reference path)
     :param target: parsed ``value`` as Empty
     :param errors: errors encountered during parsing
     :return:
@@ -188,12 +378,10 @@ def empty_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_empty(id=id)
-
-    _empty_from(
+    target = _empty_construct(
         value=value,
+        id=id,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -204,21 +392,20 @@ def empty_from(
 
 def _some_embed_from(
         value: typing.Any,
-        ref: str,
-        target: some.graph.SomeEmbed,
+        ref: some.graph.parse.Ref,
         errors: some.graph.parse.Errors
-) -> None:
+) -> typing.Optional[some.graph.SomeEmbed]:
     """
     parses SomeEmbed from a JSONable value.
 
-    If ``errors``, the attributes of ``target`` have undefined values.
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
 
     :param value: JSONable value
     :param ref:
-        reference to the value (e.g., a reference path)
-    :param target: parsed ``value`` as SomeEmbed
+        reference to the value (e.g., a lazy reference path)
     :param errors: errors encountered during parsing
-    :return:
+    :return: parsed instance, or None if parsing it added to ``errors``
 
     """
     if not isinstance(value, dict):
@@ -226,7 +413,9 @@ def _some_embed_from(
             ref,
             "Expected a dictionary, but got: {}".format(
                 type(value)))
-        return
+        return None
+
+    return some.graph.SomeEmbed()
 
 
 def some_embed_from(
@@ -245,12 +434,9 @@ def some_embed_from(
     :return: parsed instance, or None if ``errors``
 
     """
-    target = some.graph.parse.placeholder_some_embed()
-
-    _some_embed_from(
+    target = _some_embed_from(
         value=value,
         ref=ref,
-        target=target,
         errors=errors)
 
     if not errors.empty():
@@ -292,8 +478,7 @@ def some_graph_from(
     if registry_value is not None:
         if not isinstance(registry_value, dict):
             errors.add(
-                '/'.join((
-                    ref, 'empties')),
+                (ref, 'empties'),
                 "Expected a dictionary, but got: {}".format(
                     type(registry_value)))
         else:
@@ -302,10 +487,6 @@ def some_graph_from(
             else:
                 graph.empties = dict()
 
-            empties_registry = graph.empties
-            for id in registry_value:
-                empties_registry[id] = some.graph.parse.placeholder_empty(id=id)
-
     if errors.full():
         return None
 
@@ -320,14 +501,845 @@ def some_graph_from(
     if 'empties' in value:
         registry_value = value['empties']
         for id, instance_value in registry_value.items():
-            target_empty = graph.empties[id]
-            target_empty.id = id
+            instance_empty = _empty_construct(
+                instance_value,
+                id,
+                (ref, 'empties', (id, )),
+                errors)
+
+            if instance_empty is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_empty = some.graph.parse.placeholder_empty(id=id)
+
+            graph.empties[id] = instance_empty
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse optional_array
+    ##
+
+    value_0 = value.get(
+        'optional_array',
+        None)
+
+    if value_0 is not None:
+        if not isinstance(value_0, list):
+            errors.add(
+                (ref, 'optional_array'),
+                "Expected a list, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = (
+                []
+            )  # type: typing.List[int]
+            for i_1, item_1 in enumerate(
+                    value_0):
+                target_item_1 = (
+                    None
+                )  # type: typing.Optional[int]
+                if not isinstance(item_1, int):
+                    errors.add(
+                        (ref, 'optional_array', i_1),
+                        "Expected an integer, but got: {}".format(
+                            type(item_1)))
+                else:
+                    target_item_1 = item_1
+
+                if target_item_1 is not None:
+                    target_1.append(
+                        target_item_1)
+
+                if errors.full():
+                    break
+
+            graph.optional_array = target_1
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_boolean
+    ##
+
+    value_3 = value.get(
+        'optional_boolean',
+        None)
+
+    if value_3 is not None:
+        if not isinstance(value_3, bool):
+            errors.add(
+                (ref, 'optional_boolean'),
+                "Expected a bool, but got: {}".format(
+                    type(value_3)))
+        else:
+            graph.optional_boolean = value_3
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_date
+    ##
+
+    value_5 = value.get(
+        'optional_date',
+        None)
+
+    if value_5 is not None:
+        if not isinstance(value_5, str):
+            errors.add(
+                (ref, 'optional_date'),
+                "Expected a string, but got: {}".format(
+                    type(value_5)))
+        else:
+            try:
+                graph.optional_date = _date_from_string_Y_45_m_45_d(
+                    value_5)
+            except ValueError:
+                errors.add(
+                    (ref, 'optional_date'),
+                    'Expected to strptime %Y-%m-%d, but got: {}'.format(
+                        value_5))
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_datetime
+    ##
+
+    value_7 = value.get(
+        'optional_datetime',
+        None)
+
+    if value_7 is not None:
+        if not isinstance(value_7, str):
+            errors.add(
+                (ref, 'optional_datetime'),
+                "Expected a string, but got: {}".format(
+                    type(value_7)))
+        else:
+            try:
+                graph.optional_datetime = _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(
+                    value_7)
+            except ValueError:
+                errors.add(
+                    (ref, 'optional_datetime'),
+                    'Expected to strptime %Y-%m-%dT%H:%M:%SZ, but got: {}'.format(
+                        value_7))
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_duration
+    ##
+
+    value_9 = value.get(
+        'optional_duration',
+        None)
+
+    if value_9 is not None:
+        if not isinstance(value_9, str):
+            errors.add(
+                (ref, 'optional_duration'),
+                "Expected a string, but got: {}".format(
+                    type(value_9)))
+        else:
+            try:
+                graph.optional_duration = _duration_from_string(
+                    value_9)
+            except (ValueError, OverflowError) as err:
+                errors.add(
+                    (ref, 'optional_duration'),
+                    str(err))
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_float
+    ##
+
+    value_11 = value.get(
+        'optional_float',
+        None)
+
+    if value_11 is not None:
+        if not isinstance(value_11, (int, float)):
+            errors.add(
+                (ref, 'optional_float'),
+                'Expected a number, but got: {}'.format(
+                    type(value_11)))
+        else:
+            graph.optional_float = float(value_11)
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_integer
+    ##
+
+    value_13 = value.get(
+        'optional_integer',
+        None)
+
+    if value_13 is not None:
+        if not isinstance(value_13, int):
+            errors.add(
+                (ref, 'optional_integer'),
+                "Expected an integer, but got: {}".format(
+                    type(value_13)))
+        else:
+            graph.optional_integer = value_13
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_map
+    ##
+
+    value_15 = value.get(
+        'optional_map',
+        None)
+
+    if value_15 is not None:
+        if not isinstance(value_15, dict):
+            errors.add(
+                (ref, 'optional_map'),
+                "Expected a dict, but got: {}".format(
+                    type(value_15)))
+        else:
+            if isinstance(value_15, collections.OrderedDict):
+                target_16 = (
+                    collections.OrderedDict()
+                )  # type: typing.MutableMapping[str, int]
+            else:
+                target_16 = (
+                    dict()
+                )
+
+            for key_16, value_16 in value_15.items():
+                if not isinstance(key_16, str):
+                    errors.add(
+                        (ref, 'optional_map'),
+                        "Expected the key to be a str, but got: {}".format(
+                            type(key_16)))
+
+                    if errors.full():
+                        break
+                    else:
+                        continue
+
+                target_item_16 = (
+                    None
+                )  # type: typing.Optional[int]
+                if not isinstance(value_16, int):
+                    errors.add(
+                        (ref, 'optional_map', (key_16, )),
+                        "Expected an integer, but got: {}".format(
+                            type(value_16)))
+                else:
+                    target_item_16 = value_16
+
+                if target_item_16 is not None:
+                    target_16[key_16] = target_item_16
+
+                if errors.full():
+                    break
+
+            if target_16 is not None:
+                graph.optional_map = target_16
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_path
+    ##
+
+    value_18 = value.get(
+        'optional_path',
+        None)
+
+    if value_18 is not None:
+        if not isinstance(value_18, str):
+            errors.add(
+                (ref, 'optional_path'),
+                "Expected a string, but got: {}".format(
+                    type(value_18)))
+        else:
+            graph.optional_path = pathlib.Path(
+                value_18)
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_string
+    ##
+
+    value_20 = value.get(
+        'optional_string',
+        None)
+
+    if value_20 is not None:
+        if not isinstance(value_20, str):
+            errors.add(
+                (ref, 'optional_string'),
+                "Expected a string, but got: {}".format(
+                    type(value_20)))
+        else:
+            graph.optional_string = value_20
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_time
+    ##
+
+    value_22 = value.get(
+        'optional_time',
+        None)
+
+    if value_22 is not None:
+        if not isinstance(value_22, str):
+            errors.add(
+                (ref, 'optional_time'),
+                "Expected a string, but got: {}".format(
+                    type(value_22)))
+        else:
+            try:
+                graph.optional_time = _time_from_string_H_58_M_58_S(
+                    value_22)
+            except ValueError:
+                errors.add(
+                    (ref, 'optional_time'),
+                    'Expected to strptime %H:%M:%S, but got: {}'.format(
+                        value_22))
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_time_zone
+    ##
+
+    value_24 = value.get(
+        'optional_time_zone',
+        None)
+
+    if value_24 is not None:
+        if not isinstance(value_24, str):
+            errors.add(
+                (ref, 'optional_time_zone'),
+                "Expected a string, but got: {}".format(
+                    type(value_24)))
+        else:
+            graph.optional_time_zone = value_24
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_reference
+    ##
+
+    value_26 = value.get(
+        'optional_reference',
+        None)
+
+    if value_26 is not None:
+        if not isinstance(value_26, str):
+            errors.add(
+                (ref, 'optional_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_26)))
+        else:
+            target_27 = graph.empties.get(
+                value_26,
+                None)
+            if target_27 is None:
+                errors.add(
+                    (ref, 'optional_reference'),
+                    'Reference to an instance of class Empty not found: {}'.format(
+                        value_26))
+            else:
+                graph.optional_reference = target_27
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse optional_embed
+    ##
+
+    value_28 = value.get(
+        'optional_embed',
+        None)
+
+    if value_28 is not None:
+        target_29 = _some_embed_from(
+            value_28,
+            (ref, 'optional_embed'),
+            errors)
+        if target_29 is not None:
+            graph.optional_embed = target_29
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _empty_construct_fast(
+        value: typing.Any,
+        id: str
+) -> some.graph.Empty:
+    """
+    parses Empty optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    return some.graph.Empty(id=id)
+
+
+def _some_embed_from_fast(
+        value: typing.Any
+) -> some.graph.SomeEmbed:
+    """
+    parses SomeEmbed optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    return some.graph.SomeEmbed()
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate empties
+    ##
+
+    registry_value = value.get('empties', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.empties = collections.OrderedDict()
+        else:
+            graph.empties = dict()
+
+    ##
+    # Parse empties
+    ##
+
+    if 'empties' in value:
+        registry_value = value['empties']
+        for id, instance_value in registry_value.items():
+            graph.empties[id] = _empty_construct_fast(
+                instance_value,
+                id)
+
+    ##
+    # Parse optional_array
+    ##
+
+    value_0 = value.get(
+        'optional_array',
+        None)
+    if value_0 is not None:
+        if not isinstance(value_0, list):
+            raise TypeError("Expected a list")
+        target_1 = (
+            []
+        )  # type: typing.List[int]
+        for item_1 in value_0:
+            if not isinstance(item_1, int):
+                raise TypeError("Expected an integer")
+            target_item_1 = item_1
+            target_1.append(
+                target_item_1)
+        graph.optional_array = target_1
+
+    ##
+    # Parse optional_boolean
+    ##
+
+    value_3 = value.get(
+        'optional_boolean',
+        None)
+    if value_3 is not None:
+        if not isinstance(value_3, bool):
+            raise TypeError("Expected a bool")
+        graph.optional_boolean = value_3
+
+    ##
+    # Parse optional_date
+    ##
+
+    value_5 = value.get(
+        'optional_date',
+        None)
+    if value_5 is not None:
+        graph.optional_date = _date_from_string_Y_45_m_45_d(
+            value_5)
+
+    ##
+    # Parse optional_datetime
+    ##
+
+    value_7 = value.get(
+        'optional_datetime',
+        None)
+    if value_7 is not None:
+        graph.optional_datetime = _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(
+            value_7)
+
+    ##
+    # Parse optional_duration
+    ##
+
+    value_9 = value.get(
+        'optional_duration',
+        None)
+    if value_9 is not None:
+        if not isinstance(value_9, str):
+            raise TypeError("Expected a string")
+        graph.optional_duration = _duration_from_string(
+            value_9)
+
+    ##
+    # Parse optional_float
+    ##
+
+    value_11 = value.get(
+        'optional_float',
+        None)
+    if value_11 is not None:
+        if not isinstance(value_11, (int, float)):
+            raise TypeError("Expected a number")
+        graph.optional_float = float(value_11)
+
+    ##
+    # Parse optional_integer
+    ##
+
+    value_13 = value.get(
+        'optional_integer',
+        None)
+    if value_13 is not None:
+        if not isinstance(value_13, int):
+            raise TypeError("Expected an integer")
+        graph.optional_integer = value_13
+
+    ##
+    # Parse optional_map
+    ##
+
+    value_15 = value.get(
+        'optional_map',
+        None)
+    if value_15 is not None:
+        if not isinstance(value_15, dict):
+            raise TypeError("Expected a dict")
+        if isinstance(value_15, collections.OrderedDict):
+            target_16 = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, int]
+        else:
+            target_16 = (
+                dict()
+            )
+        for key_16, item_16 in value_15.items():
+            if not isinstance(key_16, str):
+                raise TypeError("Expected the key to be a str")
+            if not isinstance(item_16, int):
+                raise TypeError("Expected an integer")
+            target_item_16 = item_16
+            target_16[key_16] = target_item_16
+        graph.optional_map = target_16
+
+    ##
+    # Parse optional_path
+    ##
+
+    value_18 = value.get(
+        'optional_path',
+        None)
+    if value_18 is not None:
+        if not isinstance(value_18, str):
+            raise TypeError("Expected a string")
+        graph.optional_path = pathlib.Path(
+            value_18)
+
+    ##
+    # Parse optional_string
+    ##
+
+    value_20 = value.get(
+        'optional_string',
+        None)
+    if value_20 is not None:
+        if not isinstance(value_20, str):
+            raise TypeError("Expected a string")
+        graph.optional_string = value_20
+
+    ##
+    # Parse optional_time
+    ##
+
+    value_22 = value.get(
+        'optional_time',
+        None)
+    if value_22 is not None:
+        graph.optional_time = _time_from_string_H_58_M_58_S(
+            value_22)
+
+    ##
+    # Parse optional_time_zone
+    ##
+
+    value_24 = value.get(
+        'optional_time_zone',
+        None)
+    if value_24 is not None:
+        if not isinstance(value_24, str):
+            raise TypeError("Expected a string")
+        graph.optional_time_zone = value_24
+
+    ##
+    # Parse optional_reference
+    ##
+
+    value_26 = value.get(
+        'optional_reference',
+        None)
+    if value_26 is not None:
+        graph.optional_reference = graph.empties[
+            value_26]
+
+    ##
+    # Parse optional_embed
+    ##
+
+    value_28 = value.get(
+        'optional_embed',
+        None)
+    if value_28 is not None:
+        graph.optional_embed = _some_embed_from_fast(
+            value_28)
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_empties = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate empties reusing the unchanged instances
+    ##
+
+    registry_value = value.get('empties', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'empties'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.empties = collections.OrderedDict()
+            else:
+                graph.empties = dict()
+
+            empties_registry = graph.empties
+            previous_empties = previous.empties
+
+            previous_registry_value = previous_value.get(
+                'empties', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_empty = previous_empties.get(id, None)
+                if (target_empty is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_empty = some.graph.parse.placeholder_empty(id=id)
+                    changed_empties.add(id)
+
+                empties_registry[id] = target_empty
+
+    changed_empties.update(
+        id for id in previous.empties
+        if id not in graph.empties)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse the new and changed empties
+    ##
+
+    registry_value = value.get('empties', None)
+    if registry_value is not None and changed_empties:
+        for id, instance_value in registry_value.items():
+            if id not in changed_empties:
+                continue
 
             _empty_from(
                 instance_value,
-                '/'.join((
-                    ref, 'empties', repr(id))),
-                target_empty,
+                (ref, 'empties', (id, )),
+                graph.empties[id],
                 errors)
 
             if errors.full():
@@ -344,8 +1356,7 @@ def some_graph_from(
     if value_0 is not None:
         if not isinstance(value_0, list):
             errors.add(
-                '/'.join((
-                    ref, 'optional_array')),
+                (ref, 'optional_array'),
                 "Expected a list, but got: {}".format(
                     type(value_0)))
         else:
@@ -359,8 +1370,7 @@ def some_graph_from(
                 )  # type: typing.Optional[int]
                 if not isinstance(item_1, int):
                     errors.add(
-                        '/'.join((
-                            ref, 'optional_array', str(i_1))),
+                        (ref, 'optional_array', i_1),
                         "Expected an integer, but got: {}".format(
                             type(item_1)))
                 else:
@@ -389,8 +1399,7 @@ def some_graph_from(
     if value_3 is not None:
         if not isinstance(value_3, bool):
             errors.add(
-                '/'.join((
-                    ref, 'optional_boolean')),
+                (ref, 'optional_boolean'),
                 "Expected a bool, but got: {}".format(
                     type(value_3)))
         else:
@@ -410,20 +1419,16 @@ def some_graph_from(
     if value_5 is not None:
         if not isinstance(value_5, str):
             errors.add(
-                '/'.join((
-                    ref, 'optional_date')),
+                (ref, 'optional_date'),
                 "Expected a string, but got: {}".format(
                     type(value_5)))
         else:
             try:
-                graph.optional_date = datetime.datetime.strptime(
-                    value_5,
-                    '%Y-%m-%d'
-                ).date()
+                graph.optional_date = _date_from_string_Y_45_m_45_d(
+                    value_5)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'optional_date')),
+                    (ref, 'optional_date'),
                     'Expected to strptime %Y-%m-%d, but got: {}'.format(
                         value_5))
 
@@ -441,19 +1446,16 @@ def some_graph_from(
     if value_7 is not None:
         if not isinstance(value_7, str):
             errors.add(
-                '/'.join((
-                    ref, 'optional_datetime')),
+                (ref, 'optional_datetime'),
                 "Expected a string, but got: {}".format(
                     type(value_7)))
         else:
             try:
-                graph.optional_datetime = datetime.datetime.strptime(
-                    value_7,
-                    '%Y-%m-%dT%H:%M:%SZ')
+                graph.optional_datetime = _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(
+                    value_7)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'optional_datetime')),
+                    (ref, 'optional_datetime'),
                     'Expected to strptime %Y-%m-%dT%H:%M:%SZ, but got: {}'.format(
                         value_7))
 
@@ -471,8 +1473,7 @@ def some_graph_from(
     if value_9 is not None:
         if not isinstance(value_9, str):
             errors.add(
-                '/'.join((
-                    ref, 'optional_duration')),
+                (ref, 'optional_duration'),
                 "Expected a string, but got: {}".format(
                     type(value_9)))
         else:
@@ -481,8 +1482,7 @@ def some_graph_from(
                     value_9)
             except (ValueError, OverflowError) as err:
                 errors.add(
-                    '/'.join((
-                        ref, 'optional_duration')),
+                    (ref, 'optional_duration'),
                     str(err))
 
     if errors.full():
@@ -499,8 +1499,7 @@ def some_graph_from(
     if value_11 is not None:
         if not isinstance(value_11, (int, float)):
             errors.add(
-                '/'.join((
-                    ref, 'optional_float')),
+                (ref, 'optional_float'),
                 'Expected a number, but got: {}'.format(
                     type(value_11)))
         else:
@@ -520,8 +1519,7 @@ def some_graph_from(
     if value_13 is not None:
         if not isinstance(value_13, int):
             errors.add(
-                '/'.join((
-                    ref, 'optional_integer')),
+                (ref, 'optional_integer'),
                 "Expected an integer, but got: {}".format(
                     type(value_13)))
         else:
@@ -541,8 +1539,7 @@ def some_graph_from(
     if value_15 is not None:
         if not isinstance(value_15, dict):
             errors.add(
-                '/'.join((
-                    ref, 'optional_map')),
+                (ref, 'optional_map'),
                 "Expected a dict, but got: {}".format(
                     type(value_15)))
         else:
@@ -558,8 +1555,7 @@ def some_graph_from(
             for key_16, value_16 in value_15.items():
                 if not isinstance(key_16, str):
                     errors.add(
-                        '/'.join((
-                            ref, 'optional_map')),
+                        (ref, 'optional_map'),
                         "Expected the key to be a str, but got: {}".format(
                             type(key_16)))
 
@@ -573,8 +1569,7 @@ def some_graph_from(
                 )  # type: typing.Optional[int]
                 if not isinstance(value_16, int):
                     errors.add(
-                        '/'.join((
-                            ref, 'optional_map', repr(key_16))),
+                        (ref, 'optional_map', (key_16, )),
                         "Expected an integer, but got: {}".format(
                             type(value_16)))
                 else:
@@ -603,8 +1598,7 @@ def some_graph_from(
     if value_18 is not None:
         if not isinstance(value_18, str):
             errors.add(
-                '/'.join((
-                    ref, 'optional_path')),
+                (ref, 'optional_path'),
                 "Expected a string, but got: {}".format(
                     type(value_18)))
         else:
@@ -625,8 +1619,7 @@ def some_graph_from(
     if value_20 is not None:
         if not isinstance(value_20, str):
             errors.add(
-                '/'.join((
-                    ref, 'optional_string')),
+                (ref, 'optional_string'),
                 "Expected a string, but got: {}".format(
                     type(value_20)))
         else:
@@ -646,20 +1639,16 @@ def some_graph_from(
     if value_22 is not None:
         if not isinstance(value_22, str):
             errors.add(
-                '/'.join((
-                    ref, 'optional_time')),
+                (ref, 'optional_time'),
                 "Expected a string, but got: {}".format(
                     type(value_22)))
         else:
             try:
-                graph.optional_time = datetime.datetime.strptime(
-                    value_22,
-                    '%H:%M:%S'
-                ).time()
+                graph.optional_time = _time_from_string_H_58_M_58_S(
+                    value_22)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'optional_time')),
+                    (ref, 'optional_time'),
                     'Expected to strptime %H:%M:%S, but got: {}'.format(
                         value_22))
 
@@ -677,8 +1666,7 @@ def some_graph_from(
     if value_24 is not None:
         if not isinstance(value_24, str):
             errors.add(
-                '/'.join((
-                    ref, 'optional_time_zone')),
+                (ref, 'optional_time_zone'),
                 "Expected a string, but got: {}".format(
                     type(value_24)))
         else:
@@ -698,8 +1686,7 @@ def some_graph_from(
     if value_26 is not None:
         if not isinstance(value_26, str):
             errors.add(
-                '/'.join((
-                    ref, 'optional_reference')),
+                (ref, 'optional_reference'),
                 "Expected a str, but got: {}".format(
                     type(value_26)))
         else:
@@ -708,8 +1695,7 @@ def some_graph_from(
                 None)
             if target_27 is None:
                 errors.add(
-                    '/'.join((
-                        ref, 'optional_reference')),
+                    (ref, 'optional_reference'),
                     'Reference to an instance of class Empty not found: {}'.format(
                         value_26))
             else:
@@ -727,16 +1713,12 @@ def some_graph_from(
         None)
 
     if value_28 is not None:
-        target_29 = (
-            some.graph.parse.placeholder_some_embed()
-        )
-        _some_embed_from(
+        target_29 = _some_embed_from(
             value_28,
-            '/'.join((
-                ref, 'optional_embed')),
-            target_29,
+            (ref, 'optional_embed'),
             errors)
-        graph.optional_embed = target_29
+        if target_29 is not None:
+            graph.optional_embed = target_29
 
     if errors.full():
         return None
@@ -6,6 +6,7 @@
 
 import collections
 import datetime
+import json
 import typing
 
 import some.graph
@@ -297,4 +298,254 @@ def serialize_some_graph(
     return target
 
 
+class _WriteBuffer:
+    """buffers the chunks of text before writing them to a file."""
+
+    def __init__(self, fp: typing.TextIO, size: int) -> None:
+        """
+        initializes the buffer.
+
+        :param fp: file-like object to write to
+        :param size: number of characters to buffer before writing
+        """
+        self.fp = fp
+        self.size = size
+        self._chunks = []  # type: typing.List[str]
+        self._length = 0
+
+    def write(self, text: str) -> None:
+        """buffers the text and writes it out if the buffer is full."""
+        self._chunks.append(text)
+        self._length += len(text)
+
+        if self._length >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        """writes out the buffered text."""
+        if self._chunks:
+            self.fp.write(''.join(self._chunks))
+            self._chunks = []
+            self._length = 0
+
+
+def write_some_graph_json(
+        instance: some.graph.SomeGraph,
+        fp: typing.TextIO,
+        buffer_size: int = 65536
+) -> None:
+    """
+    writes an instance of SomeGraph as JSON text to ``fp``.
+
+    The text is the same as ``json.dumps(serialize_some_graph(instance))``, but
+    the properties and the class instances are serialized one at a time
+    so that the whole JSONable never needs to be held in memory.
+
+    :param instance: the instance of SomeGraph to be written
+    :param fp: file-like object to write the JSON text to
+    :param buffer_size:
+        number of characters buffered before they are written to ``fp``
+    :return:
+    """
+    buffer = _WriteBuffer(fp=fp, size=buffer_size)
+
+    buffer.write('{')
+    delimiter = ''
+
+    ##
+    # Write optional_array
+    ##
+
+    if instance.optional_array is not None:
+        jsonable_optional_array = (
+            instance.optional_array[:]
+        )
+        buffer.write(delimiter)
+        buffer.write('"optional_array": ')
+        buffer.write(json.dumps(jsonable_optional_array))
+        delimiter = ', '
+
+    ##
+    # Write optional_boolean
+    ##
+
+    if instance.optional_boolean is not None:
+        jsonable_optional_boolean = instance.optional_boolean
+        buffer.write(delimiter)
+        buffer.write('"optional_boolean": ')
+        buffer.write(json.dumps(jsonable_optional_boolean))
+        delimiter = ', '
+
+    ##
+    # Write optional_date
+    ##
+
+    if instance.optional_date is not None:
+        jsonable_optional_date = instance.optional_date.strftime('%Y-%m-%d')
+        buffer.write(delimiter)
+        buffer.write('"optional_date": ')
+        buffer.write(json.dumps(jsonable_optional_date))
+        delimiter = ', '
+
+    ##
+    # Write optional_datetime
+    ##
+
+    if instance.optional_datetime is not None:
+        jsonable_optional_datetime = instance.optional_datetime.strftime('%Y-%m-%dT%H:%M:%SZ')
+        buffer.write(delimiter)
+        buffer.write('"optional_datetime": ')
+        buffer.write(json.dumps(jsonable_optional_datetime))
+        delimiter = ', '
+
+    ##
+    # Write optional_duration
+    ##
+
+    if instance.optional_duration is not None:
+        jsonable_optional_duration = _duration_to_string(instance.optional_duration)
+        buffer.write(delimiter)
+        buffer.write('"optional_duration": ')
+        buffer.write(json.dumps(jsonable_optional_duration))
+        delimiter = ', '
+
+    ##
+    # Write optional_float
+    ##
+
+    if instance.optional_float is not None:
+        jsonable_optional_float = instance.optional_float
+        buffer.write(delimiter)
+        buffer.write('"optional_float": ')
+        buffer.write(json.dumps(jsonable_optional_float))
+        delimiter = ', '
+
+    ##
+    # Write optional_integer
+    ##
+
+    if instance.optional_integer is not None:
+        jsonable_optional_integer = instance.optional_integer
+        buffer.write(delimiter)
+        buffer.write('"optional_integer": ')
+        buffer.write(json.dumps(jsonable_optional_integer))
+        delimiter = ', '
+
+    ##
+    # Write optional_map
+    ##
+
+    if instance.optional_map is not None:
+        if isinstance(instance.optional_map, collections.OrderedDict):
+            target_1 = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, int]
+        else:
+            target_1 = dict()
+
+        for key_1, value_1 in instance.optional_map.items():
+            target_1[key_1] = value_1
+        jsonable_optional_map = target_1
+        buffer.write(delimiter)
+        buffer.write('"optional_map": ')
+        buffer.write(json.dumps(jsonable_optional_map))
+        delimiter = ', '
+
+    ##
+    # Write optional_path
+    ##
+
+    if instance.optional_path is not None:
+        jsonable_optional_path = str(instance.optional_path)
+        buffer.write(delimiter)
+        buffer.write('"optional_path": ')
+        buffer.write(json.dumps(jsonable_optional_path))
+        delimiter = ', '
+
+    ##
+    # Write optional_string
+    ##
+
+    if instance.optional_string is not None:
+        jsonable_optional_string = instance.optional_string
+        buffer.write(delimiter)
+        buffer.write('"optional_string": ')
+        buffer.write(json.dumps(jsonable_optional_string))
+        delimiter = ', '
+
+    ##
+    # Write optional_time
+    ##
+
+    if instance.optional_time is not None:
+        jsonable_optional_time = instance.optional_time.strftime('%H:%M:%S')
+        buffer.write(delimiter)
+        buffer.write('"optional_time": ')
+        buffer.write(json.dumps(jsonable_optional_time))
+        delimiter = ', '
+
+    ##
+    # Write optional_time_zone
+    ##
+
+    if instance.optional_time_zone is not None:
+        jsonable_optional_time_zone = instance.optional_time_zone
+        buffer.write(delimiter)
+        buffer.write('"optional_time_zone": ')
+        buffer.write(json.dumps(jsonable_optional_time_zone))
+        delimiter = ', '
+
+    ##
+    # Write optional_reference
+    ##
+
+    if instance.optional_reference is not None:
+        jsonable_optional_reference = instance.optional_reference.id
+        buffer.write(delimiter)
+        buffer.write('"optional_reference": ')
+        buffer.write(json.dumps(jsonable_optional_reference))
+        delimiter = ', '
+
+    ##
+    # Write optional_embed
+    ##
+
+    if instance.optional_embed is not None:
+        jsonable_optional_embed = serialize_some_embed(instance.optional_embed)
+        buffer.write(delimiter)
+        buffer.write('"optional_embed": ')
+        buffer.write(json.dumps(jsonable_optional_embed))
+        delimiter = ', '
+
+    ##
+    # Write instance registry of Empty
+    ##
+
+    if len(instance.empties) > 0:
+        buffer.write(delimiter)
+        buffer.write('"empties": {')
+
+        registry_delimiter = ''
+        for id, empty_instance in instance.empties.items():
+            if id != empty_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of Empty, but got: {!r}'.format(
+                        id, empty_instance.id))
+
+            buffer.write(registry_delimiter)
+            buffer.write(json.dumps(id))
+            buffer.write(': ')
+            buffer.write(
+                json.dumps(
+                    serialize_empty(
+                        instance=empty_instance)))
+            registry_delimiter = ', '
+
+        buffer.write('}')
+        delimiter = ', '
+
+    buffer.write('}')
+    buffer.flush()
+
+
 # File automatically generated by mapry. DO NOT EDIT OR APPEND!
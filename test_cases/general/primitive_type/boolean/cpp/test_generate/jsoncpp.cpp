@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_bool
   ////
 
   if (!value.isMember("some_bool")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_bool");
   } else {
     const Json::Value& value_0 = value["some_bool"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected a bool, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_bool"),
+        parse::Ref(graph_ref, "some_bool"),
         message(
           expected_but_got,
           strlen(expected_but_got),
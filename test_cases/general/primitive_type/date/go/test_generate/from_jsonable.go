@@ -4,10 +4,118 @@ package somegraph
 
 import (
 	"fmt"
-	"strings"
 	"time"
 )
 
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+	for i := 0; i < len(text); i++ {
+		if text[i] < '0' || text[i] > '9' {
+			return 0, false
+		}
+		value = value*10 + int(text[i]-'0')
+	}
+	return value, true
+}
+
+// timeFromFixedY_47_m_47_d parses the text
+// in the layout "2006/01/02" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_47_m_47_d(text string) (t time.Time, ok bool) {
+	if len(text) != 10 ||
+		text[4:5] != "/" ||
+		text[7:8] != "/" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		0,
+		0,
+		0,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
+// timeFromFixedY_45_m_45_d parses the text
+// in the layout "2006-01-02" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_45_m_45_d(text string) (t time.Time, ok bool) {
+	if len(text) != 10 ||
+		text[4:5] != "-" ||
+		text[7:8] != "-" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		0,
+		0,
+		0,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
 // If there are any errors, the state of target is undefined.
@@ -44,6 +152,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeDate
 	////
@@ -52,30 +162,28 @@ func SomeGraphFromJSONable(
 		"some_date"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_date")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_date"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_date"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
-			target1, err1 := time.Parse(
-				"2006/01/02",
-				cast1)
+			target1, fixed1 := timeFromFixedY_47_m_47_d(cast1)
+			var err1 error
+			if !fixed1 {
+				target1, err1 = time.Parse(
+					"2006/01/02",
+					cast1)
+			}
 			if err1 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_date"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_date"),
 					fmt.Sprintf(
 						"expected layout 2006/01/02, got: %s",
 						cast1))
@@ -97,30 +205,28 @@ func SomeGraphFromJSONable(
 		"formatless_date"]
 
 	if !ok2 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: formatless_date")
 	} else {
 		cast3, ok3 := value2.(string)
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "formatless_date"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("formatless_date"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value2))
 		} else {
-			target3, err3 := time.Parse(
-				"2006-01-02",
-				cast3)
+			target3, fixed3 := timeFromFixedY_45_m_45_d(cast3)
+			var err3 error
+			if !fixed3 {
+				target3, err3 = time.Parse(
+					"2006-01-02",
+					cast3)
+			}
 			if err3 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "formatless_date"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("formatless_date"),
 					fmt.Sprintf(
 						"expected layout 2006-01-02, got: %s",
 						cast3))
@@ -5,12 +5,77 @@
 
 
 import datetime
+import re
 import typing
 
 import some.graph
 import some.graph.parse
 
 
+_DATE_Y_47_m_47_d_RE = re.compile(
+    r'([0-9]{4})/([0-9]{2})/([0-9]{2})\Z')
+
+
+def _date_from_string_Y_47_m_47_d(text: str) -> datetime.date:
+    """
+    parses the date from the string in the format '%Y/%m/%d'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: date
+    :raise: ValueError if the string could not be parsed
+
+    >>> _date_from_string_Y_47_m_47_d('2016/07/03')
+    datetime.date(2016, 7, 3)
+
+    """
+    match = _DATE_Y_47_m_47_d_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.date(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y/%m/%d').date()
+
+
+_DATE_Y_45_m_45_d_RE = re.compile(
+    r'([0-9]{4})\-([0-9]{2})\-([0-9]{2})\Z')
+
+
+def _date_from_string_Y_45_m_45_d(text: str) -> datetime.date:
+    """
+    parses the date from the string in the format '%Y-%m-%d'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: date
+    :raise: ValueError if the string could not be parsed
+
+    >>> _date_from_string_Y_45_m_45_d('2016-07-03')
+    datetime.date(2016, 7, 3)
+
+    """
+    match = _DATE_Y_45_m_45_d_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.date(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y-%m-%d').date()
+
+
 def some_graph_from(
         value: typing.Any,
         ref: str,
@@ -50,20 +115,16 @@ def some_graph_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'some_date')),
+                (ref, 'some_date'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
             try:
-                graph.some_date = datetime.datetime.strptime(
-                    value_0,
-                    '%Y/%m/%d'
-                ).date()
+                graph.some_date = _date_from_string_Y_47_m_47_d(
+                    value_0)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'some_date')),
+                    (ref, 'some_date'),
                     'Expected to strptime %Y/%m/%d, but got: {}'.format(
                         value_0))
 
@@ -85,20 +146,16 @@ def some_graph_from(
     else:
         if not isinstance(value_2, str):
             errors.add(
-                '/'.join((
-                    ref, 'formatless_date')),
+                (ref, 'formatless_date'),
                 "Expected a string, but got: {}".format(
                     type(value_2)))
         else:
             try:
-                graph.formatless_date = datetime.datetime.strptime(
-                    value_2,
-                    '%Y-%m-%d'
-                ).date()
+                graph.formatless_date = _date_from_string_Y_45_m_45_d(
+                    value_2)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'formatless_date')),
+                    (ref, 'formatless_date'),
                     'Expected to strptime %Y-%m-%d, but got: {}'.format(
                         value_2))
 
@@ -109,3 +166,67 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse some_date
+    ##
+
+    graph.some_date = _date_from_string_Y_47_m_47_d(
+        value['some_date'])
+
+    ##
+    # Parse formatless_date
+    ##
+
+    graph.formatless_date = _date_from_string_Y_45_m_45_d(
+        value['formatless_date'])
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -4,10 +4,162 @@ package somegraph
 
 import (
 	"fmt"
-	"strings"
 	"time"
 )
 
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+	for i := 0; i < len(text); i++ {
+		if text[i] < '0' || text[i] > '9' {
+			return 0, false
+		}
+		value = value*10 + int(text[i]-'0')
+	}
+	return value, true
+}
+
+// timeFromFixedY_47_m_47_d_32_H_45_M_45_S_90 parses the text
+// in the layout "2006/01/02 15-04-05Z" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_47_m_47_d_32_H_45_M_45_S_90(text string) (t time.Time, ok bool) {
+	if len(text) != 20 ||
+		text[4:5] != "/" ||
+		text[7:8] != "/" ||
+		text[10:11] != " " ||
+		text[13:14] != "-" ||
+		text[16:17] != "-" ||
+		text[19:20] != "Z" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	hour, ok := fixedDigits(text[11:13])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	minute, ok := fixedDigits(text[14:16])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	second, ok := fixedDigits(text[17:19])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		hour,
+		minute,
+		second,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day ||
+		t.Hour() != hour ||
+		t.Minute() != minute ||
+		t.Second() != second {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
+// timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90 parses the text
+// in the layout "2006-01-02T15:04:05Z" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90(text string) (t time.Time, ok bool) {
+	if len(text) != 20 ||
+		text[4:5] != "-" ||
+		text[7:8] != "-" ||
+		text[10:11] != "T" ||
+		text[13:14] != ":" ||
+		text[16:17] != ":" ||
+		text[19:20] != "Z" {
+		return time.Time{}, false
+	}
+
+	year, ok := fixedDigits(text[0:4])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	month, ok := fixedDigits(text[5:7])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	day, ok := fixedDigits(text[8:10])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	hour, ok := fixedDigits(text[11:13])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	minute, ok := fixedDigits(text[14:16])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	second, ok := fixedDigits(text[17:19])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		year,
+		time.Month(month),
+		day,
+		hour,
+		minute,
+		second,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if year < 1 ||
+		t.Year() != year ||
+		int(t.Month()) != month ||
+		t.Day() != day ||
+		t.Hour() != hour ||
+		t.Minute() != minute ||
+		t.Second() != second {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
 // If there are any errors, the state of target is undefined.
@@ -44,6 +196,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeDatetime
 	////
@@ -52,30 +206,28 @@ func SomeGraphFromJSONable(
 		"some_datetime"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_datetime")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_datetime"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_datetime"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
-			target1, err1 := time.Parse(
-				"2006/01/02 15-04-05Z",
-				cast1)
+			target1, fixed1 := timeFromFixedY_47_m_47_d_32_H_45_M_45_S_90(cast1)
+			var err1 error
+			if !fixed1 {
+				target1, err1 = time.Parse(
+					"2006/01/02 15-04-05Z",
+					cast1)
+			}
 			if err1 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_datetime"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_datetime"),
 					fmt.Sprintf(
 						"expected layout 2006/01/02 15-04-05Z, got: %s",
 						cast1))
@@ -97,30 +249,28 @@ func SomeGraphFromJSONable(
 		"formatless_datetime"]
 
 	if !ok2 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: formatless_datetime")
 	} else {
 		cast3, ok3 := value2.(string)
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "formatless_datetime"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("formatless_datetime"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value2))
 		} else {
-			target3, err3 := time.Parse(
-				"2006-01-02T15:04:05Z",
-				cast3)
+			target3, fixed3 := timeFromFixedY_45_m_45_d_84_H_58_M_58_S_90(cast3)
+			var err3 error
+			if !fixed3 {
+				target3, err3 = time.Parse(
+					"2006-01-02T15:04:05Z",
+					cast3)
+			}
 			if err3 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "formatless_datetime"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("formatless_datetime"),
 					fmt.Sprintf(
 						"expected layout 2006-01-02T15:04:05Z, got: %s",
 						cast3))
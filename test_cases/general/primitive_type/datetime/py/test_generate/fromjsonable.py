@@ -5,12 +5,83 @@
 
 
 import datetime
+import re
 import typing
 
 import some.graph
 import some.graph.parse
 
 
+_DATETIME_Y_47_m_47_d_32_H_45_M_45_S_90_RE = re.compile(
+    r'([0-9]{4})/([0-9]{2})/([0-9]{2})\ ([0-9]{2})\-([0-9]{2})\-([0-9]{2})Z\Z')
+
+
+def _datetime_from_string_Y_47_m_47_d_32_H_45_M_45_S_90(text: str) -> datetime.datetime:
+    """
+    parses the datetime from the string in the format '%Y/%m/%d %H-%M-%SZ'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: datetime
+    :raise: ValueError if the string could not be parsed
+
+    >>> _datetime_from_string_Y_47_m_47_d_32_H_45_M_45_S_90('2016/07/03 12-34-56Z')
+    datetime.datetime(2016, 7, 3, 12, 34, 56)
+
+    """
+    match = _DATETIME_Y_47_m_47_d_32_H_45_M_45_S_90_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.datetime(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)),
+                int(match.group(4)),
+                int(match.group(5)),
+                int(match.group(6)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y/%m/%d %H-%M-%SZ')
+
+
+_DATETIME_Y_45_m_45_d_84_H_58_M_58_S_90_RE = re.compile(
+    r'([0-9]{4})\-([0-9]{2})\-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})Z\Z')
+
+
+def _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(text: str) -> datetime.datetime:
+    """
+    parses the datetime from the string in the format '%Y-%m-%dT%H:%M:%SZ'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: datetime
+    :raise: ValueError if the string could not be parsed
+
+    >>> _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90('2016-07-03T12:34:56Z')
+    datetime.datetime(2016, 7, 3, 12, 34, 56)
+
+    """
+    match = _DATETIME_Y_45_m_45_d_84_H_58_M_58_S_90_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.datetime(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)),
+                int(match.group(4)),
+                int(match.group(5)),
+                int(match.group(6)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y-%m-%dT%H:%M:%SZ')
+
+
 def some_graph_from(
         value: typing.Any,
         ref: str,
@@ -50,19 +121,16 @@ def some_graph_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'some_datetime')),
+                (ref, 'some_datetime'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
             try:
-                graph.some_datetime = datetime.datetime.strptime(
-                    value_0,
-                    '%Y/%m/%d %H-%M-%SZ')
+                graph.some_datetime = _datetime_from_string_Y_47_m_47_d_32_H_45_M_45_S_90(
+                    value_0)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'some_datetime')),
+                    (ref, 'some_datetime'),
                     'Expected to strptime %Y/%m/%d %H-%M-%SZ, but got: {}'.format(
                         value_0))
 
@@ -84,19 +152,16 @@ def some_graph_from(
     else:
         if not isinstance(value_2, str):
             errors.add(
-                '/'.join((
-                    ref, 'formatless_datetime')),
+                (ref, 'formatless_datetime'),
                 "Expected a string, but got: {}".format(
                     type(value_2)))
         else:
             try:
-                graph.formatless_datetime = datetime.datetime.strptime(
-                    value_2,
-                    '%Y-%m-%dT%H:%M:%SZ')
+                graph.formatless_datetime = _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(
+                    value_2)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'formatless_datetime')),
+                    (ref, 'formatless_datetime'),
                     'Expected to strptime %Y-%m-%dT%H:%M:%SZ, but got: {}'.format(
                         value_2))
 
@@ -107,3 +172,67 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse some_datetime
+    ##
+
+    graph.some_datetime = _datetime_from_string_Y_47_m_47_d_32_H_45_M_45_S_90(
+        value['some_datetime'])
+
+    ##
+    # Parse formatless_datetime
+    ##
+
+    graph.formatless_datetime = _datetime_from_string_Y_45_m_45_d_84_H_58_M_58_S_90(
+        value['formatless_datetime'])
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -9,7 +9,6 @@
 #include <iomanip>
 #include <limits>
 #include <memory>
-#include <regex>
 #include <sstream>
 #include <stdexcept>
 #include <string>
@@ -36,19 +35,6 @@ std::string message(const char* cc, size_t cc_size, std::string s) {
   return result;
 }
 
-namespace re {
-const std::regex kDuration(
-  "^(\\+|-)?P(((0|[1-9][0-9]*)(\\.[0-9]+)?)Y)?"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)M)?"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)W)?"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)D)?"
-  "(T"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)H)?"
-  "(((0|[1-9][0-9]*)(\\.[0-9]+)?)M)?"
-  "(((0|[1-9][0-9]*)(\\.([0-9]+))?)S)?"
-  ")?$");
-}  // namespace re
-
 /**
  * adds the left and the right and checks for the overflow.
  *
@@ -86,6 +72,133 @@ rep_t add_rep_double(rep_t left, double right, bool* overflows) {
   return rightRep + left;
 }
 
+/**
+ * represents the components of a duration in ISO 8601 format
+ * as they are written in the text.
+ *
+ * The components which are not specified are empty.
+ */
+struct DurationParts {
+  std::string sign;
+  std::string years;
+  std::string months;
+  std::string weeks;
+  std::string days;
+  std::string hours;
+  std::string minutes;
+  std::string seconds;
+  std::string fraction;
+};
+
+/**
+ * scans the duration in ISO 8601 format in a single pass.
+ *
+ * @param[in] s string to scan
+ * @param[out] parts components of the duration
+ * @return true if s conforms to the format
+ */
+bool scan_duration(const std::string& s, DurationParts* parts) {
+  size_t i = 0;
+  if (i < s.size() and (s[i] == '+' or s[i] == '-')) {
+    parts->sign = s.substr(i, 1);
+    ++i;
+  }
+
+  if (i == s.size() or s[i] != 'P') {
+    return false;
+  }
+  ++i;
+
+  // Designators of the date part are followed by
+  // the designators of the time part.
+  const char* designators = "YMWD";
+  size_t offset = 0;
+  size_t next = 0;
+
+  while (i < s.size()) {
+    if (s[i] == 'T' and offset == 0) {
+      designators = "HMS";
+      offset = 4;
+      next = 0;
+      ++i;
+      continue;
+    }
+
+    const size_t start = i;
+
+    if (s[i] == '0') {
+      ++i;
+    } else if (s[i] >= '1' and s[i] <= '9') {
+      ++i;
+      while (i < s.size() and s[i] >= '0' and s[i] <= '9') {
+        ++i;
+      }
+    } else {
+      return false;
+    }
+
+    const size_t integer_end = i;
+
+    if (i < s.size() and s[i] == '.') {
+      ++i;
+      while (i < s.size() and s[i] >= '0' and s[i] <= '9') {
+        ++i;
+      }
+
+      if (i == integer_end + 1) {
+        return false;
+      }
+    }
+
+    if (i == s.size()) {
+      return false;
+    }
+
+    size_t designator = next;
+    while (designators[designator] != '\0' and
+        designators[designator] != s[i]) {
+      ++designator;
+    }
+
+    if (designators[designator] == '\0') {
+      return false;
+    }
+
+    switch (offset + designator) {
+      case 0:
+        parts->years = s.substr(start, i - start);
+        break;
+      case 1:
+        parts->months = s.substr(start, i - start);
+        break;
+      case 2:
+        parts->weeks = s.substr(start, i - start);
+        break;
+      case 3:
+        parts->days = s.substr(start, i - start);
+        break;
+      case 4:
+        parts->hours = s.substr(start, i - start);
+        break;
+      case 5:
+        parts->minutes = s.substr(start, i - start);
+        break;
+      default:
+        parts->seconds = s.substr(start, integer_end - start);
+        if (i > integer_end) {
+          parts->fraction = s.substr(
+            integer_end + 1, i - integer_end - 1);
+        }
+        break;
+    }
+
+    next = designator + 1;
+    ++i;
+  }
+
+  return true;
+}
+
 /**
  * parses the duration from a string.
  *
@@ -103,8 +216,8 @@ rep_t add_rep_double(rep_t left, double right, bool* overflows) {
 std::chrono::nanoseconds duration_from_string(
     const std::string& s,
     std::string* error) {
-  std::smatch mtch;
-  const bool matched = std::regex_match(s, mtch, re::kDuration);
+  DurationParts parts;
+  const bool matched = scan_duration(s, &parts);
 
   if (!matched) {
     std::stringstream sserr;
@@ -119,7 +232,7 @@ std::chrono::nanoseconds duration_from_string(
   // Extract nanoseconds
   ////
 
-  const std::string nanoseconds_str = mtch[31];
+  const std::string& nanoseconds_str = parts.fraction;
   rep_t nanoseconds;
   if (nanoseconds_str.size() == 0) {
     // No nanoseconds specified
@@ -162,23 +275,23 @@ std::chrono::nanoseconds duration_from_string(
   // Extract all the other interval counts
   ////
 
-  const std::string sign_str = mtch[1];
+  const std::string& sign_str = parts.sign;
   const rep_t sign = (sign_str.empty() or sign_str == "+") ? 1 : -1;
 
   const double years(
-    (mtch[3].length() == 0) ? 0.0 : std::stod(mtch[3]));
+    parts.years.empty() ? 0.0 : std::stod(parts.years));
   const double months(
-    (mtch[7].length() == 0) ? 0.0 : std::stod(mtch[7]));
+    parts.months.empty() ? 0.0 : std::stod(parts.months));
   const double weeks(
-    (mtch[11].length() == 0) ? 0.0 : std::stod(mtch[11]));
+    parts.weeks.empty() ? 0.0 : std::stod(parts.weeks));
   const double days(
-    (mtch[15].length() == 0) ? 0.0 : std::stod(mtch[15]));
+    parts.days.empty() ? 0.0 : std::stod(parts.days));
   const double hours(
-    (mtch[20].length() == 0) ? 0.0 : std::stod(mtch[20]));
+    parts.hours.empty() ? 0.0 : std::stod(parts.hours));
   const double minutes(
-    (mtch[24].length() == 0) ? 0.0 : std::stod(mtch[24]));
+    parts.minutes.empty() ? 0.0 : std::stod(parts.minutes));
   const rep_t seconds(
-    (mtch[29].length() == 0) ? 0 : std::stol(mtch[29]));
+    parts.seconds.empty() ? 0 : std::stol(parts.seconds));
 
   ////
   // Sum
@@ -204,7 +317,7 @@ std::chrono::nanoseconds duration_from_string(
   }
   sum += seconds_as_ns;
 
-  bool overflows;
+  bool overflows = false;
 
   sum = add_rep_double(
     sum, minutes * 6e10, &overflows);
@@ -320,13 +433,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_duration
   ////
 
   if (!value.isMember("some_duration")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_duration");
   } else {
     const Json::Value& value_0 = value["some_duration"];
@@ -335,8 +450,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_duration"),
+        parse::Ref(graph_ref, "some_duration"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -353,8 +467,7 @@ void some_graph_from(
           "Invalid duration: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_duration"),
+          parse::Ref(graph_ref, "some_duration"),
           message(
             invalid_duration,
             strlen(invalid_duration),
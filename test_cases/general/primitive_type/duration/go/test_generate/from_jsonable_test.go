@@ -2,7 +2,11 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import "fmt"
+import (
+	"encoding/json"
+	"fmt"
+	"testing"
+)
 
 func ExampleDurationFromString_invalid() {
 	_, err := durationFromString("some wrong text")
@@ -10,7 +14,7 @@ func ExampleDurationFromString_invalid() {
 		panic("Unexpected nil error");
 	}
 	fmt.Println(err.Error())
-	// Output: failed to match the duration pattern on: some wrong text
+	// Output: failed to match the duration pattern
 }
 
 func ExampleDurationFromString_oneYear() {
@@ -97,7 +101,69 @@ func ExampleDurationFromString_negative() {
 func ExampleDurationFromString_overflow() {
 	_, err := durationFromString("P300Y")
 	fmt.Println(err.Error())
-	// Output: overflows in nanoseconds: P300Y
+	// Output: overflow in nanoseconds
+}
+
+func BenchmarkDurationFromString(b *testing.B) {
+	texts := []string{
+		"P10Y",
+		"P1M",
+		"P1W",
+		"P1D",
+		"PT1H1M1S",
+		"PT1H1M1.1S",
+		"PT",
+		"P1.1Y1.1M1.1W1.1DT1.1H1.1M1.1S",
+		"PT0.000001S",
+		"PT1.000S",
+		"-P1D"}
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		for _, text := range texts {
+			_, err := durationFromString(text)
+			if err != nil {
+				b.Fatal(err)
+			}
+		}
+	}
+}
+
+func BenchmarkSomeGraphFromJSONable(b *testing.B) {
+	var value interface{}
+	err := json.Unmarshal(syntheticSomeGraphJSON(b), &value)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		errors := NewErrors(0)
+		SomeGraphFromJSONable(
+			value, "#", &SomeGraph{}, errors)
+		if !errors.Empty() {
+			b.Fatal(errors.Values()[0].Message)
+		}
+	}
+}
+
+func BenchmarkSomeGraphFromJSONBytes(b *testing.B) {
+	data := syntheticSomeGraphJSON(b)
+
+	b.ReportAllocs()
+	b.SetBytes(int64(len(data)))
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		errors := NewErrors(0)
+		SomeGraphFromJSONBytes(
+			data, "#", &SomeGraph{}, errors)
+		if !errors.Empty() {
+			b.Fatal(errors.Values()[0].Message)
+		}
+	}
 }
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -4,6 +4,8 @@ package somegraph
 
 import (
 	"fmt"
+	"io/ioutil"
+	"testing"
 	"time"
 )
 
@@ -56,4 +58,32 @@ func ExampleDurationToString_nanoseconds() {
 	// Output: PT0.000000001S
 }
 
+func BenchmarkSomeGraphToJSONable(b *testing.B) {
+	instance := newSyntheticSomeGraph()
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		_, err := SomeGraphToJSONable(instance)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkSomeGraphWriteJSON(b *testing.B) {
+	instance := newSyntheticSomeGraph()
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		err := SomeGraphWriteJSON(ioutil.Discard, instance)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_float_gt_0_lt_100
   ////
 
   if (!value.isMember("some_float_gt_0_lt_100")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_float_gt_0_lt_100");
   } else {
     const Json::Value& value_0 = value["some_float_gt_0_lt_100"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected a double, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_float_gt_0_lt_100"),
+        parse::Ref(graph_ref, "some_float_gt_0_lt_100"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -116,8 +117,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_float_gt_0_lt_100"),
+          parse::Ref(graph_ref, "some_float_gt_0_lt_100"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -132,8 +132,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_float_gt_0_lt_100"),
+          parse::Ref(graph_ref, "some_float_gt_0_lt_100"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -156,7 +155,7 @@ void some_graph_from(
 
   if (!value.isMember("some_float_ge_0_le_100")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_float_ge_0_le_100");
   } else {
     const Json::Value& value_1 = value["some_float_ge_0_le_100"];
@@ -165,8 +164,7 @@ void some_graph_from(
         "Expected a double, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_float_ge_0_le_100"),
+        parse::Ref(graph_ref, "some_float_ge_0_le_100"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -183,8 +181,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_float_ge_0_le_100"),
+          parse::Ref(graph_ref, "some_float_ge_0_le_100"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -199,8 +196,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_float_ge_0_le_100"),
+          parse::Ref(graph_ref, "some_float_ge_0_le_100"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -223,7 +219,7 @@ void some_graph_from(
 
   if (!value.isMember("unconstrained_float")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: unconstrained_float");
   } else {
     const Json::Value& value_2 = value["unconstrained_float"];
@@ -232,8 +228,7 @@ void some_graph_from(
         "Expected a double, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/unconstrained_float"),
+        parse::Ref(graph_ref, "unconstrained_float"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -2,10 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -43,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeFloatGt0Lt100
 	////
@@ -51,36 +50,27 @@ func SomeGraphFromJSONable(
 		"some_float_gt_0_lt_100"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_float_gt_0_lt_100")
 	} else {
 		cast1, ok1 := value0.(float64)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_float_gt_0_lt_100"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_float_gt_0_lt_100"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value0))
 		} else {
 			if !(cast1 > 0) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_float_gt_0_lt_100"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_float_gt_0_lt_100"),
 					fmt.Sprintf(
 						"expected > 0.000000, but got: %f",
 						cast1))
 			} else if !(cast1 < 100) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_float_gt_0_lt_100"},
-							"/"),
+				errors.AddRef(
+					graphRef.Key("some_float_gt_0_lt_100"),
 					fmt.Sprintf(
 						"expected < 100.000000, but got: %f",
 						cast1))
@@ -102,36 +92,27 @@ func SomeGraphFromJSONable(
 		"some_float_ge_0_le_100"]
 
 	if !ok2 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_float_ge_0_le_100")
 	} else {
 		cast3, ok3 := value2.(float64)
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_float_ge_0_le_100"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_float_ge_0_le_100"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value2))
 		} else {
 			if !(cast3 >= 0) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_float_ge_0_le_100"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_float_ge_0_le_100"),
 					fmt.Sprintf(
 						"expected >= 0.000000, but got: %f",
 						cast3))
 			} else if !(cast3 <= 100) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_float_ge_0_le_100"},
-							"/"),
+				errors.AddRef(
+					graphRef.Key("some_float_ge_0_le_100"),
 					fmt.Sprintf(
 						"expected <= 100.000000, but got: %f",
 						cast3))
@@ -153,17 +134,14 @@ func SomeGraphFromJSONable(
 		"unconstrained_float"]
 
 	if !ok4 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: unconstrained_float")
 	} else {
 		cast5, ok5 := value4.(float64)
 		if !ok5 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "unconstrained_float"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("unconstrained_float"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value4))
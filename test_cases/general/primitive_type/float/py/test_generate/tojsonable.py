@@ -5,6 +5,7 @@
 
 
 import collections
+import json
 import typing
 
 import some.graph
@@ -51,4 +52,92 @@ def serialize_some_graph(
     return target
 
 
+class _WriteBuffer:
+    """buffers the chunks of text before writing them to a file."""
+
+    def __init__(self, fp: typing.TextIO, size: int) -> None:
+        """
+        initializes the buffer.
+
+        :param fp: file-like object to write to
+        :param size: number of characters to buffer before writing
+        """
+        self.fp = fp
+        self.size = size
+        self._chunks = []  # type: typing.List[str]
+        self._length = 0
+
+    def write(self, text: str) -> None:
+        """buffers the text and writes it out if the buffer is full."""
+        self._chunks.append(text)
+        self._length += len(text)
+
+        if self._length >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        """writes out the buffered text."""
+        if self._chunks:
+            self.fp.write(''.join(self._chunks))
+            self._chunks = []
+            self._length = 0
+
+
+def write_some_graph_json(
+        instance: some.graph.SomeGraph,
+        fp: typing.TextIO,
+        buffer_size: int = 65536
+) -> None:
+    """
+    writes an instance of SomeGraph as JSON text to ``fp``.
+
+    The text is the same as ``json.dumps(serialize_some_graph(instance))``, but
+    the properties are serialized one at a time
+    so that the whole JSONable never needs to be held in memory.
+
+    :param instance: the instance of SomeGraph to be written
+    :param fp: file-like object to write the JSON text to
+    :param buffer_size:
+        number of characters buffered before they are written to ``fp``
+    :return:
+    """
+    buffer = _WriteBuffer(fp=fp, size=buffer_size)
+
+    buffer.write('{')
+    delimiter = ''
+
+    ##
+    # Write some_float_gt_0_lt_100
+    ##
+
+    jsonable_some_float_gt_0_lt_100 = instance.some_float_gt_0_lt_100
+    buffer.write(delimiter)
+    buffer.write('"some_float_gt_0_lt_100": ')
+    buffer.write(json.dumps(jsonable_some_float_gt_0_lt_100))
+    delimiter = ', '
+
+    ##
+    # Write some_float_ge_0_le_100
+    ##
+
+    jsonable_some_float_ge_0_le_100 = instance.some_float_ge_0_le_100
+    buffer.write(delimiter)
+    buffer.write('"some_float_ge_0_le_100": ')
+    buffer.write(json.dumps(jsonable_some_float_ge_0_le_100))
+    delimiter = ', '
+
+    ##
+    # Write unconstrained_float
+    ##
+
+    jsonable_unconstrained_float = instance.unconstrained_float
+    buffer.write(delimiter)
+    buffer.write('"unconstrained_float": ')
+    buffer.write(json.dumps(jsonable_unconstrained_float))
+    delimiter = ', '
+
+    buffer.write('}')
+    buffer.flush()
+
+
 # File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -5,7 +5,6 @@ package somegraph
 import (
 	"fmt"
 	"math"
-	"strings"
 )
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
@@ -44,6 +43,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeIntGt0Lt100
 	////
@@ -52,26 +53,20 @@ func SomeGraphFromJSONable(
 		"some_int_gt_0_lt_100"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_int_gt_0_lt_100")
 	} else {
 		fcast1, ok1 := value0.(float64)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int_gt_0_lt_100"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int_gt_0_lt_100"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value0))
 		} else if fcast1 != math.Trunc(fcast1) {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int_gt_0_lt_100"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int_gt_0_lt_100"),
 				fmt.Sprintf(
 					"expected a whole number, but got: %f",
 					fcast1))
@@ -80,11 +75,8 @@ func SomeGraphFromJSONable(
 		} else if fcast1 >= 9223372036854775808.0 ||
 			fcast1 < -9223372036854775808.0 {
 
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int_gt_0_lt_100"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int_gt_0_lt_100"),
 				fmt.Sprintf(
 					"expected the value to fit into int64, but got an overflow: %f",
 					fcast1))
@@ -92,20 +84,14 @@ func SomeGraphFromJSONable(
 			cast1 := int64(fcast1)
 
 			if !(cast1 > 0) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_int_gt_0_lt_100"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_int_gt_0_lt_100"),
 					fmt.Sprintf(
 						"expected > 0, but got: %d",
 						cast1))
 			} else if !(cast1 < 100) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_int_gt_0_lt_100"},
-							"/"),
+				errors.AddRef(
+					graphRef.Key("some_int_gt_0_lt_100"),
 					fmt.Sprintf(
 						"expected < 100, but got: %d",
 						cast1))
@@ -127,26 +113,20 @@ func SomeGraphFromJSONable(
 		"some_int_ge_0_le_100"]
 
 	if !ok2 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_int_ge_0_le_100")
 	} else {
 		fcast3, ok3 := value2.(float64)
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int_ge_0_le_100"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int_ge_0_le_100"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value2))
 		} else if fcast3 != math.Trunc(fcast3) {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int_ge_0_le_100"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int_ge_0_le_100"),
 				fmt.Sprintf(
 					"expected a whole number, but got: %f",
 					fcast3))
@@ -155,11 +135,8 @@ func SomeGraphFromJSONable(
 		} else if fcast3 >= 9223372036854775808.0 ||
 			fcast3 < -9223372036854775808.0 {
 
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int_ge_0_le_100"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int_ge_0_le_100"),
 				fmt.Sprintf(
 					"expected the value to fit into int64, but got an overflow: %f",
 					fcast3))
@@ -167,20 +144,14 @@ func SomeGraphFromJSONable(
 			cast3 := int64(fcast3)
 
 			if !(cast3 >= 0) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_int_ge_0_le_100"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_int_ge_0_le_100"),
 					fmt.Sprintf(
 						"expected >= 0, but got: %d",
 						cast3))
 			} else if !(cast3 <= 100) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_int_ge_0_le_100"},
-							"/"),
+				errors.AddRef(
+					graphRef.Key("some_int_ge_0_le_100"),
 					fmt.Sprintf(
 						"expected <= 100, but got: %d",
 						cast3))
@@ -202,26 +173,20 @@ func SomeGraphFromJSONable(
 		"unconstrained_int"]
 
 	if !ok4 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: unconstrained_int")
 	} else {
 		fcast5, ok5 := value4.(float64)
 		if !ok5 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "unconstrained_int"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("unconstrained_int"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value4))
 		} else if fcast5 != math.Trunc(fcast5) {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "unconstrained_int"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("unconstrained_int"),
 				fmt.Sprintf(
 					"expected a whole number, but got: %f",
 					fcast5))
@@ -230,11 +195,8 @@ func SomeGraphFromJSONable(
 		} else if fcast5 >= 9223372036854775808.0 ||
 			fcast5 < -9223372036854775808.0 {
 
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "unconstrained_int"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("unconstrained_int"),
 				fmt.Sprintf(
 					"expected the value to fit into int64, but got an overflow: %f",
 					fcast5))
@@ -49,21 +49,18 @@ def some_graph_from(
     else:
         if not isinstance(value_0, int):
             errors.add(
-                '/'.join((
-                    ref, 'some_int_gt_0_lt_100')),
+                (ref, 'some_int_gt_0_lt_100'),
                 "Expected an integer, but got: {}".format(
                     type(value_0)))
         else:
             if not (value_0 > 0):
                 errors.add(
-                    '/'.join((
-                        ref, 'some_int_gt_0_lt_100')),
+                    (ref, 'some_int_gt_0_lt_100'),
                     'Expected > 0, but got: {}'.format(
                         value_0))
             if not (value_0 < 100):
                 errors.add(
-                    '/'.join((
-                        ref, 'some_int_gt_0_lt_100')),
+                    (ref, 'some_int_gt_0_lt_100'),
                     'Expected < 100, but got: {}'.format(
                         value_0))
             else:
@@ -87,21 +84,18 @@ def some_graph_from(
     else:
         if not isinstance(value_2, int):
             errors.add(
-                '/'.join((
-                    ref, 'some_int_ge_0_le_100')),
+                (ref, 'some_int_ge_0_le_100'),
                 "Expected an integer, but got: {}".format(
                     type(value_2)))
         else:
             if not (value_2 >= 0):
                 errors.add(
-                    '/'.join((
-                        ref, 'some_int_ge_0_le_100')),
+                    (ref, 'some_int_ge_0_le_100'),
                     'Expected >= 0, but got: {}'.format(
                         value_2))
             if not (value_2 <= 100):
                 errors.add(
-                    '/'.join((
-                        ref, 'some_int_ge_0_le_100')),
+                    (ref, 'some_int_ge_0_le_100'),
                     'Expected <= 100, but got: {}'.format(
                         value_2))
             else:
@@ -125,8 +119,7 @@ def some_graph_from(
     else:
         if not isinstance(value_4, int):
             errors.add(
-                '/'.join((
-                    ref, 'unconstrained_int')),
+                (ref, 'unconstrained_int'),
                 "Expected an integer, but got: {}".format(
                     type(value_4)))
         else:
@@ -139,3 +132,88 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse some_int_gt_0_lt_100
+    ##
+
+    value_1 = value['some_int_gt_0_lt_100']
+    if not isinstance(value_1, int):
+        raise TypeError("Expected an integer")
+    if not (value_1 > 0):
+        raise ValueError('Expected > 0')
+    if not (value_1 < 100):
+        raise ValueError('Expected < 100')
+    graph.some_int_gt_0_lt_100 = value_1
+
+    ##
+    # Parse some_int_ge_0_le_100
+    ##
+
+    value_3 = value['some_int_ge_0_le_100']
+    if not isinstance(value_3, int):
+        raise TypeError("Expected an integer")
+    if not (value_3 >= 0):
+        raise ValueError('Expected >= 0')
+    if not (value_3 <= 100):
+        raise ValueError('Expected <= 100')
+    graph.some_int_ge_0_le_100 = value_3
+
+    ##
+    # Parse unconstrained_int
+    ##
+
+    value_5 = value['unconstrained_int']
+    if not isinstance(value_5, int):
+        raise TypeError("Expected an integer")
+    graph.unconstrained_int = value_5
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
@@ -84,13 +84,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_path
   ////
 
   if (!value.isMember("some_path")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_path");
   } else {
     const Json::Value& value_0 = value["some_path"];
@@ -99,8 +101,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_path"),
+        parse::Ref(graph_ref, "some_path"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -119,8 +120,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_path"),
+          parse::Ref(graph_ref, "some_path"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -145,7 +145,7 @@ void some_graph_from(
 
   if (!value.isMember("unconstrained_path")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: unconstrained_path");
   } else {
     const Json::Value& value_1 = value["unconstrained_path"];
@@ -154,8 +154,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/unconstrained_path"),
+        parse::Ref(graph_ref, "unconstrained_path"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -84,13 +84,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_str
   ////
 
   if (!value.isMember("some_str")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_str");
   } else {
     const Json::Value& value_0 = value["some_str"];
@@ -99,8 +101,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_str"),
+        parse::Ref(graph_ref, "some_str"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -119,8 +120,7 @@ void some_graph_from(
           ", but got: ");
 
         errors->add(
-          std::string(ref)
-            .append("/some_str"),
+          parse::Ref(graph_ref, "some_str"),
           message(
             expected_but_got,
             strlen(expected_but_got),
@@ -143,7 +143,7 @@ void some_graph_from(
 
   if (!value.isMember("unconstrained_str")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: unconstrained_str");
   } else {
     const Json::Value& value_1 = value["unconstrained_str"];
@@ -152,8 +152,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/unconstrained_str"),
+        parse::Ref(graph_ref, "unconstrained_str"),
         message(
           expected_but_got,
           strlen(expected_but_got),
@@ -5,7 +5,6 @@ package somegraph
 import (
 	"fmt"
 	"regexp"
-	"strings"
 )
 
 var pattern0 = regexp.MustCompile(
@@ -47,6 +46,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeStr
 	////
@@ -55,27 +56,21 @@ func SomeGraphFromJSONable(
 		"some_str"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_str")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_str"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_str"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
 			if !pattern0.MatchString(cast1) {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_str"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_str"),
 					fmt.Sprintf(
 						"expected to match ^[a-zA-Z]*$, but got: %s",
 						cast1))
@@ -97,17 +92,14 @@ func SomeGraphFromJSONable(
 		"unconstrained_str"]
 
 	if !ok2 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: unconstrained_str")
 	} else {
 		cast3, ok3 := value2.(string)
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "unconstrained_str"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("unconstrained_str"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value2))
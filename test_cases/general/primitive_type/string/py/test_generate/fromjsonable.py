@@ -50,8 +50,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'some_str')),
+                (ref, 'some_str'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
@@ -59,8 +58,7 @@ def some_graph_from(
                     r'^[a-zA-Z]*$',
                     value_0):
                 errors.add(
-                    '/'.join((
-                        ref, 'some_str')),
+                    (ref, 'some_str'),
                     'Expected to match ^[a-zA-Z]*$, but got: {}'.format(
                         value_0))
             else:
@@ -84,8 +82,7 @@ def some_graph_from(
     else:
         if not isinstance(value_2, str):
             errors.add(
-                '/'.join((
-                    ref, 'unconstrained_str')),
+                (ref, 'unconstrained_str'),
                 "Expected a string, but got: {}".format(
                     type(value_2)))
         else:
@@ -98,3 +95,75 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse some_str
+    ##
+
+    value_1 = value['some_str']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    if not re.match(
+            r'^[a-zA-Z]*$',
+            value_1):
+        raise ValueError('Expected to match ^[a-zA-Z]*$')
+    graph.some_str = value_1
+
+    ##
+    # Parse unconstrained_str
+    ##
+
+    value_3 = value['unconstrained_str']
+    if not isinstance(value_3, str):
+        raise TypeError("Expected a string")
+    graph.unconstrained_str = value_3
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
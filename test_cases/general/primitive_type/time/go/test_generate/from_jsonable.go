@@ -4,10 +4,116 @@ package somegraph
 
 import (
 	"fmt"
-	"strings"
 	"time"
 )
 
+// fixedDigits converts the zero-padded decimal digits to an integer.
+//
+// ok is false if the text contains anything else but the ASCII digits.
+func fixedDigits(text string) (value int, ok bool) {
+	for i := 0; i < len(text); i++ {
+		if text[i] < '0' || text[i] > '9' {
+			return 0, false
+		}
+		value = value*10 + int(text[i]-'0')
+	}
+	return value, true
+}
+
+// timeFromFixedH_45_M_45_S parses the text
+// in the layout "15-04-05" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedH_45_M_45_S(text string) (t time.Time, ok bool) {
+	if len(text) != 8 ||
+		text[2:3] != "-" ||
+		text[5:6] != "-" {
+		return time.Time{}, false
+	}
+
+	hour, ok := fixedDigits(text[0:2])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	minute, ok := fixedDigits(text[3:5])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	second, ok := fixedDigits(text[6:8])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		0,
+		time.January,
+		1,
+		hour,
+		minute,
+		second,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if t.Hour() != hour ||
+		t.Minute() != minute ||
+		t.Second() != second {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
+// timeFromFixedH_58_M_58_S parses the text
+// in the layout "15:04:05" if the text is zero-padded and
+// all its fields are within the regular ranges.
+//
+// Otherwise, ok is false and the text needs to be parsed with time.Parse.
+func timeFromFixedH_58_M_58_S(text string) (t time.Time, ok bool) {
+	if len(text) != 8 ||
+		text[2:3] != ":" ||
+		text[5:6] != ":" {
+		return time.Time{}, false
+	}
+
+	hour, ok := fixedDigits(text[0:2])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	minute, ok := fixedDigits(text[3:5])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	second, ok := fixedDigits(text[6:8])
+	if !ok {
+		return time.Time{}, false
+	}
+
+	t = time.Date(
+		0,
+		time.January,
+		1,
+		hour,
+		minute,
+		second,
+		0,
+		time.UTC)
+
+	// Check that the fields have not been normalized.
+	if t.Hour() != hour ||
+		t.Minute() != minute ||
+		t.Second() != second {
+		return time.Time{}, false
+	}
+
+	return t, true
+}
+
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
 // If there are any errors, the state of target is undefined.
@@ -44,6 +150,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeTime
 	////
@@ -52,30 +160,28 @@ func SomeGraphFromJSONable(
 		"some_time"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_time")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_time"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_time"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
-			target1, err1 := time.Parse(
-				"15-04-05",
-				cast1)
+			target1, fixed1 := timeFromFixedH_45_M_45_S(cast1)
+			var err1 error
+			if !fixed1 {
+				target1, err1 = time.Parse(
+					"15-04-05",
+					cast1)
+			}
 			if err1 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_time"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_time"),
 					fmt.Sprintf(
 						"expected layout 15-04-05, got: %s",
 						cast1))
@@ -97,30 +203,28 @@ func SomeGraphFromJSONable(
 		"formatless_time"]
 
 	if !ok2 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: formatless_time")
 	} else {
 		cast3, ok3 := value2.(string)
 		if !ok3 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "formatless_time"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("formatless_time"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value2))
 		} else {
-			target3, err3 := time.Parse(
-				"15:04:05",
-				cast3)
+			target3, fixed3 := timeFromFixedH_58_M_58_S(cast3)
+			var err3 error
+			if !fixed3 {
+				target3, err3 = time.Parse(
+					"15:04:05",
+					cast3)
+			}
 			if err3 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "formatless_time"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("formatless_time"),
 					fmt.Sprintf(
 						"expected layout 15:04:05, got: %s",
 						cast3))
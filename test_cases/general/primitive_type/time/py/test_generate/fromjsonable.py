@@ -5,12 +5,77 @@
 
 
 import datetime
+import re
 import typing
 
 import some.graph
 import some.graph.parse
 
 
+_TIME_H_45_M_45_S_RE = re.compile(
+    r'([0-9]{2})\-([0-9]{2})\-([0-9]{2})\Z')
+
+
+def _time_from_string_H_45_M_45_S(text: str) -> datetime.time:
+    """
+    parses the time from the string in the format '%H-%M-%S'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: time
+    :raise: ValueError if the string could not be parsed
+
+    >>> _time_from_string_H_45_M_45_S('12-34-56')
+    datetime.time(12, 34, 56)
+
+    """
+    match = _TIME_H_45_M_45_S_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.time(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%H-%M-%S').time()
+
+
+_TIME_H_58_M_58_S_RE = re.compile(
+    r'([0-9]{2}):([0-9]{2}):([0-9]{2})\Z')
+
+
+def _time_from_string_H_58_M_58_S(text: str) -> datetime.time:
+    """
+    parses the time from the string in the format '%H:%M:%S'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: time
+    :raise: ValueError if the string could not be parsed
+
+    >>> _time_from_string_H_58_M_58_S('12:34:56')
+    datetime.time(12, 34, 56)
+
+    """
+    match = _TIME_H_58_M_58_S_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.time(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%H:%M:%S').time()
+
+
 def some_graph_from(
         value: typing.Any,
         ref: str,
@@ -50,20 +115,16 @@ def some_graph_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'some_time')),
+                (ref, 'some_time'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
             try:
-                graph.some_time = datetime.datetime.strptime(
-                    value_0,
-                    '%H-%M-%S'
-                ).time()
+                graph.some_time = _time_from_string_H_45_M_45_S(
+                    value_0)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'some_time')),
+                    (ref, 'some_time'),
                     'Expected to strptime %H-%M-%S, but got: {}'.format(
                         value_0))
 
@@ -85,20 +146,16 @@ def some_graph_from(
     else:
         if not isinstance(value_2, str):
             errors.add(
-                '/'.join((
-                    ref, 'formatless_time')),
+                (ref, 'formatless_time'),
                 "Expected a string, but got: {}".format(
                     type(value_2)))
         else:
             try:
-                graph.formatless_time = datetime.datetime.strptime(
-                    value_2,
-                    '%H:%M:%S'
-                ).time()
+                graph.formatless_time = _time_from_string_H_58_M_58_S(
+                    value_2)
             except ValueError:
                 errors.add(
-                    '/'.join((
-                        ref, 'formatless_time')),
+                    (ref, 'formatless_time'),
                     'Expected to strptime %H:%M:%S, but got: {}'.format(
                         value_2))
 
@@ -109,3 +166,67 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse some_time
+    ##
+
+    graph.some_time = _time_from_string_H_45_M_45_S(
+        value['some_time'])
+
+    ##
+    # Parse formatless_time
+    ##
+
+    graph.formatless_time = _time_from_string_H_58_M_58_S(
+        value['formatless_time'])
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
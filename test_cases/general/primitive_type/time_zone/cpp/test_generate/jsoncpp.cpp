@@ -83,13 +83,15 @@ void some_graph_from(
     return;
   }
 
+  const parse::Ref graph_ref(ref);
+
   ////
   // Parse some_time_zone
   ////
 
   if (!value.isMember("some_time_zone")) {
     errors->add(
-      ref,
+      graph_ref,
       "Property is missing: some_time_zone");
   } else {
     const Json::Value& value_0 = value["some_time_zone"];
@@ -98,8 +100,7 @@ void some_graph_from(
         "Expected a string, but got: ");
 
       errors->add(
-        std::string(ref)
-          .append("/some_time_zone"),
+        parse::Ref(graph_ref, "some_time_zone"),
         message(
           expected_but_got,
           strlen(expected_but_got),
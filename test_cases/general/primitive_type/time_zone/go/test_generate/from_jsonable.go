@@ -4,10 +4,53 @@ package somegraph
 
 import (
 	"fmt"
-	"strings"
+	"sync"
 	"time"
 )
 
+// locationCache maps time zone names to the loaded *time.Location's.
+//
+// time.LoadLocation reads the time zone database on every call so that
+// the locations are loaded only once and shared among the values.
+var locationCache sync.Map
+
+// loadLocation gives the location with the given name.
+//
+// The location is loaded on the first request and cached afterwards.
+// The names which could not be loaded are not cached.
+//
+// loadLocation is safe for concurrent use.
+func loadLocation(name string) (*time.Location, error) {
+	cached, ok := locationCache.Load(name)
+	if ok {
+		return cached.(*time.Location), nil
+	}
+
+	loc, err := time.LoadLocation(name)
+	if err != nil {
+		return nil, err
+	}
+
+	actual, _ := locationCache.LoadOrStore(name, loc)
+	return actual.(*time.Location), nil
+}
+
+// PrewarmLocations loads the locations with the given names in advance
+// so that the parsing needs not access the time zone database.
+//
+// All the names are loaded even if some fail. The first error is returned.
+//
+// PrewarmLocations is safe for concurrent use.
+func PrewarmLocations(names ...string) (err error) {
+	for _, name := range names {
+		_, loadErr := loadLocation(name)
+		if loadErr != nil && err == nil {
+			err = loadErr
+		}
+	}
+	return
+}
+
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
 // If there are any errors, the state of target is undefined.
@@ -44,6 +87,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeTimeZone
 	////
@@ -52,28 +97,22 @@ func SomeGraphFromJSONable(
 		"some_time_zone"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_time_zone")
 	} else {
 		cast1, ok1 := value0.(string)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_time_zone"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_time_zone"),
 				fmt.Sprintf(
 					"expected a string, but got: %T",
 					value0))
 		} else {
-			target1, err1 := time.LoadLocation(cast1)
+			target1, err1 := loadLocation(cast1)
 			if err1 != nil {
-				errors.Add(
-					strings.Join(
-						[]string{
-							ref, "some_time_zone"},
-						"/"),
+				errors.AddRef(
+					graphRef.Key("some_time_zone"),
 					fmt.Sprintf(
 						"failed to load location from %#v: %s",
 						cast1,
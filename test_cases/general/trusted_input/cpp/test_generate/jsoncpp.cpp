@@ -0,0 +1,456 @@
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+#include "jsoncpp.h"
+#include "parse.h"
+#include "types.h"
+
+#include <cstring>
+#include <memory>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <utility>
+
+namespace some {
+namespace graph {
+
+namespace jsoncpp {
+
+/**
+ * generates an error message.
+ *
+ * @param cc char array as the description part of the message
+ * @param cc_size size of the char array
+ * @param s string as the detail part of the message
+ * @return concatenated string
+ */
+std::string message(const char* cc, size_t cc_size, std::string s) {
+  std::string result;
+  result.reserve(cc_size + s.size());
+  result.append(cc, cc_size);
+  result.append(s);
+  return result;
+}
+
+/**
+ * converts a JSON value type to a human-readable string representation.
+ *
+ * @param value_type to be converted
+ * @return string representation of the JSON value type
+ */
+std::string value_type_to_string(Json::ValueType value_type) {
+  switch (value_type) {
+    case Json::ValueType::nullValue: return "null";
+    case Json::ValueType::intValue: return "int";
+    case Json::ValueType::uintValue: return "uint";
+    case Json::ValueType::realValue: return "real";
+    case Json::ValueType::stringValue: return "string";
+    case Json::ValueType::booleanValue: return "bool";
+    case Json::ValueType::arrayValue: return "array";
+    case Json::ValueType::objectValue: return "object";
+    default:
+      std::stringstream ss;
+      ss << "Unhandled value type in value_to_string: "
+        << value_type;
+      throw std::domain_error(ss.str());
+  }
+}
+
+void some_graph_from(
+    const Json::Value& value,
+    std::string ref,
+    SomeGraph* target,
+    parse::Errors* errors) {
+  if (errors == nullptr) {
+    throw std::invalid_argument("Unexpected null errors");
+  }
+
+  if (!errors->empty()) {
+    throw std::invalid_argument("Unexpected non-empty errors");
+  }
+
+  if (!value.isObject()) {
+    constexpr auto expected_but_got(
+      "Expected an object, but got: ");
+
+    errors->add(
+      ref,
+      message(
+        expected_but_got,
+        strlen(expected_but_got),
+        value_type_to_string(
+          value.type())));
+    return;
+  }
+
+  const parse::Ref graph_ref(ref);
+
+  ////
+  // Pre-allocate some_classes
+  ////
+
+  const parse::Ref some_classes_ref(
+    graph_ref, "some_classes");
+
+  if (value.isMember("some_classes")) {
+    const Json::Value& obj = value["some_classes"];
+    if (!obj.isObject()) {
+      constexpr auto expected_but_got(
+        "Expected an object, but got: ");
+
+      errors->add(
+        some_classes_ref,
+        message(
+          expected_but_got,
+          strlen(expected_but_got),
+          value_type_to_string(
+            obj.type())));
+    } else {
+      for (Json::ValueConstIterator it = obj.begin();
+          it != obj.end(); ++it) {
+                auto instance = std::make_unique<SomeClass>();
+        instance->id = it.name();
+        target->some_classes[it.name()] = std::move(instance);
+
+      }
+    }
+  }
+
+  // Pre-allocating class instances is critical.
+  // If the pre-allocation failed, we can not continue to parse the instances.
+  if (!errors->empty()) {
+    return;
+  }
+
+  ////
+  // Parse some_classes
+  ////
+
+  if (value.isMember("some_classes")) {
+    const Json::Value& obj = value["some_classes"];
+
+    for (Json::ValueConstIterator it = obj.begin(); it != obj.end(); ++it) {
+      const std::string id = it.name();
+
+      SomeClass* instance(
+        target->some_classes.at(id).get());
+      some_class_from(
+        *it,
+        parse::Ref(some_classes_ref, id),
+        instance,
+        errors);
+
+      if (errors->full()) {
+        break;
+      }
+    }
+  }
+  if (errors->full()) {
+    return;
+  }
+
+  ////
+  // Parse some_reference
+  ////
+
+  if (!value.isMember("some_reference")) {
+    errors->add(
+      graph_ref,
+      "Property is missing: some_reference");
+  } else {
+    const Json::Value& value_0 = value["some_reference"];
+    if (!value_0.isString()) {
+      constexpr auto expected_but_got(
+        "Expected a string, but got: ");
+
+      errors->add(
+        parse::Ref(graph_ref, "some_reference"),
+        message(
+          expected_but_got,
+          strlen(expected_but_got),
+          value_type_to_string(
+            value_0.type())));
+    } else {
+      const std::string& cast_0 = value_0.asString();
+      if (target->some_classes.count(cast_0) == 0) {
+        constexpr auto reference_not_found(
+          "Reference to an instance of class "
+          "Some_class"
+          " not found: ");
+
+        errors->add(
+          parse::Ref(graph_ref, "some_reference"),
+          message(
+            reference_not_found,
+            strlen(reference_not_found),
+            cast_0));
+      } else {
+        target->some_reference = target->some_classes.at(cast_0).get();
+      }
+    }
+  }
+  if (errors->full()) {
+    return;
+  }
+}
+
+void some_class_from(
+    const Json::Value& value,
+    const parse::Ref& ref,
+    SomeClass* target,
+    parse::Errors* errors) {
+  if (!value.isObject()) {
+    constexpr auto expected_but_got(
+      "Expected an object, but got: ");
+
+    errors->add(
+      ref,
+      message(
+        expected_but_got,
+        strlen(expected_but_got),
+        value_type_to_string(
+          value.type())));
+    return;
+  }
+
+  ////
+  // Parse some_integer
+  ////
+
+  if (!value.isMember("some_integer")) {
+    errors->add(
+      ref,
+      "Property is missing: some_integer");
+  } else {
+    const Json::Value& value_0 = value["some_integer"];
+    if (!value_0.isInt64()) {
+      constexpr auto expected_but_got(
+        "Expected an int64, but got: ");
+
+      errors->add(
+        parse::Ref(ref, "some_integer"),
+        message(
+          expected_but_got,
+          strlen(expected_but_got),
+          value_type_to_string(
+            value_0.type())));
+    } else {
+      target->some_integer = value_0.asInt64();
+    }
+  }
+  if (errors->full()) {
+    return;
+  }
+
+  ////
+  // Parse some_float
+  ////
+
+  if (!value.isMember("some_float")) {
+    errors->add(
+      ref,
+      "Property is missing: some_float");
+  } else {
+    const Json::Value& value_1 = value["some_float"];
+    if (!value_1.isDouble()) {
+      constexpr auto expected_but_got(
+        "Expected a double, but got: ");
+
+      errors->add(
+        parse::Ref(ref, "some_float"),
+        message(
+          expected_but_got,
+          strlen(expected_but_got),
+          value_type_to_string(
+            value_1.type())));
+    } else {
+      target->some_float = value_1.asDouble();
+    }
+  }
+  if (errors->full()) {
+    return;
+  }
+
+  ////
+  // Parse some_string
+  ////
+
+  if (!value.isMember("some_string")) {
+    errors->add(
+      ref,
+      "Property is missing: some_string");
+  } else {
+    const Json::Value& value_2 = value["some_string"];
+    if (!value_2.isString()) {
+      constexpr auto expected_but_got(
+        "Expected a string, but got: ");
+
+      errors->add(
+        parse::Ref(ref, "some_string"),
+        message(
+          expected_but_got,
+          strlen(expected_but_got),
+          value_type_to_string(
+            value_2.type())));
+    } else {
+      target->some_string = value_2.asString();
+    }
+  }
+  if (errors->full()) {
+    return;
+  }
+
+  ////
+  // Parse some_path
+  ////
+
+  if (!value.isMember("some_path")) {
+    errors->add(
+      ref,
+      "Property is missing: some_path");
+  } else {
+    const Json::Value& value_3 = value["some_path"];
+    if (!value_3.isString()) {
+      constexpr auto expected_but_got(
+        "Expected a string, but got: ");
+
+      errors->add(
+        parse::Ref(ref, "some_path"),
+        message(
+          expected_but_got,
+          strlen(expected_but_got),
+          value_type_to_string(
+            value_3.type())));
+    } else {
+        target->some_path = boost::filesystem::path(
+        value_3.asString());
+
+    }
+  }
+  if (errors->full()) {
+    return;
+  }
+
+  ////
+  // Parse some_array
+  ////
+
+  if (!value.isMember("some_array")) {
+    errors->add(
+      ref,
+      "Property is missing: some_array");
+  } else {
+    const Json::Value& value_4 = value["some_array"];
+    if (!value_4.isArray()) {
+      constexpr auto expected_but_got(
+        "Expected an array, but got: ");
+
+      errors->add(
+        parse::Ref(ref, "some_array"),
+        message(
+          expected_but_got,
+          strlen(expected_but_got),
+          value_type_to_string(
+            value_4.type())));
+    } else {
+      std::vector<int64_t>& target_4 = target->some_array;
+      target_4.resize(value_4.size());
+      size_t i_4 = 0;
+      for (const Json::Value& item_4 : value_4) {
+        if (!item_4.isInt64()) {
+          constexpr auto expected_but_got(
+            "Expected an int64, but got: ");
+
+          errors->add(
+            parse::Ref(parse::Ref(ref, "some_array"), i_4),
+            message(
+              expected_but_got,
+              strlen(expected_but_got),
+              value_type_to_string(
+                item_4.type())));
+        } else {
+          target_4.at(i_4) = item_4.asInt64();
+        }
+        ++i_4;
+
+        if (errors->full()) {
+          break;
+        }
+      }
+
+    }
+  }
+  if (errors->full()) {
+    return;
+  }
+}
+
+Json::Value serialize_some_class(
+    const SomeClass& some_class) {
+  Json::Value some_class_as_value;
+
+  some_class_as_value["some_integer"] = some_class.some_integer;
+
+  some_class_as_value["some_float"] = some_class.some_float;
+
+  some_class_as_value["some_string"] = some_class.some_string;
+
+  some_class_as_value["some_path"] = some_class.some_path.string();
+
+  Json::Value target_0(Json::arrayValue);
+  const auto& vector_0 = some_class.some_array;
+  for (int i_0 = 0;
+      i_0 < vector_0.size();
+      ++i_0) {
+    target_0[i_0] = vector_0[i_0];
+  }
+  some_class_as_value["some_array"] = std::move(target_0);
+
+  return some_class_as_value;
+}
+
+Json::Value serialize_some_graph(
+    const SomeGraph& some_graph) {
+  Json::Value some_graph_as_value;
+
+  some_graph_as_value["some_reference"] = some_graph.some_reference->id;
+
+  if (!some_graph.some_classes.empty()) {
+    Json::Value some_classes_as_value;
+    for (const auto& kv : some_graph.some_classes) {
+      const std::string& id = kv.first;
+      const SomeClass* instance = kv.second.get();
+
+      if (id != instance->id) {
+        constexpr auto expected(
+          "Expected the class instance of "
+          "SomeClass"
+          "to have the ID ");
+        constexpr auto but_got(", but got: ");
+
+        std::string msg;
+        msg.reserve(
+          strlen(expected) + id.size() +
+          strlen(but_got) + instance->id.size());
+        msg += expected;
+        msg += id;
+        msg += but_got;
+        msg += instance->id;
+
+        throw std::invalid_argument(msg);
+      }
+
+      some_classes_as_value[instance->id] = serialize_some_class(*instance);
+    }
+    some_graph_as_value["some_classes"] = some_classes_as_value;
+  }
+
+  return some_graph_as_value;
+}
+
+}  // namespace jsoncpp
+
+}  // namespace graph
+}  // namespace some
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,140 @@
+#pragma once
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+#include <string>
+#include <vector>
+
+namespace some {
+namespace graph {
+
+namespace parse {
+
+/**
+ * references a value lazily as a path from the root.
+ *
+ * The reference points to the reference of its parent so that
+ * referencing a nested value requires no string allocations.
+ * The path is rendered only when it is actually needed
+ * (e.g., when an error is added).
+ *
+ * The parent reference and the key need to outlive the reference.
+ */
+class Ref {
+public:
+  /**
+   * creates the root reference.
+   *
+   * @param root path to the root value
+   */
+  explicit Ref(const std::string& root);
+
+  /**
+   * creates the reference to a property of the parent.
+   *
+   * @param parent reference to the parent object
+   * @param key name of the property
+   */
+  Ref(const Ref& parent, const char* key);
+
+  /**
+   * creates the reference to a value of the parent.
+   *
+   * @param parent reference to the parent object
+   * @param key key of the value
+   */
+  Ref(const Ref& parent, const std::string& key);
+
+  /**
+   * creates the reference to an item of the parent array.
+   *
+   * @param parent reference to the parent array
+   * @param index index of the item
+   */
+  Ref(const Ref& parent, size_t index);
+
+  /**
+   * renders the reference as a path.
+   *
+   * @return segments of the path joined by "/"
+   */
+  std::string str() const;
+
+private:
+  const Ref* parent_;
+
+  // key of the value, nullptr if the value is an array item.
+  const char* key_;
+  size_t key_size_;
+
+  size_t index_;
+};
+
+/**
+ * represents an error occurred while parsing.
+ */
+struct Error {
+  // references the cause (e.g., a reference path).
+  const std::string ref;
+
+  // describes the error.
+  const std::string message;
+};
+
+/**
+ * collects errors capped at a certain quantity.
+ *
+ * The space for the errors will not be reserved.
+ * Make sure you reserve the necessary space by calling reserve()
+ * at the initialization.
+ */
+class Errors {
+public:
+  explicit Errors(size_t cap);
+
+  /**
+   * reserves the space for the errors.
+   *
+   * You need to reserve the space only if you think there will
+   * be an excessive amount of errors (e.g., >1000).
+   */
+   void reserve(size_t expected_errors);
+
+  /**
+   * adds an error to the container.
+   *
+   * If the container is already full, the error is ignored.
+   */
+  void add(const std::string& ref, const std::string& message);
+
+  /**
+   * adds an error to the container.
+   *
+   * The reference is rendered only if the error is actually added.
+   * If the container is already full, the error is ignored.
+   */
+  void add(const Ref& ref, const std::string& message);
+
+  /**
+   * @return true when there are exactly cap errors.
+   */
+  bool full() const;
+
+  /**
+   * @return true when there are no errors.
+   */
+  bool empty() const;
+
+  const std::vector<Error>& get() const;
+
+private:
+  const size_t cap_;
+  std::vector<Error> errors_;
+};
+
+}  // namespace parse
+
+}  // namespace graph
+}  // namespace some
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,54 @@
+#pragma once
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+#include <boost/filesystem/path.hpp>
+
+#include <cstdint>
+#include <map>
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace some {
+namespace graph {
+
+struct SomeGraph;
+
+class SomeClass;
+
+// defines some class.
+class SomeClass {
+public:
+  // identifies the instance.
+  std::string id;
+
+  // defines some bounded integer.
+  int64_t some_integer = 0;
+
+  // defines some bounded float.
+  double some_float = 0.0;
+
+  // defines some string following a pattern.
+  std::string some_string;
+
+  // defines some path following a pattern.
+  boost::filesystem::path some_path;
+
+  // defines some array of bounded size.
+  std::vector<int64_t> some_array;
+};
+
+// defines some object graph whose input is trusted.
+struct SomeGraph {
+  // references some instance.
+  SomeClass* some_reference = nullptr;
+
+  // registers SomeClass instances.
+  std::map<std::string, std::unique_ptr<SomeClass>> some_classes;
+};
+
+}  // namespace graph
+}  // namespace some
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
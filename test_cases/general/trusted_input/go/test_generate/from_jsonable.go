@@ -0,0 +1,580 @@
+package somegraph
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"fmt"
+	"math"
+	"sort"
+)
+
+// SomeClassFromJSONable parses SomeClass from a JSONable value.
+//
+// If there are any errors, the state of the target is undefined.
+//
+// SomeClassFromJSONable requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+func SomeClassFromJSONable(
+	value interface{},
+	id string,
+	ref *Ref,
+	target *SomeClass,
+	errors *Errors) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
+		errors.AddRef(
+			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	target.ID = id
+
+	////
+	// Parse SomeInteger
+	////
+
+	value0, ok0 := cast[
+		"some_integer"]
+
+	if !ok0 {
+		errors.AddRef(
+			ref,
+			"property is missing: some_integer")
+	} else {
+		fcast1, ok1 := value0.(float64)
+		if !ok1 {
+			errors.AddRef(
+				ref.Key("some_integer"),
+				fmt.Sprintf(
+					"expected a float64, but got: %T",
+					value0))
+		} else if fcast1 != math.Trunc(fcast1) {
+			errors.AddRef(
+				ref.Key("some_integer"),
+				fmt.Sprintf(
+					"expected a whole number, but got: %f",
+					fcast1))
+		// 9223372036854775808.0 == 2^63 is the first float > MaxInt64.
+		// -9223372036854775808.0 == -(2^63) is the last float >= MinInt64.
+		} else if fcast1 >= 9223372036854775808.0 ||
+			fcast1 < -9223372036854775808.0 {
+
+			errors.AddRef(
+				ref.Key("some_integer"),
+				fmt.Sprintf(
+					"expected the value to fit into int64, but got an overflow: %f",
+					fcast1))
+		} else {
+			target.SomeInteger = int64(fcast1)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse SomeFloat
+	////
+
+	value2, ok2 := cast[
+		"some_float"]
+
+	if !ok2 {
+		errors.AddRef(
+			ref,
+			"property is missing: some_float")
+	} else {
+		cast3, ok3 := value2.(float64)
+		if !ok3 {
+			errors.AddRef(
+				ref.Key("some_float"),
+				fmt.Sprintf(
+					"expected a float64, but got: %T",
+					value2))
+		} else {
+			target.SomeFloat = cast3
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse SomeString
+	////
+
+	value4, ok4 := cast[
+		"some_string"]
+
+	if !ok4 {
+		errors.AddRef(
+			ref,
+			"property is missing: some_string")
+	} else {
+		cast5, ok5 := value4.(string)
+		if !ok5 {
+			errors.AddRef(
+				ref.Key("some_string"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value4))
+		} else {
+			target.SomeString = cast5
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse SomePath
+	////
+
+	value6, ok6 := cast[
+		"some_path"]
+
+	if !ok6 {
+		errors.AddRef(
+			ref,
+			"property is missing: some_path")
+	} else {
+		cast7, ok7 := value6.(string)
+		if !ok7 {
+			errors.AddRef(
+				ref.Key("some_path"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value6))
+		} else {
+			target.SomePath = cast7
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse SomeArray
+	////
+
+	value8, ok8 := cast[
+		"some_array"]
+
+	if !ok8 {
+		errors.AddRef(
+			ref,
+			"property is missing: some_array")
+	} else {
+		cast9, ok9 := value8.([]interface{})
+		if !ok9 {
+			errors.AddRef(
+				ref.Key("some_array"),
+				fmt.Sprintf(
+					"expected a []interface{}, but got: %T",
+					value8))
+		} else {
+			target9 := make(
+				[]int64,
+				len(cast9))
+			for i9 := range cast9 {
+				fcast10, ok10 := (cast9[i9]).(float64)
+				if !ok10 {
+					errors.AddRef(
+						ref.Key("some_array").Index(i9),
+						fmt.Sprintf(
+							"expected a float64, but got: %T",
+							cast9[i9]))
+				} else if fcast10 != math.Trunc(fcast10) {
+					errors.AddRef(
+						ref.Key("some_array").Index(i9),
+						fmt.Sprintf(
+							"expected a whole number, but got: %f",
+							fcast10))
+				// 9223372036854775808.0 == 2^63 is the first float > MaxInt64.
+				// -9223372036854775808.0 == -(2^63) is the last float >= MinInt64.
+				} else if fcast10 >= 9223372036854775808.0 ||
+					fcast10 < -9223372036854775808.0 {
+
+					errors.AddRef(
+						ref.Key("some_array").Index(i9),
+						fmt.Sprintf(
+							"expected the value to fit into int64, but got an overflow: %f",
+							fcast10))
+				} else {
+					target9[i9] = int64(fcast10)
+				}
+
+				if errors.Full() {
+					break;
+				}
+			}
+
+			target.SomeArray = target9
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// SomeGraphFromJSONable parses SomeGraph from a JSONable value.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONable requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+func SomeGraphFromJSONable(
+	value interface{},
+	ref string,
+	target *SomeGraph,
+	errors *Errors) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
+		errors.Add(
+			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate SomeClasses
+	////
+
+	someClassesRef := graphRef.Key(
+		"some_classes")
+	var someClassesOk bool
+	var someClassesValue interface{}
+	var someClassesMap map[string]interface{}
+
+	someClassesValue, someClassesOk = cast[
+		"some_classes"]
+	if someClassesOk {
+		someClassesMap, ok = someClassesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				someClassesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					someClassesValue));
+		} else {
+			target.SomeClasses = make(
+				map[string]*SomeClass)
+
+			for id := range someClassesMap {
+				target.SomeClasses[id] = &SomeClass{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse SomeClasses
+	////
+
+	if someClassesOk {
+		for id, value := range someClassesMap {
+			SomeClassFromJSONable(
+				value,
+				id,
+				someClassesRef.Key(id),
+				target.SomeClasses[id],
+				errors)
+
+			if errors.Full() {
+				break
+			}
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse SomeReference
+	////
+
+	value0, ok0 := cast[
+		"some_reference"]
+
+	if !ok0 {
+		errors.AddRef(
+			graphRef,
+			"property is missing: some_reference")
+	} else {
+		cast1, ok1 := value0.(string)
+		if !ok1 {
+			errors.AddRef(
+				graphRef.Key("some_reference"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value0))
+		} else {
+			target1, ok1 := target.SomeClasses[cast1]
+			if !ok1 {
+				errors.AddRef(
+					graphRef.Key("some_reference"),
+					fmt.Sprintf(
+						"reference to an instance of class SomeClass not found: %s",
+						value0))
+			} else {
+				target.SomeReference = target1
+			}
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// SomeGraphFromJSONableParallel parses SomeGraph from a JSONable value
+// on a pool of at most workers goroutines.
+//
+// The instances of all the registries are parsed concurrently.
+// Unlike SomeGraphFromJSONable, the errors are deterministic:
+// the errors of the instances are sorted by the registry and the ID.
+//
+// If there are any errors, the state of target is undefined.
+//
+// SomeGraphFromJSONableParallel requires:
+//  * target != nil
+//  * errors != nil
+//  * errors.Empty()
+//  * workers > 0
+func SomeGraphFromJSONableParallel(
+	value interface{},
+	ref string,
+	target *SomeGraph,
+	errors *Errors,
+	workers int) {
+
+	if target == nil {
+		panic("unexpected nil target")
+	}
+
+	if errors == nil {
+		panic("unexpected nil errors")
+	}
+
+	if !errors.Empty() {
+		panic("unexpected non-empty errors")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	cast, ok := value.(map[string]interface{})
+	if !ok {
+		errors.Add(
+			ref,
+			fmt.Sprintf(
+				"expected a map[string]interface{}, but got: %T",
+				value))
+		return
+	}
+
+	graphRef := NewRef(ref)
+
+	////
+	// Pre-allocate SomeClasses
+	////
+
+	someClassesRef := graphRef.Key(
+		"some_classes")
+	var someClassesOk bool
+	var someClassesValue interface{}
+	var someClassesMap map[string]interface{}
+
+	someClassesValue, someClassesOk = cast[
+		"some_classes"]
+	if someClassesOk {
+		someClassesMap, ok = someClassesValue.(map[string]interface{})
+		if !ok {
+			errors.AddRef(
+				someClassesRef,
+				fmt.Sprintf(
+					"expected a map[string]interface{}, but got: %T",
+					someClassesValue));
+		} else {
+			target.SomeClasses = make(
+				map[string]*SomeClass)
+
+			for id := range someClassesMap {
+				target.SomeClasses[id] = &SomeClass{}
+			}
+		}
+	}
+
+	// Pre-allocating class instances is critical.
+	// If the pre-allocation failed, we can not continue to parse the instances.
+	if !errors.Empty() {
+		return
+	}
+
+	////
+	// Parse the instances of all the registries in parallel
+	////
+
+	// instanceJob identifies an instance to be parsed.
+	type instanceJob struct {
+		// indicates the registry in the order of the classes.
+		registry int
+
+		id string
+
+		value interface{}
+	}
+
+	jobs := make([]instanceJob, 0, len(someClassesMap))
+	for id, value := range someClassesMap {
+		jobs = append(jobs, instanceJob{registry: 0, id: id, value: value})
+	}
+
+	// Sort the instances so that the errors are deterministic.
+	sort.Slice(jobs, func(i, j int) bool {
+		if jobs[i].registry != jobs[j].registry {
+			return jobs[i].registry < jobs[j].registry
+		}
+		return jobs[i].id < jobs[j].id
+	})
+
+	chunks := parallelChunkCount(len(jobs), workers)
+	chunkErrors := make([][]Error, chunks)
+	workerErrors := make([]*Errors, workers)
+
+	forEachInParallel(chunks, workers, func(worker int, chunk int) {
+		instanceErrors := workerErrors[worker]
+		if instanceErrors == nil {
+			instanceErrors = NewErrors(errors.cap)
+			workerErrors[worker] = instanceErrors
+		}
+
+		start, end := parallelChunk(len(jobs), chunks, chunk)
+		for _, job := range jobs[start:end] {
+			switch job.registry {
+			case 0:
+				SomeClassFromJSONable(
+					job.value,
+					job.id,
+					someClassesRef.Key(job.id),
+					target.SomeClasses[job.id],
+					instanceErrors)
+			}
+
+			chunkErrors[chunk] = append(
+				chunkErrors[chunk], instanceErrors.values...)
+			instanceErrors.values = instanceErrors.values[:0]
+
+			// The subsequent errors of the chunk would be ignored anyway.
+			if errors.cap != 0 &&
+				uint64(len(chunkErrors[chunk])) >= errors.cap {
+				break
+			}
+		}
+	})
+
+	// Merge the errors in the order of the instances.
+	for _, values := range chunkErrors {
+		for _, e := range values {
+			errors.Add(e.Ref, e.Message)
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	////
+	// Parse SomeReference
+	////
+
+	value0, ok0 := cast[
+		"some_reference"]
+
+	if !ok0 {
+		errors.AddRef(
+			graphRef,
+			"property is missing: some_reference")
+	} else {
+		cast1, ok1 := value0.(string)
+		if !ok1 {
+			errors.AddRef(
+				graphRef.Key("some_reference"),
+				fmt.Sprintf(
+					"expected a string, but got: %T",
+					value0))
+		} else {
+			target1, ok1 := target.SomeClasses[cast1]
+			if !ok1 {
+				errors.AddRef(
+					graphRef.Key("some_reference"),
+					fmt.Sprintf(
+						"reference to an instance of class SomeClass not found: %s",
+						value0))
+			} else {
+				target.SomeReference = target1
+			}
+		}
+	}
+
+	if errors.Full() {
+		return
+	}
+
+	return
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,70 @@
+package somegraph
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import (
+	"encoding/json"
+	"runtime"
+	"testing"
+)
+
+func BenchmarkSomeGraphFromJSONable(b *testing.B) {
+	var value interface{}
+	err := json.Unmarshal(syntheticSomeGraphJSON(b), &value)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		errors := NewErrors(0)
+		SomeGraphFromJSONable(
+			value, "#", &SomeGraph{}, errors)
+		if !errors.Empty() {
+			b.Fatal(errors.Values()[0].Message)
+		}
+	}
+}
+
+func BenchmarkSomeGraphFromJSONableParallel(b *testing.B) {
+	var value interface{}
+	err := json.Unmarshal(syntheticSomeGraphJSON(b), &value)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	workers := runtime.GOMAXPROCS(0)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		errors := NewErrors(0)
+		SomeGraphFromJSONableParallel(
+			value, "#", &SomeGraph{}, errors, workers)
+		if !errors.Empty() {
+			b.Fatal(errors.Values()[0].Message)
+		}
+	}
+}
+
+func BenchmarkSomeGraphFromJSONBytes(b *testing.B) {
+	data := syntheticSomeGraphJSON(b)
+
+	b.ReportAllocs()
+	b.SetBytes(int64(len(data)))
+	b.ResetTimer()
+
+	for i := 0; i < b.N; i++ {
+		errors := NewErrors(0)
+		SomeGraphFromJSONBytes(
+			data, "#", &SomeGraph{}, errors)
+		if !errors.Empty() {
+			b.Fatal(errors.Values()[0].Message)
+		}
+	}
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,192 @@
+package somegraph
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+import "fmt"
+
+// SomeClassToJSONable converts the instance to
+// a JSONable representation.
+//
+// SomeClassToJSONable requires:
+//  * instance != nil
+//
+// SomeClassToJSONable ensures:
+//  * target != nil
+func SomeClassToJSONable(
+	instance *SomeClass) (
+	target map[string]interface{}) {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	target = make(map[string]interface{})
+
+	////
+	// Serialize SomeInteger
+	////
+
+	target["some_integer"] = instance.SomeInteger
+
+	////
+	// Serialize SomeFloat
+	////
+
+	target["some_float"] = instance.SomeFloat
+
+	////
+	// Serialize SomeString
+	////
+
+	target["some_string"] = instance.SomeString
+
+	////
+	// Serialize SomePath
+	////
+
+	target["some_path"] = instance.SomePath
+
+	////
+	// Serialize SomeArray
+	////
+
+	count0 := len(instance.SomeArray)
+	slice0 := instance.SomeArray
+	target0 := make([]interface{}, count0)
+	for i0 := 0; i0 < count0; i0++ {
+		target0[i0] = slice0[i0]
+	}
+	target["some_array"] = target0
+
+	return
+}
+
+// SomeGraph converts the instance to a JSONable representation.
+//
+// SomeGraph requires:
+//  * instance != nil
+//
+// SomeGraph ensures:
+//  * (err == nil && target != nil) || (err != nil && target == nil)
+func SomeGraphToJSONable(
+	instance *SomeGraph) (
+	target map[string]interface{}, err error) {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	target = make(map[string]interface{})
+	defer func() {
+		if err != nil {
+			target = nil
+		}
+	}()
+	////
+	// Serialize SomeReference
+	////
+
+	target["some_reference"] = instance.SomeReference.ID
+
+	////
+	// Serialize instance registry of SomeClass
+	////
+
+	if len(instance.SomeClasses) > 0 {
+		targetSomeClasses := make(map[string]interface{})
+		for id := range instance.SomeClasses {
+			someClassInstance := instance.SomeClasses[id]
+
+			if id != someClassInstance.ID {
+				err = fmt.Errorf(
+					"expected the instance of SomeClass to have the ID %s according to the registry, but got: %s",
+					id, someClassInstance.ID)
+				return
+			}
+
+			targetSomeClasses[id] = SomeClassToJSONable(
+				someClassInstance)
+		}
+
+		target["some_classes"] = targetSomeClasses
+	}
+
+	return
+}
+
+// SomeGraphToJSONableParallel converts the instance to
+// a JSONable representation on a pool of at most workers goroutines.
+//
+// The instances of each registry are converted concurrently.
+//
+// SomeGraphToJSONableParallel requires:
+//  * instance != nil
+//  * workers > 0
+//
+// SomeGraphToJSONableParallel ensures:
+//  * (err == nil && target != nil) || (err != nil && target == nil)
+func SomeGraphToJSONableParallel(
+	instance *SomeGraph,
+	workers int) (
+	target map[string]interface{}, err error) {
+
+	if instance == nil {
+		panic("unexpected nil instance")
+	}
+
+	if workers < 1 {
+		panic("unexpected non-positive workers")
+	}
+
+	target = make(map[string]interface{})
+	defer func() {
+		if err != nil {
+			target = nil
+		}
+	}()
+	////
+	// Serialize SomeReference
+	////
+
+	target["some_reference"] = instance.SomeReference.ID
+
+	////
+	// Serialize instance registry of SomeClass
+	////
+
+	if len(instance.SomeClasses) > 0 {
+		ids := make([]string, 0, len(instance.SomeClasses))
+		for id, someClassInstance := range instance.SomeClasses {
+			if id != someClassInstance.ID {
+				err = fmt.Errorf(
+					"expected the instance of SomeClass to have the ID %s according to the registry, but got: %s",
+					id, someClassInstance.ID)
+				return
+			}
+
+			ids = append(ids, id)
+		}
+
+		jsonables := make([]map[string]interface{}, len(ids))
+		chunks := parallelChunkCount(len(ids), workers)
+		forEachInParallel(chunks, workers, func(worker int, chunk int) {
+			start, end := parallelChunk(len(ids), chunks, chunk)
+			for i := start; i < end; i++ {
+				jsonables[i] = SomeClassToJSONable(
+					instance.SomeClasses[ids[i]])
+			}
+		})
+
+		targetSomeClasses := make(
+			map[string]interface{}, len(ids))
+		for i, id := range ids {
+			targetSomeClasses[id] = jsonables[i]
+		}
+
+		target["some_classes"] = targetSomeClasses
+	}
+
+	return
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
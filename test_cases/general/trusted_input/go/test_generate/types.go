@@ -0,0 +1,35 @@
+package somegraph
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+// SomeClass defines some class.
+type SomeClass struct {
+	// identifies the instance
+	ID string
+
+	// defines some bounded integer.
+	SomeInteger int64
+
+	// defines some bounded float.
+	SomeFloat float64
+
+	// defines some string following a pattern.
+	SomeString string
+
+	// defines some path following a pattern.
+	SomePath string
+
+	// defines some array of bounded size.
+	SomeArray []int64
+}
+
+// SomeGraph defines some object graph whose input is trusted.
+type SomeGraph struct {
+	// registers instances of SomeClass.
+	SomeClasses map[string]*SomeClass
+
+	// references some instance.
+	SomeReference *SomeClass
+}
+
+// File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,65 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""defines some object graph whose input is trusted."""
+
+
+import collections
+import typing
+
+
+class SomeClass:
+    """defines some class."""
+
+    def __init__(
+            self,
+            id: str,
+            some_integer: int,
+            some_float: float,
+            some_string: str,
+            some_path: str,
+            some_array: typing.List[int]) -> None:
+        """
+        initializes an instance of SomeClass with the given values.
+
+        :param id: identifier of the instance:param some_integer: defines some bounded integer.
+        :param some_float: defines some bounded float.
+        :param some_string: defines some string following a pattern.
+        :param some_path: defines some path following a pattern.
+        :param some_array: defines some array of bounded size.
+
+        """
+        self.id = id
+        self.some_integer = some_integer
+        self.some_float = some_float
+        self.some_string = some_string
+        self.some_path = some_path
+        self.some_array = some_array
+
+
+class SomeGraph:
+    """defines some object graph whose input is trusted."""
+
+    def __init__(
+            self,
+            some_reference: SomeClass,
+            some_classes: typing.Optional[typing.MutableMapping[str, SomeClass]] = None) -> None:
+        """
+        initializes an instance of SomeGraph with the given values.
+
+        The class registries are initialized with empty ordered dictionaries.
+        :param some_reference: references some instance.
+        :param some_classes:
+            registry of instances of SomeClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+
+        """
+        self.some_reference = some_reference
+
+        if some_classes is not None:
+            self.some_classes = some_classes
+        else:
+            self.some_classes = collections.OrderedDict()
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
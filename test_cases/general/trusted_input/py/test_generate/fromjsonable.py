@@ -0,0 +1,836 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses JSONable objects."""
+
+
+import collections
+import typing
+
+import some.graph
+import some.graph.parse
+
+
+def _some_class_construct(
+        value: typing.Any,
+        id: str,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeClass]:
+    """
+    parses SomeClass from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    ##
+    # Parse some_integer
+    ##
+
+    value_0 = value.get(
+        'some_integer',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_integer')
+    else:
+        if not isinstance(value_0, int):
+            errors.add(
+                (ref, 'some_integer'),
+                "Expected an integer, but got: {}".format(
+                    type(value_0)))
+        else:
+            parsed_some_integer = value_0
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_float
+    ##
+
+    value_2 = value.get(
+        'some_float',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_float')
+    else:
+        if not isinstance(value_2, (int, float)):
+            errors.add(
+                (ref, 'some_float'),
+                'Expected a number, but got: {}'.format(
+                    type(value_2)))
+        else:
+            parsed_some_float = float(value_2)
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_string
+    ##
+
+    value_4 = value.get(
+        'some_string',
+        None)
+
+    if value_4 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_string')
+    else:
+        if not isinstance(value_4, str):
+            errors.add(
+                (ref, 'some_string'),
+                "Expected a string, but got: {}".format(
+                    type(value_4)))
+        else:
+            parsed_some_string = value_4
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_path
+    ##
+
+    value_6 = value.get(
+        'some_path',
+        None)
+
+    if value_6 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_path')
+    else:
+        if not isinstance(value_6, str):
+            errors.add(
+                (ref, 'some_path'),
+                "Expected a string, but got: {}".format(
+                    type(value_6)))
+        else:
+            parsed_some_path = value_6
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_array
+    ##
+
+    value_8 = value.get(
+        'some_array',
+        None)
+
+    if value_8 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_array')
+    else:
+        if not isinstance(value_8, list):
+            errors.add(
+                (ref, 'some_array'),
+                "Expected a list, but got: {}".format(
+                    type(value_8)))
+        else:
+            target_9 = (
+                []
+            )  # type: typing.List[int]
+            for i_9, item_9 in enumerate(
+                    value_8):
+                target_item_9 = (
+                    None
+                )  # type: typing.Optional[int]
+                if not isinstance(item_9, int):
+                    errors.add(
+                        (ref, 'some_array', i_9),
+                        "Expected an integer, but got: {}".format(
+                            type(item_9)))
+                else:
+                    target_item_9 = item_9
+
+                if target_item_9 is not None:
+                    target_9.append(
+                        target_item_9)
+
+                if errors.full():
+                    break
+
+            parsed_some_array = target_9
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.SomeClass(
+        id=id,
+        some_integer=parsed_some_integer,
+        some_float=parsed_some_float,
+        some_string=parsed_some_string,
+        some_path=parsed_some_path,
+        some_array=parsed_some_array)
+
+
+def _some_class_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        target: some.graph.SomeClass,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses SomeClass from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as SomeClass
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+    ##
+    # Parse some_integer
+    ##
+
+    value_0 = value.get(
+        'some_integer',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_integer')
+    else:
+        if not isinstance(value_0, int):
+            errors.add(
+                (ref, 'some_integer'),
+                "Expected an integer, but got: {}".format(
+                    type(value_0)))
+        else:
+            target.some_integer = value_0
+    if errors.full():
+        return
+
+    ##
+    # Parse some_float
+    ##
+
+    value_2 = value.get(
+        'some_float',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_float')
+    else:
+        if not isinstance(value_2, (int, float)):
+            errors.add(
+                (ref, 'some_float'),
+                'Expected a number, but got: {}'.format(
+                    type(value_2)))
+        else:
+            target.some_float = float(value_2)
+    if errors.full():
+        return
+
+    ##
+    # Parse some_string
+    ##
+
+    value_4 = value.get(
+        'some_string',
+        None)
+
+    if value_4 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_string')
+    else:
+        if not isinstance(value_4, str):
+            errors.add(
+                (ref, 'some_string'),
+                "Expected a string, but got: {}".format(
+                    type(value_4)))
+        else:
+            target.some_string = value_4
+    if errors.full():
+        return
+
+    ##
+    # Parse some_path
+    ##
+
+    value_6 = value.get(
+        'some_path',
+        None)
+
+    if value_6 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_path')
+    else:
+        if not isinstance(value_6, str):
+            errors.add(
+                (ref, 'some_path'),
+                "Expected a string, but got: {}".format(
+                    type(value_6)))
+        else:
+            target.some_path = value_6
+    if errors.full():
+        return
+
+    ##
+    # Parse some_array
+    ##
+
+    value_8 = value.get(
+        'some_array',
+        None)
+
+    if value_8 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_array')
+    else:
+        if not isinstance(value_8, list):
+            errors.add(
+                (ref, 'some_array'),
+                "Expected a list, but got: {}".format(
+                    type(value_8)))
+        else:
+            target_9 = (
+                []
+            )  # type: typing.List[int]
+            for i_9, item_9 in enumerate(
+                    value_8):
+                target_item_9 = (
+                    None
+                )  # type: typing.Optional[int]
+                if not isinstance(item_9, int):
+                    errors.add(
+                        (ref, 'some_array', i_9),
+                        "Expected an integer, but got: {}".format(
+                            type(item_9)))
+                else:
+                    target_item_9 = item_9
+
+                if target_item_9 is not None:
+                    target_9.append(
+                        target_item_9)
+
+                if errors.full():
+                    break
+
+            target.some_array = target_9
+    if errors.full():
+        return
+
+
+def some_class_from(
+        value: typing.Any,
+        id: str,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeClass]:
+    """
+    parses SomeClass from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _some_class_construct(
+        value=value,
+        id=id,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def some_graph_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            instance_some_class = _some_class_construct(
+                instance_value,
+                id,
+                (ref, 'some_classes', (id, )),
+                errors)
+
+            if instance_some_class is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_some_class = some.graph.parse.placeholder_some_class(id=id)
+
+            graph.some_classes[id] = instance_some_class
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_reference
+    ##
+
+    value_0 = value.get(
+        'some_reference',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_reference')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = graph.some_classes.get(
+                value_0,
+                None)
+            if target_1 is None:
+                errors.add(
+                    (ref, 'some_reference'),
+                    'Reference to an instance of class Some_class not found: {}'.format(
+                        value_0))
+            else:
+                graph.some_reference = target_1
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _some_class_construct_fast(
+        value: typing.Any,
+        id: str
+) -> some.graph.SomeClass:
+    """
+    parses SomeClass optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse some_integer
+    ##
+
+    value_1 = value['some_integer']
+    if not isinstance(value_1, int):
+        raise TypeError("Expected an integer")
+    parsed_some_integer = value_1
+
+    ##
+    # Parse some_float
+    ##
+
+    value_3 = value['some_float']
+    if not isinstance(value_3, (int, float)):
+        raise TypeError("Expected a number")
+    parsed_some_float = float(value_3)
+
+    ##
+    # Parse some_string
+    ##
+
+    value_5 = value['some_string']
+    if not isinstance(value_5, str):
+        raise TypeError("Expected a string")
+    parsed_some_string = value_5
+
+    ##
+    # Parse some_path
+    ##
+
+    value_7 = value['some_path']
+    if not isinstance(value_7, str):
+        raise TypeError("Expected a string")
+    parsed_some_path = value_7
+
+    ##
+    # Parse some_array
+    ##
+
+    value_9 = value['some_array']
+    if not isinstance(value_9, list):
+        raise TypeError("Expected a list")
+    target_9 = (
+        []
+    )  # type: typing.List[int]
+    for item_9 in value_9:
+        if not isinstance(item_9, int):
+            raise TypeError("Expected an integer")
+        target_item_9 = item_9
+        target_9.append(
+            target_item_9)
+    parsed_some_array = target_9
+
+    return some.graph.SomeClass(
+        id=id,
+        some_integer=parsed_some_integer,
+        some_float=parsed_some_float,
+        some_string=parsed_some_string,
+        some_path=parsed_some_path,
+        some_array=parsed_some_array)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.some_classes = collections.OrderedDict()
+        else:
+            graph.some_classes = dict()
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            graph.some_classes[id] = _some_class_construct_fast(
+                instance_value,
+                id)
+
+    ##
+    # Parse some_reference
+    ##
+
+    graph.some_reference = graph.some_classes[
+        value['some_reference']]
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_some_classes = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate some_classes reusing the unchanged instances
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+            some_classes_registry = graph.some_classes
+            previous_some_classes = previous.some_classes
+
+            previous_registry_value = previous_value.get(
+                'some_classes', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_some_class = previous_some_classes.get(id, None)
+                if (target_some_class is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_some_class = some.graph.parse.placeholder_some_class(id=id)
+                    changed_some_classes.add(id)
+
+                some_classes_registry[id] = target_some_class
+
+    changed_some_classes.update(
+        id for id in previous.some_classes
+        if id not in graph.some_classes)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse the new and changed some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+    if registry_value is not None and changed_some_classes:
+        for id, instance_value in registry_value.items():
+            if id not in changed_some_classes:
+                continue
+
+            _some_class_from(
+                instance_value,
+                (ref, 'some_classes', (id, )),
+                graph.some_classes[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_reference
+    ##
+
+    value_0 = value.get(
+        'some_reference',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_reference')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = graph.some_classes.get(
+                value_0,
+                None)
+            if target_1 is None:
+                errors.add(
+                    (ref, 'some_reference'),
+                    'Reference to an instance of class Some_class not found: {}'.format(
+                        value_0))
+            else:
+                graph.some_reference = target_1
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
@@ -0,0 +1,136 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""provides general structures and functions for parsing."""
+
+
+import typing
+
+import some.graph
+
+
+# Ref represents a reference path to a value lazily.
+#
+# The reference is either a string or a tuple of the parent reference
+# followed by the path segments. String segments are rendered verbatim,
+# integer segments are indices and a segment wrapped in a one-tuple is
+# a key rendered with repr. Building a tuple is much cheaper than joining
+# the strings so that the reference is only rendered with ``render_ref``
+# when an error is actually added.
+Ref = typing.Union[str, typing.Tuple[typing.Any, ...]]
+
+
+def render_ref(ref: Ref) -> str:
+    """
+    renders the lazy reference as a string.
+
+    :param ref: reference to the value
+    :return: rendered reference path
+    """
+    if isinstance(ref, str):
+        return ref
+
+    parts = [render_ref(ref[0])]
+    for segment in ref[1:]:
+        if isinstance(segment, tuple):
+            parts.append(repr(segment[0]))
+        else:
+            parts.append(str(segment))
+
+    return '/'.join(parts)
+
+
+class Error:
+    """represents an error occurred while parsing."""
+
+    def __init__(self, ref: str, message: str) -> None:
+        """
+        initializes the error with the given values.
+
+        :param ref: references the cause (e.g., a reference path)
+        :param message: describes the error
+        """
+        self.ref = ref
+        self.message = message
+
+
+class Errors:
+    """
+    collects errors capped at a certain quantity.
+
+    If the capacity is full, the subsequent surplus errors are ignored.
+    """
+
+    def __init__(self, cap: int) -> None:
+        """
+        initializes the error container with the given cap.
+
+        :param cap: maximum number of contained errors
+        """
+        self.cap = cap
+        self._values = []  # type: typing.List[Error]
+
+    def add(self, ref: Ref, message: str) -> None:
+        """
+        adds an error to the container.
+
+        The reference is rendered to a string only if the error is
+        actually stored.
+
+        :param ref: references the cause (e.g., a reference path)
+        :param message: describes the error
+        """
+        if len(self._values) < self.cap:
+            self._values.append(
+                Error(ref=render_ref(ref), message=message))
+
+    def full(self) -> bool:
+        """gives True when there are exactly ``cap`` errors contained."""
+        return len(self._values) == self.cap
+
+    def empty(self) -> bool:
+        """gives True when there are no errors contained."""
+        return len(self._values) == 0
+
+    def count(self) -> int:
+        """returns the number of errors."""
+        return len(self._values)
+
+    def values(self) -> typing.Iterable[Error]:
+        """gives an iterator over the errors."""
+        return iter(self._values)
+
+
+def placeholder_some_class(
+        id: str) -> some.graph.SomeClass:
+    """
+    creates a placeholder instance of SomeClass.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :param id: identifier of the instance
+    :return: empty shell
+    """
+    return some.graph.SomeClass(  # type: ignore
+        id=id,
+        some_integer=None,
+        some_float=None,
+        some_string=None,
+        some_path=None,
+        some_array=None)
+
+
+def placeholder_some_graph() -> some.graph.SomeGraph:
+    """
+    creates a placeholder instance of SomeGraph.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :return: empty shell
+    """
+    return some.graph.SomeGraph(  # type: ignore
+        some_reference=None)
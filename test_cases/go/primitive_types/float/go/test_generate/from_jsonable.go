@@ -2,10 +2,7 @@ package somegraph
 
 // File automatically generated by mapry. DO NOT EDIT OR APPEND!
 
-import (
-	"fmt"
-	"strings"
-)
+import "fmt"
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
 //
@@ -43,6 +40,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeFloat
 	////
@@ -51,17 +50,14 @@ func SomeGraphFromJSONable(
 		"some_float"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_float")
 	} else {
 		cast1, ok1 := value0.(float64)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_float"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_float"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value0))
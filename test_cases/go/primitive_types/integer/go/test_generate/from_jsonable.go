@@ -5,7 +5,6 @@ package somegraph
 import (
 	"fmt"
 	"math"
-	"strings"
 )
 
 // SomeGraphFromJSONable parses SomeGraph from a JSONable value.
@@ -44,6 +43,8 @@ func SomeGraphFromJSONable(
 		return
 	}
 
+	graphRef := NewRef(ref)
+
 	////
 	// Parse SomeInt
 	////
@@ -52,26 +53,20 @@ func SomeGraphFromJSONable(
 		"some_int"]
 
 	if !ok0 {
-		errors.Add(
-			ref,
+		errors.AddRef(
+			graphRef,
 			"property is missing: some_int")
 	} else {
 		fcast1, ok1 := value0.(float64)
 		if !ok1 {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int"),
 				fmt.Sprintf(
 					"expected a float64, but got: %T",
 					value0))
 		} else if fcast1 != math.Trunc(fcast1) {
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int"),
 				fmt.Sprintf(
 					"expected a whole number, but got: %f",
 					fcast1))
@@ -80,11 +75,8 @@ func SomeGraphFromJSONable(
 		} else if fcast1 >= 9223372036854775808.0 ||
 			fcast1 < -9223372036854775808.0 {
 
-			errors.Add(
-				strings.Join(
-					[]string{
-						ref, "some_int"},
-					"/"),
+			errors.AddRef(
+				graphRef.Key("some_int"),
 				fmt.Sprintf(
 					"expected the value to fit into int64, but got an overflow: %f",
 					fcast1))
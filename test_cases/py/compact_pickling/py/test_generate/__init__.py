@@ -0,0 +1,175 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""defines some object graph."""
+
+
+import collections
+import typing
+
+
+class SomeClass:
+    """defines some class."""
+
+    def __init__(
+            self,
+            id: str,
+            some_text: str,
+            some_embed: 'SomeEmbed',
+            some_optional_reference: typing.Optional['SomeClass'] = None) -> None:
+        """
+        initializes an instance of SomeClass with the given values.
+
+        :param id: identifier of the instance:param some_text: defines some text.
+        :param some_embed: defines some embed.
+        :param some_optional_reference: defines some optional reference to an instance.
+
+        """
+        self.id = id
+        self.some_text = some_text
+        self.some_embed = some_embed
+        self.some_optional_reference = some_optional_reference if some_optional_reference is not None else None
+
+    def __getstate__(self) -> typing.Tuple[typing.Any, ...]:
+        """gives the attributes in the order of the properties for pickling."""
+        return (
+            self.id,
+            self.some_text,
+            self.some_embed,
+            self.some_optional_reference,
+        )
+
+    def __setstate__(self, state: typing.Tuple[typing.Any, ...]) -> None:
+        """restores the attributes from the state given by ``__getstate__``."""
+        (
+            self.id,
+            self.some_text,
+            self.some_embed,
+            self.some_optional_reference,
+        ) = state
+
+
+class OtherClass:
+    """defines other class."""
+
+    def __init__(
+            self,
+            id: str) -> None:
+        """
+        initializes an instance of OtherClass with the given values.
+
+        :param id: identifier of the instance
+        """
+        self.id = id
+
+    def __getstate__(self) -> typing.Tuple[typing.Any, ...]:
+        """gives the attributes in the order of the properties for pickling."""
+        return (
+            self.id,
+        )
+
+    def __setstate__(self, state: typing.Tuple[typing.Any, ...]) -> None:
+        """restores the attributes from the state given by ``__getstate__``."""
+        (
+            self.id,
+        ) = state
+
+
+class SomeEmbed:
+    """defines some embeddable structure."""
+
+    def __init__(
+            self,
+            reference_to_other_class: OtherClass,
+            empty: 'Empty') -> None:
+        """
+        initializes an instance of SomeEmbed with the given values.
+
+        :param reference_to_other_class: defines some reference to an instance.
+        :param empty: defines some empty embeddable structure.
+
+        """
+        self.reference_to_other_class = reference_to_other_class
+        self.empty = empty
+
+    def __getstate__(self) -> typing.Tuple[typing.Any, ...]:
+        """gives the attributes in the order of the properties for pickling."""
+        return (
+            self.reference_to_other_class,
+            self.empty,
+        )
+
+    def __setstate__(self, state: typing.Tuple[typing.Any, ...]) -> None:
+        """restores the attributes from the state given by ``__getstate__``."""
+        (
+            self.reference_to_other_class,
+            self.empty,
+        ) = state
+
+
+class Empty:
+    """defines an empty embeddable structure."""
+
+
+class SomeGraph:
+    """defines some object graph."""
+
+    def __init__(
+            self,
+            some_property: SomeEmbed,
+            some_optional_number: typing.Optional[int] = None,
+            some_classes: typing.Optional[typing.MutableMapping[str, SomeClass]] = None,
+            other_classes: typing.Optional[typing.MutableMapping[str, OtherClass]] = None) -> None:
+        """
+        initializes an instance of SomeGraph with the given values.
+
+        The class registries are initialized with empty ordered dictionaries.
+        :param some_property: defines some property.
+        :param some_optional_number: defines some optional number.
+        :param some_classes:
+            registry of instances of SomeClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+        :param other_classes:
+            registry of instances of OtherClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+
+        """
+        self.some_property = some_property
+        self.some_optional_number = some_optional_number if some_optional_number is not None else None
+
+        if some_classes is not None:
+            self.some_classes = some_classes
+        else:
+            self.some_classes = collections.OrderedDict()
+
+        if other_classes is not None:
+            self.other_classes = other_classes
+        else:
+            self.other_classes = collections.OrderedDict()
+
+    def __getstate__(self) -> typing.Tuple[typing.Any, ...]:
+        """gives the attributes in the order of the properties for pickling."""
+        return (
+            self.some_property,
+            self.some_optional_number,
+            list(self.some_classes.values()),
+            list(self.other_classes.values()),
+        )
+
+    def __setstate__(self, state: typing.Tuple[typing.Any, ...]) -> None:
+        """restores the attributes from the state given by ``__getstate__``."""
+        (
+            self.some_property,
+            self.some_optional_number,
+            some_classes,
+            other_classes,
+        ) = state
+
+        self.some_classes = collections.OrderedDict(
+            (instance.id, instance) for instance in some_classes)
+
+        self.other_classes = collections.OrderedDict(
+            (instance.id, instance) for instance in other_classes)
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
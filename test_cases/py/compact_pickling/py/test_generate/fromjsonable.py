@@ -0,0 +1,1130 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses JSONable objects."""
+
+
+import collections
+import typing
+
+import some.graph
+import some.graph.parse
+
+
+def _some_class_from(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        some_classes_registry: typing.Mapping[
+            str,
+            some.graph.SomeClass],
+        ref: some.graph.parse.Ref,
+        target: some.graph.SomeClass,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses SomeClass from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param other_classes_registry: registry of the OtherClass instances
+    :param some_classes_registry: registry of the SomeClass instances
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as SomeClass
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+    ##
+    # Parse some_text
+    ##
+
+    value_0 = value.get(
+        'some_text',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_text')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_text'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        else:
+            target.some_text = value_0
+    if errors.full():
+        return
+
+    ##
+    # Parse some_embed
+    ##
+
+    value_2 = value.get(
+        'some_embed',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_embed')
+    else:
+        target_3 = _some_embed_from(
+            value_2,
+            other_classes_registry,
+            (ref, 'some_embed'),
+            errors)
+        if target_3 is not None:
+            target.some_embed = target_3
+    if errors.full():
+        return
+
+    ##
+    # Parse some_optional_reference
+    ##
+
+    value_4 = value.get(
+        'some_optional_reference',
+        None)
+
+    if value_4 is not None:
+        if not isinstance(value_4, str):
+            errors.add(
+                (ref, 'some_optional_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_4)))
+        else:
+            target_5 = some_classes_registry.get(
+                value_4,
+                None)
+            if target_5 is None:
+                errors.add(
+                    (ref, 'some_optional_reference'),
+                    'Reference to an instance of class Some_class not found: {}'.format(
+                        value_4))
+            else:
+                target.some_optional_reference = target_5
+    if errors.full():
+        return
+
+
+def some_class_from(
+        value: typing.Any,
+        id: str,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        some_classes_registry: typing.Mapping[
+            str,
+            some.graph.SomeClass],
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeClass]:
+    """
+    parses SomeClass from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param other_classes_registry:
+        registry of the OtherClass instances
+    :param some_classes_registry:
+        registry of the SomeClass instances
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = some.graph.parse.placeholder_some_class(id=id)
+
+    _some_class_from(
+        value=value,
+        other_classes_registry=other_classes_registry,
+        some_classes_registry=some_classes_registry,
+        ref=ref,
+        target=target,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _other_class_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        target: some.graph.OtherClass,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses OtherClass from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as OtherClass
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+
+def other_class_from(
+        value: typing.Any,
+        id: str,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.OtherClass]:
+    """
+    parses OtherClass from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = some.graph.parse.placeholder_other_class(id=id)
+
+    _other_class_from(
+        value=value,
+        ref=ref,
+        target=target,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _some_embed_from(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeEmbed]:
+    """
+    parses SomeEmbed from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param other_classes_registry: registry of the OtherClass instances
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    ##
+    # Parse reference_to_other_class
+    ##
+
+    value_0 = value.get(
+        'reference_to_other_class',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: reference_to_other_class')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'reference_to_other_class'),
+                "Expected a str, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = other_classes_registry.get(
+                value_0,
+                None)
+            if target_1 is None:
+                errors.add(
+                    (ref, 'reference_to_other_class'),
+                    'Reference to an instance of class Other_class not found: {}'.format(
+                        value_0))
+            else:
+                parsed_reference_to_other_class = target_1
+    if errors.full():
+        return None
+
+    ##
+    # Parse empty
+    ##
+
+    value_2 = value.get(
+        'empty',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: empty')
+    else:
+        target_3 = _empty_from(
+            value_2,
+            (ref, 'empty'),
+            errors)
+        if target_3 is not None:
+            parsed_empty = target_3
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.SomeEmbed(
+        reference_to_other_class=parsed_reference_to_other_class,
+        empty=parsed_empty)
+
+
+def some_embed_from(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeEmbed]:
+    """
+    parses SomeEmbed from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param other_classes_registry:
+        registry of the OtherClass instances
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _some_embed_from(
+        value=value,
+        other_classes_registry=other_classes_registry,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _empty_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.Empty]:
+    """
+    parses Empty from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    return some.graph.Empty()
+
+
+def empty_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.Empty]:
+    """
+    parses Empty from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _empty_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def some_graph_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+            some_classes_registry = graph.some_classes
+            for id in registry_value:
+                some_classes_registry[id] = some.graph.parse.placeholder_some_class(id=id)
+
+    if errors.full():
+        return None
+
+    ##
+    # Pre-allocate other_classes
+    ##
+
+    registry_value = value.get('other_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'other_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.other_classes = collections.OrderedDict()
+            else:
+                graph.other_classes = dict()
+
+            other_classes_registry = graph.other_classes
+            for id in registry_value:
+                other_classes_registry[id] = some.graph.parse.placeholder_other_class(id=id)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            target_some_class = graph.some_classes[id]
+            target_some_class.id = id
+
+            _some_class_from(
+                instance_value,
+                graph.other_classes,
+                graph.some_classes,
+                (ref, 'some_classes', (id, )),
+                target_some_class,
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse other_classes
+    ##
+
+    if 'other_classes' in value:
+        registry_value = value['other_classes']
+        for id, instance_value in registry_value.items():
+            target_other_class = graph.other_classes[id]
+            target_other_class.id = id
+
+            _other_class_from(
+                instance_value,
+                (ref, 'other_classes', (id, )),
+                target_other_class,
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_property
+    ##
+
+    value_0 = value.get(
+        'some_property',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_property')
+    else:
+        target_1 = _some_embed_from(
+            value_0,
+            graph.other_classes,
+            (ref, 'some_property'),
+            errors)
+        if target_1 is not None:
+            graph.some_property = target_1
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_optional_number
+    ##
+
+    value_2 = value.get(
+        'some_optional_number',
+        None)
+
+    if value_2 is not None:
+        if not isinstance(value_2, int):
+            errors.add(
+                (ref, 'some_optional_number'),
+                "Expected an integer, but got: {}".format(
+                    type(value_2)))
+        else:
+            graph.some_optional_number = value_2
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _some_class_from_fast(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        some_classes_registry: typing.Mapping[
+            str,
+            some.graph.SomeClass],
+        target: some.graph.SomeClass
+) -> None:
+    """
+    parses SomeClass optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :param other_classes_registry: registry of the OtherClass instances
+    :param some_classes_registry: registry of the SomeClass instances
+    :param target: parsed ``value`` as SomeClass
+    :return:
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse some_text
+    ##
+
+    value_1 = value['some_text']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    target.some_text = value_1
+
+    ##
+    # Parse some_embed
+    ##
+
+    target.some_embed = _some_embed_from_fast(
+        value['some_embed'],
+        other_classes_registry)
+
+    ##
+    # Parse some_optional_reference
+    ##
+
+    value_4 = value.get(
+        'some_optional_reference',
+        None)
+    if value_4 is not None:
+        target.some_optional_reference = some_classes_registry[
+            value_4]
+
+
+def _other_class_from_fast(
+        value: typing.Any,
+        target: some.graph.OtherClass
+) -> None:
+    """
+    parses OtherClass optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :param target: parsed ``value`` as OtherClass
+    :return:
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+
+def _some_embed_from_fast(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass]
+) -> some.graph.SomeEmbed:
+    """
+    parses SomeEmbed optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param other_classes_registry: registry of the OtherClass instances
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse reference_to_other_class
+    ##
+
+    parsed_reference_to_other_class = other_classes_registry[
+        value['reference_to_other_class']]
+
+    ##
+    # Parse empty
+    ##
+
+    parsed_empty = _empty_from_fast(
+        value['empty'])
+
+    return some.graph.SomeEmbed(
+        reference_to_other_class=parsed_reference_to_other_class,
+        empty=parsed_empty)
+
+
+def _empty_from_fast(
+        value: typing.Any
+) -> some.graph.Empty:
+    """
+    parses Empty optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    return some.graph.Empty()
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.some_classes = collections.OrderedDict()
+        else:
+            graph.some_classes = dict()
+
+        some_classes_registry = graph.some_classes
+        for id in registry_value:
+            some_classes_registry[id] = some.graph.parse.placeholder_some_class(id=id)
+
+    ##
+    # Pre-allocate other_classes
+    ##
+
+    registry_value = value.get('other_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.other_classes = collections.OrderedDict()
+        else:
+            graph.other_classes = dict()
+
+        other_classes_registry = graph.other_classes
+        for id in registry_value:
+            other_classes_registry[id] = some.graph.parse.placeholder_other_class(id=id)
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            _some_class_from_fast(
+                instance_value,
+                graph.other_classes,
+                graph.some_classes,
+                graph.some_classes[id])
+
+    ##
+    # Parse other_classes
+    ##
+
+    if 'other_classes' in value:
+        registry_value = value['other_classes']
+        for id, instance_value in registry_value.items():
+            _other_class_from_fast(
+                instance_value,
+                graph.other_classes[id])
+
+    ##
+    # Parse some_property
+    ##
+
+    graph.some_property = _some_embed_from_fast(
+        value['some_property'],
+        graph.other_classes)
+
+    ##
+    # Parse some_optional_number
+    ##
+
+    value_2 = value.get(
+        'some_optional_number',
+        None)
+    if value_2 is not None:
+        if not isinstance(value_2, int):
+            raise TypeError("Expected an integer")
+        graph.some_optional_number = value_2
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _mentions_any(value: typing.Any, ids: typing.AbstractSet[str]) -> bool:
+    """
+    checks whether any of the strings in the JSONable value is in ``ids``.
+
+    The keys of the dictionaries are not considered since they can not refer
+    to instances.
+
+    :param value: JSONable value
+    :param ids: identifiers of the instances
+    :return: True if any identifier is mentioned
+    """
+    if isinstance(value, str):
+        return value in ids
+
+    if isinstance(value, dict):
+        return any(_mentions_any(item, ids) for item in value.values())
+
+    if isinstance(value, list):
+        return any(_mentions_any(item, ids) for item in value)
+
+    return False
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_some_classes = set()  # type: typing.Set[str]
+    changed_other_classes = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate some_classes reusing the unchanged instances
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+            some_classes_registry = graph.some_classes
+            previous_some_classes = previous.some_classes
+
+            previous_registry_value = previous_value.get(
+                'some_classes', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_some_class = previous_some_classes.get(id, None)
+                if (target_some_class is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_some_class = some.graph.parse.placeholder_some_class(id=id)
+                    changed_some_classes.add(id)
+
+                some_classes_registry[id] = target_some_class
+
+    changed_some_classes.update(
+        id for id in previous.some_classes
+        if id not in graph.some_classes)
+
+    if errors.full():
+        return None
+
+    ##
+    # Pre-allocate other_classes reusing the unchanged instances
+    ##
+
+    registry_value = value.get('other_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'other_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.other_classes = collections.OrderedDict()
+            else:
+                graph.other_classes = dict()
+
+            other_classes_registry = graph.other_classes
+            previous_other_classes = previous.other_classes
+
+            previous_registry_value = previous_value.get(
+                'other_classes', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_other_class = previous_other_classes.get(id, None)
+                if (target_other_class is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_other_class = some.graph.parse.placeholder_other_class(id=id)
+                    changed_other_classes.add(id)
+
+                other_classes_registry[id] = target_other_class
+
+    changed_other_classes.update(
+        id for id in previous.other_classes
+        if id not in graph.other_classes)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse anew the instances referring to the new, changed or removed
+    # instances until no more instances need to be parsed anew.
+    ##
+
+    has_changed = True
+    while has_changed:
+        has_changed = False
+
+        referred = changed_other_classes | changed_some_classes
+
+        registry_value = value.get('some_classes', None)
+        if referred and registry_value is not None:
+            for id, instance_value in registry_value.items():
+                if (id not in changed_some_classes and
+                        _mentions_any(instance_value, referred)):
+                    graph.some_classes[id] = some.graph.parse.placeholder_some_class(id=id)
+                    changed_some_classes.add(id)
+                    has_changed = True
+
+    ##
+    # Parse the new and changed some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+    if registry_value is not None and changed_some_classes:
+        for id, instance_value in registry_value.items():
+            if id not in changed_some_classes:
+                continue
+
+            _some_class_from(
+                instance_value,
+                graph.other_classes,
+                graph.some_classes,
+                (ref, 'some_classes', (id, )),
+                graph.some_classes[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse the new and changed other_classes
+    ##
+
+    registry_value = value.get('other_classes', None)
+    if registry_value is not None and changed_other_classes:
+        for id, instance_value in registry_value.items():
+            if id not in changed_other_classes:
+                continue
+
+            _other_class_from(
+                instance_value,
+                (ref, 'other_classes', (id, )),
+                graph.other_classes[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_property
+    ##
+
+    value_0 = value.get(
+        'some_property',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_property')
+    else:
+        target_1 = _some_embed_from(
+            value_0,
+            graph.other_classes,
+            (ref, 'some_property'),
+            errors)
+        if target_1 is not None:
+            graph.some_property = target_1
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_optional_number
+    ##
+
+    value_2 = value.get(
+        'some_optional_number',
+        None)
+
+    if value_2 is not None:
+        if not isinstance(value_2, int):
+            errors.add(
+                (ref, 'some_optional_number'),
+                "Expected an integer, but got: {}".format(
+                    type(value_2)))
+        else:
+            graph.some_optional_number = value_2
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
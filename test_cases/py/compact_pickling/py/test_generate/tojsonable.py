@@ -0,0 +1,353 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""serializes to JSONable objects."""
+
+
+import collections
+import json
+import typing
+
+import some.graph
+
+
+def serialize_some_class(
+        instance: some.graph.SomeClass,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of SomeClass to a JSONable representation.
+
+    :param instance: the instance of SomeClass to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize some_text
+    ##
+
+    target['some_text'] = instance.some_text
+
+    ##
+    # Serialize some_embed
+    ##
+
+    target['some_embed'] = serialize_some_embed(instance.some_embed)
+
+    ##
+    # Serialize some_optional_reference
+    ##
+
+    if instance.some_optional_reference is not None:
+        target['some_optional_reference'] = instance.some_optional_reference.id
+
+    return target
+
+
+def serialize_other_class(
+        instance: some.graph.OtherClass,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of OtherClass to a JSONable representation.
+
+    :param instance: the instance of OtherClass to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    return target
+
+
+def serialize_some_embed(
+        instance: some.graph.SomeEmbed,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of SomeEmbed to a JSONable representation.
+
+    :param instance: the instance of SomeEmbed to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize reference_to_other_class
+    ##
+
+    target['reference_to_other_class'] = instance.reference_to_other_class.id
+
+    ##
+    # Serialize empty
+    ##
+
+    target['empty'] = serialize_empty(instance.empty)
+
+    return target
+
+
+def serialize_empty(
+        instance: some.graph.Empty,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of Empty to a JSONable representation.
+
+    :param instance: the instance of Empty to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    return target
+
+
+def serialize_some_graph(
+        instance: some.graph.SomeGraph,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of SomeGraph to a JSONable.
+
+    :param instance: the instance of SomeGraph to be serialized
+    :param ordered:
+        If set, represents the instance properties and class registries
+        as a ``collections.OrderedDict``.
+        Otherwise, they are represented as a ``dict``.
+    :return: JSONable representation
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize some_property
+    ##
+
+    target['some_property'] = serialize_some_embed(instance.some_property)
+
+    ##
+    # Serialize some_optional_number
+    ##
+
+    if instance.some_optional_number is not None:
+        target['some_optional_number'] = instance.some_optional_number
+
+    ##
+    # Serialize instance registry of SomeClass
+    ##
+
+    if len(instance.some_classes) > 0:
+        if ordered:
+            target_some_classes = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, typing.Any]
+        else:
+            target_some_classes = dict()
+
+        for id, some_class_instance in instance.some_classes.items():
+            if id != some_class_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of SomeClass, but got: {!r}'.format(
+                        id, some_class_instance.id))
+
+            target_some_classes[id] = serialize_some_class(
+                instance=some_class_instance,
+                ordered=ordered)
+        target['some_classes'] = target_some_classes
+
+    ##
+    # Serialize instance registry of OtherClass
+    ##
+
+    if len(instance.other_classes) > 0:
+        if ordered:
+            target_other_classes = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, typing.Any]
+        else:
+            target_other_classes = dict()
+
+        for id, other_class_instance in instance.other_classes.items():
+            if id != other_class_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of OtherClass, but got: {!r}'.format(
+                        id, other_class_instance.id))
+
+            target_other_classes[id] = serialize_other_class(
+                instance=other_class_instance,
+                ordered=ordered)
+        target['other_classes'] = target_other_classes
+
+    return target
+
+
+class _WriteBuffer:
+    """buffers the chunks of text before writing them to a file."""
+
+    def __init__(self, fp: typing.TextIO, size: int) -> None:
+        """
+        initializes the buffer.
+
+        :param fp: file-like object to write to
+        :param size: number of characters to buffer before writing
+        """
+        self.fp = fp
+        self.size = size
+        self._chunks = []  # type: typing.List[str]
+        self._length = 0
+
+    def write(self, text: str) -> None:
+        """buffers the text and writes it out if the buffer is full."""
+        self._chunks.append(text)
+        self._length += len(text)
+
+        if self._length >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        """writes out the buffered text."""
+        if self._chunks:
+            self.fp.write(''.join(self._chunks))
+            self._chunks = []
+            self._length = 0
+
+
+def write_some_graph_json(
+        instance: some.graph.SomeGraph,
+        fp: typing.TextIO,
+        buffer_size: int = 65536
+) -> None:
+    """
+    writes an instance of SomeGraph as JSON text to ``fp``.
+
+    The text is the same as ``json.dumps(serialize_some_graph(instance))``, but
+    the properties and the class instances are serialized one at a time
+    so that the whole JSONable never needs to be held in memory.
+
+    :param instance: the instance of SomeGraph to be written
+    :param fp: file-like object to write the JSON text to
+    :param buffer_size:
+        number of characters buffered before they are written to ``fp``
+    :return:
+    """
+    buffer = _WriteBuffer(fp=fp, size=buffer_size)
+
+    buffer.write('{')
+    delimiter = ''
+
+    ##
+    # Write some_property
+    ##
+
+    jsonable_some_property = serialize_some_embed(instance.some_property)
+    buffer.write(delimiter)
+    buffer.write('"some_property": ')
+    buffer.write(json.dumps(jsonable_some_property))
+    delimiter = ', '
+
+    ##
+    # Write some_optional_number
+    ##
+
+    if instance.some_optional_number is not None:
+        jsonable_some_optional_number = instance.some_optional_number
+        buffer.write(delimiter)
+        buffer.write('"some_optional_number": ')
+        buffer.write(json.dumps(jsonable_some_optional_number))
+        delimiter = ', '
+
+    ##
+    # Write instance registry of SomeClass
+    ##
+
+    if len(instance.some_classes) > 0:
+        buffer.write(delimiter)
+        buffer.write('"some_classes": {')
+
+        registry_delimiter = ''
+        for id, some_class_instance in instance.some_classes.items():
+            if id != some_class_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of SomeClass, but got: {!r}'.format(
+                        id, some_class_instance.id))
+
+            buffer.write(registry_delimiter)
+            buffer.write(json.dumps(id))
+            buffer.write(': ')
+            buffer.write(
+                json.dumps(
+                    serialize_some_class(
+                        instance=some_class_instance)))
+            registry_delimiter = ', '
+
+        buffer.write('}')
+        delimiter = ', '
+
+    ##
+    # Write instance registry of OtherClass
+    ##
+
+    if len(instance.other_classes) > 0:
+        buffer.write(delimiter)
+        buffer.write('"other_classes": {')
+
+        registry_delimiter = ''
+        for id, other_class_instance in instance.other_classes.items():
+            if id != other_class_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of OtherClass, but got: {!r}'.format(
+                        id, other_class_instance.id))
+
+            buffer.write(registry_delimiter)
+            buffer.write(json.dumps(id))
+            buffer.write(': ')
+            buffer.write(
+                json.dumps(
+                    serialize_other_class(
+                        instance=other_class_instance)))
+            registry_delimiter = ', '
+
+        buffer.write('}')
+        delimiter = ', '
+
+    buffer.write('}')
+    buffer.flush()
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,48 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""compiles SomeGraph to native extensions with mypyc."""
+
+
+import os
+import pathlib
+import sys
+import typing
+
+import mypyc.build
+import setuptools  # type: ignore
+
+
+def main() -> int:
+    """
+    executes the main routine.
+
+    The modules are compiled in place next to their sources. The command-line
+    arguments are passed on to ``setup.py build_ext``.
+
+    :return: exit code
+    """
+    # Directory containing the top-level package of some.graph
+    root = pathlib.Path(os.path.realpath(__file__)).parents[2]
+
+    paths = [
+        'some/graph/parse.py',
+        'some/graph/fromjsonable.py',
+        'some/graph/tojsonable.py',
+    ]  # type: typing.List[str]
+
+    os.chdir(str(root))
+
+    setuptools.setup(
+        name='some.graph',
+        ext_modules=mypyc.build.mypycify(paths),
+        script_args=['build_ext', '--inplace'] + sys.argv[1:])
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
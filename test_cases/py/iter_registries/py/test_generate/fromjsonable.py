@@ -0,0 +1,1393 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses JSONable objects."""
+
+
+import collections
+import typing
+
+import some.graph
+import some.graph.parse
+
+
+def _some_class_construct(
+        value: typing.Any,
+        id: str,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeClass]:
+    """
+    parses SomeClass from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param other_classes_registry: registry of the OtherClass instances
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    parsed_some_optional_reference = None  # type: typing.Optional[some.graph.OtherClass]
+
+    ##
+    # Parse some_text
+    ##
+
+    value_0 = value.get(
+        'some_text',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_text')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_text'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        else:
+            parsed_some_text = value_0
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_array
+    ##
+
+    value_2 = value.get(
+        'some_array',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_array')
+    else:
+        if not isinstance(value_2, list):
+            errors.add(
+                (ref, 'some_array'),
+                "Expected a list, but got: {}".format(
+                    type(value_2)))
+        else:
+            target_3 = (
+                []
+            )  # type: typing.List[int]
+            for i_3, item_3 in enumerate(
+                    value_2):
+                target_item_3 = (
+                    None
+                )  # type: typing.Optional[int]
+                if not isinstance(item_3, int):
+                    errors.add(
+                        (ref, 'some_array', i_3),
+                        "Expected an integer, but got: {}".format(
+                            type(item_3)))
+                else:
+                    target_item_3 = item_3
+
+                if target_item_3 is not None:
+                    target_3.append(
+                        target_item_3)
+
+                if errors.full():
+                    break
+
+            parsed_some_array = target_3
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_embed
+    ##
+
+    value_5 = value.get(
+        'some_embed',
+        None)
+
+    if value_5 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_embed')
+    else:
+        target_6 = _some_embed_from(
+            value_5,
+            (ref, 'some_embed'),
+            errors)
+        if target_6 is not None:
+            parsed_some_embed = target_6
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_optional_reference
+    ##
+
+    value_7 = value.get(
+        'some_optional_reference',
+        None)
+
+    if value_7 is not None:
+        if not isinstance(value_7, str):
+            errors.add(
+                (ref, 'some_optional_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_7)))
+        else:
+            target_8 = other_classes_registry.get(
+                value_7,
+                None)
+            if target_8 is None:
+                errors.add(
+                    (ref, 'some_optional_reference'),
+                    'Reference to an instance of class Other_class not found: {}'.format(
+                        value_7))
+            else:
+                parsed_some_optional_reference = target_8
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.SomeClass(
+        id=id,
+        some_text=parsed_some_text,
+        some_array=parsed_some_array,
+        some_embed=parsed_some_embed,
+        some_optional_reference=parsed_some_optional_reference)
+
+
+def _some_class_from(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        ref: some.graph.parse.Ref,
+        target: some.graph.SomeClass,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses SomeClass from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param other_classes_registry: registry of the OtherClass instances
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as SomeClass
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+    ##
+    # Parse some_text
+    ##
+
+    value_0 = value.get(
+        'some_text',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_text')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_text'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        else:
+            target.some_text = value_0
+    if errors.full():
+        return
+
+    ##
+    # Parse some_array
+    ##
+
+    value_2 = value.get(
+        'some_array',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_array')
+    else:
+        if not isinstance(value_2, list):
+            errors.add(
+                (ref, 'some_array'),
+                "Expected a list, but got: {}".format(
+                    type(value_2)))
+        else:
+            target_3 = (
+                []
+            )  # type: typing.List[int]
+            for i_3, item_3 in enumerate(
+                    value_2):
+                target_item_3 = (
+                    None
+                )  # type: typing.Optional[int]
+                if not isinstance(item_3, int):
+                    errors.add(
+                        (ref, 'some_array', i_3),
+                        "Expected an integer, but got: {}".format(
+                            type(item_3)))
+                else:
+                    target_item_3 = item_3
+
+                if target_item_3 is not None:
+                    target_3.append(
+                        target_item_3)
+
+                if errors.full():
+                    break
+
+            target.some_array = target_3
+    if errors.full():
+        return
+
+    ##
+    # Parse some_embed
+    ##
+
+    value_5 = value.get(
+        'some_embed',
+        None)
+
+    if value_5 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_embed')
+    else:
+        target_6 = _some_embed_from(
+            value_5,
+            (ref, 'some_embed'),
+            errors)
+        if target_6 is not None:
+            target.some_embed = target_6
+    if errors.full():
+        return
+
+    ##
+    # Parse some_optional_reference
+    ##
+
+    value_7 = value.get(
+        'some_optional_reference',
+        None)
+
+    if value_7 is not None:
+        if not isinstance(value_7, str):
+            errors.add(
+                (ref, 'some_optional_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_7)))
+        else:
+            target_8 = other_classes_registry.get(
+                value_7,
+                None)
+            if target_8 is None:
+                errors.add(
+                    (ref, 'some_optional_reference'),
+                    'Reference to an instance of class Other_class not found: {}'.format(
+                        value_7))
+            else:
+                target.some_optional_reference = target_8
+    if errors.full():
+        return
+
+
+def some_class_from(
+        value: typing.Any,
+        id: str,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeClass]:
+    """
+    parses SomeClass from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param other_classes_registry:
+        registry of the OtherClass instances
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _some_class_construct(
+        value=value,
+        id=id,
+        other_classes_registry=other_classes_registry,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _other_class_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        target: some.graph.OtherClass,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses OtherClass from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as OtherClass
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+
+def other_class_from(
+        value: typing.Any,
+        id: str,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.OtherClass]:
+    """
+    parses OtherClass from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = some.graph.parse.placeholder_other_class(id=id)
+
+    _other_class_from(
+        value=value,
+        ref=ref,
+        target=target,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _some_embed_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeEmbed]:
+    """
+    parses SomeEmbed from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    ##
+    # Parse some_number
+    ##
+
+    value_0 = value.get(
+        'some_number',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_number')
+    else:
+        if not isinstance(value_0, int):
+            errors.add(
+                (ref, 'some_number'),
+                "Expected an integer, but got: {}".format(
+                    type(value_0)))
+        else:
+            parsed_some_number = value_0
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.SomeEmbed(
+        some_number=parsed_some_number)
+
+
+def some_embed_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeEmbed]:
+    """
+    parses SomeEmbed from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _some_embed_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def some_graph_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+    if errors.full():
+        return None
+
+    ##
+    # Pre-allocate other_classes
+    ##
+
+    registry_value = value.get('other_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'other_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.other_classes = collections.OrderedDict()
+            else:
+                graph.other_classes = dict()
+
+            other_classes_registry = graph.other_classes
+            for id in registry_value:
+                other_classes_registry[id] = some.graph.parse.placeholder_other_class(id=id)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            instance_some_class = _some_class_construct(
+                instance_value,
+                id,
+                graph.other_classes,
+                (ref, 'some_classes', (id, )),
+                errors)
+
+            if instance_some_class is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_some_class = some.graph.parse.placeholder_some_class(id=id)
+
+            graph.some_classes[id] = instance_some_class
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse other_classes
+    ##
+
+    if 'other_classes' in value:
+        registry_value = value['other_classes']
+        for id, instance_value in registry_value.items():
+            target_other_class = graph.other_classes[id]
+            target_other_class.id = id
+
+            _other_class_from(
+                instance_value,
+                (ref, 'other_classes', (id, )),
+                target_other_class,
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_reference
+    ##
+
+    value_0 = value.get(
+        'some_reference',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_reference')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = graph.some_classes.get(
+                value_0,
+                None)
+            if target_1 is None:
+                errors.add(
+                    (ref, 'some_reference'),
+                    'Reference to an instance of class Some_class not found: {}'.format(
+                        value_0))
+            else:
+                graph.some_reference = target_1
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_optional_number
+    ##
+
+    value_2 = value.get(
+        'some_optional_number',
+        None)
+
+    if value_2 is not None:
+        if not isinstance(value_2, int):
+            errors.add(
+                (ref, 'some_optional_number'),
+                "Expected an integer, but got: {}".format(
+                    type(value_2)))
+        else:
+            graph.some_optional_number = value_2
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _some_class_construct_fast(
+        value: typing.Any,
+        id: str,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass]
+) -> some.graph.SomeClass:
+    """
+    parses SomeClass optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :param other_classes_registry: registry of the OtherClass instances
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    parsed_some_optional_reference = None  # type: typing.Optional[some.graph.OtherClass]
+
+    ##
+    # Parse some_text
+    ##
+
+    value_1 = value['some_text']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    parsed_some_text = value_1
+
+    ##
+    # Parse some_array
+    ##
+
+    value_3 = value['some_array']
+    if not isinstance(value_3, list):
+        raise TypeError("Expected a list")
+    target_3 = (
+        []
+    )  # type: typing.List[int]
+    for item_3 in value_3:
+        if not isinstance(item_3, int):
+            raise TypeError("Expected an integer")
+        target_item_3 = item_3
+        target_3.append(
+            target_item_3)
+    parsed_some_array = target_3
+
+    ##
+    # Parse some_embed
+    ##
+
+    parsed_some_embed = _some_embed_from_fast(
+        value['some_embed'])
+
+    ##
+    # Parse some_optional_reference
+    ##
+
+    value_7 = value.get(
+        'some_optional_reference',
+        None)
+    if value_7 is not None:
+        parsed_some_optional_reference = other_classes_registry[
+            value_7]
+
+    return some.graph.SomeClass(
+        id=id,
+        some_text=parsed_some_text,
+        some_array=parsed_some_array,
+        some_embed=parsed_some_embed,
+        some_optional_reference=parsed_some_optional_reference)
+
+
+def _other_class_from_fast(
+        value: typing.Any,
+        target: some.graph.OtherClass
+) -> None:
+    """
+    parses OtherClass optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :param target: parsed ``value`` as OtherClass
+    :return:
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+
+def _some_embed_from_fast(
+        value: typing.Any
+) -> some.graph.SomeEmbed:
+    """
+    parses SomeEmbed optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse some_number
+    ##
+
+    value_1 = value['some_number']
+    if not isinstance(value_1, int):
+        raise TypeError("Expected an integer")
+    parsed_some_number = value_1
+
+    return some.graph.SomeEmbed(
+        some_number=parsed_some_number)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.some_classes = collections.OrderedDict()
+        else:
+            graph.some_classes = dict()
+
+    ##
+    # Pre-allocate other_classes
+    ##
+
+    registry_value = value.get('other_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.other_classes = collections.OrderedDict()
+        else:
+            graph.other_classes = dict()
+
+        other_classes_registry = graph.other_classes
+        for id in registry_value:
+            other_classes_registry[id] = some.graph.parse.placeholder_other_class(id=id)
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            graph.some_classes[id] = _some_class_construct_fast(
+                instance_value,
+                id,
+                graph.other_classes)
+
+    ##
+    # Parse other_classes
+    ##
+
+    if 'other_classes' in value:
+        registry_value = value['other_classes']
+        for id, instance_value in registry_value.items():
+            _other_class_from_fast(
+                instance_value,
+                graph.other_classes[id])
+
+    ##
+    # Parse some_reference
+    ##
+
+    graph.some_reference = graph.some_classes[
+        value['some_reference']]
+
+    ##
+    # Parse some_optional_number
+    ##
+
+    value_2 = value.get(
+        'some_optional_number',
+        None)
+    if value_2 is not None:
+        if not isinstance(value_2, int):
+            raise TypeError("Expected an integer")
+        graph.some_optional_number = value_2
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def iter_some_classes(
+        fp: typing.TextIO,
+        ref: str,
+        errors: some.graph.parse.Errors,
+        chunk_size: int = 65536
+) -> typing.Iterator[some.graph.SomeClass]:
+    """
+    parses the instances of SomeClass one at a time from a JSON file.
+
+    The JSON file is expected to contain SomeGraph. The file is
+    read incrementally and only the instances of the registry
+    'some_classes' are decoded, one at a time, so that
+    the memory is bounded by the size of a single instance. The rest of the file
+    after the registry is not read.
+
+    The references to the instances are not resolved: they are given as
+    placeholders with only the identifier set and their existence is not checked.
+
+    The iteration stops at the first error.
+
+    :param fp: text stream of the JSON file
+    :param ref: reference to the file (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :param chunk_size: number of characters read from ``fp`` at once
+    :return: parsed instances of SomeClass in the order of the file
+    """
+    if errors.full():
+        return
+
+    error_count = errors.count()
+    stream = some.graph.parse.JSONStream(fp=fp, chunk_size=chunk_size)
+
+    other_classes_registry = (
+        some.graph.parse.UnresolvedRegistry(
+            placeholder=some.graph.parse.placeholder_other_class))
+
+    try:
+        if stream.next_char() != '{':
+            errors.add(
+                ref,
+                "Expected a dictionary, but got: {}".format(
+                    type(stream.read_value())))
+            return
+
+        for key in stream.iterate_object():
+            if key != 'some_classes':
+                stream.skip_value()
+                continue
+
+            if stream.next_char() != '{':
+                registry_value = stream.read_value()
+                if registry_value is not None:
+                    errors.add(
+                        (ref, 'some_classes'),
+                        "Expected a dictionary, but got: {}".format(
+                            type(registry_value)))
+                return
+
+            for id in stream.iterate_object():
+                instance_value = stream.read_value()
+
+                target = some.graph.parse.placeholder_some_class(id=id)
+
+                _some_class_from(
+                    instance_value,
+                    other_classes_registry,
+                    (ref, 'some_classes', (id, )),
+                    target,
+                    errors)
+
+                if errors.count() > error_count:
+                    return
+
+                yield target
+
+            return
+
+    except ValueError as err:
+        errors.add(
+            ref,
+            "Expected a valid JSON text, but got: {}".format(err))
+
+
+def iter_other_classes(
+        fp: typing.TextIO,
+        ref: str,
+        errors: some.graph.parse.Errors,
+        chunk_size: int = 65536
+) -> typing.Iterator[some.graph.OtherClass]:
+    """
+    parses the instances of OtherClass one at a time from a JSON file.
+
+    The JSON file is expected to contain SomeGraph. The file is
+    read incrementally and only the instances of the registry
+    'other_classes' are decoded, one at a time, so that
+    the memory is bounded by the size of a single instance. The rest of the file
+    after the registry is not read.
+
+    The iteration stops at the first error.
+
+    :param fp: text stream of the JSON file
+    :param ref: reference to the file (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :param chunk_size: number of characters read from ``fp`` at once
+    :return: parsed instances of OtherClass in the order of the file
+    """
+    if errors.full():
+        return
+
+    error_count = errors.count()
+    stream = some.graph.parse.JSONStream(fp=fp, chunk_size=chunk_size)
+
+    try:
+        if stream.next_char() != '{':
+            errors.add(
+                ref,
+                "Expected a dictionary, but got: {}".format(
+                    type(stream.read_value())))
+            return
+
+        for key in stream.iterate_object():
+            if key != 'other_classes':
+                stream.skip_value()
+                continue
+
+            if stream.next_char() != '{':
+                registry_value = stream.read_value()
+                if registry_value is not None:
+                    errors.add(
+                        (ref, 'other_classes'),
+                        "Expected a dictionary, but got: {}".format(
+                            type(registry_value)))
+                return
+
+            for id in stream.iterate_object():
+                instance_value = stream.read_value()
+
+                target = some.graph.parse.placeholder_other_class(id=id)
+
+                _other_class_from(
+                    instance_value,
+                    (ref, 'other_classes', (id, )),
+                    target,
+                    errors)
+
+                if errors.count() > error_count:
+                    return
+
+                yield target
+
+            return
+
+    except ValueError as err:
+        errors.add(
+            ref,
+            "Expected a valid JSON text, but got: {}".format(err))
+
+
+def _mentions_any(value: typing.Any, ids: typing.AbstractSet[str]) -> bool:
+    """
+    checks whether any of the strings in the JSONable value is in ``ids``.
+
+    The keys of the dictionaries are not considered since they can not refer
+    to instances.
+
+    :param value: JSONable value
+    :param ids: identifiers of the instances
+    :return: True if any identifier is mentioned
+    """
+    if isinstance(value, str):
+        return value in ids
+
+    if isinstance(value, dict):
+        return any(_mentions_any(item, ids) for item in value.values())
+
+    if isinstance(value, list):
+        return any(_mentions_any(item, ids) for item in value)
+
+    return False
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_some_classes = set()  # type: typing.Set[str]
+    changed_other_classes = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate some_classes reusing the unchanged instances
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+            some_classes_registry = graph.some_classes
+            previous_some_classes = previous.some_classes
+
+            previous_registry_value = previous_value.get(
+                'some_classes', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_some_class = previous_some_classes.get(id, None)
+                if (target_some_class is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_some_class = some.graph.parse.placeholder_some_class(id=id)
+                    changed_some_classes.add(id)
+
+                some_classes_registry[id] = target_some_class
+
+    changed_some_classes.update(
+        id for id in previous.some_classes
+        if id not in graph.some_classes)
+
+    if errors.full():
+        return None
+
+    ##
+    # Pre-allocate other_classes reusing the unchanged instances
+    ##
+
+    registry_value = value.get('other_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'other_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.other_classes = collections.OrderedDict()
+            else:
+                graph.other_classes = dict()
+
+            other_classes_registry = graph.other_classes
+            previous_other_classes = previous.other_classes
+
+            previous_registry_value = previous_value.get(
+                'other_classes', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_other_class = previous_other_classes.get(id, None)
+                if (target_other_class is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_other_class = some.graph.parse.placeholder_other_class(id=id)
+                    changed_other_classes.add(id)
+
+                other_classes_registry[id] = target_other_class
+
+    changed_other_classes.update(
+        id for id in previous.other_classes
+        if id not in graph.other_classes)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse anew the instances referring to the new, changed or removed
+    # instances until no more instances need to be parsed anew.
+    ##
+
+    has_changed = True
+    while has_changed:
+        has_changed = False
+
+        referred = changed_other_classes
+
+        registry_value = value.get('some_classes', None)
+        if referred and registry_value is not None:
+            for id, instance_value in registry_value.items():
+                if (id not in changed_some_classes and
+                        _mentions_any(instance_value, referred)):
+                    graph.some_classes[id] = some.graph.parse.placeholder_some_class(id=id)
+                    changed_some_classes.add(id)
+                    has_changed = True
+
+    ##
+    # Parse the new and changed some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+    if registry_value is not None and changed_some_classes:
+        for id, instance_value in registry_value.items():
+            if id not in changed_some_classes:
+                continue
+
+            _some_class_from(
+                instance_value,
+                graph.other_classes,
+                (ref, 'some_classes', (id, )),
+                graph.some_classes[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse the new and changed other_classes
+    ##
+
+    registry_value = value.get('other_classes', None)
+    if registry_value is not None and changed_other_classes:
+        for id, instance_value in registry_value.items():
+            if id not in changed_other_classes:
+                continue
+
+            _other_class_from(
+                instance_value,
+                (ref, 'other_classes', (id, )),
+                graph.other_classes[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_reference
+    ##
+
+    value_0 = value.get(
+        'some_reference',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_reference')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = graph.some_classes.get(
+                value_0,
+                None)
+            if target_1 is None:
+                errors.add(
+                    (ref, 'some_reference'),
+                    'Reference to an instance of class Some_class not found: {}'.format(
+                        value_0))
+            else:
+                graph.some_reference = target_1
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_optional_number
+    ##
+
+    value_2 = value.get(
+        'some_optional_number',
+        None)
+
+    if value_2 is not None:
+        if not isinstance(value_2, int):
+            errors.add(
+                (ref, 'some_optional_number'),
+                "Expected an integer, but got: {}".format(
+                    type(value_2)))
+        else:
+            graph.some_optional_number = value_2
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
@@ -0,0 +1,401 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""provides general structures and functions for parsing."""
+
+
+import json
+
+import re
+
+import typing
+
+import some.graph
+
+
+# Ref represents a reference path to a value lazily.
+#
+# The reference is either a string or a tuple of the parent reference
+# followed by the path segments. String segments are rendered verbatim,
+# integer segments are indices and a segment wrapped in a one-tuple is
+# a key rendered with repr. Building a tuple is much cheaper than joining
+# the strings so that the reference is only rendered with ``render_ref``
+# when an error is actually added.
+Ref = typing.Union[str, typing.Tuple[typing.Any, ...]]
+
+
+def render_ref(ref: Ref) -> str:
+    """
+    renders the lazy reference as a string.
+
+    :param ref: reference to the value
+    :return: rendered reference path
+    """
+    if isinstance(ref, str):
+        return ref
+
+    parts = [render_ref(ref[0])]
+    for segment in ref[1:]:
+        if isinstance(segment, tuple):
+            parts.append(repr(segment[0]))
+        else:
+            parts.append(str(segment))
+
+    return '/'.join(parts)
+
+
+class Error:
+    """represents an error occurred while parsing."""
+
+    def __init__(self, ref: str, message: str) -> None:
+        """
+        initializes the error with the given values.
+
+        :param ref: references the cause (e.g., a reference path)
+        :param message: describes the error
+        """
+        self.ref = ref
+        self.message = message
+
+
+class Errors:
+    """
+    collects errors capped at a certain quantity.
+
+    If the capacity is full, the subsequent surplus errors are ignored.
+    """
+
+    def __init__(self, cap: int) -> None:
+        """
+        initializes the error container with the given cap.
+
+        :param cap: maximum number of contained errors
+        """
+        self.cap = cap
+        self._values = []  # type: typing.List[Error]
+
+    def add(self, ref: Ref, message: str) -> None:
+        """
+        adds an error to the container.
+
+        The reference is rendered to a string only if the error is
+        actually stored.
+
+        :param ref: references the cause (e.g., a reference path)
+        :param message: describes the error
+        """
+        if len(self._values) < self.cap:
+            self._values.append(
+                Error(ref=render_ref(ref), message=message))
+
+    def full(self) -> bool:
+        """gives True when there are exactly ``cap`` errors contained."""
+        return len(self._values) == self.cap
+
+    def empty(self) -> bool:
+        """gives True when there are no errors contained."""
+        return len(self._values) == 0
+
+    def count(self) -> int:
+        """returns the number of errors."""
+        return len(self._values)
+
+    def values(self) -> typing.Iterable[Error]:
+        """gives an iterator over the errors."""
+        return iter(self._values)
+
+
+T = typing.TypeVar('T')
+
+
+_NON_WHITESPACE_RE = re.compile(r'[^ \t\n\r]')
+_STRUCTURE_RE = re.compile(r'["{}\[\]]')
+
+
+class JSONStream:
+    """
+    reads a JSON text incrementally from a text stream.
+
+    Only the objects which are iterated over are followed character by
+    character. All the other values are decoded (or skipped) one at a time
+    so that the memory is bounded by the largest value read.
+    """
+
+    def __init__(self, fp: typing.TextIO, chunk_size: int = 65536) -> None:
+        """
+        initializes the reader.
+
+        :param fp: text stream of the JSON text
+        :param chunk_size: number of characters read from ``fp`` at once
+        """
+        self.fp = fp
+        self.chunk_size = chunk_size
+
+        self._buffer = ''
+        self._pos = 0
+
+        # Number of the characters discarded before the buffer
+        self._offset = 0
+
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """
+        reads the next chunk into the buffer discarding the consumed text.
+
+        The chunk is at least as large as the pending text so that a long
+        value is decoded in amortized linear time.
+
+        :return: False if the end of the stream has been reached
+        """
+        pending = self._buffer[self._pos:]
+        chunk = self.fp.read(max(self.chunk_size, len(pending)))
+        if not chunk:
+            return False
+
+        self._offset += self._pos
+        self._buffer = pending + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, expected: str) -> ValueError:
+        """creates the error about the unexpected next character."""
+        char = self.next_char()
+        return ValueError("Expected {} at character {}, but got: {}".format(
+            expected, self._offset + self._pos,
+            repr(char) if char else "the end of the text"))
+
+    def next_char(self) -> str:
+        """
+        skips the whitespace and gives the next character.
+
+        :return: next character, or an empty string at the end of the text
+        """
+        while True:
+            match = _NON_WHITESPACE_RE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        """
+        consumes the expected next character.
+
+        :param char: expected character
+        :return:
+        :raise ValueError: if the next character is not the expected one
+        """
+        if self.next_char() != char:
+            raise self._error(expected=repr(char))
+
+        self._pos += 1
+
+    def read_value(self) -> typing.Any:
+        """
+        decodes the next value.
+
+        :return: decoded value
+        :raise ValueError: if the value is not a valid JSON
+        """
+        if self.next_char() == '':
+            raise self._error(expected="a value")
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as err:
+                # The value might continue in the next chunk.
+                if self._fill():
+                    continue
+
+                raise ValueError("{} at character {}".format(
+                    err.msg, self._offset + err.pos))
+
+            if end == len(self._buffer) and self._fill():
+                # A number might continue in the next chunk.
+                continue
+
+            self._pos = end
+            return value
+
+    def _skip_string(self) -> None:
+        """skips the string starting at the current position."""
+        while True:
+            try:
+                _, end = json.decoder.scanstring(  # type: ignore
+                    self._buffer, self._pos + 1)
+            except json.JSONDecodeError as err:
+                if self._fill():
+                    continue
+
+                raise ValueError("{} at character {}".format(
+                    err.msg, self._offset + err.pos))
+
+            self._pos = end
+            return
+
+    def skip_value(self) -> None:
+        """
+        skips the next value without decoding the nested values.
+
+        Only the nesting of the skipped value is checked.
+
+        :return:
+        :raise ValueError: if the value is not terminated
+        """
+        if self.next_char() not in ('{', '['):
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            match = _STRUCTURE_RE.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise self._error(expected="the end of the value")
+
+                continue
+
+            if match.group() == '"':
+                self._pos = match.start()
+                self._skip_string()
+                continue
+
+            self._pos = match.end()
+            if match.group() in ('{', '['):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def iterate_object(self) -> typing.Iterator[str]:
+        """
+        iterates over the keys of the next object.
+
+        The caller needs to consume the value of each key before
+        continuing the iteration.
+
+        :return: keys of the object
+        :raise ValueError: if the object is not a valid JSON
+        """
+        self.expect('{')
+        if self.next_char() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            if self.next_char() != '"':
+                raise self._error(expected="a key")
+
+            key = self.read_value()
+            self.expect(':')
+
+            yield key
+
+            char = self.next_char()
+            if char == ',':
+                self._pos += 1
+            elif char == '}':
+                self._pos += 1
+                return
+            else:
+                raise self._error(expected="',' or '}'")
+
+
+class UnresolvedRegistry(typing.Mapping[str, T]):
+    """
+    gives a new placeholder for any identifier.
+
+    The references parsed against this registry are not resolved: they are
+    given as placeholders with only the identifier set, and their existence
+    is not checked.
+    """
+
+    def __init__(self, placeholder: typing.Callable[[str], T]) -> None:
+        """
+        initializes the registry.
+
+        :param placeholder: creates a placeholder instance given an identifier
+        """
+        self.placeholder = placeholder
+
+    def __getitem__(self, id: str) -> T:
+        """gives a new placeholder with the identifier."""
+        return self.placeholder(id)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """gives an empty iterator since no instance is known."""
+        return iter(())
+
+    def __len__(self) -> int:
+        """gives zero since no instance is known."""
+        return 0
+
+
+def placeholder_some_embed() -> some.graph.SomeEmbed:
+    """
+    creates a placeholder instance of SomeEmbed.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :return: empty shell
+    """
+    return some.graph.SomeEmbed(  # type: ignore
+        some_number=None)
+
+
+def placeholder_some_class(
+        id: str) -> some.graph.SomeClass:
+    """
+    creates a placeholder instance of SomeClass.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :param id: identifier of the instance
+    :return: empty shell
+    """
+    return some.graph.SomeClass(  # type: ignore
+        id=id,
+        some_text=None,
+        some_array=None,
+        some_embed=None)
+
+
+def placeholder_other_class(
+        id: str) -> some.graph.OtherClass:
+    """
+    creates a placeholder instance of OtherClass.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :param id: identifier of the instance
+    :return: empty shell
+    """
+    return some.graph.OtherClass(
+        id=id)
+
+
+def placeholder_some_graph() -> some.graph.SomeGraph:
+    """
+    creates a placeholder instance of SomeGraph.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :return: empty shell
+    """
+    return some.graph.SomeGraph(  # type: ignore
+        some_reference=None)
@@ -0,0 +1,164 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""defines some object graph."""
+
+
+import collections
+import datetime
+import pathlib
+import typing
+
+import pytz
+
+
+T = typing.TypeVar('T')
+
+
+class _LazilyDecoded(typing.Generic[T]):
+    """
+    decodes the string stored in an attribute on the first access.
+
+    The parsers store the validated string so that the value is decoded only
+    if it is actually accessed. The decoded value replaces the string.
+    Assigning a decoded value stores it as-is.
+    """
+
+    def __init__(self, name: str, decode: typing.Callable[[str], T]) -> None:
+        """
+        initializes the descriptor.
+
+        :param name: name of the attribute storing the string or the value
+        :param decode: decodes the value from the string
+        """
+        self.name = name
+        self.decode = decode
+
+    @typing.overload
+    def __get__(
+            self, instance: None, owner: typing.Any) -> '_LazilyDecoded[T]':
+        ...
+
+    @typing.overload
+    def __get__(self, instance: object, owner: typing.Any) -> T:
+        ...
+
+    def __get__(
+            self, instance: typing.Optional[object],
+            owner: typing.Any) -> typing.Any:
+        """gives the value decoding the stored string if necessary."""
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.name)
+        if isinstance(value, str):
+            value = self.decode(value)
+            object.__setattr__(instance, self.name, value)
+
+        return value
+
+    def __set__(self, instance: object, value: typing.Union[str, T]) -> None:
+        """stores the string to be decoded or the decoded value."""
+        setattr(instance, self.name, value)
+
+
+class SomeClass:
+    """defines some class."""
+
+    __slots__ = (
+        'id',
+        '_some_path',
+        'some_embed',
+        '_some_optional_time_zone',
+    )
+
+    some_path = _LazilyDecoded(
+        '_some_path', pathlib.Path
+    )  # type: _LazilyDecoded[pathlib.Path]
+
+    some_optional_time_zone = _LazilyDecoded(
+        '_some_optional_time_zone', pytz.timezone
+    )  # type: _LazilyDecoded[typing.Optional[datetime.tzinfo]]
+
+    def __init__(
+            self,
+            id: str,
+            some_path: pathlib.Path,
+            some_embed: 'SomeEmbed',
+            some_optional_time_zone: typing.Optional[datetime.tzinfo] = None) -> None:
+        """
+        initializes an instance of SomeClass with the given values.
+
+        :param id: identifier of the instance:param some_path: defines some absolute path.
+        :param some_embed: defines some embed.
+        :param some_optional_time_zone: defines some optional time zone.
+
+        """
+        self.id = id
+        self.some_path = some_path
+        self.some_embed = some_embed
+        self.some_optional_time_zone = some_optional_time_zone if some_optional_time_zone is not None else None
+
+
+class SomeEmbed:
+    """defines some embeddable structure."""
+
+    __slots__ = (
+        '_some_time_zone',
+        'array_of_paths',
+    )
+
+    some_time_zone = _LazilyDecoded(
+        '_some_time_zone', pytz.timezone
+    )  # type: _LazilyDecoded[datetime.tzinfo]
+
+    def __init__(
+            self,
+            some_time_zone: datetime.tzinfo,
+            array_of_paths: typing.List[pathlib.Path]) -> None:
+        """
+        initializes an instance of SomeEmbed with the given values.
+
+        :param some_time_zone: defines some time zone.
+        :param array_of_paths: defines some array of paths which are decoded eagerly.
+
+        """
+        self.some_time_zone = some_time_zone
+        self.array_of_paths = array_of_paths
+
+
+class SomeGraph:
+    """defines some object graph."""
+
+    __slots__ = (
+        'some_property',
+        'global_path',
+        'some_classes',
+    )
+
+    def __init__(
+            self,
+            some_property: SomeEmbed,
+            global_path: pathlib.Path,
+            some_classes: typing.Optional[typing.MutableMapping[str, SomeClass]] = None) -> None:
+        """
+        initializes an instance of SomeGraph with the given values.
+
+        The class registries are initialized with empty ordered dictionaries.
+        :param some_property: defines some property.
+        :param global_path: defines some global path.
+        :param some_classes:
+            registry of instances of SomeClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+
+        """
+        self.some_property = some_property
+        self.global_path = global_path
+
+        if some_classes is not None:
+            self.some_classes = some_classes
+        else:
+            self.some_classes = collections.OrderedDict()
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
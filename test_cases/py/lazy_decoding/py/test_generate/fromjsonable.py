@@ -0,0 +1,844 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses JSONable objects."""
+
+
+import collections
+import pathlib
+import re
+import typing
+
+import pytz
+import pytz.exceptions  # type: ignore
+
+import some.graph
+import some.graph.parse
+
+
+_PYTZ_TIMEZONES_LOWER = frozenset(
+    zone.lower() for zone in pytz.all_timezones)
+
+
+def _is_pytz_timezone(text: str) -> bool:
+    """
+    checks whether ``pytz.timezone`` accepts the text.
+
+    The time zone is not loaded so that the check is cheap. The names
+    are matched in the same way as ``pytz.timezone`` matches them.
+
+    :param text: name of the time zone
+    :return: True if the time zone is known
+    """
+    if text.upper() == 'UTC':
+        return True
+
+    try:
+        text.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+
+    unmunged = text.replace('_plus_', '+').replace('_minus_', '-')
+    return unmunged.lower() in _PYTZ_TIMEZONES_LOWER
+
+
+def _some_class_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        target: some.graph.SomeClass,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses SomeClass from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as SomeClass
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+    ##
+    # Parse some_path
+    ##
+
+    value_0 = value.get(
+        'some_path',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_path')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_path'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        elif not re.match(
+                r'^/.*$',
+                value_0):
+            errors.add(
+                (ref, 'some_path'),
+                'Expected to match ^/.*$, but got: {}'.format(
+                    value_0))
+        else:
+            # The value is decoded on the first access.
+            target.some_path = value_0
+    if errors.full():
+        return
+
+    ##
+    # Parse some_optional_time_zone
+    ##
+
+    value_2 = value.get(
+        'some_optional_time_zone',
+        None)
+
+    if value_2 is not None:
+        if not isinstance(value_2, str):
+            errors.add(
+                (ref, 'some_optional_time_zone'),
+                "Expected a string, but got: {}".format(
+                    type(value_2)))
+        elif not _is_pytz_timezone(value_2):
+            errors.add(
+                (ref, 'some_optional_time_zone'),
+                "Expected a valid IANA time zone, but got: {}".format(
+                    value_2))
+        else:
+            # The value is decoded on the first access.
+            target.some_optional_time_zone = value_2
+    if errors.full():
+        return
+
+    ##
+    # Parse some_embed
+    ##
+
+    value_4 = value.get(
+        'some_embed',
+        None)
+
+    if value_4 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_embed')
+    else:
+        target_5 = (
+            some.graph.parse.placeholder_some_embed()
+        )
+        _some_embed_from(
+            value_4,
+            (ref, 'some_embed'),
+            target_5,
+            errors)
+        target.some_embed = target_5
+    if errors.full():
+        return
+
+
+def some_class_from(
+        value: typing.Any,
+        id: str,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeClass]:
+    """
+    parses SomeClass from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = some.graph.parse.placeholder_some_class(id=id)
+
+    _some_class_from(
+        value=value,
+        ref=ref,
+        target=target,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _some_embed_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        target: some.graph.SomeEmbed,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses SomeEmbed from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as SomeEmbed
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+    ##
+    # Parse some_time_zone
+    ##
+
+    value_0 = value.get(
+        'some_time_zone',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_time_zone')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_time_zone'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        elif not _is_pytz_timezone(value_0):
+            errors.add(
+                (ref, 'some_time_zone'),
+                "Expected a valid IANA time zone, but got: {}".format(
+                    value_0))
+        else:
+            # The value is decoded on the first access.
+            target.some_time_zone = value_0
+    if errors.full():
+        return
+
+    ##
+    # Parse array_of_paths
+    ##
+
+    value_2 = value.get(
+        'array_of_paths',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: array_of_paths')
+    else:
+        if not isinstance(value_2, list):
+            errors.add(
+                (ref, 'array_of_paths'),
+                "Expected a list, but got: {}".format(
+                    type(value_2)))
+        else:
+            target_3 = (
+                []
+            )  # type: typing.List[pathlib.Path]
+            for i_3, item_3 in enumerate(
+                    value_2):
+                target_item_3 = (
+                    None
+                )  # type: typing.Optional[pathlib.Path]
+                if not isinstance(item_3, str):
+                    errors.add(
+                        (ref, 'array_of_paths', i_3),
+                        "Expected a string, but got: {}".format(
+                            type(item_3)))
+                else:
+                    target_item_3 = pathlib.Path(
+                        item_3)
+
+                if target_item_3 is not None:
+                    target_3.append(
+                        target_item_3)
+
+                if errors.full():
+                    break
+
+            target.array_of_paths = target_3
+    if errors.full():
+        return
+
+
+def some_embed_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeEmbed]:
+    """
+    parses SomeEmbed from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = some.graph.parse.placeholder_some_embed()
+
+    _some_embed_from(
+        value=value,
+        ref=ref,
+        target=target,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def some_graph_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+            some_classes_registry = graph.some_classes
+            for id in registry_value:
+                some_classes_registry[id] = some.graph.parse.placeholder_some_class(id=id)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            target_some_class = graph.some_classes[id]
+            target_some_class.id = id
+
+            _some_class_from(
+                instance_value,
+                (ref, 'some_classes', (id, )),
+                target_some_class,
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_property
+    ##
+
+    value_0 = value.get(
+        'some_property',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_property')
+    else:
+        target_1 = (
+            some.graph.parse.placeholder_some_embed()
+        )
+        _some_embed_from(
+            value_0,
+            (ref, 'some_property'),
+            target_1,
+            errors)
+        graph.some_property = target_1
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse global_path
+    ##
+
+    value_2 = value.get(
+        'global_path',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: global_path')
+    else:
+        if not isinstance(value_2, str):
+            errors.add(
+                (ref, 'global_path'),
+                "Expected a string, but got: {}".format(
+                    type(value_2)))
+        else:
+            graph.global_path = pathlib.Path(
+                value_2)
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _some_class_from_fast(
+        value: typing.Any,
+        target: some.graph.SomeClass
+) -> None:
+    """
+    parses SomeClass optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :param target: parsed ``value`` as SomeClass
+    :return:
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse some_path
+    ##
+
+    value_1 = value['some_path']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    if not re.match(
+            r'^/.*$',
+            value_1):
+        raise ValueError('Expected to match ^/.*$')
+    target.some_path = value_1
+
+    ##
+    # Parse some_optional_time_zone
+    ##
+
+    value_2 = value.get(
+        'some_optional_time_zone',
+        None)
+    if value_2 is not None:
+        if not isinstance(value_2, str):
+            raise TypeError("Expected a string")
+        if not _is_pytz_timezone(value_2):
+            raise ValueError("Expected a valid IANA time zone")
+        target.some_optional_time_zone = value_2
+
+    ##
+    # Parse some_embed
+    ##
+
+    target_5 = (
+        some.graph.parse.placeholder_some_embed()
+    )
+    _some_embed_from_fast(
+        value['some_embed'],
+        target_5)
+    target.some_embed = target_5
+
+
+def _some_embed_from_fast(
+        value: typing.Any,
+        target: some.graph.SomeEmbed
+) -> None:
+    """
+    parses SomeEmbed optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :param target: parsed ``value`` as SomeEmbed
+    :return:
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse some_time_zone
+    ##
+
+    value_1 = value['some_time_zone']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    if not _is_pytz_timezone(value_1):
+        raise ValueError("Expected a valid IANA time zone")
+    target.some_time_zone = value_1
+
+    ##
+    # Parse array_of_paths
+    ##
+
+    value_3 = value['array_of_paths']
+    if not isinstance(value_3, list):
+        raise TypeError("Expected a list")
+    target_3 = (
+        []
+    )  # type: typing.List[pathlib.Path]
+    for item_3 in value_3:
+        if not isinstance(item_3, str):
+            raise TypeError("Expected a string")
+        target_item_3 = pathlib.Path(
+            item_3)
+        target_3.append(
+            target_item_3)
+    target.array_of_paths = target_3
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.some_classes = collections.OrderedDict()
+        else:
+            graph.some_classes = dict()
+
+        some_classes_registry = graph.some_classes
+        for id in registry_value:
+            some_classes_registry[id] = some.graph.parse.placeholder_some_class(id=id)
+
+    ##
+    # Parse some_classes
+    ##
+
+    if 'some_classes' in value:
+        registry_value = value['some_classes']
+        for id, instance_value in registry_value.items():
+            _some_class_from_fast(
+                instance_value,
+                graph.some_classes[id])
+
+    ##
+    # Parse some_property
+    ##
+
+    target_1 = (
+        some.graph.parse.placeholder_some_embed()
+    )
+    _some_embed_from_fast(
+        value['some_property'],
+        target_1)
+    graph.some_property = target_1
+
+    ##
+    # Parse global_path
+    ##
+
+    value_3 = value['global_path']
+    if not isinstance(value_3, str):
+        raise TypeError("Expected a string")
+    graph.global_path = pathlib.Path(
+        value_3)
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_some_classes = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate some_classes reusing the unchanged instances
+    ##
+
+    registry_value = value.get('some_classes', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'some_classes'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.some_classes = collections.OrderedDict()
+            else:
+                graph.some_classes = dict()
+
+            some_classes_registry = graph.some_classes
+            previous_some_classes = previous.some_classes
+
+            previous_registry_value = previous_value.get(
+                'some_classes', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_some_class = previous_some_classes.get(id, None)
+                if (target_some_class is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_some_class = some.graph.parse.placeholder_some_class(id=id)
+                    changed_some_classes.add(id)
+
+                some_classes_registry[id] = target_some_class
+
+    changed_some_classes.update(
+        id for id in previous.some_classes
+        if id not in graph.some_classes)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse the new and changed some_classes
+    ##
+
+    registry_value = value.get('some_classes', None)
+    if registry_value is not None and changed_some_classes:
+        for id, instance_value in registry_value.items():
+            if id not in changed_some_classes:
+                continue
+
+            _some_class_from(
+                instance_value,
+                (ref, 'some_classes', (id, )),
+                graph.some_classes[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_property
+    ##
+
+    value_0 = value.get(
+        'some_property',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_property')
+    else:
+        target_1 = (
+            some.graph.parse.placeholder_some_embed()
+        )
+        _some_embed_from(
+            value_0,
+            (ref, 'some_property'),
+            target_1,
+            errors)
+        graph.some_property = target_1
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse global_path
+    ##
+
+    value_2 = value.get(
+        'global_path',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: global_path')
+    else:
+        if not isinstance(value_2, str):
+            errors.add(
+                (ref, 'global_path'),
+                "Expected a string, but got: {}".format(
+                    type(value_2)))
+        else:
+            graph.global_path = pathlib.Path(
+                value_2)
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
@@ -0,0 +1,103 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""defines some object graph."""
+
+
+import collections
+import typing
+
+
+class SomeClass:
+    """defines some class."""
+
+    def __init__(
+            self,
+            id: str,
+            some_text: str,
+            some_array: typing.List[int],
+            some_embed: 'SomeEmbed',
+            some_optional_reference: typing.Optional['OtherClass'] = None) -> None:
+        """
+        initializes an instance of SomeClass with the given values.
+
+        :param id: identifier of the instance:param some_text: defines some text.
+        :param some_array: defines some array.
+        :param some_embed: defines some embed.
+        :param some_optional_reference: defines some optional reference to an instance.
+
+        """
+        self.id = id
+        self.some_text = some_text
+        self.some_array = some_array
+        self.some_embed = some_embed
+        self.some_optional_reference = some_optional_reference if some_optional_reference is not None else None
+
+
+class OtherClass:
+    """defines other class."""
+
+    def __init__(
+            self,
+            id: str) -> None:
+        """
+        initializes an instance of OtherClass with the given values.
+
+        :param id: identifier of the instance
+        """
+        self.id = id
+
+
+class SomeEmbed:
+    """defines some embeddable structure."""
+
+    def __init__(
+            self,
+            some_number: int) -> None:
+        """
+        initializes an instance of SomeEmbed with the given values.
+
+        :param some_number: defines some number.
+
+        """
+        self.some_number = some_number
+
+
+class SomeGraph:
+    """defines some object graph."""
+
+    def __init__(
+            self,
+            some_reference: SomeClass,
+            some_optional_number: typing.Optional[int] = None,
+            some_classes: typing.Optional[typing.MutableMapping[str, SomeClass]] = None,
+            other_classes: typing.Optional[typing.MutableMapping[str, OtherClass]] = None) -> None:
+        """
+        initializes an instance of SomeGraph with the given values.
+
+        The class registries are initialized with empty ordered dictionaries.
+        :param some_reference: defines some reference to an instance.
+        :param some_optional_number: defines some optional number.
+        :param some_classes:
+            registry of instances of SomeClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+        :param other_classes:
+            registry of instances of OtherClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+
+        """
+        self.some_reference = some_reference
+        self.some_optional_number = some_optional_number if some_optional_number is not None else None
+
+        if some_classes is not None:
+            self.some_classes = some_classes
+        else:
+            self.some_classes = collections.OrderedDict()
+
+        if other_classes is not None:
+            self.other_classes = other_classes
+        else:
+            self.other_classes = collections.OrderedDict()
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,389 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""provides general structures and functions for parsing."""
+
+
+import collections
+
+import typing
+
+import some.graph
+
+
+# Ref represents a reference path to a value lazily.
+#
+# The reference is either a string or a tuple of the parent reference
+# followed by the path segments. String segments are rendered verbatim,
+# integer segments are indices and a segment wrapped in a one-tuple is
+# a key rendered with repr. Building a tuple is much cheaper than joining
+# the strings so that the reference is only rendered with ``render_ref``
+# when an error is actually added.
+Ref = typing.Union[str, typing.Tuple[typing.Any, ...]]
+
+
+def render_ref(ref: Ref) -> str:
+    """
+    renders the lazy reference as a string.
+
+    :param ref: reference to the value
+    :return: rendered reference path
+    """
+    if isinstance(ref, str):
+        return ref
+
+    parts = [render_ref(ref[0])]
+    for segment in ref[1:]:
+        if isinstance(segment, tuple):
+            parts.append(repr(segment[0]))
+        else:
+            parts.append(str(segment))
+
+    return '/'.join(parts)
+
+
+class Error:
+    """represents an error occurred while parsing."""
+
+    def __init__(self, ref: str, message: str) -> None:
+        """
+        initializes the error with the given values.
+
+        :param ref: references the cause (e.g., a reference path)
+        :param message: describes the error
+        """
+        self.ref = ref
+        self.message = message
+
+
+class Errors:
+    """
+    collects errors capped at a certain quantity.
+
+    If the capacity is full, the subsequent surplus errors are ignored.
+    """
+
+    def __init__(self, cap: int) -> None:
+        """
+        initializes the error container with the given cap.
+
+        :param cap: maximum number of contained errors
+        """
+        self.cap = cap
+        self._values = []  # type: typing.List[Error]
+
+    def add(self, ref: Ref, message: str) -> None:
+        """
+        adds an error to the container.
+
+        The reference is rendered to a string only if the error is
+        actually stored.
+
+        :param ref: references the cause (e.g., a reference path)
+        :param message: describes the error
+        """
+        if len(self._values) < self.cap:
+            self._values.append(
+                Error(ref=render_ref(ref), message=message))
+
+    def full(self) -> bool:
+        """gives True when there are exactly ``cap`` errors contained."""
+        return len(self._values) == self.cap
+
+    def empty(self) -> bool:
+        """gives True when there are no errors contained."""
+        return len(self._values) == 0
+
+    def count(self) -> int:
+        """returns the number of errors."""
+        return len(self._values)
+
+    def values(self) -> typing.Iterable[Error]:
+        """gives an iterator over the errors."""
+        return iter(self._values)
+
+
+T = typing.TypeVar('T')
+
+
+class LazyContext:
+    """
+    keeps track of the instances of lazy registries waiting to be parsed.
+
+    All the lazy registries of an object graph share the same context.
+    A reference to an instance which has not been parsed yet is resolved to
+    its placeholder and the placeholder is scheduled for parsing. This way
+    the references are resolved without recursion and each instance is
+    parsed at most once.
+    """
+
+    def __init__(self, cap: int) -> None:
+        """
+        initializes the context.
+
+        :param cap: maximum number of errors reported when parsing on access
+        """
+        self.cap = cap
+        self.parsing = False
+        self.registries = []  # type: typing.List[typing.Any]
+
+        # Placeholders waiting to be parsed as (registry, ID, placeholder)
+        self._scheduled = collections.deque(
+        )  # type: typing.Deque[typing.Tuple[typing.Any, str, typing.Any]]
+
+    def schedule(
+            self, registry: typing.Any, id: str,
+            instance: typing.Any) -> None:
+        """
+        schedules the placeholder instance for parsing.
+
+        :param registry: registry of the instance
+        :param id: identifier of the instance
+        :param instance: placeholder to be filled out
+        :return:
+        """
+        self._scheduled.append((registry, id, instance))
+
+    def parse_scheduled(self, errors: Errors) -> None:
+        """
+        parses the scheduled instances including the ones they reference.
+
+        If any error occurs, all the instances parsed in this call are
+        discarded from their registries so that they are parsed anew on
+        the next access.
+
+        :param errors: errors encountered during parsing
+        :return:
+        """
+        count = errors.count()
+
+        parsed = []  # type: typing.List[typing.Tuple[typing.Any, str]]
+        self.parsing = True
+        try:
+            while self._scheduled and not errors.full():
+                registry, id, instance = self._scheduled.popleft()
+                parsed.append((registry, id))
+                registry.parse_instance(
+                    id=id, instance=instance, errors=errors)
+        finally:
+            self.parsing = False
+
+        if errors.count() > count or self._scheduled:
+            parsed.extend(
+                (registry, id) for registry, id, _ in self._scheduled)
+            self._scheduled.clear()
+
+            for registry, id in parsed:
+                registry.discard(id=id)
+
+    def parse_on_access(self) -> None:
+        """
+        parses the scheduled instances on access to a lazy registry.
+
+        :return:
+        :raise ValueError: if the instances could not be parsed
+        """
+        errors = Errors(cap=self.cap)
+        self.parse_scheduled(errors=errors)
+
+        if not errors.empty():
+            raise ValueError("Failed to parse the instance(s):\n{}".format(
+                '\n'.join(
+                    '{}: {}'.format(error.ref, error.message)
+                    for error in errors.values())))
+
+    def materialize_all(self, errors: Errors) -> None:
+        """
+        parses all the instances of all the lazy registries.
+
+        The instances are parsed in the same order as in the eager parsing
+        so that the value is fully validated.
+
+        :param errors: errors encountered during parsing
+        :return:
+        """
+        for registry in self.registries:
+            registry.schedule_all()
+
+        self.parse_scheduled(errors=errors)
+
+
+class LazyRegistry(typing.MutableMapping[str, T]):
+    """
+    maps identifiers to the instances parsed only on the first access.
+
+    The registry keeps the JSONable value of each instance. The first access
+    to an instance parses it together with the instances it references.
+    If the parsing fails, ValueError is raised listing the errors.
+    """
+
+    def __init__(
+            self, values: typing.Mapping[str, typing.Any], ref: Ref,
+            placeholder: typing.Callable[[str], T],
+            parse: typing.Callable[[typing.Any, Ref, T, Errors], None],
+            context: LazyContext) -> None:
+        """
+        initializes the registry and registers it with the context.
+
+        :param values: JSONable values of the instances
+        :param ref: reference to the registry
+        :param placeholder: creates an empty instance given its identifier
+        :param parse: parses a JSONable value into an instance
+        :param context: context shared by all the registries of the graph
+        """
+        if isinstance(values, collections.OrderedDict):
+            self._values = collections.OrderedDict(
+                values)  # type: typing.MutableMapping[str, typing.Any]
+        else:
+            self._values = dict(values)
+
+        self._instances = dict()  # type: typing.Dict[str, T]
+        self.ref = ref
+        self.placeholder = placeholder
+        self.parse = parse
+        self.context = context
+
+        context.registries.append(self)
+
+    def __getitem__(self, id: str) -> T:
+        """
+        gives the instance, parsing it first if necessary.
+
+        :param id: identifier of the instance
+        :return: instance
+        :raise KeyError: if there is no such instance in the registry
+        :raise ValueError: if the instance could not be parsed
+        """
+        if id in self._instances:
+            return self._instances[id]
+
+        if id not in self._values:
+            raise KeyError(id)
+
+        instance = self.placeholder(id)
+        self._instances[id] = instance
+        self.context.schedule(registry=self, id=id, instance=instance)
+
+        if not self.context.parsing:
+            self.context.parse_on_access()
+
+        return instance
+
+    def __setitem__(self, id: str, instance: T) -> None:
+        """sets the instance, replacing its JSONable value."""
+        self._values[id] = None
+        self._instances[id] = instance
+
+    def __delitem__(self, id: str) -> None:
+        """removes the instance from the registry."""
+        del self._values[id]
+        if id in self._instances:
+            del self._instances[id]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """iterates over the identifiers without parsing the instances."""
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """gives the number of instances, parsed or not."""
+        return len(self._values)
+
+    def __contains__(self, id: object) -> bool:
+        """checks whether there is the instance without parsing it."""
+        return id in self._values
+
+    def parse_instance(self, id: str, instance: T, errors: Errors) -> None:
+        """
+        parses the JSONable value of the instance into its placeholder.
+
+        :param id: identifier of the instance
+        :param instance: placeholder to be filled out
+        :param errors: errors encountered during parsing
+        :return:
+        """
+        self.parse(self._values[id], (self.ref, (id, )), instance, errors)
+
+    def discard(self, id: str) -> None:
+        """discards the instance so that it is parsed anew on next access."""
+        if id in self._instances:
+            del self._instances[id]
+
+    def schedule_all(self) -> None:
+        """schedules all the instances not parsed yet for parsing."""
+        for id in self._values:
+            if id not in self._instances:
+                instance = self.placeholder(id)
+                self._instances[id] = instance
+                self.context.schedule(registry=self, id=id, instance=instance)
+
+    def materialize_all(self, errors: Errors) -> None:
+        """
+        parses all the instances of all the registries of the graph.
+
+        :param errors: errors encountered during parsing
+        :return:
+        """
+        self.context.materialize_all(errors=errors)
+
+
+def placeholder_some_embed() -> some.graph.SomeEmbed:
+    """
+    creates a placeholder instance of SomeEmbed.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :return: empty shell
+    """
+    return some.graph.SomeEmbed(  # type: ignore
+        some_number=None)
+
+
+def placeholder_some_class(
+        id: str) -> some.graph.SomeClass:
+    """
+    creates a placeholder instance of SomeClass.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :param id: identifier of the instance
+    :return: empty shell
+    """
+    return some.graph.SomeClass(  # type: ignore
+        id=id,
+        some_text=None,
+        some_array=None,
+        some_embed=None)
+
+
+def placeholder_other_class(
+        id: str) -> some.graph.OtherClass:
+    """
+    creates a placeholder instance of OtherClass.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :param id: identifier of the instance
+    :return: empty shell
+    """
+    return some.graph.OtherClass(
+        id=id)
+
+
+def placeholder_some_graph() -> some.graph.SomeGraph:
+    """
+    creates a placeholder instance of SomeGraph.
+
+    Placeholders are necessary so that we can pre-allocate class registries
+    during parsing. All the attribute of the placeholder are set to None.
+    Consider a placeholder an empty shell to be filled out during parsing.
+
+    :return: empty shell
+    """
+    return some.graph.SomeGraph(  # type: ignore
+        some_reference=None)
@@ -0,0 +1,68 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""defines some object graph."""
+
+
+import collections
+import typing
+
+import numpy
+import numpy.typing
+
+
+class TimeSeries:
+    """defines a time series."""
+
+    def __init__(
+            self,
+            id: str,
+            timestamps: numpy.typing.NDArray[numpy.int64],
+            values: numpy.typing.NDArray[numpy.float64],
+            weights: typing.Optional[numpy.typing.NDArray[numpy.float64]] = None) -> None:
+        """
+        initializes an instance of TimeSeries with the given values.
+
+        :param id: identifier of the instance:param timestamps: lists the timestamps in seconds.
+        :param values: lists the measured values.
+        :param weights: lists optional weights of the values.
+
+        """
+        self.id = id
+        self.timestamps = timestamps
+        self.values = values
+        self.weights = weights if weights is not None else None
+
+
+class SomeGraph:
+    """defines some object graph."""
+
+    def __init__(
+            self,
+            some_counts: numpy.typing.NDArray[numpy.int64],
+            some_matrix: typing.List[numpy.typing.NDArray[numpy.float64]],
+            some_map: typing.MutableMapping[str, numpy.typing.NDArray[numpy.int64]],
+            time_serieses: typing.Optional[typing.MutableMapping[str, TimeSeries]] = None) -> None:
+        """
+        initializes an instance of SomeGraph with the given values.
+
+        The class registries are initialized with empty ordered dictionaries.
+        :param some_counts: lists some unconstrained counts.
+        :param some_matrix: defines some matrix as an array of rows.
+        :param some_map: maps some names to arrays of integers.
+        :param time_serieses:
+            registry of instances of TimeSeries;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+
+        """
+        self.some_counts = some_counts
+        self.some_matrix = some_matrix
+        self.some_map = some_map
+
+        if time_serieses is not None:
+            self.time_serieses = time_serieses
+        else:
+            self.time_serieses = collections.OrderedDict()
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
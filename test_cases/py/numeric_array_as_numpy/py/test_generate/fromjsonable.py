@@ -0,0 +1,1565 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses JSONable objects."""
+
+
+import collections
+import typing
+
+import numpy
+import numpy.typing
+
+import some.graph
+import some.graph.parse
+
+
+def _time_series_construct(
+        value: typing.Any,
+        id: str,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.TimeSeries]:
+    """
+    parses TimeSeries from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    parsed_weights = None  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+
+    ##
+    # Parse timestamps
+    ##
+
+    value_0 = value.get(
+        'timestamps',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: timestamps')
+    else:
+        if not isinstance(value_0, list):
+            errors.add(
+                (ref, 'timestamps'),
+                "Expected a list, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = (
+                None
+            )  # type: typing.Optional[numpy.typing.NDArray[numpy.int64]]
+
+            # Convert all the items at once if they are all of the expected types.
+            if set(map(type, value_0)) <= {int}:
+                try:
+                    target_1 = numpy.array(value_0, dtype=numpy.int64)
+                except OverflowError:
+                    pass
+
+            if target_1 is not None:
+                # Check the constraints on all the items at once and
+                # report only the items violating them one by one.
+                for i_1 in numpy.flatnonzero(
+                        ~(target_1 >= 0)).tolist():
+                    item_1 = value_0[i_1]
+                    if not (item_1 >= 0):
+                        errors.add(
+                            (ref, 'timestamps', i_1),
+                            'Expected >= 0, but got: {}'.format(
+                                item_1))
+
+                    if errors.full():
+                        break
+
+                parsed_timestamps = target_1
+            else:
+                # Parse the items one by one to report the errors.
+                items_1 = []  # type: typing.List[int]
+                for i_1, item_1 in enumerate(
+                        value_0):
+                    target_item_1 = (
+                        None
+                    )  # type: typing.Optional[int]
+                    if not isinstance(item_1, int):
+                        errors.add(
+                            (ref, 'timestamps', i_1),
+                            "Expected an integer, but got: {}".format(
+                                type(item_1)))
+                    else:
+                        if not (item_1 >= 0):
+                            errors.add(
+                                (ref, 'timestamps', i_1),
+                                'Expected >= 0, but got: {}'.format(
+                                    item_1))
+                        else:
+                            target_item_1 = item_1
+
+                    if target_item_1 is not None:
+                        items_1.append(
+                            target_item_1)
+
+                    if errors.full():
+                        break
+
+                if len(items_1) == len(value_0):
+                    try:
+                        parsed_timestamps = numpy.array(
+                            items_1, dtype=numpy.int64)
+                    except OverflowError:
+                        errors.add(
+                            (ref, 'timestamps'),
+                            "Expected all the integers to fit into 64 bits, "
+                            "but got an overflow")
+    if errors.full():
+        return None
+
+    ##
+    # Parse values
+    ##
+
+    value_3 = value.get(
+        'values',
+        None)
+
+    if value_3 is None:
+        errors.add(
+            ref,
+            'Property is missing: values')
+    else:
+        if not isinstance(value_3, list):
+            errors.add(
+                (ref, 'values'),
+                "Expected a list, but got: {}".format(
+                    type(value_3)))
+        elif len(value_3) < 1:
+            errors.add(
+                (ref, 'values'),
+                "Expected a list of minimum size 1, but got size: {}".format(
+                    len(value_3)))
+        else:
+            target_4 = (
+                None
+            )  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+
+            # Convert all the items at once if they are all of the expected types.
+            if set(map(type, value_3)) <= {int, float}:
+                target_4 = numpy.array(value_3, dtype=numpy.float64)
+
+            if target_4 is not None:
+                # Check the constraints on all the items at once and
+                # report only the items violating them one by one.
+                for i_4 in numpy.flatnonzero(
+                        ~(target_4 >= -1) | ~(target_4 < 1)).tolist():
+                    item_4 = value_3[i_4]
+                    if not (item_4 >= -1):
+                        errors.add(
+                            (ref, 'values', i_4),
+                            'Expected >= -1, but got: {}'.format(
+                                item_4))
+                    if not (item_4 < 1):
+                        errors.add(
+                            (ref, 'values', i_4),
+                            'Expected < 1, but got: {}'.format(
+                                item_4))
+
+                    if errors.full():
+                        break
+
+                parsed_values = target_4
+            else:
+                # Parse the items one by one to report the errors.
+                items_4 = []  # type: typing.List[float]
+                for i_4, item_4 in enumerate(
+                        value_3):
+                    target_item_4 = (
+                        None
+                    )  # type: typing.Optional[float]
+                    if not isinstance(item_4, (int, float)):
+                        errors.add(
+                            (ref, 'values', i_4),
+                            'Expected a number, but got: {}'.format(
+                                type(item_4)))
+                    else:
+                        if not (item_4 >= -1):
+                            errors.add(
+                                (ref, 'values', i_4),
+                                'Expected >= -1, but got: {}'.format(
+                                    item_4))
+                        if not (item_4 < 1):
+                            errors.add(
+                                (ref, 'values', i_4),
+                                'Expected < 1, but got: {}'.format(
+                                    item_4))
+                        else:
+                            target_item_4 = float(item_4)
+
+                    if target_item_4 is not None:
+                        items_4.append(
+                            target_item_4)
+
+                    if errors.full():
+                        break
+
+                if len(items_4) == len(value_3):
+                    parsed_values = numpy.array(
+                        items_4, dtype=numpy.float64)
+    if errors.full():
+        return None
+
+    ##
+    # Parse weights
+    ##
+
+    value_6 = value.get(
+        'weights',
+        None)
+
+    if value_6 is not None:
+        if not isinstance(value_6, list):
+            errors.add(
+                (ref, 'weights'),
+                "Expected a list, but got: {}".format(
+                    type(value_6)))
+        else:
+            target_7 = (
+                None
+            )  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+
+            # Convert all the items at once if they are all of the expected types.
+            if set(map(type, value_6)) <= {int, float}:
+                target_7 = numpy.array(value_6, dtype=numpy.float64)
+
+            if target_7 is not None:
+                parsed_weights = target_7
+            else:
+                # Parse the items one by one to report the errors.
+                items_7 = []  # type: typing.List[float]
+                for i_7, item_7 in enumerate(
+                        value_6):
+                    target_item_7 = (
+                        None
+                    )  # type: typing.Optional[float]
+                    if not isinstance(item_7, (int, float)):
+                        errors.add(
+                            (ref, 'weights', i_7),
+                            'Expected a number, but got: {}'.format(
+                                type(item_7)))
+                    else:
+                        target_item_7 = float(item_7)
+
+                    if target_item_7 is not None:
+                        items_7.append(
+                            target_item_7)
+
+                    if errors.full():
+                        break
+
+                if len(items_7) == len(value_6):
+                    parsed_weights = numpy.array(
+                        items_7, dtype=numpy.float64)
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.TimeSeries(
+        id=id,
+        timestamps=parsed_timestamps,
+        values=parsed_values,
+        weights=parsed_weights)
+
+
+def _time_series_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        target: some.graph.TimeSeries,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses TimeSeries from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as TimeSeries
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+    ##
+    # Parse timestamps
+    ##
+
+    value_0 = value.get(
+        'timestamps',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: timestamps')
+    else:
+        if not isinstance(value_0, list):
+            errors.add(
+                (ref, 'timestamps'),
+                "Expected a list, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = (
+                None
+            )  # type: typing.Optional[numpy.typing.NDArray[numpy.int64]]
+
+            # Convert all the items at once if they are all of the expected types.
+            if set(map(type, value_0)) <= {int}:
+                try:
+                    target_1 = numpy.array(value_0, dtype=numpy.int64)
+                except OverflowError:
+                    pass
+
+            if target_1 is not None:
+                # Check the constraints on all the items at once and
+                # report only the items violating them one by one.
+                for i_1 in numpy.flatnonzero(
+                        ~(target_1 >= 0)).tolist():
+                    item_1 = value_0[i_1]
+                    if not (item_1 >= 0):
+                        errors.add(
+                            (ref, 'timestamps', i_1),
+                            'Expected >= 0, but got: {}'.format(
+                                item_1))
+
+                    if errors.full():
+                        break
+
+                target.timestamps = target_1
+            else:
+                # Parse the items one by one to report the errors.
+                items_1 = []  # type: typing.List[int]
+                for i_1, item_1 in enumerate(
+                        value_0):
+                    target_item_1 = (
+                        None
+                    )  # type: typing.Optional[int]
+                    if not isinstance(item_1, int):
+                        errors.add(
+                            (ref, 'timestamps', i_1),
+                            "Expected an integer, but got: {}".format(
+                                type(item_1)))
+                    else:
+                        if not (item_1 >= 0):
+                            errors.add(
+                                (ref, 'timestamps', i_1),
+                                'Expected >= 0, but got: {}'.format(
+                                    item_1))
+                        else:
+                            target_item_1 = item_1
+
+                    if target_item_1 is not None:
+                        items_1.append(
+                            target_item_1)
+
+                    if errors.full():
+                        break
+
+                if len(items_1) == len(value_0):
+                    try:
+                        target.timestamps = numpy.array(
+                            items_1, dtype=numpy.int64)
+                    except OverflowError:
+                        errors.add(
+                            (ref, 'timestamps'),
+                            "Expected all the integers to fit into 64 bits, "
+                            "but got an overflow")
+    if errors.full():
+        return
+
+    ##
+    # Parse values
+    ##
+
+    value_3 = value.get(
+        'values',
+        None)
+
+    if value_3 is None:
+        errors.add(
+            ref,
+            'Property is missing: values')
+    else:
+        if not isinstance(value_3, list):
+            errors.add(
+                (ref, 'values'),
+                "Expected a list, but got: {}".format(
+                    type(value_3)))
+        elif len(value_3) < 1:
+            errors.add(
+                (ref, 'values'),
+                "Expected a list of minimum size 1, but got size: {}".format(
+                    len(value_3)))
+        else:
+            target_4 = (
+                None
+            )  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+
+            # Convert all the items at once if they are all of the expected types.
+            if set(map(type, value_3)) <= {int, float}:
+                target_4 = numpy.array(value_3, dtype=numpy.float64)
+
+            if target_4 is not None:
+                # Check the constraints on all the items at once and
+                # report only the items violating them one by one.
+                for i_4 in numpy.flatnonzero(
+                        ~(target_4 >= -1) | ~(target_4 < 1)).tolist():
+                    item_4 = value_3[i_4]
+                    if not (item_4 >= -1):
+                        errors.add(
+                            (ref, 'values', i_4),
+                            'Expected >= -1, but got: {}'.format(
+                                item_4))
+                    if not (item_4 < 1):
+                        errors.add(
+                            (ref, 'values', i_4),
+                            'Expected < 1, but got: {}'.format(
+                                item_4))
+
+                    if errors.full():
+                        break
+
+                target.values = target_4
+            else:
+                # Parse the items one by one to report the errors.
+                items_4 = []  # type: typing.List[float]
+                for i_4, item_4 in enumerate(
+                        value_3):
+                    target_item_4 = (
+                        None
+                    )  # type: typing.Optional[float]
+                    if not isinstance(item_4, (int, float)):
+                        errors.add(
+                            (ref, 'values', i_4),
+                            'Expected a number, but got: {}'.format(
+                                type(item_4)))
+                    else:
+                        if not (item_4 >= -1):
+                            errors.add(
+                                (ref, 'values', i_4),
+                                'Expected >= -1, but got: {}'.format(
+                                    item_4))
+                        if not (item_4 < 1):
+                            errors.add(
+                                (ref, 'values', i_4),
+                                'Expected < 1, but got: {}'.format(
+                                    item_4))
+                        else:
+                            target_item_4 = float(item_4)
+
+                    if target_item_4 is not None:
+                        items_4.append(
+                            target_item_4)
+
+                    if errors.full():
+                        break
+
+                if len(items_4) == len(value_3):
+                    target.values = numpy.array(
+                        items_4, dtype=numpy.float64)
+    if errors.full():
+        return
+
+    ##
+    # Parse weights
+    ##
+
+    value_6 = value.get(
+        'weights',
+        None)
+
+    if value_6 is not None:
+        if not isinstance(value_6, list):
+            errors.add(
+                (ref, 'weights'),
+                "Expected a list, but got: {}".format(
+                    type(value_6)))
+        else:
+            target_7 = (
+                None
+            )  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+
+            # Convert all the items at once if they are all of the expected types.
+            if set(map(type, value_6)) <= {int, float}:
+                target_7 = numpy.array(value_6, dtype=numpy.float64)
+
+            if target_7 is not None:
+                target.weights = target_7
+            else:
+                # Parse the items one by one to report the errors.
+                items_7 = []  # type: typing.List[float]
+                for i_7, item_7 in enumerate(
+                        value_6):
+                    target_item_7 = (
+                        None
+                    )  # type: typing.Optional[float]
+                    if not isinstance(item_7, (int, float)):
+                        errors.add(
+                            (ref, 'weights', i_7),
+                            'Expected a number, but got: {}'.format(
+                                type(item_7)))
+                    else:
+                        target_item_7 = float(item_7)
+
+                    if target_item_7 is not None:
+                        items_7.append(
+                            target_item_7)
+
+                    if errors.full():
+                        break
+
+                if len(items_7) == len(value_6):
+                    target.weights = numpy.array(
+                        items_7, dtype=numpy.float64)
+    if errors.full():
+        return
+
+
+def time_series_from(
+        value: typing.Any,
+        id: str,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.TimeSeries]:
+    """
+    parses TimeSeries from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _time_series_construct(
+        value=value,
+        id=id,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def some_graph_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate time_serieses
+    ##
+
+    registry_value = value.get('time_serieses', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'time_serieses'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.time_serieses = collections.OrderedDict()
+            else:
+                graph.time_serieses = dict()
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse time_serieses
+    ##
+
+    if 'time_serieses' in value:
+        registry_value = value['time_serieses']
+        for id, instance_value in registry_value.items():
+            instance_time_series = _time_series_construct(
+                instance_value,
+                id,
+                (ref, 'time_serieses', (id, )),
+                errors)
+
+            if instance_time_series is None:
+                # Keep the ID in the registry so that the references to
+                # the invalid instance do not cause further errors.
+                instance_time_series = some.graph.parse.placeholder_time_series(id=id)
+
+            graph.time_serieses[id] = instance_time_series
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_counts
+    ##
+
+    value_0 = value.get(
+        'some_counts',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_counts')
+    else:
+        if not isinstance(value_0, list):
+            errors.add(
+                (ref, 'some_counts'),
+                "Expected a list, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = (
+                None
+            )  # type: typing.Optional[numpy.typing.NDArray[numpy.int64]]
+
+            # Convert all the items at once if they are all of the expected types.
+            if set(map(type, value_0)) <= {int}:
+                try:
+                    target_1 = numpy.array(value_0, dtype=numpy.int64)
+                except OverflowError:
+                    pass
+
+            if target_1 is not None:
+                graph.some_counts = target_1
+            else:
+                # Parse the items one by one to report the errors.
+                items_1 = []  # type: typing.List[int]
+                for i_1, item_1 in enumerate(
+                        value_0):
+                    target_item_1 = (
+                        None
+                    )  # type: typing.Optional[int]
+                    if not isinstance(item_1, int):
+                        errors.add(
+                            (ref, 'some_counts', i_1),
+                            "Expected an integer, but got: {}".format(
+                                type(item_1)))
+                    else:
+                        target_item_1 = item_1
+
+                    if target_item_1 is not None:
+                        items_1.append(
+                            target_item_1)
+
+                    if errors.full():
+                        break
+
+                if len(items_1) == len(value_0):
+                    try:
+                        graph.some_counts = numpy.array(
+                            items_1, dtype=numpy.int64)
+                    except OverflowError:
+                        errors.add(
+                            (ref, 'some_counts'),
+                            "Expected all the integers to fit into 64 bits, "
+                            "but got an overflow")
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_matrix
+    ##
+
+    value_3 = value.get(
+        'some_matrix',
+        None)
+
+    if value_3 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_matrix')
+    else:
+        if not isinstance(value_3, list):
+            errors.add(
+                (ref, 'some_matrix'),
+                "Expected a list, but got: {}".format(
+                    type(value_3)))
+        else:
+            target_4 = (
+                []
+            )  # type: typing.List[numpy.typing.NDArray[numpy.float64]]
+            for i_4, item_4 in enumerate(
+                    value_3):
+                target_item_4 = (
+                    None
+                )  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+                if not isinstance(item_4, list):
+                    errors.add(
+                        (ref, 'some_matrix', i_4),
+                        "Expected a list, but got: {}".format(
+                            type(item_4)))
+                else:
+                    target_5 = (
+                        None
+                    )  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+
+                    # Convert all the items at once if they are all of the expected types.
+                    if set(map(type, item_4)) <= {int, float}:
+                        target_5 = numpy.array(item_4, dtype=numpy.float64)
+
+                    if target_5 is not None:
+                        target_item_4 = target_5
+                    else:
+                        # Parse the items one by one to report the errors.
+                        items_5 = []  # type: typing.List[float]
+                        for i_5, item_5 in enumerate(
+                                item_4):
+                            target_item_5 = (
+                                None
+                            )  # type: typing.Optional[float]
+                            if not isinstance(item_5, (int, float)):
+                                errors.add(
+                                    (ref, 'some_matrix', i_4, i_5),
+                                    'Expected a number, but got: {}'.format(
+                                        type(item_5)))
+                            else:
+                                target_item_5 = float(item_5)
+
+                            if target_item_5 is not None:
+                                items_5.append(
+                                    target_item_5)
+
+                            if errors.full():
+                                break
+
+                        if len(items_5) == len(item_4):
+                            target_item_4 = numpy.array(
+                                items_5, dtype=numpy.float64)
+
+                if target_item_4 is not None:
+                    target_4.append(
+                        target_item_4)
+
+                if errors.full():
+                    break
+
+            graph.some_matrix = target_4
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_map
+    ##
+
+    value_7 = value.get(
+        'some_map',
+        None)
+
+    if value_7 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_map')
+    else:
+        if not isinstance(value_7, dict):
+            errors.add(
+                (ref, 'some_map'),
+                "Expected a dict, but got: {}".format(
+                    type(value_7)))
+        else:
+            if isinstance(value_7, collections.OrderedDict):
+                target_8 = (
+                    collections.OrderedDict()
+                )  # type: typing.MutableMapping[str, numpy.typing.NDArray[numpy.int64]]
+            else:
+                target_8 = (
+                    dict()
+                )
+
+            for key_8, value_8 in value_7.items():
+                if not isinstance(key_8, str):
+                    errors.add(
+                        (ref, 'some_map'),
+                        "Expected the key to be a str, but got: {}".format(
+                            type(key_8)))
+
+                    if errors.full():
+                        break
+                    else:
+                        continue
+
+                target_item_8 = (
+                    None
+                )  # type: typing.Optional[numpy.typing.NDArray[numpy.int64]]
+                if not isinstance(value_8, list):
+                    errors.add(
+                        (ref, 'some_map', (key_8, )),
+                        "Expected a list, but got: {}".format(
+                            type(value_8)))
+                else:
+                    target_9 = (
+                        None
+                    )  # type: typing.Optional[numpy.typing.NDArray[numpy.int64]]
+
+                    # Convert all the items at once if they are all of the expected types.
+                    if set(map(type, value_8)) <= {int}:
+                        try:
+                            target_9 = numpy.array(value_8, dtype=numpy.int64)
+                        except OverflowError:
+                            pass
+
+                    if target_9 is not None:
+                        # Check the constraints on all the items at once and
+                        # report only the items violating them one by one.
+                        for i_9 in numpy.flatnonzero(
+                                ~(target_9 <= 100)).tolist():
+                            item_9 = value_8[i_9]
+                            if not (item_9 <= 100):
+                                errors.add(
+                                    (ref, 'some_map', (key_8, ), i_9),
+                                    'Expected <= 100, but got: {}'.format(
+                                        item_9))
+
+                            if errors.full():
+                                break
+
+                        target_item_8 = target_9
+                    else:
+                        # Parse the items one by one to report the errors.
+                        items_9 = []  # type: typing.List[int]
+                        for i_9, item_9 in enumerate(
+                                value_8):
+                            target_item_9 = (
+                                None
+                            )  # type: typing.Optional[int]
+                            if not isinstance(item_9, int):
+                                errors.add(
+                                    (ref, 'some_map', (key_8, ), i_9),
+                                    "Expected an integer, but got: {}".format(
+                                        type(item_9)))
+                            else:
+                                if not (item_9 <= 100):
+                                    errors.add(
+                                        (ref, 'some_map', (key_8, ), i_9),
+                                        'Expected <= 100, but got: {}'.format(
+                                            item_9))
+                                else:
+                                    target_item_9 = item_9
+
+                            if target_item_9 is not None:
+                                items_9.append(
+                                    target_item_9)
+
+                            if errors.full():
+                                break
+
+                        if len(items_9) == len(value_8):
+                            try:
+                                target_item_8 = numpy.array(
+                                    items_9, dtype=numpy.int64)
+                            except OverflowError:
+                                errors.add(
+                                    (ref, 'some_map', (key_8, )),
+                                    "Expected all the integers to fit into 64 bits, "
+                                    "but got an overflow")
+
+                if target_item_8 is not None:
+                    target_8[key_8] = target_item_8
+
+                if errors.full():
+                    break
+
+            if target_8 is not None:
+                graph.some_map = target_8
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
+
+
+def _time_series_construct_fast(
+        value: typing.Any,
+        id: str
+) -> some.graph.TimeSeries:
+    """
+    parses TimeSeries optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    parsed_weights = None  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+
+    ##
+    # Parse timestamps
+    ##
+
+    value_1 = value['timestamps']
+    if not isinstance(value_1, list):
+        raise TypeError("Expected a list")
+    if not set(map(type, value_1)) <= {int}:
+        raise TypeError("Expected a list of integers")
+    target_1 = numpy.array(value_1, dtype=numpy.int64)
+    if numpy.any(~(target_1 >= 0)):
+        raise ValueError("Expected the items to satisfy the constraints")
+    parsed_timestamps = target_1
+
+    ##
+    # Parse values
+    ##
+
+    value_3 = value['values']
+    if not isinstance(value_3, list):
+        raise TypeError("Expected a list")
+    if len(value_3) < 1:
+        raise ValueError("Expected a list of minimum size 1")
+    if not set(map(type, value_3)) <= {int, float}:
+        raise TypeError("Expected a list of numbers")
+    target_3 = numpy.array(value_3, dtype=numpy.float64)
+    if numpy.any(~(target_3 >= -1) | ~(target_3 < 1)):
+        raise ValueError("Expected the items to satisfy the constraints")
+    parsed_values = target_3
+
+    ##
+    # Parse weights
+    ##
+
+    value_4 = value.get(
+        'weights',
+        None)
+    if value_4 is not None:
+        if not isinstance(value_4, list):
+            raise TypeError("Expected a list")
+        if not set(map(type, value_4)) <= {int, float}:
+            raise TypeError("Expected a list of numbers")
+        target_5 = numpy.array(value_4, dtype=numpy.float64)
+        parsed_weights = target_5
+
+    return some.graph.TimeSeries(
+        id=id,
+        timestamps=parsed_timestamps,
+        values=parsed_values,
+        weights=parsed_weights)
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Pre-allocate time_serieses
+    ##
+
+    registry_value = value.get('time_serieses', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            raise TypeError("Expected a dictionary")
+
+        if isinstance(registry_value, collections.OrderedDict):
+            graph.time_serieses = collections.OrderedDict()
+        else:
+            graph.time_serieses = dict()
+
+    ##
+    # Parse time_serieses
+    ##
+
+    if 'time_serieses' in value:
+        registry_value = value['time_serieses']
+        for id, instance_value in registry_value.items():
+            graph.time_serieses[id] = _time_series_construct_fast(
+                instance_value,
+                id)
+
+    ##
+    # Parse some_counts
+    ##
+
+    value_1 = value['some_counts']
+    if not isinstance(value_1, list):
+        raise TypeError("Expected a list")
+    if not set(map(type, value_1)) <= {int}:
+        raise TypeError("Expected a list of integers")
+    target_1 = numpy.array(value_1, dtype=numpy.int64)
+    graph.some_counts = target_1
+
+    ##
+    # Parse some_matrix
+    ##
+
+    value_3 = value['some_matrix']
+    if not isinstance(value_3, list):
+        raise TypeError("Expected a list")
+    target_3 = (
+        []
+    )  # type: typing.List[numpy.typing.NDArray[numpy.float64]]
+    for item_3 in value_3:
+        if not isinstance(item_3, list):
+            raise TypeError("Expected a list")
+        if not set(map(type, item_3)) <= {int, float}:
+            raise TypeError("Expected a list of numbers")
+        target_4 = numpy.array(item_3, dtype=numpy.float64)
+        target_item_3 = target_4
+        target_3.append(
+            target_item_3)
+    graph.some_matrix = target_3
+
+    ##
+    # Parse some_map
+    ##
+
+    value_6 = value['some_map']
+    if not isinstance(value_6, dict):
+        raise TypeError("Expected a dict")
+    if isinstance(value_6, collections.OrderedDict):
+        target_6 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, numpy.typing.NDArray[numpy.int64]]
+    else:
+        target_6 = (
+            dict()
+        )
+    for key_6, item_6 in value_6.items():
+        if not isinstance(key_6, str):
+            raise TypeError("Expected the key to be a str")
+        if not isinstance(item_6, list):
+            raise TypeError("Expected a list")
+        if not set(map(type, item_6)) <= {int}:
+            raise TypeError("Expected a list of integers")
+        target_7 = numpy.array(item_6, dtype=numpy.int64)
+        if numpy.any(~(target_7 <= 100)):
+            raise ValueError("Expected the items to satisfy the constraints")
+        target_item_6 = target_7
+        target_6[key_6] = target_item_6
+    graph.some_map = target_6
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+
+def _same_jsonable(value: typing.Any, other: typing.Any) -> bool:
+    """
+    checks whether the JSONable values are equal including their types.
+
+    Unlike ``==``, the types and the order of the keys need to match as well
+    so that, *e.g.*, 1 and 1.0 or True and 1 are considered different.
+
+    :param value: JSONable value
+    :param other: other JSONable value
+    :return: True if the values are the same
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return (
+            list(value.keys()) == list(other.keys()) and all(
+                _same_jsonable(item, other[key])
+                for key, item in value.items()))
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _same_jsonable(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return bool(value == other)
+
+
+def some_graph_update_from(
+        previous: some.graph.SomeGraph,
+        previous_value: typing.Any,
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph reusing the instances of the previous graph.
+
+    An instance of the previous graph is reused if its JSONable value equals
+    the new one including the types (*e.g.*, 1 and 1.0 differ) and it does not
+    refer to any changed, new or removed instance.
+    All the other instances are parsed anew. The previous graph is left
+    untouched and shares the reused instances with the new one.
+
+    The result and the errors are the same as by ``some_graph_from``.
+
+    :param previous: previously parsed SomeGraph
+    :param previous_value: JSONable value ``previous`` was parsed from
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.full():
+        return None
+
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(type(value)))
+        return None
+
+    if not isinstance(previous_value, dict):
+        previous_value = dict()
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    # IDs of the instances which are new, changed or removed
+    changed_time_serieses = set()  # type: typing.Set[str]
+
+    ##
+    # Pre-allocate time_serieses reusing the unchanged instances
+    ##
+
+    registry_value = value.get('time_serieses', None)
+
+    if registry_value is not None:
+        if not isinstance(registry_value, dict):
+            errors.add(
+                (ref, 'time_serieses'),
+                "Expected a dictionary, but got: {}".format(
+                    type(registry_value)))
+        else:
+            if isinstance(registry_value, collections.OrderedDict):
+                graph.time_serieses = collections.OrderedDict()
+            else:
+                graph.time_serieses = dict()
+
+            time_serieses_registry = graph.time_serieses
+            previous_time_serieses = previous.time_serieses
+
+            previous_registry_value = previous_value.get(
+                'time_serieses', None)
+            if not isinstance(previous_registry_value, dict):
+                previous_registry_value = dict()
+
+            for id, instance_value in registry_value.items():
+                target_time_series = previous_time_serieses.get(id, None)
+                if (target_time_series is None or
+                        not _same_jsonable(
+                            instance_value,
+                            previous_registry_value.get(id, None))):
+                    target_time_series = some.graph.parse.placeholder_time_series(id=id)
+                    changed_time_serieses.add(id)
+
+                time_serieses_registry[id] = target_time_series
+
+    changed_time_serieses.update(
+        id for id in previous.time_serieses
+        if id not in graph.time_serieses)
+
+    if errors.full():
+        return None
+
+    # Errors from pre-allocation are considered critical.
+    if not errors.empty():
+        return None
+
+    ##
+    # Parse the new and changed time_serieses
+    ##
+
+    registry_value = value.get('time_serieses', None)
+    if registry_value is not None and changed_time_serieses:
+        for id, instance_value in registry_value.items():
+            if id not in changed_time_serieses:
+                continue
+
+            _time_series_from(
+                instance_value,
+                (ref, 'time_serieses', (id, )),
+                graph.time_serieses[id],
+                errors)
+
+            if errors.full():
+                return None
+
+    ##
+    # Parse some_counts
+    ##
+
+    value_0 = value.get(
+        'some_counts',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_counts')
+    else:
+        if not isinstance(value_0, list):
+            errors.add(
+                (ref, 'some_counts'),
+                "Expected a list, but got: {}".format(
+                    type(value_0)))
+        else:
+            target_1 = (
+                None
+            )  # type: typing.Optional[numpy.typing.NDArray[numpy.int64]]
+
+            # Convert all the items at once if they are all of the expected types.
+            if set(map(type, value_0)) <= {int}:
+                try:
+                    target_1 = numpy.array(value_0, dtype=numpy.int64)
+                except OverflowError:
+                    pass
+
+            if target_1 is not None:
+                graph.some_counts = target_1
+            else:
+                # Parse the items one by one to report the errors.
+                items_1 = []  # type: typing.List[int]
+                for i_1, item_1 in enumerate(
+                        value_0):
+                    target_item_1 = (
+                        None
+                    )  # type: typing.Optional[int]
+                    if not isinstance(item_1, int):
+                        errors.add(
+                            (ref, 'some_counts', i_1),
+                            "Expected an integer, but got: {}".format(
+                                type(item_1)))
+                    else:
+                        target_item_1 = item_1
+
+                    if target_item_1 is not None:
+                        items_1.append(
+                            target_item_1)
+
+                    if errors.full():
+                        break
+
+                if len(items_1) == len(value_0):
+                    try:
+                        graph.some_counts = numpy.array(
+                            items_1, dtype=numpy.int64)
+                    except OverflowError:
+                        errors.add(
+                            (ref, 'some_counts'),
+                            "Expected all the integers to fit into 64 bits, "
+                            "but got an overflow")
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_matrix
+    ##
+
+    value_3 = value.get(
+        'some_matrix',
+        None)
+
+    if value_3 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_matrix')
+    else:
+        if not isinstance(value_3, list):
+            errors.add(
+                (ref, 'some_matrix'),
+                "Expected a list, but got: {}".format(
+                    type(value_3)))
+        else:
+            target_4 = (
+                []
+            )  # type: typing.List[numpy.typing.NDArray[numpy.float64]]
+            for i_4, item_4 in enumerate(
+                    value_3):
+                target_item_4 = (
+                    None
+                )  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+                if not isinstance(item_4, list):
+                    errors.add(
+                        (ref, 'some_matrix', i_4),
+                        "Expected a list, but got: {}".format(
+                            type(item_4)))
+                else:
+                    target_5 = (
+                        None
+                    )  # type: typing.Optional[numpy.typing.NDArray[numpy.float64]]
+
+                    # Convert all the items at once if they are all of the expected types.
+                    if set(map(type, item_4)) <= {int, float}:
+                        target_5 = numpy.array(item_4, dtype=numpy.float64)
+
+                    if target_5 is not None:
+                        target_item_4 = target_5
+                    else:
+                        # Parse the items one by one to report the errors.
+                        items_5 = []  # type: typing.List[float]
+                        for i_5, item_5 in enumerate(
+                                item_4):
+                            target_item_5 = (
+                                None
+                            )  # type: typing.Optional[float]
+                            if not isinstance(item_5, (int, float)):
+                                errors.add(
+                                    (ref, 'some_matrix', i_4, i_5),
+                                    'Expected a number, but got: {}'.format(
+                                        type(item_5)))
+                            else:
+                                target_item_5 = float(item_5)
+
+                            if target_item_5 is not None:
+                                items_5.append(
+                                    target_item_5)
+
+                            if errors.full():
+                                break
+
+                        if len(items_5) == len(item_4):
+                            target_item_4 = numpy.array(
+                                items_5, dtype=numpy.float64)
+
+                if target_item_4 is not None:
+                    target_4.append(
+                        target_item_4)
+
+                if errors.full():
+                    break
+
+            graph.some_matrix = target_4
+
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_map
+    ##
+
+    value_7 = value.get(
+        'some_map',
+        None)
+
+    if value_7 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_map')
+    else:
+        if not isinstance(value_7, dict):
+            errors.add(
+                (ref, 'some_map'),
+                "Expected a dict, but got: {}".format(
+                    type(value_7)))
+        else:
+            if isinstance(value_7, collections.OrderedDict):
+                target_8 = (
+                    collections.OrderedDict()
+                )  # type: typing.MutableMapping[str, numpy.typing.NDArray[numpy.int64]]
+            else:
+                target_8 = (
+                    dict()
+                )
+
+            for key_8, value_8 in value_7.items():
+                if not isinstance(key_8, str):
+                    errors.add(
+                        (ref, 'some_map'),
+                        "Expected the key to be a str, but got: {}".format(
+                            type(key_8)))
+
+                    if errors.full():
+                        break
+                    else:
+                        continue
+
+                target_item_8 = (
+                    None
+                )  # type: typing.Optional[numpy.typing.NDArray[numpy.int64]]
+                if not isinstance(value_8, list):
+                    errors.add(
+                        (ref, 'some_map', (key_8, )),
+                        "Expected a list, but got: {}".format(
+                            type(value_8)))
+                else:
+                    target_9 = (
+                        None
+                    )  # type: typing.Optional[numpy.typing.NDArray[numpy.int64]]
+
+                    # Convert all the items at once if they are all of the expected types.
+                    if set(map(type, value_8)) <= {int}:
+                        try:
+                            target_9 = numpy.array(value_8, dtype=numpy.int64)
+                        except OverflowError:
+                            pass
+
+                    if target_9 is not None:
+                        # Check the constraints on all the items at once and
+                        # report only the items violating them one by one.
+                        for i_9 in numpy.flatnonzero(
+                                ~(target_9 <= 100)).tolist():
+                            item_9 = value_8[i_9]
+                            if not (item_9 <= 100):
+                                errors.add(
+                                    (ref, 'some_map', (key_8, ), i_9),
+                                    'Expected <= 100, but got: {}'.format(
+                                        item_9))
+
+                            if errors.full():
+                                break
+
+                        target_item_8 = target_9
+                    else:
+                        # Parse the items one by one to report the errors.
+                        items_9 = []  # type: typing.List[int]
+                        for i_9, item_9 in enumerate(
+                                value_8):
+                            target_item_9 = (
+                                None
+                            )  # type: typing.Optional[int]
+                            if not isinstance(item_9, int):
+                                errors.add(
+                                    (ref, 'some_map', (key_8, ), i_9),
+                                    "Expected an integer, but got: {}".format(
+                                        type(item_9)))
+                            else:
+                                if not (item_9 <= 100):
+                                    errors.add(
+                                        (ref, 'some_map', (key_8, ), i_9),
+                                        'Expected <= 100, but got: {}'.format(
+                                            item_9))
+                                else:
+                                    target_item_9 = item_9
+
+                            if target_item_9 is not None:
+                                items_9.append(
+                                    target_item_9)
+
+                            if errors.full():
+                                break
+
+                        if len(items_9) == len(value_8):
+                            try:
+                                target_item_8 = numpy.array(
+                                    items_9, dtype=numpy.int64)
+                            except OverflowError:
+                                errors.add(
+                                    (ref, 'some_map', (key_8, )),
+                                    "Expected all the integers to fit into 64 bits, "
+                                    "but got an overflow")
+
+                if target_item_8 is not None:
+                    target_8[key_8] = target_item_8
+
+                if errors.full():
+                    break
+
+            if target_8 is not None:
+                graph.some_map = target_8
+
+    if errors.full():
+        return None
+
+    if not errors.empty():
+        return None
+
+    return graph
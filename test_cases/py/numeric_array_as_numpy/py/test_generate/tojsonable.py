@@ -0,0 +1,262 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""serializes to JSONable objects."""
+
+
+import collections
+import json
+import typing
+
+import some.graph
+
+
+def serialize_time_series(
+        instance: some.graph.TimeSeries,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of TimeSeries to a JSONable representation.
+
+    :param instance: the instance of TimeSeries to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize timestamps
+    ##
+
+    target['timestamps'] = instance.timestamps.tolist()
+
+    ##
+    # Serialize values
+    ##
+
+    target['values'] = instance.values.tolist()
+
+    ##
+    # Serialize weights
+    ##
+
+    if instance.weights is not None:
+        target['weights'] = instance.weights.tolist()
+
+    return target
+
+
+def serialize_some_graph(
+        instance: some.graph.SomeGraph,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of SomeGraph to a JSONable.
+
+    :param instance: the instance of SomeGraph to be serialized
+    :param ordered:
+        If set, represents the instance properties and class registries
+        as a ``collections.OrderedDict``.
+        Otherwise, they are represented as a ``dict``.
+    :return: JSONable representation
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize some_counts
+    ##
+
+    target['some_counts'] = instance.some_counts.tolist()
+
+    ##
+    # Serialize some_matrix
+    ##
+
+    target_0 = [
+        item_0.tolist()
+        for item_0 in instance.some_matrix
+    ]  # type: typing.List[typing.List[float]]
+    target['some_matrix'] = target_0
+
+    ##
+    # Serialize some_map
+    ##
+
+    if isinstance(instance.some_map, collections.OrderedDict):
+        target_1 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.List[int]]
+    else:
+        target_1 = dict()
+
+    for key_1, value_1 in instance.some_map.items():
+        target_1[key_1] = value_1.tolist()
+    target['some_map'] = target_1
+
+    ##
+    # Serialize instance registry of TimeSeries
+    ##
+
+    if len(instance.time_serieses) > 0:
+        if ordered:
+            target_time_serieses = (
+                collections.OrderedDict()
+            )  # type: typing.MutableMapping[str, typing.Any]
+        else:
+            target_time_serieses = dict()
+
+        for id, time_series_instance in instance.time_serieses.items():
+            if id != time_series_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of TimeSeries, but got: {!r}'.format(
+                        id, time_series_instance.id))
+
+            target_time_serieses[id] = serialize_time_series(
+                instance=time_series_instance,
+                ordered=ordered)
+        target['time_serieses'] = target_time_serieses
+
+    return target
+
+
+class _WriteBuffer:
+    """buffers the chunks of text before writing them to a file."""
+
+    def __init__(self, fp: typing.TextIO, size: int) -> None:
+        """
+        initializes the buffer.
+
+        :param fp: file-like object to write to
+        :param size: number of characters to buffer before writing
+        """
+        self.fp = fp
+        self.size = size
+        self._chunks = []  # type: typing.List[str]
+        self._length = 0
+
+    def write(self, text: str) -> None:
+        """buffers the text and writes it out if the buffer is full."""
+        self._chunks.append(text)
+        self._length += len(text)
+
+        if self._length >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        """writes out the buffered text."""
+        if self._chunks:
+            self.fp.write(''.join(self._chunks))
+            self._chunks = []
+            self._length = 0
+
+
+def write_some_graph_json(
+        instance: some.graph.SomeGraph,
+        fp: typing.TextIO,
+        buffer_size: int = 65536
+) -> None:
+    """
+    writes an instance of SomeGraph as JSON text to ``fp``.
+
+    The text is the same as ``json.dumps(serialize_some_graph(instance))``, but
+    the properties and the class instances are serialized one at a time
+    so that the whole JSONable never needs to be held in memory.
+
+    :param instance: the instance of SomeGraph to be written
+    :param fp: file-like object to write the JSON text to
+    :param buffer_size:
+        number of characters buffered before they are written to ``fp``
+    :return:
+    """
+    buffer = _WriteBuffer(fp=fp, size=buffer_size)
+
+    buffer.write('{')
+    delimiter = ''
+
+    ##
+    # Write some_counts
+    ##
+
+    jsonable_some_counts = instance.some_counts.tolist()
+    buffer.write(delimiter)
+    buffer.write('"some_counts": ')
+    buffer.write(json.dumps(jsonable_some_counts))
+    delimiter = ', '
+
+    ##
+    # Write some_matrix
+    ##
+
+    target_0 = [
+        item_0.tolist()
+        for item_0 in instance.some_matrix
+    ]  # type: typing.List[typing.List[float]]
+    jsonable_some_matrix = target_0
+    buffer.write(delimiter)
+    buffer.write('"some_matrix": ')
+    buffer.write(json.dumps(jsonable_some_matrix))
+    delimiter = ', '
+
+    ##
+    # Write some_map
+    ##
+
+    if isinstance(instance.some_map, collections.OrderedDict):
+        target_1 = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.List[int]]
+    else:
+        target_1 = dict()
+
+    for key_1, value_1 in instance.some_map.items():
+        target_1[key_1] = value_1.tolist()
+    jsonable_some_map = target_1
+    buffer.write(delimiter)
+    buffer.write('"some_map": ')
+    buffer.write(json.dumps(jsonable_some_map))
+    delimiter = ', '
+
+    ##
+    # Write instance registry of TimeSeries
+    ##
+
+    if len(instance.time_serieses) > 0:
+        buffer.write(delimiter)
+        buffer.write('"time_serieses": {')
+
+        registry_delimiter = ''
+        for id, time_series_instance in instance.time_serieses.items():
+            if id != time_series_instance.id:
+                raise ValueError(
+                    'Expected ID {!r} of the instance of TimeSeries, but got: {!r}'.format(
+                        id, time_series_instance.id))
+
+            buffer.write(registry_delimiter)
+            buffer.write(json.dumps(id))
+            buffer.write(': ')
+            buffer.write(
+                json.dumps(
+                    serialize_time_series(
+                        instance=time_series_instance)))
+            registry_delimiter = ', '
+
+        buffer.write('}')
+        delimiter = ', '
+
+    buffer.write('}')
+    buffer.flush()
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,100 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""defines some object graph."""
+
+
+import collections
+import typing
+
+
+class SomeClass:
+    """defines some class."""
+
+    __slots__ = (
+        'id',
+        'some_text',
+        'some_embed',
+        'some_optional_number',
+    )
+
+    def __init__(
+            self,
+            id: str,
+            some_text: str,
+            some_embed: 'SomeEmbed',
+            some_optional_number: typing.Optional[int] = None) -> None:
+        """
+        initializes an instance of SomeClass with the given values.
+
+        :param id: identifier of the instance:param some_text: defines some text.
+        :param some_embed: defines some embed.
+        :param some_optional_number: defines some optional number.
+
+        """
+        self.id = id
+        self.some_text = some_text
+        self.some_embed = some_embed
+        self.some_optional_number = some_optional_number if some_optional_number is not None else None
+
+
+class SomeEmbed:
+    """defines some embeddable structure."""
+
+    __slots__ = (
+        'reference_to_some_class',
+        'empty',
+    )
+
+    def __init__(
+            self,
+            reference_to_some_class: SomeClass,
+            empty: 'Empty') -> None:
+        """
+        initializes an instance of SomeEmbed with the given values.
+
+        :param reference_to_some_class: defines some reference to an instance.
+        :param empty: defines some empty embeddable structure.
+
+        """
+        self.reference_to_some_class = reference_to_some_class
+        self.empty = empty
+
+
+class Empty:
+    """defines an empty embeddable structure."""
+
+    __slots__ = ()
+
+
+class SomeGraph:
+    """defines some object graph."""
+
+    __slots__ = (
+        'some_property',
+        'some_classes',
+    )
+
+    def __init__(
+            self,
+            some_property: SomeEmbed,
+            some_classes: typing.Optional[typing.MutableMapping[str, SomeClass]] = None) -> None:
+        """
+        initializes an instance of SomeGraph with the given values.
+
+        The class registries are initialized with empty ordered dictionaries.
+        :param some_property: defines some property.
+        :param some_classes:
+            registry of instances of SomeClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+
+        """
+        self.some_property = some_property
+
+        if some_classes is not None:
+            self.some_classes = some_classes
+        else:
+            self.some_classes = collections.OrderedDict()
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,64 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses JSONable objects."""
+
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    # The names are imported only for the type checkers. At run time,
+    # they are resolved by ``__getattr__`` on the first access.
+    from some.graph.fromjsonable.some_class import (
+        some_class_from as some_class_from)
+    from some.graph.fromjsonable.other_class import (
+        other_class_from as other_class_from)
+    from some.graph.fromjsonable.some_embed import (
+        some_embed_from as some_embed_from)
+    from some.graph.fromjsonable.other_embed import (
+        other_embed_from as other_embed_from)
+    from some.graph.fromjsonable.some_graph import (
+        some_graph_from as some_graph_from,
+        some_graph_from_fast as some_graph_from_fast,
+        some_graph_update_from as some_graph_update_from)
+
+# Names of the submodules defining the public names of this module
+_SUBMODULES = {
+    'some_class_from': 'some_class',
+    'other_class_from': 'other_class',
+    'some_embed_from': 'some_embed',
+    'other_embed_from': 'other_embed',
+    'some_graph_from': 'some_graph',
+    'some_graph_from_fast': 'some_graph',
+    'some_graph_update_from': 'some_graph',
+}  # type: typing.Mapping[str, str]
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    imports the submodule defining the name on the first access.
+
+    :param name: name of the attribute
+    :return: the attribute
+    :raise AttributeError: if no submodule defines the name
+    """
+    submodule = _SUBMODULES.get(name, None)
+    if submodule is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+
+    value = getattr(
+        importlib.import_module('{}.{}'.format(__name__, submodule)), name)
+
+    # Cache the value so that __getattr__ is not called again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    """lists the names of this module including the ones of the submodules."""
+    return sorted(set(globals()) | set(_SUBMODULES))
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
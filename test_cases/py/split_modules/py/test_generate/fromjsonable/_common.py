@@ -0,0 +1,235 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""provides the helpers shared by the submodules."""
+
+
+import datetime
+import re
+import typing
+
+
+def _scan_duration(text: str) -> typing.Optional[typing.List[str]]:
+    """
+    scans the duration in ISO 8601 format in a single pass.
+
+    :param text: string to be scanned
+    :return:
+        sign, years, months, weeks, days, hours, minutes, seconds and
+        fraction of seconds as strings (empty if not specified),
+        or None if the text does not conform to the format
+
+    >>> _scan_duration('-P1.5YT2M3.04S')
+    ['-', '1.5', '', '', '', '', '2', '3', '04']
+
+    >>> _scan_duration('P01D') is None
+    True
+
+    """
+    # Accept a trailing new line for backward compatibility: the durations
+    # used to be matched by a regular expression ending in ``$``.
+    end = len(text) - 1 if text.endswith('\n') else len(text)
+
+    groups = ['', '', '', '', '', '', '', '', '']
+
+    position = 0
+    if position < end and text[position] in '+-':
+        groups[0] = text[position]
+        position += 1
+
+    if position == end or text[position] != 'P':
+        return None
+    position += 1
+
+    # Designators of the date part are followed by
+    # the designators of the time part.
+    designators = 'YMWD'
+    offset = 1
+    next_designator = 0
+
+    while position < end:
+        if text[position] == 'T' and offset == 1:
+            designators = 'HMS'
+            offset = 5
+            next_designator = 0
+            position += 1
+            continue
+
+        start = position
+
+        if text[position] == '0':
+            position += 1
+        elif '1' <= text[position] <= '9':
+            position += 1
+            while position < end and '0' <= text[position] <= '9':
+                position += 1
+        else:
+            return None
+
+        integer_end = position
+
+        if position < end and text[position] == '.':
+            position += 1
+            while position < end and '0' <= text[position] <= '9':
+                position += 1
+
+            if position == integer_end + 1:
+                return None
+
+        if position == end:
+            return None
+
+        designator = designators.find(text[position], next_designator)
+        if designator == -1:
+            return None
+
+        if offset + designator == 7:
+            groups[7] = text[start:integer_end]
+            groups[8] = text[integer_end + 1:position]
+        else:
+            groups[offset + designator] = text[start:position]
+
+        next_designator = designator + 1
+        position += 1
+
+    return groups
+
+
+def _duration_from_string(text: str) -> datetime.timedelta:
+    """
+    parses the duration from the string in ISO 8601 format.
+
+    Following C++ chrono library, the following units are counted as:
+
+    * years as 365.2425 days (the average length of a Gregorian year),
+    * months as 30.436875 days (exactly 1/12 of years) and
+    * weeks as 7 days.
+
+    :param text: string to be parsed
+    :return: duration
+    :raise:
+        ValueError if the string could not be parsed,
+        ValueError if the fraction precision is higher than microseconds
+        OverflowError if the duration does not fit into datetime.timedelta
+
+
+    >>> _duration_from_string('P10Y')
+    datetime.timedelta(3652, 36720)
+
+    >>> _duration_from_string('P1M')
+    datetime.timedelta(30, 37746)
+
+    >>> _duration_from_string('P1W')
+    datetime.timedelta(7)
+
+    >>> _duration_from_string('P1D')
+    datetime.timedelta(1)
+
+    >>> _duration_from_string('PT1H1M1S')
+    datetime.timedelta(0, 3661)
+
+    >>> _duration_from_string('PT1H1M1.1S')
+    datetime.timedelta(0, 3661, 100000)
+
+    >>> _duration_from_string('PT')
+    datetime.timedelta(0)
+
+    >>> _duration_from_string('P1.1Y1.1M1.1W1.1DT1.1H1.1M1.1S')
+    datetime.timedelta(444, 8114, 900000)
+
+    >>> _duration_from_string('PT0.000001S')
+    datetime.timedelta(0, 0, 1)
+
+    >>> _duration_from_string('PT1.000S')
+    datetime.timedelta(0, 1)
+
+    >>> _duration_from_string('-P1D')
+    datetime.timedelta(-1)
+
+    """
+    groups = _scan_duration(text)
+
+    if groups is None:
+        raise ValueError(
+            'Failed to match the duration: {!r}'.format(
+                text))
+
+    (sign_grp, years_grp, months_grp, weeks_grp, days_grp, hours_grp,
+     minutes_grp, seconds_grp, fraction_grp) = groups
+
+    if not sign_grp or sign_grp == '+':
+        sign = 1
+    else:
+        sign = -1
+
+    years = float(years_grp) if years_grp else 0.0
+    months = float(months_grp) if months_grp else 0.0
+    weeks = float(weeks_grp) if weeks_grp else 0.0
+    days = float(days_grp) if days_grp else 0.0
+    hours = float(hours_grp) if hours_grp else 0.0
+    minutes = float(minutes_grp) if minutes_grp else 0.0
+    seconds = int(seconds_grp) if seconds_grp else 0
+
+    if not fraction_grp:
+        microseconds = 0
+
+    elif len(fraction_grp) > 6:
+        raise ValueError(
+            ('Precision only up to microseconds supported, '
+             'but got: {}').format(text))
+
+    else:
+        stripped = fraction_grp.lstrip('0')
+        if stripped:
+            count = int(stripped)
+            order = 6 - len(fraction_grp)
+            microseconds = count * (10 ** order)
+        else:
+            microseconds = 0
+    try:
+        return sign * datetime.timedelta(
+            days=years * 365.2425 + months * 30.436875 + weeks * 7 + days,
+            seconds=seconds,
+            minutes=minutes,
+            hours=hours,
+            microseconds=microseconds)
+
+    except OverflowError as err:
+        raise OverflowError(
+            'Creating a timedelta overflowed from: {!r}'.format(
+                text)) from err
+
+
+_DATE_Y_45_m_45_d_RE = re.compile(
+    r'([0-9]{4})\-([0-9]{2})\-([0-9]{2})\Z')
+
+
+def _date_from_string_Y_45_m_45_d(text: str) -> datetime.date:
+    """
+    parses the date from the string in the format '%Y-%m-%d'.
+
+    The zero-padded strings are scanned at fixed offsets. All the other strings
+    are parsed with ``datetime.datetime.strptime``.
+
+    :param text: string to be parsed
+    :return: date
+    :raise: ValueError if the string could not be parsed
+
+    >>> _date_from_string_Y_45_m_45_d('2016-07-03')
+    datetime.date(2016, 7, 3)
+
+    """
+    match = _DATE_Y_45_m_45_d_RE.match(text)
+    if match is not None:
+        try:
+            return datetime.date(
+                int(match.group(1)),
+                int(match.group(2)),
+                int(match.group(3)))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(text, '%Y-%m-%d').date()
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
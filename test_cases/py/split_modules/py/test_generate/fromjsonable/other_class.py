@@ -0,0 +1,131 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses OtherClass from JSONable objects."""
+
+
+import typing
+
+import some.graph
+import some.graph.parse
+
+
+def _other_class_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        target: some.graph.OtherClass,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses OtherClass from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as OtherClass
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+    ##
+    # Parse some_date
+    ##
+
+    value_0 = value.get(
+        'some_date',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_date')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_date'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        else:
+            try:
+                target.some_date = _date_from_string_Y_45_m_45_d(
+                    value_0)
+            except ValueError:
+                errors.add(
+                    (ref, 'some_date'),
+                    'Expected to strptime %Y-%m-%d, but got: {}'.format(
+                        value_0))
+    if errors.full():
+        return
+
+
+def other_class_from(
+        value: typing.Any,
+        id: str,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.OtherClass]:
+    """
+    parses OtherClass from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = some.graph.parse.placeholder_other_class(id=id)
+
+    _other_class_from(
+        value=value,
+        ref=ref,
+        target=target,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _other_class_from_fast(
+        value: typing.Any,
+        target: some.graph.OtherClass
+) -> None:
+    """
+    parses OtherClass optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :param target: parsed ``value`` as OtherClass
+    :return:
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse some_date
+    ##
+
+    target.some_date = _date_from_string_Y_45_m_45_d(
+        value['some_date'])
+
+
+# The names of the other submodules are imported at the end so that
+# the submodules can refer to each other regardless of the import order.
+from some.graph.fromjsonable._common import _date_from_string_Y_45_m_45_d
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
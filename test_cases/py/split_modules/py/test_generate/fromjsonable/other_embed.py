@@ -0,0 +1,135 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses OtherEmbed from JSONable objects."""
+
+
+import typing
+
+import some.graph
+import some.graph.parse
+
+
+def _other_embed_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.OtherEmbed]:
+    """
+    parses OtherEmbed from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    ##
+    # Parse some_number
+    ##
+
+    value_0 = value.get(
+        'some_number',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_number')
+    else:
+        if not isinstance(value_0, int):
+            errors.add(
+                (ref, 'some_number'),
+                "Expected an integer, but got: {}".format(
+                    type(value_0)))
+        else:
+            if not (value_0 >= 0):
+                errors.add(
+                    (ref, 'some_number'),
+                    'Expected >= 0, but got: {}'.format(
+                        value_0))
+            else:
+                parsed_some_number = value_0
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.OtherEmbed(
+        some_number=parsed_some_number)
+
+
+def other_embed_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.OtherEmbed]:
+    """
+    parses OtherEmbed from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _other_embed_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _other_embed_from_fast(
+        value: typing.Any
+) -> some.graph.OtherEmbed:
+    """
+    parses OtherEmbed optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse some_number
+    ##
+
+    value_1 = value['some_number']
+    if not isinstance(value_1, int):
+        raise TypeError("Expected an integer")
+    if not (value_1 >= 0):
+        raise ValueError('Expected >= 0')
+    parsed_some_number = value_1
+
+    return some.graph.OtherEmbed(
+        some_number=parsed_some_number)
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
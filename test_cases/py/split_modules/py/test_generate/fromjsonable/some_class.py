@@ -0,0 +1,427 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses SomeClass from JSONable objects."""
+
+
+import re
+import typing
+
+import some.graph
+import some.graph.parse
+
+
+def _some_class_construct(
+        value: typing.Any,
+        id: str,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeClass]:
+    """
+    parses SomeClass from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param other_classes_registry: registry of the OtherClass instances
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    parsed_some_optional_reference = None  # type: typing.Optional[some.graph.OtherClass]
+
+    ##
+    # Parse some_text
+    ##
+
+    value_0 = value.get(
+        'some_text',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_text')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_text'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        else:
+            if not re.match(
+                    r'^[a-z]+$',
+                    value_0):
+                errors.add(
+                    (ref, 'some_text'),
+                    'Expected to match ^[a-z]+$, but got: {}'.format(
+                        value_0))
+            else:
+                parsed_some_text = value_0
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_duration
+    ##
+
+    value_2 = value.get(
+        'some_duration',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_duration')
+    else:
+        if not isinstance(value_2, str):
+            errors.add(
+                (ref, 'some_duration'),
+                "Expected a string, but got: {}".format(
+                    type(value_2)))
+        else:
+            try:
+                parsed_some_duration = _duration_from_string(
+                    value_2)
+            except (ValueError, OverflowError) as err:
+                errors.add(
+                    (ref, 'some_duration'),
+                    str(err))
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_embed
+    ##
+
+    value_4 = value.get(
+        'some_embed',
+        None)
+
+    if value_4 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_embed')
+    else:
+        target_5 = _some_embed_from(
+            value_4,
+            (ref, 'some_embed'),
+            errors)
+        if target_5 is not None:
+            parsed_some_embed = target_5
+    if errors.full():
+        return None
+
+    ##
+    # Parse some_optional_reference
+    ##
+
+    value_6 = value.get(
+        'some_optional_reference',
+        None)
+
+    if value_6 is not None:
+        if not isinstance(value_6, str):
+            errors.add(
+                (ref, 'some_optional_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_6)))
+        else:
+            target_7 = other_classes_registry.get(
+                value_6,
+                None)
+            if target_7 is None:
+                errors.add(
+                    (ref, 'some_optional_reference'),
+                    'Reference to an instance of class Other_class not found: {}'.format(
+                        value_6))
+            else:
+                parsed_some_optional_reference = target_7
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.SomeClass(
+        id=id,
+        some_text=parsed_some_text,
+        some_duration=parsed_some_duration,
+        some_embed=parsed_some_embed,
+        some_optional_reference=parsed_some_optional_reference)
+
+
+def _some_class_from(
+        value: typing.Any,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        ref: some.graph.parse.Ref,
+        target: some.graph.SomeClass,
+        errors: some.graph.parse.Errors
+) -> None:
+    """
+    parses SomeClass from a JSONable value.
+
+    If ``errors``, the attributes of ``target`` have undefined values.
+
+    :param value: JSONable value
+    :param other_classes_registry: registry of the OtherClass instances
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param target: parsed ``value`` as SomeClass
+    :param errors: errors encountered during parsing
+    :return:
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return
+
+    ##
+    # Parse some_text
+    ##
+
+    value_0 = value.get(
+        'some_text',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_text')
+    else:
+        if not isinstance(value_0, str):
+            errors.add(
+                (ref, 'some_text'),
+                "Expected a string, but got: {}".format(
+                    type(value_0)))
+        else:
+            if not re.match(
+                    r'^[a-z]+$',
+                    value_0):
+                errors.add(
+                    (ref, 'some_text'),
+                    'Expected to match ^[a-z]+$, but got: {}'.format(
+                        value_0))
+            else:
+                target.some_text = value_0
+    if errors.full():
+        return
+
+    ##
+    # Parse some_duration
+    ##
+
+    value_2 = value.get(
+        'some_duration',
+        None)
+
+    if value_2 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_duration')
+    else:
+        if not isinstance(value_2, str):
+            errors.add(
+                (ref, 'some_duration'),
+                "Expected a string, but got: {}".format(
+                    type(value_2)))
+        else:
+            try:
+                target.some_duration = _duration_from_string(
+                    value_2)
+            except (ValueError, OverflowError) as err:
+                errors.add(
+                    (ref, 'some_duration'),
+                    str(err))
+    if errors.full():
+        return
+
+    ##
+    # Parse some_embed
+    ##
+
+    value_4 = value.get(
+        'some_embed',
+        None)
+
+    if value_4 is None:
+        errors.add(
+            ref,
+            'Property is missing: some_embed')
+    else:
+        target_5 = _some_embed_from(
+            value_4,
+            (ref, 'some_embed'),
+            errors)
+        if target_5 is not None:
+            target.some_embed = target_5
+    if errors.full():
+        return
+
+    ##
+    # Parse some_optional_reference
+    ##
+
+    value_6 = value.get(
+        'some_optional_reference',
+        None)
+
+    if value_6 is not None:
+        if not isinstance(value_6, str):
+            errors.add(
+                (ref, 'some_optional_reference'),
+                "Expected a str, but got: {}".format(
+                    type(value_6)))
+        else:
+            target_7 = other_classes_registry.get(
+                value_6,
+                None)
+            if target_7 is None:
+                errors.add(
+                    (ref, 'some_optional_reference'),
+                    'Reference to an instance of class Other_class not found: {}'.format(
+                        value_6))
+            else:
+                target.some_optional_reference = target_7
+    if errors.full():
+        return
+
+
+def some_class_from(
+        value: typing.Any,
+        id: str,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass],
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeClass]:
+    """
+    parses SomeClass from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param other_classes_registry:
+        registry of the OtherClass instances
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _some_class_construct(
+        value=value,
+        id=id,
+        other_classes_registry=other_classes_registry,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _some_class_construct_fast(
+        value: typing.Any,
+        id: str,
+        other_classes_registry: typing.Mapping[
+            str,
+            some.graph.OtherClass]
+) -> some.graph.SomeClass:
+    """
+    parses SomeClass optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :param id: identifier of the instance
+    :param other_classes_registry: registry of the OtherClass instances
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    parsed_some_optional_reference = None  # type: typing.Optional[some.graph.OtherClass]
+
+    ##
+    # Parse some_text
+    ##
+
+    value_1 = value['some_text']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    if not re.match(
+            r'^[a-z]+$',
+            value_1):
+        raise ValueError('Expected to match ^[a-z]+$')
+    parsed_some_text = value_1
+
+    ##
+    # Parse some_duration
+    ##
+
+    value_3 = value['some_duration']
+    if not isinstance(value_3, str):
+        raise TypeError("Expected a string")
+    parsed_some_duration = _duration_from_string(
+        value_3)
+
+    ##
+    # Parse some_embed
+    ##
+
+    parsed_some_embed = _some_embed_from_fast(
+        value['some_embed'])
+
+    ##
+    # Parse some_optional_reference
+    ##
+
+    value_6 = value.get(
+        'some_optional_reference',
+        None)
+    if value_6 is not None:
+        parsed_some_optional_reference = other_classes_registry[
+            value_6]
+
+    return some.graph.SomeClass(
+        id=id,
+        some_text=parsed_some_text,
+        some_duration=parsed_some_duration,
+        some_embed=parsed_some_embed,
+        some_optional_reference=parsed_some_optional_reference)
+
+
+# The names of the other submodules are imported at the end so that
+# the submodules can refer to each other regardless of the import order.
+from some.graph.fromjsonable._common import _duration_from_string
+from some.graph.fromjsonable.some_embed import _some_embed_from
+from some.graph.fromjsonable.some_embed import _some_embed_from_fast
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
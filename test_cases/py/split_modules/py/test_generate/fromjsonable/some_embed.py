@@ -0,0 +1,130 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""parses SomeEmbed from JSONable objects."""
+
+
+import typing
+
+import some.graph
+import some.graph.parse
+
+
+def _some_embed_from(
+        value: typing.Any,
+        ref: some.graph.parse.Ref,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeEmbed]:
+    """
+    parses SomeEmbed from a JSONable value.
+
+    The properties are parsed into local variables and the instance is
+    constructed only once all of them have been parsed.
+
+    :param value: JSONable value
+    :param ref:
+        reference to the value (e.g., a lazy reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if parsing it added to ``errors``
+
+    """
+    if not isinstance(value, dict):
+        errors.add(
+            ref,
+            "Expected a dictionary, but got: {}".format(
+                type(value)))
+        return None
+
+    errors_count = errors.count()
+
+    ##
+    # Parse other_embed
+    ##
+
+    value_0 = value.get(
+        'other_embed',
+        None)
+
+    if value_0 is None:
+        errors.add(
+            ref,
+            'Property is missing: other_embed')
+    else:
+        target_1 = _other_embed_from(
+            value_0,
+            (ref, 'other_embed'),
+            errors)
+        if target_1 is not None:
+            parsed_other_embed = target_1
+    if errors.full():
+        return None
+
+    if errors.count() > errors_count:
+        return None
+
+    return some.graph.SomeEmbed(
+        other_embed=parsed_other_embed)
+
+
+def some_embed_from(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeEmbed]:
+    """
+    parses SomeEmbed from a JSONable value.
+
+    :param value: JSONable value
+    :param id: identifier of the instance
+    :param ref:
+        reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed instance, or None if ``errors``
+
+    """
+    target = _some_embed_from(
+        value=value,
+        ref=ref,
+        errors=errors)
+
+    if not errors.empty():
+       return None
+
+    return target
+
+
+def _some_embed_from_fast(
+        value: typing.Any
+) -> some.graph.SomeEmbed:
+    """
+    parses SomeEmbed optimistically from a JSONable value.
+
+    The instance is constructed once all the properties have been parsed.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed instance
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    ##
+    # Parse other_embed
+    ##
+
+    parsed_other_embed = _other_embed_from_fast(
+        value['other_embed'])
+
+    return some.graph.SomeEmbed(
+        other_embed=parsed_other_embed)
+
+
+# The names of the other submodules are imported at the end so that
+# the submodules can refer to each other regardless of the import order.
+from some.graph.fromjsonable.other_embed import _other_embed_from
+from some.graph.fromjsonable.other_embed import _other_embed_from_fast
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,62 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""serializes to JSONable objects."""
+
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    # The names are imported only for the type checkers. At run time,
+    # they are resolved by ``__getattr__`` on the first access.
+    from some.graph.tojsonable.some_class import (
+        serialize_some_class as serialize_some_class)
+    from some.graph.tojsonable.other_class import (
+        serialize_other_class as serialize_other_class)
+    from some.graph.tojsonable.some_embed import (
+        serialize_some_embed as serialize_some_embed)
+    from some.graph.tojsonable.other_embed import (
+        serialize_other_embed as serialize_other_embed)
+    from some.graph.tojsonable.some_graph import (
+        serialize_some_graph as serialize_some_graph,
+        write_some_graph_json as write_some_graph_json)
+
+# Names of the submodules defining the public names of this module
+_SUBMODULES = {
+    'serialize_some_class': 'some_class',
+    'serialize_other_class': 'other_class',
+    'serialize_some_embed': 'some_embed',
+    'serialize_other_embed': 'other_embed',
+    'serialize_some_graph': 'some_graph',
+    'write_some_graph_json': 'some_graph',
+}  # type: typing.Mapping[str, str]
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    imports the submodule defining the name on the first access.
+
+    :param name: name of the attribute
+    :return: the attribute
+    :raise AttributeError: if no submodule defines the name
+    """
+    submodule = _SUBMODULES.get(name, None)
+    if submodule is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+
+    value = getattr(
+        importlib.import_module('{}.{}'.format(__name__, submodule)), name)
+
+    # Cache the value so that __getattr__ is not called again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    """lists the names of this module including the ones of the submodules."""
+    return sorted(set(globals()) | set(_SUBMODULES))
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,42 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""serializes OtherClass to JSONable objects."""
+
+
+import collections
+import typing
+
+import some.graph
+
+
+def serialize_other_class(
+        instance: some.graph.OtherClass,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of OtherClass to a JSONable representation.
+
+    :param instance: the instance of OtherClass to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize some_date
+    ##
+
+    target['some_date'] = instance.some_date.strftime('%Y-%m-%d')
+
+    return target
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
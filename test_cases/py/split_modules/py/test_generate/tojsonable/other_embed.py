@@ -0,0 +1,42 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""serializes OtherEmbed to JSONable objects."""
+
+
+import collections
+import typing
+
+import some.graph
+
+
+def serialize_other_embed(
+        instance: some.graph.OtherEmbed,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of OtherEmbed to a JSONable representation.
+
+    :param instance: the instance of OtherEmbed to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize some_number
+    ##
+
+    target['some_number'] = instance.some_number
+
+    return target
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
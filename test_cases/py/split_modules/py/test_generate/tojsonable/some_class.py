@@ -0,0 +1,67 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""serializes SomeClass to JSONable objects."""
+
+
+import collections
+import typing
+
+import some.graph
+
+
+def serialize_some_class(
+        instance: some.graph.SomeClass,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of SomeClass to a JSONable representation.
+
+    :param instance: the instance of SomeClass to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize some_text
+    ##
+
+    target['some_text'] = instance.some_text
+
+    ##
+    # Serialize some_duration
+    ##
+
+    target['some_duration'] = _duration_to_string(instance.some_duration)
+
+    ##
+    # Serialize some_embed
+    ##
+
+    target['some_embed'] = serialize_some_embed(instance.some_embed)
+
+    ##
+    # Serialize some_optional_reference
+    ##
+
+    if instance.some_optional_reference is not None:
+        target['some_optional_reference'] = instance.some_optional_reference.id
+
+    return target
+
+
+# The names of the other submodules are imported at the end so that
+# the submodules can refer to each other regardless of the import order.
+from some.graph.tojsonable._common import _duration_to_string
+from some.graph.tojsonable.some_embed import serialize_some_embed
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
@@ -0,0 +1,47 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""serializes SomeEmbed to JSONable objects."""
+
+
+import collections
+import typing
+
+import some.graph
+
+
+def serialize_some_embed(
+        instance: some.graph.SomeEmbed,
+        ordered: bool = False
+) -> typing.MutableMapping[str, typing.Any]:
+    """
+    serializes an instance of SomeEmbed to a JSONable representation.
+
+    :param instance: the instance of SomeEmbed to be serialized
+    :param ordered:
+        If set, represents the instance as a ``collections.OrderedDict``.
+        Otherwise, it is represented as a ``dict``.
+    :return: a JSONable
+    """
+    if ordered:
+        target = (
+            collections.OrderedDict()
+        )  # type: typing.MutableMapping[str, typing.Any]
+    else:
+        target = dict()
+
+    ##
+    # Serialize other_embed
+    ##
+
+    target['other_embed'] = serialize_other_embed(instance.other_embed)
+
+    return target
+
+
+# The names of the other submodules are imported at the end so that
+# the submodules can refer to each other regardless of the import order.
+from some.graph.tojsonable.other_embed import serialize_other_embed
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
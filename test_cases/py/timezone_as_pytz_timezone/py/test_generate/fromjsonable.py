@@ -52,8 +52,7 @@ def some_graph_from(
     else:
         if not isinstance(value_0, str):
             errors.add(
-                '/'.join((
-                    ref, 'some_time_zone')),
+                (ref, 'some_time_zone'),
                 "Expected a string, but got: {}".format(
                     type(value_0)))
         else:
@@ -62,8 +61,7 @@ def some_graph_from(
                     value_0)
             except pytz.exceptions.UnknownTimeZoneError:
                 errors.add(
-                    '/'.join((
-                        ref, 'some_time_zone')),
+                    (ref, 'some_time_zone'),
                     "Expected a valid IANA time zone, but got: {}".format(
                         value_0))
 
@@ -74,3 +72,63 @@ def some_graph_from(
         return None
 
     return graph
+
+
+def _some_graph_from_fast(
+        value: typing.Any
+) -> some.graph.SomeGraph:
+    """
+    parses SomeGraph optimistically from a JSONable value.
+
+    :param value: JSONable value assumed to be valid
+    :return: parsed SomeGraph
+    :raise:
+        KeyError, TypeError, ValueError or OverflowError
+        if ``value`` is invalid
+    """
+    if not isinstance(value, dict):
+        raise TypeError("Expected a dictionary")
+
+    graph = some.graph.parse.placeholder_some_graph()
+
+    ##
+    # Parse some_time_zone
+    ##
+
+    value_1 = value['some_time_zone']
+    if not isinstance(value_1, str):
+        raise TypeError("Expected a string")
+    graph.some_time_zone = pytz.timezone(
+        value_1)
+
+    return graph
+
+
+def some_graph_from_fast(
+        value: typing.Any,
+        ref: str,
+        errors: some.graph.parse.Errors
+) -> typing.Optional[some.graph.SomeGraph]:
+    """
+    parses SomeGraph from a JSONable value assumed to be valid.
+
+    The value is first parsed optimistically without keeping track of
+    the reference paths and the errors. Only if the value turns out to be
+    invalid, it is parsed again with :py:func:`some_graph_from`
+    to collect the errors.
+
+    :param value: JSONable value
+    :param ref: reference to the value (e.g., a reference path)
+    :param errors: errors encountered during parsing
+    :return: parsed SomeGraph, or None if ``errors``
+    """
+    if errors.empty():
+        try:
+            return _some_graph_from_fast(value)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            pass
+
+    return some_graph_from(
+        value=value,
+        ref=ref,
+        errors=errors)
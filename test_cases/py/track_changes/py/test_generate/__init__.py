@@ -0,0 +1,280 @@
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
+
+
+"""defines some object graph."""
+
+
+import collections
+import itertools
+import typing
+
+
+# Revisions are drawn from a single counter so that the changes of all
+# the object graphs can be compared against a checkpoint.
+_REVISIONS = itertools.count(1)
+
+
+def checkpoint() -> int:
+    """
+    marks the point after which the changes are serialized by the deltas.
+
+    :return: revision to be passed as ``since`` to the delta serialization
+    """
+    return next(_REVISIONS)
+
+
+class TrackedRegistry(collections.OrderedDict):  # type: ignore
+    """
+    records the changes of a class registry.
+
+    The registry keeps the revision of the last change for each identifier of
+    an added, changed or removed instance in the order of the changes so that
+    the changes since a checkpoint are listed without visiting the unchanged
+    instances.
+
+    The instances notify the registry they were last inserted into whenever
+    their attributes are set. Call ``touch`` if you modify an attribute
+    in place (*e.g.*, append to a list).
+    """
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """initializes the registry recording the given instances as added."""
+        self.revisions = collections.OrderedDict(
+        )  # type: collections.OrderedDict[str, int]
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, id: str, instance: typing.Any) -> None:
+        """inserts the instance and records it as changed."""
+        super().__setitem__(id, instance)
+        object.__setattr__(instance, '_tracker', self)
+        self.touch(id)
+
+    def __delitem__(self, id: str) -> None:
+        """removes the instance and records it as removed."""
+        instance = self[id]
+        super().__delitem__(id)
+        if getattr(instance, '_tracker', None) is self:
+            object.__setattr__(instance, '_tracker', None)
+        self.touch(id)
+
+    def pop(self, id: str, *args: typing.Any) -> typing.Any:
+        """removes the instance and records it as removed."""
+        if args and id not in self:
+            return args[0]
+
+        instance = self[id]
+        del self[id]
+        return instance
+
+    def popitem(self, last: bool = True) -> typing.Tuple[str, typing.Any]:
+        """removes the last or the first instance and records it as removed."""
+        if not self:
+            raise KeyError('dictionary is empty')
+
+        id = next(reversed(self)) if last else next(iter(self))
+        return id, self.pop(id)
+
+    def clear(self) -> None:
+        """removes all the instances and records them as removed."""
+        for id in list(self):
+            del self[id]
+
+    def touch(self, id: str) -> None:
+        """
+        records that the instance has been changed.
+
+        :param id: identifier of the instance
+        """
+        self.revisions[id] = next(_REVISIONS)
+        self.revisions.move_to_end(id)
+
+    def changed_since(self, since: int) -> typing.List[str]:
+        """
+        lists the identifiers of the instances changed after the checkpoint.
+
+        :param since: revision given by ``checkpoint()``
+        :return:
+            identifiers of the added, changed and removed instances
+            in the order of the changes
+        """
+        result = []  # type: typing.List[str]
+        for id in reversed(self.revisions):
+            if self.revisions[id] <= since:
+                break
+
+            result.append(id)
+
+        result.reverse()
+        return result
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """pickles the instances without the revisions."""
+        return (self.__class__, (), None, None, iter(self.items()))
+
+
+class SomeClass:
+    """defines some class."""
+
+    __slots__ = (
+        'id',
+        'some_text',
+        'some_array',
+        'some_embed',
+        'some_optional_reference',
+        '_tracker',
+    )
+
+    def __init__(
+            self,
+            id: str,
+            some_text: str,
+            some_array: typing.List[int],
+            some_embed: 'SomeEmbed',
+            some_optional_reference: typing.Optional['OtherClass'] = None) -> None:
+        """
+        initializes an instance of SomeClass with the given values.
+
+        :param id: identifier of the instance:param some_text: defines some text.
+        :param some_array: defines some array.
+        :param some_embed: defines some embed.
+        :param some_optional_reference: defines some optional reference to an instance.
+
+        """
+        self.id = id
+        self.some_text = some_text
+        self.some_array = some_array
+        self.some_embed = some_embed
+        self.some_optional_reference = some_optional_reference if some_optional_reference is not None else None
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """sets the attribute and records the change in the registry."""
+        object.__setattr__(self, name, value)
+
+        tracker = getattr(self, '_tracker', None)
+        if tracker is not None:
+            tracker.touch(self.id)
+
+
+class OtherClass:
+    """defines other class."""
+
+    __slots__ = (
+        'id',
+        '_tracker',
+    )
+
+    def __init__(
+            self,
+            id: str) -> None:
+        """
+        initializes an instance of OtherClass with the given values.
+
+        :param id: identifier of the instance
+        """
+        self.id = id
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """sets the attribute and records the change in the registry."""
+        object.__setattr__(self, name, value)
+
+        tracker = getattr(self, '_tracker', None)
+        if tracker is not None:
+            tracker.touch(self.id)
+
+
+class SomeEmbed:
+    """defines some embeddable structure."""
+
+    __slots__ = (
+        'some_number',
+    )
+
+    def __init__(
+            self,
+            some_number: int) -> None:
+        """
+        initializes an instance of SomeEmbed with the given values.
+
+        :param some_number: defines some number.
+
+        """
+        self.some_number = some_number
+
+
+class SomeGraph:
+    """defines some object graph."""
+
+    __slots__ = (
+        'some_reference',
+        'some_optional_number',
+        'some_classes',
+        'other_classes',
+        '_revision',
+    )
+
+    def __init__(
+            self,
+            some_reference: SomeClass,
+            some_optional_number: typing.Optional[int] = None,
+            some_classes: typing.Optional[typing.MutableMapping[str, SomeClass]] = None,
+            other_classes: typing.Optional[typing.MutableMapping[str, OtherClass]] = None) -> None:
+        """
+        initializes an instance of SomeGraph with the given values.
+
+        The class registries are initialized with empty ordered dictionaries.
+        :param some_reference: defines some reference to an instance.
+        :param some_optional_number: defines some optional number.
+        :param some_classes:
+            registry of instances of SomeClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+        :param other_classes:
+            registry of instances of OtherClass;
+            if not specified, it is initialized as a ``collections.OrderedDict``.
+
+        """
+        self.some_reference = some_reference
+        self.some_optional_number = some_optional_number if some_optional_number is not None else None
+
+        if some_classes is not None:
+            self.some_classes = some_classes
+        else:
+            self.some_classes = collections.OrderedDict()
+
+        if other_classes is not None:
+            self.other_classes = other_classes
+        else:
+            self.other_classes = collections.OrderedDict()
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """
+        sets the attribute and records the change.
+
+        The class registries given as dictionaries are converted to
+        TrackedRegistry. Replacing a registry records all its instances
+        as changed and the instances missing from it as removed.
+        """
+        if name not in (
+                'some_classes',
+                'other_classes',
+        ):
+            object.__setattr__(self, name, value)
+            object.__setattr__(self, '_revision', next(_REVISIONS))
+            return
+
+        previous = getattr(self, name, None)
+        if isinstance(value, dict) and value is not previous:
+            if isinstance(value, TrackedRegistry):
+                for id in value:
+                    value.touch(id)
+            else:
+                value = TrackedRegistry(value)
+
+            if previous is not None:
+                for id in previous:
+                    if id not in value:
+                        value.touch(id)
+
+        object.__setattr__(self, name, value)
+
+
+# File automatically generated by mapry. DO NOT EDIT OR APPEND!
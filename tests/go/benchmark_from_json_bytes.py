@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark parsing the generated Go object graph directly from JSON bytes."""
+
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+from typing import Optional
+
+import temppathlib
+
+import mapry.go.generate.fromjsonable
+import mapry.go.generate.fromjsonbytes
+import mapry.go.generate.parse
+import mapry.go.generate.types
+import mapry.parse
+import tests.path
+
+_BENCHMARK_CODE = textwrap.dedent(
+    '''\
+    package address
+
+    import (
+        "encoding/json"
+        "io/ioutil"
+        "testing"
+    )
+
+    func readData(b *testing.B) []byte {
+        data, err := ioutil.ReadFile("pipeline.json")
+        if err != nil {
+            b.Fatal(err)
+        }
+        return data
+    }
+
+    func BenchmarkUnmarshalFromJSONable(b *testing.B) {
+        data := readData(b)
+        b.SetBytes(int64(len(data)))
+        b.ReportAllocs()
+        b.ResetTimer()
+
+        for i := 0; i < b.N; i++ {
+            var value interface{}
+            err := json.Unmarshal(data, &value)
+            if err != nil {
+                b.Fatal(err)
+            }
+
+            pipeline := &Pipeline{}
+            errors := NewErrors(0)
+            PipelineFromJSONable(value, "#", pipeline, errors)
+            if !errors.Empty() {
+                b.Fatal(errors.Values()[0].Message)
+            }
+        }
+    }
+
+    func BenchmarkFromJSONBytes(b *testing.B) {
+        data := readData(b)
+        b.SetBytes(int64(len(data)))
+        b.ReportAllocs()
+        b.ResetTimer()
+
+        for i := 0; i < b.N; i++ {
+            pipeline := &Pipeline{}
+            errors := NewErrors(0)
+            PipelineFromJSONBytes(data, "#", pipeline, errors)
+            if !errors.Empty() {
+                b.Fatal(errors.Values()[0].Message)
+            }
+        }
+    }
+    ''')
+
+
+def generate_text(count: int) -> str:
+    """
+    Generate the JSON text of an address book with the given number of persons.
+
+    :param count: number of persons
+    :return: JSON text
+    """
+    persons = dict()
+    for i in range(count):
+        persons['person{}'.format(i)] = {
+            'full_name':
+            'Person Number {}'.format(i),
+            'birthday':
+            '{:04d}-{:02d}-{:02d}'.format(
+                1950 + i % 60, 1 + i % 12, 1 + i % 28),
+            'address': {
+                'text': 'Some street {}, Some City, Some Country'.format(i)
+            }
+        }
+
+    return json.dumps({'persons': persons, 'maintainer': 'person0'})
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of persons in the address book",
+        type=int,
+        default=100000)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the package is generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = (
+        tests.path.REPO_DIR /
+        "test_cases/docs/schema/introductory_example/schema.json")
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.go is not None, \
+        "Expected Go settings in the schema: {}".format(schema_pth)
+
+    graph = schema.graph
+    go = schema.go
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        package_dir = tmp_dir.path / "src" / go.package
+        package_dir.mkdir(exist_ok=True, parents=True)
+
+        (package_dir / 'types.go').write_text(
+            mapry.go.generate.types.generate(graph=graph, go=go))
+
+        (package_dir / 'parse.go').write_text(
+            mapry.go.generate.parse.generate(go=go))
+
+        (package_dir / 'from_jsonable.go').write_text(
+            mapry.go.generate.fromjsonable.generate(graph=graph, go=go))
+
+        (package_dir / 'from_json_bytes.go').write_text(
+            mapry.go.generate.fromjsonbytes.generate(graph=graph, go=go))
+
+        (package_dir / 'benchmark_test.go').write_text(_BENCHMARK_CODE)
+
+        (package_dir / 'pipeline.json').write_text(generate_text(count=count))
+
+        env = os.environ.copy()
+        env['GOPATH'] = str(tmp_dir.path)
+        env['GO111MODULE'] = 'off'
+
+        print("Parsing {} persons:".format(count))
+        sys.stdout.flush()
+
+        subprocess.check_call(
+            ['go', 'test', '-run', '^$', '-bench', '.', '-benchmem', '.'],
+            cwd=str(package_dir),
+            env=env)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Benchmark parsing time zones in Go with and without the location cache."""
+
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+from typing import Any, Dict, Optional
+
+import temppathlib
+
+import mapry.go.generate.fromjsonable
+import mapry.go.generate.parse
+import mapry.go.generate.types
+import mapry.parse
+
+_TIME_ZONES = [
+    "Europe/Zurich", "Europe/London", "America/New_York", "America/Chicago",
+    "Asia/Tokyo", "Asia/Kolkata", "Australia/Sydney", "Africa/Cairo",
+    "America/Sao_Paulo", "UTC"
+]
+
+_BENCHMARK_CODE = textwrap.dedent(
+    '''\
+    package calendar
+
+    import (
+        "encoding/json"
+        "io/ioutil"
+        "testing"
+    )
+
+    func BenchmarkCalendarFromJSONable(b *testing.B) {
+        data, err := ioutil.ReadFile("calendar.json")
+        if err != nil {
+            b.Fatal(err)
+        }
+
+        var value interface{}
+        err = json.Unmarshal(data, &value)
+        if err != nil {
+            b.Fatal(err)
+        }
+
+        b.ReportAllocs()
+        b.ResetTimer()
+
+        for i := 0; i < b.N; i++ {
+            calendar := &Calendar{}
+            errors := NewErrors(0)
+            CalendarFromJSONable(value, "#", calendar, errors)
+            if !errors.Empty() {
+                b.Fatal(errors.Values()[0].Message)
+            }
+        }
+    }
+    ''')
+
+
+def generate_schema() -> Dict[str, Any]:
+    """
+    Generate the schema of an object graph with many time zones.
+
+    :return: JSONable schema
+    """
+    return {
+        "name":
+        "Calendar",
+        "description":
+        "defines a calendar of meetings.",
+        "go": {
+            "package": "calendar"
+        },
+        "classes": [{
+            "name": "Meeting",
+            "description": "defines a meeting.",
+            "properties": {
+                "time_zone": {
+                    "type": "time_zone",
+                    "description": "indicates where the meeting takes place."
+                }
+            }
+        }]
+    }
+
+
+def generate_text(count: int) -> str:
+    """
+    Generate the JSON text of a calendar with the given number of meetings.
+
+    :param count: number of meetings
+    :return: JSON text
+    """
+    meetings = dict()
+    for i in range(count):
+        meetings['meeting{}'.format(i)] = {
+            'time_zone': _TIME_ZONES[i % len(_TIME_ZONES)]
+        }
+
+    return json.dumps({'meetings': meetings})
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", help="number of meetings", type=int, default=100000)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the packages are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema = mapry.parse.schema_from_mapping(mapping=generate_schema(), ref='#')
+    assert schema.go is not None
+
+    graph = schema.graph
+    go = schema.go
+
+    text = generate_text(count=count)
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        from_jsonable = mapry.go.generate.fromjsonable.generate(
+            graph=graph, go=go)
+
+        # Emulate the code generated before the locations were cached.
+        uncached_from_jsonable = from_jsonable.replace(
+            ':= loadLocation(', ':= time.LoadLocation(')
+        assert uncached_from_jsonable != from_jsonable
+
+        for name, code in [("uncached", uncached_from_jsonable),
+                           ("cached", from_jsonable)]:
+            package_dir = tmp_dir.path / "src" / name / go.package
+            package_dir.mkdir(exist_ok=True, parents=True)
+
+            (package_dir / 'types.go').write_text(
+                mapry.go.generate.types.generate(graph=graph, go=go))
+
+            (package_dir / 'parse.go').write_text(
+                mapry.go.generate.parse.generate(go=go))
+
+            (package_dir / 'from_jsonable.go').write_text(code)
+
+            (package_dir / 'benchmark_test.go').write_text(_BENCHMARK_CODE)
+
+            (package_dir / 'calendar.json').write_text(text)
+
+            env = os.environ.copy()
+            env['GOPATH'] = str(tmp_dir.path)
+            env['GO111MODULE'] = 'off'
+
+            print("Parsing {} meetings {}:".format(count, name))
+            sys.stdout.flush()
+
+            subprocess.check_call(
+                ['go', 'test', '-run', '^$', '-bench', '.', '-benchmem', '.'],
+                cwd=str(package_dir),
+                env=env)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
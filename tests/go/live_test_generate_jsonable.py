@@ -14,9 +14,11 @@ import temppathlib
 import mapry
 import mapry.go.generate
 import mapry.go.generate.fromjsonable
+import mapry.go.generate.fromjsonbytes
 import mapry.go.generate.parse
 import mapry.go.generate.tojsonable
 import mapry.go.generate.types
+import mapry.go.generate.writejson
 import mapry.go.jinja2_env
 import mapry.go.validation
 import mapry.parse
@@ -30,11 +32,15 @@ package main
     graph.name|ucamel_case }} as a JSON file.
 
 import (
+    "bytes"
     "flag"
     "fmt"
     "encoding/json"
+    "io/ioutil"
     "os"
     "path/filepath"
+    "reflect"
+    "sort"
 
     {{ "parse_serialize/%s"|format(package)|escaped_str }}
 )
@@ -67,6 +73,16 @@ func read(pth string) (value interface{}, err error) {
     return
 }
 
+// messages lists the errors sorted so that they can be compared.
+func messages(errors *{{ package }}.Errors) []string {
+    result := []string{}
+    for _, e := range errors.Values() {
+        result = append(result, fmt.Sprintf("%s: %s", e.Ref, e.Message))
+    }
+    sort.Strings(result)
+    return result
+}
+
 func main() {
     os.Exit(func() int {
         flag.Parse()
@@ -94,6 +110,52 @@ func main() {
             instance,
             errors)
 
+        data, err := ioutil.ReadFile(*path)
+        if err != nil {
+            fmt.Fprintf(
+                os.Stderr,
+                "failed to read the file %s: %s\\n",
+                filepath.Base(*path), err.Error())
+            return 1
+        }
+
+        bytesInstance := &{{ package }}.{{ graph.name|ucamel_case }}{}
+        bytesErrors := {{ package }}.NewErrors(0)
+
+        {{ package }}.{{ graph.name|ucamel_case }}FromJSONBytes(
+            data,
+            "#",
+            bytesInstance,
+            bytesErrors)
+
+        if !reflect.DeepEqual(messages(errors), messages(bytesErrors)) {
+            fmt.Fprintf(
+                os.Stderr,
+                "parsing from JSON bytes gave different errors: %#v\\n",
+                messages(bytesErrors))
+            return 1
+        }
+        {% if graph.classes %}
+
+        parallelInstance := &{{ package }}.{{ graph.name|ucamel_case }}{}
+        parallelErrors := {{ package }}.NewErrors(0)
+
+        {{ package }}.{{ graph.name|ucamel_case }}FromJSONableParallel(
+            value,
+            "#",
+            parallelInstance,
+            parallelErrors,
+            3)
+
+        if !reflect.DeepEqual(messages(errors), messages(parallelErrors)) {
+            fmt.Fprintf(
+                os.Stderr,
+                "parsing in parallel gave different errors: %#v\\n",
+                messages(parallelErrors))
+            return 1
+        }
+        {% endif %}{# /if graph.classes #}
+
         if !errors.Empty() {
             ee := errors.Values()
             for i := 0; i < len(ee); i++ {
@@ -110,7 +172,6 @@ func main() {
         jsonable, err = {{ package }}.{{ graph.name|ucamel_case }}ToJSONable(
             instance)
 
-        var data []byte
         data, err = json.MarshalIndent(jsonable, "", "  ")
         if err != nil {
             fmt.Fprintf(
@@ -119,6 +180,111 @@ func main() {
                 err.Error())
             return 1
         }
+
+        var bytesJsonable map[string]interface{}
+        bytesJsonable, err = {{ package }}.{{
+            graph.name|ucamel_case }}ToJSONable(bytesInstance)
+
+        var bytesData []byte
+        bytesData, err = json.MarshalIndent(bytesJsonable, "", "  ")
+        if err != nil {
+            fmt.Fprintf(
+                os.Stderr,
+                "failed to marshal the jsonable parsed from bytes: %s\\n",
+                err.Error())
+            return 1
+        }
+
+        if string(data) != string(bytesData) {
+            fmt.Fprintf(
+                os.Stderr,
+                "parsing from JSON bytes gave a different instance: %s\\n",
+                string(bytesData))
+            return 1
+        }
+        {% if graph.classes %}
+
+        var parallelJsonable map[string]interface{}
+        parallelJsonable, err = {{ package }}.{{
+            graph.name|ucamel_case }}ToJSONableParallel(parallelInstance, 3)
+        if err != nil {
+            fmt.Fprintf(
+                os.Stderr,
+                "failed to convert to the jsonable in parallel: %s\\n",
+                err.Error())
+            return 1
+        }
+
+        var parallelData []byte
+        parallelData, err = json.MarshalIndent(parallelJsonable, "", "  ")
+        if err != nil {
+            fmt.Fprintf(
+                os.Stderr,
+                "failed to marshal the jsonable converted in parallel: %s\\n",
+                err.Error())
+            return 1
+        }
+
+        if string(data) != string(parallelData) {
+            fmt.Fprintf(
+                os.Stderr,
+                "parsing and converting in parallel gave " +
+                    "a different instance: %s\\n",
+                string(parallelData))
+            return 1
+        }
+        {% endif %}{# /if graph.classes #}
+
+        var compact []byte
+        compact, err = json.Marshal(jsonable)
+        if err != nil {
+            fmt.Fprintf(
+                os.Stderr,
+                "failed to marshal the jsonable compactly: %s\\n",
+                err.Error())
+            return 1
+        }
+
+        written := &bytes.Buffer{}
+        err = {{ package }}.{{ graph.name|ucamel_case }}WriteJSON(
+            written, instance)
+        if err != nil {
+            fmt.Fprintf(
+                os.Stderr,
+                "failed to write the instance as JSON: %s\\n",
+                err.Error())
+            return 1
+        }
+
+        if written.String() != string(compact) {
+            fmt.Fprintf(
+                os.Stderr,
+                "writing JSON gave %s, but marshalling the jsonable gave %s\\n",
+                written.String(), string(compact))
+            return 1
+        }
+        {% if graph.classes %}
+
+        parallelWritten := &bytes.Buffer{}
+        err = {{ package }}.{{ graph.name|ucamel_case }}WriteJSONParallel(
+            parallelWritten, instance, 3)
+        if err != nil {
+            fmt.Fprintf(
+                os.Stderr,
+                "failed to write the instance as JSON in parallel: %s\\n",
+                err.Error())
+            return 1
+        }
+
+        if parallelWritten.String() != string(compact) {
+            fmt.Fprintf(
+                os.Stderr,
+                "writing JSON in parallel gave %s, " +
+                    "but marshalling the jsonable gave %s\\n",
+                parallelWritten.String(), string(compact))
+            return 1
+        }
+        {% endif %}{# /if graph.classes #}
         os.Stdout.Write(data)
         os.Stdout.Sync()
 
@@ -238,9 +404,15 @@ def execute_case(case: Case, gopath: pathlib.Path) -> None:
     (src_dir / "parse_serialize" / go.package / 'fromjsonable.go').write_text(
         mapry.go.generate.fromjsonable.generate(graph=graph, go=go))
 
+    (src_dir / "parse_serialize" / go.package / 'fromjsonbytes.go').write_text(
+        mapry.go.generate.fromjsonbytes.generate(graph=graph, go=go))
+
     (src_dir / "parse_serialize" / go.package / 'tojsonable.go').write_text(
         mapry.go.generate.tojsonable.generate(graph=graph, go=go))
 
+    (src_dir / "parse_serialize" / go.package / 'writejson.go').write_text(
+        mapry.go.generate.writejson.generate(graph=graph, go=go))
+
     (src_dir / "parse_serialize" / "main.go").write_text(
         generate_parse_serialize(graph=graph, go=go))
     (src_dir / "parse_serialize" / "main.go").chmod(mode=0o755)
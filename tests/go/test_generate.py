@@ -8,10 +8,13 @@ import unittest
 import mapry.go.generate
 import mapry.go.generate.fromjsonable
 import mapry.go.generate.fromjsonable_test
+import mapry.go.generate.fromjsonbytes
 import mapry.go.generate.parse
+import mapry.go.generate.synthetic_test
 import mapry.go.generate.tojsonable
 import mapry.go.generate.tojsonable_test
 import mapry.go.generate.types
+import mapry.go.generate.writejson
 import mapry.go.validation
 import mapry.parse
 import tests.path
@@ -59,12 +62,22 @@ class TestGenerate(unittest.TestCase):
                  mapry.go.generate.fromjsonable_test.generate(
                      graph=graph, go=go)),
 
+                ('from_json_bytes.go',
+                 mapry.go.generate.fromjsonbytes.generate(graph=graph, go=go)),
+
                 ('to_jsonable.go',
                  mapry.go.generate.tojsonable.generate(graph=graph, go=go)),
 
                 ('to_jsonable_test.go',
                  mapry.go.generate.tojsonable_test.generate(
                      graph=graph, go=go)),
+
+                ('write_json.go',
+                 mapry.go.generate.writejson.generate(graph=graph, go=go)),
+
+                ('synthetic_test.go',
+                 mapry.go.generate.synthetic_test.generate(
+                     graph=graph, go=go)),
             ])
             # yapf: enable
 
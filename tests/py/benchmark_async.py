@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark how long the generated Python parsing blocks the event loop."""
+
+import argparse
+import asyncio
+import importlib
+import json
+import pathlib
+import sys
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_slots_memory
+
+
+async def measure(func: Callable[[], Awaitable[Any]]) -> Tuple[float, float]:
+    """
+    Measure the run time and the longest stall of the event loop.
+
+    A concurrent task wakes up as often as possible and records the longest
+    time it had to wait.
+
+    :param func: coroutine function to be measured
+    :return: run time and the longest stall in seconds
+    """
+    stalls = []  # type: List[float]
+    done = False
+
+    async def tick() -> None:
+        """Record the time between the wake-ups."""
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            stalls.append(now - last)
+            last = now
+
+    ticker = asyncio.ensure_future(tick())
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    result = await func()
+    duration = time.perf_counter() - start
+
+    done = True
+    await ticker
+
+    assert result is not None, "Expected the parsing to succeed."
+    return duration, max(stalls)
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of persons in the address book",
+        type=int,
+        default=100000)
+    parser.add_argument(
+        "--budget",
+        help="number of instances processed before yielding",
+        type=int,
+        default=1000)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the module is generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    budget = int(args.budget)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = (
+        tests.path.REPO_DIR /
+        "test_cases/docs/schema/introductory_example/schema.json")
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+    schema.py.coroutines = True
+
+    value = json.loads(
+        tests.py.benchmark_slots_memory.generate_text(count=count))
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        parse = importlib.import_module(schema.py.module_name + '.parse')
+        fromjsonable = importlib.import_module(
+            schema.py.module_name + '.fromjsonable')
+
+        async def synchronous() -> Any:
+            """Parse the graph without yielding."""
+            return fromjsonable.pipeline_from(
+                value=value, ref='#', errors=parse.Errors(cap=10))
+
+        async def cooperative() -> Any:
+            """Parse the graph yielding after every ``budget`` instances."""
+            return await fromjsonable.pipeline_from_async(
+                value=value,
+                ref='#',
+                errors=parse.Errors(cap=10),
+                budget=budget)
+
+        print("Parsing {} persons (budget: {}):".format(count, budget))
+
+        for name, func in [("pipeline_from", synchronous),
+                           ("pipeline_from_async", cooperative)]:
+            duration, stall = asyncio.run(measure(func=func))
+            print(
+                "  {:<20} total {:8.3f} s, longest stall {:8.4f} s".format(
+                    name, duration, stall))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
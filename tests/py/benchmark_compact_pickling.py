@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Benchmark pickling the generated Python classes with and without tuples."""
+
+import argparse
+import importlib
+import pathlib
+import pickle
+import sys
+import time
+from typing import Any, Mapping, Optional, Tuple
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_slots_memory
+
+
+def generate_value(count: int) -> Mapping[str, Any]:
+    """
+    Generate a JSONable of the ``py/compact_pickling`` test case.
+
+    :param count: number of instances of the classes
+    :return: JSONable
+    """
+    some_classes = {
+        'some_instance_{}'.format(i): {
+            'some_text':
+            'some text {}'.format(i),
+            'some_embed': {
+                'reference_to_other_class': 'other_instance_{}'.format(i),
+                'empty': {}
+            },
+            # Pair up the instances so that they refer to each other.
+            'some_optional_reference':
+            'some_instance_{}'.format(min(i ^ 1, count - 1))
+        }
+        for i in range(count)
+    }
+
+    other_classes = {
+        'other_instance_{}'.format(i): {}
+        for i in range(count)
+    }  # type: Mapping[str, Any]
+
+    return {
+        'some_classes': some_classes,
+        'other_classes': other_classes,
+        'some_property': {
+            'reference_to_other_class': 'other_instance_0',
+            'empty': {}
+        }
+    }
+
+
+def measure(module_name: str, value: Any,
+            repeats: int) -> Tuple[int, float, float]:
+    """
+    Measure the size of the pickle and the best run times of the round trip.
+
+    :param module_name: name of the generated module
+    :param value: JSONable to be parsed and pickled
+    :param repeats: number of runs
+    :return: size in bytes, best dumping time and best loading time in seconds
+    """
+    parse = importlib.import_module(module_name + '.parse')
+    fromjsonable = importlib.import_module(module_name + '.fromjsonable')
+
+    errors = parse.Errors(cap=10)
+    graph = fromjsonable.some_graph_from(value=value, ref='#', errors=errors)
+    assert errors.empty(), "Expected no errors, but got: {}".format([
+        (error.ref, error.message) for error in errors.values()
+    ])
+
+    data = b''
+    best_dump = None  # type: Optional[float]
+    best_load = None  # type: Optional[float]
+    for _ in range(repeats):
+        start = time.perf_counter()
+        data = pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL)
+        duration = time.perf_counter() - start
+
+        if best_dump is None or duration < best_dump:
+            best_dump = duration
+
+        start = time.perf_counter()
+        loaded = pickle.loads(data)
+        duration = time.perf_counter() - start
+
+        if best_load is None or duration < best_load:
+            best_load = duration
+
+    # The references need to point to the unpickled instances.
+    for instance in loaded.some_classes.values():
+        assert (
+            instance.some_optional_reference is
+            loaded.some_classes[instance.some_optional_reference.id])
+        assert (
+            instance.some_embed.reference_to_other_class is loaded.
+            other_classes[instance.some_embed.reference_to_other_class.id])
+
+    assert best_dump is not None
+    assert best_load is not None
+    return len(data), best_dump, best_load
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of instances per class",
+        type=int,
+        default=100000)
+    parser.add_argument("--repeats", help="number of runs", type=int, default=5)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the modules are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = (
+        tests.path.REPO_DIR / "test_cases/py/compact_pickling/schema.json")
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+
+    value = generate_value(count=count)
+
+    variants = [
+        ('default', False, False),
+        ('compact', False, True),
+        ('default with slots', True, False),
+        ('compact with slots', True, True),
+    ]
+
+    print(
+        "Pickling {} instances per class, best of {} runs:".format(
+            count, repeats))
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+        sys.path.insert(0, str(src_dir))
+
+        for i, (name, slots, compact_pickling) in enumerate(variants):
+            schema.py.module_name = "variant{}.graph".format(i)
+            schema.py.slots = slots
+            schema.py.compact_pickling = compact_pickling
+            tests.py.benchmark_slots_memory.generate_module(
+                graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+            size, dump, load = measure(
+                module_name=schema.py.module_name, value=value, repeats=repeats)
+
+            print(
+                "  {:<20} {:8.1f} MB, dumps {:.3f} s, loads {:.3f} s".format(
+                    name, size / 1024 / 1024, dump, load))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
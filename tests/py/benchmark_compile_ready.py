@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Benchmark the generated Python code interpreted and compiled with mypyc."""
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+from typing import List, Optional
+
+import temppathlib
+
+import mapry.parse
+import mapry.py.generate.build_native
+import mapry.py.naming
+import tests.path
+import tests.py.benchmark_slots_memory
+
+_MEASURE_CODE = textwrap.dedent(
+    '''\
+    import importlib
+    import json
+    import sys
+    import time
+
+    module_name, graph_variable, repeats = sys.argv[1:4]
+    paths = sys.argv[4:]
+
+    parse = importlib.import_module(module_name + '.parse')
+    fromjsonable = importlib.import_module(module_name + '.fromjsonable')
+    tojsonable = importlib.import_module(module_name + '.tojsonable')
+
+    graph_from = getattr(fromjsonable, graph_variable + '_from')
+    serialize_graph = getattr(tojsonable, 'serialize_' + graph_variable)
+
+    values = []
+    for path in paths:
+        with open(path, 'rt') as fid:
+            values.append(json.load(fid))
+
+    start = time.perf_counter()
+    for _ in range(int(repeats)):
+        for value in values:
+            errors = parse.Errors(cap=10)
+            graph = graph_from(value, '#', errors)
+            assert errors.empty()
+            serialize_graph(graph)
+
+    print(time.perf_counter() - start)
+    ''')
+
+
+def measure(
+        src_dir: pathlib.Path, module_name: str, graph_variable: str,
+        example_paths: List[pathlib.Path], repeats: int) -> float:
+    """
+    Measure the time to parse and serialize the examples in a fresh process.
+
+    :param src_dir: directory where the module is generated
+    :param module_name: name of the generated module
+    :param graph_variable: Python variable name of the object graph
+    :param example_paths: paths to the valid examples
+    :param repeats: number of times the examples are parsed and serialized
+    :return: run time in seconds
+    """
+    out = subprocess.check_output([
+        sys.executable, '-c', _MEASURE_CODE, module_name, graph_variable,
+        str(repeats)
+    ] + [str(pth) for pth in example_paths],
+                                  cwd=str(src_dir),
+                                  universal_newlines=True)
+
+    return float(out.strip())
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeats",
+        help="number of times the examples of a test case are parsed "
+        "and serialized",
+        type=int,
+        default=1000)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the modules are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    test_cases_dir = tests.path.REPO_DIR / "test_cases"
+
+    total_interpreted = 0.0
+    total_compiled = 0.0
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        print(
+            "Parsing and serializing the valid examples {} times:".format(
+                repeats))
+
+        for schema_pth in sorted(test_cases_dir.glob("**/schema.json")):
+            case_dir = schema_pth.parent
+            rel_pth = case_dir.relative_to(test_cases_dir)
+
+            example_paths = sorted(case_dir.glob("example_ok*.json"))
+            if not example_paths:
+                continue
+
+            schema = mapry.parse.schema_from_json_file(path=schema_pth)
+            if schema.py is None or schema.py.split_modules:
+                continue
+
+            schema.py.compile_ready = True
+            graph_variable = mapry.py.naming.as_variable(
+                identifier=schema.graph.name)
+
+            interpreted_dir = tmp_dir.path / "interpreted" / rel_pth
+            compiled_dir = tmp_dir.path / "compiled" / rel_pth
+
+            for src_dir in [interpreted_dir, compiled_dir]:
+                tests.py.benchmark_slots_memory.generate_module(
+                    graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+            build_pth = compiled_dir / os.path.join(
+                *schema.py.module_name.split('.')) / 'build_native.py'
+            build_pth.write_text(
+                mapry.py.generate.build_native.generate(
+                    graph=schema.graph, py=schema.py))
+
+            try:
+                subprocess.check_output(
+                    [sys.executable, str(build_pth)],
+                    cwd=str(compiled_dir),
+                    stderr=subprocess.STDOUT)
+            except subprocess.CalledProcessError as err:
+                errors = [
+                    line for line in err.output.decode().splitlines()
+                    if 'error:' in line
+                ]
+                print(
+                    "  {:<48} skipped, failed to compile: {}".format(
+                        str(rel_pth), '; '.join(errors)))
+                continue
+
+            interpreted, compiled = (
+                measure(
+                    src_dir=src_dir,
+                    module_name=schema.py.module_name,
+                    graph_variable=graph_variable,
+                    example_paths=example_paths,
+                    repeats=repeats)
+                for src_dir in (interpreted_dir, compiled_dir))
+            total_interpreted += interpreted
+            total_compiled += compiled
+
+            print(
+                "  {:<48} {:8.3f} s {:8.3f} s {:6.2f}x".format(
+                    str(rel_pth), interpreted, compiled,
+                    interpreted / compiled))
+
+    print(
+        "  {:<48} {:8.3f} s {:8.3f} s {:6.2f}x".format(
+            "total (interpreted, compiled, speedup)", total_interpreted,
+            total_compiled, total_interpreted / total_compiled))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Benchmark parsing composites constructed once against filled placeholders."""
+
+import argparse
+import gc
+import importlib
+import pathlib
+import sys
+import time
+import unittest.mock
+from typing import Any, Dict, Mapping, Optional
+
+import temppathlib
+
+import mapry.parse
+import mapry.py.generate.fromjsonable
+import tests.py.benchmark_slots_memory
+
+
+def generate_schema(module_name: str) -> Dict[str, Any]:
+    """
+    Generate the schema of an object graph with embeds and class instances.
+
+    :param module_name: name of the generated module
+    :return: JSONable schema
+    """
+    return {
+        "name":
+        "Some_graph",
+        "description":
+        "defines an object graph with many composites.",
+        "py": {
+            "module_name": module_name,
+            "path_as": "str",
+            "timezone_as": "str"
+        },
+        "classes": [{
+            "name": "Sample",
+            "description": "defines a sample.",
+            "properties": {
+                "value": {
+                    "type": "float",
+                    "description": "defines the value."
+                },
+                "tag": {
+                    "type": "string",
+                    "description": "defines the tag.",
+                    "optional": True
+                }
+            }
+        }],
+        "embeds": [{
+            "name": "Point",
+            "description": "defines a point.",
+            "properties": {
+                "x": {
+                    "type": "float",
+                    "description": "defines the abscissa."
+                },
+                "y": {
+                    "type": "float",
+                    "description": "defines the ordinate."
+                },
+                "label": {
+                    "type": "string",
+                    "description": "defines the label.",
+                    "optional": True
+                }
+            }
+        }],
+        "properties": {
+            "points": {
+                "type": "array",
+                "description": "defines the points.",
+                "values": {
+                    "type": "Point"
+                }
+            }
+        }
+    }
+
+
+def generate_value(count: int) -> Mapping[str, Any]:
+    """
+    Generate a JSONable of the object graph.
+
+    :param count: number of embeds and of class instances
+    :return: JSONable
+    """
+    return {
+        'samples': {
+            'sample-{}'.format(i): {
+                'value': float(i),
+                'tag': 'sample-{}'.format(i)
+            }
+            for i in range(count)
+        },
+        'points': [{
+            'x': float(i),
+            'y': 0.5,
+            'label': 'point-{}'.format(i)
+        } for i in range(count)]
+    }
+
+
+def measure(
+        module_name: str, value: Any, repeats: int,
+        trusted_input: bool) -> float:
+    """
+    Measure the best run time of parsing the value.
+
+    :param module_name: name of the generated module
+    :param value: JSONable to be parsed
+    :param repeats: number of runs
+    :param trusted_input: if set, parse with the optimistic path
+    :return: best run time in seconds
+    """
+    parse = importlib.import_module(module_name + '.parse')
+    fromjsonable = importlib.import_module(module_name + '.fromjsonable')
+
+    best = None  # type: Optional[float]
+    for _ in range(repeats):
+        graph_from = (
+            fromjsonable.some_graph_from_fast
+            if trusted_input else fromjsonable.some_graph_from)
+
+        errors = parse.Errors(cap=10)
+
+        # Disable the garbage collector as timeit does so that its pauses
+        # do not dominate the measurement.
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            graph_from(value=value, ref='#', errors=errors)
+            duration = time.perf_counter() - start
+        finally:
+            gc.enable()
+
+        assert errors.empty()
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+    return best
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of embeds and of class instances",
+        type=int,
+        default=200000)
+    parser.add_argument("--repeats", help="number of runs", type=int, default=5)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the modules are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    value = generate_value(count=count)
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        for module_name in ["placeholder.graph", "once.graph"]:
+            schema = mapry.parse.schema_from_mapping(
+                mapping=generate_schema(module_name=module_name), ref='#')
+            assert schema.py is not None
+            schema.py.trusted_input = True
+
+            # Emulate the code generated before the composites were
+            # constructed in a single pass.
+            constructs_once = module_name == "once.graph"
+            with unittest.mock.patch.object(mapry.py.generate.fromjsonable,
+                                            '_constructs_once',
+                                            return_value=constructs_once):
+                with unittest.mock.patch.object(mapry.py.generate.fromjsonable,
+                                                '_class_constructs_once',
+                                                return_value=constructs_once):
+                    tests.py.benchmark_slots_memory.generate_module(
+                        graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        print(
+            "Parsing {0} embeds and {0} class instances, "
+            "best of {1} runs:".format(count, repeats))
+        for trusted_input in [False, True]:
+            placeholder = measure(
+                module_name="placeholder.graph",
+                value=value,
+                repeats=repeats,
+                trusted_input=trusted_input)
+            once = measure(
+                module_name="once.graph",
+                value=value,
+                repeats=repeats,
+                trusted_input=trusted_input)
+
+            print(
+                "  {}:".format(
+                    "trusted input" if trusted_input else "validating"))
+            print("    placeholder then fill: {:.3f} s".format(placeholder))
+            print("    constructed once:      {:.3f} s".format(once))
+            print(
+                "    saving:                {:.0f}%".format(
+                    100.0 * (placeholder - once) / placeholder))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
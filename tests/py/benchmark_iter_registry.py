@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark iterating over a registry of a large JSON file in Python."""
+
+import argparse
+import importlib
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+from typing import Callable, Optional, Tuple
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_slots_memory
+
+
+def measure(func: Callable[[], int]) -> Tuple[float, int]:
+    """
+    Measure the run time and the peak memory of the function.
+
+    :param func: function to be measured returning the number of instances
+    :return: run time in seconds, peak of the traced memory in bytes
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return duration, peak
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of persons in the address book",
+        type=int,
+        default=100000)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the module and the JSON file are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = (
+        tests.path.REPO_DIR /
+        "test_cases/docs/schema/introductory_example/schema.json")
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+    schema.py.iter_registries = True
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        parse = importlib.import_module(schema.py.module_name + '.parse')
+        fromjsonable = importlib.import_module(
+            schema.py.module_name + '.fromjsonable')
+
+        pth = tmp_dir.path / "pipeline.json"
+        pth.write_text(
+            tests.py.benchmark_slots_memory.generate_text(count=count))
+
+        def load_graph() -> int:
+            """Load the whole file, parse the graph and visit the persons."""
+            errors = parse.Errors(cap=10)
+            with pth.open('rt') as fid:
+                pipeline = fromjsonable.pipeline_from(
+                    value=json.load(fid), ref=str(pth), errors=errors)
+
+            assert errors.empty()
+            assert pipeline is not None
+            return sum(1 for _ in pipeline.persons.values())
+
+        def iterate() -> int:
+            """Iterate over the persons in the file one at a time."""
+            errors = parse.Errors(cap=10)
+            with pth.open('rt') as fid:
+                result = sum(
+                    1 for _ in fromjsonable.iter_persons(
+                        fp=fid, ref=str(pth), errors=errors))
+
+            assert errors.empty()
+            return result
+
+        print(
+            "Visiting {} persons in a file of {:.1f} MB:".format(
+                count,
+                pth.stat().st_size / 1024.0 / 1024.0))
+
+        for name, func in [("json.load and pipeline_from", load_graph),
+                           ("iter_persons", iterate)]:
+            duration, peak = measure(func=func)
+            print(
+                "  {:<28} {:8.3f} s {:10.1f} MB peak".format(
+                    name, duration, peak / 1024.0 / 1024.0))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
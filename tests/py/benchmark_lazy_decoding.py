@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark the generated Python parsers with and without lazy decoding."""
+
+import argparse
+import importlib
+import pathlib
+import sys
+import time
+from typing import Any, Mapping, Optional
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_slots_memory
+
+TIME_ZONES = ['Europe/Zurich', 'UTC', 'America/New_York', 'Asia/Tokyo']
+
+
+def generate_value(count: int) -> Mapping[str, Any]:
+    """
+    Generate a JSONable of the ``py/lazy_decoding`` test case.
+
+    :param count: number of instances
+    :return: JSONable
+    """
+    some_classes = {
+        'instance{}'.format(i): {
+            'some_path': '/some/path/{}'.format(i),
+            'some_optional_time_zone': TIME_ZONES[i % len(TIME_ZONES)],
+            'some_embed': {
+                'some_time_zone': TIME_ZONES[(i + 1) % len(TIME_ZONES)],
+                'array_of_paths': []
+            }
+        }
+        for i in range(count)
+    }
+
+    return {
+        'some_classes': some_classes,
+        'some_property': {
+            'some_time_zone': 'UTC',
+            'array_of_paths': []
+        },
+        'global_path': '/some/path'
+    }
+
+
+def measure(module_name: str, value: Any, repeats: int) -> float:
+    """
+    Measure the best run time of parsing the value.
+
+    :param module_name: name of the generated module
+    :param value: JSONable to be parsed
+    :param repeats: number of runs
+    :return: best run time in seconds
+    """
+    parse = importlib.import_module(module_name + '.parse')
+    fromjsonable = importlib.import_module(module_name + '.fromjsonable')
+
+    best = None  # type: Optional[float]
+    for _ in range(repeats):
+        errors = parse.Errors(cap=10)
+
+        start = time.perf_counter()
+        fromjsonable.some_graph_from(value=value, ref='#', errors=errors)
+        duration = time.perf_counter() - start
+
+        assert errors.empty(), "Expected no errors, but got: {}".format([
+            (error.ref, error.message) for error in errors.values()
+        ])
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+    return best
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", help="number of instances", type=int, default=100000)
+    parser.add_argument("--repeats", help="number of runs", type=int, default=5)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the modules are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = (
+        tests.path.REPO_DIR / "test_cases/py/lazy_decoding/schema.json")
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+
+    value = generate_value(count=count)
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        schema.py.module_name = "eager.graph"
+        schema.py.lazy_decoding = False
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        schema.py.module_name = "lazy.graph"
+        schema.py.lazy_decoding = True
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        eager = measure(module_name="eager.graph", value=value, repeats=repeats)
+        lazy = measure(module_name="lazy.graph", value=value, repeats=repeats)
+
+    print("Parsing {} instances, best of {} runs:".format(count, repeats))
+    print("  eager decoding: {:.3f} s".format(eager))
+    print("  lazy decoding:  {:.3f} s".format(lazy))
+    print("  saving:         {:.0f}%".format(100.0 * (eager - lazy) / eager))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark parsing the generated Python object graph eagerly and lazily."""
+
+import argparse
+import importlib
+import json
+import pathlib
+import sys
+import time
+from typing import Any, Callable, Optional
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_slots_memory
+
+
+def measure(func: Callable[[], Any], repeats: int) -> float:
+    """
+    Measure the best run time of the function.
+
+    :param func: function to be measured
+    :param repeats: number of runs
+    :return: best run time in seconds
+    """
+    best = None  # type: Optional[float]
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+    return best
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of persons in the address book",
+        type=int,
+        default=100000)
+    parser.add_argument(
+        "--repeats", help="number of runs per method", type=int, default=5)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the module is generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = (
+        tests.path.REPO_DIR /
+        "test_cases/docs/schema/introductory_example/schema.json")
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+    schema.py.lazy_registries = True
+
+    value = json.loads(
+        tests.py.benchmark_slots_memory.generate_text(count=count))
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        parse = importlib.import_module(schema.py.module_name + '.parse')
+        fromjsonable = importlib.import_module(
+            schema.py.module_name + '.fromjsonable')
+
+        def eager() -> None:
+            """Parse all the instances and access a single person."""
+            pipeline = fromjsonable.pipeline_from(
+                value=value, ref='#', errors=parse.Errors(cap=10))
+            assert pipeline is not None
+            assert pipeline.persons['person1'].full_name
+
+        def lazy() -> None:
+            """Parse only the accessed person."""
+            pipeline = fromjsonable.pipeline_from_lazy(
+                value=value, ref='#', errors=parse.Errors(cap=10))
+            assert pipeline is not None
+            assert pipeline.persons['person1'].full_name
+
+        def lazy_materialized() -> None:
+            """Parse lazily and then materialize all the instances."""
+            errors = parse.Errors(cap=10)
+            pipeline = fromjsonable.pipeline_from_lazy(
+                value=value, ref='#', errors=errors)
+            assert pipeline is not None
+            fromjsonable.materialize_pipeline(graph=pipeline, errors=errors)
+            assert errors.empty()
+
+        print(
+            "Parsing {} persons and accessing one, best of {} runs:".format(
+                count, repeats))
+
+        for name, func in [("eager", eager), ("lazy", lazy),
+                           ("lazy, then materialized", lazy_materialized)]:
+            duration = measure(func=func, repeats=repeats)
+            print("  {:<25} {:8.3f} s".format(name, duration))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark parsing the generated Python object graph in worker processes."""
+
+import argparse
+import importlib
+import os
+import pathlib
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_slots_memory
+import tests.py.benchmark_trusted_input
+
+
+def measure(func: Callable[[], Any], repeats: int) -> float:
+    """
+    Measure the best run time of the function.
+
+    :param func: function to be measured
+    :param repeats: number of runs
+    :return: best run time in seconds
+    """
+    best = None  # type: Optional[float]
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        duration = time.perf_counter() - start
+
+        assert result is not None, "Expected the parsing to succeed."
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+    return best
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--case",
+        help="test case whose schema is benchmarked",
+        choices=sorted(tests.py.benchmark_trusted_input.GENERATORS.keys()),
+        default='general/trusted_input')
+    parser.add_argument(
+        "--count",
+        help="number of instances per class",
+        type=int,
+        default=1000000)
+    parser.add_argument(
+        "--workers",
+        help="numbers of worker processes to benchmark",
+        type=int,
+        nargs='+',
+        default=None)
+    parser.add_argument(
+        "--repeats", help="number of runs per method", type=int, default=3)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the module is generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    case = str(args.case)
+    count = int(args.count)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    cpu_count = os.cpu_count() or 1
+    workers = ([int(worker)
+                for worker in args.workers] if args.workers is not None else
+               sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+               )  # type: List[int]
+
+    schema_pth = tests.path.REPO_DIR / "test_cases" / case / "schema.json"
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+    schema.py.parallel_parsing = True
+
+    value = tests.py.benchmark_trusted_input.GENERATORS[case](count)
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        parse = importlib.import_module(schema.py.module_name + '.parse')
+        fromjsonable = importlib.import_module(
+            schema.py.module_name + '.fromjsonable')
+
+        print(
+            "Parsing {} with {} instances per class on {} processors, "
+            "best of {} runs:".format(case, count, cpu_count, repeats))
+
+        serial = measure(
+            func=lambda: fromjsonable.some_graph_from(
+                value=value, ref='#', errors=parse.Errors(cap=10)),
+            repeats=repeats)
+        print("  {:<20} {:8.3f} s".format("some_graph_from", serial))
+
+        for worker_count in workers:
+            # yapf: disable
+            duration = measure(
+                func=lambda: fromjsonable.some_graph_from_parallel(
+                    value=value, ref='#', errors=parse.Errors(cap=10),
+                    workers=worker_count),  # pylint: disable=cell-var-from-loop
+                repeats=repeats)
+            # yapf: enable
+
+            print(
+                "  {:<20} {:8.3f} s ({:.1f}x)".format(
+                    "{} worker(s)".format(worker_count), duration,
+                    serial / duration))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark the memory of generated Python classes with and without slots."""
+
+import argparse
+import importlib
+import json
+import os
+import pathlib
+import sys
+import tracemalloc
+from typing import Any, List, Optional
+
+import temppathlib
+
+import mapry
+import mapry.parse
+import mapry.py.generate.fromjsonable
+import mapry.py.generate.parse
+import mapry.py.generate.tojsonable
+import mapry.py.generate.types
+import tests.path
+
+
+def generate_module(
+        graph: mapry.Graph, py: mapry.Py, src_dir: pathlib.Path) -> None:
+    """
+    Generate the Python module of the object graph.
+
+    :param graph: mapry definition of the object graph
+    :param py: Python settings
+    :param src_dir: directory where the module should be generated
+    :return:
+    """
+    module_dir = src_dir / os.path.join(*py.module_name.split("."))
+    module_dir.mkdir(exist_ok=True, parents=True)
+
+    for parent in list(module_dir.relative_to(src_dir).parents)[:-1]:
+        (src_dir / parent / "__init__.py"
+         ).write_text('"""automatically generated by mapry-to-py."""\n')
+
+    (module_dir / '__init__.py').write_text(
+        mapry.py.generate.types.generate(graph=graph, py=py))
+
+    (module_dir / 'parse.py').write_text(
+        mapry.py.generate.parse.generate(graph=graph, py=py))
+
+    for generate_files in [mapry.py.generate.fromjsonable.generate_files,
+                           mapry.py.generate.tojsonable.generate_files]:
+        for filename, code in generate_files(graph=graph, py=py).items():
+            (module_dir / filename).parent.mkdir(exist_ok=True, parents=True)
+            (module_dir / filename).write_text(code)
+
+
+def generate_text(count: int) -> str:
+    """
+    Generate the JSON text of an address book with the given number of persons.
+
+    :param count: number of persons
+    :return: JSON text
+    """
+    persons = dict()
+    for i in range(count):
+        persons['person{}'.format(i)] = {
+            'full_name':
+            'Person Number {}'.format(i),
+            'birthday':
+            '{:04d}-{:02d}-{:02d}'.format(
+                1950 + i % 60, 1 + i % 12, 1 + i % 28),
+            'address': {
+                'text': 'Some street {}, Some City, Some Country'.format(i)
+            }
+        }
+
+    return json.dumps({'persons': persons, 'maintainer': 'person0'})
+
+
+def measure(module_name: str, count: int) -> float:
+    """
+    Measure the memory allocated per instance of the generated class.
+
+    The instances are created as placeholders and filled out afterwards,
+    the same way as the generated parsing code does.
+
+    :param module_name: name of the generated module
+    :param count: number of instances
+    :return: allocated memory per instance in bytes
+    """
+    parse = importlib.import_module(module_name + '.parse')
+
+    # Pre-allocate the identifiers and the list so that they are not accounted.
+    identifiers = [str(i) for i in range(count)]
+    instances = [None] * count  # type: List[Any]
+
+    embed = parse.placeholder_some_embed()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    for i, identifier in enumerate(identifiers):
+        instance = parse.placeholder_some_class(id=identifier)
+        instance.some_text = identifier
+        instance.some_embed = embed
+        instance.some_optional_number = 1
+        instances[i] = instance
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of instances to be created",
+        type=int,
+        default=100000)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the modules are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = tests.path.REPO_DIR / "test_cases/py/slots/schema.json"
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        schema.py.module_name = "without_slots.graph"
+        schema.py.slots = False
+        generate_module(graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        schema.py.module_name = "with_slots.graph"
+        schema.py.slots = True
+        generate_module(graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        without_slots = measure(module_name="without_slots.graph", count=count)
+        with_slots = measure(module_name="with_slots.graph", count=count)
+
+    print("Memory per instance of {} instances:".format(count))
+    print("  without slots: {:.1f} bytes".format(without_slots))
+    print("  with slots:    {:.1f} bytes".format(with_slots))
+    print(
+        "  saving:        {:.1f} bytes ({:.0f}%)".format(
+            without_slots - with_slots,
+            100.0 * (without_slots - with_slots) / without_slots))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark importing the generated Python modules split or monolithic."""
+
+import argparse
+import pathlib
+import subprocess
+import sys
+import textwrap
+from typing import Any, Dict, List, Optional
+
+import temppathlib
+
+import mapry.parse
+import tests.py.benchmark_slots_memory
+
+
+def generate_schema(count: int, split_modules: bool) -> Dict[str, Any]:
+    """
+    Generate the schema of an object graph with many classes.
+
+    :param count: number of classes
+    :param split_modules: Python setting whether to split the modules
+    :return: JSONable schema
+    """
+    classes = []  # type: List[Dict[str, Any]]
+    for i in range(count):
+        classes.append({
+            "name": "Class_{}".format(i),
+            "description": "defines a class.",
+            "properties": {
+                "some_text": {
+                    "type": "string",
+                    "description": "defines some text.",
+                    "pattern": "^[a-z]+$"
+                },
+                "some_number": {
+                    "type": "integer",
+                    "description": "defines some number.",
+                    "minimum": 0
+                },
+                "some_date": {
+                    "type": "date",
+                    "description": "defines some date."
+                }
+            }
+        })
+
+    return {
+        "name": "Big_graph",
+        "description": "defines an object graph with many classes.",
+        "py": {
+            "module_name":
+            ("split" if split_modules else "monolith") + ".big_graph",
+            "path_as": "str",
+            "timezone_as": "str",
+            "split_modules": split_modules
+        },
+        "classes": classes
+    }
+
+
+def measure(src_dir: pathlib.Path, module_name: str, repeats: int) -> float:
+    """
+    Measure the best time to import and use a single class parser.
+
+    Every run is executed in a fresh interpreter so that no module is cached.
+
+    :param src_dir: directory where the modules are generated
+    :param module_name: name of the generated module
+    :param repeats: number of runs
+    :return: best run time in seconds
+    """
+    code = textwrap.dedent(
+        '''\
+        import time
+        start = time.perf_counter()
+        import {0}.parse
+        import {0}.fromjsonable
+        errors = {0}.parse.Errors(cap=10)
+        {0}.fromjsonable.class_0_from(
+            {{"some_text": "abc", "some_number": 1,
+              "some_date": "2016-07-03"}},
+            id="some_instance", ref="#", errors=errors)
+        assert errors.empty()
+        print(time.perf_counter() - start)
+        '''.format(module_name))
+
+    durations = []  # type: List[float]
+    for _ in range(repeats):
+        out = subprocess.check_output([sys.executable, '-c', code],
+                                      cwd=str(src_dir),
+                                      universal_newlines=True)
+        durations.append(float(out.strip()))
+
+    return min(durations)
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", help="number of classes", type=int, default=300)
+    parser.add_argument(
+        "--repeats", help="number of runs per setting", type=int, default=5)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the modules are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        for split_modules in [False, True]:
+            schema = mapry.parse.schema_from_mapping(
+                mapping=generate_schema(
+                    count=count, split_modules=split_modules),
+                ref='#')
+            assert schema.py is not None
+
+            tests.py.benchmark_slots_memory.generate_module(
+                graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        # Compile the bytecode in advance as mapry-to-py does.
+        subprocess.check_call(
+            [sys.executable, '-m', 'compileall', '-q',
+             str(src_dir)])
+
+        print(
+            "Importing and parsing a single class of {} classes, "
+            "best of {} runs:".format(count, repeats))
+        for module_name in ["monolith.big_graph", "split.big_graph"]:
+            duration = measure(
+                src_dir=src_dir, module_name=module_name, repeats=repeats)
+            print("  {:<20} {:8.3f} s".format(module_name, duration))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark serializing the changes of the generated Python object graph."""
+
+import argparse
+import importlib
+import json
+import pathlib
+import sys
+import time
+from typing import Any, Callable, Optional
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_slots_memory
+
+
+def measure(func: Callable[[], Any], repeats: int) -> float:
+    """
+    Measure the best run time of the function.
+
+    :param func: function to be measured
+    :param repeats: number of runs
+    :return: best run time in seconds
+    """
+    best = None  # type: Optional[float]
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+    return best
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of persons in the address book",
+        type=int,
+        default=100000)
+    parser.add_argument(
+        "--changes", help="number of changed persons", type=int, default=10)
+    parser.add_argument(
+        "--repeats", help="number of runs per method", type=int, default=5)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the modules are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    changes = int(args.changes)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = (
+        tests.path.REPO_DIR /
+        "test_cases/docs/schema/introductory_example/schema.json")
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+
+    value = json.loads(
+        tests.py.benchmark_slots_memory.generate_text(count=count))
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        schema.py.module_name = "untracked.address"
+        schema.py.track_changes = False
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        schema.py.module_name = "tracked.address"
+        schema.py.track_changes = True
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        parse_times = dict()
+        for module_name in ["untracked.address", "tracked.address"]:
+            parse = importlib.import_module(module_name + '.parse')
+            fromjsonable = importlib.import_module(
+                module_name + '.fromjsonable')
+
+            def parse_func(
+                    fromjsonable: Any = fromjsonable,
+                    parse: Any = parse) -> Any:
+                """Parse with the modules bound at this iteration."""
+                return fromjsonable.pipeline_from(
+                    value=value, ref='#', errors=parse.Errors(cap=10))
+
+            parse_times[module_name] = measure(func=parse_func, repeats=repeats)
+
+        tracked = importlib.import_module("tracked.address")
+        parse = importlib.import_module("tracked.address.parse")
+        fromjsonable = importlib.import_module("tracked.address.fromjsonable")
+        tojsonable = importlib.import_module("tracked.address.tojsonable")
+
+        errors = parse.Errors(cap=10)
+        pipeline = fromjsonable.pipeline_from(
+            value=value, ref='#', errors=errors)
+        assert errors.empty()
+        assert pipeline is not None
+
+        since = tracked.checkpoint()
+
+        step = max(1, count // changes)
+        for i in range(0, step * changes, step):
+            person = pipeline.persons['person{}'.format(i)]
+            person.full_name = person.full_name + ' Jr.'
+
+        delta = tojsonable.serialize_pipeline_delta(pipeline, since=since)
+        assert len(delta['registries']['persons']['changed']) == changes
+
+        full = measure(
+            func=lambda: tojsonable.serialize_pipeline(pipeline),
+            repeats=repeats)
+        delta_time = measure(
+            func=lambda: tojsonable.serialize_pipeline_delta(
+                pipeline, since=since),
+            repeats=repeats)
+
+    print("Parsing {} persons, best of {} runs:".format(count, repeats))
+    print("  untracked: {:8.3f} s".format(parse_times["untracked.address"]))
+    print("  tracked:   {:8.3f} s".format(parse_times["tracked.address"]))
+    print(
+        "Serializing after changing {} persons, best of {} runs:".format(
+            changes, repeats))
+    print("  whole graph: {:10.6f} s".format(full))
+    print("  delta:       {:10.6f} s".format(delta_time))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Benchmark the generated Python parsers with and without trusted input."""
+
+import argparse
+import importlib
+import pathlib
+import sys
+import time
+from typing import Any, Callable, Mapping, Optional
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_slots_memory
+
+
+def generate_class_value(count: int) -> Mapping[str, Any]:
+    """
+    Generate a JSONable of the ``general/class`` test case.
+
+    :param count: number of instances per class
+    :return: JSONable
+    """
+    empties = {
+        'empty-{}'.format(i): {}
+        for i in range(count)
+    }  # type: Mapping[str, Any]
+
+    with_references = {
+        'with-reference-{}'.format(i): {
+            'reference_to_an_empty': 'empty-{}'.format(i),
+            'array_of_empties': ['empty-{}'.format(i)] * 3,
+            'map_of_empties': {
+                'some-key': 'empty-{}'.format(i)
+            }
+        }
+        for i in range(count)
+    }
+
+    return {
+        'empties': empties,
+        'with_references': with_references,
+        'global_reference_to_an_empty': 'empty-0'
+    }
+
+
+def letters(number: int) -> str:
+    """
+    Represent the number with lowercase letters as its base-26 digits.
+
+    :param number: non-negative number
+    :return: representation
+    """
+    digits = [chr(ord('a') + number % 26)]
+    while number >= 26:
+        number //= 26
+        digits.append(chr(ord('a') + number % 26))
+
+    return ''.join(reversed(digits))
+
+
+def generate_trusted_input_value(count: int) -> Mapping[str, Any]:
+    """
+    Generate a JSONable of the ``general/trusted_input`` test case.
+
+    :param count: number of instances
+    :return: JSONable
+    """
+    some_classes = {
+        'instance{}'.format(letters(number=i)): {
+            'some_integer': i % 100,
+            'some_float': 0.5,
+            'some_string': 'Valid',
+            'some_path': '/some/path/{}'.format(i),
+            'some_array': [1, 2, 3]
+        }
+        for i in range(count)
+    }
+
+    return {
+        'some_classes': some_classes,
+        'some_reference': next(iter(some_classes.keys()))
+    }
+
+
+GENERATORS = {
+    'general/class': generate_class_value,
+    'general/trusted_input': generate_trusted_input_value
+}  # type: Mapping[str, Callable[[int], Mapping[str, Any]]]
+
+
+def measure(module_name: str, value: Any, repeats: int) -> float:
+    """
+    Measure the best run time of parsing the value with the validating path.
+
+    :param module_name: name of the generated module
+    :param value: JSONable to be parsed
+    :param repeats: number of runs
+    :return: best run time in seconds
+    """
+    parse = importlib.import_module(module_name + '.parse')
+    fromjsonable = importlib.import_module(module_name + '.fromjsonable')
+
+    best = None  # type: Optional[float]
+    for _ in range(repeats):
+        errors = parse.Errors(cap=10)
+
+        start = time.perf_counter()
+        fromjsonable.some_graph_from(value=value, ref='#', errors=errors)
+        duration = time.perf_counter() - start
+
+        assert errors.empty(), "Expected no errors, but got: {}".format([
+            (error.ref, error.message) for error in errors.values()
+        ])
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+    return best
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--case",
+        help="test case whose schema is benchmarked",
+        choices=sorted(GENERATORS.keys()),
+        default='general/class')
+    parser.add_argument(
+        "--count",
+        help="number of instances per class",
+        type=int,
+        default=100000)
+    parser.add_argument("--repeats", help="number of runs", type=int, default=5)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the modules are generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    case = str(args.case)
+    count = int(args.count)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = tests.path.REPO_DIR / "test_cases" / case / "schema.json"
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+
+    value = GENERATORS[case](count)
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        schema.py.module_name = "validating.graph"
+        schema.py.trusted_input = False
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        schema.py.module_name = "trusted.graph"
+        schema.py.trusted_input = True
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        validating = measure(
+            module_name="validating.graph", value=value, repeats=repeats)
+        trusted = measure(
+            module_name="trusted.graph", value=value, repeats=repeats)
+
+    print(
+        "Parsing {} with {} instances per class, best of {} runs:".format(
+            case, count, repeats))
+    print("  validating:    {:.3f} s".format(validating))
+    print("  trusted input: {:.3f} s".format(trusted))
+    print(
+        "  saving:        {:.0f}%".format(
+            100.0 * (validating - trusted) / validating))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
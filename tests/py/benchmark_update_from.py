@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark re-parsing the generated Python object graph incrementally."""
+
+import argparse
+import copy
+import importlib
+import json
+import pathlib
+import sys
+from typing import Optional
+
+import temppathlib
+
+import mapry.parse
+import tests.path
+import tests.py.benchmark_lazy_registry
+import tests.py.benchmark_slots_memory
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count",
+        help="number of persons in the address book",
+        type=int,
+        default=100000)
+    parser.add_argument(
+        "--changed",
+        help="number of persons changed between the loads",
+        type=int,
+        default=10)
+    parser.add_argument(
+        "--repeats", help="number of runs per method", type=int, default=5)
+    parser.add_argument(
+        "--operation_dir",
+        help="directory where the module is generated; "
+        "if not specified, a temporary directory is used")
+
+    args = parser.parse_args()
+
+    count = int(args.count)
+    changed = int(args.changed)
+    repeats = int(args.repeats)
+    operation_dir = (
+        pathlib.Path(args.operation_dir) if args.operation_dir is not None else
+        None)  # type: Optional[pathlib.Path]
+
+    schema_pth = (
+        tests.path.REPO_DIR /
+        "test_cases/docs/schema/introductory_example/schema.json")
+    schema = mapry.parse.schema_from_json_file(path=schema_pth)
+    assert schema.py is not None, \
+        "Expected Python settings in the schema: {}".format(schema_pth)
+
+    previous_value = json.loads(
+        tests.py.benchmark_slots_memory.generate_text(count=count))
+
+    value = copy.deepcopy(previous_value)
+    for i in range(0, count, max(1, count // changed)):
+        value['persons']['person{}'.format(i)]['full_name'] += ' Jr.'
+
+    with temppathlib.TmpDirIfNecessary(path=operation_dir) as tmp_dir:
+        src_dir = tmp_dir.path / "src"
+
+        tests.py.benchmark_slots_memory.generate_module(
+            graph=schema.graph, py=schema.py, src_dir=src_dir)
+
+        sys.path.insert(0, str(src_dir))
+
+        parse = importlib.import_module(schema.py.module_name + '.parse')
+        fromjsonable = importlib.import_module(
+            schema.py.module_name + '.fromjsonable')
+
+        previous = fromjsonable.pipeline_from(
+            value=previous_value, ref='#', errors=parse.Errors(cap=10))
+        assert previous is not None
+
+        def full() -> None:
+            """Parse the whole graph anew."""
+            assert fromjsonable.pipeline_from(
+                value=value, ref='#', errors=parse.Errors(cap=10)) is not None
+
+        def update() -> None:
+            """Parse only the changed instances."""
+            assert fromjsonable.pipeline_update_from(
+                previous=previous,
+                previous_value=previous_value,
+                value=value,
+                ref='#',
+                errors=parse.Errors(cap=10)) is not None
+
+        print(
+            "Re-parsing {} persons with {} changed, best of {} runs:".format(
+                count, changed, repeats))
+
+        for name, func in [("pipeline_from", full),
+                           ("pipeline_update_from", update)]:
+            duration = tests.py.benchmark_lazy_registry.measure(
+                func=func, repeats=repeats)
+            print("  {:<25} {:8.3f} s".format(name, duration))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
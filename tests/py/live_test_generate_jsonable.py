@@ -15,6 +15,7 @@ import temppathlib
 import mapry
 import mapry.parse
 import mapry.py.generate
+import mapry.py.generate.build_native
 import mapry.py.generate.fromjsonable
 import mapry.py.generate.parse
 import mapry.py.generate.tojsonable
@@ -29,15 +30,47 @@ _PARSE_SERIALIZE_TPL = mapry.py.jinja2_env.ENV.from_string(
 """parses and serializes the given {{
     graph.name|as_composite }} as a JSON file."""
 import argparse
+{% if py.coroutines %}
+import asyncio
+{% endif %}{# /if py.coroutines #}
 import collections
+import io
 import json
 import pathlib
+import pickle
 import sys
+{% if py.track_changes %}
+import typing
+{% endif %}{# /if py.track_changes #}
 
 
 import {{ py.module_name }}.parse
 import {{ py.module_name }}.fromjsonable
 import {{ py.module_name }}.tojsonable
+{% if py.track_changes %}
+
+
+def apply_delta(
+        jsonable: typing.MutableMapping[str, typing.Any],
+        delta: typing.Mapping[str, typing.Any]) -> None:
+    """applies the delta to the JSONable of {{
+        graph.name|as_composite }} in place."""
+    if 'properties' in delta:
+        {% for prop in graph.properties.values() %}
+        jsonable.pop({{ prop.json|repr }}, None)
+        {% endfor %}{# /for prop #}
+        jsonable.update(delta['properties'])
+
+    for key, changes in delta.get('registries', dict()).items():
+        registry = jsonable.setdefault(key, collections.OrderedDict())
+        registry.update(changes.get('changed', dict()))
+
+        for id in changes.get('removed', []):
+            registry.pop(id, None)
+
+        if not registry:
+            del jsonable[key]
+{% endif %}{# /if py.track_changes #}
 
 
 def main() -> int:
@@ -69,6 +102,138 @@ def main() -> int:
         ref="#",
         errors=errors)
 
+    # The fast path needs to give exactly the same result.
+    fast_errors = {{ py.module_name }}.parse.Errors(cap=10)
+
+    fast_graph = {{ py.module_name }}.fromjsonable.{{
+        graph.name|as_variable }}_from_fast(
+        value=value,
+        ref="#",
+        errors=fast_errors)
+
+    # yapf: disable
+    if ([(error.ref, error.message) for error in errors.values()] !=
+            [(error.ref, error.message) for error in fast_errors.values()]):
+        # yapf: enable
+        print(
+            "The errors of the fast path differ from the errors of "
+            "the validating path.",
+            file=sys.stderr)
+        return 1
+    {% if graph.classes %}
+    {% if py.lazy_registries %}
+
+    # The lazy parsing needs to accept exactly the same values once all
+    # the instances have been materialized.
+    lazy_errors = {{ py.module_name }}.parse.Errors(cap=10)
+
+    lazy_graph = {{ py.module_name }}.fromjsonable.{{
+        graph.name|as_variable }}_from_lazy(
+        value=value,
+        ref="#",
+        errors=lazy_errors)
+
+    if lazy_graph is not None:
+        {{ py.module_name }}.fromjsonable.materialize_{{
+            graph.name|as_variable }}(
+            graph=lazy_graph,
+            errors=lazy_errors)
+
+    if errors.empty() != lazy_errors.empty():
+        print(
+            "The lazy parsing and the validating path disagree whether "
+            "the value is valid.",
+            file=sys.stderr)
+        return 1
+    {% endif %}{# /if py.lazy_registries #}
+
+    # Updating an empty graph needs to give exactly the same result.
+    update_errors = {{ py.module_name }}.parse.Errors(cap=10)
+
+    updated_graph = {{ py.module_name }}.fromjsonable.{{
+        graph.name|as_variable }}_update_from(
+        previous={{ py.module_name }}.parse.placeholder_{{
+            graph.name|as_variable }}(),
+        previous_value=dict(),
+        value=value,
+        ref="#",
+        errors=update_errors)
+
+    # yapf: disable
+    if ([(error.ref, error.message) for error in errors.values()] !=
+            [(error.ref, error.message) for error in update_errors.values()]):
+        # yapf: enable
+        print(
+            "The errors of updating an empty graph differ from the errors "
+            "of the validating path.",
+            file=sys.stderr)
+        return 1
+    {% if py.coroutines %}
+
+    # The coroutine needs to give exactly the same result even if it yields
+    # after every instance.
+    async_errors = {{ py.module_name }}.parse.Errors(cap=10)
+
+    async_graph = asyncio.run({{ py.module_name }}.fromjsonable.{{
+        graph.name|as_variable }}_from_async(
+        value=value,
+        ref="#",
+        errors=async_errors,
+        budget=1))
+
+    # yapf: disable
+    if ([(error.ref, error.message) for error in errors.values()] !=
+            [(error.ref, error.message) for error in async_errors.values()]):
+        # yapf: enable
+        print(
+            "The errors of the coroutine differ from the errors "
+            "of the validating path.",
+            file=sys.stderr)
+        return 1
+    {% endif %}{# /if py.coroutines #}
+    {% if py.parallel_parsing %}
+
+    # The parallel parsing needs to give exactly the same result even if
+    # every instance is parsed in a separate shard.
+    parallel_errors = {{ py.module_name }}.parse.Errors(cap=10)
+
+    parallel_graph = {{ py.module_name }}.fromjsonable.{{
+        graph.name|as_variable }}_from_parallel(
+        value=value,
+        ref="#",
+        errors=parallel_errors,
+        workers=2,
+        shard_size=1)
+
+    # yapf: disable
+    if ([(error.ref, error.message) for error in errors.values()] !=
+            [(error.ref, error.message)
+             for error in parallel_errors.values()]):
+        # yapf: enable
+        print(
+            "The errors of the parallel parsing differ from the errors "
+            "of the validating path.",
+            file=sys.stderr)
+        return 1
+
+    try:
+        {{ py.module_name }}.fromjsonable.{{
+            graph.name|as_variable }}_from_parallel(
+            value=value,
+            ref="#",
+            errors={{ py.module_name }}.parse.Errors(cap=10),
+            shard_size=0)
+
+        print(
+            "Expected the parallel parsing to reject a non-positive "
+            "shard size.",
+            file=sys.stderr)
+        return 1
+    except ValueError:
+        pass
+    {% endif %}{# /if py.parallel_parsing #}
+    {% endif %}{# /if graph.classes #}
+
     if not errors.empty():
         for error in errors.values():
             print("{}: {}".format(error.ref, error.message), file=sys.stderr)
@@ -76,6 +241,239 @@ def main() -> int:
         return 1
 
     assert graph is not None, "Expected parsed graph to be non-None."
+    assert fast_graph is not None, "Expected fast parsed graph to be non-None."
+
+    if (json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+            graph.name|as_variable }}(fast_graph, ordered=True)) !=
+            json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                graph.name|as_variable }}(graph, ordered=True))):
+        print(
+            "The graph parsed by the fast path differs from the graph "
+            "parsed by the validating path.",
+            file=sys.stderr)
+        return 1
+
+    {% if graph.classes %}
+    {% if py.lazy_registries %}
+
+    assert lazy_graph is not None, \\
+        "Expected the lazily parsed graph to be non-None."
+
+    if (json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+            graph.name|as_variable }}(lazy_graph, ordered=True)) !=
+            json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                graph.name|as_variable }}(graph, ordered=True))):
+        print(
+            "The lazily parsed graph differs from the graph "
+            "parsed by the validating path.",
+            file=sys.stderr)
+        return 1
+    {% endif %}{# /if py.lazy_registries #}
+
+    assert updated_graph is not None, \\
+        "Expected the updated graph to be non-None."
+
+    # Updating the graph with the same value needs to reuse all the instances.
+    reupdate_errors = {{ py.module_name }}.parse.Errors(cap=10)
+
+    reupdated_graph = {{ py.module_name }}.fromjsonable.{{
+        graph.name|as_variable }}_update_from(
+        previous=updated_graph,
+        previous_value=value,
+        value=value,
+        ref="#",
+        errors=reupdate_errors)
+
+    assert reupdated_graph is not None, \\
+        "Expected the graph updated with the same value to be non-None."
+    {% for cls in graph.classes.values() %}
+
+    if any(
+            instance is not updated_graph.{{ cls.plural|as_attribute }}[id]
+            for id, instance in reupdated_graph.{{
+                cls.plural|as_attribute }}.items()):
+        print(
+            "Expected all the instances of {{ cls.plural|as_attribute }} "
+            "to be reused when updating with the same value.",
+            file=sys.stderr)
+        return 1
+    {% endfor %}{# /for cls #}
+
+    for a_graph in [updated_graph, reupdated_graph]:
+        if (json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                graph.name|as_variable }}(a_graph, ordered=True)) !=
+                json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                    graph.name|as_variable }}(graph, ordered=True))):
+            print(
+                "The updated graph differs from the graph "
+                "parsed by the validating path.",
+                file=sys.stderr)
+            return 1
+    {% if py.coroutines %}
+
+    assert async_graph is not None, \\
+        "Expected the graph parsed by the coroutine to be non-None."
+
+    # yapf: disable
+    if (json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+            graph.name|as_variable }}(async_graph, ordered=True)) !=
+            json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                graph.name|as_variable }}(graph, ordered=True))):
+        # yapf: enable
+        print(
+            "The graph parsed by the coroutine differs from the graph "
+            "parsed by the validating path.",
+            file=sys.stderr)
+        return 1
+    {% endif %}{# /if py.coroutines #}
+    {% if py.parallel_parsing %}
+
+    assert parallel_graph is not None, \\
+        "Expected the graph parsed in parallel to be non-None."
+
+    if (json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+            graph.name|as_variable }}(parallel_graph, ordered=True)) !=
+            json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                graph.name|as_variable }}(graph, ordered=True))):
+        print(
+            "The graph parsed in parallel differs from the graph "
+            "parsed by the validating path.",
+            file=sys.stderr)
+        return 1
+    {% endif %}{# /if py.parallel_parsing #}
+    {% if py.coroutines %}
+
+    # yapf: disable
+    if (json.dumps(asyncio.run({{ py.module_name }}.tojsonable.serialize_{{
+            graph.name|as_variable }}_async(graph, ordered=True, budget=1))) !=
+            json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                graph.name|as_variable }}(graph, ordered=True))):
+        # yapf: enable
+        print(
+            "The JSONable serialized by the coroutine differs from "
+            "the JSONable of the synchronous serialization.",
+            file=sys.stderr)
+        return 1
+    {% endif %}{# /if py.coroutines #}
+    {% endif %}{# /if graph.classes #}
+
+    # The graph needs to survive a pickling round trip.
+    pickled_graph = pickle.loads(pickle.dumps(graph))
+
+    if (json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+            graph.name|as_variable }}(pickled_graph, ordered=True)) !=
+            json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                graph.name|as_variable }}(graph, ordered=True))):
+        print(
+            "The unpickled graph differs from the graph "
+            "parsed by the validating path.",
+            file=sys.stderr)
+        return 1
+    {% if py.iter_registries %}
+    {% for cls in graph.classes.values() %}
+
+    # Iterating over the registry needs to give the same instances even if
+    # the file is read in small chunks.
+    iter_errors = {{ py.module_name }}.parse.Errors(cap=10)
+
+    with path.open('rt') as fid:
+        iterated_{{ cls.plural|as_variable }} = list(
+            {{ py.module_name }}.fromjsonable.iter_{{
+                cls.plural|as_variable }}(
+                fp=fid, ref="#", errors=iter_errors, chunk_size=7))
+
+    # yapf: disable
+    if (not iter_errors.empty() or
+            [instance.id for instance in iterated_{{
+                cls.plural|as_variable }}] !=
+            list(graph.{{ cls.plural|as_attribute }}.keys()) or
+            any(json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                    cls.name|as_variable }}(instance, ordered=True)) !=
+                json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                    cls.name|as_variable }}(
+                    graph.{{ cls.plural|as_attribute }}[instance.id],
+                    ordered=True))
+                for instance in iterated_{{ cls.plural|as_variable }})):
+        # yapf: enable
+        print(
+            "The instances iterated over the registry "
+            "{{ cls.plural|as_attribute }} differ from the instances "
+            "of the parsed graph.",
+            file=sys.stderr)
+        return 1
+    {% endfor %}{# /for cls #}
+    {% endif %}{# /if py.iter_registries #}
+    {% if py.track_changes %}
+
+    # The changes are tracked on a copy so that the graph is left untouched.
+    tracked_graph = pickle.loads(pickle.dumps(graph))
+
+    # The delta needs to be empty right after the checkpoint.
+    since = {{ py.module_name }}.checkpoint()
+
+    if {{ py.module_name }}.tojsonable.serialize_{{
+            graph.name|as_variable }}_delta(tracked_graph, since=since):
+        print(
+            "Expected an empty delta right after the checkpoint.",
+            file=sys.stderr)
+        return 1
+
+    # The delta applied to the previous JSONable needs to give
+    # the JSONable of the changed graph.
+    delta_jsonable = {{ py.module_name }}.tojsonable.serialize_{{
+        graph.name|as_variable }}(tracked_graph, ordered=True)
+
+    # Number of the expected changed and removed instances
+    expected_changes = 0
+    {% for prop in graph.properties.values() %}
+    {% if loop.first %}
+
+    tracked_graph.{{ prop.name|as_attribute }} = tracked_graph.{{
+        prop.name|as_attribute }}
+    {% endif %}{# /if loop.first #}
+    {% endfor %}{# /for prop #}
+    {% for cls in graph.classes.values() %}
+
+    if len(tracked_graph.{{ cls.plural|as_attribute }}) > 1:
+        tracked_graph.{{ cls.plural|as_attribute }}.popitem()
+        expected_changes += 1
+
+    for instance in tracked_graph.{{ cls.plural|as_attribute }}.values():
+        instance.id = instance.id
+        expected_changes += 1
+        break
+    {% endfor %}{# /for cls #}
+
+    delta = {{ py.module_name }}.tojsonable.serialize_{{
+        graph.name|as_variable }}_delta(
+        tracked_graph, since=since, ordered=True)
+
+    apply_delta(jsonable=delta_jsonable, delta=delta)
+
+    # yapf: disable
+    if (json.dumps(delta_jsonable, sort_keys=True) !=
+            json.dumps({{ py.module_name }}.tojsonable.serialize_{{
+                graph.name|as_variable }}(tracked_graph, ordered=True),
+                       sort_keys=True)):
+        # yapf: enable
+        print(
+            "The JSONable with the delta applied differs from the JSONable "
+            "of the changed graph.",
+            file=sys.stderr)
+        return 1
+
+    changes = sum(
+        len(registry_delta.get('changed', dict())) +
+        len(registry_delta.get('removed', []))
+        for registry_delta in delta.get('registries', dict()).values())
+
+    if changes != expected_changes:
+        print(
+            "Expected {} changed and removed instances in the delta, "
+            "but got: {}".format(expected_changes, changes),
+            file=sys.stderr)
+        return 1
+    {% endif %}{# /if py.track_changes #}
 
     try:
         jsonable = {{ py.module_name }}.tojsonable.serialize_{{
@@ -83,6 +481,19 @@ def main() -> int:
             graph,
             ordered=True)
 
+        # Streaming needs to give exactly the same text as json.dumps.
+        # The small buffer makes sure that the buffer is flushed many times.
+        stream = io.StringIO()
+        {{ py.module_name }}.tojsonable.write_{{ graph.name|as_variable }}_json(
+            graph, stream, buffer_size=7)
+
+        if stream.getvalue() != json.dumps(jsonable):
+            print(
+                "The JSON text written by the streaming writer differs from "
+                "the JSON text of the serialized JSONable.",
+                file=sys.stderr)
+            return 1
+
         print(json.dumps(jsonable, indent=2))
     except Exception as err:
         print(
@@ -188,6 +599,14 @@ def execute_case(case: Case, case_src_dir: pathlib.Path) -> None:
     assert py is not None, \
         "Expected Python settings to be specified in the schema {}".format(
             case.schema_path)
+
+    # The optional entry points are generated for all the cases so that
+    # they are tested on all the schemas.
+    py.lazy_registries = True
+    py.coroutines = True
+    py.parallel_parsing = True
+    py.iter_registries = True
+
     module_dir = case_src_dir / os.path.join(*py.module_name.split("."))
     module_dir.mkdir(exist_ok=True, parents=True)
 
@@ -211,11 +630,15 @@ def execute_case(case: Case, case_src_dir: pathlib.Path) -> None:
     (module_dir / 'parse.py').write_text(
         mapry.py.generate.parse.generate(graph=graph, py=py))
 
-    (module_dir / 'fromjsonable.py').write_text(
-        mapry.py.generate.fromjsonable.generate(graph=graph, py=py))
+    for generate_files in [mapry.py.generate.fromjsonable.generate_files,
+                           mapry.py.generate.tojsonable.generate_files]:
+        for filename, code in generate_files(graph=graph, py=py).items():
+            (module_dir / filename).parent.mkdir(exist_ok=True, parents=True)
+            (module_dir / filename).write_text(code)
 
-    (module_dir / 'tojsonable.py').write_text(
-        mapry.py.generate.tojsonable.generate(graph=graph, py=py))
+    if py.compile_ready:
+        (module_dir / 'build_native.py').write_text(
+            mapry.py.generate.build_native.generate(graph=graph, py=py))
 
     (module_dir / "parse_serialize.py").write_text(
         generate_parse_serialize(graph=graph, py=py))
@@ -235,6 +658,13 @@ def execute_case(case: Case, case_src_dir: pathlib.Path) -> None:
                                str(pth)],
                               cwd=str(case_src_dir))
 
+    if py.compile_ready:
+        say("Compiling the generated files in {} ...".format(case_src_dir))
+        subprocess.check_call(
+            [sys.executable,
+             str(module_dir / 'build_native.py')],
+            cwd=str(case_src_dir))
+
     ##
     # Execute
     ##
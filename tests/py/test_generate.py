@@ -8,6 +8,7 @@ import unittest
 
 import mapry.parse
 import mapry.py.generate
+import mapry.py.generate.build_native
 import mapry.py.generate.fromjsonable
 import mapry.py.generate.parse
 import mapry.py.generate.tojsonable
@@ -68,15 +69,19 @@ class TestGenerate(unittest.TestCase):
 
                 ('parse.py',
                  mapry.py.generate.parse.generate(graph=graph, py=py)),
-
-                ('fromjsonable.py',
-                 mapry.py.generate.fromjsonable.generate(graph=graph, py=py)),
-
-                ('tojsonable.py',
-                 mapry.py.generate.tojsonable.generate(graph=graph, py=py)),
             ])
             # yapf: enable
 
+            filename_to_code.update(
+                mapry.py.generate.fromjsonable.generate_files(
+                    graph=graph, py=py))
+            filename_to_code.update(
+                mapry.py.generate.tojsonable.generate_files(graph=graph, py=py))
+
+            if py.compile_ready:
+                filename_to_code['build_native.py'] = (
+                    mapry.py.generate.build_native.generate(graph=graph, py=py))
+
             for filename, code in filename_to_code.items():
                 expected_pth = schema_pth.parent / "py/test_generate" / filename
 
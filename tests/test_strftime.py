@@ -53,3 +53,43 @@ class TestTokenize(unittest.TestCase):
         self.assertIsNotNone(not_implemented_err)
         self.assertEqual(
             'unsupported directive(s): %j, %U', str(not_implemented_err))
+
+
+class TestFixedWidthFormat(unittest.TestCase):
+    def test_compilable(self) -> None:
+        fmt = mapry.strftime.fixed_width_format(format="%d.%m.%Y %H%%")
+        assert fmt is not None
+
+        self.assertEqual(14, fmt.length)
+        self.assertTrue(fmt.has_date())
+
+        # yapf: disable
+        self.assertListEqual(
+            [('%d', 0, 2), ('%m', 3, 5), ('%Y', 6, 10), ('%H', 11, 13)],
+            [(field.directive, field.start, field.end)
+             for field in fmt.fields])
+        # yapf: enable
+
+        self.assertListEqual([('.', 2), ('.', 5), (' ', 10), ('%', 13)],
+                             [(literal.text, literal.start)
+                              for literal in fmt.literals])
+
+        self.assertEqual('d_46_m_46_Y_32_H_37', fmt.identifier)
+
+    def test_time_only(self) -> None:
+        fmt = mapry.strftime.fixed_width_format(format="%H:%M")
+        assert fmt is not None
+
+        self.assertFalse(fmt.has_date())
+        self.assertSetEqual({'%H', '%M'}, fmt.directives)
+
+    def test_not_compilable(self) -> None:
+        for a_format in ['%Y-%m-%d %Z', '%Y-%m', '%H:%M:%H', '%b %d',
+                         'no directives', '%Y-%m-%dä', '%Y-%m-%d\n%H']:
+            self.assertIsNone(
+                mapry.strftime.fixed_width_format(format=a_format),
+                "Expected the format not to compile: {!r}".format(a_format))
+
+
+if __name__ == '__main__':
+    unittest.main()